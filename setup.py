@@ -106,11 +106,14 @@ setup(
 
     # additional package data files that goes into the package itself
     package_data = {
-            '': ['*.json'],
+            '': ['*.json', '*.idx'],
     },
 
     # console entry point
     entry_points = {
+        'console_scripts': [
+            'genie-parse-bulk = genie.libs.parser.utils.bulk:main',
+        ],
     },
 
     # package dependencies
@@ -13,13 +13,19 @@ __author__ = 'Cisco Systems Inc.'
 __contact__ = ['pyats-support@cisco.com', 'pyats-support-ext@cisco.com']
 __copyright__ = 'Copyright (c) 2018, Cisco Systems Inc.'
 
-from .base import tcl_invoke_ats_cmd,\
-                  tcl_package_require_caas,\
-                  tcl_package_require_caas_parsers,\
-                  tcl_invoke_caas_abstract_parser,\
-                  CaasMetaParser
-
 from genie import abstract
 abstract.declare_package(__name__)
 
+from .utils.lazy import lazy_getattr
+
+# the tcl helpers of base import pyats.tcl, and the OS packages their parser
+# modules, on first access
+__getattr__ = lazy_getattr(__name__, {
+    'tcl_invoke_ats_cmd': '.base',
+    'tcl_package_require_caas': '.base',
+    'tcl_package_require_caas_parsers': '.base',
+    'tcl_invoke_caas_abstract_parser': '.base',
+    'CaasMetaParser': '.base',
+})
+
 
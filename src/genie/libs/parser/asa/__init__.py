@@ -1,4 +1,9 @@
 from genie.base import *
 from genie import abstract
 
-abstract.declare_token(__name__)
\ No newline at end of file
+abstract.declare_token(__name__)
+
+from genie.libs.parser.utils.lazy import lazy_getattr
+
+# parser modules are imported when first accessed
+__getattr__ = lazy_getattr(__name__)
@@ -1,3 +1,25 @@
 from genie import abstract
 abstract.declare_token(__name__)
 
+import importlib
+
+from . import resources
+
+# the parsers of the REST resources are rows of resources.RESOURCES, their
+# modules are created when imported
+resources.install()
+
+
+def __getattr__(name):
+    # get_net_wccp or NetWccp, created on first access
+    module = resources.lookup(name)
+    if module is None:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(
+            __name__, name))
+    module = importlib.import_module('{}.{}'.format(__name__, module))
+    return module if module.__name__.endswith('.' + name) else \
+        getattr(module, name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(resources.names()))
@@ -1,33 +0,0 @@
-# Global Imports
-import json
-from collections import defaultdict
-
-# Metaparser
-from genie.metaparser import MetaParser
-
-# =============================================
-# Collection for '/mgmt/tm/cm/key' resources
-# =============================================
-
-
-class CmKeySchema(MetaParser):
-
-    schema = {}
-
-
-class CmKey(CmKeySchema):
-    """ To F5 resource for /mgmt/tm/cm/key
-    """
-
-    cli_command = "/mgmt/tm/cm/key"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
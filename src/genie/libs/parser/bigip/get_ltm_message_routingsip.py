@@ -1,33 +0,0 @@
-# Global Imports
-import json
-from collections import defaultdict
-
-# Metaparser
-from genie.metaparser import MetaParser
-
-# =============================================
-# Collection for '/mgmt/tm/ltm/message-routing/sip' resources
-# =============================================
-
-
-class LtmMessageroutingSipSchema(MetaParser):
-
-    schema = {}
-
-
-class LtmMessageroutingSip(LtmMessageroutingSipSchema):
-    """ To F5 resource for /mgmt/tm/ltm/message-routing/sip
-    """
-
-    cli_command = "/mgmt/tm/ltm/message-routing/sip"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
@@ -1,33 +0,0 @@
-# Global Imports
-import json
-from collections import defaultdict
-
-# Metaparser
-from genie.metaparser import MetaParser
-
-# =============================================
-# Collection for '/mgmt/tm/net/fdb' resources
-# =============================================
-
-
-class NetFdbSchema(MetaParser):
-
-    schema = {}
-
-
-class NetFdb(NetFdbSchema):
-    """ To F5 resource for /mgmt/tm/net/fdb
-    """
-
-    cli_command = "/mgmt/tm/net/fdb"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
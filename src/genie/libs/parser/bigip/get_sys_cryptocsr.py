@@ -1,33 +0,0 @@
-# Global Imports
-import json
-from collections import defaultdict
-
-# Metaparser
-from genie.metaparser import MetaParser
-
-# =============================================
-# Collection for '/mgmt/tm/sys/crypto/csr' resources
-# =============================================
-
-
-class SysCryptoCsrSchema(MetaParser):
-
-    schema = {}
-
-
-class SysCryptoCsr(SysCryptoCsrSchema):
-    """ To F5 resource for /mgmt/tm/sys/crypto/csr
-    """
-
-    cli_command = "/mgmt/tm/sys/crypto/csr"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
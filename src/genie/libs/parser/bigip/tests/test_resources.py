@@ -0,0 +1,126 @@
+import os
+import sys
+import json
+import pickle
+import tempfile
+import unittest
+import importlib
+import subprocess
+from unittest.mock import Mock
+
+from genie.metaparser import MetaParser
+
+from genie.libs.parser import bigip
+from genie.libs.parser.bigip import resources
+from genie.libs.parser.bigip.resources import RESOURCES
+from genie.libs.parser.bigip.get_net_wccp import NetWccp, NetWccpSchema
+
+
+class TestResources(unittest.TestCase):
+
+    def test_unique(self):
+        self.assertEqual(len({module for module, _, _ in RESOURCES}),
+                         len(RESOURCES))
+        self.assertEqual(len({name for _, name, _ in RESOURCES}),
+                         len(RESOURCES))
+        self.assertEqual(len({path for _, _, path in RESOURCES}),
+                         len(RESOURCES))
+
+    def test_every_resource(self):
+        for module, name, path in RESOURCES:
+            with self.subTest(module):
+                parser = getattr(importlib.import_module(
+                    'genie.libs.parser.bigip.' + module), name)
+                self.assertEqual(parser.cli_command, path)
+                self.assertEqual(parser.__module__,
+                                 'genie.libs.parser.bigip.' + module)
+                self.assertEqual(parser.__bases__[0].__name__,
+                                 name + 'Schema')
+                self.assertEqual(parser.schema, {})
+
+    def test_import_paths(self):
+        from genie.libs.parser.bigip import NetWccp as parser
+        self.assertIs(parser, NetWccp)
+        self.assertIs(bigip.get_net_wccp.NetWccp, NetWccp)
+        self.assertIs(NetWccp.__bases__[0], NetWccpSchema)
+        self.assertIs(NetWccpSchema.__bases__[0], MetaParser)
+        self.assertEqual(NetWccp.__doc__.strip(),
+                         'To F5 resource for /mgmt/tm/net/wccp')
+        self.assertIs(pickle.loads(pickle.dumps(NetWccp)), NetWccp)
+        self.assertIn('get_net_wccp', dir(bigip))
+        self.assertIn('NetWccp', dir(bigip))
+
+    def test_unknown(self):
+        with self.assertRaises(AttributeError):
+            bigip.NetUnknown
+        with self.assertRaises(ImportError):
+            importlib.import_module('genie.libs.parser.bigip.get_unknown')
+
+    def test_lookup(self):
+        self.assertEqual(resources.lookup('NetWccp'), 'get_net_wccp')
+        self.assertEqual(resources.lookup('get_net_wccp'), 'get_net_wccp')
+        self.assertIsNone(resources.lookup('NetUnknown'))
+
+    def test_rest(self):
+        output = {'kind': 'tm:net:wccp:wccpcollectionstate',
+                  'selfLink': 'https://localhost/mgmt/tm/net/wccp?ver=14.1.2',
+                  'items': [{'name': 'wccp1', 'fullPath': '/Common/wccp1'}]}
+        device = Mock(**{'get.return_value.json.return_value': output})
+        self.assertEqual(NetWccp(device=device, context='rest').parse(),
+                         output)
+        device.get.assert_called_once_with('/mgmt/tm/net/wccp')
+
+    def test_empty(self):
+        # the schema is empty, an empty reply is returned as it is
+        device = Mock(**{'get.return_value.json.return_value': {}})
+        self.assertEqual(NetWccp(device=device, context='rest').parse(), {})
+
+    def test_make_json(self):
+        with tempfile.TemporaryDirectory() as folder:
+            json_path = os.path.join(folder, 'parsers.json')
+            with open(json_path, 'w') as f:
+                json.dump({'tokens': ['iosxe'], 'show version': {
+                    'iosxe': {'module_name': 'show_platform'}}}, f)
+            self.assertEqual(resources.make_json(json_path), len(RESOURCES))
+            with open(json_path) as f:
+                data = json.load(f)
+        self.assertEqual(data['tokens'], ['iosxe', 'bigip'])
+        self.assertEqual(data['show version'],
+                         {'iosxe': {'module_name': 'show_platform'}})
+        self.assertEqual(len(data), len(RESOURCES) + 2)
+        entry = data['/mgmt/tm/net/wccp']['bigip']
+        self.assertEqual(entry['package'], 'genie.libs.parser')
+        self.assertEqual(entry['schema'], '{}')
+        # as get_parser finds the class of an entry
+        self.assertIs(getattr(getattr(bigip, entry['module_name']),
+                              entry['class']), NetWccp)
+
+    def test_make_json_link(self):
+        # the file parsers.json links to is written, the link is kept
+        with tempfile.TemporaryDirectory() as folder:
+            target = os.path.join(folder, 'github_parser.json')
+            with open(target, 'w') as f:
+                json.dump({'tokens': []}, f)
+            json_path = os.path.join(folder, 'parsers.json')
+            os.symlink('github_parser.json', json_path)
+            resources.make_json(json_path)
+            self.assertTrue(os.path.islink(json_path))
+            self.assertEqual(sorted(os.listdir(folder)),
+                             ['github_parser.json', 'parsers.json'])
+            with open(target) as f:
+                self.assertIn('/mgmt/tm/net/wccp', json.load(f))
+
+    def test_lazy(self):
+        # importing the package creates the module of no resource
+        created = subprocess.check_output([
+            sys.executable, '-c',
+            'import sys; import genie.libs.parser.bigip; '
+            'from genie.libs.parser.bigip import NetWccp; '
+            'print(sorted(m for m in sys.modules if ".get_" in m))'],
+            universal_newlines=True)
+        self.assertEqual(created.strip(),
+                         "['genie.libs.parser.bigip.get_net_wccp']")
+
+
+if __name__ == '__main__':
+    unittest.main()
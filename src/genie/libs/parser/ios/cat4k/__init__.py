@@ -1,3 +1,8 @@
 # Enable abstraction using this directory name as the abstraction token
 from genie import abstract
-abstract.declare_token(__name__)
\ No newline at end of file
+abstract.declare_token(__name__)
+
+from genie.libs.parser.utils.lazy import lazy_getattr
+
+# parser modules are imported when first accessed
+__getattr__ = lazy_getattr(__name__)
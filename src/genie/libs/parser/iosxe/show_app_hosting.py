@@ -1,6 +1,6 @@
 # Metaparser
 from genie.metaparser import MetaParser
-import genie.parsergen as pg
+from genie.libs.parser.utils.tabular import Tabular
 import re
 
 
@@ -35,9 +35,9 @@ class ShowApphostingList(ShowApphostingListSchema):
         # ---------------------------------------------------------                                                                                                 
         # utd                                      RUNNING   
         if out:
-            out = pg.oper_fill_tabular(device_output=out,
-                                    header_fields=["App id", "State"],
-                                    index=[0])
+            out = Tabular(device_output=out,
+                       header_fields=["App id", "State"],
+                       index=[0])
             return_dict = out.entries
             app_id ={}
             for keys in return_dict.keys() :
@@ -22,6 +22,7 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.columnar import ColumnarParser
 
 
 # =============================================
@@ -64,7 +65,7 @@ class ShowArpSchema(MetaParser):
     }
 
 
-class ShowArp(ShowArpSchema):
+class ShowArp(ColumnarParser, ShowArpSchema):
     """ Parser for show arp
                   show arp <WROD>
                   show arp vrf <vrf>
@@ -72,8 +73,15 @@ class ShowArp(ShowArpSchema):
 
     cli_command = ['show arp','show arp vrf {vrf}','show arp vrf {vrf} {intf_or_ip}','show arp {intf_or_ip}']
     exclude = ['age']
-
-    def cli(self, vrf='', intf_or_ip='', cmd=None, output=None):
+    columnar_tables = {
+        'neighbors': ('interfaces', '{interface}', 'ipv4', 'neighbors',
+                      '{ip}'),
+        'global_static_table': ('global_static_table', '{ip_address}')}
+    columnar_key_fields = ('ip', 'ip_address')
+    columnar_cli = True
+
+    def cli(self, vrf='', intf_or_ip='', cmd=None, output=None,
+            columnar=False):
         if output is None:
             if not cmd:
                 cmd = self.cli_command[0]
@@ -94,6 +102,15 @@ class ShowArp(ShowArpSchema):
                          '(?P<mac>[\w\.]+) +(?P<type>\w+)( +(?P<interface>[\w\.\/\-]+))?$')
         # initial variables
         ret_dict = {}
+        if columnar:
+            ret_dict = self.columnar_result()
+            # the columns of the tables, added at once
+            neighbors = {name: [] for name in (
+                'interface', 'ip', 'link_layer_address', 'type', 'origin',
+                'age', 'protocol')}
+            global_static = {name: [] for name in (
+                'ip_address', 'mac_address', 'encap_type', 'age',
+                'protocol')}
 
         for line in out.splitlines():
             line = line.strip()
@@ -102,6 +119,25 @@ class ShowArp(ShowArpSchema):
             # Internet  10.169.197.93          -   fa16.3eff.b7ad  ARPA
             m = p1.match(line)
             if m:
+                if columnar:
+                    protocol, address, age, mac, type_, _, interface = \
+                        m.groups()
+                    if interface:
+                        neighbors['interface'].append(interface)
+                        neighbors['ip'].append(address)
+                        neighbors['link_layer_address'].append(mac)
+                        neighbors['type'].append(type_)
+                        neighbors['origin'].append(
+                            'static' if age == '-' else 'dynamic')
+                        neighbors['age'].append(age)
+                        neighbors['protocol'].append(protocol)
+                    else:
+                        global_static['ip_address'].append(address)
+                        global_static['mac_address'].append(mac)
+                        global_static['encap_type'].append(type_)
+                        global_static['age'].append(age)
+                        global_static['protocol'].append(protocol)
+                    continue
                 group = m.groupdict()
                 address = group['address']
                 interface = group['interface']
@@ -128,6 +164,9 @@ class ShowArp(ShowArpSchema):
                 final_dict['protocol'] = group['protocol']
                 continue
 
+        if columnar:
+            ret_dict['neighbors'].extend(neighbors)
+            ret_dict['global_static_table'].extend(global_static)
         return ret_dict
 
 # =====================================
@@ -137,7 +176,7 @@ class ShowIpArp(ShowArp):
     """Parser for 'show ip arp,  show ip arp vrf <vrf>"""
     cli_command = ['show ip arp', 'show ip arp vrf {vrf}']
 
-    def cli(self, vrf='', output=None):
+    def cli(self, vrf='', output=None, columnar=False):
         if output is None:
             if vrf:
                 cmd = self.cli_command[1].format(vrf=vrf)
@@ -146,7 +185,7 @@ class ShowIpArp(ShowArp):
             out = self.device.execute(cmd)
         else:
             out = output
-        return super().cli(output=out)
+        return super().cli(output=out, columnar=columnar)
 # =====================================
 # Schema for 'show ip arp summary'
 # =====================================
@@ -115,6 +115,7 @@ from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
 # Parser
 from genie.libs.parser.iosxe.show_vrf import ShowVrf
+from genie.libs.parser.utils.patterns import Patterns
 
 
 # ============================================
@@ -208,38 +209,23 @@ class ShowBgpSuperParser(ShowBgpSchema):
         * 'show ip bgp {address_family} vrf {vrf}'
     '''
 
-    def cli(self, address_family='', vrf='', output=None):
-
-        # Init dictionary
-        route_dict = {}
-        af_dict = {}
-        if not vrf:
-            vrf = 'default'
-        if address_family:
-            original_address_family = address_family
-        index = 1
-        bgp_table_version = local_router_id = ''
-        metric = localpref = weight = ''
-        status_codes = ''
-        prefix = ""
-        origin_codes_info = origin_codes_data = ""
-
+    patterns = Patterns(
         # For address family: IPv4 Unicast
-        p1 = re.compile(r'^\s*For +address +family:'
-                        r' +(?P<address_family>[\S\s]+)$')
+        p1=r'^\s*For +address +family:'
+           r' +(?P<address_family>[\S\s]+)$',
 
         # BGP table version is 25, Local Router ID is 10.186.101.1
-        p2 = re.compile(r'^\s*BGP +table +version +is'
-                        r' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
-                        r' +ID +is +(?P<local_router_id>(\S+))$')
+        p2=r'^\s*BGP +table +version +is'
+           r' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
+           r' +ID +is +(?P<local_router_id>(\S+))$',
 
         #     Network          Next Hop            Metric LocPrf Weight Path
         # *>   [5][65535:1][0][24][10.1.1.0]/17
         # *>  100:2051:VEID-2:Blk-1/136
-        p3_1 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                          r'(?P<path_type>(i|e|c|l|a|r|I))?\s*'
-                          r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,\-]+)'
-                          r'(?: *(?P<param>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
+        p3_1=r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+             r'(?P<path_type>(i|e|c|l|a|r|I))?\s*'
+             r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,\-]+)'
+             r'(?: *(?P<param>[a-zA-Z0-9\.\:\/\[\]\,]+))?$',
 
         #     Network          Next Hop            Metric LocPrf Weight Path
         # * i                  10.4.1.1               2219    100      0 200 33299 51178 47751 {27016} e
@@ -248,11 +234,11 @@ class ShowBgpSuperParser(ShowBgpSchema):
         # r>                    0.0.0.0                 0         32768 ?
         # *m                    0.0.0.0                 0         32768 ?
         # * i                  ::FFFF:10.4.1.1        2219    100      0 200 33299 51178 47751 {27016} e
-        p3_2 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|m|r|\s)+)?'
-                          r'(?P<path_type>(i|e|c|l|a|r|I))?\s{10,20}'
-                          r'(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                          r' +(?P<metric>(?:\d+(?=[ \d]{13}\d ))?) +(?P<local_prf>(?:\d+(?=[ \d]{6}\d ))?) +(?P<weight>\d+)'
-                          r'(?P<termination>[\s\S]+)$')
+        p3_2=r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|m|r|\s)+)?'
+             r'(?P<path_type>(i|e|c|l|a|r|I))?\s{10,20}'
+             r'(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+             r' +(?P<metric>(?:\d+(?=[ \d]{13}\d ))?) +(?P<local_prf>(?:\d+(?=[ \d]{6}\d ))?) +(?P<weight>\d+)'
+             r'(?P<termination>[\s\S]+)$',
 
         # Network            Next Hop            Metric     LocPrf     Weight Path
         # *    10.36.3.0/24       10.36.3.254                0             0 65530 ?
@@ -262,39 +248,58 @@ class ShowBgpSuperParser(ShowBgpSchema):
         # *>i 2001:db8:cdc9:121::/64   ::FFFF:10.4.1.1        2219    100      0 200 33299 51178 47751 {27016} e
         # *>  100:2051:VEID-2:Blk-1/136
         # *>i10.1.1.0/24   0.0.0.0                   0    100      0 1234 60000 ?
-        p4 = re.compile(r'^\s*(?P<status_codes>(?:s|x|S|d|h|m|r|\*|\>|\s)+)?'
-                        r'(?P<path_type>(?:i|e|c|l|a|r|I))? *'
-                        r'(?P<prefix>[a-zA-Z0-9\.\:\/\-\[\]]+) +'
-                        r'(?P<next_hop>[a-zA-Z0-9\.\:]+) +'
-                        r'(?P<metric>(?:\d+(?=[ \d]{13}\d ))?) +'
-                        r'(?P<local_prf>(?:\d+(?=[ \d]{6}\d ))?) +'
-                        r'(?P<weight>\d+)(?P<path>[0-9 \S\{\}]+)$')
+        p4=r'^\s*(?P<status_codes>(?:s|x|S|d|h|m|r|\*|\>|\s)+)?'
+           r'(?P<path_type>(?:i|e|c|l|a|r|I))? *'
+           r'(?P<prefix>[a-zA-Z0-9\.\:\/\-\[\]]+) +'
+           r'(?P<next_hop>[a-zA-Z0-9\.\:]+) +'
+           r'(?P<metric>(?:\d+(?=[ \d]{13}\d ))?) +'
+           r'(?P<local_prf>(?:\d+(?=[ \d]{6}\d ))?) +'
+           r'(?P<weight>\d+)(?P<path>[0-9 \S\{\}]+)$',
 
         # AF-Private Import to Address-Family: L2VPN E-VPN, Pfx Count/Limit: 2/1000
-        p5 = re.compile(r'^\s*AF-Private +Import +to +Address-Family:'
-                        r' +(?P<af_private_import_to_address_family>[\s\S]+),'
-                        r' +Pfx +Count/Limit:'
-                        r' +(?P<pfx_count>[\d]+)\/+(?P<pfx_limit>[\d]+)$')
+        p5=r'^\s*AF-Private +Import +to +Address-Family:'
+           r' +(?P<af_private_import_to_address_family>[\s\S]+),'
+           r' +Pfx +Count/Limit:'
+           r' +(?P<pfx_count>[\d]+)\/+(?P<pfx_limit>[\d]+)$',
 
         # Route Distinguisher: 200:1
         # Route Distinguisher: 300:1 (default for vrf VRF1) VRF Router ID 10.94.44.44
-        p6 = re.compile(r'^\s*Route +Distinguisher *: '
-                        r'+(?P<route_distinguisher>(\S+))'
-                        r'( +\(default for vrf +(?P<default_vrf>(\S+))\))?'
-                        r'( +VRF Router ID (?P<vrf_router_id>(\S+)))?$')
+        p6=r'^\s*Route +Distinguisher *: '
+           r'+(?P<route_distinguisher>(\S+))'
+           r'( +\(default for vrf +(?P<default_vrf>(\S+))\))?'
+           r'( +VRF Router ID (?P<vrf_router_id>(\S+)))?$',
+    )
+
+    def cli(self, address_family='', vrf='', output=None):
+
+        # Init dictionary
+        p = self.patterns
+
+        route_dict = {}
+        af_dict = {}
+        if not vrf:
+            vrf = 'default'
+        if address_family:
+            original_address_family = address_family
+        index = 1
+        bgp_table_version = local_router_id = ''
+        metric = localpref = weight = ''
+        status_codes = ''
+        prefix = ""
+        origin_codes_info = origin_codes_data = ""
 
         for line in output.splitlines():
             line = line.rstrip()
 
             # For address family: IPv4 Unicast
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 address_family = str(m.groupdict()['address_family']).lower()
                 original_address_family = address_family
                 continue
 
             # BGP table version is 25, Local Router ID is 10.186.101.1
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 bgp_table_version = int(m.groupdict()['bgp_table_version'])
                 local_router_id = str(m.groupdict()['local_router_id'])
@@ -303,7 +308,7 @@ class ShowBgpSuperParser(ShowBgpSchema):
             #     Network          Next Hop            Metric LocPrf Weight Path
             # *>   [5][65535:1][0][24][10.1.1.0]/17
             # *>  100:2051:VEID-2:Blk-1/136
-            m = p3_1.match(line)
+            m = p.p3_1.match(line)
             if m:
                 # Get keys
                 if m.groupdict()['status_codes']:
@@ -326,7 +331,7 @@ class ShowBgpSuperParser(ShowBgpSchema):
             #                      0.0.0.0                  0         32768 ?
             # *>                    0.0.0.0                 0         32768 ?
             # * i                  ::FFFF:10.4.1.1        2219    100      0 200 33299 51178 47751 {27016} e
-            m = p3_2.match(line)
+            m = p.p3_2.match(line)
             if m:
                 # Get keys
                 path_type = ""
@@ -412,7 +417,7 @@ class ShowBgpSuperParser(ShowBgpSchema):
             # *>i 10.1.2.0/24      10.4.1.1               2219    100      0 200 33299 51178 47751 {27016} e
             # *>i 2001:db8:cdc9:121::/64   ::FFFF:10.4.1.1        2219    100      0 200 33299 51178 47751 {27016} e
             # *>  100:2051:VEID-2:Blk-1/136
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 path_type = ""
                 path_data = ""
@@ -490,7 +495,7 @@ class ShowBgpSuperParser(ShowBgpSchema):
                 continue
 
             # AF-Private Import to Address-Family: L2VPN E-VPN, Pfx Count/Limit: 2/1000
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 af_private_import_to_address_family = m.groupdict()['af_private_import_to_address_family']
                 pfx_count = int(m.groupdict()['pfx_count'])
@@ -519,7 +524,7 @@ class ShowBgpSuperParser(ShowBgpSchema):
 
             # Route Distinguisher: 200:1
             # Route Distinguisher: 300:1 (default for vrf VRF1) VRF Router ID 10.94.44.44
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 route_distinguisher = str(m.groupdict()['route_distinguisher'])
                 new_address_family = original_address_family + ' RD ' + route_distinguisher
@@ -901,45 +906,27 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
         * 'show ip bgp {address_family} rd {rd} detail'
     '''
 
-    def cli(self, address_family='', vrf='', rd='', output=None):
-        # Init dictionary
-        ret_dict = {}
-        subdict = ''
-        next_line_update_group = False
-        route_distinguisher = ''
-        new_address_family = ''
-        original_address_family = address_family
-        refresh_epoch_flag = False
-        route_info = ''
-        route_status = ''
-        aggregated_by_as = ''
-        aggregated_by_address = ''
-        imported_path_from = ''
-        imported_safety_path = False
-        refresh_epoch = None
-        cmd_vrf = vrf if vrf else None
-        default_vrf = None
-
+    patterns = Patterns(
         # For address family: IPv4 Unicast
         # For address family: L2VPN E-VPN
-        p1 = re.compile(r'^For +address +family:'
-                        r' +(?P<address_family>[a-zA-Z0-9\-\s]+)$')
+        p1=r'^For +address +family:'
+           r' +(?P<address_family>[a-zA-Z0-9\-\s]+)$',
 
         # Paths: (1 available, best #1, table default)
         # Paths: (1 available, best #1, table VRF1)
         # Paths: (1 available, best #1, no table)
         # Paths: (1 available, best #1, table default, RIB-failure(17))
-        p2 = re.compile(r'^Paths: +\((?P<paths>(?P<available_path>[0-9]+) +available\, '
-                        r'+(no +best +path|best +\#(?P<best_path>[0-9]+))\,?(?: +(table +('
-                        r'?P<vrf_id>\S+?)|no +table))?,?(?: +(.*))?)\)')
+        p2=r'^Paths: +\((?P<paths>(?P<available_path>[0-9]+) +available\, '
+           r'+(no +best +path|best +\#(?P<best_path>[0-9]+))\,?(?: +(table +('
+           r'?P<vrf_id>\S+?)|no +table))?,?(?: +(.*))?)\)',
 
         # Route Distinguisher: 100:100 (default for vrf VRF1)
         # Route Distinguisher: 65535:1 (default for vrf evpn1)
         # Route Distinguisher: 65109:3051
         # Route Distinguisher: 10.100.1.1:3014 (default for vrf vrf1)
-        p2_1 = re.compile(r'^Route +Distinguisher:'
-                          r' +(?P<route_distinguisher>[0-9.\:]+)'
-                          r'(?: +\(default +for +vrf +(?P<vrf_id>(\S+))\))?$')
+        p2_1=r'^Route +Distinguisher:'
+             r' +(?P<route_distinguisher>[0-9.\:]+)'
+             r'(?: +\(default +for +vrf +(?P<vrf_id>(\S+))\))?$',
 
         # BGP routing table entry for 10.4.1.1/32, version 4
         # BGP routing table entry for [100:100]2001:11:11::11/128, version 2
@@ -948,120 +935,120 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
         # BGP routing table entry for 2001:2:2:2::2/128, version 2
         # BGP routing table entry for [5][65535:1][0][24][10.36.3.0]/17, version 3
         # BGP routing table entry for 10.100.1.1:3014:0.0.0.0/0, version 74438
-        p3_1 = re.compile(r'^BGP +routing +table +entry +for +(\[[0-9]+\])?'
-                        r'((?P<route_distinguisher>((\[[0-9]+[\:][0-9]+\])'
-                        r'|[0-9]+])|([0-9.]+[:][0-9]+[:])))?(\[[0-9]+\])?'
-                        r'(\[[0-9]+\])?(?P<router_id>((\[[0-9]+[\.][0-9]+[\.]'
-                        r'[0-9]+[\.][0-9]+\][\/][0-9]+)|([0-9]+[\.][0-9]+[\.]'
-                        r'[0-9]+[\.][0-9]+[\/][0-9]+)|([a-zA-Z0-9]+[\:]'
-                        r'[a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:][\:][a-zA-Z0-9]+'
-                        r'[\/][0-9]+)|([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
-                        r'[a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:][\:][\/][0-9]+)|'
-                        r'([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
-                        r'[a-zA-Z0-9]+[\:][\:][0-9]+[\/][0-9]+)))\, +version '
-                        r'+(?P<prefix_table_version>[0-9]+)$')
+        p3_1=r'^BGP +routing +table +entry +for +(\[[0-9]+\])?'
+             r'((?P<route_distinguisher>((\[[0-9]+[\:][0-9]+\])'
+             r'|[0-9]+])|([0-9.]+[:][0-9]+[:])))?(\[[0-9]+\])?'
+             r'(\[[0-9]+\])?(?P<router_id>((\[[0-9]+[\.][0-9]+[\.]'
+             r'[0-9]+[\.][0-9]+\][\/][0-9]+)|([0-9]+[\.][0-9]+[\.]'
+             r'[0-9]+[\.][0-9]+[\/][0-9]+)|([a-zA-Z0-9]+[\:]'
+             r'[a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:][\:][a-zA-Z0-9]+'
+             r'[\/][0-9]+)|([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
+             r'[a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:][\:][\/][0-9]+)|'
+             r'([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
+             r'[a-zA-Z0-9]+[\:][\:][0-9]+[\/][0-9]+)))\, +version '
+             r'+(?P<prefix_table_version>[0-9]+)$',
 
         # BGP routing table entry for 65109:3051:VEID-1:Blk-1/136, version 2
-        p3_2 = re.compile(r'^BGP +routing +table +entry +for'
-                          r' +(?:(?P<rd>([0-9\:\[\]]+)))?:(?P<router_id>(\S+)),?'
-                          r' +version +(?P<version>(\d+))$')
+        p3_2=r'^BGP +routing +table +entry +for'
+             r' +(?:(?P<rd>([0-9\:\[\]]+)))?:(?P<router_id>(\S+)),?'
+             r' +version +(?P<version>(\d+))$',
 
         # 10.1.1.2 from 10.1.1.2 (10.1.1.2)
         # 10.16.2.2 (metric 11) (via default) from 10.16.2.2 (10.16.2.2)
         # :: (via vrf VRF1) from 0.0.0.0 (10.1.1.1)
         # 192.168.0.1 (inaccessible) from 192.168.0.9 (192.168.0.9)
         # 172.17.111.1 (via vrf SH_BGP_VRF100) from 172.17.111.1 (10.5.5.5)
-        p4 = re.compile(r'^((?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                        r'(( +\(metric +(?P<next_hop_igp_metric>[0-9]+)\))|'
-                        r'( +\((?P<inaccessible>inaccessible)\)))?'
-                        r'( +\(via +(?P<next_hop_via>[\S\s]+)\))? +'
-                        r'from +(?P<gateway>[a-zA-Z0-9\.\:]+)'
-                        r' +\((?P<originator>[0-9\.]+)\))$')
+        p4=r'^((?P<next_hop>[a-zA-Z0-9\.\:]+)'
+           r'(( +\(metric +(?P<next_hop_igp_metric>[0-9]+)\))|'
+           r'( +\((?P<inaccessible>inaccessible)\)))?'
+           r'( +\(via +(?P<next_hop_via>[\S\s]+)\))? +'
+           r'from +(?P<gateway>[a-zA-Z0-9\.\:]+)'
+           r' +\((?P<originator>[0-9\.]+)\))$',
 
         # Origin incomplete, metric 0, localpref 100, valid, internal
         # Origin incomplete, metric 0, localpref 100, valid, internal, best
         # Origin incomplete, metric 0, localpref 100, weight 32768, valid, sourced, best
         # Origin IGP, localpref 100, valid, external, atomic-aggregate
         # Origin IGP, localpref 100, valid, external, atomic-aggregate, best
-        p5 = re.compile(r'^Origin +(?P<origin>[a-zA-Z]+),(?: +metric '
-                        r'+(?P<metric>[0-9]+),?)?(?: +localpref '
-                        r'+(?P<locprf>[0-9]+),?)?(?: +weight '
-                        r'+(?P<weight>[0-9]+),?)?(?: +(?P<valid>valid?,))?(?: '
-                        r'+(?P<sourced>sourced?,))?(?: +(?P<state>(internal|'
-                        r'external|local)\,?))?(?: '
-                        r'+(?P<aggregate>atomic-aggregate?))?(\,)?(?: '
-                        r'+(?P<best>best))?$')
+        p5=r'^Origin +(?P<origin>[a-zA-Z]+),(?: +metric '
+           r'+(?P<metric>[0-9]+),?)?(?: +localpref '
+           r'+(?P<locprf>[0-9]+),?)?(?: +weight '
+           r'+(?P<weight>[0-9]+),?)?(?: +(?P<valid>valid?,))?(?: '
+           r'+(?P<sourced>sourced?,))?(?: +(?P<state>(internal|'
+           r'external|local)\,?))?(?: '
+           r'+(?P<aggregate>atomic-aggregate?))?(\,)?(?: '
+           r'+(?P<best>best))?$',
 
         # Advertised to update-groups:
-        p6_1 = re.compile(r'^Advertised +to +update-groups *:$')
+        p6_1=r'^Advertised +to +update-groups *:$',
 
         # Not advertised to any peer
-        p6_2 = re.compile(r'^Not +advertised +to +any +peer$')
+        p6_2=r'^Not +advertised +to +any +peer$',
 
         # 3
         # 38         44         45
-        p6_3 = re.compile(r'^(?P<group1>(\d+))'
-                          r'(?: +(?P<group2>(\d+)) +(?P<group3>(\d+)))?$')
+        p6_3=r'^(?P<group1>(\d+))'
+             r'(?: +(?P<group2>(\d+)) +(?P<group3>(\d+)))?$',
 
         # Refresh Epoch 1
-        p7 = re.compile(r'^Refresh +Epoch +(?P<refresh_epoch>[0-9]+)$')
+        p7=r'^Refresh +Epoch +(?P<refresh_epoch>[0-9]+)$',
 
         # Extended Community: RT:65535:1 ENCAP:8 Router MAC:001E.7AFF.FCD2
-        p8 = re.compile(r'^Extended +Community\:'
-                        r' +(?P<ext_community>([a-zA-Z0-9\-\:]+)) +ENCAP *:'
-                        r'(?P<encap>(\d+)) +Router +(?P<router_mac>(\S+))$')
+        p8=r'^Extended +Community\:'
+           r' +(?P<ext_community>([a-zA-Z0-9\-\:]+)) +ENCAP *:'
+           r'(?P<encap>(\d+)) +Router +(?P<router_mac>(\S+))$',
 
         # Extended Community: SoO:65109:999 RT:65109:50
         # Extended Community: RT:0:3051 RT:65109:3051 L2VPN L2:0x0:MTU-1500
         # Extended Community: RT:65109:50 RT:65109:51 , recursive-via-connected
-        p8_2 = re.compile(r'^Extended +Community *:'
-                          r' +(?P<ext_community>([a-zA-Z0-9\-\:\s]+))'
-                          r'(?: *, +(?P<recursive>(recursive-via-connected)))?$')
+        p8_2=r'^Extended +Community *:'
+             r' +(?P<ext_community>([a-zA-Z0-9\-\:\s]+))'
+             r'(?: *, +(?P<recursive>(recursive-via-connected)))?$',
 
         # Community: 62000:1
         # Community: 1:1 65100:101 65100:175 65100:500 65100:601 65151:65000 65351:1
-        p8_3 = re.compile(r'^Community: +(?P<community>[\S+\s]+)$')
+        p8_3=r'^Community: +(?P<community>[\S+\s]+)$',
 
         # AGI version(0), VE Block Size(10) Label Base(16)
-        p8_4 = re.compile(r'^AGI +version\((?P<agi_version>(\d+))\),'
-                          r' +VE +Block +Size\((?P<ve_block_size>(\d+))\)'
-                          r' +Label +Base\((?P<label_base>(\d+))\)$')
+        p8_4=r'^AGI +version\((?P<agi_version>(\d+))\),'
+             r' +VE +Block +Size\((?P<ve_block_size>(\d+))\)'
+             r' +Label +Base\((?P<label_base>(\d+))\)$',
 
         # Originator: 192.168.165.220, Cluster list: 0.0.0.61
-        p8_5 = re.compile(r'^\s*Originator: +(?P<originator>(\S+)),'
-                          r' +Cluster +list: +(?P<cluster_list>(\S+))$')
+        p8_5=r'^\s*Originator: +(?P<originator>(\S+)),'
+             r' +Cluster +list: +(?P<cluster_list>(\S+))$',
 
         # rx pathid: 0, tx pathid: 0
-        p9 = re.compile(r'^rx +pathid\: +(?P<recipient_pathid>[0-9x]+)\,'
-                        r' +tx +pathid\:'
-                        r' +(?P<transfer_pathid>[0-9x]+)$')
+        p9=r'^rx +pathid\: +(?P<recipient_pathid>[0-9x]+)\,'
+           r' +tx +pathid\:'
+           r' +(?P<transfer_pathid>[0-9x]+)$',
 
         # EVPN ESI: 00000000000000000000, Gateway Address: 0.0.0.0, local vtep: 10.21.33.33, Label 30000
-        p10 = re.compile(r'^EVPN +ESI\: +(?P<evpn_esi>[0-9]+)\,'
-                         r' +Gateway +Address\: +'
-                         r'(?P<gateway_address>[a-zA-Z0-9\.\:]+)\,'
-                         r' +local vtep\: +(?P<local_vtep>[a-zA-Z0-9\.\:]+)'
-                         r'\, +[L|l]abel +(?P<label>[0-9]+)$')
+        p10=r'^EVPN +ESI\: +(?P<evpn_esi>[0-9]+)\,'
+            r' +Gateway +Address\: +'
+            r'(?P<gateway_address>[a-zA-Z0-9\.\:]+)\,'
+            r' +local vtep\: +(?P<local_vtep>[a-zA-Z0-9\.\:]+)'
+            r'\, +[L|l]abel +(?P<label>[0-9]+)$',
 
         # Local vxlan vtep:
-        p11 = re.compile(r'^Local +vxlan +vtep\:$')
+        p11=r'^Local +vxlan +vtep\:$',
 
         # bdi:BDI200
-        p12 = re.compile(r'^bdi\:(?P<bdi>[A-Z0-9]+)$')
+        p12=r'^bdi\:(?P<bdi>[A-Z0-9]+)$',
 
         # vrf:evpn1, vni:30000
-        p13 = re.compile(r'^vrf\:(?P<vrf>[a-zA-Z0-9]+)\,'
-                         r' +vni\:(?P<vni>[0-9]+)$')
+        p13=r'^vrf\:(?P<vrf>[a-zA-Z0-9]+)\,'
+            r' +vni\:(?P<vni>[0-9]+)$',
 
         # local router mac:001E.7AFF.FCD2
-        p14 = re.compile(r'^local +router +mac\:'
-                         r'(?P<local_router_mac>[a-zA-Z0-9\.]+)$')
+        p14=r'^local +router +mac\:'
+            r'(?P<local_router_mac>[a-zA-Z0-9\.]+)$',
 
         # encap:8
-        p15 = re.compile(r'^encap\:(?P<encap>[0-9]+)$')
+        p15=r'^encap\:(?P<encap>[0-9]+)$',
 
         # vtep-ip:10.21.33.33
-        p16 = re.compile(r'^vtep-ip\:(?P<vtep_ip>[0-9\.]+)$')
+        p16=r'^vtep-ip\:(?P<vtep_ip>[0-9\.]+)$',
 
         # Local
         # 65530
@@ -1074,20 +1061,42 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
         # 4210105002 4210105502 4210105001 4210105507 4210105007 4210105220 65000 65151 65501, (aggregated by 65251 10.160.0.61), (received & used)
         # 4210105002 4210105502 4210105001 4210105507 4210105007 4210105220 65000 65151 65501, (aggregated by 65251 2001:db8:4::1), (received & used)
         # 4210105002 4210105502 4210105001 4210105507 4210105007 4210105220 65000 65151 65501, (aggregated by 65251 FE80:CD00:0:CDE:1257:0:211E:729C), (received & used)
-        p17 = re.compile(r'^(?P<route_info>[a-zA-Z0-9\-\.\{\}\s\(\)\/\:\[\]]+)'
-                       r'(\,)?(?: +\(aggregated +by +(?P<aggregated_by>[\w\s\.\:]'
-                       r'+)\)(\,))?(?: +(?P<route_status>[A-Za-z0-9\.\:\/\(\)\s'
-                       r'\[\]\-\&]+))?$')
-        
+        p17=r'^(?P<route_info>[a-zA-Z0-9\-\.\{\}\s\(\)\/\:\[\]]+)'
+            r'(\,)?(?: +\(aggregated +by +(?P<aggregated_by>[\w\s\.\:]'
+            r'+)\)(\,))?(?: +(?P<route_status>[A-Za-z0-9\.\:\/\(\)\s'
+            r'\[\]\-\&]+))?$',
+
         # mpls labels in/out nolabel/64402
-        p18 = re.compile(r'^mpls +labels +in\/out +(?P<in>\w+)\/(?P<out>\w+)$')
+        p18=r'^mpls +labels +in\/out +(?P<in>\w+)\/(?P<out>\w+)$',
+    )
+
+    def cli(self, address_family='', vrf='', rd='', output=None):
+        # Init dictionary
+        p = self.patterns
+
+        ret_dict = {}
+        subdict = ''
+        next_line_update_group = False
+        route_distinguisher = ''
+        new_address_family = ''
+        original_address_family = address_family
+        refresh_epoch_flag = False
+        route_info = ''
+        route_status = ''
+        aggregated_by_as = ''
+        aggregated_by_address = ''
+        imported_path_from = ''
+        imported_safety_path = False
+        refresh_epoch = None
+        cmd_vrf = vrf if vrf else None
+        default_vrf = None
 
         for line in output.splitlines():
             line = line.strip()
 
             # For address family: IPv4 Unicast
             # For address family: L2VPN E-VPN
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 index = 0
                 address_family = m.groupdict()['address_family'].lower()
@@ -1104,7 +1113,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
             # Paths: (1 available, best #1, table VRF1)
             # Paths: (1 available, best #1, no table)
             # Paths: (1 available, best #1, table default, RIB-failure(17))
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 original_address_family = address_family.lower()
@@ -1187,7 +1196,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
             # Route Distinguisher: 100:100 (default for vrf VRF1)
             # Route Distinguisher: 65535:1 (default for vrf evpn1)
             # Route Distinguisher: 10.100.1.1:3014 (default for vrf vrf1)
-            m = p2_1.match(line)
+            m = p.p2_1.match(line)
             if m:
                 route_distinguisher = m.groupdict()['route_distinguisher']
                 default_vrf = m.groupdict()['vrf_id']
@@ -1211,7 +1220,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
             # BGP routing table entry for 2001:2:2:2::2/128, version 2
             # BGP routing table entry for [5][65535:1][0][24][10.36.3.0]/17, version 3
             # BGP routing table entry for 10.100.1.1:3014:0.0.0.0/0, version 74438
-            m = p3_1.match(line)
+            m = p.p3_1.match(line)
             if m:
                 update_group = 0
                 index = 0
@@ -1222,7 +1231,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                 continue
 
             # BGP routing table entry for 65109:3051:VEID-1:Blk-1/136, version 2
-            m = p3_2.match(line)
+            m = p.p3_2.match(line)
             if m:
                 update_group = 0
                 index = 0
@@ -1236,7 +1245,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
             # :: (via vrf VRF1) from 0.0.0.0 (10.1.1.1)
             # 192.168.0.1 (inaccessible) from 192.168.0.9 (192.168.0.9)
             # 172.17.111.1 (via vrf SH_BGP_VRF100) from 172.17.111.1 (10.5.5.5)
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 index += 1
                 group = m.groupdict()
@@ -1291,7 +1300,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
             # Origin incomplete, metric 0, localpref 100, weight 32768, valid, sourced, best
             # Origin IGP, localpref 100, valid, external, atomic-aggregate
             # Origin IGP, localpref 100, valid, external, atomic-aggregate, best
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 group = m.groupdict()
                 status_codes = ''
@@ -1356,20 +1365,20 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                 continue
 
             # Advertised to update-groups:
-            m = p6_1.match(line)
+            m = p.p6_1.match(line)
             if m:
                 next_line_update_group = True
                 continue
 
             # Not advertised to any peer
-            m = p6_2.match(line)
+            m = p.p6_2.match(line)
             if m:
                 next_line_update_group = False
                 continue
 
             # 3
             # # 38         44         45
-            m = p6_3.match(line)
+            m = p.p6_3.match(line)
             if m and next_line_update_group:
                 group = m.groupdict()
                 if group['group2'] and group['group3']:
@@ -1384,14 +1393,14 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                 continue
 
             # Refresh Epoch 1
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 refresh_epoch_flag = True
                 refresh_epoch = int(m.groupdict()['refresh_epoch'])
                 continue
 
             # Extended Community: RT:65535:1 ENCAP:8 Router MAC:001E.7AFF.FCD2
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 group = m.groupdict()
 
@@ -1410,7 +1419,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
             # Extended Community: SoO:65109:999 RT:65109:50
             # Extended Community: RT:0:3051 RT:65109:3051 L2VPN L2:0x0:MTU-1500
             # Extended Community: RT:65109:50 RT:65109:51 , recursive-via-connected
-            m = p8_2.match(line)
+            m = p.p8_2.match(line)
             if m:
                 group = m.groupdict()
                 ext_community = group['ext_community']
@@ -1427,13 +1436,13 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
 
             # Community: 62000:1
             # Community: 1:1 65100:101 65100:175 65100:500 65100:601 65151:65000 65351:1
-            m = p8_3.match(line)
+            m = p.p8_3.match(line)
             if m:
                 subdict['community'] = m.groupdict()['community']
                 continue
 
             # AGI version(0), VE Block Size(10) Label Base(16)
-            m = p8_4.match(line)
+            m = p.p8_4.match(line)
             if m:
                 group = m.groupdict()
 
@@ -1443,20 +1452,20 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                 continue
 
             # Originator: 192.168.165.220, Cluster list: 0.0.0.61
-            m = p8_5.match(line)
+            m = p.p8_5.match(line)
             if m:
                 subdict['cluster_list'] = m.groupdict()['cluster_list']
                 continue
 
             # rx pathid: 0, tx pathid: 0
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 subdict['recipient_pathid'] = m.groupdict()['recipient_pathid']
                 subdict['transfer_pathid'] = m.groupdict()['transfer_pathid']
                 continue
             
             # mpls labels in/out nolabel/64402
-            m = p18.match(line)
+            m = p.p18.match(line)
             if m:
                 group = m.groupdict()
 
@@ -1466,7 +1475,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                 continue
 
             # EVPN ESI: 00000000000000000000, Gateway Address: 0.0.0.0, local vtep: 10.21.33.33, Label 30000
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 group = m.groupdict()
                 if 'evpn' not in subdict:
@@ -1479,7 +1488,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                 continue
 
             # Local vxlan vtep:
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 if 'local_vxlan_vtep' not in subdict:
                     subdict['local_vxlan_vtep'] = {}
@@ -1491,8 +1500,8 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
             # local router mac:001E.7AFF.FCD2
             # encap:8
             # vtep-ip:10.21.33.33
-            m = p12.match(line) or p14.match(line)\
-                or p15.match(line) or p16.match(line)
+            m = p.p12.match(line) or p.p14.match(line)\
+                or p.p15.match(line) or p.p16.match(line)
             if m and local_vxlan_vtep:
                 group = m.groupdict()
                 k = list(group)[0]
@@ -1500,7 +1509,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                 continue
 
             # vrf:evpn1, vni:30000
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m and local_vxlan_vtep:
                 subdict['local_vxlan_vtep']['vrf'] = m.groupdict()['vrf']
                 subdict['local_vxlan_vtep']['vni'] = m.groupdict()['vni']
@@ -1516,7 +1525,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
             # 4210105002 4210105502 4210105001 4210105507 4210105007 4210105220 65000 65151 65501, (aggregated by 65251 10.160.0.61), (received & used)
             # 4210105002 4210105502 4210105001 4210105507 4210105007 4210105220 65000 65151 65501, (aggregated by 65251 2001:db8:4::1), (received & used)
             # 4210105002 4210105502 4210105001 4210105507 4210105007 4210105220 65000 65151 65501, (aggregated by 65251 FE80:CD00:0:CDE:1257:0:211E:729C), (received & used)
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m and refresh_epoch_flag or m and m.groupdict()['route_info']:
                 group = m.groupdict()
                 route_info = group['route_info']
@@ -1843,9 +1852,93 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
         * 'show ip bgp {address_family} all summary'
     '''
 
+    patterns = Patterns(
+        rc1=r'address\-family\s+(?P<address_family>'
+            'ipv4|ipv6)\s+vrf\s+(?P<vrf>\S+)',
+        rc2=r'neighbor\s+(?P<neighbor_address>\S+)\s+'
+            'remote\-as\s+(?P<remote_as>\S+)',
+
+        # For address family: IPv4 Unicast
+        p1=r'^For address family: +(?P<address_family>[a-zA-Z0-9\s\-\_]+)$',
+
+        # BGP router identifier 192.168.111.1, local AS number 100
+        p2=r'^BGP +router +identifier'
+           ' +(?P<route_identifier>[0-9\.\:]+), +local +AS'
+           ' +number +(?P<local_as>[0-9]+)$',
+
+        # BGP table version is 28, main routing table version 28
+        p3=r'^BGP +table +version +is'
+           ' +(?P<bgp_table_version>[0-9]+),'
+           ' +main +routing +table +version'
+           ' +(?P<routing_table_version>[0-9]+)$',
+
+        # 27 network entries using 6696 bytes of memory
+        p4=r'^(?P<networks>[0-9]+) +network +entries +using'
+           ' +(?P<bytes>[0-9]+) +bytes +of +memory$',
+
+        # 27 path entries using 3672 bytes of memory
+        p5=r'^(?P<path>[0-9]+) +path +entries +using'
+           ' +(?P<memory_usage>[0-9]+) +bytes +of +memory$',
+
+        # 2 BGP rrinfo entries using 48 bytes of memory
+        # 201 BGP AS-PATH entries using 4824 bytes of memory
+        p5_1=r'^(?P<num_entries>([0-9]+)) +BGP'
+             ' +(?P<entries_type>(\S+)) +entries +using'
+             ' +(?P<entries_byte>[0-9]+) +bytes +of +memory$',
+
+        # 4 BGP extended community entries using 96 bytes of memory
+        p5_2=r'^(?P<num_community_entries>[0-9]+) +BGP +extended'
+             ' +community +entries +using'
+             ' +(?P<memory_usage>[0-9]+) +bytes +of +memory$',
+
+        # 1/1 BGP path/bestpath attribute entries using 280 bytes of memory
+        p6=r'^(?P<attribute_entries>(\S+)) +BGP'
+           ' +(?P<attribute_type>(\S+)) +attribute +entries'
+           ' +using +(?P<bytes>[0-9]+) +bytes +of +memory$',
+
+        # 0 BGP route-map cache entries using 0 bytes of memory
+        # 0 BGP filter-list cache entries using 0 bytes of memory
+        p6_1=r'^(?P<num_cache_entries>([0-9]+)) +BGP'
+             ' +(?P<cache_type>(\S+)) +cache +entries +using'
+             ' +(?P<cache_byte>[0-9]+) +bytes +of +memory$',
+
+        # BGP using 10648 total bytes of memory
+        p7=r'^BGP +using +(?P<total_memory>[0-9]+) +total +bytes'
+           ' +of +memory$',
+
+        # BGP activity 47/20 prefixes, 66/39 paths, scan interval 60 secs
+        p8=r'^BGP +activity +(?P<activity_prefixes>(\S+))'
+           ' +prefixes, +(?P<activity_paths>(\S+)) +paths, +scan'
+           ' +interval +(?P<scan_interval>[0-9]+) +secs$',
+
+        # Neighbor        V           AS MsgRcvd MsgSent   TblVer  InQ OutQ Up/Down  State/PfxRcd
+        # 192.168.111.1       4          100       0       0        1    0    0 01:07:38 Idle
+        # 192.168.4.1       4          100       0       0        1    0    0 never    Idle
+        # 192.168.51.1       4          100       0       0        1    0    0 01:07:38 Idle
+        p9=r'^ *(?P<our_entry>\*)?(?P<neighbor>[a-zA-Z0-9\.\:]+) +(?P<version>[0-9]+)'
+           ' +(?P<as>[0-9]+) +(?P<msg_rcvd>[0-9]+)'
+           ' +(?P<msg_sent>[0-9]+) +(?P<tbl_ver>[0-9]+)'
+           ' +(?P<inq>[0-9]+) +(?P<outq>[0-9]+)'
+           ' +(?P<up_down>[a-zA-Z0-9\:]+)'
+           ' +(?P<state>[a-zA-Z0-9\(\)\s]+)$',
+
+        #  Neighbor        V           AS MsgRcvd MsgSent   TblVer  InQ OutQ Up/Down  State/PfxRcd
+        #  2001:DB8:20:4:6::6
+        #           4          400      67      73       66    0    0 01:03:11        5
+        p10=r'^(?P<neighbor>[a-zA-Z0-9\.\:]+)$',
+        p11=r'^(?P<version>[0-9]+)'
+            ' +(?P<as>[0-9]+) +(?P<msg_rcvd>[0-9]+)'
+            ' +(?P<msg_sent>[0-9]+) +(?P<tbl_ver>[0-9]+)'
+            ' +(?P<inq>[0-9]+) +(?P<outq>[0-9]+)'
+            ' +(?P<up_down>[a-zA-Z0-9\:]+)'
+            ' +(?P<state>[a-zA-Z0-9\(\)\s]+)$',
+    )
+
     def cli(self, address_family='', vrf='', rd='',  cmd='', output=None):
 
         # Init vars
+        p = self.patterns
+
         sum_dict = {}
         cache_dict = {}
         entries_dict = {}
@@ -1881,18 +1974,12 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
                 for command in commands_list:
                     out_vrf = self.device.execute(command)
 
-                    rc1 = re.compile(r'address\-family\s+(?P<address_family>'
-                                      'ipv4|ipv6)\s+vrf\s+(?P<vrf>\S+)')
-
-                    rc2 = re.compile(r'neighbor\s+(?P<neighbor_address>\S+)\s+'
-                                'remote\-as\s+(?P<remote_as>\S+)')
-
                     flag_address_family = False            
 
                     for line in out_vrf.splitlines():
                         line = line.strip()
 
-                        result = rc1.match(line)
+                        result = p.rc1.match(line)
                         if result:
                             groupdict = result.groupdict()
                             address_family_d = bgp_config_dict.setdefault(groupdict['address_family'], {})
@@ -1902,95 +1989,19 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
                             continue
 
                         if flag_address_family:
-                            result = rc2.match(line)
+                            result = p.rc2.match(line)
                             if result:
                                 groupdict = result.groupdict()
                                 neighbor_dict = vrf_dict.setdefault(groupdict['neighbor_address'], {})
                                 neighbor_dict['remote_as'] = groupdict['remote_as']
                             continue
 
-        # For address family: IPv4 Unicast
-        p1 = re.compile(r'^For address family: +(?P<address_family>[a-zA-Z0-9\s\-\_]+)$')
-
-        # BGP router identifier 192.168.111.1, local AS number 100
-        p2 = re.compile(r'^BGP +router +identifier'
-                         ' +(?P<route_identifier>[0-9\.\:]+), +local +AS'
-                         ' +number +(?P<local_as>[0-9]+)$')
-
-        # BGP table version is 28, main routing table version 28
-        p3 = re.compile(r'^BGP +table +version +is'
-                         ' +(?P<bgp_table_version>[0-9]+),'
-                         ' +main +routing +table +version'
-                         ' +(?P<routing_table_version>[0-9]+)$')
-
-        # 27 network entries using 6696 bytes of memory
-        p4 = re.compile(r'^(?P<networks>[0-9]+) +network +entries +using'
-                         ' +(?P<bytes>[0-9]+) +bytes +of +memory$')
-
-        # 27 path entries using 3672 bytes of memory
-        p5 = re.compile(r'^(?P<path>[0-9]+) +path +entries +using'
-                         ' +(?P<memory_usage>[0-9]+) +bytes +of +memory$')
-
-        # 2 BGP rrinfo entries using 48 bytes of memory
-        # 201 BGP AS-PATH entries using 4824 bytes of memory
-        p5_1 = re.compile(r'^(?P<num_entries>([0-9]+)) +BGP'
-                           ' +(?P<entries_type>(\S+)) +entries +using'
-                           ' +(?P<entries_byte>[0-9]+) +bytes +of +memory$')
-
-        # 4 BGP extended community entries using 96 bytes of memory
-        p5_2 = re.compile(r'^(?P<num_community_entries>[0-9]+) +BGP +extended'
-                           ' +community +entries +using'
-                           ' +(?P<memory_usage>[0-9]+) +bytes +of +memory$')
-
-        # 1/1 BGP path/bestpath attribute entries using 280 bytes of memory
-        p6 = re.compile(r'^(?P<attribute_entries>(\S+)) +BGP'
-                         ' +(?P<attribute_type>(\S+)) +attribute +entries'
-                         ' +using +(?P<bytes>[0-9]+) +bytes +of +memory$')
-
-        # 0 BGP route-map cache entries using 0 bytes of memory
-        # 0 BGP filter-list cache entries using 0 bytes of memory
-        p6_1 = re.compile(r'^(?P<num_cache_entries>([0-9]+)) +BGP'
-                           ' +(?P<cache_type>(\S+)) +cache +entries +using'
-                           ' +(?P<cache_byte>[0-9]+) +bytes +of +memory$')
-
-        # BGP using 10648 total bytes of memory
-        p7 = re.compile(r'^BGP +using +(?P<total_memory>[0-9]+) +total +bytes'
-                         ' +of +memory$')
-
-        # BGP activity 47/20 prefixes, 66/39 paths, scan interval 60 secs
-        p8 = re.compile(r'^BGP +activity +(?P<activity_prefixes>(\S+))'
-                         ' +prefixes, +(?P<activity_paths>(\S+)) +paths, +scan'
-                         ' +interval +(?P<scan_interval>[0-9]+) +secs$')
-
-        # Neighbor        V           AS MsgRcvd MsgSent   TblVer  InQ OutQ Up/Down  State/PfxRcd
-        # 192.168.111.1       4          100       0       0        1    0    0 01:07:38 Idle
-        # 192.168.4.1       4          100       0       0        1    0    0 never    Idle
-        # 192.168.51.1       4          100       0       0        1    0    0 01:07:38 Idle
-        p9 = re.compile(r'^ *(?P<our_entry>\*)?(?P<neighbor>[a-zA-Z0-9\.\:]+) +(?P<version>[0-9]+)'
-                         ' +(?P<as>[0-9]+) +(?P<msg_rcvd>[0-9]+)'
-                         ' +(?P<msg_sent>[0-9]+) +(?P<tbl_ver>[0-9]+)'
-                         ' +(?P<inq>[0-9]+) +(?P<outq>[0-9]+)'
-                         ' +(?P<up_down>[a-zA-Z0-9\:]+)'
-                         ' +(?P<state>[a-zA-Z0-9\(\)\s]+)$')
-
-        #  Neighbor        V           AS MsgRcvd MsgSent   TblVer  InQ OutQ Up/Down  State/PfxRcd
-        #  2001:DB8:20:4:6::6
-        #           4          400      67      73       66    0    0 01:03:11        5
-        p10 = re.compile(r'^(?P<neighbor>[a-zA-Z0-9\.\:]+)$')
-
-        p11 = re.compile(r'^(?P<version>[0-9]+)'
-                          ' +(?P<as>[0-9]+) +(?P<msg_rcvd>[0-9]+)'
-                          ' +(?P<msg_sent>[0-9]+) +(?P<tbl_ver>[0-9]+)'
-                          ' +(?P<inq>[0-9]+) +(?P<outq>[0-9]+)'
-                          ' +(?P<up_down>[a-zA-Z0-9\:]+)'
-                         ' +(?P<state>[a-zA-Z0-9\(\)\s]+)$')
-
         for line in output.splitlines():
 
             line = line.strip()
 
             # For address family: IPv4 Unicast
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 # Save variables for use later
                 address_family = m.groupdict()['address_family'].lower()
@@ -2009,7 +2020,7 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
                 continue
 
             # BGP router identifier 192.168.111.1, local AS number 100
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 route_identifier = m.groupdict()['route_identifier']
                 local_as = int(m.groupdict()['local_as'])
@@ -2018,28 +2029,28 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
                 continue
 
             # BGP table version is 28, main routing table version 28
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 bgp_table_version = int(m.groupdict()['bgp_table_version'])
                 routing_table_version = int(m.groupdict()['routing_table_version'])
                 continue
 
             # 27 network entries using 6696 bytes of memory
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 num_prefix_entries = int(m.groupdict()['networks'])
                 num_memory_usage = int(m.groupdict()['bytes'])
                 continue
 
             # 27 path entries using 3672 bytes of memory
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 path_total_entries = int(m.groupdict()['path'])
                 path_memory_usage = int(m.groupdict()['memory_usage'])
                 continue
 
             # 2 BGP rrinfo entries using 48 bytes of memory
-            m = p5_1.match(line)
+            m = p.p5_1.match(line)
             if m:
                 num_entries = int(m.groupdict()['num_entries'])
                 entries_type = str(m.groupdict()['entries_type'])
@@ -2050,14 +2061,14 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
                 continue
 
             # 4 BGP extended community entries using 96 bytes of memory
-            m = p5_2.match(line)
+            m = p.p5_2.match(line)
             if m:
                 num_community_entries = int(m.groupdict()['num_community_entries'])
                 community_memory_usage = int(m.groupdict()['memory_usage'])
                 continue
 
             # 1/1 BGP path/bestpath attribute entries using 280 bytes of memory
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 attribute_entries = str(m.groupdict()['attribute_entries'])
                 attribute_type = str(m.groupdict()['attribute_type'])
@@ -2065,7 +2076,7 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
                 continue
 
             # 0 BGP route-map cache entries using 0 bytes of memory
-            m = p6_1.match(line)
+            m = p.p6_1.match(line)
             if m:
                 num_cache_entries = int(m.groupdict()['num_cache_entries'])
                 cache_type = str(m.groupdict()['cache_type'])
@@ -2077,13 +2088,13 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
                 continue
 
             # BGP using 10648 total bytes of memory
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 total_memory = int(m.groupdict()['total_memory'])
                 continue
 
             # BGP activity 47/20 prefixes, 66/39 paths, scan interval 60 secs
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 activity_prefixes = str(m.groupdict()['activity_prefixes'])
                 activity_paths = str(m.groupdict()['activity_paths'])
@@ -2094,7 +2105,7 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
             # 192.168.111.1       4          100       0       0        1    0    0 01:07:38 Idle
             # 192.168.4.1       4          100       0       0        1    0    0 never    Idle
             # 192.168.51.1       4          100       0       0        1    0    0 01:07:38 Idle
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 # Add neighbor to dictionary
                 neighbor = str(m.groupdict()['neighbor'])
@@ -2195,7 +2206,7 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
                 #  Neighbor        V           AS MsgRcvd MsgSent   TblVer  InQ OutQ Up/Down  State/PfxRcd
                 #  2001:DB8:20:4:6::6
                 #           4          400      67      73       66    0    0 01:03:11        5
-                m = p10.match(line)
+                m = p.p10.match(line)
                 if m :
                     # Add neighbor to dictionary
                     neighbor = str(m.groupdict()['neighbor'])
@@ -2212,7 +2223,7 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
                         nbr_dict['address_family'][address_family] = {}
                     nbr_af_dict = nbr_dict['address_family'][address_family]
 
-                m = p11.match(line)
+                m = p.p11.match(line)
                 if m:
                     # Add keys for this address_family
                     nbr_af_dict['version'] = int(m.groupdict()['version'])
@@ -2785,140 +2796,126 @@ class ShowBgpNeighborSuperParser(MetaParser):
         * 'show ip bgp {address_family} vrf {vrf} neighbors {neighbor}'
     '''
 
-    def cli(self, neighbor='', address_family='', vrf='', output=None):
-
-        # Init vars
-        ret_dict = {}
-        list_of_neighbors = []
-        af_name = None ; af_dict = {} ; nbr_dict = {}
-        message_statistics = False
-        prefix_activity = True
-        local_prefix = False
-        refresh_activity = False
-
+    patterns = Patterns(
         # For address family: IPv4 Unicast
         # For address family: L2VPN E-VPN
-        p1 = re.compile(r'^For +address +family: +(?P<af>[a-zA-Z0-9\-\s]+)$')
+        p1=r'^For +address +family: +(?P<af>[a-zA-Z0-9\-\s]+)$',
 
         # BGP neighbor is 10.16.2.2,  remote AS 100, internal link
-        p2_1 = re.compile(r'^BGP +neighbor +is +(?P<neighbor>(\S+)), +remote +AS'
-                         ' +(?P<remote_as>(\d+)), +(?P<link>[a-zA-Z]+) +link$')
+        p2_1=r'^BGP +neighbor +is +(?P<neighbor>(\S+)), +remote +AS'
+             ' +(?P<remote_as>(\d+)), +(?P<link>[a-zA-Z]+) +link$',
 
         # BGP neighbor is 10.66.6.6,  vrf VRF2,  remote AS 400, external link
         # BGP neighbor is 172.17.111.1,  vrf SH_BGP_VRF100,  remote AS 65000, external link
-        p2_2 = re.compile(r'^BGP +neighbor +is +(?P<neighbor>(\S+)), +vrf'
-                           ' +(?P<vrf>(\S+)), +remote +AS +(?P<remote_as>(\d+)),'
-                           ' +(?P<link>[a-zA-Z]+) +link$')
+        p2_2=r'^BGP +neighbor +is +(?P<neighbor>(\S+)), +vrf'
+             ' +(?P<vrf>(\S+)), +remote +AS +(?P<remote_as>(\d+)),'
+             ' +(?P<link>[a-zA-Z]+) +link$',
 
         # IOS output
         # BGP neighbor is 10.51.1.101,  remote AS 300,  local AS 101, external link
         # BGP neighbor is 10.51.1.101,  remote AS 300,  local AS 101 no-prepend replace-as, external link
-        p2_3 = re.compile(r'^BGP +neighbor +is +(?P<neighbor>(\S+)),'
-                           '(?: +vrf +(?P<vrf>(\S+)),)?'
-                           ' +remote +AS +(?P<remote_as>(\d+)),'
-                           ' +local +AS +(?P<local_as>\d+)(?P<no_prepend> no-prepend)?'
-                           '(?P<replace_as> replace-as)?, +(?P<link>(\S+)) +link$')
+        p2_3=r'^BGP +neighbor +is +(?P<neighbor>(\S+)),'
+             '(?: +vrf +(?P<vrf>(\S+)),)?'
+             ' +remote +AS +(?P<remote_as>(\d+)),'
+             ' +local +AS +(?P<local_as>\d+)(?P<no_prepend> no-prepend)?'
+             '(?P<replace_as> replace-as)?, +(?P<link>(\S+)) +link$',
 
         # Description: router22222222
-        p3 = re.compile(r'^Description: +(?P<description>(\S+))$')
+        p3=r'^Description: +(?P<description>(\S+))$',
 
         # Administratively shut down
-        p4 = re.compile(r'^Administratively shut down$')
+        p4=r'^Administratively shut down$',
 
         # BGP version 4, remote router ID 10.16.2.2
-        p5 = re.compile(r'^BGP +version +(?P<bgp_version>(\d+)), +remote'
-                         ' +router +ID +(?P<router_id>(\S+))$')
+        p5=r'^BGP +version +(?P<bgp_version>(\d+)), +remote'
+           ' +router +ID +(?P<router_id>(\S+))$',
 
         # BGP state = Established, up for 01:10:35
         # BGP state = Idle, down for 01:10:35
         # BGP state = Idle
         # BGP state = Established, up for 1w2d
         # Session state = Closing
-        p6 = re.compile(r'^(BGP|Session) +state += +(?P<session_state>(\S+))'
-                         '(?:, +(?P<state>(up|down)) +for +(?P<time>(\S+)))?$')
+        p6=r'^(BGP|Session) +state += +(?P<session_state>(\S+))'
+           '(?:, +(?P<state>(up|down)) +for +(?P<time>(\S+)))?$',
 
         # Last read 00:00:04, last write 00:00:09, hold time is 180, keepalive interval is 60 seconds
-        p7_1 = re.compile(r'^Last +read +(?P<last_read>(\S+)), +last +write'
-                           ' +(?P<last_write>(\S+)), +hold +time +is'
-                           ' +(?P<hold_time>(\d+)), +keepalive +interval +is'
-                           ' +(?P<keepalive>(\d+)) +seconds$')
+        p7_1=r'^Last +read +(?P<last_read>(\S+)), +last +write'
+             ' +(?P<last_write>(\S+)), +hold +time +is'
+             ' +(?P<hold_time>(\d+)), +keepalive +interval +is'
+             ' +(?P<keepalive>(\d+)) +seconds$',
 
         # Configured hold time is 90, keepalive interval is 30 seconds
-        p7_2 = re.compile(r'^Configured +hold +time +is (?P<holdtime>(\d+)),'
-                           ' +keepalive +interval +is +(?P<keepalive>(\d+))'
-                           ' +seconds$')
+        p7_2=r'^Configured +hold +time +is (?P<holdtime>(\d+)),'
+             ' +keepalive +interval +is +(?P<keepalive>(\d+))'
+             ' +seconds$',
 
         # Minimum holdtime from neighbor is 0 seconds
-        p7_3 = re.compile(r'^Minimum +holdtime +from +neighbor +is'
-                           ' +(?P<min_holdtime>(\d+)) +seconds$')
+        p7_3=r'^Minimum +holdtime +from +neighbor +is'
+             ' +(?P<min_holdtime>(\d+)) +seconds$',
 
         # Neighbor sessions:
-        p7_4 = re.compile(r'^Neighbor +sessions:+$')
+        p7_4=r'^Neighbor +sessions:+$',
 
         # Neighbor sessions:
         #  1 active, is not multisession capable (disabled)
-        p8 = re.compile(r'^(?P<sessions>(\d+)) active,(?: +is +not +multisession'
-                         ' +capable( +\(disabled\))?)?$')
+        p8=r'^(?P<sessions>(\d+)) active,(?: +is +not +multisession'
+           ' +capable( +\(disabled\))?)?$',
 
         # Neighbor capabilities:
-        p9 = re.compile(r'^Neighbor +capabilities:$')
+        p9=r'^Neighbor +capabilities:$',
 
         #  Route refresh: advertised and received(new)
-        p10 = re.compile(r'^Route +refresh: +(?P<route_refresh>(.*))$')
+        p10=r'^Route +refresh: +(?P<route_refresh>(.*))$',
 
         #  Four-octets ASN Capability: advertised and received
-        p11 = re.compile(r'^Four-octets +ASN +Capability: +(?P<cap>(.*))$')
+        p11=r'^Four-octets +ASN +Capability: +(?P<cap>(.*))$',
 
         # Address family VPNv4 Unicast: advertised and received
         # Address family VPNv6 Unicast: advertised and received
         # Address family link-state link-state: advertised
-        p12 = re.compile(r'^Address +family +(?P<af_type>([a-zA-Z0-9\s\-]+)) *:'
-                          ' +(?P<val>(.*))$')
+        p12=r'^Address +family +(?P<af_type>([a-zA-Z0-9\s\-]+)) *:'
+            ' +(?P<val>(.*))$',
 
         #  Graceful Restart Capability: received
-        p13 = re.compile(r'^Graceful +Restart +Capability: +(?P<gr>(.*))$')
+        p13=r'^Graceful +Restart +Capability: +(?P<gr>(.*))$',
 
         #   Remote Restart timer is 120 seconds
-        p14 = re.compile(r'^Remote +Restart +timer +is +(?P<timer>(\d+))'
-                          ' +seconds$')
+        p14=r'^Remote +Restart +timer +is +(?P<timer>(\d+))'
+            ' +seconds$',
 
         #   Address families advertised by peer:
         #    VPNv4 Unicast (was not preserved, VPNv6 Unicast (was not preserved
-        p15 = re.compile(r'^(?P<af_type1>([a-zA-Z0-9\s]+)) +\(was +not'
-                          ' +preserved, +(?P<af_type2>([a-zA-Z0-9\s]+))'
-                          ' +\(was +not +preserved$')
-
-        # Address families advertised by peer before restart:
-        #   IPv4 Unicast, VPNv4 Unicast, L2VPN Vpls
+        p15=r'^(?P<af_type1>([a-zA-Z0-9\s]+)) +\(was +not'
+            ' +preserved, +(?P<af_type2>([a-zA-Z0-9\s]+))'
+            ' +\(was +not +preserved$',
 
         #  Enhanced Refresh Capability: advertised
-        p16 = re.compile(r'^Enhanced +Refresh +Capability: +(?P<erc>(.*))$')
-
+        p16=r'^Enhanced +Refresh +Capability: +(?P<erc>(.*))$',
 
         #  Multisession Capability:
         #  Multisession Capability: advertised
-        p17 = re.compile(r'^Multisession +Capability: +(?P<multisession>(.*))$')
+        p17=r'^Multisession +Capability: +(?P<multisession>(.*))$',
 
         #  Stateful switchover support enabled: NO for session 1
-        p18 = re.compile(r'^Stateful +switchover +support +(?P<state>(\S+)):'
-                         ' +(?P<value>(.*))$')
+        p18=r'^Stateful +switchover +support +(?P<state>(\S+)):'
+            ' +(?P<value>(.*))$',
 
         # Message statistics:
         # Message statistics for 192.168.10.253 active:
         # Message statistics, state Established:
-        p19 = re.compile(r'^Message +statistics(( +for +(?P<state>[\w. ]+))|'
-                         r'(, +state +Established))?:$')
+        p19=r'^Message +statistics(( +for +(?P<state>[\w. ]+))|'
+            r'(, +state +Established))?:$',
 
         #  InQ depth is 0
         #  OutQ depth is 0
-        p20 = re.compile(r'^(?P<qtype>(InQ|OutQ)) +depth +is +(?P<val>(\d+))$')
+        p20=r'^(?P<qtype>(InQ|OutQ)) +depth +is +(?P<val>(\d+))$',
 
         # Prefix activity:               ----       ----
         # Local Policy Denied Prefixes:    --------    -------
         # Refresh activity:          ----   ----
-        p21 = re.compile(r'^(?P<table_type>(Prefix activity|'
-                          'Local Policy Denied Prefixes|Refresh activity)) *:'
-                          ' +(.*)$')
+        p21=r'^(?P<table_type>(Prefix activity|'
+            'Local Policy Denied Prefixes|Refresh activity)) *:'
+            ' +(.*)$',
 
         #  Opens:                  1          1
         #  Notifications:          0          0
@@ -2929,74 +2926,72 @@ class ShowBgpNeighborSuperParser(MetaParser):
         #  Prefixes Current:     403        201 (Consumes 27336 bytes)
         #  Used as bestpath:     n/a          0
         #  Used as multipath:    n/a          0
-        p22 = re.compile('^(?P<item>([a-zA-Z\s\-]+)):? +(?P<sent>(n/a|\d+))'
-                         ' +(?P<recv>(n/a|\d+))(?:\(Consumes +(?P<bytes>(\d+))'
-                         ' +bytes\))?$')
-
-        # Do log neighbor state changes (via global configuration)
+        p22='^(?P<item>([a-zA-Z\s\-]+)):? +(?P<sent>(n/a|\d+))'
+            ' +(?P<recv>(n/a|\d+))(?:\(Consumes +(?P<bytes>(\d+))'
+            ' +bytes\))?$',
 
         # Default minimum time between advertisement runs is 0 seconds
-        p23 = re.compile(r'^Default +minimum +time +between +advertisement'
-                          ' +runs +is +(?P<time>(\d+)) +seconds$')
+        p23=r'^Default +minimum +time +between +advertisement'
+            ' +runs +is +(?P<time>(\d+)) +seconds$',
 
         # Address tracking is enabled, the RIB does have a route to 10.16.2.2
         # Address tracking is enabled, the RIB does not have a route to 10.16.2.2
-        p24 = re.compile(r'^Address +tracking +is +(?P<status>(\S+)), +the +RIB'
-                          ' +does( +(?P<rip_has_route>(not)+))? +have +a +route +to +(?P<route>(\S+))$')
+        p24=r'^Address +tracking +is +(?P<status>(\S+)), +the +RIB'
+            ' +does( +(?P<rip_has_route>(not)+))? +have +a +route +to +(?P<route>(\S+))$',
 
         # Connections established 1; dropped 0
-        p25 = re.compile(r'^Connections +established +(?P<established>(\d+));'
-                          ' +dropped +(?P<dropped>(\d+))$')
+        p25=r'^Connections +established +(?P<established>(\d+));'
+            ' +dropped +(?P<dropped>(\d+))$',
 
         # Last reset never
         # Last reset 01:05:09, due to Active open failed
-        p26 = re.compile(r'^Last +reset +(?P<reset>(\S+))(?:, +due +to'
-                          ' +(?P<reason>(.*)))?$')
+        p26=r'^Last +reset +(?P<reset>(\S+))(?:, +due +to'
+            ' +(?P<reason>(.*)))?$',
 
         # Transport(tcp) path-mtu-discovery is enabled
-        p27 = re.compile(r'^Transport\(tcp\) +path-mtu-discovery +is'
-                          ' +(?P<status>(\S+))$')
+        p27=r'^Transport\(tcp\) +path-mtu-discovery +is'
+            ' +(?P<status>(\S+))$',
 
         # Graceful-Restart is disabled
         # Graceful-Restart is enabled, restart-time 120 seconds, stalepath-time 360 seconds
-        p28 = re.compile(r'^Graceful-Restart +is +(?P<gr>(enabled|disabled))'
-                          '(?:, +restart-time +(?P<restart>(\d+)) +seconds,'
-                          ' +stalepath-time +(?P<stalepath>(\d+)) +seconds)?$')
+        p28=r'^Graceful-Restart +is +(?P<gr>(enabled|disabled))'
+            '(?:, +restart-time +(?P<restart>(\d+)) +seconds,'
+            ' +stalepath-time +(?P<stalepath>(\d+)) +seconds)?$',
 
         # Connection state is ESTAB, I/O status: 1, unread input bytes: 0
-        p29 = re.compile(r'^Connection +state +is +(?P<state>(\S+)), +I/O'
-                          ' +status: (?P<io>(\d+)), +unread +input +bytes:'
-                          ' +(?P<bytes>(\d+))$')
+        p29=r'^Connection +state +is +(?P<state>(\S+)), +I/O'
+            ' +status: (?P<io>(\d+)), +unread +input +bytes:'
+            ' +(?P<bytes>(\d+))$',
 
         # Connection is ECN Disabled, Mininum incoming TTL 0, Outgoing TTL 255
-        p30 = re.compile(r'^Connection +is +ECN +(?P<ecn_state>(\S+)),'
-                          ' +Mininum +incoming +TTL +(?P<incoming_ttl>(\d+)),'
-                          ' +Outgoing +TTL +(?P<outgoing_ttl>(\d+))$')
+        p30=r'^Connection +is +ECN +(?P<ecn_state>(\S+)),'
+            ' +Mininum +incoming +TTL +(?P<incoming_ttl>(\d+)),'
+            ' +Outgoing +TTL +(?P<outgoing_ttl>(\d+))$',
 
         # Local host: 10.64.4.4, Local port: 35281
-        p31 = re.compile(r'^Local +host: +(?P<local_host>(\S+)), +Local +port:'
-                          ' +(?P<local_port>(\d+))$')
+        p31=r'^Local +host: +(?P<local_host>(\S+)), +Local +port:'
+            ' +(?P<local_port>(\d+))$',
 
         # Foreign host: 10.16.2.2, Foreign port: 179
-        p32 = re.compile(r'^Foreign +host: +(?P<foreign_host>(\S+)), +Foreign'
-                          ' +port: +(?P<foreign_port>(\d+))$')
+        p32=r'^Foreign +host: +(?P<foreign_host>(\S+)), +Foreign'
+            ' +port: +(?P<foreign_port>(\d+))$',
 
         # Connection tableid (VRF): 0
-        p33 = re.compile(r'^Connection +tableid +\(VRF\): +(?P<val>(\d+))$')
+        p33=r'^Connection +tableid +\(VRF\): +(?P<val>(\d+))$',
 
         # Maximum output segment queue size: 50
-        p34 = re.compile(r'^Maximum +output +segment +queue +size:'
-                          ' +(?P<size>(\d+))$')
+        p34=r'^Maximum +output +segment +queue +size:'
+            ' +(?P<size>(\d+))$',
 
         # Enqueued packets for retransmit: 0, input: 0  mis-ordered: 0 (0 bytes)
-        p35 = re.compile(r'^Enqueued +packets +for +retransmit:'
-                          ' +(?P<retransmit>(\d+)), +input: +(?P<input>(\d+))'
-                          ' +mis-ordered: +(?P<misordered>(\d+))'
-                          ' +\((?P<bytes>(\d+)) +bytes+\)$')
+        p35=r'^Enqueued +packets +for +retransmit:'
+            ' +(?P<retransmit>(\d+)), +input: +(?P<input>(\d+))'
+            ' +mis-ordered: +(?P<misordered>(\d+))'
+            ' +\((?P<bytes>(\d+)) +bytes+\)$',
 
         # Event Timers (current time is 0x530449):
-        p36 = re.compile(r'^Event +Timers +\(+current +time +is'
-                          ' +(?P<time>(\S+))+\):$')
+        p36=r'^Event +Timers +\(+current +time +is'
+            ' +(?P<time>(\S+))+\):$',
 
         # Timer          Starts    Wakeups            Next
         # Retrans            86          0             0x0
@@ -3009,160 +3004,175 @@ class ShowBgpNeighborSuperParser(MetaParser):
         # DeadWait            0          0             0x0
         # Linger              0          0             0x0
         # ProcessQ            0          0             0x0
-        p37 = re.compile(r'^(?P<item>(\S+)) +(?P<starts>(\d+))'
-                          ' +(?P<wakeups>(\d+)) +(?P<next>0x[0-9a-f]+)$')
+        p37=r'^(?P<item>(\S+)) +(?P<starts>(\d+))'
+            ' +(?P<wakeups>(\d+)) +(?P<next>0x[0-9a-f]+)$',
 
         # iss:   55023811  snduna:   55027115  sndnxt:   55027115
-        p38 = re.compile(r'^iss: +(?P<iss>(\d+)) +snduna: +(?P<snduna>(\d+))'
-                          ' +sndnxt: +(?P<sndnxt>(\d+))$')
+        p38=r'^iss: +(?P<iss>(\d+)) +snduna: +(?P<snduna>(\d+))'
+            ' +sndnxt: +(?P<sndnxt>(\d+))$',
 
         # irs:  109992783  rcvnxt:  109995158
-        p39 = re.compile(r'^irs: +(?P<irs>(\d+)) +rcvnxt: +(?P<rcvnxt>(\d+))$')
-
+        p39=r'^irs: +(?P<irs>(\d+)) +rcvnxt: +(?P<rcvnxt>(\d+))$',
 
         # sndwnd:  16616  scale:      0  maxrcvwnd:  16384
-        p40 = re.compile(r'^sndwnd: +(?P<sndwnd>(\d+)) +scale: +(?P<scale>(\d+))'
-                          ' +maxrcvwnd: +(?P<maxrcvwnd>(\d+))$')
+        p40=r'^sndwnd: +(?P<sndwnd>(\d+)) +scale: +(?P<scale>(\d+))'
+            ' +maxrcvwnd: +(?P<maxrcvwnd>(\d+))$',
 
         # rcvwnd:  16327  scale:      0  delrcvwnd:     57
-        p41 = re.compile(r'^rcvwnd: +(?P<rcvwnd>(\d+)) +scale: +(?P<scale>(\d+))'
-                          ' +delrcvwnd: +(?P<delrcvwnd>(\d+))$')
+        p41=r'^rcvwnd: +(?P<rcvwnd>(\d+)) +scale: +(?P<scale>(\d+))'
+            ' +delrcvwnd: +(?P<delrcvwnd>(\d+))$',
 
         # SRTT: 1000 ms, RTTO: 1003 ms, RTV: 3 ms, KRTT: 0 ms
-        p42 = re.compile(r'^SRTT: +(?P<srtt>(\d+)) +ms, +RTTO: +(?P<rtto>(\d+))'
-                          ' +ms, +RTV: +(?P<rtv>(\d+)) +ms, +KRTT:'
-                          ' +(?P<krtt>(\d+)) +ms$')
+        p42=r'^SRTT: +(?P<srtt>(\d+)) +ms, +RTTO: +(?P<rtto>(\d+))'
+            ' +ms, +RTV: +(?P<rtv>(\d+)) +ms, +KRTT:'
+            ' +(?P<krtt>(\d+)) +ms$',
 
         # minRTT: 4 ms, maxRTT: 1000 ms, ACK hold: 200 ms
-        p43 = re.compile(r'^minRTT: +(?P<min_rtt>(\d+)) +ms, +maxRTT:'
-                          ' +(?P<max_rtt>(\d+)) +ms, +ACK +hold:'
-                          ' +(?P<ack_hold>(\d+)) +ms$')
-
+        p43=r'^minRTT: +(?P<min_rtt>(\d+)) +ms, +maxRTT:'
+            ' +(?P<max_rtt>(\d+)) +ms, +ACK +hold:'
+            ' +(?P<ack_hold>(\d+)) +ms$',
 
         # uptime: 4236258 ms, Sent idletime: 4349 ms, Receive idletime: 4549 ms
-        p44 = re.compile(r'^uptime: +(?P<uptime>(\d+)) +ms, +Sent +idletime:'
-                          ' +(?P<sent>(\d+)) +ms, +Receive +idletime:'
-                          ' +(?P<receive>(\d+)) +ms$')
+        p44=r'^uptime: +(?P<uptime>(\d+)) +ms, +Sent +idletime:'
+            ' +(?P<sent>(\d+)) +ms, +Receive +idletime:'
+            ' +(?P<receive>(\d+)) +ms$',
 
         # Status Flags: active open
-        p45 = re.compile(r'^Status +Flags: +(?P<flags>(.*))$')
+        p45=r'^Status +Flags: +(?P<flags>(.*))$',
 
         # Option Flags: nagle, path mtu capable
-        p46 = re.compile(r'^Option +Flags: +(?P<flags>(.*))$')
+        p46=r'^Option +Flags: +(?P<flags>(.*))$',
 
         # IP Precedence value : 6
-        p47 = re.compile(r'^IP +Precedence +value : +(?P<value>(\d+))$')
+        p47=r'^IP +Precedence +value : +(?P<value>(\d+))$',
 
         # Datagrams (max data segment is 536 bytes):
-        p48 = re.compile(r'^Datagrams +\(max +data +segment +is'
-                          ' +(?P<bytes>(\d+)) +bytes\):$')
+        p48=r'^Datagrams +\(max +data +segment +is'
+            ' +(?P<bytes>(\d+)) +bytes\):$',
 
         # Rcvd: 164 (out of order: 0), with data: 80, total data bytes: 2374
-        p49 = re.compile(r'^Rcvd: +(?P<received>(\d+)) +\(out +of +order:'
-                          ' +(?P<out_of_order>(\d+))\), +with +data:'
-                          ' (?P<with_data>(\d+)), +total +data +bytes:'
-                          ' (?P<total_data>(\d+))$')
+        p49=r'^Rcvd: +(?P<received>(\d+)) +\(out +of +order:'
+            ' +(?P<out_of_order>(\d+))\), +with +data:'
+            ' (?P<with_data>(\d+)), +total +data +bytes:'
+            ' (?P<total_data>(\d+))$',
 
         # Sent: 166 (retransmit: 0, fastretransmit: 0, partialack: 0, Second Congestion: 0), with data: 87, total data bytes: 3303
-        p50 = re.compile(r'^Sent: (?P<sent>(\d+)) +\(retransmit:'
-                          ' +(?P<retransmit>(\d+)), +fastretransmit:'
-                          ' +(?P<fastretransmit>(\d+)), +partialack:'
-                          ' +(?P<partialack>(\d+)), +Second +Congestion:'
-                          ' +(?P<second_congestion>(\d+))\), +with +data:'
-                          ' (?P<sent_with_data>(\d+)), +total +data +bytes:'
-                          ' +(?P<sent_total_data>(\d+))$')
-
+        p50=r'^Sent: (?P<sent>(\d+)) +\(retransmit:'
+            ' +(?P<retransmit>(\d+)), +fastretransmit:'
+            ' +(?P<fastretransmit>(\d+)), +partialack:'
+            ' +(?P<partialack>(\d+)), +Second +Congestion:'
+            ' +(?P<second_congestion>(\d+))\), +with +data:'
+            ' (?P<sent_with_data>(\d+)), +total +data +bytes:'
+            ' +(?P<sent_total_data>(\d+))$',
 
         # Packets received in fast path: 0, fast processed: 0, slow path: 0
-        p51 = re.compile(r'^Packets +received +in +fast +path: +(?P<rcv>(\d+)),'
-                          ' +fast +processed: +(?P<processed>(\d+)),'
-                          ' +slow +path: +(?P<path>(\d+))$')
+        p51=r'^Packets +received +in +fast +path: +(?P<rcv>(\d+)),'
+            ' +fast +processed: +(?P<processed>(\d+)),'
+            ' +slow +path: +(?P<path>(\d+))$',
 
         # fast lock acquisition failures: 0, slow path: 0
-        p52 = re.compile(r'^fast +lock +acquisition +failures:'
-                          ' +(?P<failures>(\d+)), +slow +path: +(?P<path>(\d+))$')
-
+        p52=r'^fast +lock +acquisition +failures:'
+            ' +(?P<failures>(\d+)), +slow +path: +(?P<path>(\d+))$',
 
         # TCP Semaphore      0x1286E7EC  FREE
-        p53 = re.compile(r'^TCP +Semaphore +(?P<semaphore>0x[0-9a-fA-F]+)'
-                          ' +(?P<status>(\S+))$')
+        p53=r'^TCP +Semaphore +(?P<semaphore>0x[0-9a-fA-F]+)'
+            ' +(?P<status>(\S+))$',
 
         # BGP table version 9431, neighbor version 9431/0
-        p54 = re.compile(r'^BGP +table +version +(?P<bgp_table_version>(\d+)),'
-                          ' +neighbor +version +(?P<nbr_version>(\S+))$')
+        p54=r'^BGP +table +version +(?P<bgp_table_version>(\d+)),'
+            ' +neighbor +version +(?P<nbr_version>(\S+))$',
 
         # Output queue size : 0
-        p55 = re.compile(r'^Output +queue +size *: +(?P<size>(\d+))$')
+        p55=r'^Output +queue +size *: +(?P<size>(\d+))$',
 
         # Index 38, Advertise bit 1
-        p56 = re.compile(r'^Index +(?P<index>(\d+)), +Advertise +bit'
-                        ' +(?P<adv_bit>(\d+))$')
+        p56=r'^Index +(?P<index>(\d+)), +Advertise +bit'
+            ' +(?P<adv_bit>(\d+))$',
 
         # Route-Reflector Client
-        p57 = re.compile(r'^Route-Reflector +Client$')
+        p57=r'^Route-Reflector +Client$',
 
         # 38 update-group member
-        p58 = re.compile(r'^(?P<num>(\d+)) +update-group +member$')
+        p58=r'^(?P<num>(\d+)) +update-group +member$',
 
         # Community attribute sent to this neighbor
-        p59 = re.compile(r'^Community +attribute +sent +to +this +neighbor$')
+        p59=r'^Community +attribute +sent +to +this +neighbor$',
 
         # Extended-community attribute sent to this neighbor
-        p60 = re.compile(r'^Extended-community +attribute +sent +to +this'
-                        ' +neighbor$')
+        p60=r'^Extended-community +attribute +sent +to +this'
+            ' +neighbor$',
 
         # Suppress LDP signaling protocol
-        p61 = re.compile(r'^Suppress +LDP +signaling +protocol$')
+        p61=r'^Suppress +LDP +signaling +protocol$',
 
         # Slow-peer detection is disabled
-        p62 = re.compile(r'^Slow-peer +detection +is'
-                          ' +(?P<state>(enabled|disabled))$')
+        p62=r'^Slow-peer +detection +is'
+            ' +(?P<state>(enabled|disabled))$',
 
         # Slow-peer split-update-group dynamic is disabled
-        p63 = re.compile(r'^Slow-peer +split-update-group +dynamic +is'
-                          ' +(?P<state>(enabled|disabled))$')
+        p63=r'^Slow-peer +split-update-group +dynamic +is'
+            ' +(?P<state>(enabled|disabled))$',
 
         # Number of NLRIs in the update sent: max 199, min 0
-        p64 = re.compile(r'^Number +of +NLRIs +in +the +update +sent: +max'
-                        ' +(?P<max>(\d+)), +min +(?P<min>(\d+))$')
+        p64=r'^Number +of +NLRIs +in +the +update +sent: +max'
+            ' +(?P<max>(\d+)), +min +(?P<min>(\d+))$',
 
         # Last detected as dynamic slow peer: never
-        p65 = re.compile(r'^Last +detected +as +dynamic +slow +peer:'
-                          ' +(?P<val>(\S+))$')
+        p65=r'^Last +detected +as +dynamic +slow +peer:'
+            ' +(?P<val>(\S+))$',
 
         # Dynamic slow peer recovered: never
-        p66 = re.compile(r'^Dynamic +slow +peer +recovered: +(?P<val>(\S+))$')
+        p66=r'^Dynamic +slow +peer +recovered: +(?P<val>(\S+))$',
 
         # Refresh Epoch: 3
-        p67 = re.compile(r'^Refresh +Epoch: +(?P<num>(\d+))$')
+        p67=r'^Refresh +Epoch: +(?P<num>(\d+))$',
 
         # Last Sent Refresh Start-of-rib: 02:41:38
         # Last Received Refresh Start-of-rib: 02:01:36
-        p68 = re.compile(r'^Last +(Sent|Received) +Refresh +Start-of-rib:'
-                          ' +(?P<val>(\S+))$')
+        p68=r'^Last +(Sent|Received) +Refresh +Start-of-rib:'
+            ' +(?P<val>(\S+))$',
 
         # Last Sent Refresh End-of-rib: 02:41:38
         # Last Received Refresh End-of-rib: 02:01:32
-        p69 = re.compile(r'^Last +(Sent|Received) +Refresh +End-of-rib:'
-                          ' +(?P<val>(\S+))$')
+        p69=r'^Last +(Sent|Received) +Refresh +End-of-rib:'
+            ' +(?P<val>(\S+))$',
 
         # Refresh-Out took 0 seconds
         # Refresh-In took 4 seconds
-        p70 = re.compile(r'^Refresh-(?P<type>(In|Out)) +took +(?P<val>(\d+))'
-                          ' +seconds$')
+        p70=r'^Refresh-(?P<type>(In|Out)) +took +(?P<val>(\d+))'
+            ' +seconds$',
 
         # SSO is disabled
-        p71 = re.compile(r'^SSO +is +(?P<state>(enabled|disabled))$')
+        p71=r'^SSO +is +(?P<state>(enabled|disabled))$',
 
         # No active TCP connection
-        p72 = re.compile(r'^No +active +TCP +connection$')
+        p72=r'^No +active +TCP +connection$',
+    )
+
+    def cli(self, neighbor='', address_family='', vrf='', output=None):
+
+        # Init vars
+        p = self.patterns
+
+        ret_dict = {}
+        list_of_neighbors = []
+        af_name = None ; af_dict = {} ; nbr_dict = {}
+        message_statistics = False
+        prefix_activity = True
+        local_prefix = False
+        refresh_activity = False
+
+        # Address families advertised by peer before restart:
+        #   IPv4 Unicast, VPNv4 Unicast, L2VPN Vpls
+
+        # Do log neighbor state changes (via global configuration)
 
         for line in output.splitlines():
 
             line = line.strip()
 
             # For address family: IPv4 Unicast
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 af_name = m.groupdict()['af'].lower().replace("-", "")
                 # af_dict
@@ -3172,7 +3182,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # BGP neighbor is 10.16.2.2,  remote AS 100, internal link
-            m = p2_1.match(line)
+            m = p.p2_1.match(line)
             if m:
                 group = m.groupdict()
                 neighbor = group['neighbor']
@@ -3200,7 +3210,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
 
             # BGP neighbor is 10.66.6.6,  vrf VRF2,  remote AS 400, external link
             # BGP neighbor is 172.17.111.1,  vrf SH_BGP_VRF100,  remote AS 65000, external link
-            m = p2_2.match(line)
+            m = p.p2_2.match(line)
             if m:
                 group = m.groupdict()
                 neighbor = group['neighbor']
@@ -3227,7 +3237,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
 
             # BGP neighbor is 10.51.1.101,  remote AS 300,  local AS 101, external link
             # BGP neighbor is 10.51.1.101,  remote AS 300,  local AS 101 no-prepend replace-as, external link
-            m = p2_3.match(line)
+            m = p.p2_3.match(line)
             if m:
                 group = m.groupdict()
                 neighbor = group['neighbor']
@@ -3263,19 +3273,19 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Description: router22222222
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 nbr_dict['description'] = m.groupdict()['description']
                 continue
 
             # Administratively shut down
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 nbr_dict['shutdown'] = True
                 continue
 
             # BGP version 4, remote router ID 10.16.2.2
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 group = m.groupdict()
                 nbr_dict['bgp_version'] = int(group['bgp_version'])
@@ -3286,7 +3296,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
             # BGP state = Idle, down for 01:10:35
             # BGP state = Idle
             # BGP state = Established, up for 1w2d
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 group = m.groupdict()
                 nbr_dict['session_state'] = group['session_state']
@@ -3300,7 +3310,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Last read 00:00:04, last write 00:00:09, hold time is 180, keepalive interval is 60 seconds
-            m = p7_1.match(line)
+            m = p.p7_1.match(line)
             if m:
                 group = m.groupdict()
                 timers_dict = nbr_dict.\
@@ -3313,7 +3323,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Configured hold time is 90, keepalive interval is 30 seconds
-            m = p7_2.match(line)
+            m = p.p7_2.match(line)
             if m:
                 group = m.groupdict()
                 timers_dict = nbr_dict.\
@@ -3323,13 +3333,13 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Minimum holdtime from neighbor is 0 seconds
-            m = p7_3.match(line)
+            m = p.p7_3.match(line)
             if m:
                 timers_dict['min_holdtime'] = int(m.groupdict()['min_holdtime'])
                 continue
 
             # Neighbor sessions:
-            m = p7_4.match(line)
+            m = p.p7_4.match(line)
             if m:
                 neighbor_type = 'neighbor_session'
                 nbr_session_dict = nbr_dict.\
@@ -3337,7 +3347,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             #  1 active, is not multisession capable (disabled)
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 neighbor_active_sessions = int(m.groupdict()['sessions'])
                 if neighbor_type == 'neighbor_session':
@@ -3346,7 +3356,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
 
 
             # Neighbor capabilities:
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 neighbor_type = 'neighbor_capabilities'
                 nbr_cap_dict = nbr_dict.\
@@ -3354,13 +3364,13 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             #  Route refresh: advertised and received(new)
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 nbr_cap_dict['route_refresh'] = m.groupdict()['route_refresh']
                 continue
 
             #  Four-octets ASN Capability: advertised and received
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 nbr_cap_dict['four_octets_asn'] = m.groupdict()['cap']
                 continue
@@ -3370,7 +3380,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
             # Address family IPv4 Unicast: advertised and received
             # Address family IPv6 Unicast: advertised and received
             # Address family link-state link-state: advertised
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 group = m.groupdict()
                 af_type = group['af_type'].lower().replace(" ", "_")
@@ -3378,20 +3388,20 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             #  Graceful Restart Capability: received
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 nbr_cap_dict['graceful_restart'] = m.groupdict()['gr']
                 continue
 
             #   Remote Restart timer is 120 seconds
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 nbr_cap_dict['remote_restart_timer'] = int(m.groupdict()['timer'])
                 continue
 
             #   Address families advertised by peer:
             #    VPNv4 Unicast (was not preserved, VPNv6 Unicast (was not preserved
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 af_list = []
                 group = m.groupdict()
@@ -3401,20 +3411,20 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             #  Enhanced Refresh Capability: advertised
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 nbr_cap_dict['enhanced_refresh'] = m.groupdict()['erc']
                 continue
 
             #  Multisession Capability:
             #  Multisession Capability: advertised
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 nbr_cap_dict['multisession'] = m.groupdict()['multisession']
                 continue
 
             # Stateful switchover support enabled: NO for session 1
-            m = p18.match(line)
+            m = p.p18.match(line)
             if m:
                 if neighbor_type == 'neighbor_session':
                     nbr_session_dict['stateful_switchover'] = m.groupdict()['value']
@@ -3425,7 +3435,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
             # Message statistics:
             # Message statistics for 192.168.10.253 active:
             # Message statistics, state Established:
-            m = p19.match(line)
+            m = p.p19.match(line)
             if m:
                 message_statistics = True
                 prefix_activity = False
@@ -3449,7 +3459,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
 
             #  InQ depth is 0
             #  OutQ depth is 0
-            m = p20.match(line)
+            m = p.p20.match(line)
             if m:
                 group = m.groupdict()
                 key = '{}_depth'.format(group['qtype'].lower().\
@@ -3460,7 +3470,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
             # Prefix activity:               ----       ----
             # Local Policy Denied Prefixes:    --------    -------
             # Refresh activity:          ----   ----
-            m = p21.match(line)
+            m = p.p21.match(line)
             if m:
                 table_type = m.groupdict()['table_type'].lower()
                 if table_type == 'prefix activity':
@@ -3500,7 +3510,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
             #  Keepalives:            75         74
             #  Route Refresh:          0          0
             #  Total:                 87         81
-            m = p22.match(line)
+            m = p.p22.match(line)
             if m:
                 group = m.groupdict()
                 item = group['item'].strip().lower().replace(" ", "_").\
@@ -3530,7 +3540,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Default minimum time between advertisement runs is 0 seconds
-            m = p23.match(line)
+            m = p.p23.match(line)
             if m:
                 session_transport_dict = nbr_dict.\
                                         setdefault('bgp_session_transport', {})
@@ -3540,7 +3550,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
 
             # Address tracking is enabled, the RIB does have a route to 10.16.2.2
             # Address tracking is enabled, the RIB does not have a route to 10.16.2.2
-            m = p24.match(line)
+            m = p.p24.match(line)
             if m:
                 group = m.groupdict()
                 session_transport_dict['address_tracking_status'] = group['status']
@@ -3549,7 +3559,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Connections established 1; dropped 0
-            m = p25.match(line)
+            m = p.p25.match(line)
             if m:
                 group = m.groupdict()
                 conn_dict = session_transport_dict.setdefault('connection', {})
@@ -3558,7 +3568,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Last reset never
-            m = p26.match(line)
+            m = p.p26.match(line)
             if m:
                 group = m.groupdict()
                 conn_dict['last_reset'] = group['reset']
@@ -3567,7 +3577,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Transport(tcp) path-mtu-discovery is enabled
-            m = p27.match(line)
+            m = p.p27.match(line)
             if m:
                 session_transport_dict['tcp_path_mtu_discovery'] = \
                                                         m.groupdict()['status']
@@ -3575,7 +3585,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
 
             # Graceful-Restart is disabled
             # Graceful-Restart is enabled, restart-time 120 seconds, stalepath-time 360 seconds
-            m = p28.match(line)
+            m = p.p28.match(line)
             if m:
                 group = m.groupdict()
                 session_transport_dict['graceful_restart'] = group['gr']
@@ -3588,7 +3598,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Connection state is ESTAB, I/O status: 1, unread input bytes: 0
-            m = p29.match(line)
+            m = p.p29.match(line)
             if m:
                 group = m.groupdict()
                 session_transport_dict['connection_state'] = \
@@ -3598,7 +3608,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Connection is ECN Disabled, Mininum incoming TTL 0, Outgoing TTL 255
-            m = p30.match(line)
+            m = p.p30.match(line)
             if m:
                 group = m.groupdict()
                 session_transport_dict['ecn_connection'] = \
@@ -3610,7 +3620,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Local host: 10.64.4.4, Local port: 35281
-            m = p31.match(line)
+            m = p.p31.match(line)
             if m:
                 group = m.groupdict()
                 transport_dict = session_transport_dict.\
@@ -3620,7 +3630,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Foreign host: 10.16.2.2, Foreign port: 179
-            m = p32.match(line)
+            m = p.p32.match(line)
             if m:
                 group = m.groupdict()
                 transport_dict['foreign_host'] = group['foreign_host']
@@ -3628,21 +3638,21 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Connection tableid (VRF): 0
-            m = p33.match(line)
+            m = p.p33.match(line)
             if m:
                 session_transport_dict['connection_tableid'] = \
                                                     int(m.groupdict()['val'])
                 continue
 
             # Maximum output segment queue size: 50
-            m = p34.match(line)
+            m = p.p34.match(line)
             if m:
                 session_transport_dict['maximum_output_segment_queue_size'] = \
                                                     int(m.groupdict()['size'])
                 continue
 
             # Enqueued packets for retransmit: 0, input: 0  mis-ordered: 0 (0 bytes)
-            m = p35.match(line)
+            m = p.p35.match(line)
             if m:
                 group = m.groupdict()
                 enq_dict = session_transport_dict.setdefault('enqueued_packets', {})
@@ -3652,7 +3662,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Event Timers (current time is 0x530449):
-            m = p36.match(line)
+            m = p.p36.match(line)
             if m:
                 af_dict['current_time'] = m.groupdict()['time']
                 event_timers_dict = nbr_dict.setdefault('bgp_event_timer', {})
@@ -3672,7 +3682,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
             # DeadWait            0          0             0x0
             # Linger              0          0             0x0
             # ProcessQ            0          0             0x0
-            m = p37.match(line)
+            m = p.p37.match(line)
             if m:
                 group = m.groupdict()
                 item = group['item'].lower()
@@ -3682,7 +3692,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # iss:   55023811  snduna:   55027115  sndnxt:   55027115
-            m = p38.match(line)
+            m = p.p38.match(line)
             if m:
                 group = m.groupdict()
                 session_transport_dict['iss'] = int(group['iss'])
@@ -3691,7 +3701,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # irs:  109992783  rcvnxt:  109995158
-            m = p39.match(line)
+            m = p.p39.match(line)
             if m:
                 group = m.groupdict()
                 session_transport_dict['irs'] = int(group['irs'])
@@ -3699,7 +3709,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # sndwnd:  16616  scale:      0  maxrcvwnd:  16384
-            m = p40.match(line)
+            m = p.p40.match(line)
             if m:
                 group = m.groupdict()
                 session_transport_dict['sndwnd'] = int(group['sndwnd'])
@@ -3708,7 +3718,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # rcvwnd:  16327  scale:      0  delrcvwnd:     57
-            m = p41.match(line)
+            m = p.p41.match(line)
             if m:
                 group = m.groupdict()
                 session_transport_dict['rcvwnd'] = int(group['rcvwnd'])
@@ -3717,7 +3727,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # SRTT: 1000 ms, RTTO: 1003 ms, RTV: 3 ms, KRTT: 0 ms
-            m = p42.match(line)
+            m = p.p42.match(line)
             if m:
                 group = m.groupdict()
                 session_transport_dict['srtt'] = int(group['srtt'])
@@ -3727,7 +3737,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # minRTT: 4 ms, maxRTT: 1000 ms, ACK hold: 200 ms
-            m = p43.match(line)
+            m = p.p43.match(line)
             if m:
                 group = m.groupdict()
                 session_transport_dict['min_rtt'] = int(group['min_rtt'])
@@ -3736,7 +3746,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # uptime: 4236258 ms, Sent idletime: 4349 ms, Receive idletime: 4549 ms
-            m = p44.match(line)
+            m = p.p44.match(line)
             if m:
                 group = m.groupdict()
                 session_transport_dict['uptime'] = int(group['uptime'])
@@ -3745,26 +3755,26 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Status Flags: active open
-            m = p45.match(line)
+            m = p.p45.match(line)
             if m:
                 session_transport_dict['status_flags'] = m.groupdict()['flags']
                 continue
 
             # Option Flags: nagle, path mtu capable
-            m = p46.match(line)
+            m = p.p46.match(line)
             if m:
                 session_transport_dict['option_flags'] = m.groupdict()['flags']
                 continue
 
             # IP Precedence value : 6
-            m = p47.match(line)
+            m = p.p47.match(line)
             if m:
                 session_transport_dict['ip_precedence_value'] = \
                                                     int(m.groupdict()['value'])
                 continue
 
             # Datagrams (max data segment is 536 bytes):
-            m = p48.match(line)
+            m = p.p48.match(line)
             if m:
                 session_transport_dict['transport']['mss'] = \
                                                     int(m.groupdict()['bytes'])
@@ -3772,7 +3782,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Rcvd: 164 (out of order: 0), with data: 80, total data bytes: 2374
-            m = p49.match(line)
+            m = p.p49.match(line)
             if m:
                 group = m.groupdict()
                 datagram_rcv_dict = datagram_dict.\
@@ -3785,7 +3795,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
 
             # Sent: 166 (retransmit: 0, fastretransmit: 0, partialack: 0, Second Congestion: 0),
             #       with data: 87, total data bytes: 3303
-            m = p50.match(line)
+            m = p.p50.match(line)
             if m:
                 group = m.groupdict()
                 datagram_sent_dict = datagram_dict.\
@@ -3800,7 +3810,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Packets received in fast path: 0, fast processed: 0, slow path: 0
-            m = p51.match(line)
+            m = p.p51.match(line)
             if m:
                 group = m.groupdict()
                 session_transport_dict['packet_fast_path'] = int(group['rcv'])
@@ -3810,7 +3820,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # fast lock acquisition failures: 0, slow path: 0
-            m = p52.match(line)
+            m = p.p52.match(line)
             if m:
                 group = m.groupdict()
                 session_transport_dict['fast_lock_acquisition_failures'] = \
@@ -3819,7 +3829,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # TCP Semaphore      0x1286E7EC  FREE
-            m = p53.match(line)
+            m = p.p53.match(line)
             if m:
                 group = m.groupdict()
                 session_transport_dict['tcp_semaphore'] = group['semaphore']
@@ -3828,7 +3838,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
 
             # Session: 192.168.197.254
             # BGP table version 9431, neighbor version 9431/0
-            m = p54.match(line)
+            m = p.p54.match(line)
             if m:
                 group = m.groupdict()
                 af_dict['bgp_table_version'] = int(group['bgp_table_version'])
@@ -3836,13 +3846,13 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Output queue size : 0
-            m = p55.match(line)
+            m = p.p55.match(line)
             if m:
                 af_dict['output_queue_size'] = int(m.groupdict()['size'])
                 continue
 
             # Index 38, Advertise bit 1
-            m = p56.match(line)
+            m = p.p56.match(line)
             if m:
                 group = m.groupdict()
                 af_dict['index'] = int(group['index'])
@@ -3850,37 +3860,37 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Route-Reflector Client
-            m = p57.match(line)
+            m = p.p57.match(line)
             if m:
                 af_dict['route_reflector_client'] = True
                 continue
 
             # 38 update-group member
-            m = p58.match(line)
+            m = p.p58.match(line)
             if m:
                 af_dict['update_group_member'] = int(m.groupdict()['num'])
                 continue
 
             # Community attribute sent to this neighbor
-            m = p59.match(line)
+            m = p.p59.match(line)
             if m:
                 af_dict['community_attribute_sent'] = True
                 continue
 
             # Extended-community attribute sent to this neighbor
-            m = p60.match(line)
+            m = p.p60.match(line)
             if m:
                 af_dict['extended_community_attribute_sent'] = True
                 continue
 
             # Suppress LDP signaling protocol
-            m = p61.match(line)
+            m = p.p61.match(line)
             if m:
                 af_dict['suppress_ldp_signaling'] = True
                 continue
 
             # Slow-peer detection is disabled
-            m = p62.match(line)
+            m = p.p62.match(line)
             if m:
                 if m.groupdict()['state'] == 'disabled':
                     af_dict['slow_peer_detection'] = False
@@ -3889,7 +3899,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Slow-peer split-update-group dynamic is disabled
-            m = p63.match(line)
+            m = p.p63.match(line)
             if m:
                 if m.groupdict()['state'] == 'disabled':
                     af_dict['slow_peer_split_update_group_dynamic'] = False
@@ -3898,7 +3908,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Number of NLRIs in the update sent: max 199, min 0
-            m = p64.match(line)
+            m = p.p64.match(line)
             if m:
                 group = m.groupdict()
                 af_dict['max_nlri'] = int(group['max'])
@@ -3906,26 +3916,26 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Last detected as dynamic slow peer: never
-            m = p65.match(line)
+            m = p.p65.match(line)
             if m:
                 af_dict['last_detected_dynamic_slow_peer'] = m.groupdict()['val']
                 continue
 
             # Dynamic slow peer recovered: never
-            m = p66.match(line)
+            m = p.p66.match(line)
             if m:
                 af_dict['dynamic_slow_peer_recovered'] = m.groupdict()['val']
                 continue
 
             # Refresh Epoch: 3
-            m = p67.match(line)
+            m = p.p67.match(line)
             if m:
                 af_dict['refresh_epoch'] = int(m.groupdict()['num'])
                 continue
 
             # Last Sent Refresh Start-of-rib: 02:41:38
             # Last Received Refresh Start-of-rib: 02:01:36
-            m = p68.match(line)
+            m = p.p68.match(line)
             if m:
                 if 'Sent' in line:
                     af_dict['last_sent_refresh_start_of_rib'] = \
@@ -3937,7 +3947,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
 
             # Last Sent Refresh End-of-rib: 02:41:38
             # Last Received Refresh End-of-rib: 02:01:32
-            m = p69.match(line)
+            m = p.p69.match(line)
             if m:
                 if 'Sent' in line:
                     af_dict['last_sent_refresh_end_of_rib'] = \
@@ -3949,7 +3959,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
 
             # Refresh-Out took 0 seconds
             # Refresh-In took 4 seconds
-            m = p70.match(line)
+            m = p.p70.match(line)
             if m:
                 if m.groupdict()['type'] == 'Out':
                     af_dict['refresh_out'] = int(m.groupdict()['val'])
@@ -3958,7 +3968,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # SSO is disabled
-            m = p71.match(line)
+            m = p.p71.match(line)
             if m:
                 if m.groupdict()['state'] == 'disabled':
                     session_transport_dict['sso'] = False
@@ -3967,7 +3977,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # No active TCP connection
-            m = p72.match(line)
+            m = p.p72.match(line)
             if m:
                 session_transport_dict['tcp_connection'] = False
                 continue
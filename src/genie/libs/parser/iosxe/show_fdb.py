@@ -20,6 +20,7 @@ from genie.metaparser.util.schemaengine import Schema, \
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.columnar import ColumnarParser
 
 
 class ShowMacAddressTableSchema(MetaParser):
@@ -54,13 +55,19 @@ class ShowMacAddressTableSchema(MetaParser):
         Optional('total_mac_addresses'): int,
     }
 
-class ShowMacAddressTable(ShowMacAddressTableSchema):
+class ShowMacAddressTable(ColumnarParser, ShowMacAddressTableSchema):
     """Parser for show mac address-table"""
 
     cli_command = ['show mac address-table',
                    'show mac address-table vlan {vlan}']
 
-    def cli(self, vlan='', output=None):
+    columnar_tables = {
+        'mac_addresses': ('mac_table', 'vlans', '{vlan_key}', 'mac_addresses',
+                          '{mac_address}', 'interfaces', '{interface}')}
+    columnar_key_fields = ('mac_address', 'interface')
+    columnar_cli = True
+
+    def cli(self, vlan='', output=None, columnar=False):
         if output is None:
             # get output from device
             if vlan:
@@ -74,6 +81,31 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
         ret_dict = mac_dict = {}
         entry_type = entry = learn = age = ''
 
+        if columnar:
+            # a row per interface of a mac, and one without interface for
+            # its drop entry, a mac on several lines updates its rows as it
+            # updates its dict
+            columns = {name: [] for name in (
+                'vlan_key', 'vlan', 'mac_address', 'interface', 'entry_type',
+                'entry', 'learn', 'age', 'protocols', 'drop.drop',
+                'drop.entry_type')}
+            mac = None
+
+            def add_row(intf, entry_type, entry=None, learn=None, age=None,
+                        protocols=None, drop=False):
+                columns['vlan_key'].append(str(vlan) if mac else None)
+                columns['vlan'].append(vlan if mac else None)
+                columns['mac_address'].append(mac)
+                columns['interface'].append(intf)
+                columns['entry_type'].append(None if drop else entry_type)
+                columns['entry'].append(entry)
+                columns['learn'].append(learn)
+                columns['age'].append(age)
+                columns['protocols'].append(protocols)
+                columns['drop.drop'].append(True if drop else None)
+                columns['drop.entry_type'].append(
+                    entry_type if drop else None)
+
         # Total Mac Addresses for this criterion: 93
         p1 = re.compile(r'^Total +Mac +Addresses +for +this +criterion: +(?P<val>\d+)$')
 
@@ -120,6 +152,17 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
                 vlan = int(group['vlan']) if re.search('\d+', group['vlan']) \
                                           else group['vlan'].lower()
                 intfs = group['intfs'].strip()
+                if columnar:
+                    if 'drop' in intfs.lower():
+                        add_row(None, group['entry_type'].lower(), drop=True)
+                        continue
+                    for intf in intfs.replace(' ',',').split(','):
+                        entry_type = group['entry_type'].lower()
+                        if group['entry']:
+                            entry = group['entry'].strip()
+                        add_row(Common.convert_intf_name(intf), entry_type,
+                                entry if group['entry'] else None)
+                    continue
                 vlan_dict = ret_dict.setdefault('mac_table', {}) \
                 .setdefault('vlans', {}).setdefault(str(vlan), {})
                 vlan_dict['vlan'] = vlan
@@ -151,6 +194,14 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
             if m:
                 group = m.groupdict()
                 intfs = group['intfs'].strip()
+                if columnar:
+                    if 'drop' in intfs.lower():
+                        add_row(None, entry_type, drop=True)
+                        continue
+                    for intf in intfs.split(','):
+                        add_row(Common.convert_intf_name(intf), entry_type,
+                                entry or None, learn or None, age or None)
+                    continue
 
                 if 'drop' in intfs.lower():
                     drop_dict = mac_dict.setdefault('drop', {})
@@ -183,6 +234,24 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
                 vlan = int(group['vlan']) if re.search('\d+', group['vlan']) \
                                           else group['vlan'].lower()
                 intfs = group['intfs'].strip()
+                if columnar:
+                    if 'drop' in intfs.lower():
+                        add_row(None, group['entry_type'].lower(), drop=True)
+                        continue
+                    for intf in intfs.split(','):
+                        entry_type = group['entry_type'].lower()
+                        if group['entry']:
+                            entry = group['entry'].strip()
+                        if group['learn']:
+                            learn = group['learn']
+                        if group['age']:
+                            age = int(group['age']) \
+                                if group['age'].isdigit() else None
+                        add_row(Common.convert_intf_name(intf), entry_type,
+                                entry if group['entry'] else None,
+                                learn if group['learn'] else None,
+                                age if group['age'] else None)
+                    continue
                 vlan_dict = ret_dict.setdefault('mac_table', {}) \
                 .setdefault('vlans', {}).setdefault(str(vlan), {})
                 vlan_dict['vlan'] = vlan
@@ -225,6 +294,18 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
                 vlan = int(group['vlan']) if re.search('\d+', group['vlan']) \
                                           else group['vlan'].lower()
                 intfs = group['intfs'].strip()
+                if columnar:
+                    if 'drop' in intfs.lower():
+                        add_row(None, group['entry_type'].lower(), drop=True)
+                        continue
+                    for intf in intfs.replace(' ',',').split(','):
+                        entry_type = group['entry_type'].lower()
+                        if group['entry']:
+                            entry = group['entry'].strip()
+                        add_row(Common.convert_intf_name(intf), entry_type,
+                                entry if group['entry'] else None,
+                                protocols=group['protocols'].split(','))
+                    continue
                 vlan_dict = ret_dict.setdefault('mac_table', {}) \
                 .setdefault('vlans', {}).setdefault(str(vlan), {})
                 vlan_dict['vlan'] = vlan
@@ -253,6 +334,15 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
                         intf_dict.update({'protocols': group['protocols'].split(',')})
                 continue
 
+        if columnar:
+            columnar_dict = self.columnar_result()
+            columnar_dict.extra = ret_dict
+            columnar_dict['mac_addresses'].extend(columns, levels={
+                'vlan': 1, 'drop.drop': 2, 'drop.entry_type': 2,
+                'entry_type': 3, 'entry': 3, 'learn': 3, 'age': 3,
+                'protocols': 3})
+            return columnar_dict
+
         return ret_dict
 
 
@@ -20,7 +20,6 @@ import logging
 import pprint
 import re
 import unittest
-from genie import parsergen
 from collections import defaultdict
 
 from pyats.log.utils import banner
@@ -47,6 +46,9 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Use
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.patterns import Patterns
+from genie.libs.parser.utils.parallel import parse_blocks, merge_results
+from genie.libs.parser.utils.tabular import Tabular
 
 logger = logging.getLogger(__name__)
 
@@ -209,63 +211,54 @@ class ShowInterfaces(ShowInterfacesSchema):
         'reliability']
 
 
-    def cli(self,interface="",output=None):
-        if output is None:
-            if interface:
-                cmd = self.cli_command[1].format(interface=interface)
-            else:
-                cmd = self.cli_command[0]
-            out = self.device.execute(cmd)
-        else:
-            out = output
-
-        # GigabitEthernet1 is up, line protocol is up 
+    patterns = Patterns(
+        # GigabitEthernet1 is up, line protocol is up
         # Port-channel12 is up, line protocol is up (connected)
         # Vlan1 is administratively down, line protocol is down , Autostate Enabled
         # Dialer1 is up (spoofing), line protocol is up (spoofing)
-        p1 = re.compile(r'^(?P<interface>[\w\/\.\-]+) +is +(?P<enabled>[\w\s]+)(?: '
-                        r'+\S+)?, +line +protocol +is +(?P<line_protocol>\w+)(?: '
-                        r'*\((?P<attribute>\S+)\)|( +\, +Autostate +(?P<autostate>\S+)))?.*$')
-        p1_1 =  re.compile(r'^(?P<interface>[\w\/\.\-]+) +is'
-                           r' +(?P<enabled>[\w\s]+),'
-                           r' +line +protocol +is +(?P<line_protocol>\w+)'
-                           r'( *, *(?P<attribute>[\w\s]+))?$')
+        p1=r'^(?P<interface>[\w\/\.\-]+) +is +(?P<enabled>[\w\s]+)(?: '
+           r'+\S+)?, +line +protocol +is +(?P<line_protocol>\w+)(?: '
+           r'*\((?P<attribute>\S+)\)|( +\, +Autostate +(?P<autostate>\S+)))?.*$',
+        p1_1=r'^(?P<interface>[\w\/\.\-]+) +is'
+             r' +(?P<enabled>[\w\s]+),'
+             r' +line +protocol +is +(?P<line_protocol>\w+)'
+             r'( *, *(?P<attribute>[\w\s]+))?$',
 
         # Hardware is Gigabit Ethernet, address is 0057.d2ff.428c (bia 0057.d2ff.428c)
         # Hardware is Loopback
-        p2 = re.compile(r'^Hardware +is +(?P<type>[a-zA-Z0-9\-\/\s\+]+)'
-                        r'(, *address +is +(?P<mac_address>[a-z0-9\.]+)'
-                        r' *\(bia *(?P<phys_address>[a-z0-9\.]+)\))?$')
+        p2=r'^Hardware +is +(?P<type>[a-zA-Z0-9\-\/\s\+]+)'
+           r'(, *address +is +(?P<mac_address>[a-z0-9\.]+)'
+           r' *\(bia *(?P<phys_address>[a-z0-9\.]+)\))?$',
 
-        # Hardware is LTE Adv CAT6 - Multimode LTE/DC-HSPA+/HSPA+/HSPA/UMTS/EDGE/GPRS 
-        p2_2 = re.compile(r'Hardware +is +(?P<type>[a-zA-Z0-9\-\/\+ ]+)'
-                          r'(?P<mac_address>.*)(?P<phys_address>.*)')
+        # Hardware is LTE Adv CAT6 - Multimode LTE/DC-HSPA+/HSPA+/HSPA/UMTS/EDGE/GPRS
+        p2_2=r'Hardware +is +(?P<type>[a-zA-Z0-9\-\/\+ ]+)'
+             r'(?P<mac_address>.*)(?P<phys_address>.*)',
 
         # Description: desc
         # Description: Pim Register Tunnel (Encap) for RP 10.186.1.1
-        p3 = re.compile(r'^Description: *(?P<description>.*)$')
+        p3=r'^Description: *(?P<description>.*)$',
 
         # Secondary address 10.2.2.2/24
-        p4 = re.compile(r'^Secondary +Address +is +(?P<ipv4>(?P<ip>[0-9\.]+)'
-                        r'\/(?P<prefix_length>[0-9]+))$')
+        p4=r'^Secondary +Address +is +(?P<ipv4>(?P<ip>[0-9\.]+)'
+           r'\/(?P<prefix_length>[0-9]+))$',
 
         # Internet address is 10.4.4.4/24
-        p5 = re.compile(r'^Internet +[A|a]ddress +is +(?P<ipv4>(?P<ip>[0-9\.x]+)'
-                        r'\/(?P<prefix_length>[0-9]+))$')
+        p5=r'^Internet +[A|a]ddress +is +(?P<ipv4>(?P<ip>[0-9\.x]+)'
+           r'\/(?P<prefix_length>[0-9]+))$',
 
         # MTU 1500 bytes, BW 768 Kbit/sec, DLY 3330 usec,
-        # MTU 1500 bytes, BW 10000 Kbit, DLY 1000 usec, 
+        # MTU 1500 bytes, BW 10000 Kbit, DLY 1000 usec,
         # MTU 1600 bytes, sub MTU 1600, BW 3584 Kbit/sec, DLY 410 usec,
-        # MTU 1500 bytes, BW 5200 Kbit/sec, RxBW 25000 Kbit/sec, DLY 100 usec, 
-        p6 = re.compile(r'^MTU +(?P<mtu>\d+) +bytes(, +sub +MTU +'
-                        r'(?P<sub_mtu>\d+))?, +BW +(?P<bandwidth>[0-9]+) +Kbit(\/sec)?'
-                        r'(, +RxBW +[0-9]+ +Kbit(\/sec)?)?, +'
-                        r'DLY +(?P<delay>[0-9]+) +usec,$')
+        # MTU 1500 bytes, BW 5200 Kbit/sec, RxBW 25000 Kbit/sec, DLY 100 usec,
+        p6=r'^MTU +(?P<mtu>\d+) +bytes(, +sub +MTU +'
+           r'(?P<sub_mtu>\d+))?, +BW +(?P<bandwidth>[0-9]+) +Kbit(\/sec)?'
+           r'(, +RxBW +[0-9]+ +Kbit(\/sec)?)?, +'
+           r'DLY +(?P<delay>[0-9]+) +usec,$',
 
         # reliability 255/255, txload 1/255, rxload 1/255
-        p7 = re.compile(r'^reliability +(?P<reliability>[\d\/]+),'
-                        r' +txload +(?P<txload>[\d\/]+), +rxload'
-                        r' +(?P<rxload>[\d\/]+)$')
+        p7=r'^reliability +(?P<reliability>[\d\/]+),'
+           r' +txload +(?P<txload>[\d\/]+), +rxload'
+           r' +(?P<rxload>[\d\/]+)$',
 
         # Encapsulation LOOPBACK, loopback not set
         # Encapsulation 802.1Q Virtual LAN, Vlan ID 20, medium is p2p
@@ -274,13 +267,12 @@ class ShowInterfaces(ShowInterfacesSchema):
         # Encapsulation 802.1Q Virtual LAN, Vlan ID  1., loopback not set
         # Encapsulation 802.1Q Virtual LAN, Vlan ID  105.
         # Encapsulation(s): AAL5
-        p8 = re.compile(r'^Encapsulation(\(s\):)? +(?P<encapsulation>[\w\s\.]+)'
-                r'(, +(?P<rest>.*))?$')
-            
-        # Keepalive set (10 sec)
-        p10 = re.compile(r'^Keepalive +set +\((?P<keepalive>[0-9]+)'
-                        r' +sec\)$')
+        p8=r'^Encapsulation(\(s\):)? +(?P<encapsulation>[\w\s\.]+)'
+           r'(, +(?P<rest>.*))?$',
 
+        # Keepalive set (10 sec)
+        p10=r'^Keepalive +set +\((?P<keepalive>[0-9]+)'
+            r' +sec\)$',
 
         # Auto-duplex, 1000Mb/s, media type is 10/100/1000BaseTX
         # Full-duplex, 1000Mb/s, link type is auto, media type is
@@ -292,194 +284,258 @@ class ShowInterfaces(ShowInterfacesSchema):
         # auto-duplex, 10 Gb/s, media type is 10G
         # Full Duplex, 10000Mbps, link type is force-up, media type is SFP-LR
         # Full-duplex, 100Gb/s, link type is force-up, media type is QSFP 100G SR4
-        p11 = re.compile(r'^(?P<duplex_mode>\w+)[\-\s]+[d|D]uplex\, '
-                         r'+(?P<port_speed>[\w\s\/]+|[a|A]uto-[S|s]peed|Auto '
-                         r'(S|s)peed)(?:(?:\, +link +type +is '
-                         r'+(?P<link_type>\S+))?(?:\, *(media +type +is| )'
-                         r'*(?P<media_type>[\w\/\- ]+)?)(?: +media +type)?)?$')
+        p11=r'^(?P<duplex_mode>\w+)[\-\s]+[d|D]uplex\, '
+            r'+(?P<port_speed>[\w\s\/]+|[a|A]uto-[S|s]peed|Auto '
+            r'(S|s)peed)(?:(?:\, +link +type +is '
+            r'+(?P<link_type>\S+))?(?:\, *(media +type +is| )'
+            r'*(?P<media_type>[\w\/\- ]+)?)(?: +media +type)?)?$',
 
         # input flow-control is off, output flow-control is unsupported
-        p12 = re.compile(r'^(input|output) +flow-control +is +(?P<receive>\w+), +'
-                          '(output|input) +flow-control +is +(?P<send>\w+)$')
+        p12=r'^(input|output) +flow-control +is +(?P<receive>\w+), +'
+            '(output|input) +flow-control +is +(?P<send>\w+)$',
 
         # ARP type: ARPA, ARP Timeout 04:00:00
-        p13 = re.compile(r'^ARP +type: +(?P<arp_type>\w+), +'
-                          'ARP +Timeout +(?P<arp_timeout>[\w\:\.]+)$')
+        p13=r'^ARP +type: +(?P<arp_type>\w+), +'
+            'ARP +Timeout +(?P<arp_timeout>[\w\:\.]+)$',
 
         # Last input never, output 00:01:05, output hang never
-        p14 = re.compile(r'^Last +input +(?P<last_input>[\w\.\:]+), +'
-                          'output +(?P<last_output>[\w\.\:]+), '
-                          'output +hang +(?P<output_hang>[\w\.\:]+)$')
+        p14=r'^Last +input +(?P<last_input>[\w\.\:]+), +'
+            'output +(?P<last_output>[\w\.\:]+), '
+            'output +hang +(?P<output_hang>[\w\.\:]+)$',
 
         # Members in this channel: Gi1/0/2
         # Members in this channel: Fo1/0/2 Fo1/0/4
-        p15 = re.compile(r'^Members +in +this +channel: +'
-                          '(?P<port_channel_member_intfs>[\w\/\.\s\,]+)$')   
+        p15=r'^Members +in +this +channel: +'
+            '(?P<port_channel_member_intfs>[\w\/\.\s\,]+)$',
 
-        # No. of active members in this channel: 12 
-        p15_1 = re.compile(r'^No\. +of +active +members +in +this +'
-                            'channel: +(?P<active_members>\d+)$')
+        # No. of active members in this channel: 12
+        p15_1=r'^No\. +of +active +members +in +this +'
+              'channel: +(?P<active_members>\d+)$',
 
         # Member 2 : GigabitEthernet0/0/10 , Full-duplex, 900Mb/s
-        p15_2 = re.compile(r'^Member +\d+ +: +(?P<interface>\S+) +,'
-                            ' +\S+, +\S+$')
+        p15_2=r'^Member +\d+ +: +(?P<interface>\S+) +,'
+              ' +\S+, +\S+$',
 
         # No. of PF_JUMBO supported members in this channel : 0
-        p15_3 = re.compile(r'^No\. +of +PF_JUMBO +supported +members +'
-                            'in +this +channel +: +(?P<number>\d+)$')
+        p15_3=r'^No\. +of +PF_JUMBO +supported +members +'
+              'in +this +channel +: +(?P<number>\d+)$',
 
         # Last clearing of "show interface" counters 1d02h
-        p16 = re.compile(r'^Last +clearing +of +\"show +interface\" +counters +'
-                          '(?P<last_clear>[\w\:\.]+)$')
+        p16=r'^Last +clearing +of +\"show +interface\" +counters +'
+            '(?P<last_clear>[\w\:\.]+)$',
 
         # Input queue: 0/375/0/0 (size/max/drops/flushes); Total output drops: 0
-        p17 = re.compile(r'^Input +queue: +(?P<size>\d+)\/(?P<max>\d+)\/'
-                          '(?P<drops>\d+)\/(?P<flushes>\d+) +'
-                          '\(size\/max\/drops\/flushes\); +'
-                          'Total +output +drops: +(?P<output_drop>\d+)$')
+        p17=r'^Input +queue: +(?P<size>\d+)\/(?P<max>\d+)\/'
+            '(?P<drops>\d+)\/(?P<flushes>\d+) +'
+            '\(size\/max\/drops\/flushes\); +'
+            'Total +output +drops: +(?P<output_drop>\d+)$',
 
         # Queueing strategy: fifo
         # Queueing strategy: Class-based queueing
-        p18 = re.compile(r'^Queueing +strategy: +(?P<queue_strategy>\S+).*$')
+        p18=r'^Queueing +strategy: +(?P<queue_strategy>\S+).*$',
 
         # Output queue: 0/0 (size/max)
         # Output queue: 0/1000/64/0 (size/max total/threshold/drops)
-        p19 = re.compile(r'^Output +queue: +(?P<size>\d+)\/(?P<max>\d+)'
-                          '(?:\/(?P<threshold>\d+)\/(?P<drops>\d+))? '
-                          '+\(size\/max(?: +total\/threshold\/drops\))?.*$')
+        p19=r'^Output +queue: +(?P<size>\d+)\/(?P<max>\d+)'
+            '(?:\/(?P<threshold>\d+)\/(?P<drops>\d+))? '
+            '+\(size\/max(?: +total\/threshold\/drops\))?.*$',
 
         # 5 minute input rate 0 bits/sec, 0 packets/sec
-        p20 = re.compile(r'^(?P<load_interval>[0-9\#]+)'
-                          ' *(?P<unit>(minute|second|minutes|seconds)) *input *rate'
-                          ' *(?P<in_rate>[0-9]+) *bits/sec,'
-                          ' *(?P<in_rate_pkts>[0-9]+) *packets/sec$')
+        p20=r'^(?P<load_interval>[0-9\#]+)'
+            ' *(?P<unit>(minute|second|minutes|seconds)) *input *rate'
+            ' *(?P<in_rate>[0-9]+) *bits/sec,'
+            ' *(?P<in_rate_pkts>[0-9]+) *packets/sec$',
 
         # 5 minute output rate 0 bits/sec, 0 packets/sec
-        p21 = re.compile(r'^(?P<load_interval>[0-9\#]+)'
-                          ' *(minute|second|minutes|seconds) *output *rate'
-                          ' *(?P<out_rate>[0-9]+) *bits/sec,'
-                          ' *(?P<out_rate_pkts>[0-9]+) *packets/sec$')
+        p21=r'^(?P<load_interval>[0-9\#]+)'
+            ' *(minute|second|minutes|seconds) *output *rate'
+            ' *(?P<out_rate>[0-9]+) *bits/sec,'
+            ' *(?P<out_rate_pkts>[0-9]+) *packets/sec$',
 
         # 0 packets input, 0 bytes, 0 no buffer
         # 13350 packets input, 2513375 bytes
-        p22 = re.compile(r'^(?P<in_pkts>[0-9]+) +packets +input, +(?P<in_octets>[0-9]+) '
-                          '+bytes(?:, +(?P<in_no_buffer>[0-9]+) +no +buffer)?$')
+        p22=r'^(?P<in_pkts>[0-9]+) +packets +input, +(?P<in_octets>[0-9]+) '
+            '+bytes(?:, +(?P<in_no_buffer>[0-9]+) +no +buffer)?$',
 
         # Received 4173 broadcasts (0 IP multicasts)
         # Received 535996 broadcasts (535961 multicasts)
-        p23 = re.compile(r'^Received +(?P<in_broadcast_pkts>\d+) +broadcasts +'
-                          '\((?P<in_multicast_pkts>\d+) *(IP)? *multicasts\)$')
+        p23=r'^Received +(?P<in_broadcast_pkts>\d+) +broadcasts +'
+            '\((?P<in_multicast_pkts>\d+) *(IP)? *multicasts\)$',
 
         # 0 runts, 0 giants, 0 throttles
-        p24 = re.compile(r'^(?P<in_runts>[0-9]+) *runts,'
-                          ' *(?P<in_giants>[0-9]+) *giants,'
-                          ' *(?P<in_throttles>[0-9]+) *throttles$')
+        p24=r'^(?P<in_runts>[0-9]+) *runts,'
+            ' *(?P<in_giants>[0-9]+) *giants,'
+            ' *(?P<in_throttles>[0-9]+) *throttles$',
 
         # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored
         # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
-        p25 = re.compile(r'^(?P<in_errors>[0-9]+) +input +errors, +'
-                          '(?P<in_crc_errors>[0-9]+) +CRC, +'
-                          '(?P<in_frame>[0-9]+) +frame, +'
-                          '(?P<in_overrun>[0-9]+) +overrun, +'
-                          '(?P<in_ignored>[0-9]+) +ignored'
-                          '(, *(?P<in_abort>[0-9]+) +abort)?$')
+        p25=r'^(?P<in_errors>[0-9]+) +input +errors, +'
+            '(?P<in_crc_errors>[0-9]+) +CRC, +'
+            '(?P<in_frame>[0-9]+) +frame, +'
+            '(?P<in_overrun>[0-9]+) +overrun, +'
+            '(?P<in_ignored>[0-9]+) +ignored'
+            '(, *(?P<in_abort>[0-9]+) +abort)?$',
 
         # 0 watchdog, 535961 multicast, 0 pause input
-        p26 = re.compile(r'^(?P<in_watchdog>[0-9]+) +watchdog, +'
-                          '(?P<in_multicast_pkts>[0-9]+) +multicast, +'
-                          '(?P<in_pause_input>[0-9]+) +pause +input$')
+        p26=r'^(?P<in_watchdog>[0-9]+) +watchdog, +'
+            '(?P<in_multicast_pkts>[0-9]+) +multicast, +'
+            '(?P<in_pause_input>[0-9]+) +pause +input$',
 
         # 0 input packets with dribble condition detected
-        p27 = re.compile(r'^(?P<in_with_dribble>[0-9]+) +input +packets +with +'
-                          'dribble +condition +detected$')
+        p27=r'^(?P<in_with_dribble>[0-9]+) +input +packets +with +'
+            'dribble +condition +detected$',
 
         # 23376 packets output, 3642296 bytes, 0 underruns
         # 13781 packets output, 2169851 bytes
-        p28 = re.compile(r'^(?P<out_pkts>[0-9]+) +packets +output, +(?P<out_octets>[0-9]+) '
-                          '+bytes(?:\, +(?P<out_underruns>[0-9]+) +underruns)?$')
+        p28=r'^(?P<out_pkts>[0-9]+) +packets +output, +(?P<out_octets>[0-9]+) '
+            '+bytes(?:\, +(?P<out_underruns>[0-9]+) +underruns)?$',
 
         # Received 4173 broadcasts (0 IP multicasts)
         # Received 535996 broadcasts (535961 multicasts)
-        p29 = re.compile(r'^Received +(?P<out_broadcast_pkts>\d+) +broadcasts +'
-                          '\((?P<out_multicast_pkts>\d+) *(IP)? *multicasts\)$')
+        p29=r'^Received +(?P<out_broadcast_pkts>\d+) +broadcasts +'
+            '\((?P<out_multicast_pkts>\d+) *(IP)? *multicasts\)$',
 
         # 0 output errors, 0 collisions, 2 interface resets
         # 0 output errors, 0 interface resets
-        p30 = re.compile(r'^(?P<out_errors>[0-9]+) +output +errors,'
-                          '( *(?P<out_collision>[0-9]+) +collisions,)? +'
-                          '(?P<out_interface_resets>[0-9]+) +interface +resets$')
+        p30=r'^(?P<out_errors>[0-9]+) +output +errors,'
+            '( *(?P<out_collision>[0-9]+) +collisions,)? +'
+            '(?P<out_interface_resets>[0-9]+) +interface +resets$',
 
         # 0 unknown protocol drops
-        p31 = re.compile(r'^(?P<out_unknown_protocl_drops>[0-9]+) +'
-                          'unknown +protocol +drops$')
+        p31=r'^(?P<out_unknown_protocl_drops>[0-9]+) +'
+            'unknown +protocol +drops$',
 
         # 0 babbles, 0 late collision, 0 deferred
-        p32 = re.compile(r'^(?P<out_babble>[0-9]+) +babbles, +'
-                          '(?P<out_late_collision>[0-9]+) +late +collision, +'
-                          '(?P<out_deferred>[0-9]+) +deferred$')
+        p32=r'^(?P<out_babble>[0-9]+) +babbles, +'
+            '(?P<out_late_collision>[0-9]+) +late +collision, +'
+            '(?P<out_deferred>[0-9]+) +deferred$',
 
         # 0 lost carrier, 0 no carrier, 0 pause output
         # 0 lost carrier, 0 no carrier
-        p33 = re.compile(r'^(?P<out_lost_carrier>\d+) +lost +carrier, +'
-                r'(?P<out_no_carrier>\d+) +no +carrier(, +(?P<out_pause_output>\d+) +'
-                r'pause +output)?$')
+        p33=r'^(?P<out_lost_carrier>\d+) +lost +carrier, +'
+            r'(?P<out_no_carrier>\d+) +no +carrier(, +(?P<out_pause_output>\d+) +'
+            r'pause +output)?$',
 
         # 0 output buffer failures, 0 output buffers swapped out
-        p34 = re.compile(r'^(?P<out_buffer_failure>[0-9]+) +output +buffer +failures, +'
-                          '(?P<out_buffers_swapped>[0-9]+) +output +buffers +swapped +out$')
+        p34=r'^(?P<out_buffer_failure>[0-9]+) +output +buffer +failures, +'
+            '(?P<out_buffers_swapped>[0-9]+) +output +buffers +swapped +out$',
 
         # Interface is unnumbered. Using address of Loopback0 (10.4.1.1)
         # Interface is unnumbered. Using address of GigabitEthernet0/2.1 (192.168.154.1)
-        p35 = re.compile(r'^Interface +is +unnumbered. +Using +address +of +'
-                          '(?P<unnumbered_intf>[\w\/\.]+) +'
-                          '\((?P<unnumbered_ip>[\w\.\:]+)\)$')
-        
+        p35=r'^Interface +is +unnumbered. +Using +address +of +'
+            '(?P<unnumbered_intf>[\w\/\.]+) +'
+            '\((?P<unnumbered_ip>[\w\.\:]+)\)$',
+
         # 8 maximum active VCs, 1024 VCs per VP, 1 current VCCs
-        p36 = re.compile(r'^(?P<maximum_active_vcs>\d+) +maximum +active +VCs, +'
-                r'(?P<vcs_per_vp>\d+) +VCs +per +VP, +(?P<current_vccs>\d+) +current +VCCs$')
-        
+        p36=r'^(?P<maximum_active_vcs>\d+) +maximum +active +VCs, +'
+            r'(?P<vcs_per_vp>\d+) +VCs +per +VP, +(?P<current_vccs>\d+) +current +VCCs$',
+
         # VC Auto Creation Disabled.
-        p37 = re.compile(r'^VC +Auto +Creation +(?P<vc_auto_creation>\S+)\.$')
+        p37=r'^VC +Auto +Creation +(?P<vc_auto_creation>\S+)\.$',
 
         # VC idle disconnect time: 300 seconds
-        p38 = re.compile(r'^VC +idle +disconnect +time: +(?P<vc_idle_disconnect_time>\d+) +'
-                r'seconds$')
-        
+        p38=r'^VC +idle +disconnect +time: +(?P<vc_idle_disconnect_time>\d+) +'
+            r'seconds$',
+
         # AAL5 CRC errors : 0
-        p39 = re.compile(r'^(?P<key>\S+ +CRC +errors) +: +(?P<val>\d+)$')
-        
+        p39=r'^(?P<key>\S+ +CRC +errors) +: +(?P<val>\d+)$',
+
         # AAL5 SAR Timeouts : 0
-        p40 = re.compile(r'^(?P<key>\S+ +SAR +Timeouts) +: +(?P<val>\d+)$')
-        
+        p40=r'^(?P<key>\S+ +SAR +Timeouts) +: +(?P<val>\d+)$',
+
         # AAL5 Oversized SDUs : 0
-        p41 = re.compile(r'^(?P<key>\S+ +Oversized +SDUs) +: +(?P<val>\d+)$')
+        p41=r'^(?P<key>\S+ +Oversized +SDUs) +: +(?P<val>\d+)$',
 
         # LCP Closed
         # LCP Closed, loopback not set
-        p42 = re.compile(r'^LCP\s+(?P<state>\S+)(,\s+loopback\s+(?P<loopback>[\S\s]+))?$')
+        p42=r'^LCP\s+(?P<state>\S+)(,\s+loopback\s+(?P<loopback>[\S\s]+))?$',
 
         # Base PPPoATM vaccess
-        p43 = re.compile(r'^Base PPPoATM +(?P<base_pppoatm>\S+)$')
+        p43=r'^Base PPPoATM +(?P<base_pppoatm>\S+)$',
 
         # Vaccess status 0x44, loopback not set
-        p44 = re.compile(r'^Vaccess\s+status\s+(?P<status>\S+),\s+'
-                r'loopback\s+(?P<loopback>[\S\s]+)$')
+        p44=r'^Vaccess\s+status\s+(?P<status>\S+),\s+'
+            r'loopback\s+(?P<loopback>[\S\s]+)$',
 
         # DTR is pulsed for 5 seconds on reset
-        p45 = re.compile(r'^DTR +is +pulsed +for +(?P<dtr_pulsed>\d+) +'
-                r'seconds +on +reset$')
+        p45=r'^DTR +is +pulsed +for +(?P<dtr_pulsed>\d+) +'
+            r'seconds +on +reset$',
+
+        # Carrier delay is 10 sec
+        p_cd=r'^Carrier +delay +is +(?P<carrier_delay>\d+).*$',
+
+        # Asymmetric Carrier-Delay Up Timer is 2 sec
+        # Asymmetric Carrier-Delay Down Timer is 10 sec
+        p_cd_2=r'^Asymmetric +Carrier-Delay +(?P<type>Down|Up)'
+               ' +Timer +is +(?P<carrier_delay>\d+).*$',
+    )
+
+    def cli(self,interface="",output=None):
+        if output is None:
+            if interface:
+                cmd = self.cli_command[1].format(interface=interface)
+            else:
+                cmd = self.cli_command[0]
+            out = self.device.execute(cmd)
+        else:
+            out = output
+
+        results = parse_blocks(self, out, '_parse_interfaces',
+                               headers=[self.patterns.p1, self.patterns.p1_1])
+        if results is not None:
+            interface_dict = {}
+            unnumbered_dict = {}
+            members = set()
+            for interfaces, unnumbered in results:
+                # port-channel members can be in the block of another chunk
+                members.update(
+                    intf for intf, intf_dict in interfaces.items()
+                    if intf_dict.get('port_channel', {}).get(
+                        'port_channel_member'))
+                merge_results([interfaces], into=interface_dict)
+                merge_results([unnumbered], into=unnumbered_dict)
+            for intf in members:
+                interface_dict[intf]['port_channel']\
+                    ['port_channel_member'] = True
+        else:
+            interface_dict, unnumbered_dict = self._parse_interfaces(out)
+
+        # create strucutre for unnumbered interface
+        if not unnumbered_dict:
+            return(interface_dict)
+
+        for intf in unnumbered_dict:
+            unnumbered_intf = unnumbered_dict[intf]['unnumbered_intf']
+            unnumbered_ip = unnumbered_dict[intf]['unnumbered_ip']
+            if unnumbered_intf in interface_dict:
+                if 'ipv4' in interface_dict[unnumbered_intf]:
+                    for ip in interface_dict[unnumbered_intf]['ipv4']:
+                        if unnumbered_ip in ip:
+                            if 'ipv4' not in interface_dict[intf]:
+                                interface_dict[intf]['ipv4'] = {}
+                            if ip not in interface_dict[intf]['ipv4']:
+                                interface_dict[intf]['ipv4'][ip] = {}
+                            m = re.search('([\w\.\:]+)\/(\d+)', ip)
+                            interface_dict[intf]['ipv4'][ip]['ip'] = m.groups()[0]
+                            interface_dict[intf]['ipv4'][ip]['prefix_length'] = m.groups()[1]
+                            interface_dict[intf]['ipv4']['unnumbered'] = {}
+                            interface_dict[intf]['ipv4']['unnumbered']\
+                                ['interface_ref'] = unnumbered_intf
+        return(interface_dict)
 
+    def _parse_interfaces(self, out):
         interface_dict = {}
         unnumbered_dict = {}
         for line in out.splitlines():
             line = line.strip()
+            p = self.patterns.for_line(line)
             # GigabitEthernet1 is up, line protocol is up 
             # Port-channel12 is up, line protocol is up (connected)
             # Vlan1 is administratively down, line protocol is down , Autostate Enabled
             # Dialer1 is up (spoofing), line protocol is up (spoofing)
 
-            m = p1.match(line)
-            m1 = p1_1.match(line)
+            m = p.p1.match(line)
+            m1 = p.p1_1.match(line)
             m = m if m else m1
             if m:
                 interface = m.groupdict()['interface']
@@ -519,10 +575,10 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Hardware is Gigabit Ethernet, address is 0057.d2ff.428c (bia 0057.d2ff.428c)
             # Hardware is Loopback
-            m = p2.match(line)
+            m = p.p2.match(line)
 
             # Hardware is LTE Adv CAT6 - Multimode LTE/DC-HSPA+/HSPA+/HSPA/UMTS/EDGE/GPRS 
-            m1 = p2_2.match(line)
+            m1 = p.p2_2.match(line)
             m = m if m else m1
             if m:
                 types = m.groupdict()['type']
@@ -536,7 +592,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
             # Description: desc
             # Description: Pim Register Tunnel (Encap) for RP 10.186.1.1
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 description = m.groupdict()['description']
 
@@ -544,7 +600,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Secondary address 10.2.2.2/24
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 ip_sec = m.groupdict()['ip']
                 prefix_length_sec = m.groupdict()['prefix_length']
@@ -564,7 +620,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Internet Address is 10.4.4.4/24
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 ip = m.groupdict()['ip']
                 prefix_length = m.groupdict()['prefix_length']
@@ -583,7 +639,7 @@ class ShowInterfaces(ShowInterfacesSchema):
             
             # MTU 1500 bytes, BW 768 Kbit/sec, DLY 3330 usec,
             # MTU 1500 bytes, BW 10000 Kbit, DLY 1000 usec, 
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 mtu = m.groupdict()['mtu']
                 sub_mtu = m.groupdict().get('sub_mtu', None)
@@ -599,7 +655,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # reliability 255/255, txload 1/255, rxload 1/255
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 reliability = m.groupdict()['reliability']
                 txload = m.groupdict()['txload']
@@ -615,7 +671,7 @@ class ShowInterfaces(ShowInterfacesSchema):
             # Encapsulation QinQ Virtual LAN, outer ID  10, inner ID 20
             # Encapsulation 802.1Q Virtual LAN, Vlan ID  1., loopback not set
             # Encapsulation 802.1Q Virtual LAN, Vlan ID  105.
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 encapsulation = m.groupdict()['encapsulation']
                 encapsulation = m.groupdict()['encapsulation'].lower()
@@ -666,7 +722,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Keepalive set (10 sec)
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 keepalive = m.groupdict()['keepalive']
                 if keepalive:
@@ -683,7 +739,7 @@ class ShowInterfaces(ShowInterfacesSchema):
             # auto-duplex, 10 Gb/s, media type is 10G
             # Full Duplex, 10000Mbps, link type is force-up, media type is SFP-LR
             # Full-duplex, 100Gb/s, link type is force-up, media type is QSFP 100G SR4
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 duplex_mode = m.groupdict()['duplex_mode'].lower()
                 port_speed = m.groupdict()['port_speed'].lower().replace('-speed', '')
@@ -707,7 +763,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # input flow-control is off, output flow-control is unsupported
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 receive = m.groupdict()['receive'].lower()
                 send = m.groupdict()['send'].lower()
@@ -725,8 +781,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Carrier delay is 10 sec
-            p_cd = re.compile(r'^Carrier +delay +is +(?P<carrier_delay>\d+).*$')
-            m = p_cd.match(line)
+            m = p.p_cd.match(line)
             if m:
                 group = m.groupdict()
                 sub_dict = interface_dict.setdefault(interface, {})
@@ -734,9 +789,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Asymmetric Carrier-Delay Up Timer is 2 sec
             # Asymmetric Carrier-Delay Down Timer is 10 sec
-            p_cd_2 = re.compile(r'^Asymmetric +Carrier-Delay +(?P<type>Down|Up)'
-                                 ' +Timer +is +(?P<carrier_delay>\d+).*$')
-            m = p_cd_2.match(line)
+            m = p.p_cd_2.match(line)
             if m:
                 group = m.groupdict()
                 tp = group['type'].lower()
@@ -747,7 +800,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                     sub_dict['carrier_delay_down'] = int(group['carrier_delay'])
 
             # ARP type: ARPA, ARP Timeout 04:00:00
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 arp_type = m.groupdict()['arp_type'].lower()
                 arp_timeout = m.groupdict()['arp_timeout']
@@ -756,7 +809,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Last input never, output 00:01:05, output hang never
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 last_input = m.groupdict()['last_input']
                 last_output = m.groupdict()['last_output']
@@ -768,7 +821,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Members in this channel: Gi1/0/2
             # Members in this channel: Fo1/0/2 Fo1/0/4
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 interface_dict[interface]['port_channel']\
                     ['port_channel_member'] = True
@@ -788,7 +841,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # No. of active members in this channel: 12 
-            m = p15_1.match(line)
+            m = p.p15_1.match(line)
             if m:
                 group = m.groupdict()
                 active_members = int(group['active_members'])
@@ -799,7 +852,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Member 2 : GigabitEthernet0/0/10 , Full-duplex, 900Mb/s
-            m = p15_2.match(line)
+            m = p.p15_2.match(line)
             if m:
                 group = m.groupdict()
                 intf = group['interface']
@@ -813,7 +866,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # No. of PF_JUMBO supported members in this channel : 0
-            m = p15_3.match(line)
+            m = p.p15_3.match(line)
             if m:
                 group = m.groupdict()
                 number = int(group['number'])
@@ -822,13 +875,13 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Last clearing of "show interface" counters 1d02h
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:                
                 last_clear = m.groupdict()['last_clear']
                 continue
 
             # Input queue: 0/375/0/0 (size/max/drops/flushes); Total output drops: 0
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 if 'queues' not in interface_dict[interface]:
                     interface_dict[interface]['queues'] = {}
@@ -847,7 +900,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Queueing strategy: fifo
             # Queueing strategy: Class-based queueing
-            m = p18.match(line)
+            m = p.p18.match(line)
             if m:
                 if 'queues' not in interface_dict[interface]:
                     interface_dict[interface]['queues'] = {}
@@ -857,7 +910,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Output queue: 0/0 (size/max)
             # Output queue: 0/1000/64/0 (size/max total/threshold/drops)
-            m = p19.match(line)
+            m = p.p19.match(line)
             if m:
                 if 'queues' not in interface_dict[interface]:
                     interface_dict[interface]['queues'] = {}
@@ -873,7 +926,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 5 minute input rate 0 bits/sec, 0 packets/sec
-            m = p20.match(line)
+            m = p.p20.match(line)
             if m:
                 load_interval = int(m.groupdict()['load_interval'])
                 in_rate = int(m.groupdict()['in_rate'])
@@ -907,7 +960,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 5 minute output rate 0 bits/sec, 0 packets/sec
-            m = p21.match(line)
+            m = p.p21.match(line)
             if m:
                 out_rate = int(m.groupdict()['out_rate'])
                 out_rate_pkts = int(m.groupdict()['out_rate_pkts'])
@@ -919,7 +972,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 packets input, 0 bytes, 0 no buffer
-            m = p22.match(line)
+            m = p.p22.match(line)
             if m:
                 if 'counters' not in interface_dict[interface]:
                     interface_dict[interface]['counters'] = {}
@@ -935,7 +988,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Received 4173 broadcasts (0 IP multicasts)
             # Received 535996 broadcasts (535961 multicasts)
-            m = p23.match(line)
+            m = p.p23.match(line)
             if m:
                 interface_dict[interface]['counters']['in_multicast_pkts'] = \
                     int(m.groupdict()['in_broadcast_pkts'])
@@ -944,7 +997,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 runts, 0 giants, 0 throttles
-            m = p24.match(line)
+            m = p.p24.match(line)
             if m:
                 interface_dict[interface]['counters']['in_runts'] = \
                     int(m.groupdict()['in_runts'])
@@ -956,7 +1009,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored
             # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
-            m = p25.match(line)
+            m = p.p25.match(line)
             if m:
                 interface_dict[interface]['counters']['in_errors'] = \
                     int(m.groupdict()['in_errors'])
@@ -974,7 +1027,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 watchdog, 535961 multicast, 0 pause input
-            m = p26.match(line)
+            m = p.p26.match(line)
             if m:
                 interface_dict[interface]['counters']['in_watchdog'] = \
                     int(m.groupdict()['in_watchdog'])
@@ -985,14 +1038,14 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 input packets with dribble condition detected
-            m = p27.match(line)
+            m = p.p27.match(line)
             if m:
                 interface_dict[interface]['counters']['in_with_dribble'] = \
                     int(m.groupdict()['in_with_dribble'])
                 continue
 
             # 23376 packets output, 3642296 bytes, 0 underruns
-            m = p28.match(line)
+            m = p.p28.match(line)
             if m:
                 interface_dict[interface]['counters']['out_pkts'] = \
                     int(m.groupdict()['out_pkts'])
@@ -1005,7 +1058,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Received 4173 broadcasts (0 IP multicasts)
             # Received 535996 broadcasts (535961 multicasts)
-            m = p29.match(line)
+            m = p.p29.match(line)
             if m:
                 interface_dict[interface]['counters']['out_broadcast_pkts'] = \
                     int(m.groupdict()['out_broadcast_pkts'])
@@ -1015,7 +1068,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # 0 output errors, 0 collisions, 2 interface resets
             # 0 output errors, 0 interface resets
-            m = p30.match(line)
+            m = p.p30.match(line)
             if m:
                 interface_dict[interface]['counters']['out_errors'] = \
                     int(m.groupdict()['out_errors'])
@@ -1027,14 +1080,14 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 unknown protocol drops
-            m = p31.match(line)
+            m = p.p31.match(line)
             if m:
                 interface_dict[interface]['counters']['out_unknown_protocl_drops'] = \
                     int(m.groupdict()['out_unknown_protocl_drops'])
                 continue
 
             # 0 babbles, 0 late collision, 0 deferred
-            m = p32.match(line)
+            m = p.p32.match(line)
             if m:
                 interface_dict[interface]['counters']['out_babble'] = \
                     int(m.groupdict()['out_babble'])
@@ -1045,7 +1098,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 lost carrier, 0 no carrier, 0 pause output
-            m = p33.match(line)
+            m = p.p33.match(line)
             if m:
                 interface_dict[interface]['counters']['out_lost_carrier'] = \
                     int(m.groupdict()['out_lost_carrier'])
@@ -1058,7 +1111,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 output buffer failures, 0 output buffers swapped out
-            m = p34.match(line)
+            m = p.p34.match(line)
             if m:
                 interface_dict[interface]['counters']['out_buffer_failure'] = \
                     int(m.groupdict()['out_buffer_failure'])
@@ -1068,7 +1121,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Interface is unnumbered. Using address of Loopback0 (10.4.1.1)
             # Interface is unnumbered. Using address of GigabitEthernet0/2.1 (192.168.154.1)
-            m = p35.match(line)
+            m = p.p35.match(line)
             if m:
                 unnumbered_dict[interface] = {}
                 unnumbered_dict[interface]['unnumbered_intf'] = m.groupdict()['unnumbered_intf']
@@ -1076,7 +1129,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 8 maximum active VCs, 1024 VCs per VP, 1 current VCCs
-            m = p36.match(line)
+            m = p.p36.match(line)
             if m:
                 group = m.groupdict()
                 maximum_active_vcs = group['maximum_active_vcs']
@@ -1088,7 +1141,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
             
             # VC Auto Creation Disabled.
-            m = p37.match(line)
+            m = p.p37.match(line)
             if m:
                 group = m.groupdict()
                 vc_auto_creation = group['vc_auto_creation']
@@ -1096,7 +1149,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # VC idle disconnect time: 300 seconds
-            m = p38.match(line)
+            m = p.p38.match(line)
             if m:
                 group = m.groupdict()
                 vc_idle_disconnect_time = group['vc_idle_disconnect_time']
@@ -1104,28 +1157,28 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # AAL5 CRC errors : 0
-            m = p39.match(line)
+            m = p.p39.match(line)
             if m:
                 group = m.groupdict()
                 interface_dict[interface].update({'aal5_crc_errors': int(group['val'])})
                 continue
             
             # AAL5 SAR Timeouts : 0
-            m = p40.match(line)
+            m = p.p40.match(line)
             if m:
                 group = m.groupdict()
                 interface_dict[interface].update({'aal5_oversized_sdus': int(group['val'])})
                 continue
 
             # AAL5 Oversized SDUs : 0
-            m = p41.match(line)
+            m = p.p41.match(line)
             if m:
                 group = m.groupdict()
                 interface_dict[interface].update({'aal5_sar_timeouts': int(group['val'])})
                 continue
 
             # LCP Closed
-            m = p42.match(line)
+            m = p.p42.match(line)
             if m:
                 group = m.groupdict()
                 interface_dict[interface].update({'lcp_state': group['state']})
@@ -1135,14 +1188,14 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Base PPPoATM vaccess
-            m = p43.match(line)
+            m = p.p43.match(line)
             if m:
                 group = m.groupdict()
                 interface_dict[interface].update({'base_pppoatm': group['base_pppoatm']})
                 continue
 
             # Vaccess status 0x44, loopback not set
-            m = p44.match(line)
+            m = p.p44.match(line)
             if m:
                 group = m.groupdict()
                 interface_dict[interface].update({'vaccess_status': group['status']})
@@ -1150,38 +1203,17 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # DTR is pulsed for 5 seconds on reset
-            m = p45.match(line)
+            m = p.p45.match(line)
             if m:
                 group = m.groupdict()
                 interface_dict[interface].update({'dtr_pulsed': group['dtr_pulsed']})
                 continue
 
-        # create strucutre for unnumbered interface
-        if not unnumbered_dict:
-            return(interface_dict)
+        return interface_dict, unnumbered_dict
 
-        for intf in unnumbered_dict:
-            unnumbered_intf = unnumbered_dict[intf]['unnumbered_intf']
-            unnumbered_ip = unnumbered_dict[intf]['unnumbered_ip']
-            if unnumbered_intf in interface_dict:
-                if 'ipv4' in interface_dict[unnumbered_intf]:
-                    for ip in interface_dict[unnumbered_intf]['ipv4']:
-                        if unnumbered_ip in ip:
-                            if 'ipv4' not in interface_dict[intf]:
-                                interface_dict[intf]['ipv4'] = {}
-                            if ip not in interface_dict[intf]['ipv4']:
-                                interface_dict[intf]['ipv4'][ip] = {}
-                            m = re.search('([\w\.\:]+)\/(\d+)', ip)
-                            interface_dict[intf]['ipv4'][ip]['ip'] = m.groups()[0]
-                            interface_dict[intf]['ipv4'][ip]['prefix_length'] = m.groups()[1]
-                            interface_dict[intf]['ipv4']['unnumbered'] = {}
-                            interface_dict[intf]['ipv4']['unnumbered']\
-                                ['interface_ref'] = unnumbered_intf
-        return(interface_dict)
 
-
-# parser using parsergen
-# ----------------------
+# parser using the tabular engine
+# --------------------------------
 class ShowIpInterfaceBriefSchema(MetaParser):
     """Parser for show ip interface brief"""
     schema = {'interface':
@@ -1242,26 +1274,18 @@ class ShowIpInterfaceBrief(ShowIpInterfaceBriefSchema):
             out = output
 
         if out:
-            res = parsergen.oper_fill_tabular(device_output=out,
-                                              device_os='iosxe',
-                                              table_terminal_pattern=r"^\n",
-                                              header_fields=
-                                               [ "Interface",
-                                                 "IP-Address",
-                                                 "OK\?",
-                                                 "Method",
-                                                 "Status",
-                                                 "Protocol" ],
-                                              label_fields=
-                                               [ "Interface",
-                                                 "ip_address",
-                                                 "interface_is_ok",
-                                                 "method",
-                                                 "status",
-                                                 "protocol" ],
-                                              index=[0])
-
-            # Building the schema out of the parsergen output
+            res = Tabular(device_output=out,
+                          device_os='iosxe',
+                          table_terminal_pattern=r"^\n",
+                          header_fields=[
+                              "Interface", "IP-Address", "OK\?",
+                              "Method", "Status", "Protocol"],
+                          label_fields=[
+                              "Interface", "ip_address", "interface_is_ok",
+                              "method", "status", "protocol"],
+                          index=[0])
+
+            # Building the schema out of the tabular output
             if res.entries:
                 for intf, intf_dict in res.entries.items():
                     intf = Common.convert_intf_name(intf)
@@ -1945,6 +1969,182 @@ class ShowIpInterface(ShowIpInterfaceSchema):
     cli_command = ['show ip interface','show ip interface {interface}']
     exclude = ['unnumbered', 'address_determined_by', '(Tunnel.*)', 'joins', 'leaves']
 
+    patterns = Patterns(
+        # Vlan211 is up, line protocol is up
+        # GigabitEthernet2 is administratively down, line protocol is down
+        p1=r'^(?P<interface>[\w\/\.\-]+) +is'
+           r' +(?P<enabled>[\w\s]+),'
+           r' +line +protocol +is +(?P<oper_status>\w+)$',
+
+        # Internet address is 192.168.76.1/24
+        p2=r'^Internet +[A|a]ddress +is +(?P<ipv4>(?P<ip>[0-9\.]+)'
+           r'\/(?P<prefix_length>[0-9]+))$',
+
+        # Interface is unnumbered. Using address of GigabitEthernet0/0.101 (10.1.98.10)
+        p2_0=r'^Interface +is +unnumbered. +Using +address +of +(\S+)'
+             r' +\((?P<ipv4>(?P<ip>[0-9\.]+))\)$',
+
+        # Secondary address 10.2.2.2/24
+        p2_1=r'^Secondary +address +(?P<ipv4>(?P<ip>[0-9\.]+)'
+             r'\/(?P<prefix_length>[0-9]+))$',
+
+        # Internet address will be negotiated using DHCP
+        # Internet address will be negotiated using IPCP
+        p2_2=r'^Internet +[A|a]ddress +will +be +negotiated '
+             r'+using +(?P<negotiated>DHCP|IPCP)$',
+
+        # Broadcast address is 255.255.255.255
+        p3=r'^Broadcast +address +is +(?P<address>[\w\.\:]+)$',
+
+        # MTU is 1500 bytes
+        p4=r'^MTU +is +(?P<mtu>\d+) +bytes$',
+
+        # Helper address is not set
+        p5=r'^Helper +address +is +not +set$',
+
+        # Helper address is 10.1.1.1
+        p5_0=r'^Helper +address +is +(?P<address>[\d\.]+)$',
+
+        # Helper addresses are 10.1.1.1
+        p5_1=r'^Helper +addresses +are +(?P<address>[\w\.\:\s]+)$',
+
+        # 10.2.2.2
+        p5_2=r'^(?P<address>[\d\.]+)$',
+
+        # Directed broadcast forwarding is disabled
+        p6=r'^Directed +broadcast +forwarding +is +(?P<status>\w+)$',
+
+        # Multicast reserved groups joined: 224.0.0.1 224.0.0.2 224.0.0.22 224.0.0.13
+        p41=r'^Multicast +reserved +groups +joined: +(?P<multicast_groups>[\w\s\.]+)$',
+
+        # Multicast reserved groups joined: 224.0.0.1 224.0.0.2 224.0.0.22 224.0.0.13
+        p41_1=r'(?P<multicast_groups>\d+\.\d+\.\d+\.\d+)',
+
+        # Outgoing Common access list is not set
+        p7=r'^Outgoing +Common +access +list +is +'
+           r'(?P<access_list>[\w\s]+)$',
+
+        # Outgoing access list is not set
+        p8=r'^Outgoing +access +list +is +'
+           r'(?P<access_list>[\w\s]+)$',
+
+        # Inbound Common access list is not set
+        p9=r'^Inbound +Common +access +list +is +'
+           r'(?P<access_list>[\w\s]+)$',
+
+        # Inbound  access list is not set
+        p10=r'^Outgoing +access +list +is +'
+            r'(?P<access_list>[\w\s]+)$',
+
+        # Proxy ARP is enabled
+        p11=r'^Proxy +ARP +is +'
+            r'(?P<status>\w+)$',
+
+        # Local Proxy ARP is disabled
+        p12=r'^Local +Proxy +ARP +is +'
+            r'(?P<status>\w+)$',
+
+        # Security level is default
+        p13=r'^Security +level +is +'
+            r'(?P<level>\w+)$',
+
+        # Split horizon is enabled
+        p14=r'^Split +horizon +is +'
+            r'(?P<status>\w+)$',
+
+        # ICMP redirects are always sent
+        p15=r'^ICMP +redirects +are +'
+            r'(?P<sent>[\w\s]+)$',
+
+        # ICMP unreachables are always sent
+        p16=r'^ICMP +unreachables +are +'
+            r'(?P<sent>[\w\s]+)$',
+
+        # ICMP mask replies are never sent
+        p17=r'^ICMP +mask +replies +are +'
+            r'(?P<sent>[\w\s]+)$',
+
+        # IP fast switching is enabled
+        p18=r'^IP +fast +switching +is +'
+            r'(?P<status>\w+)$',
+
+        # IP Flow switching is disabled
+        p19=r'^IP +Flow +switching +is +'
+            r'(?P<status>\w+)$',
+
+        # IP CEF switching is enabled
+        p20=r'^IP +CEF +switching +is +'
+            r'(?P<status>\w+)$',
+
+        # IP CEF switching turbo vector
+        p21=r'^IP +CEF +switching +turbo +vector$',
+
+        # IP Null turbo vector
+        p22=r'^IP +Null +turbo +vector$',
+
+        # VPN Routing/Forwarding "Mgmt-vrf"
+        p23=r'^VPN +Routing\/Forwarding +\"(?P<vrf>[\w\-]+)\"$',
+
+        # Associated unicast routing topologies:
+        #     Topology "base", operation state is UP
+        p24=r'^Associated +unicast +routing +topologies:$',
+        p24_1=r'^Topology +\"(?P<topo>\w+)\", +'
+              r'operation +state +is +(?P<topo_status>\w+)$',
+
+        # IP route-cache flags are Fast, CEF
+        p26=r'^IP +route\-cache +flags +are +(?P<flags>[\w\s\,]+)$',
+
+        # Router Discovery is disabled
+        p27=r'^Router +Discovery +is +'
+            r'(?P<status>\w+)$',
+
+        # IP output packet accounting is disabled
+        p28=r'^IP +output +packet +accounting +is +'
+            r'(?P<status>\w+)$',
+
+        # IP access violation accounting is disabled
+        p29=r'^IP +access +violation +accounting +is +'
+            r'(?P<status>\w+)$',
+
+        # TCP/IP header compression is disabled
+        p30=r'^TCP\/IP +header +compression +is +'
+            r'(?P<status>\w+)$',
+
+        # RTP/IP header compression is disabled
+        p31=r'^RTP\/IP +header +compression +is +'
+            r'(?P<status>\w+)$',
+
+        # Probe proxy name replies are disabled
+        p32=r'^Probe +proxy +name +replies +are +'
+            r'(?P<status>\w+)$',
+
+        # Policy routing is disabled
+        p33=r'^Policy +routing +is +'
+            r'(?P<status>\w+)$',
+
+        # Network address translation is disabled
+        p34=r'^Network +address +translation +is +'
+            r'(?P<status>\w+)$',
+
+        # BGP Policy Mapping is disabled
+        p35=r'^BGP +Policy +Mapping +is +'
+            r'(?P<status>\w+)$',
+
+        # IPv4 WCCP Redirect outbound is disable
+        p37=r'^IPv4 +WCCP +Redirect +outbound +is +(?P<status>\w+)$',
+
+        # IPv4 WCCP Redirect inbound is disabled
+        p38=r'^IPv4 +WCCP +Redirect +inbound +is +(?P<status>\w+)$',
+
+        # IPv4 WCCP Redirect exclude is disabled
+        p39=r'^IPv4 +WCCP +Redirect +exclude +is +(?P<status>\w+)$',
+
+        # Interface is unnumbered. Using address of Loopback11 (192.168.151.1)
+        p40=r'^Interface +is +unnumbered. +Using +address +of +'
+            r'(?P<unnumbered_intf>[\w\/\-\.]+) +'
+            r'\((?P<unnumbered_ip>[\w\.\:]+)\)$',
+    )
+
     def cli(self,interface="",output=None):
         if output is None:
             if interface:
@@ -1959,13 +2159,11 @@ class ShowIpInterface(ShowIpInterfaceSchema):
         unnumbered_dict = {}
         for line in out.splitlines():
             line = line.strip()
+            p = self.patterns.for_line(line)
 
             # Vlan211 is up, line protocol is up
             # GigabitEthernet2 is administratively down, line protocol is down
-            p1 =  re.compile(r'^(?P<interface>[\w\/\.\-]+) +is'
-                            r' +(?P<enabled>[\w\s]+),'
-                            r' +line +protocol +is +(?P<oper_status>\w+)$')
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 interface = m.groupdict()['interface']
                 enabled = m.groupdict()['enabled'].lower()
@@ -1983,9 +2181,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Internet address is 192.168.76.1/24
-            p2 = re.compile(r'^Internet +[A|a]ddress +is +(?P<ipv4>(?P<ip>[0-9\.]+)'
-                            r'\/(?P<prefix_length>[0-9]+))$')
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 ip = m.groupdict()['ip']
                 prefix_length = m.groupdict()['prefix_length']
@@ -2005,9 +2201,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Interface is unnumbered. Using address of GigabitEthernet0/0.101 (10.1.98.10)
-            p2_0 = re.compile(r'^Interface +is +unnumbered. +Using +address +of +(\S+)'
-                              r' +\((?P<ipv4>(?P<ip>[0-9\.]+))\)$')
-            m = p2_0.match(line)
+            m = p.p2_0.match(line)
             if m:
                 ip = m.groupdict()['ip']
                 address = m.groupdict()['ipv4']
@@ -2024,9 +2218,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Secondary address 10.2.2.2/24
-            p2_1 = re.compile(r'^Secondary +address +(?P<ipv4>(?P<ip>[0-9\.]+)'
-                              r'\/(?P<prefix_length>[0-9]+))$')
-            m = p2_1.match(line)
+            m = p.p2_1.match(line)
             if m:
                 ip = m.groupdict()['ip']
                 prefix_length = m.groupdict()['prefix_length']
@@ -2046,9 +2238,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
             # Internet address will be negotiated using DHCP
             # Internet address will be negotiated using IPCP
-            p2_2 = re.compile(r'^Internet +[A|a]ddress +will +be +negotiated '
-                              r'+using +(?P<negotiated>DHCP|IPCP)$')
-            m = p2_2.match(line)
+            m = p.p2_2.match(line)
             if m:
                 negotiated_holder = m.groupdict()
                 if 'DHCP' in negotiated_holder.get('negotiated'):
@@ -2061,8 +2251,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Broadcast address is 255.255.255.255
-            p3 = re.compile(r'^Broadcast +address +is +(?P<address>[\w\.\:]+)$')
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 interface_dict[interface]['ipv4'][address]['broadcast_address'] = \
                     m.groupdict()['address']
@@ -2078,30 +2267,26 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # MTU is 1500 bytes
-            p4 = re.compile(r'^MTU +is +(?P<mtu>\d+) +bytes$')
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 interface_dict[interface]['mtu'] = \
                     int(m.groupdict()['mtu'])
                 continue
 
             # Helper address is not set
-            p5 = re.compile(r'^Helper +address +is +not +set$')
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 continue
 
             # Helper address is 10.1.1.1
-            p5_0 = re.compile(r'^Helper +address +is +(?P<address>[\d\.]+)$')
-            m = p5_0.match(line)
+            m = p.p5_0.match(line)
             if m:
                 interface_dict[interface]['helper_address'] = \
                     [m.groupdict()['address']]
                 continue
 
             # Helper addresses are 10.1.1.1
-            p5_1 = re.compile(r'^Helper +addresses +are +(?P<address>[\w\.\:\s]+)$')
-            m = p5_1.match(line)
+            m = p.p5_1.match(line)
             if m:
                 helper_flag = True
                 if 'not set' not in m.groupdict()['address']:
@@ -2112,8 +2297,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
             
             # 10.2.2.2
-            p5_2 = re.compile(r'^(?P<address>[\d\.]+)$')
-            m = p5_2.match(line)
+            m = p.p5_2.match(line)
             if m:
                 if helper_flag:
                     helper_list.append(m.groupdict()['address'])
@@ -2122,8 +2306,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 helper_flag = False
 
             # Directed broadcast forwarding is disabled
-            p6 = re.compile(r'^Directed +broadcast +forwarding +is +(?P<status>\w+)$')
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['directed_broadcast_forwarding'] = False
@@ -2132,8 +2315,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Multicast reserved groups joined: 224.0.0.1 224.0.0.2 224.0.0.22 224.0.0.13
-            p41 = re.compile(r'^Multicast +reserved +groups +joined: +(?P<multicast_groups>[\w\s\.]+)$')
-            m = p41.match(line)
+            m = p.p41.match(line)
             if m:
                 multicast_groups_address = str(m.groupdict()['multicast_groups'])
 
@@ -2145,8 +2327,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Multicast reserved groups joined: 224.0.0.1 224.0.0.2 224.0.0.22 224.0.0.13
-            p41_1 = re.compile(r'(?P<multicast_groups>\d+\.\d+\.\d+\.\d+)')
-            m = p41_1.findall(line)
+            m = p.p41_1.findall(line)
             if m and multicast_groups:
                 multicast_groups.extend(m)
                 interface_dict[interface]['multicast_groups']\
@@ -2154,9 +2335,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Outgoing Common access list is not set 
-            p7 = re.compile(r'^Outgoing +Common +access +list +is +'
-                            r'(?P<access_list>[\w\s]+)$')
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 if 'not set' not in m.groupdict()['access_list']:
                     interface_dict[interface]['out_common_access_list'] = \
@@ -2164,9 +2343,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Outgoing access list is not set
-            p8 = re.compile(r'^Outgoing +access +list +is +'
-                            r'(?P<access_list>[\w\s]+)$')
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 if 'not set' not in m.groupdict()['access_list']:
                     interface_dict[interface]['out_access_list'] = \
@@ -2174,9 +2351,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Inbound Common access list is not set
-            p9 = re.compile(r'^Inbound +Common +access +list +is +'
-                            r'(?P<access_list>[\w\s]+)$')
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 if 'not set' not in m.groupdict()['access_list']:
                     interface_dict[interface]['inbound_common_access_list'] = \
@@ -2184,9 +2359,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Inbound  access list is not set
-            p10 = re.compile(r'^Outgoing +access +list +is +'
-                            r'(?P<access_list>[\w\s]+)$')
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 if 'not set' not in m.groupdict()['access_list']:
                     interface_dict[interface]['inbound_access_list'] = \
@@ -2194,9 +2367,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Proxy ARP is enabled
-            p11 = re.compile(r'^Proxy +ARP +is +'
-                            r'(?P<status>\w+)$')
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['proxy_arp'] = False
@@ -2205,9 +2376,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Local Proxy ARP is disabled
-            p12 = re.compile(r'^Local +Proxy +ARP +is +'
-                            r'(?P<status>\w+)$')
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['local_proxy_arp'] = False
@@ -2216,17 +2385,13 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Security level is default
-            p13 = re.compile(r'^Security +level +is +'
-                            r'(?P<level>\w+)$')
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 interface_dict[interface]['security_level'] = m.groupdict()['level']
                 continue
 
             # Split horizon is enabled
-            p14 = re.compile(r'^Split +horizon +is +'
-                            r'(?P<status>\w+)$')
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['split_horizon'] = False
@@ -2235,9 +2400,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # ICMP redirects are always sent
-            p15 = re.compile(r'^ICMP +redirects +are +'
-                            r'(?P<sent>[\w\s]+)$')
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 if 'icmp' not in interface_dict[interface]:
                     interface_dict[interface]['icmp'] = {}
@@ -2247,9 +2410,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # ICMP unreachables are always sent
-            p16 = re.compile(r'^ICMP +unreachables +are +'
-                             r'(?P<sent>[\w\s]+)$')
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 if 'icmp' not in interface_dict[interface]:
                     interface_dict[interface]['icmp'] = {}
@@ -2259,9 +2420,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # ICMP mask replies are never sent
-            p17 = re.compile(r'^ICMP +mask +replies +are +'
-                             r'(?P<sent>[\w\s]+)$')
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 if 'icmp' not in interface_dict[interface]:
                     interface_dict[interface]['icmp'] = {}
@@ -2271,9 +2430,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # IP fast switching is enabled
-            p18 = re.compile(r'^IP +fast +switching +is +'
-                             r'(?P<status>\w+)$')
-            m = p18.match(line)
+            m = p.p18.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['ip_fast_switching'] = False
@@ -2282,9 +2439,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # IP Flow switching is disabled
-            p19 = re.compile(r'^IP +Flow +switching +is +'
-                             r'(?P<status>\w+)$')
-            m = p19.match(line)
+            m = p.p19.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['ip_flow_switching'] = False
@@ -2293,9 +2448,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # IP CEF switching is enabled
-            p20 = re.compile(r'^IP +CEF +switching +is +'
-                             r'(?P<status>\w+)$')
-            m = p20.match(line)
+            m = p.p20.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['ip_cef_switching'] = False
@@ -2304,38 +2457,32 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # IP CEF switching turbo vector
-            p21 = re.compile(r'^IP +CEF +switching +turbo +vector$')
-            m = p21.match(line)
+            m = p.p21.match(line)
             if m:
                 interface_dict[interface]['ip_cef_switching_turbo_vector'] = True
                 continue
 
             # IP Null turbo vector
-            p22 = re.compile(r'^IP +Null +turbo +vector$')
-            m = p22.match(line)
+            m = p.p22.match(line)
             if m:
                 interface_dict[interface]['ip_null_turbo_vector'] = True
                 continue
 
             # VPN Routing/Forwarding "Mgmt-vrf"
-            p23 = re.compile(r'^VPN +Routing\/Forwarding +\"(?P<vrf>[\w\-]+)\"$')
-            m = p23.match(line)
+            m = p.p23.match(line)
             if m:
                 interface_dict[interface]['vrf'] = m.groupdict()['vrf']
                 continue
 
             # Associated unicast routing topologies:
             #     Topology "base", operation state is UP
-            p24 = re.compile(r'^Associated +unicast +routing +topologies:$')
-            m = p24.match(line)
+            m = p.p24.match(line)
             if m:
                 if 'unicast_routing_topologies' not in interface_dict[interface]:
                     interface_dict[interface]['unicast_routing_topologies'] = {}
                 continue
 
-            p24_1 = re.compile(r'^Topology +\"(?P<topo>\w+)\", +'
-                            r'operation +state +is +(?P<topo_status>\w+)$')
-            m = p24_1.match(line)
+            m = p.p24_1.match(line)
             if m:
                 if 'unicast_routing_topologies' in interface_dict[interface]:
                     if 'topology' not in interface_dict[interface]\
@@ -2373,8 +2520,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # IP route-cache flags are Fast, CEF
-            p26 = re.compile(r'^IP +route\-cache +flags +are +(?P<flags>[\w\s\,]+)$')
-            m = p26.match(line)
+            m = p.p26.match(line)
             if m:
                 ret = m.groupdict()['flags'].split(',')
                 ret = [i.strip() for i in ret]
@@ -2382,9 +2528,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Router Discovery is disabled
-            p27 = re.compile(r'^Router +Discovery +is +'
-                             r'(?P<status>\w+)$')
-            m = p27.match(line)
+            m = p.p27.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['router_discovery'] = False
@@ -2393,9 +2537,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # IP output packet accounting is disabled
-            p28 = re.compile(r'^IP +output +packet +accounting +is +'
-                             r'(?P<status>\w+)$')
-            m = p28.match(line)
+            m = p.p28.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['ip_output_packet_accounting'] = False
@@ -2404,9 +2546,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # IP access violation accounting is disabled
-            p29 = re.compile(r'^IP +access +violation +accounting +is +'
-                             r'(?P<status>\w+)$')
-            m = p29.match(line)
+            m = p.p29.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['ip_access_violation_accounting'] = False
@@ -2415,9 +2555,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # TCP/IP header compression is disabled
-            p30 = re.compile(r'^TCP\/IP +header +compression +is +'
-                             r'(?P<status>\w+)$')
-            m = p30.match(line)
+            m = p.p30.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['tcp_ip_header_compression'] = False
@@ -2426,9 +2564,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # RTP/IP header compression is disabled
-            p31 = re.compile(r'^RTP\/IP +header +compression +is +'
-                             r'(?P<status>\w+)$')
-            m = p31.match(line)
+            m = p.p31.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['rtp_ip_header_compression'] = False
@@ -2437,9 +2573,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Probe proxy name replies are disabled
-            p32 = re.compile(r'^Probe +proxy +name +replies +are +'
-                             r'(?P<status>\w+)$')
-            m = p32.match(line)
+            m = p.p32.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['probe_proxy_name_replies'] = False
@@ -2448,9 +2582,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Policy routing is disabled
-            p33 = re.compile(r'^Policy +routing +is +'
-                             r'(?P<status>\w+)$')
-            m = p33.match(line)
+            m = p.p33.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['policy_routing'] = False
@@ -2459,9 +2591,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Network address translation is disabled
-            p34 = re.compile(r'^Network +address +translation +is +'
-                             r'(?P<status>\w+)$')
-            m = p34.match(line)
+            m = p.p34.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['network_address_translation'] = False
@@ -2470,9 +2600,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # BGP Policy Mapping is disabled
-            p35 = re.compile(r'^BGP +Policy +Mapping +is +'
-                             r'(?P<status>\w+)$')
-            m = p35.match(line)
+            m = p.p35.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['bgp_policy_mapping'] = False
@@ -2491,8 +2619,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # IPv4 WCCP Redirect outbound is disable
-            p37 = re.compile(r'^IPv4 +WCCP +Redirect +outbound +is +(?P<status>\w+)$')
-            m = p37.match(line)
+            m = p.p37.match(line)
             if m:
                 if 'wccp' not in interface_dict[interface]:
                     interface_dict[interface]['wccp'] = {}
@@ -2505,8 +2632,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # IPv4 WCCP Redirect inbound is disabled
-            p38 = re.compile(r'^IPv4 +WCCP +Redirect +inbound +is +(?P<status>\w+)$')
-            m = p38.match(line)
+            m = p.p38.match(line)
             if m:
                 if 'wccp' not in interface_dict[interface]:
                     interface_dict[interface]['wccp'] = {}
@@ -2518,8 +2644,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                         ['redirect_inbound'] = True
 
             # IPv4 WCCP Redirect exclude is disabled
-            p39 = re.compile(r'^IPv4 +WCCP +Redirect +exclude +is +(?P<status>\w+)$')
-            m = p39.match(line)
+            m = p.p39.match(line)
             if m:
                 if 'wccp' not in interface_dict[interface]:
                     interface_dict[interface]['wccp'] = {}
@@ -2531,10 +2656,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                         ['redirect_exclude'] = True
 
             # Interface is unnumbered. Using address of Loopback11 (192.168.151.1)
-            p40 = re.compile(r'^Interface +is +unnumbered. +Using +address +of +'
-                             r'(?P<unnumbered_intf>[\w\/\-\.]+) +'
-                             r'\((?P<unnumbered_ip>[\w\.\:]+)\)$')
-            m = p40.match(line)
+            m = p.p40.match(line)
             if m:
                 unnumbered_dict[interface] = {}
                 unnumbered_intf = m.groupdict()['unnumbered_intf']
@@ -2623,6 +2745,105 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
     """Parser for show ipv6 interface"""
     cli_command = ['show ipv6 interface {interface}','show ipv6 interface']
 
+    patterns = Patterns(
+        # Vlan211 is up, line protocol is up
+        # GigabitEthernet1/0/1 is administratively down, line protocol is down
+        p1=r'^(?P<interface>[\w\/\.\-]+) +is'
+           ' +(?P<enabled>[\w\s]+),'
+           ' +line +protocol +is +(?P<oper_status>\w+)$',
+
+        # IPv6 is enabled, link-local address is FE80::257:D2FF:FE28:
+        # IPv6 is tentative, link-local address is FE80::257:D2FF:FEFF:428C [TEN]
+        # IPv6 is tentative, link-local address is FE80::257:D2FF:FEFF:428C [UNA/TEN]
+        p2=r'^IPv6 +is +(?P<status>\w+), +'
+           'link-local +address +is +(?P<link_local>[\w\:]+)'
+           '( *\[(?P<type>[\w\/]+)\])?$',
+
+        # No Virtual link-local address(es):
+        # Virtual link-local address(es):
+        # FE80::5:73FF:FEA0:16 [UNA/OOD]
+        p21=r'^Virtual +link\-local +address\(es\)\:$',
+        p21_1=r'^(?P<ipv6>[\w\:]+)'
+              '( *\[(?P<type>[\w\/]+)\])?$',
+
+        # Stateless address autoconfig enabled
+        p3=r'^Stateless +address +autoconfig +enabled$',
+
+        # Global unicast address(es):
+        #   2001:10::14:1, subnet is 2001:10::14:0/112
+        #   2001:DB8:3:3::3, subnet is 2001:DB8:3:3::/64 [ANY/TEN]
+        p4=r'^Global +unicast +address\(es\):$',
+        p4_1=r'^(?P<ipv6>[\w\:]+), +subnet +is +(?P<dum1>(?P<dum2>[\w\:]+)'
+             '\/(?P<prefix_length>[0-9]+))'
+             '( *\[(?P<type>[\w\/]+)\])?$',
+
+        #     valid lifetime 2591911 preferred lifetime 604711
+        p4_2=r'^valid +lifetime +(?P<valid>\d+) +'
+             'preferred +lifetime +(?P<preferred>\d+)$',
+
+        # Joined group address(es):
+        #   FF02::1
+        #   FF02::1:FF14:1
+        #   FF02::1:FF28:1A71
+        p5=r'^Joined +group +address\(es\):$',
+        p5_1=r'^(?P<address>[\w\:]+)$',
+
+        # ICMP error messages limited to one every 100 milliseconds
+        p7=r'^ICMP +error +messages +limited +to +one +'
+           'every +(?P<limited>\d+) +milliseconds$',
+
+        # ICMP redirects are enabled
+        p8=r'^ICMP +redirects +are +(?P<status>\w+)$',
+
+        # ICMP unreachables are sent
+        p9=r'^ICMP +unreachables +are +(?P<status>[\w\s]+)$',
+
+        # ND DAD is enabled, number of DAD attempts: 1
+        p10=r'^ND +DAD +is +(?P<status>\w+), +'
+            'number +of +DAD +attempts: +(?P<attempts>\d+)$',
+
+        # ND reachable time is 30000 milliseconds (using 30000)
+        p11=r'^ND +reachable +time +is (?P<time>\d+) +milliseconds'
+            ' +\(using +(?P<use>\d+)\)$',
+
+        # ND NS retransmit interval is 1000 milliseconds
+        p12=r'^ND +NS +retransmit +interval +is'
+            ' +(?P<interval>\d+) +milliseconds$',
+
+        # ND advertised reachable time is 0 (unspecified)
+        p13=r'^ND +advertised +reachable +time +is +(?P<time>\d+)'
+            ' +\((?P<dummy>\S+)\)$',
+
+        # ND advertised retransmit interval is 0 (unspecified)
+        p14=r'^ND +advertised +retransmit +interval +is +(?P<time>\d+)'
+            ' +\((?P<dummy>\S+)\)$',
+
+        # ND router advertisements are sent every 200 seconds
+        p15=r'^ND +router +advertisements +are +sent +'
+            'every +(?P<time>\d+) +seconds$',
+
+        # ND router advertisements live for 1800 seconds
+        p16=r'^ND +router +advertisements +live +for +'
+            '(?P<time>\d+) +seconds$',
+
+        # ND advertised default router preference is Medium
+        p17=r'^ND +advertised +default +router +preference +'
+            'is +(?P<prefer>\w+)$',
+
+        # ND RAs are suppressed (periodic)
+        p17_1=r'^ND +RAs +are +suppressed.*$',
+
+        # Hosts use stateless autoconfig for addresses.
+        p18=r'^Hosts +use +(?P<addr_conf_method>[\w\s]+) +for +addresses.$',
+
+        # Interface is unnumbered. Using address of Loopback0
+        p19=r'^Interface +is +unnumbered. +Using +address +of'
+            ' +(?P<unnumbered_intf>[\w\/\.]+)$',
+
+        # No global unicast address is configured
+        p20=r'^No +global +unicast +address +is +configured$',
+    )
+
     def cli(self, interface='',output=None):
         if output is None:
             if not interface:
@@ -2642,13 +2863,11 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                        'pre': 'preferre'}
         for line in out.splitlines():
             line = line.strip()
+            p = self.patterns.for_line(line)
 
             # Vlan211 is up, line protocol is up
             # GigabitEthernet1/0/1 is administratively down, line protocol is down
-            p1 =  re.compile(r'^(?P<interface>[\w\/\.\-]+) +is'
-                              ' +(?P<enabled>[\w\s]+),'
-                              ' +line +protocol +is +(?P<oper_status>\w+)$')
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 intf = m.groupdict()['interface']
                 enabled = m.groupdict()['enabled'].lower()
@@ -2669,10 +2888,7 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
             # IPv6 is enabled, link-local address is FE80::257:D2FF:FE28:
             # IPv6 is tentative, link-local address is FE80::257:D2FF:FEFF:428C [TEN]
             # IPv6 is tentative, link-local address is FE80::257:D2FF:FEFF:428C [UNA/TEN]
-            p2 = re.compile(r'^IPv6 +is +(?P<status>\w+), +'
-                             'link-local +address +is +(?P<link_local>[\w\:]+)'
-                             '( *\[(?P<type>[\w\/]+)\])?$')
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 status = m.groupdict()['status']
                 link_addr = m.groupdict()['link_local']
@@ -2697,15 +2913,12 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
             # No Virtual link-local address(es):
             # Virtual link-local address(es):
             # FE80::5:73FF:FEA0:16 [UNA/OOD]
-            p21 = re.compile(r'^Virtual +link\-local +address\(es\)\:$')
-            m = p21.match(line)
+            m = p.p21.match(line)
             if m:
                 ipv6 = True
                 continue
 
-            p21_1 = re.compile(r'^(?P<ipv6>[\w\:]+)'
-                                '( *\[(?P<type>[\w\/]+)\])?$')
-            m = p21_1.match(line)
+            m = p.p21_1.match(line)
             if m and ipv6:
                 if 'ipv6' not in ret_dict[intf]:
                     ret_dict[intf]['ipv6'] = {}
@@ -2729,8 +2942,7 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 continue
 
             # Stateless address autoconfig enabled
-            p3 = re.compile(r'^Stateless +address +autoconfig +enabled$')
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 ret_dict[intf]['autoconf'] = True
                 continue
@@ -2738,16 +2950,12 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
             # Global unicast address(es):
             #   2001:10::14:1, subnet is 2001:10::14:0/112 
             #   2001:DB8:3:3::3, subnet is 2001:DB8:3:3::/64 [ANY/TEN]
-            p4 = re.compile(r'^Global +unicast +address\(es\):$')
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 ipv6 = True
                 continue
 
-            p4_1 = re.compile(r'^(?P<ipv6>[\w\:]+), +subnet +is +(?P<dum1>(?P<dum2>[\w\:]+)'
-                               '\/(?P<prefix_length>[0-9]+))'
-                               '( *\[(?P<type>[\w\/]+)\])?$')
-            m = p4_1.match(line)
+            m = p.p4_1.match(line)
             if m and ipv6:
                 if 'ipv6' not in ret_dict[intf]:
                     ret_dict[intf]['ipv6'] = {}
@@ -2787,9 +2995,7 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 continue
 
             #     valid lifetime 2591911 preferred lifetime 604711
-            p4_2 = re.compile(r'^valid +lifetime +(?P<valid>\d+) +'
-                               'preferred +lifetime +(?P<preferred>\d+)$')
-            m = p4_2.match(line)
+            m = p.p4_2.match(line)
             if m and ipv6:
                 try:
                     address
@@ -2808,14 +3014,12 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
             #   FF02::1
             #   FF02::1:FF14:1
             #   FF02::1:FF28:1A71
-            p5 = re.compile(r'^Joined +group +address\(es\):$')
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 ipv6 = False
                 continue
 
-            p5_1 = re.compile(r'^(?P<address>[\w\:]+)$')
-            m = p5_1.match(line)
+            m = p.p5_1.match(line)
             if m and not ipv6:
                 joined_group.append(m.groupdict()['address'])
                 ret_dict[intf]['joined_group_addresses'] = sorted(joined_group)
@@ -2836,9 +3040,7 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 continue
 
             # ICMP error messages limited to one every 100 milliseconds
-            p7 = re.compile(r'^ICMP +error +messages +limited +to +one +'
-                             'every +(?P<limited>\d+) +milliseconds$')
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 if 'ipv6' not in ret_dict[intf]:
                     ret_dict[intf]['ipv6'] = {}
@@ -2849,8 +3051,7 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 continue
 
             # ICMP redirects are enabled
-            p8 = re.compile(r'^ICMP +redirects +are +(?P<status>\w+)$')
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 if 'ipv6' not in ret_dict[intf]:
                     ret_dict[intf]['ipv6'] = {}
@@ -2863,8 +3064,7 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 continue
 
             # ICMP unreachables are sent
-            p9 = re.compile(r'^ICMP +unreachables +are +(?P<status>[\w\s]+)$')
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 if 'ipv6' not in ret_dict[intf]:
                     ret_dict[intf]['ipv6'] = {}
@@ -2875,9 +3075,7 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 continue
 
             # ND DAD is enabled, number of DAD attempts: 1
-            p10 = re.compile(r'^ND +DAD +is +(?P<status>\w+), +'
-                              'number +of +DAD +attempts: +(?P<attempts>\d+)$')
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 nd_dict = ret_dict.setdefault(intf, {}).setdefault('ipv6', {}).setdefault('nd', {})
                 nd_dict.setdefault('suppress', False)
@@ -2891,9 +3089,7 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 continue
 
             # ND reachable time is 30000 milliseconds (using 30000)
-            p11 = re.compile(r'^ND +reachable +time +is (?P<time>\d+) +milliseconds'
-                              ' +\(using +(?P<use>\d+)\)$')
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 nd_dict = ret_dict.setdefault(intf, {}).setdefault('ipv6', {}).setdefault('nd', {})
                 nd_dict.setdefault('suppress', False)
@@ -2902,9 +3098,7 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 continue
 
             # ND NS retransmit interval is 1000 milliseconds
-            p12 = re.compile(r'^ND +NS +retransmit +interval +is'
-                              ' +(?P<interval>\d+) +milliseconds$')
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 nd_dict = ret_dict.setdefault(intf, {}).setdefault('ipv6', {}).setdefault('nd', {})
                 nd_dict.setdefault('suppress', False)
@@ -2912,9 +3106,7 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 continue
 
             # ND advertised reachable time is 0 (unspecified)
-            p13 = re.compile(r'^ND +advertised +reachable +time +is +(?P<time>\d+)'
-                              ' +\((?P<dummy>\S+)\)$')
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 nd_dict = ret_dict.setdefault(intf, {}).setdefault('ipv6', {}).setdefault('nd', {})
                 nd_dict.setdefault('suppress', False)
@@ -2926,9 +3118,7 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 continue
 
             # ND advertised retransmit interval is 0 (unspecified)
-            p14 = re.compile(r'^ND +advertised +retransmit +interval +is +(?P<time>\d+)'
-                              ' +\((?P<dummy>\S+)\)$')
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 nd_dict = ret_dict.setdefault(intf, {}).setdefault('ipv6', {}).setdefault('nd', {})
                 nd_dict.setdefault('suppress', False)
@@ -2940,9 +3130,7 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 continue
 
             # ND router advertisements are sent every 200 seconds
-            p15 = re.compile(r'^ND +router +advertisements +are +sent +'
-                              'every +(?P<time>\d+) +seconds$')
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 nd_dict = ret_dict.setdefault(intf, {}).setdefault('ipv6', {}).setdefault('nd', {})
                 nd_dict.setdefault('suppress', False)
@@ -2950,9 +3138,7 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 continue
 
             # ND router advertisements live for 1800 seconds
-            p16 = re.compile(r'^ND +router +advertisements +live +for +'
-                              '(?P<time>\d+) +seconds$')
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 nd_dict = ret_dict.setdefault(intf, {}).setdefault('ipv6', {}).setdefault('nd', {})
                 nd_dict.setdefault('suppress', False)
@@ -2960,9 +3146,7 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 continue
 
             # ND advertised default router preference is Medium
-            p17 = re.compile(r'^ND +advertised +default +router +preference +'
-                              'is +(?P<prefer>\w+)$')
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 nd_dict = ret_dict.setdefault(intf, {}).setdefault('ipv6', {}).setdefault('nd', {})
                 nd_dict.setdefault('suppress', False)
@@ -2970,25 +3154,21 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 continue
 
             # ND RAs are suppressed (periodic)
-            p17_1 = re.compile(r'^ND +RAs +are +suppressed.*$')
-            m = p17_1.match(line)
+            m = p.p17_1.match(line)
             if m:
                 nd_dict = ret_dict.setdefault(intf, {}).setdefault('ipv6', {}).setdefault('nd', {})
                 nd_dict.update({'suppress': True})
                 continue
 
             # Hosts use stateless autoconfig for addresses.
-            p18 = re.compile(r'^Hosts +use +(?P<addr_conf_method>[\w\s]+) +for +addresses.$')
-            m = p18.match(line)
+            m = p.p18.match(line)
             if m:
                 ret_dict[intf]['addresses_config_method'] = \
                     m.groupdict()['addr_conf_method']
                 continue
 
             # Interface is unnumbered. Using address of Loopback0
-            p19 = re.compile(r'^Interface +is +unnumbered. +Using +address +of'
-                              ' +(?P<unnumbered_intf>[\w\/\.]+)$')
-            m = p19.match(line)
+            m = p.p19.match(line)
             if m:
                 if 'ipv6' not in ret_dict[intf]:
                     ret_dict[intf]['ipv6'] = {}
@@ -2999,8 +3179,7 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 continue
 
             # No global unicast address is configured
-            p20 = re.compile(r'^No +global +unicast +address +is +configured$')
-            m = p20.match(line)
+            m = p.p20.match(line)
             if m:
                 if 'ipv6' not in ret_dict[intf]:
                     ret_dict[intf]['ipv6'] = {}
@@ -21,6 +21,7 @@ from genie.metaparser.util.schemaengine import (Schema,
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.columnar import ColumnarParser
 
 
 class ShowIpNatTranslationsSchema(MetaParser):
@@ -61,7 +62,7 @@ class ShowIpNatTranslationsSchema(MetaParser):
     }
 
 
-class ShowIpNatTranslations(ShowIpNatTranslationsSchema):
+class ShowIpNatTranslations(ColumnarParser, ShowIpNatTranslationsSchema):
     """
         * show ip nat translations
         * show ip nat translations verbose
@@ -74,7 +75,10 @@ class ShowIpNatTranslations(ShowIpNatTranslationsSchema):
                    'show ip nat translations vrf {vrf}',
                    'show ip nat translations vrf {vrf} verbose']
 
-    def cli(self, vrf=None, option=None, output=None):
+    columnar_tables = {'index': ('vrf', '{vrf}', 'index', '{index}')}
+    columnar_cli = True
+
+    def cli(self, vrf=None, option=None, output=None, columnar=False):
         if output is None:
             if option and vrf is None:
                 cmd = self.cli_command[1].format(verbose=option)
@@ -306,6 +310,35 @@ class ShowIpNatTranslations(ShowIpNatTranslationsSchema):
 
                 continue
 
+        if columnar:
+            # the lines of a translation update its dict after it is added,
+            # the columns are filled from the dicts once all are complete
+            columnar_dict = self.columnar_result()
+            columns = {name: [] for name in (
+                'vrf', 'index', 'protocol', 'inside_global', 'inside_local',
+                'outside_local', 'outside_global', 'group_id', 'time_left')}
+            details = ['create', 'use', 'timeout', 'map_id_in', 'mac_address',
+                       'input_idb', 'entry_id', 'use_count']
+            columns.update({'details.' + k: [] for k in details})
+            for vrf_name, vrf_dict in ret_dict.get('vrf', {}).items():
+                if not isinstance(vrf_dict, dict):
+                    # number_of_translations
+                    columnar_dict.extra.setdefault('vrf', {})[vrf_name] = \
+                        vrf_dict
+                    continue
+                for index, protocol_dict in vrf_dict.get('index', {}).items():
+                    columns['vrf'].append(vrf_name)
+                    columns['index'].append(index)
+                    for k in ['protocol', 'inside_global', 'inside_local',
+                              'outside_local', 'outside_global', 'group_id',
+                              'time_left']:
+                        columns[k].append(protocol_dict.get(k))
+                    details_dict = protocol_dict.get('details', {})
+                    for k in details:
+                        columns['details.' + k].append(details_dict.get(k))
+            columnar_dict['index'].extend(columns)
+            return columnar_dict
+
         return ret_dict
 
 
@@ -34,11 +34,9 @@ from xml.dom import minidom
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, Use
 from genie.libs.parser.utils.common import Common
-# genie.parsergen
-try:
-    import genie.parsergen
-except (ImportError, OSError):
-    pass
+from genie.libs.parser.utils.xml_index import XmlIndex
+from genie.libs.parser.utils.tabular import Tabular
+from genie.libs.parser.utils.columnar import ColumnarParser
 
 # pyATS
 from pyats.utils.exceptions import SchemaTypeError
@@ -1210,53 +1208,53 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
         # table2 for C3850
-        tmp2 = genie.parsergen.oper_fill_tabular(right_justified=True,
-                                                 header_fields=["Switch",
-                                                                "Ports",
-                                                                "Model             ",
-                                                                'SW Version       ',
-                                                                "SW Image              ",
-                                                                "Mode   "],
-                                                 label_fields=["switch_num",
-                                                               "ports",
-                                                               "model",
-                                                               "sw_ver",
-                                                               'sw_image',
-                                                               'mode'],
-                                                 index=[0, ],
-                                                 table_terminal_pattern=r"(^\n|^\s*$)",
-                                                 device_output=out,
-                                                 device_os='iosxe')
+        tmp2 = Tabular(right_justified=True,
+                       header_fields=["Switch",
+                                      "Ports",
+                                      "Model             ",
+                                      'SW Version       ',
+                                      "SW Image              ",
+                                      "Mode   "],
+                       label_fields=["switch_num",
+                                     "ports",
+                                     "model",
+                                     "sw_ver",
+                                     'sw_image',
+                                     'mode'],
+                       index=[0, ],
+                       table_terminal_pattern=r"(^\n|^\s*$)",
+                       device_output=out,
+                       device_os='iosxe')
 
         if not tmp2.entries:
             # table2 for IOS
-            tmp2 = genie.parsergen.oper_fill_tabular(right_justified=True,
-                                                     header_fields=["Switch",
-                                                                    "Ports",
-                                                                    "Model             ",
-                                                                    'SW Version       ',
-                                                                    "SW Image              "],
-                                                     label_fields=["switch_num",
-                                                                   "ports",
-                                                                   "model",
-                                                                   "sw_ver",
-                                                                   'sw_image'],
-                                                     index=[0, ],
-                                                     table_terminal_pattern=r"(^\n|^\s*$)",
-                                                     device_output=out,
-                                                     device_os='ios')
+            tmp2 = Tabular(right_justified=True,
+                           header_fields=["Switch",
+                                          "Ports",
+                                          "Model             ",
+                                          'SW Version       ',
+                                          "SW Image              "],
+                           label_fields=["switch_num",
+                                         "ports",
+                                         "model",
+                                         "sw_ver",
+                                         'sw_image'],
+                           index=[0, ],
+                           table_terminal_pattern=r"(^\n|^\s*$)",
+                           device_output=out,
+                           device_os='ios')
         # switch_number
         # license table for Cat3850
-        tmp = genie.parsergen.oper_fill_tabular(right_justified=True,
-                                                header_fields=["Current            ",
-                                                               "Type            ",
-                                                               "Next reboot  "],
-                                                label_fields=["license_level",
-                                                              "license_type",
-                                                              "next_reload_license_level"],
-                                                table_terminal_pattern=r"(^\n|^\s*$)",
-                                                device_output=out,
-                                                device_os='iosxe')
+        tmp = Tabular(right_justified=True,
+                      header_fields=["Current            ",
+                                     "Type            ",
+                                     "Next reboot  "],
+                      label_fields=["license_level",
+                                    "license_type",
+                                    "next_reload_license_level"],
+                      table_terminal_pattern=r"(^\n|^\s*$)",
+                      device_output=out,
+                      device_os='iosxe')
 
         if tmp.entries:
             res = tmp
@@ -3366,7 +3364,7 @@ class ShowProcessesCpuSortedSchema(MetaParser):
     }
 
 
-class ShowProcessesCpuSorted(ShowProcessesCpuSortedSchema):
+class ShowProcessesCpuSorted(ColumnarParser, ShowProcessesCpuSortedSchema):
     """Parser for show processes cpu sorted
                   show processes cpu sorted <1min|5min|5sec>
                   show processes cpu sorted | include <WORD>
@@ -3375,8 +3373,10 @@ class ShowProcessesCpuSorted(ShowProcessesCpuSortedSchema):
     cli_command = 'show processes cpu sorted'
     exclude = ['five_min_cpu', 'five_sec_cpu_total', 'nonzero_cpu_processes', 'zero_cpu_processes',
                'five_sec_cpu', 'invoked', 'one_min_cpu', 'runtime', 'usecs', 'pid', 'process', ]
+    columnar_tables = {'sort': ('sort', '{index}')}
+    columnar_cli = True
 
-    def cli(self, sort_time='', key_word='', output=None):
+    def cli(self, sort_time='', key_word='', output=None, columnar=False):
 
         assert sort_time in ['1min', '5min', '5sec', ''], "Not one from 1min 5min 5sec"
         if output is None:
@@ -3394,6 +3394,12 @@ class ShowProcessesCpuSorted(ShowProcessesCpuSortedSchema):
         zero_cpu_processes = []
         nonzero_cpu_processes = []
         index = 0
+        if columnar:
+            columnar_dict = self.columnar_result()
+            # the columns of the sort table, added at once
+            sort = {name: [] for name in (
+                'index', 'process', 'runtime', 'invoked', 'usecs', 'tty',
+                'pid', 'five_sec_cpu', 'one_min_cpu', 'five_min_cpu')}
 
         # initial regexp pattern
         p1 = re.compile(r'^CPU +utilization +for +five +seconds: +'
@@ -3421,12 +3427,20 @@ class ShowProcessesCpuSorted(ShowProcessesCpuSortedSchema):
             if m:
                 group = m.groupdict()
                 index += 1
-                sort_dict = ret_dict.setdefault('sort', {}).setdefault(index, {})
-                sort_dict['process'] = group['process']
-                sort_dict.update({k: int(v) for k, v in group.items()
-                                  if k in ['runtime', 'invoked', 'usecs', 'tty', 'pid']})
-                sort_dict.update({k: float(v) for k, v in group.items()
-                                  if k in ['five_sec_cpu', 'one_min_cpu', 'five_min_cpu']})
+                if columnar:
+                    sort['index'].append(index)
+                    sort['process'].append(group['process'])
+                    for k in ['runtime', 'invoked', 'usecs', 'tty', 'pid']:
+                        sort[k].append(int(group[k]))
+                    for k in ['five_sec_cpu', 'one_min_cpu', 'five_min_cpu']:
+                        sort[k].append(float(group[k]))
+                else:
+                    sort_dict = ret_dict.setdefault('sort', {}).setdefault(index, {})
+                    sort_dict['process'] = group['process']
+                    sort_dict.update({k: int(v) for k, v in group.items()
+                                      if k in ['runtime', 'invoked', 'usecs', 'tty', 'pid']})
+                    sort_dict.update({k: float(v) for k, v in group.items()
+                                      if k in ['five_sec_cpu', 'one_min_cpu', 'five_min_cpu']})
                 if float(group['five_sec_cpu']) or \
                    float(group['one_min_cpu']) or \
                    float(group['five_min_cpu']):
@@ -3439,6 +3453,10 @@ class ShowProcessesCpuSorted(ShowProcessesCpuSortedSchema):
                             zero_cpu_processes) if zero_cpu_processes else None
         ret_dict.setdefault('nonzero_cpu_processes',
                             nonzero_cpu_processes) if nonzero_cpu_processes else None
+        if columnar:
+            columnar_dict['sort'].extend(sort)
+            columnar_dict.extra = ret_dict
+            return columnar_dict
         return ret_dict
 
 
@@ -3645,8 +3663,8 @@ class ShowProcessesCpu(ShowProcessesCpuSorted):
 
     cli_command = 'show processes cpu'
 
-    def cli(self, key_word='', output=None):
-        return(super().cli(key_word=key_word, output=output))
+    def cli(self, key_word='', output=None, columnar=False):
+        return(super().cli(key_word=key_word, output=output, columnar=columnar))
 
 
 class ShowVersionRpSchema(MetaParser):
@@ -6234,9 +6252,8 @@ class ShowPlatformIntegrity(ShowPlatformIntegritySchema):
 
         log.info(minidom.parseString(output).toprettyxml())
 
-        root = ET.fromstring(output)
-        boot_integrity_oper_data = Common.retrieve_xml_child(root=root, key='boot-integrity-oper-data')
-        boot_integrity = Common.retrieve_xml_child(root=boot_integrity_oper_data, key='boot-integrity')
+        index = XmlIndex(ET.fromstring(output))
+        boot_integrity = index.find('boot-integrity')
         ret_dict = {}
         boot_index = 0
         name = None
@@ -2,7 +2,7 @@
 
 """
 import re
-import genie.parsergen as pg
+from genie.libs.parser.utils.tabular import Tabular
 # import parser utils
 from genie.libs.parser.utils.common import Common
 
@@ -133,11 +133,11 @@ class ShowUsers(ShowUsersSchema):
         # initial return dictionary
         ret_dict = {}
 
-        pg_result = pg.oper_fill_tabular(device_output=out, device_os='iosxe',
-                                         index=[1],
-                                         header_fields=[' ', ' Line', 'User', 'Host\(s\)', 'Idle', '  Location'],
-                                         label_fields=['busy', 'line', 'user', 'host', 'idle', 'location'],
-                                         table_terminal_pattern='Interface\s+User\s+Mode\s+Idle\s+Peer\s+Address')
+        pg_result = Tabular(device_output=out, device_os='iosxe',
+                            index=[1],
+                            header_fields=[' ', ' Line', 'User', 'Host\(s\)', 'Idle', '  Location'],
+                            label_fields=['busy', 'line', 'user', 'host', 'idle', 'location'],
+                            table_terminal_pattern='Interface\s+User\s+Mode\s+Idle\s+Peer\s+Address')
 
         # returns a dictionary
         pg_entries = pg_result.entries
@@ -218,10 +218,10 @@ class ShowUsers(ShowUsersSchema):
         # unknown      NETCONF(ONEP)      com.cisco.ne 00:00:49
         # unknown      a(ONEP)            com.cisco.sy 00:00:49
 
-        interface_result = pg.oper_fill_tabular(device_output=out,
-                                                device_os='iosxe',
-                                                index=[0,1],
-                                                header_fields=['Interface', 'User', 'Mode', 'Idle', 'Peer Address'])
+        interface_result = Tabular(device_output=out,
+                                   device_os='iosxe',
+                                   index=[0,1],
+                                   header_fields=['Interface', 'User', 'Mode', 'Idle', 'Peer Address'])
 
         interface_entries = interface_result.entries
 
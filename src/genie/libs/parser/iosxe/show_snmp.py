@@ -11,6 +11,7 @@ import re
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
+from genie.libs.parser.utils.stream import iter_lines
 
 
 # ==========================
@@ -58,7 +59,7 @@ class ShowSnmpMib(ShowSnmpMibSchema):
         # rmon.19.1
         p2 = re.compile(r'^(?P<snmp>([a-zA-Z0-9\-\.]+))$')
 
-        for line in out.splitlines():
+        for line in iter_lines(out):
             line = line.strip()
 
             # lldpLocalSystemData.1
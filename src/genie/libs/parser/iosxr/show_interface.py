@@ -33,6 +33,8 @@ from genie.metaparser.util.schemaengine import Schema, \
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.patterns import Patterns
+from genie.libs.parser.utils.parallel import parse_blocks, merge_results
 
 logger = logging.getLogger(__name__)
 
@@ -481,6 +483,167 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
         'interface_state', 'in_unknown_protos', 'last_clear', 'carrier_transitions', 'in_giants']
 
 
+    patterns = Patterns(
+        # MgmtEth0/0/CPU0/0 is administratively down, line protocol is administratively down
+        p1=r'^\s*(?P<interface>[a-zA-Z0-9\/\.\-]+) +is'
+           ' +(?P<enabled>(administratively down|down))(?:,'
+           ' +line +protocol +is +(?P<line_protocol>'
+           '(administratively down|down)))?$',
+        p1_1=r'^\s*(?P<interface>[a-zA-Z0-9\/\.\-]+) +is'
+             ' +(?P<enabled>(administratively up|up))(?:,'
+             ' +line +protocol +is +(?P<line_protocol>'
+             '(administratively up|up)))?$',
+
+        # Interface state transitions: 1
+        p2=r'^\s*Interface +state +transitions:'
+           ' +(?P<interface_state>[0-9]+)$',
+        p3=r'^\s*Hardware is (?P<types>[a-zA-Z\,\s]+)(?:'
+           ' +address +is (?P<mac_address>[a-z0-9\.]+) +\(bia'
+           ' +(?P<phys_address>[a-z0-9\.]+)\))?$',
+
+        # Hardware is VLAN sub-interface(s), address is aaaa.bbff.8888
+        p3_1=r'^\s*Hardware is (?P<types>[\w\W]+) +address'
+             ' +is +(?P<mac_address>[a-z0-9\.]+)$',
+
+        #Description: desc
+        p3_2=r'^\s*Description: +(?P<description>[\w\W]+)$',
+
+        # Internet address is 10.1.1.1/24
+        p4=r'^\s*Internet +address +is +(?P<ip>[a-z0-9\.]+)'
+           '(\/(?P<prefix_length>[0-9]+))?$',
+
+        # MTU 1500 bytes, BW 0 Kbit (Max: 1000000 Kbit)
+        # MTU 6000 bytes, BW 20000000 Kbit (Max: 20000000 Kbit)
+        p5=r'^\s*MTU +(?P<mtu>[0-9]+) +bytes, +BW'
+           ' +(?P<bandwidth>[0-9]+) +Kbit(?: *\(Max: +\d+'
+           ' +Kbit\))?$',
+
+        # reliability 255/255, txload Unknown, rxload Unknown
+        p6=r'^\s*reliability +(?P<reliability>[a-zA-Z0-9\/]+),'
+           ' +txload +(?P<txload>[a-zA-Z0-9\/]+), +rxload'
+           ' +(?P<rxload>[a-zA-Z0-9\/]+)$',
+
+        # Encapsulation 802.1Q Virtual LAN, VLAN Id 10, 2nd VLAN Id 10,
+        p7=r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
+           ' +VLAN +Id +(?P<first_dot1q>[0-9]+), +2nd +VLAN'
+           ' +Id +(?P<second_dot1q>[0-9]+),$',
+
+        # Encapsulation 802.1Q Virtual LAN, VLAN Id 20,  loopback not set,
+        p7_1=r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
+             ' +VLAN +Id +(?P<first_dot1q>[0-9]+), +loopback'
+             ' +(?P<loopback_status>[a-zA-Z\s]+),$',
+        p7_2=r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
+             ' +VLAN +Id +(?P<first_dot1q>[0-9]+), +2nd +VLAN +Id'
+             ' +(?P<second_dot1q>[0-9]+),(?: +loopback'
+             ' +(?P<loopback_status>[a-zA-Z\s]+),)?$',
+
+        # Encapsulation ARPA,
+        p7_3=r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),$',
+
+        # Encapsulation Null,  loopback not set,
+        p7_4=r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
+             ' +loopback +(?P<loopback_status>[a-zA-Z\s]+),$',
+
+        # loopback not set,
+        p7_5=r'^\s*loopback +(?P<loopback_status>[a-zA-Z\s]+),$',
+
+        # Last input never, output never
+        p8=r'^\s*Last +input +(?P<last_input>[\w\W]+),'
+           ' +output +(?P<last_output>[\w\W]+)$',
+
+        # ARP type ARPA, ARP timeout 04:00:00
+        p8_1=r'^\s*ARP +type +(?P<arp_type>\S+), +ARP +timeout'
+             ' +(?P<arp_timeout>\S+)',
+        p8_2=r'^\s*Last +link +flapped +(?P<last_link_flapped>\S+)$',
+
+        # Last clearing of "show interface" counters never
+        p8_3=r'^\s*Last +clearing +of +"show interface"'
+             ' +counters +(?P<last_clear>[\w\W]+)$',
+
+        # 5 minute input rate 0 bits/sec, 0 packets/sec
+        p9=r'^\s*(?P<load_interval>[0-9]+) +(?P<timecheck>minute|second|)'
+           ' +input +rate +(?P<in_rate>[0-9]+) +bits/sec,'
+           ' +(?P<in_rate_pkts>[0-9]+) +packets/sec$',
+
+        # Full-duplex, 1000Mb/s, unknown, link type is autonegotiation
+        # Duplex unknown, 0Kb/s, unknown, link type is autonegotiation
+        p9_1=r'^\s*(?P<duplex_mode>[\w\W]+), +(?P<port_speed>\S+)(Mb/s|Kb/s|Gb/s),'
+             ' +(?P<location>\S+), +link +type +is'
+             ' +(?P<auto_negotiate>(autonegotiation))$',
+        p9_2=r'^\s*(?P<duplex_mode>[\w\W]+), +(?P<port_speed>\S+),'
+             ' +(?P<location>\S+), +link +type +is +(?P<auto_negotiate>(force-up))$',
+
+        # output flow control is off, input flow control is off
+        p9_3=r'^\s*output +flow +control +is +(?P<flow_control_send>(off)),'
+             ' +input +flow +control +is +(?P<flow_control_receive>(off))$',
+        p9_4=r'^\s*output +flow +control +is +(?P<flow_control_send>(on)),'
+             ' +input +flow +control +is +(?P<flow_control_receive>(on))$',
+        p9_5=r'^\s*output +flow +control +is +(?P<flow_control_send>(on)),'
+             ' +input +flow +control +is +(?P<flow_control_receive>(off))$',
+        p9_6=r'^\s*output +flow +control +is +(?P<flow_control_send>(off)),'
+             ' +input +flow +control +is +(?P<flow_control_receive>(on))$',
+
+        # Carrier delay (up) is 10 msec
+        p9_7=r'^\s*Carrier +delay +\(up\) +is'
+             ' +(?P<carrier_delay>[0-9]+) +msec$',
+
+        # 5 minute output rate 0 bits/sec, 0 packets/sec
+        p10=r'^\s*(?P<load_interval>[0-9]+) +(?P<timecheck>minute|second|)'
+            ' +output +rate +(?P<out_rate>[0-9]+) +bits/sec,'
+            ' +(?P<out_rate_pkts>[0-9]+) +packets/sec$',
+
+        # 0 packets input, 0 bytes, 0 total input drops
+        p11=r'^\s*(?P<in_pkts>[0-9]+) +packets +input,'
+            ' +(?P<in_octets>[0-9]+) +bytes, +(?P<in_discards>[0-9]+)'
+            ' +total +input +drops$',
+
+        # 0 drops for unrecognized upper-level protocol
+        p12=r'^\s*(?P<in_unknown_protos>[0-9]+) +drops +for +unrecognized'
+            ' +upper-level +protocol$',
+
+        # Received 0 broadcast packets, 0 multicast packets
+        p13=r'^\s*Received +(?P<in_broadcast_pkts>[0-9]+)'
+            ' +broadcast +packets, +(?P<in_multicast_pkts>[0-9]+)'
+            ' +multicast +packets$',
+
+        # 0 runts, 0 giants, 0 throttles, 0 parity
+        p14=r'^\s*(?P<in_runts>[0-9]+) +runts, +(?P<in_giants>[0-9]+)'
+            ' +giants, +(?P<in_throttles>[0-9]+) +throttles,'
+            ' +(?P<in_parity>[0-9]+) parity$',
+
+        # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
+        p15=r'^\s*(?P<in_frame_errors>[0-9]+) +input +errors,'
+            ' +(?P<in_crc_errors>[0-9]+) +CRC,'
+            ' +(?P<in_frame>[0-9]+)'
+            ' +frame, +(?P<in_overrun>[0-9]+) +overrun,'
+            ' +(?P<in_ignored>[0-9]+) +ignored,'
+            ' +(?P<in_abort>[0-9]+) +abort$',
+
+        # 0 packets output, 0 bytes, 0 total output drops
+        p16=r'^\s*(?P<out_pkts>[0-9]+) +packets +output,'
+            ' +(?P<out_octets>[0-9]+) +bytes, +(?P<out_discards>[0-9]+)'
+            ' +total +output +drops$',
+
+        # Output 0 broadcast packets, 0 multicast packets
+        p17=r'^\s*Output +(?P<out_broadcast_pkts>[0-9]+)'
+            ' +broadcast +packets, +(?P<out_multicast_pkts>[0-9]+)'
+            ' +multicast +packets$',
+
+        # 0 output errors, 0 underruns, 0 applique, 0 resets
+        p18=r'^\s*(?P<out_errors>[0-9]+) +output +errors,'
+            ' +(?P<out_underruns>[0-9]+) +underruns,'
+            ' +(?P<out_applique>[0-9]+) +applique,'
+            ' +(?P<out_resets>[0-9]+) +resets$',
+
+        # 0 output buffer failures, 0 output buffers swapped out
+        p19=r'^\s*(?P<out_buffer_failures>[0-9]+) +output'
+            ' +buffer +failures, +(?P<out_buffer_swapped_out>[0-9]+)'
+            ' +output +buffers +swapped +out$',
+
+        # 0 carrier transitions
+        p20=r'^\s*(?P<carrier_transitions>[0-9]+) +carrier +transitions$',
+    )
+
     def cli(self, interface='', output=None):
         if output is None:
             if interface:
@@ -491,8 +654,6 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
         else:
             out = output
 
-        interface_detail_dict = {}
-
         # it's supported for NCS500 that output has non utf8 character
         if "non_utf-8_character b'" in out:
             out = out.split("non_utf-8_character b'")[1]
@@ -500,15 +661,20 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
         elif "b'" in out:
             out = out.split("b'")[1]
 
+        results = parse_blocks(self, out, '_parse_interfaces',
+                               headers=[self.patterns.p1, self.patterns.p1_1])
+        if results is not None:
+            return merge_results(results)
+        return self._parse_interfaces(out)
+
+    def _parse_interfaces(self, out):
+        interface_detail_dict = {}
         for line in out.splitlines():
             line = line.strip()
+            p = self.patterns.for_line(line)
 
             # MgmtEth0/0/CPU0/0 is administratively down, line protocol is administratively down
-            p1 = re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/\.\-]+) +is'
-                             ' +(?P<enabled>(administratively down|down))(?:,'
-                             ' +line +protocol +is +(?P<line_protocol>'
-                             '(administratively down|down)))?$')
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 interface = m.groupdict()['interface']
                 enabled = m.groupdict()['enabled']
@@ -521,11 +687,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 interface_detail_dict[interface]['enabled'] = False
                 continue
 
-            p1_1 = re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/\.\-]+) +is'
-                               ' +(?P<enabled>(administratively up|up))(?:,'
-                               ' +line +protocol +is +(?P<line_protocol>'
-                               '(administratively up|up)))?$')
-            m = p1_1.match(line)
+            m = p.p1_1.match(line)
             if m:
                 interface = m.groupdict()['interface']
                 enabled = m.groupdict()['enabled']
@@ -539,9 +701,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # Interface state transitions: 1
-            p2 = re.compile(r'^\s*Interface +state +transitions:'
-                             ' +(?P<interface_state>[0-9]+)$')
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 interface_state = int(m.groupdict()['interface_state'])
                 interface_detail_dict[interface]['interface_state'] = interface_state
@@ -550,10 +710,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
             # Hardware is Null interface
             # Hardware is Management Ethernet, address is 5254.00ff.3007 (bia 5254.00ff.3007)
 
-            p3 = re.compile(r'^\s*Hardware is (?P<types>[a-zA-Z\,\s]+)(?:'
-                             ' +address +is (?P<mac_address>[a-z0-9\.]+) +\(bia'
-                             ' +(?P<phys_address>[a-z0-9\.]+)\))?$')
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 types = m.groupdict()['types'].lower()
                 types = types.replace(",","")
@@ -570,9 +727,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # Hardware is VLAN sub-interface(s), address is aaaa.bbff.8888
-            p3_1 = re.compile(r'^\s*Hardware is (?P<types>[\w\W]+) +address'
-                               ' +is +(?P<mac_address>[a-z0-9\.]+)$')
-            m = p3_1.match(line)
+            m = p.p3_1.match(line)
             if m:
                 types = m.groupdict()['types'].lower()
                 types = types.replace(",","")
@@ -585,17 +740,14 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             #Description: desc
-            p3_2 = re.compile(r'^\s*Description: +(?P<description>[\w\W]+)$')
-            m = p3_2.match(line)
+            m = p.p3_2.match(line)
             if m:
                 interface_detail_dict[interface]['description']\
                 = str(m.groupdict()['description'])
                 continue
 
             # Internet address is 10.1.1.1/24
-            p4 = re.compile(r'^\s*Internet +address +is +(?P<ip>[a-z0-9\.]+)'
-                             '(\/(?P<prefix_length>[0-9]+))?$')
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 ip = m.groupdict()['ip']
                 prefix_length = m.groupdict()['prefix_length']
@@ -613,10 +765,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
 
             # MTU 1500 bytes, BW 0 Kbit (Max: 1000000 Kbit)
             # MTU 6000 bytes, BW 20000000 Kbit (Max: 20000000 Kbit)
-            p5 = re.compile(r'^\s*MTU +(?P<mtu>[0-9]+) +bytes, +BW'
-                             ' +(?P<bandwidth>[0-9]+) +Kbit(?: *\(Max: +\d+'
-                             ' +Kbit\))?$')
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 mtu = int(m.groupdict()['mtu'])
                 bandwidth = int(m.groupdict()['bandwidth'])
@@ -626,10 +775,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # reliability 255/255, txload Unknown, rxload Unknown
-            p6 = re.compile(r'^\s*reliability +(?P<reliability>[a-zA-Z0-9\/]+),'
-                             ' +txload +(?P<txload>[a-zA-Z0-9\/]+), +rxload'
-                             ' +(?P<rxload>[a-zA-Z0-9\/]+)$')
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 reliability = m.groupdict()['reliability']
                 txload = m.groupdict()['txload'].lower()
@@ -641,10 +787,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
             
             # Encapsulation 802.1Q Virtual LAN, VLAN Id 10, 2nd VLAN Id 10,
-            p7 = re.compile(r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
-                             ' +VLAN +Id +(?P<first_dot1q>[0-9]+), +2nd +VLAN'
-                             ' +Id +(?P<second_dot1q>[0-9]+),$')
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 encapsulation = str(m.groupdict()['encapsulation']).lower()
 
@@ -660,10 +803,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # Encapsulation 802.1Q Virtual LAN, VLAN Id 20,  loopback not set,
-            p7_1 = re.compile(r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
-                               ' +VLAN +Id +(?P<first_dot1q>[0-9]+), +loopback'
-                               ' +(?P<loopback_status>[a-zA-Z\s]+),$')
-            m = p7_1.match(line)
+            m = p.p7_1.match(line)
             if m:
                 encapsulation = str(m.groupdict()['encapsulation']).lower()
                 loopback_status = str(m.groupdict()['loopback_status'])
@@ -680,12 +820,8 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                     interface_detail_dict[interface]['loopback_status']\
                     = m.groupdict()['loopback_status']
                 continue
-            
-            p7_2 = re.compile(r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
-                               ' +VLAN +Id +(?P<first_dot1q>[0-9]+), +2nd +VLAN +Id'
-                               ' +(?P<second_dot1q>[0-9]+),(?: +loopback'
-                               ' +(?P<loopback_status>[a-zA-Z\s]+),)?$')
-            m = p7_2.match(line)
+
+            m = p.p7_2.match(line)
             if m:
                 encapsulation = str(m.groupdict()['encapsulation']).lower()
                 loopback_status = str(m.groupdict()['loopback_status'])
@@ -706,8 +842,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # Encapsulation ARPA,
-            p7_3 = re.compile(r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),$')
-            m = p7_3.match(line)
+            m = p.p7_3.match(line)
             if m:
                 encapsulation = str(m.groupdict()['encapsulation']).lower()
 
@@ -719,9 +854,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # Encapsulation Null,  loopback not set,
-            p7_4 = re.compile(r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
-                               ' +loopback +(?P<loopback_status>[a-zA-Z\s]+),$')
-            m = p7_4.match(line)
+            m = p.p7_4.match(line)
             if m:
                 encapsulation = str(m.groupdict()['encapsulation']).lower()
                 loopback_status = str(m.groupdict()['loopback_status'])
@@ -739,8 +872,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # loopback not set,
-            p7_5 = re.compile(r'^\s*loopback +(?P<loopback_status>[a-zA-Z\s]+),$')
-            m = p7_5.match(line)
+            m = p.p7_5.match(line)
             if m:
                 loopback_status = str(m.groupdict()['loopback_status'])
 
@@ -750,9 +882,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # Last input never, output never
-            p8 = re.compile(r'^\s*Last +input +(?P<last_input>[\w\W]+),'
-                             ' +output +(?P<last_output>[\w\W]+)$')
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 interface_detail_dict[interface]['last_input']\
                  = m.groupdict()['last_input']
@@ -761,9 +891,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # ARP type ARPA, ARP timeout 04:00:00
-            p8_1 = re.compile(r'^\s*ARP +type +(?P<arp_type>\S+), +ARP +timeout'
-                               ' +(?P<arp_timeout>\S+)')
-            m = p8_1.match(line)
+            m = p.p8_1.match(line)
             if m:
                 arp_type = str(m.groupdict()['arp_type']).lower()
 
@@ -773,26 +901,20 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                  = m.groupdict()['arp_timeout']
                 continue
 
-            p8_2 = re.compile(r'^\s*Last +link +flapped +(?P<last_link_flapped>\S+)$')
-            m = p8_2.match(line)
+            m = p.p8_2.match(line)
             if m:
                 interface_detail_dict[interface]['last_link_flapped']\
                  = m.groupdict()['last_link_flapped']
                 continue
 
             # Last clearing of "show interface" counters never
-            p8_3 = re.compile(r'^\s*Last +clearing +of +"show interface"'
-                               ' +counters +(?P<last_clear>[\w\W]+)$')
-            m = p8_3.match(line)
+            m = p.p8_3.match(line)
             if m:
                 last_clear = str(m.groupdict()['last_clear'])
                 continue
 
             # 5 minute input rate 0 bits/sec, 0 packets/sec
-            p9 = re.compile(r'^\s*(?P<load_interval>[0-9]+) +(?P<timecheck>minute|second|)'
-                             ' +input +rate +(?P<in_rate>[0-9]+) +bits/sec,'
-                             ' +(?P<in_rate_pkts>[0-9]+) +packets/sec$')
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 load_interval = int(m.groupdict()['load_interval'])
                 in_rate = int(m.groupdict()['in_rate'])
@@ -819,10 +941,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
 
             # Full-duplex, 1000Mb/s, unknown, link type is autonegotiation
             # Duplex unknown, 0Kb/s, unknown, link type is autonegotiation
-            p9_1 = re.compile(r'^\s*(?P<duplex_mode>[\w\W]+), +(?P<port_speed>\S+)(Mb/s|Kb/s|Gb/s),'
-                               ' +(?P<location>\S+), +link +type +is'
-                               ' +(?P<auto_negotiate>(autonegotiation))$')
-            m = p9_1.match(line)
+            m = p.p9_1.match(line)
             if m:
                 auto_negotiate = m.groupdict()['auto_negotiate']
                 duplex_mode = str(m.groupdict()['duplex_mode']).lower()
@@ -834,9 +953,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 interface_detail_dict[interface]['auto_negotiate'] = True
                 continue
 
-            p9_2 = re.compile(r'^\s*(?P<duplex_mode>[\w\W]+), +(?P<port_speed>\S+),'
-                               ' +(?P<location>\S+), +link +type +is +(?P<auto_negotiate>(force-up))$')
-            m = p9_2.match(line)
+            m = p.p9_2.match(line)
             if m:
                 auto_negotiate = m.groupdict()['auto_negotiate']
                 duplex_mode = str(m.groupdict()['duplex_mode']).lower()
@@ -849,9 +966,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # output flow control is off, input flow control is off
-            p9_3 = re.compile(r'^\s*output +flow +control +is +(?P<flow_control_send>(off)),'
-                               ' +input +flow +control +is +(?P<flow_control_receive>(off))$')
-            m = p9_3.match(line)
+            m = p.p9_3.match(line)
             if m:
                 flow_control_send = m.groupdict()['flow_control_send']
                 flow_control_receive = m.groupdict()['flow_control_receive']
@@ -863,9 +978,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 interface_detail_dict[interface]['flow_control']['flow_control_receive'] = False
                 continue
 
-            p9_4 = re.compile(r'^\s*output +flow +control +is +(?P<flow_control_send>(on)),'
-                               ' +input +flow +control +is +(?P<flow_control_receive>(on))$')
-            m = p9_4.match(line)
+            m = p.p9_4.match(line)
             if m:
                 flow_control_send = m.groupdict()['flow_control_send']
                 flow_control_receive = m.groupdict()['flow_control_receive']
@@ -877,9 +990,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 interface_detail_dict[interface]['flow_control']['flow_control_receive'] = True
                 continue
 
-            p9_5 = re.compile(r'^\s*output +flow +control +is +(?P<flow_control_send>(on)),'
-                               ' +input +flow +control +is +(?P<flow_control_receive>(off))$')
-            m = p9_5.match(line)
+            m = p.p9_5.match(line)
             if m:
                 flow_control_send = m.groupdict()['flow_control_send']
                 flow_control_receive = m.groupdict()['flow_control_receive']
@@ -891,9 +1002,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 interface_detail_dict[interface]['flow_control']['flow_control_receive'] = False
                 continue
 
-            p9_6 = re.compile(r'^\s*output +flow +control +is +(?P<flow_control_send>(off)),'
-                               ' +input +flow +control +is +(?P<flow_control_receive>(on))$')
-            m = p9_6.match(line)
+            m = p.p9_6.match(line)
             if m:
                 flow_control_send = m.groupdict()['flow_control_send']
                 flow_control_receive = m.groupdict()['flow_control_receive']
@@ -906,9 +1015,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # Carrier delay (up) is 10 msec
-            p9_7 = re.compile(r'^\s*Carrier +delay +\(up\) +is'
-                               ' +(?P<carrier_delay>[0-9]+) +msec$')
-            m = p9_7.match(line)
+            m = p.p9_7.match(line)
             if m:
                 carrier_delay = m.groupdict()['carrier_delay']
 
@@ -916,10 +1023,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # 5 minute output rate 0 bits/sec, 0 packets/sec
-            p10 = re.compile(r'^\s*(?P<load_interval>[0-9]+) +(?P<timecheck>minute|second|)'
-                              ' +output +rate +(?P<out_rate>[0-9]+) +bits/sec,'
-                              ' +(?P<out_rate_pkts>[0-9]+) +packets/sec$')
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 load_interval = int(m.groupdict()['load_interval'])
                 out_rate = int(m.groupdict()['out_rate'])
@@ -943,10 +1047,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # 0 packets input, 0 bytes, 0 total input drops
-            p11 = re.compile(r'^\s*(?P<in_pkts>[0-9]+) +packets +input,'
-                              ' +(?P<in_octets>[0-9]+) +bytes, +(?P<in_discards>[0-9]+)'
-                              ' +total +input +drops$')
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 in_pkts = int(m.groupdict()['in_pkts'])
                 in_octets = int(m.groupdict()['in_octets'])
@@ -961,19 +1062,14 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # 0 drops for unrecognized upper-level protocol
-            p12 = re.compile(r'^\s*(?P<in_unknown_protos>[0-9]+) +drops +for +unrecognized'
-                              ' +upper-level +protocol$')
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 interface_detail_dict[interface]['counters']\
                 ['in_unknown_protos'] = int(m.groupdict()['in_unknown_protos'])
                 continue
 
             # Received 0 broadcast packets, 0 multicast packets
-            p13 = re.compile(r'^\s*Received +(?P<in_broadcast_pkts>[0-9]+)'
-                              ' +broadcast +packets, +(?P<in_multicast_pkts>[0-9]+)'
-                              ' +multicast +packets$')
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 interface_detail_dict[interface]['counters']\
                 ['in_broadcast_pkts'] = int(m.groupdict()['in_broadcast_pkts'])
@@ -982,10 +1078,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # 0 runts, 0 giants, 0 throttles, 0 parity
-            p14 = re.compile(r'^\s*(?P<in_runts>[0-9]+) +runts, +(?P<in_giants>[0-9]+)'
-                              ' +giants, +(?P<in_throttles>[0-9]+) +throttles,'
-                              ' +(?P<in_parity>[0-9]+) parity$')
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 interface_detail_dict[interface]['counters']\
                 ['in_runts'] = int(m.groupdict()['in_runts'])
@@ -998,13 +1091,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
-            p15 = re.compile(r'^\s*(?P<in_frame_errors>[0-9]+) +input +errors,'
-                              ' +(?P<in_crc_errors>[0-9]+) +CRC,'
-                              ' +(?P<in_frame>[0-9]+)'
-                              ' +frame, +(?P<in_overrun>[0-9]+) +overrun,'
-                              ' +(?P<in_ignored>[0-9]+) +ignored,'
-                              ' +(?P<in_abort>[0-9]+) +abort$')
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 interface_detail_dict[interface]['counters']\
                 ['in_frame_errors'] = int(m.groupdict()['in_frame_errors'])
@@ -1021,10 +1108,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # 0 packets output, 0 bytes, 0 total output drops 
-            p16 = re.compile(r'^\s*(?P<out_pkts>[0-9]+) +packets +output,'
-                              ' +(?P<out_octets>[0-9]+) +bytes, +(?P<out_discards>[0-9]+)'
-                              ' +total +output +drops$')
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 interface_detail_dict[interface].setdefault('counters', {})
                 interface_detail_dict[interface]['counters']\
@@ -1036,10 +1120,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
     
             # Output 0 broadcast packets, 0 multicast packets
-            p17 = re.compile(r'^\s*Output +(?P<out_broadcast_pkts>[0-9]+)'
-                              ' +broadcast +packets, +(?P<out_multicast_pkts>[0-9]+)'
-                              ' +multicast +packets$')
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 interface_detail_dict[interface]['counters']\
                 ['out_broadcast_pkts'] = int(m.groupdict()['out_broadcast_pkts'])
@@ -1048,11 +1129,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # 0 output errors, 0 underruns, 0 applique, 0 resets
-            p18 = re.compile(r'^\s*(?P<out_errors>[0-9]+) +output +errors,'
-                              ' +(?P<out_underruns>[0-9]+) +underruns,'
-                              ' +(?P<out_applique>[0-9]+) +applique,'
-                              ' +(?P<out_resets>[0-9]+) +resets$')
-            m = p18.match(line)
+            m = p.p18.match(line)
             if m:
                 interface_detail_dict[interface]['counters']\
                 ['out_errors'] = int(m.groupdict()['out_errors'])
@@ -1065,10 +1142,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # 0 output buffer failures, 0 output buffers swapped out
-            p19 = re.compile(r'^\s*(?P<out_buffer_failures>[0-9]+) +output'
-                              ' +buffer +failures, +(?P<out_buffer_swapped_out>[0-9]+)'
-                              ' +output +buffers +swapped +out$')
-            m = p19.match(line)
+            m = p.p19.match(line)
             if m:
                 interface_detail_dict[interface]['counters']\
                 ['out_buffer_failures'] = int(m.groupdict()['out_buffer_failures'])
@@ -1077,8 +1151,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # 0 carrier transitions
-            p20 = re.compile(r'^\s*(?P<carrier_transitions>[0-9]+) +carrier +transitions$')
-            m = p20.match(line)
+            m = p.p20.match(line)
             if m:
                 interface_detail_dict[interface]['counters']\
                 ['carrier_transitions'] = int(m.groupdict()['carrier_transitions'])
@@ -1222,6 +1295,71 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
     cli_command = ['show ipv4 vrf {vrf} interface {interface}',
                    'show ipv4 vrf {vrf} interface', 'show ipv4 vrf all interface']
 
+    patterns = Patterns(
+        # GigabitEthernet0/0/0/0 is Shutdown, ipv4 protocol is Down
+        p1=r'^\s*(?P<interface>\S+) +is (?P<int_status>\S+),'
+           ' +ipv4 +protocol +is +(?P<oper_status>[a-zA-Z]+)$',
+
+        # Vrf is VRF1 (vrfid 0x60000002)
+        p2=r'^\s*Vrf +is +(?P<vrf>\S+) \(vrfid +(?P<vrf_id>[a-z0-9]+)\)$',
+
+        # Interface is unnumbered.  Using address of Loopback11 (10.69.111.111/32)
+        p2_1=r'^\s*Interface is unnumbered. +Using +address'
+             ' +of +(?P<unnumbered_intf_ref>\S+)'
+             ' +\((?P<ip>[0-9\.]+)\/(?P<prefix_length>[0-9]+)\)$',
+
+        # Internet address is 10.1.1.1/24 with route-tag 50
+        p3=r'^\s*Internet +address +is +(?P<ip>[0-9\.]+)\/'
+           '(?P<prefix_length>[0-9]+)(?: +with +route-tag'
+           ' +(?P<route_tag>[0-9]+))?$',
+
+        # Secondary address 10.2.2.2/24
+        p4=r'^\s*(?P<secondary>(Secondary)) +address'
+           ' +(?P<ip>[0-9\.]+)\/(?P<prefix_length>[0-9]+)(?:'
+           ' +with +route-tag +(?P<route_tag>[0-9]+))?$',
+
+        # MTU is 1600 (1586 is available to IP)
+        p5=r'^\s*MTU is +(?P<mtu>[0-9]+)'
+           ' +\((?P<mtu_available>[0-9]+) +is +available +to'
+           ' +IP\)$',
+
+        # Helper address is not set
+        p6=r'^\s*Helper +address +is +(?P<helper_address>[a-z\s]+)$',
+
+        # Multicast reserved groups joined: 224.0.0.2 224.0.0.1 224.0.0.2
+        p6_1=r'^\s*Multicast +reserved +groups +joined: +(?P<multicast_groups_address>[a-z0-9\.\s]+)$',
+
+        # 224.0.0.5 224.0.0.6
+        p6_2=r'^\s*(?P<multicast_groups_address>[a-z0-9\.\s]+)$',
+
+        # Directed broadcast forwarding is disabled
+        p7=r'^\s*Directed +broadcast +forwarding +is'
+           ' +(?P<broadcast_forwarding>[a-zA-Z]+)$',
+
+        # Outgoing access list is not set
+        p8=r'^\s*Outgoing +access +list +is'
+           ' +(?P<out_access_list>[a-zA-Z\s]+)$',
+
+        # Inbound  access list is not set
+        p9=r'^\s*Inbound +access +list +is'
+           ' +(?P<in_access_list>[a-zA-Z\s]+)$',
+
+        # Inbound  common access list is not set, access list is not set
+        p9_1=r'^\s*Inbound +common +access +list +is'
+             ' +(?P<in_common_access_list>[a-zA-Z\s]+), '
+             '+access +list +is +(?P<in_access_list>[a-zA-Z\s]+)$',
+
+        # Proxy ARP is disabled
+        p10=r'^\s*Proxy +ARP +is +(?P<proxy_arp>[a-zA-Z]+)$',
+
+        # ICMP redirects are never sent
+        p11=r'^\s*ICMP +redirects +(are|is) +(?P<icmp_redirects>[a-zA-Z\s]+)$',
+
+        # ICMP unreachables are always sent
+        p12=r'^\s*ICMP +unreachables +(are|is)'
+            ' +(?P<icmp_unreachables>[a-zA-Z\s]+)$',
+    )
+
     def cli(self, interface='', vrf='', output=None):
         if output is None:
             if vrf:
@@ -1239,11 +1377,10 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
 
         for line in out.splitlines():
             line = line.rstrip()
+            p = self.patterns.for_line(line)
 
             # GigabitEthernet0/0/0/0 is Shutdown, ipv4 protocol is Down
-            p1 = re.compile(r'^\s*(?P<interface>\S+) +is (?P<int_status>\S+),'
-                             ' +ipv4 +protocol +is +(?P<oper_status>[a-zA-Z]+)$')
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 interface = m.groupdict()['interface']
                 int_status = m.groupdict()['int_status'].lower()
@@ -1259,8 +1396,7 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                 continue
 
             # Vrf is VRF1 (vrfid 0x60000002)
-            p2 = re.compile(r'^\s*Vrf +is +(?P<vrf>\S+) \(vrfid +(?P<vrf_id>[a-z0-9]+)\)$')
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 vrf = str(m.groupdict()['vrf'])
                 vrf_id = str(m.groupdict()['vrf_id'])
@@ -1270,10 +1406,7 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                 continue
 
             # Interface is unnumbered.  Using address of Loopback11 (10.69.111.111/32)
-            p2_1 = re.compile(r'^\s*Interface is unnumbered. +Using +address'
-                               ' +of +(?P<unnumbered_intf_ref>\S+)'
-                               ' +\((?P<ip>[0-9\.]+)\/(?P<prefix_length>[0-9]+)\)$')
-            m = p2_1.match(line)
+            m = p.p2_1.match(line)
             if m:
                 unnumbered_intf_ref = m.groupdict()['unnumbered_intf_ref']
                 ip = m.groupdict()['ip']
@@ -1302,10 +1435,7 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                 continue
 
             # Internet address is 10.1.1.1/24 with route-tag 50
-            p3 = re.compile(r'^\s*Internet +address +is +(?P<ip>[0-9\.]+)\/'
-                             '(?P<prefix_length>[0-9]+)(?: +with +route-tag'
-                             ' +(?P<route_tag>[0-9]+))?$')
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 ip = m.groupdict()['ip']
                 prefix_length = str(m.groupdict()['prefix_length'])
@@ -1326,10 +1456,7 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                 continue
 
             # Secondary address 10.2.2.2/24
-            p4 = re.compile(r'^\s*(?P<secondary>(Secondary)) +address'
-                             ' +(?P<ip>[0-9\.]+)\/(?P<prefix_length>[0-9]+)(?:'
-                             ' +with +route-tag +(?P<route_tag>[0-9]+))?$')
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 ip = m.groupdict()['ip']
                 prefix_length = str(m.groupdict()['prefix_length'])
@@ -1353,10 +1480,7 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                 continue
 
             # MTU is 1600 (1586 is available to IP)
-            p5 = re.compile(r'^\s*MTU is +(?P<mtu>[0-9]+)'
-                             ' +\((?P<mtu_available>[0-9]+) +is +available +to'
-                             ' +IP\)$')
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 mtu = m.groupdict()['mtu']
                 mtu_available = m.groupdict()['mtu_available']
@@ -1370,8 +1494,7 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                 continue
 
             # Helper address is not set
-            p6 = re.compile(r'^\s*Helper +address +is +(?P<helper_address>[a-z\s]+)$')
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 helper_address = str(m.groupdict()['helper_address'])
 
@@ -1381,8 +1504,7 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                 continue
 
             # Multicast reserved groups joined: 224.0.0.2 224.0.0.1 224.0.0.2
-            p6_1 = re.compile(r'^\s*Multicast +reserved +groups +joined: +(?P<multicast_groups_address>[a-z0-9\.\s]+)$')
-            m = p6_1.match(line)
+            m = p.p6_1.match(line)
             if m:
                 multicast_groups_address = str(m.groupdict()['multicast_groups_address'])
 
@@ -1397,8 +1519,7 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                 continue
 
             # 224.0.0.5 224.0.0.6
-            p6_2 = re.compile(r'^\s*(?P<multicast_groups_address>[a-z0-9\.\s]+)$')
-            m = p6_2.match(line)
+            m = p.p6_2.match(line)
             if m:
                 multicast_groups_address = str(m.groupdict()['multicast_groups_address'])
 
@@ -1413,9 +1534,7 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                 continue
 
             # Directed broadcast forwarding is disabled
-            p7 = re.compile(r'^\s*Directed +broadcast +forwarding +is'
-                             ' +(?P<broadcast_forwarding>[a-zA-Z]+)$')
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 broadcast_forwarding = str(m.groupdict()['broadcast_forwarding'])
 
@@ -1424,9 +1543,7 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                 continue
 
             # Outgoing access list is not set
-            p8 = re.compile(r'^\s*Outgoing +access +list +is'
-                             ' +(?P<out_access_list>[a-zA-Z\s]+)$')
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 out_access_list = str(m.groupdict()['out_access_list'])
 
@@ -1436,9 +1553,7 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                 continue
 
             # Inbound  access list is not set
-            p9 = re.compile(r'^\s*Inbound +access +list +is'
-                             ' +(?P<in_access_list>[a-zA-Z\s]+)$')
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 in_access_list = str(m.groupdict()['in_access_list'])
 
@@ -1448,10 +1563,7 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                 continue
 
             # Inbound  common access list is not set, access list is not set
-            p9_1 = re.compile(r'^\s*Inbound +common +access +list +is'
-                               ' +(?P<in_common_access_list>[a-zA-Z\s]+), '
-                               '+access +list +is +(?P<in_access_list>[a-zA-Z\s]+)$')
-            m = p9_1.match(line)
+            m = p.p9_1.match(line)
             if m:
                 in_common_access_list = str(m.groupdict()['in_common_access_list'])
                 in_access_list = str(m.groupdict()['in_access_list'])
@@ -1466,8 +1578,7 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                 continue
 
             # Proxy ARP is disabled
-            p10 = re.compile(r'^\s*Proxy +ARP +is +(?P<proxy_arp>[a-zA-Z]+)$')
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 proxy_arp = str(m.groupdict()['proxy_arp'])
 
@@ -1475,8 +1586,7 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                 continue
 
             # ICMP redirects are never sent
-            p11 = re.compile(r'^\s*ICMP +redirects +(are|is) +(?P<icmp_redirects>[a-zA-Z\s]+)$')
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 icmp_redirects = str(m.groupdict()['icmp_redirects'])
 
@@ -1484,9 +1594,7 @@ class ShowIpv4VrfAllInterface(ShowIpv4VrfAllInterfaceSchema):
                 continue
 
             # ICMP unreachables are always sent
-            p12 = re.compile(r'^\s*ICMP +unreachables +(are|is)'
-                              ' +(?P<icmp_unreachables>[a-zA-Z\s]+)$')
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 icmp_unreachables = str(m.groupdict()['icmp_unreachables'])
 
@@ -1578,6 +1686,144 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
     exclude = ['complete_protocol_adj', 'complete_glean_adj', 'ipv6_groups', 'ipv6_link_local']
 
 
+    patterns = Patterns(
+        # show ipv6 vrf {vrf} interface {interface}
+        # show ipv6 vrf {vrf} interface', 'show ipv6 vrf all interface
+        p1=r'^show +[\S\s]+$',
+
+        # GigabitEthernet0/0/0/0 is Shutdown, ipv6 protocol is Down, Vrfid is VRF1 (0x60000002)
+        # nve100 is Up, ipv6 protocol is Unknown, Vrfid is default (0x60000000)
+        p1_1=r'^\s*(?P<interface>\S+) +is +(?P<int_status>[a-zA-Z]+),'
+             ' +ipv6 +protocol +is +(?P<oper_status>[a-zA-Z]+),'
+             ' +Vrfid +is +(?P<vrf>\S+) +\((?P<vrf_id>[a-z0-9]+)\)$',
+
+        # IPv6 is enabled, link-local address is fe80::a8aa:bbff:feff:8888 [TENTATIVE]
+        p2=r'^\s*(?P<enabled>(IPv6 is enabled)), +link-local'
+           ' +address +is +(?P<ipv6_link_local>[a-zA-Z0-9\:]+)'
+           ' +\[(?P<ipv6_link_local_state>[A-Z]+)\]$',
+
+        # IPv6 is enabled, link-local address is fe80::a8aa:bbff:feff:8888
+        p2_1=r'^\s*(?P<enabled>(IPv6 is enabled)), +link-local'
+             ' +address +is +(?P<ipv6_link_local>[a-zA-Z0-9\:]+)$',
+
+        # IPv6 is disabled, link-local address unassigned
+        p2_2=r'^\s*(?P<enabled>(IPv6 is disabled)),'
+             ' +link-local +address +(?P<ipv6_link_local>[a-zA-Z]+)$',
+
+        # Global unicast address(es):
+        # 2001:db8:3:3:a8aa:bbff:feff:8888, subnet is 2001:db8:3:3::/64 [TENTATIVE]
+        p3=r'^\s*(?P<ipv6>(.+)(ff:fe)(.+)), +subnet +is'
+           ' +(?P<ipv6_subnet>[a-zA-Z0-9\:]+)\/(?P<ipv6_prefix_length>[0-9]+)'
+           ' +\[(?P<ipv6_status>[A-Z]+)\](?: +with +route-tag'
+           ' +(?P<ipv6_route_tag>[0-9]+))?$',
+
+        # Global unicast address(es):
+        # 2001:db8:4:4::4, subnet is 2001:db8:4:4::/64 [TENTATIVE] with route-tag 10
+        p3_1=r'^\s*(?P<ipv6>[a-zA-Z0-9\:]+), +subnet +is'
+             ' +(?P<ipv6_subnet>[a-zA-Z0-9\:]+)\/'
+             '(?P<ipv6_prefix_length>[0-9]+)'
+             ' +\[(?P<ipv6_status>[A-Z]+)\] +with +route-tag'
+             ' +(?P<ipv6_route_tag>[0-9]+)$',
+
+        # Global unicast address(es):
+        # 2001:db8:1:1::1, subnet is 2001:db8:1:1::/64 [TENTATIVE]
+        p3_2=r'^\s*(?P<ipv6>[a-zA-Z0-9\:]+), +subnet +is'
+             ' +(?P<ipv6_subnet>[a-zA-Z0-9\:]+)\/'
+             '(?P<ipv6_prefix_length>[0-9]+)'
+             ' +\[(?P<ipv6_status>[A-Z]+)\]?$',
+
+        # Global unicast address(es):
+        # 2001:db8:1:1::1, subnet is 2001:db8:1:1::/64
+        p3_3=r'^\s*(?P<ipv6>[a-zA-Z0-9\:]+), +subnet +is'
+             ' +(?P<ipv6_subnet>[a-zA-Z0-9\:]+)\/'
+             '(?P<ipv6_prefix_length>[0-9]+)$',
+
+        # Joined group address(es): ff02::1:ff00:1 ff02::1:ffa6:78c5 ff02::2
+        #ff02::1
+        p4=r'^\s*Joined +group +address\(es\): +(?P<ipv6_group_address>[a-z0-9\:\s]+)$',
+        p4_1=r'^\s*(?P<ipv6_group_address>[a-z0-9\:\s]+)$',
+
+        # MTU is 1600 (1586 is available to IPv6)
+        p5=r'^\s*MTU +is +(?P<ipv6_mtu>[0-9]+)'
+           ' +\((?P<ipv6_mtu_available>[0-9]+) +is +available'
+           ' +to +IPv6\)$',
+
+        # ICMP redirects are disabled
+        p6=r'^\s*ICMP +redirects +are +(?P<icmp_redirects>[a-z]+)$',
+
+        # ICMP unreachables are enabled
+        p7=r'^\s*ICMP +unreachables +are'
+           ' +(?P<icmp_unreachables>[a-z]+)$',
+
+        # ND DAD is enabled, number of DAD attempts 1
+        p8=r'^\s*ND +DAD +is +(?P<nd_dad>[a-z]+), +number +of +DAD'
+           ' +attempts +(?P<dad_attempts>[0-9]+)$',
+
+        # ND reachable time is 0 milliseconds
+        p9=r'^\s*ND +reachable +time +is'
+           ' +(?P<nd_reachable_time>[0-9]+) +milliseconds$',
+
+        # ND cache entry limit is 1000000000
+        p10=r'^\s*ND +cache +entry +limit +is'
+            ' +(?P<nd_cache_limit>[0-9]+)$',
+
+        # ND advertised retransmit interval is 0 milliseconds
+        p11=r'^\s*ND +advertised +retransmit +interval +is'
+            ' +(?P<nd_adv_retrans_int>[0-9]+) +milliseconds$',
+
+        # ND router advertisements are sent every 160 to 240 seconds
+        p11_1=r'^\s*ND +router +advertisements +are +sent'
+              ' +every +(?P<nd_adv_duration>[a-z0-9\s]+) +seconds$',
+
+        # ND router advertisements live for 1800 seconds
+        p11_2=r'^\s*ND +router +advertisements +live +for'
+              ' +(?P<nd_router_adv>[0-9]+) +seconds$',
+
+        # Hosts use stateless autoconfig for addresses.
+        p12=r'^\s*Hosts +use +(?P<stateless_autoconfig>(stateless))'
+            ' +autoconfig +for +addresses.$',
+
+        # Outgoing access list is not set
+        p13=r'^\s*Outgoing +access +list +is'
+            ' +(?P<out_access_list>[a-zA-Z\s]+)$',
+
+        # Inbound  access list is not set
+        p14=r'^\s*Inbound +access +list +is'
+            ' +(?P<in_access_list>[a-zA-Z\s]+)$',
+
+        # Inbound  common access list is not set, access list is not set
+        p14_1=r'^\s*Inbound +common +access +list +is'
+              ' +(?P<in_common_access_list>[a-zA-Z\s]+),'
+              ' +access +list +is +(?P<in_access_list>[a-zA-Z\s]+)$',
+
+        # Table Id is 0xe0800011
+        p15=r'^\s*Table +Id +is +(?P<table_id>[a-z0-9]+)$',
+
+        # Complete protocol adjacency: 0
+        p16=r'^\s*Complete +protocol +adjacency:'
+            ' +(?P<complete_protocol_adj>[0-9]+)$',
+
+        #Complete glean adjacency: 0
+        p17=r'^\s*Complete +glean +adjacency:'
+            ' +(?P<complete_glean_adj>[0-9]+)$',
+
+        # Incomplete protocol adjacency: 0
+        p18=r'^\s*Incomplete +protocol +adjacency:'
+            ' +(?P<incomplete_protocol_adj>[0-9]+)$',
+
+        # Incomplete glean adjacency: 0
+        p19=r'^\s*Incomplete +glean +adjacency:'
+            ' +(?P<incomplete_glean_adj>[0-9]+)$',
+
+        # Dropped protocol request: 0
+        p20=r'^\s*Dropped +protocol +request:'
+            ' +(?P<dropped_protocol_req>[0-9]+)$',
+
+        # Dropped glean request: 0
+        p21=r'^\s*Dropped +glean +request:'
+            ' +(?P<dropped_glean_req>[0-9]+)$',
+    )
+
     def cli(self, interface='', vrf='', output=None):
         if output is None:
             if vrf:
@@ -1595,20 +1841,17 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
 
         for line in out.splitlines():
             line = line.strip()
+            p = self.patterns.for_line(line)
             
             # show ipv6 vrf {vrf} interface {interface}
             # show ipv6 vrf {vrf} interface', 'show ipv6 vrf all interface
-            p1 = re.compile(r'^show +[\S\s]+$')
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 continue
             
             # GigabitEthernet0/0/0/0 is Shutdown, ipv6 protocol is Down, Vrfid is VRF1 (0x60000002)
             # nve100 is Up, ipv6 protocol is Unknown, Vrfid is default (0x60000000)
-            p1_1 = re.compile(r'^\s*(?P<interface>\S+) +is +(?P<int_status>[a-zA-Z]+),'
-                             ' +ipv6 +protocol +is +(?P<oper_status>[a-zA-Z]+),'
-                             ' +Vrfid +is +(?P<vrf>\S+) +\((?P<vrf_id>[a-z0-9]+)\)$')
-            m = p1_1.match(line)
+            m = p.p1_1.match(line)
             if m:
                 interface = m.groupdict()['interface']
                 int_status = m.groupdict()['int_status'].lower()
@@ -1634,10 +1877,7 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
 
             # IPv6 is enabled, link-local address is fe80::a8aa:bbff:feff:8888 [TENTATIVE]
-            p2 = re.compile(r'^\s*(?P<enabled>(IPv6 is enabled)), +link-local'
-                             ' +address +is +(?P<ipv6_link_local>[a-zA-Z0-9\:]+)'
-                             ' +\[(?P<ipv6_link_local_state>[A-Z]+)\]$')
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 enabled = bool(m.groupdict()['enabled'])
                 ipv6_link_local = m.groupdict()['ipv6_link_local']
@@ -1647,9 +1887,7 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
 
             # IPv6 is enabled, link-local address is fe80::a8aa:bbff:feff:8888
-            p2_1 = re.compile(r'^\s*(?P<enabled>(IPv6 is enabled)), +link-local'
-                               ' +address +is +(?P<ipv6_link_local>[a-zA-Z0-9\:]+)$')
-            m = p2_1.match(line)
+            m = p.p2_1.match(line)
             if m:
                 enabled = bool(m.groupdict()['enabled'])
                 ipv6_link_local = m.groupdict()['ipv6_link_local']
@@ -1657,9 +1895,7 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
 
             # IPv6 is disabled, link-local address unassigned
-            p2_2 = re.compile(r'^\s*(?P<enabled>(IPv6 is disabled)),'
-                               ' +link-local +address +(?P<ipv6_link_local>[a-zA-Z]+)$')
-            m = p2_2.match(line)
+            m = p.p2_2.match(line)
             if m:
                 enabled = bool(m.groupdict()['enabled'])
                 ipv6_link_local = m.groupdict()['ipv6_link_local']
@@ -1668,11 +1904,7 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
 
             # Global unicast address(es):
             # 2001:db8:3:3:a8aa:bbff:feff:8888, subnet is 2001:db8:3:3::/64 [TENTATIVE]
-            p3 = re.compile(r'^\s*(?P<ipv6>(.+)(ff:fe)(.+)), +subnet +is'
-                             ' +(?P<ipv6_subnet>[a-zA-Z0-9\:]+)\/(?P<ipv6_prefix_length>[0-9]+)'
-                             ' +\[(?P<ipv6_status>[A-Z]+)\](?: +with +route-tag'
-                             ' +(?P<ipv6_route_tag>[0-9]+))?$')
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 ipv6 = m.groupdict()['ipv6']
                 ipv6_subnet = m.groupdict()['ipv6_subnet']
@@ -1711,12 +1943,7 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
 
             # Global unicast address(es):
             # 2001:db8:4:4::4, subnet is 2001:db8:4:4::/64 [TENTATIVE] with route-tag 10
-            p3_1 = re.compile(r'^\s*(?P<ipv6>[a-zA-Z0-9\:]+), +subnet +is'
-                               ' +(?P<ipv6_subnet>[a-zA-Z0-9\:]+)\/'
-                               '(?P<ipv6_prefix_length>[0-9]+)'
-                               ' +\[(?P<ipv6_status>[A-Z]+)\] +with +route-tag'
-                               ' +(?P<ipv6_route_tag>[0-9]+)$')
-            m = p3_1.match(line)
+            m = p.p3_1.match(line)
             if m:
                 ipv6 = m.groupdict()['ipv6']
                 ipv6_subnet = m.groupdict()['ipv6_subnet']
@@ -1752,11 +1979,7 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
 
             # Global unicast address(es):
             # 2001:db8:1:1::1, subnet is 2001:db8:1:1::/64 [TENTATIVE]
-            p3_2 = re.compile(r'^\s*(?P<ipv6>[a-zA-Z0-9\:]+), +subnet +is'
-                               ' +(?P<ipv6_subnet>[a-zA-Z0-9\:]+)\/'
-                               '(?P<ipv6_prefix_length>[0-9]+)'
-                               ' +\[(?P<ipv6_status>[A-Z]+)\]?$')
-            m = p3_2.match(line)
+            m = p.p3_2.match(line)
             if m:
                 ipv6 = m.groupdict()['ipv6']
                 ipv6_subnet = m.groupdict()['ipv6_subnet']
@@ -1789,10 +2012,7 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
 
             # Global unicast address(es):
             # 2001:db8:1:1::1, subnet is 2001:db8:1:1::/64
-            p3_3 = re.compile(r'^\s*(?P<ipv6>[a-zA-Z0-9\:]+), +subnet +is'
-                               ' +(?P<ipv6_subnet>[a-zA-Z0-9\:]+)\/'
-                               '(?P<ipv6_prefix_length>[0-9]+)$')
-            m = p3_3.match(line)
+            m = p.p3_3.match(line)
             if m:
                 ipv6 = m.groupdict()['ipv6']
                 ipv6_subnet = m.groupdict()['ipv6_subnet']
@@ -1820,8 +2040,7 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
 
             # Joined group address(es): ff02::1:ff00:1 ff02::1:ffa6:78c5 ff02::2
             #ff02::1
-            p4 = re.compile(r'^\s*Joined +group +address\(es\): +(?P<ipv6_group_address>[a-z0-9\:\s]+)$')
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 ipv6_group_address = str(m.groupdict()['ipv6_group_address'])
 
@@ -1836,8 +2055,7 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 ipv6_vrf_all_interface_dict[interface]['ipv6']['ipv6_groups'] = ipv6_groups
                 continue
 
-            p4_1 = re.compile(r'^\s*(?P<ipv6_group_address>[a-z0-9\:\s]+)$')
-            m = p4_1.match(line)
+            m = p.p4_1.match(line)
             if m:
                 ipv6_group_address = str(m.groupdict()['ipv6_group_address'])
 
@@ -1852,10 +2070,7 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
 
             # MTU is 1600 (1586 is available to IPv6)
-            p5 = re.compile(r'^\s*MTU +is +(?P<ipv6_mtu>[0-9]+)'
-                             ' +\((?P<ipv6_mtu_available>[0-9]+) +is +available'
-                             ' +to +IPv6\)$')
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 ipv6_mtu = m.groupdict()['ipv6_mtu']
                 ipv6_mtu_available = m.groupdict()['ipv6_mtu_available']
@@ -1867,8 +2082,7 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
 
             # ICMP redirects are disabled
-            p6 = re.compile(r'^\s*ICMP +redirects +are +(?P<icmp_redirects>[a-z]+)$')
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 icmp_redirects = m.groupdict()['icmp_redirects']
 
@@ -1877,9 +2091,7 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
 
             # ICMP unreachables are enabled
-            p7 = re.compile(r'^\s*ICMP +unreachables +are'
-                             ' +(?P<icmp_unreachables>[a-z]+)$')
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 icmp_unreachables = m.groupdict()['icmp_unreachables']
 
@@ -1888,9 +2100,7 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
 
             # ND DAD is enabled, number of DAD attempts 1
-            p8 = re.compile(r'^\s*ND +DAD +is +(?P<nd_dad>[a-z]+), +number +of +DAD'
-                             ' +attempts +(?P<dad_attempts>[0-9]+)$')
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 nd_dad = m.groupdict()['nd_dad']
                 dad_attempts = m.groupdict()['dad_attempts']
@@ -1902,9 +2112,7 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
 
             # ND reachable time is 0 milliseconds
-            p9 = re.compile(r'^\s*ND +reachable +time +is'
-                             ' +(?P<nd_reachable_time>[0-9]+) +milliseconds$')
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 nd_reachable_time = m.groupdict()['nd_reachable_time']
 
@@ -1913,9 +2121,7 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
 
             # ND cache entry limit is 1000000000
-            p10 = re.compile(r'^\s*ND +cache +entry +limit +is'
-                              ' +(?P<nd_cache_limit>[0-9]+)$')
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 nd_cache_limit = m.groupdict()['nd_cache_limit']
 
@@ -1924,9 +2130,7 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
 
             # ND advertised retransmit interval is 0 milliseconds
-            p11 = re.compile(r'^\s*ND +advertised +retransmit +interval +is'
-                              ' +(?P<nd_adv_retrans_int>[0-9]+) +milliseconds$')
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 nd_adv_retrans_int = m.groupdict()['nd_adv_retrans_int']
 
@@ -1935,9 +2139,7 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
 
             # ND router advertisements are sent every 160 to 240 seconds
-            p11_1 = re.compile(r'^\s*ND +router +advertisements +are +sent'
-                                ' +every +(?P<nd_adv_duration>[a-z0-9\s]+) +seconds$')
-            m = p11_1.match(line)
+            m = p.p11_1.match(line)
             if m:
                 nd_adv_duration = m.groupdict()['nd_adv_duration']
                 nd_adv_duration = nd_adv_duration.replace(" ","")
@@ -1948,9 +2150,7 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
 
             # ND router advertisements live for 1800 seconds
-            p11_2 = re.compile(r'^\s*ND +router +advertisements +live +for'
-                                ' +(?P<nd_router_adv>[0-9]+) +seconds$')
-            m = p11_2.match(line)
+            m = p.p11_2.match(line)
             if m:
                 nd_router_adv = m.groupdict()['nd_router_adv']
                 ipv6_vrf_all_interface_dict[interface]['ipv6']['nd_router_adv']\
@@ -1958,9 +2158,7 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
 
             # Hosts use stateless autoconfig for addresses.
-            p12 = re.compile(r'^\s*Hosts +use +(?P<stateless_autoconfig>(stateless))'
-                              ' +autoconfig +for +addresses.$')
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 stateless_autoconfig = m.groupdict()['stateless_autoconfig']
 
@@ -1969,9 +2167,7 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
 
             # Outgoing access list is not set
-            p13 = re.compile(r'^\s*Outgoing +access +list +is'
-                              ' +(?P<out_access_list>[a-zA-Z\s]+)$')
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 out_access_list = m.groupdict()['out_access_list']
 
@@ -1981,9 +2177,7 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
 
             # Inbound  access list is not set
-            p14 = re.compile(r'^\s*Inbound +access +list +is'
-                              ' +(?P<in_access_list>[a-zA-Z\s]+)$')
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 in_access_list = m.groupdict()['in_access_list']
 
@@ -1992,10 +2186,7 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
 
             # Inbound  common access list is not set, access list is not set
-            p14_1 = re.compile(r'^\s*Inbound +common +access +list +is'
-                                ' +(?P<in_common_access_list>[a-zA-Z\s]+),'
-                                ' +access +list +is +(?P<in_access_list>[a-zA-Z\s]+)$')
-            m = p14_1.match(line)
+            m = p.p14_1.match(line)
             if m:
                 in_common_access_list = m.groupdict()['in_common_access_list']
                 in_access_list = m.groupdict()['in_access_list']
@@ -2008,8 +2199,7 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
 
             # Table Id is 0xe0800011
-            p15 = re.compile(r'^\s*Table +Id +is +(?P<table_id>[a-z0-9]+)$')
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 table_id = m.groupdict()['table_id']
 
@@ -2018,9 +2208,7 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
 
             # Complete protocol adjacency: 0
-            p16 = re.compile(r'^\s*Complete +protocol +adjacency:'
-                              ' +(?P<complete_protocol_adj>[0-9]+)$')
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 complete_protocol_adj = m.groupdict()['complete_protocol_adj']
 
@@ -2029,9 +2217,7 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
             
             #Complete glean adjacency: 0
-            p17 = re.compile(r'^\s*Complete +glean +adjacency:'
-                              ' +(?P<complete_glean_adj>[0-9]+)$')
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 complete_glean_adj = m.groupdict()['complete_glean_adj']
 
@@ -2040,9 +2226,7 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
 
             # Incomplete protocol adjacency: 0
-            p18 = re.compile(r'^\s*Incomplete +protocol +adjacency:'
-                              ' +(?P<incomplete_protocol_adj>[0-9]+)$')
-            m = p18.match(line)
+            m = p.p18.match(line)
             if m:
                 incomplete_protocol_adj = m.groupdict()['incomplete_protocol_adj']
 
@@ -2051,9 +2235,7 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
 
             # Incomplete glean adjacency: 0
-            p19 = re.compile(r'^\s*Incomplete +glean +adjacency:'
-                              ' +(?P<incomplete_glean_adj>[0-9]+)$')
-            m = p19.match(line)
+            m = p.p19.match(line)
             if m:
                 incomplete_glean_adj = m.groupdict()['incomplete_glean_adj']
 
@@ -2062,9 +2244,7 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
 
             # Dropped protocol request: 0
-            p20 = re.compile(r'^\s*Dropped +protocol +request:'
-                              ' +(?P<dropped_protocol_req>[0-9]+)$')
-            m = p20.match(line)
+            m = p.p20.match(line)
             if m:
                 dropped_protocol_req = m.groupdict()['dropped_protocol_req']
 
@@ -2073,9 +2253,7 @@ class ShowIpv6VrfAllInterface(ShowIpv6VrfAllInterfaceSchema):
                 continue
 
             # Dropped glean request: 0
-            p21 = re.compile(r'^\s*Dropped +glean +request:'
-                              ' +(?P<dropped_glean_req>[0-9]+)$')
-            m = p21.match(line)
+            m = p.p21.match(line)
             if m:
                 dropped_glean_req = m.groupdict()['dropped_glean_req']
 
@@ -2376,194 +2554,197 @@ class ShowInterfaces(ShowInterfacesSchema):
     exclude = []
 
 
-    def cli(self, interface="", output=None):
-        if output is None:
-            if interface:
-                cmd = self.cli_command[1].format(interface=interface)
-            else:
-                cmd = self.cli_command[0]
-            out = self.device.execute(cmd)
-        else:
-            out = output
-
-        result_dict = {}
-
-        # GigabitEthernet1 is up, line protocol is up 
+    patterns = Patterns(
+        # GigabitEthernet1 is up, line protocol is up
         # TenGigE0/0/0/4 is administratively down, line protocol is administratively down
-        p1 = re.compile(r'^(?P<interface>\S+) +is +(?P<enabled>[\w\s]+), '
-                         '+line +protocol +is +(?P<line_protocol>[\w\s]+)$')
+        p1=r'^(?P<interface>\S+) +is +(?P<enabled>[\w\s]+), '
+           '+line +protocol +is +(?P<line_protocol>[\w\s]+)$',
 
-        # Interface state transitions: 9 
-        p2 = re.compile(r'^Interface +state +transitions: +(?P<interface_state_transitions>[\d]+)$')
+        # Interface state transitions: 9
+        p2=r'^Interface +state +transitions: +(?P<interface_state_transitions>[\d]+)$',
 
         # Hardware is Loopback
         # Hardware is Gigabit Ethernet, address is 0057.d2ff.428c (bia 0057.d2ff.428c)
-        p3 = re.compile(r'^Hardware +is +(?P<type>[\w\-\/\s\+\(\)]+)'
-                         '(, *address +is +(?P<mac_address>[\w\.]+))?'
-                         '( *\(bia *(?P<phys_address>[\w\.]+)\))?$')
+        p3=r'^Hardware +is +(?P<type>[\w\-\/\s\+\(\)]+)'
+           '(, *address +is +(?P<mac_address>[\w\.]+))?'
+           '( *\(bia *(?P<phys_address>[\w\.]+)\))?$',
 
         # Layer 2 Transport Mode
-        p4 = re.compile(r'^Layer +2 +Transport +Mode$')
+        p4=r'^Layer +2 +Transport +Mode$',
 
         # Description: to-ML26-BE1
-        p5 = re.compile(r'^Description: *(?P<description>.*)$')
+        p5=r'^Description: *(?P<description>.*)$',
 
         # Internet address is 10.4.4.4/24
         # Internet address is Unknown
-        p6 = re.compile(r'^Internet +[A|a]ddress +is +(?P<ipv4>(?P<ip>[\d\.]+)'
-                         '\/(?P<prefix_length>[\d]+))?(?P<unknown>Unknown)?$')
+        p6=r'^Internet +[A|a]ddress +is +(?P<ipv4>(?P<ip>[\d\.]+)'
+           '\/(?P<prefix_length>[\d]+))?(?P<unknown>Unknown)?$',
 
         # MTU 1500 bytes, BW 10000 Kbit
         # MTU 1518 bytes, BW 10000000 Kbit (Max: 10000000 Kbit)
-        p7 = re.compile(r'^MTU +(?P<mtu>[\d]+) +bytes, +BW +(?P<bandwidth>[\d]+) +Kbit'
-                         '(.*Max: +(?P<bandwidth_max>[\d]+).*)?$')
+        p7=r'^MTU +(?P<mtu>[\d]+) +bytes, +BW +(?P<bandwidth>[\d]+) +Kbit'
+           '(.*Max: +(?P<bandwidth_max>[\d]+).*)?$',
 
         # reliability 255/255, txload 1/255, rxload 1/255
         # reliability Unknown, txload Unknown, rxload Unknown
-        p8 = re.compile(r'^reliability +(?P<reliability>[\w\/]+), '
-                         '+txload +(?P<txload>[\w\/]+), +rxload '
-                         '+(?P<rxload>[\w\/]+)$')
+        p8=r'^reliability +(?P<reliability>[\w\/]+), '
+           '+txload +(?P<txload>[\w\/]+), +rxload '
+           '+(?P<rxload>[\w\/]+)$',
 
         # Encapsulation ARPA,
         # Encapsulation 802.1Q Virtual LAN,
         # Encapsulation ARPA,  loopback not set,
         # Encapsulation 802.1Q Virtual LAN, VLAN Id 10,  loopback not set,
         # Encapsulation 802.1Q Virtual LAN, VLAN Id 10, 2nd VLAN Id 10,
-        p9 = re.compile(r'^Encapsulation +(?P<encapsulation>[\w\.\s]+),'
-                         '( +VLAN +Id +(?P<first_dot1q>\d+),)?'
-                         '( +2nd +VLAN +Id +(?P<second_dot1q>\d+),)?'
-                         '( +loopback +(?P<loopback>[\w\s]+),)?$')
+        p9=r'^Encapsulation +(?P<encapsulation>[\w\.\s]+),'
+           '( +VLAN +Id +(?P<first_dot1q>\d+),)?'
+           '( +2nd +VLAN +Id +(?P<second_dot1q>\d+),)?'
+           '( +loopback +(?P<loopback>[\w\s]+),)?$',
 
         # Outer Match: Dot1Q VLAN 300
-        p10 = re.compile(r'^Outer +Match: +(?P<outer_match>[\w\s]+)$')
+        p10=r'^Outer +Match: +(?P<outer_match>[\w\s]+)$',
 
         # Ethertype Any, MAC Match src any, dest any
-        p11 = re.compile(r'^Ethertype +(?P<ethertype>\w+), '
-                           '+MAC +Match +(?P<mac_match>[\w\s]+), '
-                           '+dest +(?P<dest>\w+)$')
+        p11=r'^Ethertype +(?P<ethertype>\w+), '
+            '+MAC +Match +(?P<mac_match>[\w\s]+), '
+            '+dest +(?P<dest>\w+)$',
 
         # Full-duplex, 0Kb/s
         # Full-duplex, 1000Mb/s, link type is force-up
         # Full-duplex, Auto Speed, SR, link type is force-up
         # Duplex unknown, 0Kb/s, THD, link type is autonegotiation
-        p12 = re.compile(r'^(?P<duplex_mode>[\w\s\-]+([d|D]uplex|unknown)), '
-                          '+(?P<port_speed>[\w\s\/]+)(, +(?P<media_type>\S+))?'
-                          '(, +link +type +is +(?P<link_type>\S+))?$')
+        p12=r'^(?P<duplex_mode>[\w\s\-]+([d|D]uplex|unknown)), '
+            '+(?P<port_speed>[\w\s\/]+)(, +(?P<media_type>\S+))?'
+            '(, +link +type +is +(?P<link_type>\S+))?$',
 
         # output flow control is off, input flow control is off
         # output flow control is off, input flow control is unsupported
-        p13 = re.compile(r'^output +flow +control +is +(?P<send>\w+), +'
-                          'input +flow +control +is +(?P<receive>\w+)$')
+        p13=r'^output +flow +control +is +(?P<send>\w+), +'
+            'input +flow +control +is +(?P<receive>\w+)$',
 
         # Carrier delay (up) is 10 msec
         # Carrier delay (up) is 10 msec, Carrier delay (down) is 60 msec
-        p14 = re.compile(r'^Carrier +delay +\(up\) +is +(?P<carrier_delay_up>\d+) +msec'
-                '(, +Carrier +delay +\(down\) +is +(?P<carrier_delay_down>\d+) +msec)?$')
+        p14=r'^Carrier +delay +\(up\) +is +(?P<carrier_delay_up>\d+) +msec'
+            '(, +Carrier +delay +\(down\) +is +(?P<carrier_delay_down>\d+) +msec)?$',
 
         # loopback not set,
-        p15 = re.compile(r'^loopback +(?P<loopback>[\w\s]+),$')
+        p15=r'^loopback +(?P<loopback>[\w\s]+),$',
 
         # Last link flapped 5w6d
-        p16 = re.compile(r'^Last +link +flapped +(?P<last_link_flapped>\S+)$')
+        p16=r'^Last +link +flapped +(?P<last_link_flapped>\S+)$',
 
         # ARP type ARPA, ARP timeout 04:00:00
-        p17 = re.compile(r'^ARP +type +(?P<arp_type>\w+), +'
-                          'ARP +timeout +(?P<arp_timeout>[\w\:\.]+)$')
+        p17=r'^ARP +type +(?P<arp_type>\w+), +'
+            'ARP +timeout +(?P<arp_timeout>[\w\:\.]+)$',
 
         # Last input never, output 00:01:05
-        p18 = re.compile(r'^Last +input +(?P<last_input>[\w\.\:]+), +'
-                          'output +(?P<last_output>[\w\.\:]+)$')
+        p18=r'^Last +input +(?P<last_input>[\w\.\:]+), +'
+            'output +(?P<last_output>[\w\.\:]+)$',
 
         # No. of members in this bundle: 1
-        p19 = re.compile(r'^No\. +of +members +in +this +bundle: +(?P<member_count>\d+)$')
+        p19=r'^No\. +of +members +in +this +bundle: +(?P<member_count>\d+)$',
 
         # TenGigE0/0/0/1               Full-duplex  10000Mb/s    Active
-        p20 = re.compile(r'^(?P<interface>[\w\/\.]+) '
-                          '+(?P<duplex_mode>[\w\-\s]+([d|D]uplex|unknown)) '
-                          '+(?P<speed>[\w\/\s]+?) +(?P<state>\w+)$')
+        p20=r'^(?P<interface>[\w\/\.]+) '
+            '+(?P<duplex_mode>[\w\-\s]+([d|D]uplex|unknown)) '
+            '+(?P<speed>[\w\/\s]+?) +(?P<state>\w+)$',
 
         # Last clearing of "show interface" counters 1d02h
-        p21 = re.compile(r'^Last +clearing +of +"show +interface" +counters +'
-                          '(?P<last_clear>[\w\:\.]+)$')
+        p21=r'^Last +clearing +of +"show +interface" +counters +'
+            '(?P<last_clear>[\w\:\.]+)$',
 
         # Input/output data rate is disabled.
-        p22 = re.compile(r'^Input\/output +data +rate +is +disabled\.$')
+        p22=r'^Input\/output +data +rate +is +disabled\.$',
 
         # 5 minute input rate 0 bits/sec, 0 packets/sec
-        p23 = re.compile(r'^(?P<load_interval>[\d\#]+)'
-                          ' *(?P<unit>(minute|second|minutes|seconds)) +input +rate'
-                          ' +(?P<in_rate>[\d]+) +bits/sec,'
-                          ' +(?P<in_rate_pkts>[\d]+) +packets/sec$')
+        p23=r'^(?P<load_interval>[\d\#]+)'
+            ' *(?P<unit>(minute|second|minutes|seconds)) +input +rate'
+            ' +(?P<in_rate>[\d]+) +bits/sec,'
+            ' +(?P<in_rate_pkts>[\d]+) +packets/sec$',
 
         # 5 minute output rate 0 bits/sec, 0 packets/sec
-        p24 = re.compile(r'^(?P<load_interval>[\d\#]+)'
-                          ' *(minute|second|minutes|seconds) +output +rate'
-                          ' +(?P<out_rate>[\d]+) +bits/sec,'
-                          ' +(?P<out_rate_pkts>[\d]+) +packets/sec$')
+        p24=r'^(?P<load_interval>[\d\#]+)'
+            ' *(minute|second|minutes|seconds) +output +rate'
+            ' +(?P<out_rate>[\d]+) +bits/sec,'
+            ' +(?P<out_rate_pkts>[\d]+) +packets/sec$',
 
         # 0 packets input, 0 bytes
         # 0 packets input, 0 bytes, 0 total input drops
-        p25 = re.compile(r'^(?P<in_pkts>[\d]+) +packets +input, +(?P<in_octets>[\d]+) +bytes'
-                          '(, +(?P<in_total_drops>[\d]+) +total +input +drops)?$')
+        p25=r'^(?P<in_pkts>[\d]+) +packets +input, +(?P<in_octets>[\d]+) +bytes'
+            '(, +(?P<in_total_drops>[\d]+) +total +input +drops)?$',
 
         # 1258859 drops for unrecognized upper-level protocol
-        p26 = re.compile(r'(?P<in_unknown_protos>[\d]+) +drops +for '
-                          '+unrecognized +upper-level +protocol$')
+        p26=r'(?P<in_unknown_protos>[\d]+) +drops +for '
+            '+unrecognized +upper-level +protocol$',
 
         # 0 input drops, 0 queue drops, 0 input errors
-        p27 = re.compile(r'(?P<in_drops>[\d]+) +input +drops, '
-                          '+(?P<in_queue_drops>[\d]+) +queue +drops, '
-                          '+(?P<in_errors>[\d]+) +input +errors$')
+        p27=r'(?P<in_drops>[\d]+) +input +drops, '
+            '+(?P<in_queue_drops>[\d]+) +queue +drops, '
+            '+(?P<in_errors>[\d]+) +input +errors$',
 
         # Received 0 broadcast packets, 0 multicast packets
-        p28 = re.compile(r'^Received +(?P<in_broadcast_pkts>\d+) +broadcast +packets, '
-                          '+(?P<in_multicast_pkts>\d+) +multicast +packets$')
+        p28=r'^Received +(?P<in_broadcast_pkts>\d+) +broadcast +packets, '
+            '+(?P<in_multicast_pkts>\d+) +multicast +packets$',
 
         # 0 runts, 0 giants, 0 throttles, 0 parity
-        p29 = re.compile(r'^(?P<in_runts>[\d]+) +runts, +(?P<in_giants>[\d]+) +giants, '
-                          '+(?P<in_throttles>[\d]+) +throttles, +(?P<in_parity>[\d]+) +parity$')
+        p29=r'^(?P<in_runts>[\d]+) +runts, +(?P<in_giants>[\d]+) +giants, '
+            '+(?P<in_throttles>[\d]+) +throttles, +(?P<in_parity>[\d]+) +parity$',
 
         # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
-        p30 = re.compile(r'^(?P<in_errors>[\d]+) +input +errors, +'
-                          '(?P<in_crc_errors>[\d]+) +CRC, +'
-                          '(?P<in_frame>[\d]+) +frame, +'
-                          '(?P<in_overrun>[\d]+) +overrun, +'
-                          '(?P<in_ignored>[\d]+) +ignored, +'
-                          '(?P<in_abort>[\d]+) +abort$')
+        p30=r'^(?P<in_errors>[\d]+) +input +errors, +'
+            '(?P<in_crc_errors>[\d]+) +CRC, +'
+            '(?P<in_frame>[\d]+) +frame, +'
+            '(?P<in_overrun>[\d]+) +overrun, +'
+            '(?P<in_ignored>[\d]+) +ignored, +'
+            '(?P<in_abort>[\d]+) +abort$',
 
         # 0 packets output, 0 bytes
         # 0 packets output, 0 bytes, 0 total output drops
-        p31 = re.compile(r'^(?P<out_pkts>[\d]+) +packets +output, +(?P<out_octets>[\d]+) +bytes'
-                          '(, +(?P<out_total_drops>[\d]+) +total +output +drops)?$')
+        p31=r'^(?P<out_pkts>[\d]+) +packets +output, +(?P<out_octets>[\d]+) +bytes'
+            '(, +(?P<out_total_drops>[\d]+) +total +output +drops)?$',
 
         # Output 0 broadcast packets, 178045 multicast packets
-        p32 = re.compile(r'^Output +(?P<out_broadcast_pkts>\d+) +broadcast +packets, '
-                          '+(?P<out_multicast_pkts>\d+) +multicast +packets$')
-        
+        p32=r'^Output +(?P<out_broadcast_pkts>\d+) +broadcast +packets, '
+            '+(?P<out_multicast_pkts>\d+) +multicast +packets$',
+
         # 0 output errors, 0 underruns, 0 applique, 0 resets
-        p33 = re.compile(r'^(?P<out_errors>[\d]+) +output +errors, '
-                          '+(?P<out_underruns>[\d]+) +underruns, '
-                          '+(?P<out_applique>[\d]+) +applique, '
-                          '+(?P<out_resets>[\d]+) +resets$')
+        p33=r'^(?P<out_errors>[\d]+) +output +errors, '
+            '+(?P<out_underruns>[\d]+) +underruns, '
+            '+(?P<out_applique>[\d]+) +applique, '
+            '+(?P<out_resets>[\d]+) +resets$',
 
         # 0 output drops, 0 queue drops, 0 output errors
-        p34 = re.compile(r'(?P<out_drops>[\d]+) +output +drops, '
-                          '+(?P<out_queue_drops>[\d]+) +queue +drops, '
-                          '+(?P<out_errors>[\d]+) +output +errors$')
+        p34=r'(?P<out_drops>[\d]+) +output +drops, '
+            '+(?P<out_queue_drops>[\d]+) +queue +drops, '
+            '+(?P<out_errors>[\d]+) +output +errors$',
 
         # 0 output buffer failures, 0 output buffers swapped out
-        p35 = re.compile(r'^(?P<out_buffer_failure>[\d]+) +output +buffer +failures, '
-                          '+(?P<out_buffers_swapped>[\d]+) +output +buffers +swapped +out$')
+        p35=r'^(?P<out_buffer_failure>[\d]+) +output +buffer +failures, '
+            '+(?P<out_buffers_swapped>[\d]+) +output +buffers +swapped +out$',
 
         # 0 carrier transitions
-        p36 = re.compile(r'^(?P<carrier_transitions>[\d]+) +carrier +transitions$')
+        p36=r'^(?P<carrier_transitions>[\d]+) +carrier +transitions$',
+    )
+
+    def cli(self, interface="", output=None):
+        if output is None:
+            if interface:
+                cmd = self.cli_command[1].format(interface=interface)
+            else:
+                cmd = self.cli_command[0]
+            out = self.device.execute(cmd)
+        else:
+            out = output
+
+        result_dict = {}
 
         for line in out.splitlines():
             line = line.strip()
+            p = self.patterns.for_line(line)
 
             # GigabitEthernet1 is up, line protocol is up
             # TenGigE0/0/0/4 is administratively down, line protocol is administratively down
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 interface = group['interface']
@@ -2582,7 +2763,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Interface state transitions: 9
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 interface_state_transitions = int(m.groupdict()['interface_state_transitions'])
                 intf_dict['interface_state_transitions'] = interface_state_transitions
@@ -2590,7 +2771,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Hardware is Loopback
             # Hardware is Gigabit Ethernet, address is 0057.d2ff.428c (bia 0057.d2ff.428c)
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 types = m.groupdict()['type']
                 mac_address = m.groupdict()['mac_address']
@@ -2603,13 +2784,13 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Layer 2 Transport Mode
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 intf_dict['layer2'] = True
                 continue
 
             # Description: desc
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 description = m.groupdict()['description']
                 intf_dict['description'] = description
@@ -2617,7 +2798,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Internet Address is 10.4.4.4/24
             # Internet address is Unknown
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 ipv4 = m.groupdict()['ipv4']
                 ip = m.groupdict()['ip']
@@ -2632,7 +2813,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # MTU 1500 bytes, BW 10000 Kbit
             # MTU 1518 bytes, BW 10000000 Kbit (Max: 10000000 Kbit)
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 mtu = m.groupdict()['mtu']
                 bandwidth = m.groupdict()['bandwidth']
@@ -2645,7 +2826,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # reliability 255/255, txload 1/255, rxload 1/255
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 reliability = m.groupdict()['reliability']
                 txload = m.groupdict()['txload']
@@ -2659,7 +2840,7 @@ class ShowInterfaces(ShowInterfacesSchema):
             # Encapsulation ARPA,
             # Encapsulation 802.1Q Virtual LAN, Vlan ID 1, loopback not set
             # Encapsulation 802.1Q Virtual LAN, VLAN Id 10, 2nd VLAN Id 10,
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 group = m.groupdict()
                 encapsulation = group['encapsulation'].lower()
@@ -2682,14 +2863,14 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Outer Match: Dot1Q VLAN 300
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 outer_match = m.groupdict()['outer_match']
                 encap_dict['outer_match'] = outer_match
                 continue
 
             # Ethertype Any, MAC Match src any, dest any
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 group = m.groupdict()
                 ethertype = group['ethertype']
@@ -2705,7 +2886,7 @@ class ShowInterfaces(ShowInterfacesSchema):
             # Full-duplex, 1000Mb/s, link type is force-up
             # Full-duplex, Auto Speed, SR, link type is force-up
             # Duplex unknown, 0Kb/s, THD, link type is autonegotiation
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 group = m.groupdict()
                 duplex_mode = group['duplex_mode'].lower()
@@ -2727,7 +2908,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # output flow control is off, input flow control is off
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 receive = m.groupdict()['receive'].lower()
                 send = m.groupdict()['send'].lower()
@@ -2746,7 +2927,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Carrier delay (up) is 10 msec
             # Carrier delay (up) is 10 msec, Carrier delay (down) is 60 msec
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 group = m.groupdict()
                 carrier_delay_up = group['carrier_delay_up']
@@ -2759,14 +2940,14 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # loopback not set,
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 loopback = m.groupdict()['loopback']
                 intf_dict['loopback'] = loopback
                 continue
 
             # Last link flapped 5w6d
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 last_link_flapped = m.groupdict()['last_link_flapped']
                 intf_dict['last_link_flapped'] = last_link_flapped
@@ -2774,7 +2955,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
 
             # ARP type ARPA, ARP timeout 04:00:00
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 arp_type = m.groupdict()['arp_type'].lower()
                 arp_timeout = m.groupdict()['arp_timeout']
@@ -2783,7 +2964,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Last input never, output 00:01:05
-            m = p18.match(line)
+            m = p.p18.match(line)
             if m:
                 last_input = m.groupdict()['last_input']
                 last_output = m.groupdict()['last_output']
@@ -2792,14 +2973,14 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # No. of members in this bundle: 1
-            m = p19.match(line)
+            m = p.p19.match(line)
             if m:
                 port_dict = intf_dict.setdefault('port_channel', {})
                 port_dict['member_count'] = int(m.groupdict()['member_count'])
                 continue
 
             # TenGigE0/0/0/1               Full-duplex  10000Mb/s    Active
-            m = p20.match(line)
+            m = p.p20.match(line)
             if m:
                 group = m.groupdict()
                 interface = group['interface']
@@ -2815,7 +2996,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Last clearing of "show interface" counters 1d02h
-            m = p21.match(line)
+            m = p.p21.match(line)
             if m:
                 last_clear = m.groupdict()['last_clear']
                 counter_dict = intf_dict.setdefault('counters', {})
@@ -2823,7 +3004,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 5 minute input rate 0 bits/sec, 0 packets/sec
-            m = p23.match(line)
+            m = p.p23.match(line)
             if m:
                 group = m.groupdict()
                 load_interval = int(group['load_interval'])
@@ -2842,7 +3023,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 5 minute output rate 0 bits/sec, 0 packets/sec
-            m = p24.match(line)
+            m = p.p24.match(line)
             if m:
                 group = m.groupdict()
                 out_rate = int(group['out_rate'])
@@ -2855,7 +3036,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # 0 packets input, 0 bytes
             # 0 packets input, 0 bytes, 0 total input drops
-            m = p25.match(line)
+            m = p.p25.match(line)
             if m:
                 group = m.groupdict()
                 counter_dict = intf_dict.setdefault('counters', {})
@@ -2865,34 +3046,34 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 1258859 drops for unrecognized upper-level protocol
-            m = p26.match(line)
+            m = p.p26.match(line)
             if m:
                 counter_dict['in_unknown_protos'] = int(m.groupdict()['in_unknown_protos'])
                 continue
 
             # 0 input drops, 0 queue drops, 0 input errors
-            m = p27.match(line)
+            m = p.p27.match(line)
             if m:
                 group = m.groupdict()
                 counter_dict.update({k: int(v) for k, v in group.items()})
                 continue
 
             # Received 0 broadcast packets, 0 multicast packets
-            m = p28.match(line)
+            m = p.p28.match(line)
             if m:
                 group = m.groupdict()
                 counter_dict.update({k: int(v) for k, v in group.items()})
                 continue
 
             # 0 runts, 0 giants, 0 throttles, 0 parity
-            m = p29.match(line)
+            m = p.p29.match(line)
             if m:
                 group = m.groupdict()
                 counter_dict.update({k: int(v) for k, v in group.items()})
                 continue
 
             # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
-            m = p30.match(line)
+            m = p.p30.match(line)
             if m:
                 group = m.groupdict()
                 counter_dict.update({k: int(v) for k, v in group.items()})
@@ -2900,7 +3081,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # 0 packets output, 0 bytes
             # 0 packets output, 0 bytes, 0 total output drops
-            m = p31.match(line)
+            m = p.p31.match(line)
             if m:
                 group = m.groupdict()
                 for k, v in group.items():
@@ -2909,7 +3090,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Output 0 broadcast packets, 178045 multicast packets
-            m = p32.match(line)
+            m = p.p32.match(line)
             if m:
                 group = m.groupdict()
                 counter_dict.update({k: int(v) for k, v in group.items()})
@@ -2917,28 +3098,28 @@ class ShowInterfaces(ShowInterfacesSchema):
 
 
             # 0 output errors, 0 underruns, 0 applique, 0 resets
-            m = p33.match(line)
+            m = p.p33.match(line)
             if m:
                 group = m.groupdict()
                 counter_dict.update({k: int(v) for k, v in group.items()})
                 continue
 
             # 0 output drops, 0 queue drops, 0 output errors
-            m = p34.match(line)
+            m = p.p34.match(line)
             if m:
                 group = m.groupdict()
                 counter_dict.update({k: int(v) for k, v in group.items()})
                 continue
 
             # 0 output buffer failures, 0 output buffers swapped out
-            m = p35.match(line)
+            m = p.p35.match(line)
             if m:
                 group = m.groupdict()
                 counter_dict.update({k: int(v) for k, v in group.items()})
                 continue
 
             # 0 carrier transitions
-            m = p36.match(line)
+            m = p.p36.match(line)
             if m:
                 group = m.groupdict()
                 counter_dict.update({k: int(v) for k, v in group.items()})
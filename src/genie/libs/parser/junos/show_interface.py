@@ -21,6 +21,21 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional, Use, Or
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.structured import (StructuredParser, TEXT, FLAG,
+                                                OneOrMany)
+
+# input and output counters of the traffic statistics blocks, as the
+# structured_mapping of ShowInterfaces declares them
+TRANSIT_STATISTICS = {
+    "input-bps": TEXT,
+    "input-bytes": TEXT,
+    "input-packets": TEXT,
+    "input-pps": TEXT,
+    "output-bps": TEXT,
+    "output-bytes": TEXT,
+    "output-packets": TEXT,
+    "output-pps": TEXT
+}
 
 
 # =======================================================
@@ -823,9 +838,294 @@ class ShowInterfacesSchema(MetaParser):
         }
     }
 
-class ShowInterfaces(ShowInterfacesSchema):
+class ShowInterfaces(StructuredParser, ShowInterfacesSchema):
     cli_command = ['show interfaces', 'show interfaces {interface}']
 
+    # part of '| display xml' and '| display json' kept by xml() and
+    # json()
+    structured_mapping = {
+        "interface-information": {
+            "@junos:style": TEXT,
+            "physical-interface": [{
+                "down-hold-time": TEXT,
+                "up-hold-time": TEXT,
+                "statistics-cleared": TEXT,
+                "active-alarms": {
+                    "interface-alarms": {
+                        "alarm-not-present": FLAG,
+                        "ethernet-alarm-link-down": FLAG
+                    }
+                },
+                "active-defects": {
+                    "interface-alarms": {
+                        "alarm-not-present": FLAG,
+                        "ethernet-alarm-link-down": FLAG
+                    }
+                },
+                "admin-status": {
+                    "#text": TEXT,
+                    "@junos:format": TEXT
+                },
+                "bpdu-error": TEXT,
+                "clocking": TEXT,
+                "current-physical-address": TEXT,
+                "description": TEXT,
+                "eth-switch-error": TEXT,
+                "ethernet-fec-mode": {
+                    "@junos:style": TEXT,
+                    "enabled_fec_mode": TEXT
+                },
+                "ethernet-fec-statistics": {
+                    "@junos:style": TEXT,
+                    "fec_ccw_count": TEXT,
+                    "fec_ccw_error_rate": TEXT,
+                    "fec_nccw_count": TEXT,
+                    "fec_nccw_error_rate": TEXT
+                },
+                "ethernet-pcs-statistics": {
+                    "@junos:style": TEXT,
+                    "bit-error-seconds": TEXT,
+                    "errored-blocks-seconds": TEXT
+                },
+                "hardware-physical-address": TEXT,
+                "if-config-flags": {
+                    "internal-flags": TEXT,
+                    "iff-snmp-traps": FLAG,
+                    "iff-hardware-down": FLAG
+                },
+                "if-auto-negotiation": TEXT,
+                "if-device-flags": {
+                    "ifdf-present": FLAG,
+                    "ifdf-running": FLAG,
+                    "ifdf-loopback": FLAG,
+                    "ifdf-down": FLAG
+                },
+                "if-flow-control": TEXT,
+                "if-media-flags": {
+                    "ifmf-none": FLAG
+                },
+                "if-remote-fault": TEXT,
+                "if-type": TEXT,
+                "ifd-specific-config-flags": {
+                    "internal-flags": TEXT
+                },
+                "interface-flapped": {
+                    "#text": TEXT,
+                    "@junos:seconds": TEXT
+                },
+                "interface-transmit-statistics": TEXT,
+                "l2pt-error": TEXT,
+                "ld-pdu-error": TEXT,
+                "link-level-type": TEXT,
+                "link-type": TEXT,
+                "link-mode": TEXT,
+                "local-index": TEXT,
+                "logical-interface": [{
+                    "address-family": [{
+                        "address-family-flags": {
+                            "ifff-is-primary": FLAG,
+                            "ifff-no-redirects": FLAG,
+                            "ifff-none": FLAG,
+                            "ifff-sendbcast-pkt-to-re": FLAG,
+                            "internal-flags": FLAG,
+                            "ifff-primary": FLAG,
+                            "ifff-receive-ttl-exceeded": FLAG,
+                            "ifff-receive-options": FLAG,
+                            "ifff-encapsulation": TEXT
+                        },
+                        "address-family-name": TEXT,
+                        "interface-address": OneOrMany({
+                            "ifa-broadcast": TEXT,
+                            "ifa-destination": TEXT,
+                            "generation": TEXT,
+                            "ifa-flags": {
+                                "ifaf-current-preferred": FLAG,
+                                "ifaf-current-primary": FLAG,
+                                "ifaf-is-primary": FLAG,
+                                "ifaf-is-preferred": FLAG,
+                                "ifaf-kernel": FLAG,
+                                "ifaf-preferred": FLAG,
+                                "ifaf-primary": FLAG,
+                                "ifaf-is-default": FLAG,
+                                "ifaf-none": FLAG,
+                                "ifaf-dest-route-down": FLAG
+                            },
+                            "ifa-local": TEXT
+                        }),
+                        "intf-curr-cnt": TEXT,
+                        "intf-dropcnt": TEXT,
+                        "intf-unresolved-cnt": TEXT,
+                        "generation": TEXT,
+                        "route-table": TEXT,
+                        "max-local-cache": TEXT,
+                        "maximum-labels": TEXT,
+                        "mtu": TEXT,
+                        "new-hold-limit": TEXT,
+                        "policer-information": {
+                            "policer-input": TEXT,
+                            "policer-output": TEXT
+                        }
+                    }],
+                    "encapsulation": TEXT,
+                    "filter-information": TEXT,
+                    "if-config-flags": {
+                        "iff-snmp-traps": FLAG,
+                        "iff-up": FLAG,
+                        "internal-flags": TEXT
+                    },
+                    "local-index": TEXT,
+                    "logical-interface-bandwidth": TEXT,
+                    "name": TEXT,
+                    "description": TEXT,
+                    "policer-overhead": TEXT,
+                    "snmp-index": TEXT,
+                    "traffic-statistics": {
+                        "@junos:style": TEXT,
+                        "input-packets": TEXT,
+                        "input-bytes": TEXT,
+                        "output-packets": TEXT,
+                        "output-bytes": TEXT,
+                        "ipv6-transit-statistics": TRANSIT_STATISTICS
+                    },
+                    "transit-traffic-statistics": dict(
+                        TRANSIT_STATISTICS,
+                        **{"ipv6-transit-statistics": TRANSIT_STATISTICS})
+                }],
+                "loopback": TEXT,
+                "lsi-traffic-statistics": {
+                    "@junos:style": TEXT,
+                    "input-bps": TEXT,
+                    "input-bytes": TEXT,
+                    "input-packets": TEXT,
+                    "input-pps": TEXT
+                },
+                "mru": TEXT,
+                "mtu": TEXT,
+                "name": TEXT,
+                "oper-status": TEXT,
+                "pad-to-minimum-frame-size": TEXT,
+                "physical-interface-cos-information": {
+                    "physical-interface-cos-hw-max-queues": TEXT,
+                    "physical-interface-cos-use-max-queues": TEXT
+                },
+                "snmp-index": TEXT,
+                "sonet-mode": TEXT,
+                "source-filtering": TEXT,
+                "speed": TEXT,
+                "stp-traffic-statistics": {
+                    "@junos:style": TEXT,
+                    "stp-input-bytes-dropped": TEXT,
+                    "stp-input-packets-dropped": TEXT,
+                    "stp-output-bytes-dropped": TEXT,
+                    "stp-output-packets-dropped": TEXT
+                },
+                "traffic-statistics": dict(
+                    TRANSIT_STATISTICS,
+                    **{"@junos:style": TEXT,
+                       "ipv6-transit-statistics": TRANSIT_STATISTICS}),
+                "output-error-list": {
+                    "aged-packets": TEXT,
+                    "carrier-transitions": TEXT,
+                    "hs-link-crc-errors": TEXT,
+                    "mtu-errors": TEXT,
+                    "output-collisions": TEXT,
+                    "output-drops": TEXT,
+                    "output-errors": TEXT,
+                    "output-fifo-errors": TEXT,
+                    "output-resource-errors": TEXT
+                },
+                "ethernet-mac-statistics": {
+                    "@junos:style": TEXT,
+                    "input-broadcasts": TEXT,
+                    "input-bytes": TEXT,
+                    "input-code-violations": TEXT,
+                    "input-crc-errors": TEXT,
+                    "input-fifo-errors": TEXT,
+                    "input-fragment-frames": TEXT,
+                    "input-jabber-frames": TEXT,
+                    "input-mac-control-frames": TEXT,
+                    "input-mac-pause-frames": TEXT,
+                    "input-multicasts": TEXT,
+                    "input-oversized-frames": TEXT,
+                    "input-packets": TEXT,
+                    "input-total-errors": TEXT,
+                    "input-unicasts": TEXT,
+                    "input-vlan-tagged-frames": TEXT,
+                    "output-broadcasts": TEXT,
+                    "output-bytes": TEXT,
+                    "output-crc-errors": TEXT,
+                    "output-fifo-errors": TEXT,
+                    "output-mac-control-frames": TEXT,
+                    "output-mac-pause-frames": TEXT,
+                    "output-multicasts": TEXT,
+                    "output-packets": TEXT,
+                    "output-total-errors": TEXT,
+                    "output-unicasts": TEXT
+                },
+                "ethernet-filter-statistics": {
+                    "input-packets": TEXT,
+                    "input-reject-count": TEXT,
+                    "input-reject-destination-address-count": TEXT,
+                    "input-reject-source-address-count": TEXT,
+                    "output-packet-error-count": TEXT,
+                    "output-packet-pad-count": TEXT,
+                    "output-packets": TEXT,
+                    "cam-destination-filter-count": TEXT,
+                    "cam-source-filter-count": TEXT
+                },
+                "cos-information": {
+                    "cos-stream-information": {
+                        "cos-direction": TEXT,
+                        "cos-queue-configuration": [{
+                            "cos-queue-bandwidth": TEXT,
+                            "cos-queue-bandwidth-bps": TEXT,
+                            "cos-queue-buffer": TEXT,
+                            "cos-queue-buffer-bytes": TEXT,
+                            "cos-queue-forwarding-class": TEXT,
+                            "cos-queue-limit": TEXT,
+                            "cos-queue-number": TEXT,
+                            "cos-queue-priority": TEXT
+                        }]
+                    }
+                },
+                "input-error-list": {
+                    "framing-errors": TEXT,
+                    "input-discards": TEXT,
+                    "input-drops": TEXT,
+                    "input-errors": TEXT,
+                    "input-fifo-errors": TEXT,
+                    "input-giants": TEXT,
+                    "input-l2-channel-errors": TEXT,
+                    "input-l2-mismatch-timeouts": TEXT,
+                    "input-l3-incompletes": TEXT,
+                    "input-resource-errors": TEXT,
+                    "input-runts": TEXT
+                },
+                "transit-traffic-statistics": dict(
+                    TRANSIT_STATISTICS,
+                    **{"ipv6-transit-statistics": TRANSIT_STATISTICS}),
+                "pfe-information": {
+                    "destination-mask": TEXT,
+                    "destination-slot": TEXT
+                },
+                "queue-counters": {
+                    "@junos:style": TEXT,
+                    "interface-cos-short-summary": {
+                        "intf-cos-num-queues-in-use": TEXT,
+                        "intf-cos-num-queues-supported": TEXT
+                    },
+                    "queue": [{
+                        "forwarding-class-name": TEXT,
+                        "queue-counters-queued-packets": TEXT,
+                        "queue-counters-total-drop-packets": TEXT,
+                        "queue-counters-trans-packets": TEXT,
+                        "queue-number": TEXT
+                    }]
+                }
+            }]
+        }
+    }
+
     def cli(self, interface=None, output=None):
 
         if not output:
@@ -40,6 +40,20 @@ from genie.metaparser import MetaParser
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any, Optional, Use,
                                                 Schema, Or)
+from genie.libs.parser.utils.structured import StructuredParser, TEXT, FLAG
+
+# ospf-lsa-topology of the router and network LSAs, as the
+# structured_mapping of ShowOspfDatabaseExtensive declares it
+LSA_TOPOLOGY = {
+    "ospf-lsa-topology-link": [{
+        "link-type-name": TEXT,
+        "ospf-lsa-topology-link-metric": TEXT,
+        "ospf-lsa-topology-link-node-id": TEXT,
+        "ospf-lsa-topology-link-state": TEXT
+    }],
+    "ospf-topology-id": TEXT,
+    "ospf-topology-name": TEXT
+}
 
 
 class ShowOspfInterfaceBriefSchema(MetaParser):
@@ -2498,7 +2512,8 @@ class ShowOspfDatabaseExtensiveSchema(MetaParser):
     }
 
 
-class ShowOspfDatabaseExtensive(ShowOspfDatabaseExtensiveSchema):
+class ShowOspfDatabaseExtensive(StructuredParser,
+                                 ShowOspfDatabaseExtensiveSchema):
     """ Parser for:
             * show ospf database extensive
             * show ospf database {data_type} extensive
@@ -2508,6 +2523,100 @@ class ShowOspfDatabaseExtensive(ShowOspfDatabaseExtensiveSchema):
         'show ospf database {data_type} extensive'
         ]
 
+    # part of '| display xml' and '| display json' kept by xml() and
+    # json()
+    structured_mapping = {
+        "ospf-database-information": {
+            "ospf-area-header": {
+                "ospf-area": TEXT
+            },
+            "ospf-database": [{
+                "advertising-router": TEXT,
+                "age": TEXT,
+                "checksum": TEXT,
+                "lsa-id": TEXT,
+                "our-entry": FLAG,
+                "lsa-length": TEXT,
+                "lsa-type": TEXT,
+                "options": TEXT,
+                "ospf-network-lsa": {
+                    "address-mask": TEXT,
+                    "attached-router": [TEXT],
+                    "ospf-lsa-topology": LSA_TOPOLOGY
+                },
+                "ospf-database-extensive": {
+                    "aging-timer": {
+                        "#text": TEXT
+                    },
+                    "expiration-time": {
+                        "#text": TEXT
+                    },
+                    "installation-time": {
+                        "#text": TEXT
+                    },
+                    "generation-timer": {
+                        "#text": TEXT
+                    },
+                    "lsa-change-count": TEXT,
+                    "lsa-changed-time": {
+                        "#text": TEXT
+                    },
+                    "send-time": {
+                        "#text": TEXT
+                    },
+                    "database-entry-state": TEXT
+                },
+                "ospf-router-lsa": {
+                    "bits": TEXT,
+                    "link-count": TEXT,
+                    "ospf-link": [{
+                        "link-data": TEXT,
+                        "link-id": TEXT,
+                        "link-type-name": TEXT,
+                        "link-type-value": TEXT,
+                        "metric": TEXT,
+                        "ospf-topology-count": TEXT
+                    }],
+                    "ospf-lsa-topology": LSA_TOPOLOGY
+                },
+                "ospf-opaque-area-lsa": {
+                    "tlv-block": {
+                        "formatted-tlv-data": TEXT,
+                        "tlv-length": TEXT,
+                        "tlv-type-name": TEXT,
+                        "tlv-type-value": TEXT
+                    },
+                    "te-subtlv": {
+                        "formatted-tlv-data": [TEXT],
+                        "tlv-length": [TEXT],
+                        "tlv-type-name": [TEXT],
+                        "tlv-type-value": [TEXT]
+                    }
+                },
+                "ospf-external-lsa": {
+                    "address-mask": TEXT,
+                    "ospf-external-lsa-topology": {
+                        "forward-address": TEXT,
+                        "ospf-topology-id": TEXT,
+                        "ospf-topology-metric": TEXT,
+                        "ospf-topology-name": TEXT,
+                        "tag": TEXT,
+                        "type-value": TEXT
+                    }
+                },
+                "ospf-summary-lsa": {
+                    "address-mask": TEXT,
+                    "ospf-summary-lsa-topology": {
+                        "ospf-topology-name": TEXT,
+                        "ospf-topology-id": TEXT,
+                        "ospf-topology-metric": TEXT
+                    }
+                },
+                "sequence-number": TEXT
+            }]
+        }
+    }
+
     def cli(self, data_type=None, output=None):
         if not output:
             if data_type:
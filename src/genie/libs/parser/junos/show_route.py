@@ -29,6 +29,9 @@ import re
 from genie.metaparser import MetaParser
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import Any, Optional, Use, Schema
+from genie.libs.parser.utils.stream import iter_lines
+from genie.libs.parser.utils.structured import (StructuredParser, TEXT,
+                                                OneOrMany)
 '''
 Schema for:
     * show route table {table}
@@ -854,7 +857,8 @@ class ShowRouteProtocolExtensiveSchema(MetaParser):
         }
     }
 
-class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
+class ShowRouteProtocolExtensive(StructuredParser,
+                                 ShowRouteProtocolExtensiveSchema):
     """ Parser for:
             * show route protocol {protocol} extensive
             * show route protocol {protocol} table {table} extensive
@@ -871,6 +875,126 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                     'show route extensive',
                     'show route extensive {destination}',
                     'show route protocol {protocol} {destination} extensive']
+
+    # part of '| display xml' and '| display json' kept by xml() and
+    # json()
+    structured_mapping = {
+        "route-information": {
+            "route-table": [{
+                "active-route-count": TEXT,
+                "destination-count": TEXT,
+                "hidden-route-count": TEXT,
+                "holddown-route-count": TEXT,
+                "rt": [{
+                    "@junos:style": TEXT,
+                    "rt-announced-count": TEXT,
+                    "rt-destination": TEXT,
+                    "rt-entry": OneOrMany({
+                        "accepted": TEXT,
+                        "active-tag": TEXT,
+                        "age": {
+                            "#text": TEXT,
+                            "@junos:seconds": TEXT
+                        },
+                        "announce-bits": TEXT,
+                        "announce-tasks": TEXT,
+                        "as-path": TEXT,
+                        "cluster-list": TEXT,
+                        "bgp-rt-flag": TEXT,
+                        "bgp-path-attributes": {
+                            "attr-as-path-effective": {
+                                "aspath-effective-string": TEXT,
+                                "attr-value": TEXT
+                            }
+                        },
+                        "current-active": TEXT,
+                        "inactive-reason": TEXT,
+                        "last-active": TEXT,
+                        "local-as": TEXT,
+                        "local-preference": TEXT,
+                        "peer-as": TEXT,
+                        "metric": TEXT,
+                        "metric2": TEXT,
+                        "nh": [{
+                            "@junos:indent": TEXT,
+                            "label-element": TEXT,
+                            "label-element-childcount": TEXT,
+                            "label-element-lspid": TEXT,
+                            "label-element-parent": TEXT,
+                            "label-element-refcount": TEXT,
+                            "label-ttl-action": TEXT,
+                            "load-balance-label": TEXT,
+                            "mpls-label": TEXT,
+                            "nh-string": TEXT,
+                            "selected-next-hop": TEXT,
+                            "session": TEXT,
+                            "to": TEXT,
+                            "via": TEXT,
+                            "weight": TEXT
+                        }],
+                        "nh-address": TEXT,
+                        "nh-index": TEXT,
+                        "nh-kernel-id": TEXT,
+                        "nh-reference-count": TEXT,
+                        "gateway": TEXT,
+                        "nh-type": TEXT,
+                        "preference": TEXT,
+                        "preference2": TEXT,
+                        "protocol-name": TEXT,
+                        "protocol-nh": [{
+                            "@junos:indent": TEXT,
+                            "forwarding-nh-count": TEXT,
+                            "indirect-nh": TEXT,
+                            "label-ttl-action": TEXT,
+                            "load-balance-label": TEXT,
+                            "metric": TEXT,
+                            "mpls-label": TEXT,
+                            "nh": [{
+                                "@junos:indent": TEXT,
+                                "label-element": TEXT,
+                                "label-element-childcount": TEXT,
+                                "label-element-lspid": TEXT,
+                                "label-element-parent": TEXT,
+                                "label-element-refcount": TEXT,
+                                "label-ttl-action": TEXT,
+                                "load-balance-label": TEXT,
+                                "mpls-label": TEXT,
+                                "nh-string": TEXT,
+                                "selected-next-hop": TEXT,
+                                "session": TEXT,
+                                "to": TEXT,
+                                "via": TEXT,
+                                "weight": TEXT
+                            }],
+                            "nh-index": TEXT,
+                            "nh-type": TEXT,
+                            "output": TEXT,
+                            "to": TEXT
+                        }],
+                        "rt-entry-state": TEXT,
+                        "rt-ospf-area": TEXT,
+                        "rt-tag": TEXT,
+                        "peer-id": TEXT,
+                        "task-name": TEXT,
+                        "validation-state": TEXT
+                    }),
+                    "rt-entry-count": {
+                        "#text": TEXT,
+                        "@junos:format": TEXT
+                    },
+                    "rt-prefix-length": TEXT,
+                    "rt-state": TEXT,
+                    "tsi": {
+                        "#text": TEXT,
+                        "@junos:indent": TEXT
+                    }
+                }],
+                "table-name": TEXT,
+                "total-route-count": TEXT
+            }]
+        }
+    }
+
     def cli(self, protocol=None, table=None, 
             destination=None, route=None, 
             output=None):
@@ -1068,7 +1192,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
         # Router ID: 10.16.2.2
         p37 = re.compile(r'^Router +ID: +(?P<peer_id>\S+)$')
 
-        for line in out.splitlines():
+        for line in iter_lines(out):
             line = line.strip()
             # inet.0: 929 destinations, 1615 routes (929 active, 0 holddown, 0 hidden)
             m = p1.match(line)
@@ -0,0 +1,243 @@
+# Python
+import os
+import json
+import unittest
+import importlib.util
+from unittest.mock import Mock
+
+import xmltodict
+
+# Metaparser
+from genie.metaparser import MetaParser
+from genie.metaparser.util.schemaengine import Schema
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+# junos parsers with the xml context and parse_json()
+from genie.libs.parser.junos.show_route import ShowRouteProtocolExtensive
+from genie.libs.parser.junos.show_interface import ShowInterfaces
+from genie.libs.parser.junos.show_ospf import ShowOspfDatabaseExtensive
+from genie.libs.parser.utils.structured import (select, read_xml, read_json,
+                                                TEXT, FLAG, OneOrMany)
+
+FOLDER = os.path.dirname(os.path.abspath(__file__))
+
+
+def to_xml(tree):
+    """Return the '| display xml' reply of a parsed tree, with an element
+       and an attribute no mapping declares in each element"""
+    def element(value):
+        if value is True:
+            return None
+        if isinstance(value, list):
+            return [element(item) for item in value]
+        if isinstance(value, dict):
+            node = {key: element(item) for key, item in value.items()}
+            if '#text' not in node:
+                node['unmapped-element'] = 'unused'
+            node['@junos:unmapped'] = 'unused'
+            return node
+        return value
+    node = element(tree)
+    node['@xmlns:junos'] = 'http://xml.juniper.net/junos/19.2R1/junos'
+    node['cli'] = {'banner': None}
+    return xmltodict.unparse({'rpc-reply': node}, pretty=True) + \
+        '\n\n{master}\n'
+
+
+def to_json(tree):
+    """Return the '| display json' reply of a parsed tree, as to_xml()"""
+    def element(value):
+        if value is True:
+            return [{'data': [None]}]
+        if isinstance(value, list):
+            return [element(item)[0] for item in value]
+        if isinstance(value, dict):
+            attributes = {key[1:]: item for key, item in value.items()
+                          if key.startswith('@')}
+            attributes['junos:unmapped'] = 'unused'
+            if '#text' in value:
+                return [{'data': value['#text'], 'attributes': attributes}]
+            node = {key: element(item) for key, item in value.items()
+                    if not key.startswith('@')}
+            node['unmapped-element'] = [{'data': 'unused'}]
+            node['attributes'] = attributes
+            return [node]
+        return [{'data': value}]
+    node = {key: element(value) for key, value in tree.items()}
+    return json.dumps(node, indent=4)
+
+
+def structured(tree, strip=False):
+    """Return tree as the structured contexts read it back: without the
+       empty blocks the cli context keeps, and with its strings stripped
+       as xml text is read when strip"""
+    if isinstance(tree, dict):
+        tree = {key: structured(value, strip) for key, value in tree.items()}
+        return {key: value for key, value in tree.items() if value != {}}
+    if isinstance(tree, list):
+        return [structured(value, strip) for value in tree]
+    if isinstance(tree, str) and strip:
+        return tree.strip()
+    return tree
+
+
+def goldens(parser, context='cli'):
+    """Yield the name, arguments and expected output of the golden tests of
+       parser in context, with the reply of the device in the output file
+       for the xml and json contexts"""
+    folder = os.path.join(FOLDER, parser.__name__, context, 'equal')
+    for name in sorted(os.listdir(folder)):
+        if not name.endswith('_expected.py'):
+            continue
+        golden = name[:-len('_expected.py')]
+        spec = importlib.util.spec_from_file_location(
+            golden, os.path.join(folder, name))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        arguments = os.path.join(folder, golden + '_arguments.json')
+        if os.path.isfile(arguments):
+            with open(arguments) as f:
+                arguments = json.load(f)
+        else:
+            arguments = {}
+        if context == 'cli':
+            yield golden, arguments, module.expected_output
+        else:
+            with open(os.path.join(folder, golden + '_output.txt')) as f:
+                yield golden, arguments, f.read(), module.expected_output
+
+
+class TestSelect(unittest.TestCase):
+
+    mapping = {
+        'rt': [{
+            'rt-destination': TEXT,
+            'rt-entry': OneOrMany({'age': {'#text': TEXT,
+                                           '@junos:seconds': TEXT}}),
+            'selected': FLAG,
+            'hops': [TEXT],
+        }],
+    }
+
+    def test_select(self):
+        self.assertEqual(select(self.mapping, {
+            'rt': {'rt-destination': '0.0.0.0/0', 'rt-state': 'FlashAll',
+                   'rt-entry': [{'age': '3w2d'},
+                                {'age': {'#text': '1d',
+                                         '@junos:seconds': '86400'}}],
+                   'selected': None, 'hops': '10.0.0.1'}}),
+            {'rt': [{'rt-destination': '0.0.0.0/0',
+                     'rt-entry': [{'age': {'#text': '3w2d'}},
+                                  {'age': {'#text': '1d',
+                                           '@junos:seconds': '86400'}}],
+                     'selected': True, 'hops': ['10.0.0.1']}]})
+        self.assertEqual(select({'hops': TEXT}, {'hops': None}),
+                         {'hops': ''})
+
+    def test_nothing_declared(self):
+        self.assertIsNone(select(self.mapping, {'rt': {'rt-state': 'x'}}))
+        self.assertEqual(select(self.mapping, {'rt': {'rt-entry': {
+            'age': '3w2d'}}}), {'rt': [{'rt-entry': {'age': {
+                '#text': '3w2d'}}}]})
+
+    def test_read(self):
+        tree = {'route-information': {'rt': {
+            'rt-destination': '0.0.0.0/0', 'selected': True}}}
+        self.assertEqual(select(self.mapping, read_xml(to_xml(tree))),
+                         select(self.mapping, read_json(to_json(tree))))
+        # the {master} banner and the prompt around the reply
+        self.assertEqual(read_json('{master}\nuser@router> \n' +
+                                   to_json(tree) + '\n\n{master}\n'),
+                         read_json(to_json(tree)))
+        with self.assertRaises(ValueError):
+            read_json('{master}\n')
+
+    def test_command(self):
+        obj = ShowRouteProtocolExtensive(device=Mock())
+        self.assertEqual(obj.structured_command(protocol='ospf', table=None),
+                         'show route protocol ospf extensive')
+        self.assertEqual(obj.structured_command(),
+                         'show route extensive')
+        with self.assertRaises(TypeError):
+            obj.structured_command(interface='ge-0/0/0')
+
+
+class TestStructuredGolden(unittest.TestCase):
+    """ The xml context and parse_json() parse '| display xml' and
+        '| display json' replies of a device
+    """
+
+    maxDiff = None
+
+    def check(self, parser):
+        for context in ('xml', 'json'):
+            for golden, arguments, reply, expected in goldens(parser,
+                                                              context):
+                with self.subTest(golden=golden, context=context):
+                    device = Mock(**{'execute.return_value': reply})
+                    if context == 'xml':
+                        obj = parser(device=device, context='xml')
+                        parsed_output = obj.parse(**arguments)
+                    else:
+                        obj = parser(device=device)
+                        parsed_output = obj.parse_json(**arguments)
+                    device.execute.assert_called_once_with(
+                        '{} | display {}'.format(
+                            obj.structured_command(**arguments), context))
+                    self.assertEqual(parsed_output, expected)
+
+    def test_show_route_protocol_extensive(self):
+        self.check(ShowRouteProtocolExtensive)
+
+    def test_show_interfaces(self):
+        self.check(ShowInterfaces)
+
+    def test_show_ospf_database_extensive(self):
+        self.check(ShowOspfDatabaseExtensive)
+
+
+class TestStructuredParity(unittest.TestCase):
+    """ The xml context and parse_json() return the golden outputs of the
+        cli context from the structured replies holding them
+    """
+
+    maxDiff = None
+
+    def check(self, parser):
+        for golden, arguments, expected in goldens(parser):
+            for context, reply, expected in (
+                    ('xml', to_xml(expected), structured(expected, True)),
+                    ('json', to_json(expected), structured(expected))):
+                with self.subTest(golden=golden, context=context):
+                    device = Mock(**{'execute.return_value': reply})
+                    if context == 'xml':
+                        obj = parser(device=device, context='xml')
+                        parsed_output = obj.parse(**arguments)
+                    else:
+                        obj = parser(device=device)
+                        parsed_output = obj.parse_json(**arguments)
+                    device.execute.assert_called_once_with(
+                        '{} | display {}'.format(
+                            obj.structured_command(**arguments), context))
+                    self.assertEqual(parsed_output, expected)
+                    Schema(parser.schema).validate(parsed_output)
+
+    def test_show_route_protocol_extensive(self):
+        self.check(ShowRouteProtocolExtensive)
+
+    def test_show_interfaces(self):
+        self.check(ShowInterfaces)
+
+    def test_show_ospf_database_extensive(self):
+        self.check(ShowOspfDatabaseExtensive)
+
+    def test_json_context(self):
+        # MetaParser only runs the contexts of its CONTEXT_LIST
+        self.assertNotIn('json', MetaParser.CONTEXT_LIST)
+        device = Mock(**{'execute.return_value': '{}'})
+        with self.assertRaises(SchemaEmptyParserError):
+            ShowInterfaces(device=device).parse_json()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -14,6 +14,7 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.columnar import ColumnarParser
 
 # ===================
 # Schema for 'ps -ef'
@@ -38,12 +39,14 @@ class PsSchema(MetaParser):
 # ===================
 # Parser for 'ps -ef'
 # ===================
-class Ps(PsSchema):
+class Ps(ColumnarParser, PsSchema):
  
     ''' Parser for "ps -ef"'''
     cli_command = ['ps -ef', 'ps -ef | grep {grep}']
+    columnar_tables = {'pid': ('pid', '{pid}')}
+    columnar_cli = True
 
-    def cli(self, output=None, grep=None):
+    def cli(self, output=None, grep=None, columnar=False):
         if output is None:
             command = self.cli_command[0]
             if grep:
@@ -54,6 +57,11 @@ class Ps(PsSchema):
  
         # Init vars
         parsed_dict = {}
+        if columnar:
+            parsed_dict = self.columnar_result()
+            # the columns of the pid table, added at once
+            columns = {name: [] for name in (
+                'uid', 'pid', 'ppid', 'c', 'stime', 'tty', 'time', 'cmd')}
 
         # root      2322     1  0  2019 tty2     00:00:00 /sbin/mingetty /dev/tty2      
         # root      2326     1  0  2019 tty3     00:00:00 /sbin/mingetty /dev/tty3       
@@ -72,6 +80,17 @@ class Ps(PsSchema):
                 if grep and 'grep {}'.format(grep) in line:
                     continue
 
+                if columnar:
+                    uid, pid, ppid, c, stime, tty, time, cmd = m.groups()
+                    columns['uid'].append(uid)
+                    columns['pid'].append(pid)
+                    columns['ppid'].append(ppid)
+                    columns['c'].append(c)
+                    columns['stime'].append(stime)
+                    columns['tty'].append(tty)
+                    columns['time'].append(time)
+                    columns['cmd'].append(cmd)
+                    continue
                 groups = m.groupdict()
                 pid = groups['pid']
                 del groups['pid']
@@ -80,4 +99,7 @@ class Ps(PsSchema):
         #if len(parsed_dict) == 0:
         #    parsed_dict.setdefault('pid', {})
 
+        if columnar:
+            # the first process of a pid is kept, as setdefault does
+            parsed_dict['pid'].extend(columns, update=False)
         return parsed_dict
\ No newline at end of file
@@ -51,7 +51,6 @@ NXOS parsers for the following show commands:
 # Python
 import re
 from copy import deepcopy
-import xml.etree.ElementTree as ET
 
 # Metaparser
 from genie.metaparser import MetaParser
@@ -63,6 +62,9 @@ from genie.libs.parser.yang.bgp_openconfig_yang import BgpOpenconfigYang
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.xml_stream import iter_rows, Row
+from genie.libs.parser.utils.json_rows import iter_json_rows, loads
+from genie.libs.parser.utils.structured import JsonContext
 
 
 # =====================================
@@ -170,7 +172,7 @@ class ShowBgpProcessVrfAllSchema(MetaParser):
 # =====================================
 # Parser for 'show bgp process vrf all'
 # =====================================
-class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
+class ShowBgpProcessVrfAll(JsonContext, ShowBgpProcessVrfAllSchema):
     """Parser for:
         show bgp process vrf all
         show bgp process vrf <vrf>
@@ -178,6 +180,8 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
     """
     cli_command = ['show bgp process vrf all', 'show bgp process vrf {vrf}']
     xml_command = ['show bgp process vrf all | xml', 'show bgp process vrf {vrf} | xml']
+    json_command = ['show bgp process vrf all | json',
+                    'show bgp process vrf {vrf} | json']
     exclude = [
       'bgp_pid',
       'hwm_attr_entries',
@@ -796,6 +800,76 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
 
         return parsed_dict
 
+    xml_rows = {
+        'process': Row('', {
+            'processid': ('bgp_pid', int),
+            'protocolstartedreason': 'bgp_protocol_started_reason',
+            'protocoltag': 'bgp_tag',
+            'protocolstate': ('bgp_protocol_state', str.lower),
+            'isolatemode': 'bgp_isolate_mode',
+            'mmode': 'bgp_mmode',
+            'memorystate': ('bgp_memory_state', str.lower),
+            'forwardingstatesaved': ('bgp_performance_mode',
+                                     lambda text: 'No' if text == 'false'
+                                     else 'Yes'),
+            'asformat': 'bgp_asformat',
+            'srgbmin': 'srgbmin',
+            'srgbmax': 'srgbmax',
+            'attributeentries': ('num_attr_entries', int),
+            'hwmattributeentries': ('hwm_attr_entries', int),
+            'bytesused': ('bytes_used', int),
+            'entriespendingdelete': ('entries_pending_delete', int),
+            'hwmentriespendingdelete': ('hwm_entries_pending_delete', int),
+            'pathsperattribute': ('bgp_paths_per_hwm_attr', int),
+            'aspathentries': ('bgp_as_path_entries', int),
+            'aspathbytes': ('bytes_used_as_path_entries', int)}),
+        'vrf': Row('TABLE_vrf/ROW_vrf', {
+            'vrf-name-out': 'vrf',
+            'vrf-id': 'vrf_id',
+            'vrf-state': ('vrf_state', str.lower),
+            'vrf-router-id': 'router_id',
+            'vrf-cfgd-id': 'conf_router_id',
+            'vrf-confed-id': ('confed_id', int),
+            'vrf-cluster-id': 'cluster_id',
+            'vrf-peers': ('num_conf_peers', int),
+            'vrf-pending-peers': ('num_pending_conf_peers', int),
+            'vrf-est-peers': ('num_established_peers', int),
+            'vrf-rd': 'vrf_rd'}),
+        'af': Row('TABLE_vrf/ROW_vrf/TABLE_af/ROW_af', {
+            'af-name': ('address_family', str.lower),
+            'af-table-id': ('table_id', lambda text: text if '0x' in text
+                            else '0x' + text),
+            'af-state': ('table_state', str.lower),
+            'af-num-peers': ('peers', int),
+            'af-num-active-peers': ('active_peers', int),
+            'af-peer-routes': ('routes', int),
+            'af-peer-paths': ('paths', int),
+            'af-peer-networks': ('networks', int),
+            'af-peer-aggregates': ('aggregates', int),
+            'af-rr': 'route_reflector',
+            'nexthop-trigger-delay-critical': ('critical', int),
+            'nexthop-trigger-delay-non-critical': ('non_critical', int),
+            'af-aggregate-label': 'aggregate_label',
+            'af-label-mode': 'label_mode',
+            'importdefault_map': 'import_default_map',
+            'importdefault_prefixlimit': ('import_default_prefix_limit', int),
+            'importdefault_prefixcount': ('import_default_prefix_count', int),
+            'exportdefault_map': 'export_default_map',
+            'exportdefault_prefixlimit': ('export_default_prefix_limit', int),
+            'exportdefault_prefixcount': ('export_default_prefix_count',
+                                          int)}),
+        'redist': Row('TABLE_vrf/ROW_vrf/TABLE_af/ROW_af/TABLE_redist/'
+                      'ROW_redist', {
+            'protocol': 'protocol',
+            'route-map': 'route_map'}),
+        'export_rt': Row('TABLE_vrf/ROW_vrf/TABLE_af/ROW_af/'
+                         'TABLE_evpn_export_rt/ROW_evpn_export_rt', {
+            'evpn-export-rt': 'rt'}),
+        'import_rt': Row('TABLE_vrf/ROW_vrf/TABLE_af/ROW_af/'
+                         'TABLE_evpn_import_rt/ROW_evpn_import_rt', {
+            'evpn-import-rt': 'rt'}),
+    }
+
     def xml(self, vrf='', output=None):
         if output is None:
             if vrf:
@@ -805,260 +879,89 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
         else:
             out = output
 
+        return self._parse_rows(iter_rows(out, self.xml_rows))
+
+    def json(self, vrf='', output=None):
+        if output is None:
+            if vrf:
+                out = self.device.execute(self.json_command[1].format(vrf=vrf))
+            else:
+                out = self.device.execute(self.json_command[0])
+        else:
+            out = output
+
+        tree = loads(out)
+        if tree is None:
+            # '| json' is rejected by the platform
+            if output is not None:
+                raise ValueError("'| json' was rejected, parse the cli "
+                                 "output with cli() instead")
+            return self.cli(vrf=vrf)
+        return self._parse_rows(iter_json_rows(tree, self.xml_rows))
+
+    def _parse_rows(self, rows):
         etree_dict = {}
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        xml_output = ET.fromstring(out)
-
-        for item in xml_output:
-            for data in item:
-                for show in data:
-                    for bgp in show:
-                        for __XML__OPT_Cmd_show_ip_bgp_session_cmd_vrf in bgp:
-                            for process in __XML__OPT_Cmd_show_ip_bgp_session_cmd_vrf:
-                                for __XML__OPT_Cmd_show_bgp_process_cmd_vrf in process:
-                                    for __XML__OPT_Cmd_show_bgp_process_cmd___readonly__ in __XML__OPT_Cmd_show_bgp_process_cmd_vrf:
-                                        for key in __XML__OPT_Cmd_show_bgp_process_cmd___readonly__:
-                                            # Get key text
-                                            text = key.tag[key.tag.find('}')+1:]
-                                            # bgp_pid
-                                            if text == 'processid':
-                                                etree_dict['bgp_pid'] = int(key.text)
-                                            # bgp_protocol_started_reason
-                                            if text == 'protocolstartedreason':
-                                                etree_dict['bgp_protocol_started_reason'] = key.text
-                                            # bgp_tag
-                                            if text == 'protocoltag':
-                                                etree_dict['bgp_tag'] = key.text
-                                            # bgp_protocol_state
-                                            if text == 'protocolstate':
-                                                etree_dict['bgp_protocol_state'] = str(key.text).lower()
-                                            # bgp_isolate_mode
-                                            if text == 'isolatemode':
-                                                etree_dict['bgp_isolate_mode'] = key.text
-                                            # bgp_mmode
-                                            if text == 'mmode':
-                                                etree_dict['bgp_mmode'] = key.text
-                                            # bgp_memory_state
-                                            if text == 'memorystate':
-                                                etree_dict['bgp_memory_state'] = str(key.text).lower()
-                                            # bgp_performance_mode
-                                            if text == 'forwardingstatesaved':
-                                                if key.text == 'false':
-                                                    etree_dict['bgp_performance_mode'] = 'No'
-                                                else:
-                                                    etree_dict['bgp_performance_mode'] = 'Yes'
-                                            # bgp_asformat
-                                            if text == 'asformat':
-                                                etree_dict['bgp_asformat'] = key.text
-                                            if text == 'srgbmin':
-                                                srgbin = key.text
-                                            if text == 'srgbmax':
-                                                srgmax = key.text
-                                                try:
-                                                    etree_dict['segment_routing_global_block'] = srgbin + '-' + srgmax
-                                                except Exception:
-                                                    pass
-                                            # num_attr_entries
-                                            if text == 'attributeentries':
-                                                etree_dict['num_attr_entries'] = int(key.text)
-                                            # hwm_attr_entries
-                                            if text == 'hwmattributeentries':
-                                                etree_dict['hwm_attr_entries'] = int(key.text)
-                                            # bytes_used
-                                            if text == 'bytesused':
-                                                etree_dict['bytes_used'] = int(key.text)
-                                            # entries_pending_delete
-                                            if text == 'entriespendingdelete':
-                                                etree_dict['entries_pending_delete'] = int(key.text)
-                                            # hwm_entries_pending_delete
-                                            if text == 'hwmentriespendingdelete':
-                                                etree_dict['hwm_entries_pending_delete'] = int(key.text)
-                                            # bgp_paths_per_hwm_attr
-                                            if text == 'pathsperattribute':
-                                                etree_dict['bgp_paths_per_hwm_attr'] = int(key.text)
-                                            # bgp_as_path_entries
-                                            if text == 'aspathentries':
-                                                etree_dict['bgp_as_path_entries'] = int(key.text)
-                                            # bytes_used_as_path_entries
-                                            if text == 'aspathbytes':
-                                                etree_dict['bytes_used_as_path_entries'] = int(key.text)
-                                            
-                                            if text == 'TABLE_vrf':
-                                                for table_vrf in key:
-                                                    for row_vrf in table_vrf:
-                                                        vrf_tag = row_vrf.tag[row_vrf.tag.find('}')+1:]
-
-                                                        # vrf
-                                                        #   vrf_name
-                                                        if vrf_tag == 'vrf-name-out':
-                                                            vrf_name = row_vrf.text
-                                                            if 'vrf' not in etree_dict:
-                                                                etree_dict['vrf'] = {}
-                                                            if vrf_name not in etree_dict['vrf']:
-                                                                etree_dict['vrf'][vrf_name] = {}
-                                                                vrf_dict = etree_dict['vrf'][vrf_name]
-                                                        # vrf_id
-                                                        if vrf_tag == 'vrf-id':
-                                                            vrf_dict['vrf_id'] = row_vrf.text
-                                                        # vrf_state
-                                                        if vrf_tag == 'vrf-state':
-                                                            vrf_dict['vrf_state'] = str(row_vrf.text).lower()
-                                                        # router_id
-                                                        if vrf_tag == 'vrf-router-id':
-                                                            vrf_dict['router_id'] = row_vrf.text
-                                                        # conf_router_id
-                                                        if vrf_tag == 'vrf-cfgd-id':
-                                                            vrf_dict['conf_router_id'] = row_vrf.text
-                                                        # confed_id
-                                                        if vrf_tag == 'vrf-confed-id':
-                                                            vrf_dict['confed_id'] = int(row_vrf.text)
-                                                        # cluster_id
-                                                        if vrf_tag == 'vrf-cluster-id':
-                                                           vrf_dict['cluster_id'] = row_vrf.text
-                                                        # num_conf_peers
-                                                        if vrf_tag == 'vrf-peers':
-                                                            vrf_dict['num_conf_peers'] = int(row_vrf.text)
-                                                        # num_pending_conf_peers
-                                                        if vrf_tag == 'vrf-pending-peers':
-                                                            vrf_dict['num_pending_conf_peers'] = int(row_vrf.text)
-                                                        # num_established_peers
-                                                        if vrf_tag == 'vrf-est-peers':
-                                                            vrf_dict['num_established_peers'] = int(row_vrf.text)
-                                                            vrf_dict['vrf_rd'] = 'not configured'
-                                                        # vrf_rd
-                                                        if vrf_tag == 'vrf-rd':
-                                                            vrf_dict['vrf_rd'] = row_vrf.text
-
-                                                        if vrf_tag == 'TABLE_af':
-                                                            for table_af in row_vrf:
-                                                                for row_af in table_af:
-                                                                    af_tag = row_af.tag[row_af.tag.find('}')+1:]
-
-                                                                    # address_family
-                                                                    #   address_family_name
-                                                                    if af_tag == 'af-name':
-                                                                        address_family_name = str(row_af.text).lower()
-                                                                        if 'address_family' not in etree_dict['vrf'][vrf_name]:
-                                                                            etree_dict['vrf'][vrf_name]['address_family'] = {}
-                                                                        if address_family_name not in etree_dict['vrf'][vrf_name]['address_family']:
-                                                                            etree_dict['vrf'][vrf_name]['address_family'][address_family_name] = {}
-                                                                            af_dict = etree_dict['vrf'][vrf_name]['address_family'][address_family_name]
-                                                                        # Initialize empty lists
-                                                                        export_rt_list = ''
-                                                                        import_rt_list = ''
-                                                                    # table_id
-                                                                    if af_tag == 'af-table-id':
-                                                                        table_id = str(row_af.text)
-                                                                        if '0x' in table_id:
-                                                                            af_dict['table_id'] = table_id
-                                                                        else:
-                                                                            af_dict['table_id'] = '0x' + table_id
-                                                                    # table_state
-                                                                    if af_tag == 'af-state':
-                                                                        af_dict['table_state'] = str(row_af.text).lower()
-                                                                    # peers
-                                                                    if af_tag == 'af-num-peers':
-                                                                        peers = int(row_af.text)
-                                                                        if 'peers' not in af_dict:
-                                                                            af_dict['peers'] = {}
-                                                                        if peers not in af_dict['peers']:
-                                                                            af_dict['peers'][peers] = {}
-                                                                    # active_peers
-                                                                    if af_tag == 'af-num-active-peers':
-                                                                        af_dict['peers'][peers]['active_peers'] = int(row_af.text)
-                                                                    # routes
-                                                                    if af_tag == 'af-peer-routes':
-                                                                        af_dict['peers'][peers]['routes'] = int(row_af.text)
-                                                                    # paths
-                                                                    if af_tag == 'af-peer-paths':
-                                                                        af_dict['peers'][peers]['paths'] = int(row_af.text)
-                                                                    # networks
-                                                                    if af_tag == 'af-peer-networks':
-                                                                        af_dict['peers'][peers]['networks'] = int(row_af.text)
-                                                                    # aggregates
-                                                                    if af_tag == 'af-peer-aggregates':
-                                                                        af_dict['peers'][peers]['aggregates'] = int(row_af.text)
-                                                                    # route_reflector
-                                                                    if af_tag == 'af-rr':
-                                                                        if row_af.text == 'true':
-                                                                            af_dict['route_reflector'] = True
-                                                                    # next_hop_trigger_delay
-                                                                    #   critical
-                                                                    if af_tag == 'nexthop-trigger-delay-critical':
-                                                                        if 'next_hop_trigger_delay' not in af_dict:
-                                                                            af_dict['next_hop_trigger_delay'] = {}
-                                                                        af_dict['next_hop_trigger_delay']['critical'] = int(row_af.text)
-                                                                    # next_hop_trigger_delay
-                                                                    #   non_critical
-                                                                    if af_tag == 'nexthop-trigger-delay-non-critical':
-                                                                        af_dict['next_hop_trigger_delay']['non_critical'] = int(row_af.text)
-                                                                    # aggregate_label
-                                                                    if af_tag == 'af-aggregate-label':
-                                                                        af_dict['aggregate_label'] = row_af.text
-                                                                    # label_mode
-                                                                    if af_tag == 'af-label-mode':
-                                                                        af_dict['label_mode'] = row_af.text
-                                                                    # import_default_map
-                                                                    if af_tag == 'importdefault_map':
-                                                                        af_dict['import_default_map'] = row_af.text
-                                                                    # import_default_prefix_limit
-                                                                    if af_tag == 'importdefault_prefixlimit':
-                                                                        af_dict['import_default_prefix_limit'] = int(row_af.text)
-                                                                    # import_default_prefix_count
-                                                                    if af_tag == 'importdefault_prefixcount':
-                                                                        af_dict['import_default_prefix_count'] = int(row_af.text)
-                                                                    # export_default_map
-                                                                    if af_tag == 'exportdefault_map':
-                                                                        af_dict['export_default_map'] = row_af.text
-                                                                    # export_default_prefix_limit
-                                                                    if af_tag == 'exportdefault_prefixlimit':
-                                                                        af_dict['export_default_prefix_limit'] = int(row_af.text)
-                                                                    # export_default_prefix_count
-                                                                    if af_tag == 'exportdefault_prefixcount':
-                                                                        af_dict['export_default_prefix_count'] = int(row_af.text)
-
-                                                                    # TABLE_redist
-                                                                    #   ROW_redist
-                                                                    if af_tag == 'TABLE_redist':
-                                                                        for table_redist in row_af:
-                                                                            for row_redist in table_redist:
-                                                                                row_redist_tag = row_redist.tag[row_redist.tag.find('}')+1:]
-                                                                                # protocol
-                                                                                if row_redist_tag == 'protocol':
-                                                                                    protocol = row_redist.text
-                                                                                    if 'redistribution' not in af_dict:
-                                                                                        af_dict['redistribution'] = {}
-                                                                                    if protocol not in af_dict['redistribution']:
-                                                                                        af_dict['redistribution'][protocol] = {}
-                                                                                # route_map
-                                                                                if row_redist_tag == 'route-map':
-                                                                                    af_dict['redistribution'][protocol]['route_map'] = row_redist.text
-
-                                                                    # TABLE_evpn_export_rt
-                                                                    #   ROW_evpn_export_rt
-                                                                    if af_tag == 'TABLE_evpn_export_rt':
-                                                                        for table_evpn_export in row_af:
-                                                                            for row_export in table_evpn_export:
-                                                                                row_export_tag = row_export.tag[row_export.tag.find('}')+1:]
-                                                                                # export_rt_list
-                                                                                if row_export_tag == 'evpn-export-rt':
-                                                                                    export_rt_list = str(export_rt_list + ' ' + row_export.text).strip()
-                                                                                    af_dict['export_rt_list'] = export_rt_list
-                                                                    # TABLE_evpn_import_rt
-                                                                    #   ROW_evpn_import_rt
-                                                                    if af_tag == 'TABLE_evpn_import_rt':
-                                                                        for table_evpn_import in row_af:
-                                                                            for row_import in table_evpn_import:
-                                                                                row_import_tag = row_import.tag[row_import.tag.find('}')+1:]
-                                                                                # export_rt_list
-                                                                                if row_import_tag == 'evpn-import-rt':
-                                                                                    import_rt_list = str(import_rt_list + ' ' + row_import.text).strip()
-                                                                                    af_dict['import_rt_list'] = import_rt_list
-
-                                                                    # parsed all tags
-                                                                    continue
-                                                                                    
+
+        def af_dict(vrf_values, af_values):
+            return etree_dict.setdefault('vrf', {})\
+                .setdefault(vrf_values['vrf'], {})\
+                .setdefault('address_family', {})\
+                .setdefault(af_values['address_family'], {})
+
+        for row, values, parents in rows:
+            if row == 'process':
+                # segment_routing_global_block
+                srgb = values.pop('srgbmin', None), values.pop('srgbmax', None)
+                if None not in srgb:
+                    values['segment_routing_global_block'] = '-'.join(srgb)
+                etree_dict.update(values)
+
+            elif row == 'vrf':
+                if 'vrf' not in values:
+                    continue
+                if 'num_established_peers' in values:
+                    values.setdefault('vrf_rd', 'not configured')
+                etree_dict.setdefault('vrf', {})\
+                    .setdefault(values.pop('vrf'), {}).update(values)
+
+            elif row == 'af':
+                if 'address_family' not in values:
+                    continue
+                sub_dict = af_dict(parents[-1], values)
+                del values['address_family']
+                # peers
+                counts = {key: values.pop(key) for key in (
+                    'active_peers', 'routes', 'paths', 'networks',
+                    'aggregates') if key in values}
+                if 'peers' in values:
+                    sub_dict.setdefault('peers', {})\
+                        .setdefault(values.pop('peers'), {}).update(counts)
+                # route_reflector
+                if values.pop('route_reflector', None) == 'true':
+                    sub_dict['route_reflector'] = True
+                # next_hop_trigger_delay
+                delay = {key: values.pop(key) for key in (
+                    'critical', 'non_critical') if key in values}
+                if delay:
+                    sub_dict.setdefault('next_hop_trigger_delay', {})\
+                        .update(delay)
+                sub_dict.update(values)
+
+            elif row == 'redist':
+                if 'protocol' not in values:
+                    continue
+                sub_dict = af_dict(*parents[-2:])\
+                    .setdefault('redistribution', {})\
+                    .setdefault(values.pop('protocol'), {})
+                sub_dict.update(values)
+
+            elif 'rt' in values:
+                # export_rt_list, import_rt_list
+                sub_dict = af_dict(*parents[-2:])
+                key = row + '_list'
+                sub_dict[key] = '{} {}'.format(
+                    sub_dict.get(key, ''), values['rt']).strip()
+
         return etree_dict
 
     def yang(self, vrf=''):
@@ -3518,7 +3421,7 @@ class ShowBgpVrfAllAllSummarySchema(MetaParser):
 # =========================================
 # Parser for 'show bgp vrf <WORD> all summary'
 # =========================================
-class ShowBgpVrfAllAllSummary(ShowBgpVrfAllAllSummarySchema):
+class ShowBgpVrfAllAllSummary(JsonContext, ShowBgpVrfAllAllSummarySchema):
     """Parser for show bgp vrf <WORD> all summary"""
 
     cli_command = [ 'show bgp vrf all all summary',
@@ -3526,6 +3429,7 @@ class ShowBgpVrfAllAllSummary(ShowBgpVrfAllAllSummarySchema):
                     'show bgp vrf {vrf} {address_family} summary']
 
     xml_command = 'show bgp vrf {vrf} all summary | xml'
+    json_command = 'show bgp vrf {vrf} all summary | json'
     exclude = [
       'tbl_ver',
       'up_down',
@@ -3837,314 +3741,163 @@ class ShowBgpVrfAllAllSummary(ShowBgpVrfAllAllSummarySchema):
 
         return sum_dict
 
+    xml_rows = {
+        'vrf': Row('TABLE_vrf/ROW_vrf', {
+            'vrf-name-out': 'vrf',
+            'vrf-router-id': 'route_identifier',
+            'vrf-local-as': ('local_as', int)}),
+        'saf': Row('TABLE_vrf/ROW_vrf/TABLE_af/ROW_af/TABLE_saf/ROW_saf', {
+            'af-name': ('address_family', str.lower),
+            'tableversion': ('bgp_table_version', int),
+            'configuredpeers': ('config_peers', int),
+            'capablepeers': ('capable_peers', int),
+            'totalnetworks': ('total_prefixes', int),
+            'totalpaths': ('total_paths', int),
+            'memoryused': ('memory_usage', int),
+            'numberattrs': 'numberattrs',
+            'bytesattrs': 'bytesattrs',
+            'numberpaths': 'numberpaths',
+            'bytespaths': 'bytespaths',
+            'numbercommunities': 'numbercommunities',
+            'bytescommunities': 'bytescommunities',
+            'numberclusterlist': 'numberclusterlist',
+            'bytesclusterlist': 'bytesclusterlist',
+            'dampening': ('dampening', lambda text: 'enabled' in text.lower()
+                          or 'true' in text.lower()),
+            'historypaths': ('history_paths', int),
+            'dampenedpaths': ('dampened_paths', int),
+            'softreconfigrecvdpaths': ('soft_reconfig_recvd_paths', int),
+            'softreconfigidenticalpaths': ('soft_reconfig_identical_paths',
+                                           int),
+            'softreconfigcombopaths': ('soft_reconfig_combo_paths', int),
+            'softreconfigfilteredrecvd': ('soft_reconfig_filtered_recvd', int),
+            'softreconfigbytes': ('soft_reconfig_bytes', int)}),
+        'neighbor': Row('TABLE_vrf/ROW_vrf/TABLE_af/ROW_af/TABLE_saf/ROW_saf/'
+                        'TABLE_neighbor/ROW_neighbor', {
+            'neighborid': 'neighbor',
+            'neighborversion': ('neighbor_table_version', int),
+            'msgrecvd': ('msg_rcvd', int),
+            'msgsent': ('msg_sent', int),
+            'neighbortableversion': ('tbl_ver', int),
+            'inq': ('inq', int),
+            'outq': ('outq', int),
+            'neighboras': ('as', int),
+            'time': 'up_down',
+            'state': ('state', str.lower),
+            'prefixreceived': 'prefix_received'}),
+    }
+
     def xml(self, vrf='all', address_family='all'):
 
         out = self.device.execute(self.xml_command.format(vrf=vrf))
 
-        etree_dict = {}
-
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        root = ET.fromstring(out)
-
-        # top table root
-        show_root = Common.retrieve_xml_child(root=root, key='show')
-        # get xml namespace
-        # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
-        try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
-            namespace = m.groupdict()['name']
-        except Exception:
-            return etree_dict
-
-        # compare cli command
-        Common.compose_compare_command(root=root, namespace=namespace,
-                                       expect_command=self.cli_command[2].format(vrf=vrf,
-                                                                              address_family=address_family))
-
-        # find Vrf root
-        root = Common.retrieve_xml_child(root=root, key='TABLE_vrf')
-
-        if not root:
-            return etree_dict
-
-        # -----   loop vrf  -----
-        for vrf_tree in root.findall('{}ROW_vrf'.format(namespace)):
-            # vrf
-            try:
-                vrf = vrf_tree.find('{}vrf-name-out'.format(namespace)).text
-            except Exception:
-                break
-
-            # <vrf-router-id>10.106.0.6</vrf-router-id>
-            try:
-                route_identifier = vrf_tree.find('{}vrf-router-id'.format(namespace)).text
-            except Exception:
-                route_identifier = None
-
-            # <vrf-local-as>333</vrf-local-as>
-            try:
-                local_as = vrf_tree.find('{}vrf-local-as'.format(namespace)).text
-            except Exception:
-                local_as = None
-
-            # Address family table
-            af_tree = vrf_tree.find('{}TABLE_af'.format(namespace))
-            if not af_tree:
-                continue
-            for af_root in af_tree.findall('{}ROW_af'.format(namespace)):
-                # Address family table
-                saf_tree = af_root.find('{}TABLE_saf'.format(namespace))
-                if not saf_tree:
-                    continue
-                # -----   loop address_family  -----
-                for saf_root in saf_tree.findall('{}ROW_saf'.format(namespace)):
-                    # neighbor
-                    try:
-                        af = saf_root.find('{}af-name'.format(namespace)).text
-                        af = af.lower()
-                        # initial af dictionary
-                        af_dict = {}
-                        if route_identifier:
-                            af_dict['route_identifier'] = route_identifier
-                        if local_as:
-                            af_dict['local_as'] = int(local_as)
-                    except Exception:
-                        continue
-
-                    # <tableversion>7</tableversion>
-                    try:
-                        af_dict['bgp_table_version'] = int(
-                            saf_root.find('{}tableversion'.format(namespace)).text)
-                    except Exception:
-                        # for valide entry, table version should be there
-                        continue
-
-                    # <configuredpeers>3</configuredpeers>
-                    af_dict['config_peers'] = \
-                        int(saf_root.find('{}configuredpeers'.format(namespace)).text)
-                        
-                    # <capablepeers>2</capablepeers>
-                    af_dict['capable_peers'] = \
-                        int(saf_root.find('{}capablepeers'.format(namespace)).text)
-
-                    # <totalnetworks>5</totalnetworks>
-                    try:
-                        total_prefix_entries = \
-                            int(saf_root.find('{}totalnetworks'.format(namespace)).text)
-                        if 'prefixes' not in af_dict:
-                            af_dict['prefixes'] = {}
-                        af_dict['prefixes']['total_entries'] = total_prefix_entries
-                    except Exception:
-                        pass
-                        
-                    # <totalpaths>10</totalpaths>
-                    try:
-                        total_path_entries = \
-                            int(saf_root.find('{}totalpaths'.format(namespace)).text)
-                        if 'path' not in af_dict:
-                            af_dict['path'] = {}
-                        af_dict['path']['total_entries'] = total_path_entries
-                    except Exception:
-                        pass
-                        
-                    # <memoryused>1820</memoryused>
-                    try:
-                        memory_usage = \
-                            int(saf_root.find('{}memoryused'.format(namespace)).text)
-                        af_dict['path']['memory_usage'] = memory_usage
-                        af_dict['prefixes']['memory_usage'] = memory_usage
-                    except Exception:
-                        pass
-
-                    try:
-                        # <numberattrs>1</numberattrs>
-                        entries_1 = \
-                            saf_root.find('{}numberattrs'.format(namespace)).text
-                            
-                        # <bytesattrs>160</bytesattrs>
-                        entries_2 = \
-                            saf_root.find('{}bytesattrs'.format(namespace)).text
-
-                        af_dict['attribute_entries'] = '[{0}/{1}]'.format(entries_1, entries_2)
-                    except Exception:
-                        pass
-                        
-                    try:
-                        # <numberpaths>1</numberpaths>
-                        entries_1 = \
-                            saf_root.find('{}numberpaths'.format(namespace)).text
-
-                        # <bytespaths>34</bytespaths>
-                        entries_2 = \
-                            saf_root.find('{}bytespaths'.format(namespace)).text
-
-                        af_dict['as_path_entries'] = '[{0}/{1}]'.format(entries_1, entries_2)
-                    except Exception:
-                        pass
-                        
-                    try:
-                        # <numbercommunities>0</numbercommunities>
-                        entries_1 = \
-                            saf_root.find('{}numbercommunities'.format(namespace)).text
-
-                        # <bytescommunities>0</bytescommunities>
-                        entries_2 = \
-                            saf_root.find('{}bytescommunities'.format(namespace)).text
-
-                        af_dict['community_entries'] = '[{0}/{1}]'.format(entries_1, entries_2)
-                    except Exception:
-                        pass
-                        
-                    try:
-                        # <numberclusterlist>0</numberclusterlist>
-                        entries_1 = \
-                            saf_root.find('{}numberclusterlist'.format(namespace)).text
-
-                        # <bytesclusterlist>0</bytesclusterlist>
-                        entries_2 = \
-                            saf_root.find('{}bytesclusterlist'.format(namespace)).text
-
-                        af_dict['clusterlist_entries'] = '[{0}/{1}]'.format(entries_1, entries_2)
-                    except Exception:
-                        pass
-
-                    # <dampening>Enabled</dampening>
-                    dampening = saf_root.find('{}dampening'.format(namespace)).text.lower()
-                    if 'enabled' in dampening or 'true' in dampening:
-                        af_dict['dampening'] = True
+        return self._parse_rows(iter_rows(
+            out, self.xml_rows, command=self.cli_command[2].format(
+                vrf=vrf, address_family=address_family)))
 
-                    # <historypaths>0</historypaths>
-                    try:
-                        af_dict['history_paths'] = int(saf_root.find('{}historypaths'.format(namespace)).text)
-                    except Exception:
-                        pass
-
-                    # <dampenedpaths>0</dampenedpaths>
-                    try:
-                        af_dict['dampened_paths'] = int(saf_root.find('{}dampenedpaths'.format(namespace)).text)
-                    except Exception:
-                        pass
-
-                    # <softreconfigrecvdpaths>10</softreconfigrecvdpaths>
-                    try:
-                        af_dict['soft_reconfig_recvd_paths'] = int(
-                                saf_root.find('{}softreconfigrecvdpaths'.format(namespace)).text)
-                    except Exception:
-                        pass
-                        
-                    # <softreconfigidenticalpaths>10</softreconfigidenticalpaths>
-                    try:
-                        af_dict['soft_reconfig_identical_paths'] = int(
-                                saf_root.find('{}softreconfigidenticalpaths'.format(namespace)).text)
-                    except Exception:
-                        pass
-
-                    # <softreconfigcombopaths>0</softreconfigcombopaths>
-                    try:
-                        af_dict['soft_reconfig_combo_paths'] = int(
-                                saf_root.find('{}softreconfigcombopaths'.format(namespace)).text)
-                    except Exception:
-                        pass
+    def json(self, vrf='all', address_family='all', output=None):
+        if output is None:
+            out = self.device.execute(self.json_command.format(vrf=vrf))
+        else:
+            out = output
 
-                    # <softreconfigfilteredrecvd>0</softreconfigfilteredrecvd>
-                    try:
-                        af_dict['soft_reconfig_filtered_recvd'] = int(
-                                saf_root.find('{}softreconfigfilteredrecvd'.format(namespace)).text)
-                    except Exception:
-                        pass
-                        
-                    # <softreconfigbytes>0</softreconfigbytes>
-                    try:
-                        af_dict['soft_reconfig_bytes'] = int(
-                                saf_root.find('{}softreconfigbytes'.format(namespace)).text)
-                    except Exception:
-                        pass
-                        
-                     # Neighbor table
-                    nei_tree = saf_root.find('{}TABLE_neighbor'.format(namespace))
-                    if not nei_tree:
-                        continue
+        tree = loads(out)
+        if tree is None:
+            # '| json' is rejected by the platform
+            if output is not None:
+                raise ValueError("'| json' was rejected, parse the cli "
+                                 "output with cli() instead")
+            return self.cli(vrf=vrf, address_family=address_family)
+        return self._parse_rows(iter_json_rows(tree, self.xml_rows))
 
-                    # -----   loop neighbors  -----
-                    for nei_root in nei_tree.findall('{}ROW_neighbor'.format(namespace)):
-                        # neighbor
-                        try:
-                            nei = nei_root.find('{}neighborid'.format(namespace)).text
-                        except Exception:
-                            continue
+    def _parse_rows(self, rows):
+        etree_dict = {}
+        saf = None
 
-                        if 'vrf' not in etree_dict:
-                            etree_dict['vrf'] = {}
-                        if vrf not in etree_dict['vrf']:
-                            etree_dict['vrf'][vrf] = {}
+        for row, values, parents in rows:
+            if row != 'neighbor' or 'neighbor' not in values:
+                continue
 
-                        if 'neighbor' not in etree_dict['vrf'][vrf]:
-                            etree_dict['vrf'][vrf]['neighbor'] = {}
-                        if nei not in etree_dict['vrf'][vrf]['neighbor']:
-                            etree_dict['vrf'][vrf]['neighbor'][nei] = {}
+            # address family attributes, shared by its neighbors
+            if parents[-1] is not saf:
+                vrf_values, saf = parents[-2:]
+                af_dict = self._xml_af(vrf_values, saf)
+            if af_dict is None:
+                continue
 
-                        if 'address_family' not in etree_dict['vrf'][vrf]['neighbor'][nei]:
-                            etree_dict['vrf'][vrf]['neighbor'][nei]['address_family'] = {}
+            sub_dict = etree_dict.setdefault('vrf', {})\
+                .setdefault(vrf_values['vrf'], {})\
+                .setdefault('neighbor', {})\
+                .setdefault(values.pop('neighbor'), {})\
+                .setdefault('address_family', {})\
+                .setdefault(saf['address_family'], {})
 
-                        if af not in etree_dict['vrf'][vrf]['neighbor'][nei]['address_family']:
-                            etree_dict['vrf'][vrf]['neighbor'][nei]['address_family'][af] = {}
-                    
-                        sub_dict = etree_dict['vrf'][vrf]['neighbor'][nei]['address_family'][af]
+            #  ---   AF attributes -------
+            sub_dict.update(deepcopy(af_dict))
 
-                        #  ---   AF attributes -------
-                        update_dict = deepcopy(af_dict)
-                        sub_dict.update(update_dict)
-
-                        #  ---   Neighbors attributes -------
-                        # <neighborversion>4</neighborversion>
-                        sub_dict['neighbor_table_version'] = int(
-                            nei_root.find('{}neighborversion'.format(namespace)).text)
+            #  ---   Neighbors attributes -------
+            state = values.get('state', '')
+            if 'established' in state:
+                values['state_pfxrcd'] = values.get('prefix_received')
+            else:
+                values.pop('prefix_received', None)
+                values['state_pfxrcd'] = state
+            sub_dict.update(values)
 
-                        # <msgrecvd>5471</msgrecvd>
-                        sub_dict['msg_rcvd'] = int(
-                            nei_root.find('{}msgrecvd'.format(namespace)).text)
-                        
-                        # <msgsent>5459</msgsent>
-                        sub_dict['msg_sent'] = int(
-                            nei_root.find('{}msgsent'.format(namespace)).text)
-                        
-                        # <neighbortableversion>7</neighbortableversion>
-                        sub_dict['tbl_ver'] = int(
-                            nei_root.find('{}neighbortableversion'.format(namespace)).text)
-                        
-                        # <inq>0</inq>
-                        sub_dict['inq'] = int(
-                            nei_root.find('{}inq'.format(namespace)).text)
-                        
-                        # <outq>0</outq>
-                        sub_dict['outq'] = int(
-                            nei_root.find('{}outq'.format(namespace)).text)
-                        
-                        # <neighboras>333</neighboras>
-                        sub_dict['as'] = int(
-                            nei_root.find('{}neighboras'.format(namespace)).text)
-                        
-                        # <time>3d18h</time>
-                        sub_dict['up_down'] = \
-                            nei_root.find('{}time'.format(namespace)).text
-                        
-                        # <state>Established</state>
-                        state = nei_root.find('{}state'.format(namespace)).text.lower()
+        return etree_dict
 
-                        # <prefixreceived>5</prefixreceived>
-                        prefix_received = \
-                            nei_root.find('{}prefixreceived'.format(namespace)).text
+    @staticmethod
+    def _xml_af(vrf_values, saf):
+        '''address family attributes of a ROW_saf, None for an invalid one'''
+        # for valid entry, af name and table version should be there
+        if 'vrf' not in vrf_values or 'address_family' not in saf or \
+                'bgp_table_version' not in saf:
+            return None
 
-                        if 'established' in state:
-                            sub_dict['state'] = state
-                            sub_dict['prefix_received'] = prefix_received
-                            sub_dict['state_pfxrcd'] = prefix_received
-                        else:
-                            sub_dict['state'] = state
-                            sub_dict['state_pfxrcd'] = state
-                
-        return etree_dict
+        af_dict = {}
+        if vrf_values.get('route_identifier'):
+            af_dict['route_identifier'] = vrf_values['route_identifier']
+        if 'local_as' in vrf_values:
+            af_dict['local_as'] = vrf_values['local_as']
+        for key in ('bgp_table_version', 'config_peers', 'capable_peers'):
+            if key in saf:
+                af_dict[key] = saf[key]
+
+        # <totalnetworks>5</totalnetworks>
+        if 'total_prefixes' in saf:
+            af_dict['prefixes'] = {'total_entries': saf['total_prefixes']}
+        # <totalpaths>10</totalpaths>
+        if 'total_paths' in saf:
+            af_dict['path'] = {'total_entries': saf['total_paths']}
+        # <memoryused>1820</memoryused>
+        if 'memory_usage' in saf and 'path' in af_dict:
+            af_dict['path']['memory_usage'] = saf['memory_usage']
+            if 'prefixes' in af_dict:
+                af_dict['prefixes']['memory_usage'] = saf['memory_usage']
+
+        # <numberattrs>1</numberattrs> <bytesattrs>160</bytesattrs>
+        for key, number, size in (
+                ('attribute_entries', 'numberattrs', 'bytesattrs'),
+                ('as_path_entries', 'numberpaths', 'bytespaths'),
+                ('community_entries', 'numbercommunities',
+                 'bytescommunities'),
+                ('clusterlist_entries', 'numberclusterlist',
+                 'bytesclusterlist')):
+            if number in saf and size in saf:
+                af_dict[key] = '[{0}/{1}]'.format(saf[number], saf[size])
+
+        # <dampening>Enabled</dampening>
+        if saf.get('dampening'):
+            af_dict['dampening'] = True
+
+        for key in ('history_paths', 'dampened_paths',
+                    'soft_reconfig_recvd_paths',
+                    'soft_reconfig_identical_paths',
+                    'soft_reconfig_combo_paths',
+                    'soft_reconfig_filtered_recvd', 'soft_reconfig_bytes'):
+            if key in saf:
+                af_dict[key] = saf[key]
+        return af_dict
 
 
 # ==================================================
@@ -4320,205 +4073,65 @@ class ShowBgpVrfAllAllDampeningParameters(ShowBgpVrfAllAllDampeningParametersSch
                 continue
         return bgp_dict
 
+    xml_rows = {
+        'vrf': Row('TABLE_vrf/ROW_vrf', {'vrf-name-out': 'vrf'}),
+        'safi': Row('TABLE_vrf/ROW_vrf/TABLE_afi/ROW_afi/TABLE_safi/ROW_safi',
+                    {'af-name': ('address_family', str.lower)}),
+        'rd': Row('TABLE_vrf/ROW_vrf/TABLE_afi/ROW_afi/TABLE_safi/ROW_safi/'
+                  'TABLE_rd/ROW_rd', {
+            'rd_val': 'rd',
+            'rpmname': 'dampening_route_map',
+            'rd_vrf': 'rd_vrf',
+            'rd_vniid': 'rd_vni_id',
+            'damphalflife': 'dampening_half_life_time',
+            'dampsuppress': 'dampening_suppress_time',
+            'dampreuse': 'dampening_reuse_time',
+            'dampsuppresstime': 'dampening_max_suppress_time',
+            'dampmaxpenalty': 'dampening_max_suppress_penalty'}),
+        'rpm': Row('TABLE_vrf/ROW_vrf/TABLE_afi/ROW_afi/TABLE_safi/ROW_safi/'
+                   'TABLE_rd/ROW_rd/TABLE_rpm/ROW_rpm', {
+            'rpmdamphalflife': 'dampening_half_life_time',
+            'rpmdampsuppress': 'dampening_suppress_time',
+            'rpmdampreuse': 'dampening_reuse_time',
+            'rpmdampsuppresstime': 'dampening_max_suppress_time',
+            'rpmdampmaxpenalty': 'dampening_max_suppress_penalty'}),
+    }
+
     def xml(self, vrf='all', address_family='all'):
         out = self.device.execute(self.xml_command.format(vrf=vrf))
         etree_dict = {}
 
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        root = ET.fromstring(out)
-
-        # top table root
-        show_root = Common.retrieve_xml_child(root=root, key='show')
-        # get xml namespace
-        # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
-        try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
-            namespace = m.groupdict()['name']
-        except Exception:
-            return etree_dict
-
-        # compare cli command
-        Common.compose_compare_command(root=root, namespace=namespace,
-                                       expect_command=self.cli_command[1].format(vrf=vrf,
-                                                                              address_family=address_family))
-
-        root = Common.retrieve_xml_child(
-                root=root,
-                key='TABLE_vrf')
-
-        if not root:
-            return etree_dict
-
-        # -----   loop vrf  -----
-        for vrf_tree in root.findall('{}ROW_vrf'.format(namespace)):
-            # vrf
-            try:
-                vrf = vrf_tree.find('{}vrf-name-out'.format(namespace)).text
-            except Exception:
-                break
-
-            # Address family table
-            af_tree = vrf_tree.find('{}TABLE_afi'.format(namespace))
-            if not af_tree:
-                continue
-            for af_root in af_tree.findall('{}ROW_afi'.format(namespace)):
-                # Address family table
-                saf_tree = af_root.find('{}TABLE_safi'.format(namespace))
-                if not saf_tree:
-                    continue
-                # -----   loop address_family  -----
-                for saf_root in saf_tree.findall('{}ROW_safi'.format(namespace)):
-                    # neighbor
-                    try:
-                        af = saf_root.find('{}af-name'.format(namespace)).text
-                        af = af.lower()
-                    except Exception:
-                        continue
-
-                     # RD table
-                    rd_tree = saf_root.find('{}TABLE_rd'.format(namespace))
-                    if not rd_tree:
-                        continue
-
-                    # -----   loop rd  -----
-                    for rd_root in rd_tree.findall('{}ROW_rd'.format(namespace)):
-
-                        # neighbor
-                        try:
-                            rd = rd_root.find('{}rd_val'.format(namespace)).text
-                        except Exception:
-                            rd = None
-
-                        if 'vrf' not in etree_dict:
-                            etree_dict['vrf'] = {}
-                        if vrf not in etree_dict['vrf']:
-                            etree_dict['vrf'][vrf] = {}
-
-                        if 'address_family' not in etree_dict['vrf'][vrf]:
-                            etree_dict['vrf'][vrf]['address_family'] = {}
-
-                        if af not in etree_dict['vrf'][vrf]['address_family']:
-                            etree_dict['vrf'][vrf]['address_family'][af] = {}
-
-                        # dampening
-                        etree_dict['vrf'][vrf]['address_family'][af]['dampening'] = 'True'
+        for row, values, parents in iter_rows(
+                out, self.xml_rows, command=self.cli_command[1].format(
+                    vrf=vrf, address_family=address_family)):
+            if row == 'rpm':
+                # the route map values take precedence over the rd ones
+                parents[-1].update(values)
+                continue
+            if row != 'rd':
+                continue
+            vrf_values, safi = parents[-2:]
+            if 'vrf' not in vrf_values or 'address_family' not in safi:
+                continue
 
-                        if rd:
-                            if 'route_distinguisher' not in etree_dict['vrf'][vrf]:
-                                etree_dict['vrf'][vrf]['address_family'][af]\
-                                    ['route_distinguisher'] = {}
+            af_dict = etree_dict.setdefault('vrf', {})\
+                .setdefault(vrf_values['vrf'], {})\
+                .setdefault('address_family', {})\
+                .setdefault(safi['address_family'], {})
 
-                            if rd not in etree_dict['vrf'][vrf]['address_family']:
-                                etree_dict['vrf'][vrf]['address_family'][af]\
-                                    ['route_distinguisher'][rd] = {}
-                            sub_dict = etree_dict['vrf'][vrf]['address_family'][af]\
-                                    ['route_distinguisher'][rd]
-                        else:
-                            sub_dict = etree_dict['vrf'][vrf]['address_family'][af]
-                                    
+            # dampening
+            af_dict['dampening'] = 'True'
 
-                        # <dampconfigured>Configured</dampconfigured>
-                        # cli does not have this key
-
-                        # <rpmname>test</rpmname>
-                        try:
-                            sub_dict['dampening_route_map'] = \
-                                rd_root.find('{}rpmname'.format(namespace)).text
-                        except Exception:
-                            pass
-
-                        # <rd_vrf>vpn2</rd_vrf>
-                        try:
-                            sub_dict['rd_vrf'] = \
-                                rd_root.find('{}rd_vrf'.format(namespace)).text
-                        except Exception:
-                            pass
-
-                        # <rd_vniid>2</rd_vniid>
-                        try:
-                            sub_dict['rd_vni_id'] = \
-                                rd_root.find('{}rd_vniid'.format(namespace)).text
-                        except Exception:
-                            pass
-
-                        # <damphalflife>1</damphalflife>
-                        try:
-                            sub_dict['dampening_half_life_time'] = \
-                                rd_root.find('{}damphalflife'.format(namespace)).text
-                        except Exception:
-                            pass
-
-                        # <dampsuppress>30</dampsuppress>
-                        try:
-                            sub_dict['dampening_suppress_time'] = \
-                                rd_root.find('{}dampsuppress'.format(namespace)).text
-                        except Exception:
-                            pass
-
-                        # <dampreuse>10</dampreuse>
-                        try:
-                            sub_dict['dampening_reuse_time'] = \
-                                rd_root.find('{}dampreuse'.format(namespace)).text
-                        except Exception:
-                            pass
-
-                        # <dampsuppresstime>2</dampsuppresstime>
-                        try:
-                            sub_dict['dampening_max_suppress_time'] = \
-                                rd_root.find('{}dampsuppresstime'.format(namespace)).text
-                        except Exception:
-                            pass
-
-                        # <dampmaxpenalty>40</dampmaxpenalty>
-                        try:
-                            sub_dict['dampening_max_suppress_penalty'] = \
-                                rd_root.find('{}dampmaxpenalty'.format(namespace)).text
-                        except Exception:
-                            pass
-
-                        # TABLE_rpm
-                        rpm_tree = rd_root.find('{}TABLE_rpm'.format(namespace))
-                        if not rpm_tree:
-                            continue
+            rd = values.pop('rd', None)
+            if rd:
+                sub_dict = af_dict.setdefault('route_distinguisher', {})\
+                    .setdefault(rd, {})
+            else:
+                sub_dict = af_dict
 
-                        # ROW_rpm
-                        for rpm_root in rpm_tree.findall('{}ROW_rpm'.format(namespace)):
-
-                            # <rpmdamphalflife>1</rpmdamphalflife>
-                            try:
-                                sub_dict['dampening_half_life_time'] = \
-                                    rpm_root.find('{}rpmdamphalflife'.format(namespace)).text
-                            except Exception:
-                                pass
-
-                            # <rpmdampsuppress>30</rpmdampsuppress>
-                            try:
-                                sub_dict['dampening_suppress_time'] = \
-                                    rpm_root.find('{}rpmdampsuppress'.format(namespace)).text
-                            except Exception:
-                                pass
-
-                            # <rpmdampreuse>10</rpmdampreuse>
-                            try:
-                                sub_dict['dampening_reuse_time'] = \
-                                    rpm_root.find('{}rpmdampreuse'.format(namespace)).text
-                            except Exception:
-                                pass
-
-                            # <rpmdampsuppresstime>2</rpmdampsuppresstime>
-                            try:
-                                sub_dict['dampening_max_suppress_time'] = \
-                                    rpm_root.find('{}rpmdampsuppresstime'.format(namespace)).text
-                            except Exception:
-                                pass
-
-                            # <rpmdampmaxpenalty>40</rpmdampmaxpenalty>
-                            try:
-                                sub_dict['dampening_max_suppress_penalty'] = \
-                                    rpm_root.find('{}rpmdampmaxpenalty'.format(namespace)).text
-                            except Exception:
-                                pass
+            # <dampconfigured>Configured</dampconfigured>
+            # cli does not have this key
+            sub_dict.update(values)
 
         return etree_dict
 
@@ -7577,235 +7190,125 @@ class ShowBgpAllDampeningFlapStatistics(ShowBgpAllDampeningFlapStatisticsSchema)
         return ret_dict
 
 
+    xml_rows = {
+        'vrf': Row('TABLE_vrf/ROW_vrf', {'vrf-name-out': 'vrf'}),
+        'safi': Row('TABLE_vrf/ROW_vrf/TABLE_afi/ROW_afi/TABLE_safi/ROW_safi',
+                    {'af-name': ('address_family', str.lower)}),
+        'rd': Row('TABLE_vrf/ROW_vrf/TABLE_afi/ROW_afi/TABLE_safi/ROW_safi/'
+                  'TABLE_rd/ROW_rd', {
+            'rd_val': 'rd',
+            'dampeningenabled': 'dampening_enabled',
+            'dampening': 'dampening',
+            'historypaths': ('history_paths', int),
+            'dampenedpaths': ('dampened_paths', int)}),
+        'prefix': Row('TABLE_vrf/ROW_vrf/TABLE_afi/ROW_afi/TABLE_safi/'
+                      'ROW_safi/TABLE_rd/ROW_rd/TABLE_prefix/ROW_prefix', {
+            'ipprefix': 'ipprefix',
+            'ipv6prefix': 'ipv6prefix',
+            'nonipprefix': 'nonipprefix',
+            'status': 'status',
+            'pathtype': 'pathtype',
+            'peer': 'peer',
+            'ipv6peer': 'ipv6peer',
+            'flapcount': ('flaps', int),
+            'duration': 'duration',
+            'reuse': 'reuse_time',
+            'penalty': ('current_penalty', int),
+            'suppresslimit': ('suppress_limit', int),
+            'reuselimit': ('reuse_limit', int),
+            'best': ('best', lambda text: text != 'false')}),
+    }
+
     def xml(self):
         out = self.device.execute(self.xml_command)
 
         etree_dict = {}
-        sub_dict = {}
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        root = ET.fromstring(out)
-
-        # top table root
-        show_root = Common.retrieve_xml_child(root=root, key='show')
-        # get xml namespace
-        # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
-        try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
-            namespace = m.groupdict()['name']
-        except Exception:
-            return etree_dict
-
-        # compare cli command
-        Common.compose_compare_command(root=root, namespace=namespace,
-                                expect_command=self.cli_command)
-
-        # top table root
-        vrf_root = Common.retrieve_xml_child(root=root, key='TABLE_vrf')
-        if not vrf_root:
-            return etree_dict
-
-        # -----   loop vrf  -----
-        for vrf_tree in vrf_root.findall('{}ROW_vrf'.format(namespace)):
-            # vrf
-            try:
-                vrf = vrf_tree.find('{}vrf-name-out'.format(namespace)).text
-            except Exception:
-                break
-
-            # address_family table
-            afi = vrf_tree.find('{}TABLE_afi'.format(namespace))
-
-            # -----   loop address_family  -----
-            for af_root in afi.findall('{}ROW_afi'.format(namespace)):
-
-                # address_family
-                row_safi = af_root.find('{}TABLE_safi'.format(namespace))
-                row_safi = row_safi.find('{}ROW_safi'.format(namespace))
+        rd_values = None
 
-                try:
-                    af = row_safi.find('{}af-name'.format(namespace)).text.lower()
-                except Exception:
-                    continue
-
-                # rd table
-                rd = row_safi.find('{}TABLE_rd'.format(namespace))
-                if not rd:
-                    continue
-                else:
-                    if 'vrf' not in etree_dict:
-                        etree_dict['vrf'] = {}
-                    if vrf not in etree_dict['vrf']:
-                        etree_dict['vrf'][vrf] = {}
-
-                    if 'address_family' not in etree_dict['vrf'][vrf]:
-                        etree_dict['vrf'][vrf]['address_family'] = {}
-                    if af not in etree_dict['vrf'][vrf]['address_family']:
-                        etree_dict['vrf'][vrf]['address_family'][af] = {}
-
-                # -----   loop rd  -----
-                for rd_root in rd.findall('{}ROW_rd'.format(namespace)):
-                    # rd
-                    try:
-                        rd = rd_root.find('{}rd_val'.format(namespace)).text
-                    except Exception:
-                        rd = None
-
-                    # <dampeningenabled>true</dampeningenabled>
-                    try:
-                        dampeningenabled = rd_root.find('{}dampeningenabled'
-                                                        .format(namespace)).text
-                    except Exception:
-                        # <dampening>true</dampening>
-                        try:
-                            dampeningenabled = rd_root.find('{}dampening'
-                                                            .format(namespace)).text
-                        except Exception:
-                            pass
-                            
-                    # <historypaths>0</historypaths>
-                    historypaths = int(rd_root.find('{}historypaths'
-                                                    .format(namespace)).text)
-                    # <dampenedpaths>2</dampenedpaths>
-                    dampenedpaths = int(rd_root.find('{}dampenedpaths'
-                                                     .format(namespace)).text)
-
-                    if rd:
-                        # set default attributes under address family 
-                        # <dampeningenabled>true</dampeningenabled>
-                        if dampeningenabled == 'true':
-                            etree_dict['vrf'][vrf]['address_family'][af]['dampening_enabled'] = True
-
-                        # <historypaths>0</historypaths>
-                        etree_dict['vrf'][vrf]['address_family'][af]['history_paths'] = historypaths
-                        
-                        # <dampenedpaths>2</dampenedpaths>
-                        etree_dict['vrf'][vrf]['address_family'][af]['dampened_paths'] = dampenedpaths
-
-                        if 'route_identifier' not in etree_dict['vrf'][vrf]\
-                            ['address_family'][af]:
-                            etree_dict['vrf'][vrf]['address_family'][af]\
-                                ['route_identifier'] = {}
+        for row, values, parents in iter_rows(out, self.xml_rows,
+                                              command=self.cli_command):
+            if row == 'rd':
+                if values is not rd_values:
+                    # rd without prefix
+                    self._xml_rd(etree_dict, *parents[-2:], values)
+                continue
+            if row != 'prefix':
+                continue
 
-                        if rd not in etree_dict['vrf'][vrf]\
-                            ['address_family'][af]['route_identifier']:
-                            etree_dict['vrf'][vrf]['address_family'][af]\
-                                ['route_identifier'][rd] = {}
+            if parents[-1] is not rd_values:
+                rd_values = parents[-1]
+                sub_dict = self._xml_rd(etree_dict, *parents[-3:])
+            if sub_dict is None:
+                continue
 
-                        sub_dict = etree_dict['vrf'][vrf]['address_family'][af]\
-                            ['route_identifier'][rd]
-                    else:
-                        sub_dict = etree_dict['vrf'][vrf]['address_family'][af]
+            # <ipprefix>10.25.1.0/24</ipprefix>
+            # <ipv6prefix>2001::/112</ipv6prefix>
+            # <nonipprefix>[2]:[0]:[0]:[48]:[0201.02ff.0302]:[32]:[10.81.1.1]/248</nonipprefix>
+            network = None
+            for key in ('ipprefix', 'ipv6prefix', 'nonipprefix'):
+                if key in values:
+                    network = values.pop(key)
+            if network is None:
+                continue
 
-                    # <dampeningenabled>true</dampeningenabled>
-                    if dampeningenabled == 'true':
-                        sub_dict['dampening_enabled'] = True
+            # <ipv6peer>2001:db8:8d82::2002</ipv6peer>
+            if 'ipv6peer' in values:
+                values['peer'] = values.pop('ipv6peer')
+            # <reuse>00:01:40</reuse>
+            if not values.get('reuse_time'):
+                values.pop('reuse_time', None)
 
-                    # <historypaths>0</historypaths>
-                    sub_dict['history_paths'] = historypaths
+            sub_dict.setdefault('network', {}).setdefault(network, {})\
+                .update(values)
 
-                    # <dampenedpaths>2</dampenedpaths>
-                    sub_dict['dampened_paths'] = dampenedpaths
+        return etree_dict
 
-                    # prefix table
-                    prefix = rd_root.find('{}TABLE_prefix'.format(namespace))
-                    if not prefix:
-                        continue
+    @staticmethod
+    def _xml_rd(etree_dict, vrf_values, safi, rd_values):
+        '''fill and return the dict of a ROW_rd, None for an invalid one'''
+        if 'vrf' not in vrf_values or 'address_family' not in safi:
+            return None
+        af_dict = etree_dict.setdefault('vrf', {})\
+            .setdefault(vrf_values['vrf'], {})\
+            .setdefault('address_family', {})\
+            .setdefault(safi['address_family'], {})
+
+        # <dampeningenabled>true</dampeningenabled>
+        # <dampening>true</dampening>
+        enabled = rd_values.get('dampening_enabled',
+                                rd_values.get('dampening')) == 'true'
+        counts = {key: rd_values[key] for key in (
+            'history_paths', 'dampened_paths') if key in rd_values}
+
+        rd = rd_values.get('rd')
+        if rd:
+            # set default attributes under address family
+            if enabled:
+                af_dict['dampening_enabled'] = True
+            af_dict.update(counts)
+            sub_dict = af_dict.setdefault('route_identifier', {})\
+                .setdefault(rd, {})
+        else:
+            sub_dict = af_dict
 
-                    # -----   loop prefix  -----
-                    for prefix_root in prefix.findall('{}ROW_prefix'.format(namespace)):
-
-                        # <ipprefix>10.25.1.0/24</ipprefix>
-                        try:
-                            network = prefix_root.find('{}ipprefix'.format(namespace)).text
-                        except Exception:
-                            pass
-
-                        # ipv6prefix>2001::/112</ipv6prefix>
-                        try:
-                            network = prefix_root.find('{}ipv6prefix'.format(namespace)).text
-                        except Exception:
-                            pass
-
-                        # <nonipprefix>[2]:[0]:[0]:[48]:[0201.02ff.0302]:[32]:[10.81.1.1]/248</nonipprefix>
-                        try:
-                            network = prefix_root.find('{}nonipprefix'.format(namespace)).text
-                        except Exception:
-                            pass
-                           
-                        if 'network' not in sub_dict:
-                            sub_dict['network'] = {}
-
-                        if network not in sub_dict['network']:
-                            sub_dict['network'][network] = {}
-
-                        # <status>d</status>
-                        sub_dict['network'][network]['status'] = \
-                            prefix_root.find('{}status'.format(namespace)).text
-
-                        # <pathtype>e</pathtype>
-                        sub_dict['network'][network]['pathtype'] = \
-                            prefix_root.find('{}pathtype'.format(namespace)).text
-
-                        # <peer>10.106.102.3</peer>
-                        try:
-                            sub_dict['network'][network]['peer'] = \
-                                prefix_root.find('{}peer'.format(namespace)).text
-                        except Exception:
-                            pass
-
-                        # <ipv6peer>2001:db8:8d82::2002</ipv6peer>
-                        try:
-                            sub_dict['network'][network]['peer'] = \
-                                prefix_root.find('{}ipv6peer'.format(namespace)).text
-                        except Exception:
-                            pass
-
-                        # <flapcount>39</flapcount>
-                        sub_dict['network'][network]['flaps'] = \
-                            int(prefix_root.find('{}flapcount'.format(namespace)).text)
-                            
-                        # <duration>00:09:53</duration>
-                        sub_dict['network'][network]['duration'] = \
-                            prefix_root.find('{}duration'.format(namespace)).text
-                            
-                        # <reuse>00:01:40</reuse>
-                        reuse = prefix_root.find('{}reuse'.format(namespace)).text
-                        if reuse:
-                            sub_dict['network'][network]['reuse_time'] = reuse
-                            
-                            
-                        # <penalty>34</penalty>
-                        penalty = prefix_root.find('{}penalty'.format(namespace)).text
-                        if penalty:
-                            sub_dict['network'][network]['current_penalty'] = int(penalty)
-                            
-                        # <suppresslimit>30</suppresslimit>
-                        sub_dict['network'][network]['suppress_limit'] = \
-                            int(prefix_root.find('{}suppresslimit'.format(namespace)).text)
-
-                       # <reuselimit>10</reuselimit>
-                        sub_dict['network'][network]['reuse_limit'] = \
-                            int(prefix_root.find('{}reuselimit'.format(namespace)).text)
-
-                       # <best>false</best>
-                        if prefix_root.find('{}best'.format(namespace)).text == 'false':
-                            sub_dict['network'][network]['best'] = False
-                        else:
-                            sub_dict['network'][network]['best'] = True                                                                                    
-        return etree_dict
+        if enabled:
+            sub_dict['dampening_enabled'] = True
+        sub_dict.update(counts)
+        return sub_dict
 
 
 # ==========================================
 # Parser for 'show bgp all nexthop-database'
 # ==========================================
-class ShowBgpAllNexthopDatabase(ShowBgpVrfAllAllNextHopDatabase):
+class ShowBgpAllNexthopDatabase(JsonContext,
+                                ShowBgpVrfAllAllNextHopDatabase):
     """Parser for:
         show bgp all nexthop-database
         parser class implements detail parsing mechanisms for cli,xml output."""
 
     cli_command = 'show bgp all nexthop-database'
     xml_command = 'show bgp all nexthop-database | xml'
+    json_command = 'show bgp all nexthop-database | json'
     exclude = [
     'resolve_time',
     'rnh_epoch',
@@ -7819,230 +7322,114 @@ class ShowBgpAllNexthopDatabase(ShowBgpVrfAllAllNextHopDatabase):
     def cli(self,output=None):
         return super().cli(cmd=self.cli_command,output=output)
 
+    xml_rows = {
+        'vrf': Row('TABLE_nhvrf/ROW_nhvrf', {'nhvrf-name-out': 'vrf'}),
+        'safi': Row('TABLE_nhvrf/ROW_nhvrf/TABLE_nhafi/ROW_nhafi/'
+                    'TABLE_nhsafi/ROW_nhsafi', {
+            'af-name': ('address_family', str.lower),
+            'nhnoncriticaldelay': ('nexthop_trigger_delay_non_critical', int),
+            'nhcriticaldelay': ('nexthop_trigger_delay_critical', int)}),
+        'nexthop': Row('TABLE_nhvrf/ROW_nhvrf/TABLE_nhafi/ROW_nhafi/'
+                       'TABLE_nhsafi/ROW_nhsafi/TABLE_nexthop/ROW_nexthop', {
+            'ipnexthop-out': 'ipnexthop',
+            'ipv6nexthop-out': 'ipv6nexthop',
+            'refcount': ('refcount', int),
+            'igpmetric': ('igp_cost', int),
+            'multipath': ('multipath', lambda text: 'No' if text == 'false'
+                          else 'Yes'),
+            'igptype': ('igp_route_type', int),
+            'igppref': ('igp_preference', int),
+            'attached': ('attached', lambda text: text != 'false'),
+            'local': ('local', lambda text: text != 'false'),
+            'reachable': ('reachable', lambda text: text != 'false'),
+            'labeled': ('labeled', lambda text: text != 'false'),
+            'filtered': ('filtered', lambda text: text != 'false'),
+            'pendingupdate': ('pending_update', lambda text: text != 'false'),
+            'resolvetime': 'resolve_time',
+            'ribroute': 'rib_route',
+            'ipv6ribroute': 'ipv6ribroute',
+            'nextadvertise': ('metric_next_advertise', str.lower),
+            'rnhepoch': ('rnh_epoch', int)}),
+        'attachedhop': Row('TABLE_nhvrf/ROW_nhvrf/TABLE_nhafi/ROW_nhafi/'
+                           'TABLE_nhsafi/ROW_nhsafi/TABLE_nexthop/ROW_nexthop/'
+                           'TABLE_attachedhops/ROW_attachedhops', {
+            'attachedhop': 'attachedhop',
+            'ipv6attachedhop': 'ipv6attachedhop',
+            'interface': 'attached_nexthop_interface'}),
+    }
+
     def xml(self):
         out = self.device.execute(self.xml_command)
 
-        etree_dict = {}
-        sub_dict = {}
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        root = ET.fromstring(out)
-
-        # top table root
-        show_root = Common.retrieve_xml_child(root=root, key='show')
-        # get xml namespace
-        # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
-        try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
-            namespace = m.groupdict()['name']
-        except Exception:
-            return etree_dict
-
-        # compare cli command
-        Common.compose_compare_command(root=root, namespace=namespace,
-                                expect_command=self.cli_command)
-
-        # top table root
-        vrf_root = Common.retrieve_xml_child(root=root, key='TABLE_nhvrf')
-        if not vrf_root:
-            return etree_dict
-
-        # -----   loop vrf  -----
-        for vrf_tree in vrf_root.findall('{}ROW_nhvrf'.format(namespace)):
-            # vrf
-            try:
-                vrf = vrf_tree.find('{}nhvrf-name-out'.format(namespace)).text
-            except Exception:
-                break
-
-            if 'vrf' not in etree_dict:
-                etree_dict['vrf'] = {}
-            if vrf not in etree_dict['vrf']:
-                etree_dict['vrf'][vrf] = {}
-
-            # address_family table
-            afi = vrf_tree.find('{}TABLE_nhafi'.format(namespace))
-
-            # -----   loop address_family  -----
-            for af_root in afi.findall('{}ROW_nhafi'.format(namespace)):
-
-                # address_family
-                row_safi = af_root.find('{}TABLE_nhsafi'.format(namespace))
-                af_root = row_safi.find('{}ROW_nhsafi'.format(namespace))
-                try:
-                    af = af_root.find('{}af-name'.format(namespace)).text.lower()
-                except Exception:
-                    continue
-
-                if 'address_family' not in etree_dict['vrf'][vrf]:
-                    etree_dict['vrf'][vrf]['address_family'] = {}
-                if af not in etree_dict['vrf'][vrf]['address_family']:
-                    etree_dict['vrf'][vrf]['address_family'][af] = {}
-
-                # af_nexthop_trigger_enable
-                etree_dict['vrf'][vrf]['address_family'][af]\
-                    ['af_nexthop_trigger_enable'] = True
-
-                # <nhnoncriticaldelay>10000</nhnoncriticaldelay>
-                etree_dict['vrf'][vrf]['address_family'][af]\
-                    ['nexthop_trigger_delay_non_critical'] = int(af_root.find('{}nhnoncriticaldelay'
-                                                             .format(namespace)).text)
-                # <nhcriticaldelay>3000</nhcriticaldelay>
-                etree_dict['vrf'][vrf]['address_family'][af]\
-                    ['nexthop_trigger_delay_critical'] = int(af_root.find('{}nhcriticaldelay'
-                                                             .format(namespace)).text)
-
-                # nexthop table
-                next_hop = af_root.find('{}TABLE_nexthop'.format(namespace))
-                if not next_hop:
-                    continue
-
-                # -----   loop nexthop  -----
-                for nexthop_root in next_hop.findall('{}ROW_nexthop'.format(namespace)):
-                    # nexthop
-                    # <ipnexthop-out>192.168.154.1</ipnexthop-out>
-                    try:
-                        nexthop = nexthop_root.find('{}ipnexthop-out'.format(namespace)).text
-                    except Exception:
-                        pass
-
-                    # <ipv6nexthop-out>2001:db8:400::3:1</ipv6nexthop-out>
-                    try:
-                        nexthop = nexthop_root.find('{}ipv6nexthop-out'.format(namespace)).text
-                    except Exception:
-                        pass
-
-                    if 'next_hop' not in etree_dict['vrf'][vrf]\
-                        ['address_family'][af]:
-                        etree_dict['vrf'][vrf]['address_family'][af]\
-                            ['next_hop'] = {}
-
-                    if nexthop not in etree_dict['vrf'][vrf]\
-                        ['address_family'][af]['next_hop']:
-                        etree_dict['vrf'][vrf]['address_family'][af]\
-                            ['next_hop'][nexthop] = {}
-
-                    sub_dict = etree_dict['vrf'][vrf]['address_family'][af]\
-                        ['next_hop'][nexthop]
-
-                    # <refcount>1</refcount>
-                    sub_dict['refcount'] = int(nexthop_root.find(
-                                                '{}refcount'.format(namespace)).text)
-
-                    # <igpmetric>3</igpmetric>
-                    sub_dict['igp_cost'] = \
-                        int(nexthop_root.find('{}igpmetric'.format(namespace)).text)
-
-                    # <multipath>false</multipath>
-                    try:
-                        if nexthop_root.find('{}multipath'.format(namespace)).text == 'false':
-                            sub_dict['multipath'] = 'No'
-                        else:
-                            sub_dict['multipath'] = 'Yes'
-                    except Exception:
-                        pass
-
-                    # <igptype>0</igptype>
-                    sub_dict['igp_route_type'] = \
-                        int(nexthop_root.find('{}igptype'.format(namespace)).text)
+        return self._parse_rows(iter_rows(out, self.xml_rows,
+                                          command=self.cli_command))
 
-                    # <igppref>110</igppref>
-                    sub_dict['igp_preference'] = \
-                        int(nexthop_root.find('{}igppref'.format(namespace)).text)
-
-                    # <attached>false</attached>
-                    if nexthop_root.find('{}attached'.format(namespace)).text == 'false':
-                        sub_dict['attached'] = False
-                    else:
-                        sub_dict['attached'] = True
-
-
-                    # <local>false</local>
-                    if nexthop_root.find('{}local'.format(namespace)).text == 'false':
-                        sub_dict['local'] = False
-                    else:
-                        sub_dict['local'] = True
-
-                    # <reachable>true</reachable>
-                    if nexthop_root.find('{}reachable'.format(namespace)).text == 'false':
-                        sub_dict['reachable'] = False
-                    else:
-                        sub_dict['reachable'] = True
-
-                    # <labeled>true</labeled>
-                    if nexthop_root.find('{}labeled'.format(namespace)).text == 'false':
-                        sub_dict['labeled'] = False
-                    else:
-                        sub_dict['labeled'] = True
-
-                    # <filtered>false</filtered>
-                    if nexthop_root.find('{}filtered'.format(namespace)).text == 'false':
-                        sub_dict['filtered'] = False
-                    else:
-                        sub_dict['filtered'] = True
-
-                    # <pendingupdate>false</pendingupdate>
-                    if nexthop_root.find('{}pendingupdate'.format(namespace)).text == 'false':
-                        sub_dict['pending_update'] = False
-                    else:
-                        sub_dict['pending_update'] = True
+    def json(self, output=None):
+        if output is None:
+            out = self.device.execute(self.json_command)
+        else:
+            out = output
 
-                    # <resolvetime>18:38:21</resolvetime>
-                    sub_dict['resolve_time'] = \
-                        nexthop_root.find('{}resolvetime'.format(namespace)).text
+        tree = loads(out)
+        if tree is None:
+            # '| json' is rejected by the platform
+            if output is not None:
+                raise ValueError("'| json' was rejected, parse the cli "
+                                 "output with cli() instead")
+            return self.cli()
+        return self._parse_rows(iter_json_rows(tree, self.xml_rows))
 
-                    # <ribroute>192.168.154.1/32</ribroute>
-                    try:
-                        sub_dict['rib_route'] = \
-                            nexthop_root.find('{}ribroute'.format(namespace)).text
-                    except Exception:
-                        pass                    
+    def _parse_rows(self, rows):
+        etree_dict = {}
 
-                    # <ipv6ribroute>0::/0</ipv6ribroute>
-                    try:
-                        sub_dict['rib_route'] = \
-                            nexthop_root.find('{}ipv6ribroute'.format(namespace)).text
-                    except Exception:
-                        pass
+        def af_dict(vrf_values, safi):
+            return etree_dict.setdefault('vrf', {})\
+                .setdefault(vrf_values['vrf'], {})\
+                .setdefault('address_family', {})\
+                .setdefault(safi['address_family'], {})
 
-                    # <nextadvertise>Never</nextadvertise>
-                    sub_dict['metric_next_advertise'] = \
-                        nexthop_root.find('{}nextadvertise'.format(namespace)).text.lower()
+        def nexthop_dict(vrf_values, safi, nexthop):
+            # <ipnexthop-out>192.168.154.1</ipnexthop-out>
+            # <ipv6nexthop-out>2001:db8:400::3:1</ipv6nexthop-out>
+            return af_dict(vrf_values, safi).setdefault('next_hop', {})\
+                .setdefault(nexthop.get('ipv6nexthop',
+                                        nexthop.get('ipnexthop')), {})
 
-                    # <rnhepoch>1</rnhepoch>
-                    sub_dict['rnh_epoch'] = \
-                        int(nexthop_root.find('{}rnhepoch'.format(namespace)).text)
+        for row, values, parents in rows:
+            if row == 'vrf':
+                if 'vrf' in values:
+                    etree_dict.setdefault('vrf', {})\
+                        .setdefault(values['vrf'], {})
+                continue
+            if 'vrf' not in parents[0] or (row != 'safi' and
+                                           'address_family' not in parents[1]):
+                continue
 
+            if row == 'safi':
+                if 'address_family' not in values:
+                    continue
+                sub_dict = af_dict(parents[0], values)
+                del values['address_family']
+                sub_dict['af_nexthop_trigger_enable'] = True
+                sub_dict.update(values)
+
+            elif row == 'nexthop':
+                sub_dict = nexthop_dict(*parents, values)
+                values.pop('ipnexthop', None)
+                values.pop('ipv6nexthop', None)
+                # <ipv6ribroute>0::/0</ipv6ribroute>
+                if 'ipv6ribroute' in values:
+                    values['rib_route'] = values.pop('ipv6ribroute')
+                sub_dict.update(values)
 
-                    # attachedhops table
-                    attached = nexthop_root.find('{}TABLE_attachedhops'.format(namespace))
-                    if not attached:
-                        continue
+            else:
+                # <attachedhop>192.168.66.2</attachedhop>
+                # <ipv6attachedhop>fe80::6e9c:edff:fe4d:ff41</ipv6attachedhop>
+                attached = values.pop('ipv6attachedhop',
+                                      values.pop('attachedhop', None))
+                nexthop_dict(*parents).setdefault('attached_nexthop', {})\
+                    .setdefault(attached, {}).update(values)
 
-                    # -----   loop attachedhops  -----
-                    for attach_root in attached.findall('{}ROW_attachedhops'.format(namespace)):
-
-                        # <attachedhop>192.168.66.2</attachedhop>
-                        try:
-                            att_hop = attach_root.find('{}attachedhop'.format(namespace)).text
-                        except Exception:
-                            pass
-
-                        # <ipv6attachedhop>fe80::6e9c:edff:fe4d:ff41</ipv6attachedhop>
-                        try:
-                            att_hop = attach_root.find('{}ipv6attachedhop'.format(namespace)).text
-                        except Exception:
-                            pass
-                           
-                        if 'attached_nexthop' not in sub_dict:
-                            sub_dict['attached_nexthop'] = {}
-
-                        if att_hop not in sub_dict['attached_nexthop']:
-                            sub_dict['attached_nexthop'][att_hop] = {}
-
-                        # <interface>port-channel2.100</interface>
-                        sub_dict['attached_nexthop'][att_hop]['attached_nexthop_interface'] = \
-                            attach_root.find('{}interface'.format(namespace)).text                                                                                                          
         return etree_dict
 
 
@@ -8416,347 +7803,105 @@ class ShowBgpPeerTemplateCmd(ShowBgpPeerTemplateCmdSchema):
         return ret_dict
 
 
+    xml_rows = {
+        'template': Row('TABLE_neighbor/ROW_neighbor', {
+            'templatepeer': 'template',
+            'sourceif': 'source_interface',
+            'lowmemexempt': ('low_mem_exempt', lambda text: text == 'true'),
+            'ttlsecurity': ('logging_neighbor_events',
+                            lambda text: text == 'true'),
+            'passiveonly': ('passive_only', lambda text: text == 'true'),
+            'localas-inactive': ('local_as_inactive',
+                                 lambda text: text == 'true'),
+            'remove-privateas': ('remove_private_as',
+                                 lambda text: text == 'true'),
+            'ttllimit': ('external_bgp_peer_hops_limit', int)}),
+        'vrf': Row('TABLE_neighbor/ROW_neighbor/TABLE_vrf/ROW_vrf',
+                   {'vrf-name': ('vrf', str.lower)}),
+        'inheriting_peer': Row('TABLE_neighbor/ROW_neighbor/TABLE_vrf/ROW_vrf/'
+                               'TABLE_inheritingpeer/ROW_inheritingpeer',
+                               {'inheritingpeer': ('inheriting_peer',
+                                                   str.lower)}),
+        'af': Row('TABLE_neighbor/ROW_neighbor/TABLE_peraf/ROW_peraf/'
+                  'TABLE_persaf/ROW_persaf', {
+            'per-af-name': ('address_family', str.lower),
+            'conditionmap': 'condition_map',
+            'advertisemap': 'advertise_map',
+            'advertisemapstatus': ('advertise_map_status', str.lower),
+            'insoftreconfigallowed': ('in_soft_reconfig_allowed',
+                                      lambda text: text == 'true'),
+            'sendcommunity': ('send_community', lambda text: text == 'true'),
+            'sendextcommunity': ('send_ext_community',
+                                 lambda text: text == 'true'),
+            'thirdpartynexthop': ('third_party_nexthop',
+                                  lambda text: text == 'true'),
+            'asoverride': ('as_override', lambda text: text == 'true'),
+            'peerascheckdisabled': ('peer_as_check_disabled',
+                                    lambda text: text == 'true'),
+            'rrconfigured': ('rr_configured', lambda text: text == 'true'),
+            'localnexthop': 'local_nexthop',
+            'maxpfx': ('max_pfx', int),
+            'soo': 'soo',
+            'weight': ('weight', int),
+            'allowasin': ('allow_as_in', int),
+            'defaultoriginate': ('default_originate',
+                                 lambda text: text == 'true'),
+            'defaultoriginatermap': 'default_originate_route_map',
+            'unsuppress-map': 'unsuppress_map'}),
+        'in_policy': Row('TABLE_neighbor/ROW_neighbor/TABLE_peraf/ROW_peraf/'
+                         'TABLE_persaf/ROW_persaf/TABLE_inpolicy/ROW_inpolicy',
+                         {'inpolicyname': 'name', 'inpolicytype': 'type'}),
+        'out_policy': Row('TABLE_neighbor/ROW_neighbor/TABLE_peraf/ROW_peraf/'
+                          'TABLE_persaf/ROW_persaf/TABLE_outpolicy/'
+                          'ROW_outpolicy',
+                          {'outpolicyname': 'name', 'outpolicytype': 'type'}),
+    }
+
     def xml(self):
         out = self.device.execute(self.xml_command)
 
         etree_dict = {}
-        sub_dict = {}
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        root = ET.fromstring(out)
-
-        # top table root
-        show_root = Common.retrieve_xml_child(root=root, key='show')
-        # get xml namespace
-        # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
-        try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
-            namespace = m.groupdict()['name']
-        except Exception:
-            return etree_dict
-
-        # compare cli command
-        Common.compose_compare_command(root=root, namespace=namespace,
-                                expect_command=self.cli_command)
-
-        # top table root
-        root = Common.retrieve_xml_child(root=root, key='TABLE_neighbor')
-        if not root:
-            return etree_dict
-
-        # -----   loop vrf  -----
-        for peer_tree in root.findall('{}ROW_neighbor'.format(namespace)):
-            # vrf
-            try:
-                template = peer_tree.find('{}templatepeer'.format(namespace)).text
-            except Exception:
-                break
-
-            if 'template' not in etree_dict:
-                etree_dict['template'] = {}
-            if template not in etree_dict['template']:
-                etree_dict['template'][template] = {}
-
-            # <sourceif>loopback1</sourceif>
-            try:
-                etree_dict['template'][template]['source_interface'] = \
-                    peer_tree.find('{}sourceif'.format(namespace)).text
-            except Exception:
-                pass
-
-            # <lowmemexempt>true</lowmemexempt>
-            try:
-                if peer_tree.find('{}lowmemexempt'.format(namespace)).text == 'true':
-                    etree_dict['template'][template]['low_mem_exempt'] = True
-                else:
-                    etree_dict['template'][template]['low_mem_exempt'] = False
-            except Exception:
-                pass
-
-            # <ttlsecurity>false</ttlsecurity>
-            if peer_tree.find('{}ttlsecurity'.format(namespace)).text == 'true':
-                etree_dict['template'][template]['logging_neighbor_events'] = True
-            else:
-                etree_dict['template'][template]['logging_neighbor_events'] = False
-
-            # <passiveonly>true</passiveonly>
-            if peer_tree.find('{}passiveonly'.format(namespace)).text == 'true':
-                etree_dict['template'][template]['passive_only'] = True
-            else:
-                etree_dict['template'][template]['passive_only'] = False
-
-            # <localas-inactive>false</localas-inactive>
-            if peer_tree.find('{}localas-inactive'.format(namespace)).text == 'true':
-                etree_dict['template'][template]['local_as_inactive'] = True
-            else:
-                etree_dict['template'][template]['local_as_inactive'] = False
-
-            # <remove-privateas>false</remove-privateas>
-            if peer_tree.find('{}remove-privateas'.format(namespace)).text == 'true':
-                etree_dict['template'][template]['remove_private_as'] = True
-            else:
-                etree_dict['template'][template]['remove_private_as'] = False
-
-            # <ttllimit>100</ttllimit>
-            try:
-                etree_dict['template'][template]['external_bgp_peer_hops_limit'] = \
-                    int(peer_tree.find('{}ttllimit'.format(namespace)).text)
-            except Exception:
-                pass
-
-             # vrf table
-            vrf_tree = peer_tree.find('{}TABLE_vrf'.format(namespace))
-            if vrf_tree:
-                # -----   loop vrf  -----
-                for vrf_root in vrf_tree.findall('{}ROW_vrf'.format(namespace)):
-                    # <vrf-name>default</vrf-name>
-                    try:
-                        vrf = vrf_root.find('{}vrf-name'.format(namespace)).text.lower()
-                    except Exception:
-                        continue
-
-                    # inheritingpeer table
-                    inherit_tree = vrf_root.find('{}TABLE_inheritingpeer'.format(namespace))
-                    if not inherit_tree:
-                        continue
 
-                    # -----   loop inheritingpeer  -----
-                    for inherit_root in inherit_tree.findall('{}ROW_inheritingpeer'
-                                                             .format(namespace)):
+        def template_dict(template):
+            return etree_dict.setdefault('template', {})\
+                .setdefault(template['template'], {})
 
-                        # <inheritingpeer>10.186.201.1</inheritingpeer>
-                        try:
-                            inherit_peer = inherit_root.find('{}inheritingpeer'
-                                                             .format(namespace)).text.lower()
-                        except Exception:
-                            continue
-                        if 'vrf' not in etree_dict['template'][template]:
-                            etree_dict['template'][template]['vrf'] = {}
-                        if vrf not in etree_dict['template'][template]['vrf']:
-                            etree_dict['template'][template]['vrf'][vrf] = {}
-
-                        if 'inheriting_peer' not in etree_dict['template']\
-                            [template]['vrf'][vrf]:
-                            etree_dict['template'][template]['vrf'][vrf]\
-                                ['inheriting_peer'] = {}
-                            
-                        if inherit_peer not in etree_dict['template']\
-                            [template]['vrf'][vrf]['inheriting_peer']:
-                            etree_dict['template'][template]['vrf'][vrf]\
-                                ['inheriting_peer'][inherit_peer] = {}
-
-                        etree_dict['template'][template]['vrf'][vrf]\
-                                ['inheriting_peer'][inherit_peer]['inheriting_peer'] = inherit_peer
-
-
-            # address_family table
-            afi = peer_tree.find('{}TABLE_peraf'.format(namespace))
-
-            # -----   loop address_family  -----
-            for af_root in afi.findall('{}ROW_peraf'.format(namespace)):
+        for row, values, parents in iter_rows(out, self.xml_rows,
+                                              command=self.cli_command):
+            if row == 'template':
+                if 'template' in values:
+                    sub_dict = template_dict(values)
+                    del values['template']
+                    sub_dict.update(values)
+                continue
+            if 'template' not in parents[0]:
+                continue
 
-                try:
-                    # address_family
-                    row_safi = af_root.find('{}TABLE_persaf'.format(namespace))
-                    af_root = row_safi.find('{}ROW_persaf'.format(namespace))
-                    af = af_root.find('{}per-af-name'.format(namespace)).text.lower()
-                except Exception:
+            if row == 'inheriting_peer':
+                if 'vrf' not in parents[1] or 'inheriting_peer' not in values:
                     continue
+                # <inheritingpeer>10.186.201.1</inheritingpeer>
+                template_dict(parents[0]).setdefault('vrf', {})\
+                    .setdefault(parents[1]['vrf'], {})\
+                    .setdefault('inheriting_peer', {})\
+                    .setdefault(values['inheriting_peer'], {})\
+                    .update(values)
+
+            elif row == 'af':
+                if 'address_family' not in values:
+                    continue
+                template_dict(parents[0]).setdefault('address_family', {})\
+                    .setdefault(values.pop('address_family'), {})\
+                    .update(values)
 
-                if 'address_family' not in etree_dict['template'][template]:
-                    etree_dict['template'][template]['address_family'] = {}
-                if af not in etree_dict['template'][template]['address_family']:
-                    etree_dict['template'][template]['address_family'][af] = {}
-
-                sub_dict = etree_dict['template'][template]['address_family'][af]
-
-                # <conditionmap>DENY_ALL_RM</conditionmap>
-                try:
-                    sub_dict['condition_map'] = \
-                        af_root.find('{}conditionmap'.format(namespace)).text
-                except Exception:
-                    pass
-
-                # <advertisemap>BLOCK-ALL</advertisemap>
-                try:
-                    sub_dict['advertise_map'] = \
-                        af_root.find('{}advertisemap'.format(namespace)).text
-                except Exception:
-                    pass
-
-                # <advertisemapstatus>Advertise</advertisemapstatus>
-                try:
-                    sub_dict['advertise_map_status'] = \
-                        af_root.find('{}advertisemapstatus'.format(namespace)).text.lower()
-                except Exception:
-                    pass
-
-                try:
-                    # <insoftreconfigallowed>false</insoftreconfigallowed>
-                    if af_root.find('{}insoftreconfigallowed'.format(namespace)).text == 'true':
-                        sub_dict['in_soft_reconfig_allowed'] = True
-                    else:
-                        sub_dict['in_soft_reconfig_allowed'] = False
-                except Exception:
-                    pass
-
-                # <sendcommunity>true</sendcommunity>
-                try:
-                    if af_root.find('{}sendcommunity'.format(namespace)).text == 'true':
-                        sub_dict['send_community'] = True
-                    else:
-                        sub_dict['send_community'] = False
-                except Exception:
-                    pass
-
-                # <sendextcommunity>true</sendextcommunity>
-                try:
-                    if af_root.find('{}sendextcommunity'.format(namespace)).text == 'true':
-                        sub_dict['send_ext_community'] = True
-                    else:
-                        sub_dict['send_ext_community'] = False
-                except Exception:
-                    pass
-
-                # <thirdpartynexthop>false</thirdpartynexthop>
-                try:
-                    if af_root.find('{}thirdpartynexthop'.format(namespace)).text == 'true':
-                        sub_dict['third_party_nexthop'] = True
-                    else:
-                        sub_dict['third_party_nexthop'] = False
-                except Exception:
-                    pass
-
-                # <asoverride>true</asoverride>
-                try:
-                    if af_root.find('{}asoverride'.format(namespace)).text == 'true':
-                        sub_dict['as_override'] = True
-                    else:
-                        sub_dict['as_override'] = False
-                except Exception:
-                    pass
-
-                # <peerascheckdisabled>false</peerascheckdisabled>
-                try:
-                    if af_root.find('{}peerascheckdisabled'.format(namespace)).text == 'true':
-                        sub_dict['peer_as_check_disabled'] = True
-                    else:
-                        sub_dict['peer_as_check_disabled'] = False
-                except Exception:
-                    pass
-
-                # <rrconfigured>false</rrconfigured>
-                try:
-                    if af_root.find('{}rrconfigured'.format(namespace)).text == 'true':
-                        sub_dict['rr_configured'] = True
-                    else:
-                        sub_dict['rr_configured'] = False
-                except:
-                    Exception
-
-                # <localnexthop>0.0.0.0</localnexthop>
-                try:
-                    sub_dict['local_nexthop'] = \
-                        af_root.find('{}localnexthop'.format(namespace)).text
-                except Exception:
-                    pass
-
-                # <maxpfx>888888888</maxpfx>
-                try:
-                    sub_dict['max_pfx'] = \
-                        int(af_root.find('{}maxpfx'.format(namespace)).text)
-                except Exception:
-                    pass
-
-                # <soo>SOO:10.4.1.1:100</soo>
-                try:
-                    sub_dict['soo'] = \
-                        af_root.find('{}soo'.format(namespace)).text
-                except Exception:
-                    pass
-
-                # <weight>9999</weight>
-                try:
-                    sub_dict['weight'] = \
-                        int(af_root.find('{}weight'.format(namespace)).text)
-                except Exception:
-                    pass
-
-                # <allowasin>10</allowasin>
-                try:
-                    sub_dict['allow_as_in'] = \
-                        int(af_root.find('{}allowasin'.format(namespace)).text)
-                except Exception:
-                    pass
-
-                # <defaultoriginate>true</defaultoriginate>
-                try:
-                    if af_root.find('{}defaultoriginate'.format(namespace)).text == 'true':
-                        sub_dict['default_originate'] = True
-                    else:
-                        sub_dict['default_originate'] = False
-                except Exception:
-                    pass
-
-                # <defaultoriginatermap>PASS-ALL</defaultoriginatermap>
-                try:
-                    sub_dict['default_originate_route_map'] = \
-                        af_root.find('{}defaultoriginatermap'.format(namespace)).text
-                except Exception:
-                    pass
-
-                # <unsuppress-map>ORIGINATE_IPV6</unsuppress-map>
-                try:
-                    sub_dict['unsuppress_map'] = \
-                        af_root.find('{}unsuppress-map'.format(namespace)).text
-                except Exception:
-                    pass
-                
-
-                # TABLE_inpolicy table
-                policy = af_root.find('{}TABLE_inpolicy'.format(namespace))
-
-                if policy:
-                    # -----   loop in policy  -----
-                    for policy_root in policy.findall('{}ROW_inpolicy'.format(namespace)):
-                        try:
-                            policy = policy_root.find('{}inpolicyname'.format(namespace)).text
-                        except Exception:
-                            continue
-
-                        if 'in_policy' not in sub_dict:
-                            sub_dict['in_policy'] = {}
-                        if policy not in sub_dict['in_policy']:
-                            sub_dict['in_policy'][policy] = {}
-
-                        sub_dict['in_policy'][policy]['name'] = policy
-
-                        # <inpolicytype>route-map</inpolicytype>
-                        sub_dict['in_policy'][policy]['type'] = \
-                            policy_root.find('{}inpolicytype'.format(namespace)).text
-
-                # TABLE_outpolicy table
-                policy = af_root.find('{}TABLE_outpolicy'.format(namespace))
-
-                if policy:
-                    # -----   loop in policy  -----
-                    for policy_root in policy.findall('{}ROW_outpolicy'.format(namespace)):
-                        try:
-                            policy = policy_root.find('{}outpolicyname'.format(namespace)).text
-                        except Exception:
-                            continue
-                        if 'out_policy' not in sub_dict:
-                            sub_dict['out_policy'] = {}
-                        if policy not in sub_dict['out_policy']:
-                            sub_dict['out_policy'][policy] = {}
-
-                        sub_dict['out_policy'][policy]['name'] = policy
-
-                        # <outpolicytype>route-map</outpolicytype>
-                        sub_dict['out_policy'][policy]['type'] = \
-                            policy_root.find('{}outpolicytype'.format(namespace)).text
+            elif row in ('in_policy', 'out_policy'):
+                if 'address_family' not in parents[1] or 'name' not in values:
+                    continue
+                template_dict(parents[0]).setdefault('address_family', {})\
+                    .setdefault(parents[1]['address_family'], {})\
+                    .setdefault(row, {}).setdefault(values['name'], {})\
+                    .update(values)
 
-                                                                                                                         
         return etree_dict
 
 
@@ -8946,161 +8091,61 @@ class ShowBgpPolicyStatisticsParser(ShowBgpPolicyStatisticsSchema):
         return ret_dict
 
 
+    xml_rows = {
+        'vrf': Row('TABLE_vrf/ROW_vrf', {
+            'vrf-name-polstats': 'vrf',
+            'rpm-handle-count': ('rpm_handle_count', int)}),
+        'rmap': Row('TABLE_vrf/ROW_vrf/TABLE_rmap/ROW_rmap', {
+            'name': ('name', lambda text: text.replace('&gt;', '>')),
+            'action': 'action',
+            'seqnum': ('seq_num', int),
+            'totalacceptcount': ('total_accept_count', int),
+            'totalrejectcount': ('total_reject_count', int)}),
+        'cmd': Row('TABLE_vrf/ROW_vrf/TABLE_rmap/ROW_rmap/TABLE_cmd/ROW_cmd', {
+            'command': ('command',
+                        lambda text: text.strip().replace('&gt;', '>')),
+            'comparecount': ('compare_count', int),
+            'matchcount': ('match_count', int)}),
+    }
+
     def xml(self, cmd):
         out = self.device.execute('{cmd} | xml'.format(cmd=cmd))
 
         etree_dict = {}
-        neighbor = None
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        root = ET.fromstring(out)
-
-        # top table root
-        show_root = Common.retrieve_xml_child(root=root, key='show')
-        # get xml namespace
-        # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
-        try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
-            namespace = m.groupdict()['name']
-        except Exception:
-            return etree_dict
-
-        # compare cli command
-        Common.compose_compare_command(root=root, namespace=namespace,
-                                       expect_command=cmd)
-
-        # get neighbor
-        nei = Common.retrieve_xml_child(root=root, key='__XML__PARAM__neighbor-id')
-
-        if hasattr(nei, 'tag'):
-            for item in nei.getchildren():
-                if '__XML__value' in item.tag:
-                    neighbor = item.text
-                    continue
-
-                # cover the senario that __readonly__ may be mssing when
-                # there are values in the output
-                if '__readonly__' in item.tag:
-                    root = item.getchildren()[0]
-                else:
-                    root = item
-        else:
-            # top table rootl
-            root = Common.retrieve_xml_child(root=root, key='TABLE_vrf')
-
-        if not root:
-            return etree_dict
-
-        # -----   loop vrf  -----
-        for vrf_tree in root.findall('{}ROW_vrf'.format(namespace)):
-            # vrf
-            try:
-                vrf = vrf_tree.find('{}vrf-name-polstats'.format(namespace)).text
-            except Exception:
-                break
+        rmap = None
 
-            if 'vrf' not in etree_dict:
-                etree_dict['vrf'] = {}
-            if vrf not in etree_dict['vrf']:
-                etree_dict['vrf'][vrf] = {}
+        def rmap_dict(vrf_values, rmap):
+            # a route map listed again gets the next index
+            route_map = etree_dict.setdefault('vrf', {})\
+                .setdefault(vrf_values['vrf'], {})\
+                .setdefault('route_map', {})\
+                .setdefault(rmap['name'], {})
+            return route_map.setdefault(len(route_map) + 1, {})
 
-            # <rpm-handle-count>1</rpm-handle-count>
-            etree_dict['vrf'][vrf]['rpm_handle_count'] = \
-                int(vrf_tree.find('{}rpm-handle-count'.format(namespace)).text)
-
-             # route_map table
-            rpm_tree = vrf_tree.find('{}TABLE_rmap'.format(namespace))
-            if not rpm_tree:
+        for row, values, parents in iter_rows(out, self.xml_rows,
+                                              command=cmd):
+            if row == 'vrf':
+                if 'vrf' in values:
+                    etree_dict.setdefault('vrf', {})\
+                        .setdefault(values.pop('vrf'), {}).update(values)
+                continue
+            if 'vrf' not in parents[0]:
                 continue
 
-            # -----   loop route_map  -----
-            for rmp_root in rpm_tree.findall('{}ROW_rmap'.format(namespace)):
-                # route map
-                try:
-                    name = rmp_root.find('{}name'.format(namespace)).text
-                    name = name.replace('&gt;', '>')
-                except Exception:
-                    continue
-
-                if 'route_map' not in etree_dict['vrf'][vrf]:
-                    etree_dict['vrf'][vrf]['route_map'] = {}
-
-                if name not in etree_dict['vrf'][vrf]['route_map']:
-                    etree_dict['vrf'][vrf]['route_map'][name] = {}
-                    # initial index
-                    index = 1
-                else:
-                    index += 1
-                    
-                if index not in etree_dict['vrf'][vrf]['route_map'][name]:
-                    etree_dict['vrf'][vrf]['route_map'][name][index] = {}
-
-
-                # <action>deny</action>
-                try:
-                    etree_dict['vrf'][vrf]['route_map'][name][index]['action'] = \
-                        rmp_root.find('{}action'.format(namespace)).text
-                except Exception:
-                    pass
-
-                # <seqnum>10</seqnum>
-                try:
-                    etree_dict['vrf'][vrf]['route_map'][name][index]['seq_num'] = \
-                        int(rmp_root.find('{}seqnum'.format(namespace)).text)
-                except Exception:
-                    pass
-
-                # <totalacceptcount>0</totalacceptcount>
-                try:
-                    etree_dict['vrf'][vrf]['route_map'][name][index]['total_accept_count'] = \
-                        int(rmp_root.find('{}totalacceptcount'.format(namespace)).text)
-                except Exception:
-                    pass
-
-                # <totalrejectcount>2</totalrejectcount>
-                try:
-                    etree_dict['vrf'][vrf]['route_map'][name][index]['total_reject_count'] = \
-                        int(rmp_root.find('{}totalrejectcount'.format(namespace)).text)
-                except Exception:
-                    pass
-
-
-                # TABLE_cmd table
-                command = rmp_root.find('{}TABLE_cmd'.format(namespace))
-
-                if not command:
+            if row == 'rmap':
+                if 'name' not in values:
                     continue
+                if values is not rmap:
+                    sub_dict = rmap_dict(parents[0], values)
+                del values['name']
+                sub_dict.update(values)
 
-                # -----   loop command  -----
-                for command_root in command.findall('{}ROW_cmd'.format(namespace)):
-                    try:
-                        cmd_str = command_root.find('{}command'.format(namespace)).text.strip()
-                        cmd_str = cmd_str.replace('&gt;', '>')
-                    except Exception:
-                        continue
-
-                    if 'command' not in etree_dict['vrf'][vrf]['route_map'][name][index]:
-                        etree_dict['vrf'][vrf]['route_map'][name][index]['command'] = {}
-
-                    # command
-                    etree_dict['vrf'][vrf]['route_map'][name][index]\
-                        ['command']['command'] = cmd_str
+            elif 'name' in parents[1] and 'command' in values:
+                if parents[1] is not rmap:
+                    rmap = parents[1]
+                    sub_dict = rmap_dict(*parents)
+                sub_dict.setdefault('command', {}).update(values)
 
-                    # <comparecount>2</comparecount>
-                    try:
-                        etree_dict['vrf'][vrf]['route_map'][name][index]\
-                            ['command']['compare_count'] = \
-                                int(command_root.find('{}comparecount'.format(namespace)).text)
-                    except Exception:
-                        pass
-                    
-                    # <matchcount>0</matchcount>
-                    try:
-                        etree_dict['vrf'][vrf]['route_map'][name][index]\
-                            ['command']['match_count'] = \
-                                int(command_root.find('{}matchcount'.format(namespace)).text)
-                    except Exception:
-                        pass
         return etree_dict
 
 # ===============================================================================
@@ -9243,12 +8288,14 @@ class ShowBgpSessionsSchema(MetaParser):
 # =========================================
 # Parser for 'show bgp sessions vrf <WORD>'
 # =========================================
-class ShowBgpSessions(ShowBgpSessionsSchema):
+class ShowBgpSessions(JsonContext, ShowBgpSessionsSchema):
     """Parser for:
         show bgp sessions"""
 
     cli_command = ['show bgp sessions vrf {vrf}','show bgp sessions']
     xml_command = ['show bgp sessions vrf {vrf} | xml','show bgp sessions | xml']
+    json_command = ['show bgp sessions vrf {vrf} | json',
+                    'show bgp sessions | json']
     exclude = ['last_read', 'last_write']
 
     def cli(self, vrf='',output=None):
@@ -9374,6 +8421,31 @@ class ShowBgpSessions(ShowBgpSessionsSchema):
 
         return ret_dict
 
+    xml_rows = {
+        'sessions': Row('', {
+            'totalpeers': ('total_peers', int),
+            'totalestablishedpeers': ('total_established_peers', int),
+            'localas': ('local_as', int)}),
+        'vrf': Row('TABLE_vrf/ROW_vrf', {
+            'vrf-name-out': 'vrf',
+            'local-as': ('local_as', int),
+            'vrfpeers': ('vrf_peers', int),
+            'vrfestablishedpeers': ('vrf_established_peers', int),
+            'router-id': 'router_id'}),
+        'neighbor': Row('TABLE_vrf/ROW_vrf/TABLE_neighbor/ROW_neighbor', {
+            'neighbor-id': 'neighbor',
+            'connectionsdropped': ('connections_dropped', int),
+            'remoteas': ('remote_as', int),
+            'lastflap': 'last_flap',
+            'lastread': 'last_read',
+            'lastwrite': 'last_write',
+            'state': ('state', str.lower),
+            'localport': ('local_port', int),
+            'remoteport': ('remote_port', int),
+            'notificationssent': ('notifications_sent', int),
+            'notificationsreceived': ('notifications_received', int)}),
+    }
+
     def xml(self, vrf=''):
         if vrf:
             cmd = self.xml_command[0].format(vrf=vrf)
@@ -9384,186 +8456,55 @@ class ShowBgpSessions(ShowBgpSessionsSchema):
 
         out = self.device.execute(cmd)
 
-        etree_dict = {}
-
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        root = ET.fromstring(out)
-
-        # top table root
-        show_root = Common.retrieve_xml_child(root=root, key='show')
-        # get xml namespace
-        # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
-        try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
-            namespace = m.groupdict()['name']
-        except Exception:
-            return etree_dict
-
-        # compare cli command
-        Common.compose_compare_command(root=root, namespace=namespace,
-                                       expect_command=cli_cmd)
-
-        ret = Common.retrieve_xml_child(
-                root=root,
-                key='__readonly__')
-
-        if hasattr(ret, 'tag'):
-            # get total_peers                
-            try:
-                total_peers = ret.find('{}totalpeers'.format(namespace)).text
-                etree_dict['total_peers'] = int(total_peers)
-            except Exception:
-                pass
-
-            # get total_established_peers            
-            try:
-                total_established_peers = ret.find(
-                    '{}totalestablishedpeers'.format(namespace)).text
-                etree_dict['total_established_peers'] = int(total_established_peers)
-            except Exception:
-                pass
-
-            # get local_as               
-            try:
-                local_as = ret.find('{}localas'.format(namespace)).text
-                etree_dict['local_as'] = int(local_as)
-            except Exception:
-                pass
+        return self._parse_rows(iter_rows(out, self.xml_rows,
+                                          command=cli_cmd))
 
+    def json(self, vrf='', output=None):
+        if output is None:
+            if vrf:
+                cmd = self.json_command[0].format(vrf=vrf)
+            else:
+                cmd = self.json_command[1]
+            out = self.device.execute(cmd)
         else:
-            # output is empty
-            return etree_dict
-
-        # find Vrf root
-        root = ret.find('{}TABLE_vrf'.format(namespace))
-
-        if not root:
-            return etree_dict
-
-        # -----   loop vrf  -----
-        for vrf_tree in root.findall('{}ROW_vrf'.format(namespace)):
-            # vrf
-            try:
-                vrf = vrf_tree.find('{}vrf-name-out'.format(namespace)).text
-            except Exception:
-                break
-
-            if 'vrf' not in etree_dict:
-                etree_dict['vrf'] = {}
-            if vrf not in etree_dict['vrf']:
-                etree_dict['vrf'][vrf] = {}
-
-            # <local-as>333</local-as>
-            etree_dict['vrf'][vrf]['local_as'] = \
-                int(vrf_tree.find('{}local-as'.format(namespace)).text)
-
-            # <vrfpeers>3</vrfpeers>
-            etree_dict['vrf'][vrf]['vrf_peers'] = \
-                int(vrf_tree.find('{}vrfpeers'.format(namespace)).text)
-
-            # <vrfestablishedpeers>2</vrfestablishedpeers>
-            etree_dict['vrf'][vrf]['vrf_established_peers'] = \
-                int(vrf_tree.find('{}vrfestablishedpeers'.format(namespace)).text)
-                
-            # <router-id>10.106.0.6</router-id>
-            etree_dict['vrf'][vrf]['router_id'] = \
-                vrf_tree.find('{}router-id'.format(namespace)).text
-                
-             # Neighbor table
-            nei_tree = vrf_tree.find('{}TABLE_neighbor'.format(namespace))
-            if not nei_tree:
-                continue
-
-            # -----   loop neighbors  -----
-            for nei_root in nei_tree.findall('{}ROW_neighbor'.format(namespace)):
-                # neighbor
-                try:
-                    nei = nei_root.find('{}neighbor-id'.format(namespace)).text
-                except Exception:
-                    continue
+            out = output
 
-                if 'neighbor' not in etree_dict['vrf'][vrf]:
-                    etree_dict['vrf'][vrf]['neighbor'] = {}
+        tree = loads(out)
+        if tree is None:
+            # '| json' is rejected by the platform
+            if output is not None:
+                raise ValueError("'| json' was rejected, parse the cli "
+                                 "output with cli() instead")
+            return self.cli(vrf=vrf)
+        return self._parse_rows(iter_json_rows(tree, self.xml_rows))
 
-                if nei not in etree_dict['vrf'][vrf]['neighbor']:
-                    etree_dict['vrf'][vrf]['neighbor'][nei] = {}
+    def _parse_rows(self, rows):
+        etree_dict = {}
 
-                # <connectionsdropped>0</connectionsdropped>
-                try:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['connections_dropped'] = \
-                        int(nei_root.find('{}connectionsdropped'.format(namespace)).text)
-                except Exception:
-                    pass
+        for row, values, parents in rows:
+            if row == 'sessions':
+                etree_dict.update(values)
+                continue
+            vrf_values = values if row == 'vrf' else parents[-1]
+            if 'vrf' not in vrf_values:
+                continue
+            vrf_dict = etree_dict.setdefault('vrf', {})\
+                .setdefault(vrf_values['vrf'], {})
 
-                # <remoteas>333</remoteas>
-                try:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['remote_as'] = \
-                        int(nei_root.find('{}remoteas'.format(namespace)).text)
-                except Exception:
-                    pass
+            if row == 'vrf':
+                del values['vrf']
+                vrf_dict.update(values)
 
+            elif 'neighbor' in values:
                 # <lastflap>PT1H4M41S</lastflap>
-                try:
-                    ret = nei_root.find('{}lastflap'.format(namespace)).text
-                    ret = Common.convert_xml_time(ret)
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['last_flap'] = \
-                        'never' if 'P' in ret else ret
-                except Exception:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['last_flap'] = 'never'
-                    
-                # <lastread>PT47S</lastread>
-                try:
-                    ret = nei_root.find('{}lastread'.format(namespace)).text
-                    ret = Common.convert_xml_time(ret)
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['last_read'] = \
-                        'never' if 'P' in ret else ret
-                except Exception:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['last_read'] = 'never'
-                    
-                # <lastwrite>PT15S</lastwrite>
-                try:
-                    ret = nei_root.find('{}lastwrite'.format(namespace)).text
-                    ret = Common.convert_xml_time(ret)
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['last_write'] = \
-                        'never' if 'P' in ret else ret
-                except Exception:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['last_write'] = 'never'
-                    
-                # <state>Established</state>
-                try:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['state'] = \
-                        nei_root.find('{}state'.format(namespace)).text.lower()
-                except Exception:
-                    pass
-                    
-                # <localport>179</localport>
-                try:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['local_port'] = \
-                        int(nei_root.find('{}localport'.format(namespace)).text)
-                except Exception:
-                    pass
-                    
-                # <remoteport>48392</remoteport>
-                try:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['remote_port'] = \
-                        int(nei_root.find('{}remoteport'.format(namespace)).text)
-                except Exception:
-                    pass
-                    
-                # <notificationssent>0</notificationssent>
-                try:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['notifications_sent'] = \
-                        int(nei_root.find('{}notificationssent'.format(namespace)).text)
-                except Exception:
-                    pass
-                    
-                # <notificationsreceived>0</notificationsreceived>
-                try:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['notifications_received'] = \
-                        int(nei_root.find('{}notificationsreceived'.format(namespace)).text)
-                except Exception:
-                    pass                    
+                for key in ('last_flap', 'last_read', 'last_write'):
+                    try:
+                        ret = Common.convert_xml_time(values[key])
+                        values[key] = 'never' if 'P' in ret else ret
+                    except Exception:
+                        values[key] = 'never'
+                vrf_dict.setdefault('neighbor', {})\
+                    .setdefault(values.pop('neighbor'), {}).update(values)
 
         return etree_dict
 
@@ -9636,12 +8577,14 @@ class ShowBgpLabelsSchema(MetaParser):
 # ========================================================
 # Parser for 'show bgp <address_family> labels vrf <WORD>'
 # ========================================================
-class ShowBgpLabels(ShowBgpLabelsSchema):
+class ShowBgpLabels(JsonContext, ShowBgpLabelsSchema):
     """Parser for:
         show bgp <address_family> labels [vrf <WROD>]"""
 
     cli_command = ['show bgp {address_family} labels vrf {vrf}','show bgp {address_family} labels']
     xml_command = ['show bgp {address_family} labels vrf {vrf} | xml','show bgp {address_family} labels | xml']
+    json_command = ['show bgp {address_family} labels vrf {vrf} | json',
+                    'show bgp {address_family} labels | json']
     exclude = [
       'table_version']
 
@@ -9825,6 +8768,38 @@ class ShowBgpLabels(ShowBgpLabelsSchema):
 
         return ret_dict
 
+    xml_rows = {
+        'vrf': Row('TABLE_vrf/ROW_vrf', {'vrf-name-out': 'vrf'}),
+        'safi': Row('TABLE_vrf/ROW_vrf/TABLE_afi/ROW_afi/TABLE_safi/ROW_safi', {
+            'af-name': ('address_family', str.lower),
+            'table-version': ('table_version', int),
+            'router-id': 'router_id'}),
+        'rd': Row('TABLE_vrf/ROW_vrf/TABLE_afi/ROW_afi/TABLE_safi/ROW_safi/'
+                  'TABLE_rd/ROW_rd', {
+            'rd_val': 'rd',
+            'rd_vrf': 'rd_vrf'}),
+        'prefix': Row('TABLE_vrf/ROW_vrf/TABLE_afi/ROW_afi/TABLE_safi/'
+                      'ROW_safi/TABLE_rd/ROW_rd/TABLE_prefix/ROW_prefix', {
+            'ipprefix': 'ipprefix',
+            'ipv6prefix': 'ipv6prefix'}),
+        'path': Row('TABLE_vrf/ROW_vrf/TABLE_afi/ROW_afi/TABLE_safi/ROW_safi/'
+                    'TABLE_rd/ROW_rd/TABLE_prefix/ROW_prefix/TABLE_path/'
+                    'ROW_path', {
+            'pathnr': ('index', int),
+            'status': 'status',
+            'best': ('best_path', lambda text: 'none' not in text),
+            'type': 'type',
+            'statuscode': 'status_code',
+            'bestcode': 'best_code',
+            'typecode': 'type_code',
+            'ipnexthop': 'ipnexthop',
+            'ipv6nexthop': 'ipv6nexthop',
+            'inlabel': 'in_label',
+            'outlabel': 'out_label',
+            'vpn': 'vpn',
+            'hold_down': 'hold_down'}),
+    }
+
     def xml(self, address_family, vrf=''):
         assert address_family in ['ipv4 unicast', 'ipv4 multicast',
                                   'ipv6 unicast', 'ipv6 multicast',
@@ -9840,226 +8815,124 @@ class ShowBgpLabels(ShowBgpLabelsSchema):
 
         out = self.device.execute(cmd)
 
-        etree_dict = {}
+        return self._parse_rows(iter_rows(out, self.xml_rows,
+                                          command=cli_cmd))
 
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        root = ET.fromstring(out)
-
-        # top table root
-        show_root = Common.retrieve_xml_child(root=root, key='show')
-        # get xml namespace
-        # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
-        try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
-            namespace = m.groupdict()['name']
-        except Exception:
-            return etree_dict
-
-        # compare cli command
-        Common.compose_compare_command(root=root, namespace=namespace,
-                                       expect_command=cli_cmd)
-
-        # find Vrf root
-        root = Common.retrieve_xml_child(root=root, key='TABLE_vrf')
-
-        if not root:
-            return etree_dict
-
-        # -----   loop vrf  -----
-        for vrf_tree in root.findall('{}ROW_vrf'.format(namespace)):
-            # vrf
-            try:
-                vrf = vrf_tree.find('{}vrf-name-out'.format(namespace)).text
-            except Exception:
-                break
-
-            # Address family table
-            af_tree = vrf_tree.find('{}TABLE_afi'.format(namespace))
-            if not af_tree:
-                continue
-            for af_root in af_tree.findall('{}ROW_afi'.format(namespace)):
-                # Address family table
-                saf_tree = af_root.find('{}TABLE_safi'.format(namespace))
-                if not saf_tree:
-                    continue
-                # -----   loop address_family  -----
-                for saf_root in saf_tree.findall('{}ROW_safi'.format(namespace)):
-                    # neighbor
-                    try:
-                        af = saf_root.find('{}af-name'.format(namespace)).text
-                        af = af.lower()
-                    except Exception:
-                        continue
-
-                    # <table-version>7</table-version>
-                    try:
-                        table_version = \
-                            int(saf_root.find('{}table-version'.format(namespace)).text)
-                    except Exception:
-                        table_version = None
-
-                    # <router-id>10.106.0.6</router-id>
-                    try:
-                        router_id = \
-                            saf_root.find('{}router-id'.format(namespace)).text
-                    except Exception:
-                        router_id = None
-
-                    if table_version or router_id:
-                        if 'vrf' not in etree_dict:
-                            etree_dict['vrf'] = {}
-                        if vrf not in etree_dict['vrf']:
-                            etree_dict['vrf'][vrf] = {}
-
-                        if 'address_family' not in etree_dict['vrf'][vrf]:
-                            etree_dict['vrf'][vrf]['address_family'] = {}
-
-                        if af not in etree_dict['vrf'][vrf]['address_family']:
-                            etree_dict['vrf'][vrf]['address_family'][af] = {}
-                        if table_version:
-                            etree_dict['vrf'][vrf]['address_family'][af]['table_version'] = table_version
-                        if router_id:
-                            etree_dict['vrf'][vrf]['address_family'][af]['router_id'] = router_id
-
-                     # RD table
-                    rd_tree = saf_root.find('{}TABLE_rd'.format(namespace))
-                    if not rd_tree:
-                        continue
-
-                    # -----   loop rd  -----
-                    for rd_root in rd_tree.findall('{}ROW_rd'.format(namespace)):
-                        # neighbor
-                        try:
-                            rd = rd_root.find('{}rd_val'.format(namespace)).text
-                        except Exception:
-                            rd = None
-
-                        if rd:
-                            if 'route_distinguisher' not in etree_dict['vrf'][vrf]:
-                                etree_dict['vrf'][vrf]['address_family'][af]\
-                                    ['route_distinguisher'] = {}
-
-                            if rd not in etree_dict['vrf'][vrf]['address_family']:
-                                etree_dict['vrf'][vrf]['address_family'][af]\
-                                    ['route_distinguisher'][rd] = {}
-                            sub_dict = etree_dict['vrf'][vrf]['address_family'][af]\
-                                    ['route_distinguisher'][rd]
-                        else:
-                            sub_dict = etree_dict['vrf'][vrf]['address_family'][af]
+    def json(self, address_family, vrf='', output=None):
+        assert address_family in ['ipv4 unicast', 'ipv4 multicast',
+                                  'ipv6 unicast', 'ipv6 multicast',
+                                  'vpnv4 unicast', 'vpnv6 unicast']
 
-                        # <rd_vrf>vrf-9100</rd_vrf>
-                        try:
-                            sub_dict['rd_vrf'] = rd_root.find('{}rd_vrf'.format(namespace)).text
-                        except Exception:
-                            pass
+        if output is None:
+            if vrf:
+                cmd = self.json_command[0].format(
+                    address_family=address_family, vrf=vrf)
+            else:
+                cmd = self.json_command[1].format(
+                    address_family=address_family)
+            out = self.device.execute(cmd)
+        else:
+            out = output
 
-                         # prefix table
-                        prefix_tree = rd_root.find('{}TABLE_prefix'.format(namespace))
-                        if not prefix_tree:
-                            continue
+        tree = loads(out)
+        if tree is None:
+            # '| json' is rejected by the platform
+            if output is not None:
+                raise ValueError("'| json' was rejected, parse the cli "
+                                 "output with cli() instead")
+            return self.cli(address_family=address_family, vrf=vrf)
+        return self._parse_rows(iter_json_rows(tree, self.xml_rows))
 
-                        # -----   loop prefix  -----
-                        for prefix_root in prefix_tree.findall('{}ROW_prefix'.format(namespace)):
-                            # <ipprefix>10.1.1.1</ipprefix>
-                            try:
-                                prefix = prefix_root.find('{}ipprefix'.format(namespace)).text
-                            except Exception:
-                                # <ipv6prefix>2001:db8:4309::/112</ipv6prefix>
-                                try:
-                                    prefix = prefix_root.find('{}ipv6prefix'.format(namespace)).text
-                                except Exception:
-                                    continue 
-
-                            if 'prefix' not in sub_dict:
-                                sub_dict['prefix'] = {}
-
-                            if prefix not in sub_dict['prefix']:
-                                sub_dict['prefix'][prefix] = {}
-
-                             # path table
-                            index_tree = prefix_root.find('{}TABLE_path'.format(namespace))
-                            if not index_tree:
-                                continue
+    def _parse_rows(self, rows):
+        etree_dict = {}
 
-                            # -----   loop path  -----
-                            for index_root in index_tree.findall('{}ROW_path'.format(namespace)):
-                                # neighbor
-                                try:
-                                    index = int(index_root.find('{}pathnr'.format(namespace)).text)
-                                except Exception:
-                                    continue
-
-                                if 'index' not in sub_dict['prefix'][prefix]:
-                                    sub_dict['prefix'][prefix]['index'] = {}
-
-                                if index not in sub_dict['prefix'][prefix]['index']:
-                                    sub_dict['prefix'][prefix]['index'][index] = {}
-
-                                # <status>valid</status>
-                                sub_dict['prefix'][prefix]['index'][index]['status'] = \
-                                    index_root.find('{}status'.format(namespace)).text
-
-                                # <best>bestpath</best>
-                                sub_dict['prefix'][prefix]['index'][index]['best_path'] = \
-                                    False if 'none' in index_root.find('{}best'.format(namespace)).text \
-                                    else True
-
-                                # <type>internal</type>
-                                sub_dict['prefix'][prefix]['index'][index]['type'] = \
-                                    index_root.find('{}type'.format(namespace)).text
-
-                                try:
-                                    # <statuscode>*</statuscode>
-                                    status_code = index_root.find('{}statuscode'.format(namespace)).text
-                                    sub_dict['prefix'][prefix]['index'][index]\
-                                        .setdefault('status_code', status_code) if status_code.strip() else None                                        
-
-                                    # <bestcode>&gt;</bestcode>
-                                    best_code = index_root.find('{}bestcode'.format(namespace)).text
-                                    best_code = '>' if '&gt;' in best_code else best_code.strip()
-                                    if best_code:
-                                        sub_dict['prefix'][prefix]['index'][index]['best_code'] = best_code
-                                       
-                                    # <typecode>i</typecode>
-                                    sub_dict['prefix'][prefix]['index'][index]['type_code'] = \
-                                        index_root.find('{}typecode'.format(namespace)).text
-                                except Exception:
-                                    pass
-
-                                # <ipnexthop>10.106.101.1</ipnexthop>
-                                try:
-                                    sub_dict['prefix'][prefix]['index'][index]['nexthop'] = \
-                                        index_root.find('{}ipnexthop'.format(namespace)).text
-                                except Exception:
-                                    # <ipv6nexthop>2001:db8:1900:1::1:101</ipv6nexthop>
-                                    try:
-                                        sub_dict['prefix'][prefix]['index'][index]['nexthop'] = \
-                                            index_root.find('{}ipv6nexthop'.format(namespace)).text
-                                    except Exception:
-                                        pass
-
-                                # <inlabel>nolabel</inlabel>
-                                sub_dict['prefix'][prefix]['index'][index]['in_label'] = \
-                                    index_root.find('{}inlabel'.format(namespace)).text
-
-                                # <outlabel>nolabel</outlabel>
-                                sub_dict['prefix'][prefix]['index'][index]['out_label'] = \
-                                    index_root.find('{}outlabel'.format(namespace)).text
-
-                                # <vpn></vpn>
-                                vpn = index_root.find('{}vpn'.format(namespace)).text
-                                if vpn:
-                                    sub_dict['prefix'][prefix]['index'][index]['vpn'] = vpn
-                                    
+        def rd_dict(vrf_values, safi, rd):
+            sub_dict = etree_dict.setdefault('vrf', {})\
+                .setdefault(vrf_values['vrf'], {})\
+                .setdefault('address_family', {})\
+                .setdefault(safi['address_family'], {})
+            if rd.get('rd'):
+                sub_dict = sub_dict.setdefault('route_distinguisher', {})\
+                    .setdefault(rd['rd'], {})
+            return sub_dict
+
+        for row, values, parents in rows:
+            if row == 'vrf':
+                continue
+            if 'vrf' not in parents[0] or 'address_family' not in (
+                    values if row == 'safi' else parents[1]):
+                continue
+
+            if row == 'safi':
+                # <table-version>7</table-version>
+                # <router-id>10.106.0.6</router-id>
+                if values.get('table_version') or values.get('router_id'):
+                    sub_dict = rd_dict(parents[0], values, {})
+                    for key in ('table_version', 'router_id'):
+                        if values.get(key):
+                            sub_dict[key] = values[key]
+
+            elif row == 'rd':
+                sub_dict = rd_dict(*parents, values)
+                # <rd_vrf>vrf-9100</rd_vrf>
+                if 'rd_vrf' in values:
+                    sub_dict['rd_vrf'] = values['rd_vrf']
+
+            elif row == 'prefix':
+                # <ipprefix>10.1.1.1</ipprefix>
+                # <ipv6prefix>2001:db8:4309::/112</ipv6prefix>
+                prefix = values.get('ipprefix', values.get('ipv6prefix'))
+                if prefix is not None:
+                    rd_dict(*parents).setdefault('prefix', {})\
+                        .setdefault(prefix, {})
 
-                                # <hold_down></hold_down>
-                                hold_down = index_root.find('{}hold_down'.format(namespace)).text
-                                if hold_down:
-                                    sub_dict['prefix'][prefix]['index'][index]['hold_down'] = hold_down
+            else:
+                prefix = parents[-1].get('ipprefix',
+                                         parents[-1].get('ipv6prefix'))
+                index = values.pop('index', None)
+                if prefix is None or index is None:
+                    continue
+                self._xml_path(values)
+                rd_dict(*parents[:3]).setdefault('prefix', {})\
+                    .setdefault(prefix, {}).setdefault('index', {})\
+                    .setdefault(index, {}).update(values)
 
         return etree_dict
 
+    @staticmethod
+    def _xml_path(values):
+        '''turn the values of a ROW_path into the keys of an index'''
+        status_code = values.pop('status_code', None)
+        best_code = values.pop('best_code', None)
+        has_type_code = 'type_code' in values
+        type_code = values.pop('type_code', None)
+        # <statuscode>*</statuscode>
+        # <bestcode>&gt;</bestcode>
+        # <typecode>i</typecode>
+        if status_code is not None:
+            if status_code.strip():
+                values['status_code'] = status_code
+            if best_code is not None:
+                best_code = '>' if '&gt;' in best_code else best_code.strip()
+                if best_code:
+                    values['best_code'] = best_code
+                if has_type_code:
+                    values['type_code'] = type_code
+
+        # <ipnexthop>10.106.101.1</ipnexthop>
+        # <ipv6nexthop>2001:db8:1900:1::1:101</ipv6nexthop>
+        ipv6_nexthop = values.pop('ipv6nexthop', None)
+        if 'ipnexthop' in values:
+            values['nexthop'] = values.pop('ipnexthop')
+        elif ipv6_nexthop is not None:
+            values['nexthop'] = ipv6_nexthop
+
+        # <vpn></vpn>
+        # <hold_down></hold_down>
+        for key in ('vpn', 'hold_down'):
+            if not values.get(key):
+                values.pop(key, None)
+
 # ====================================================
 #  schema for show bgp l2vpn evpn summary
 # ====================================================
@@ -24,6 +24,9 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional
                                          
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.patterns import Patterns
+from genie.libs.parser.utils.lexer import Lexer
+from genie.libs.parser.utils.parallel import parse_blocks, merge_results
 
 
 # ===========================
@@ -187,16 +190,7 @@ class ShowInterface(ShowInterfaceSchema):
       'in_crc_errors',
       'reliability']
 
-    def cli(self, interface="", output=None):
-        if output is None:
-            if interface:
-                cmd = self.cli_command[1].format(interface=interface)
-            else:
-                cmd = self.cli_command[0]
-            out = self.device.execute(cmd)
-        else:
-            out = output
-
+    patterns = Patterns(
         # Ethernet2/1.10 is down (Administratively down)
         # Vlan1 is down (Administratively down), line protocol is down, autostate enabled
         # Vlan200 is down (VLAN/BD is down), line protocol is down, autostate enabled
@@ -207,262 +201,279 @@ class ShowInterface(ShowInterfaceSchema):
         # Ethernet1/3 is down (XCVR not inserted)
         # Ethernet1/2 is down (SFP validation failed)
         # Ethernet1/4 is down (SFP not inserted)
-        p1 = re.compile(r'^(?P<interface>\S+)\s*is\s*(?P<link_state>(down|up))?'
-                        r'(administratively\s+(?P<admin_1>(down|up)))?\s*'
-                        r'(\(Administratively\s*(?P<admin_2>(down|up))\))?'
-                        r'(\(VLAN\/BD\s+is+\s+(down|up)\))?'
-                        r'(,\s*line\s+protocol\s+is\s+(?P<line_protocol>\w+))?'
-                        r'(,\s+autostate\s+(?P<autostate>\S+))?'
-                        r'(\(Link\s+not\s+connected\))?'
-                        r'(\(SFP\s+validation\s+failed\))?'
-                        r'(\(SFP\s+not\s+inserted\))?'
-                        r'(\(suspended\(.*\)\))?'
-                        r'(\(\S+ErrDisabled\))?'
-                        r'(\(XCVR\s+not\s+inserted\))?'
-                        r'(\(.*ACK.*\))?$')
+        p1=r'^(?P<interface>\S+)\s*is\s*(?P<link_state>(down|up))?'
+           r'(administratively\s+(?P<admin_1>(down|up)))?\s*'
+           r'(\(Administratively\s*(?P<admin_2>(down|up))\))?'
+           r'(\(VLAN\/BD\s+is+\s+(down|up)\))?'
+           r'(,\s*line\s+protocol\s+is\s+(?P<line_protocol>\w+))?'
+           r'(,\s+autostate\s+(?P<autostate>\S+))?'
+           r'(\(Link\s+not\s+connected\))?'
+           r'(\(SFP\s+validation\s+failed\))?'
+           r'(\(SFP\s+not\s+inserted\))?'
+           r'(\(suspended\(.*\)\))?'
+           r'(\(\S+ErrDisabled\))?'
+           r'(\(XCVR\s+not\s+inserted\))?'
+           r'(\(.*ACK.*\))?$',
 
         # admin state is up
         # admin state is up,
         # admin state is up, Dedicated Interface
         # admin state is up, Dedicated Interface, [parent interface is Ethernet2/1]
-        p2 = re.compile(r'^admin +state +is'
-                        r' +(?P<admin_state>([a-zA-Z0-9\/\.]+))(?:,)?'
-                        r'(?: +(?P<dedicated_intf>(Dedicated Interface)))?'
-                        r'(?:, +\[parent +interface +is'
-                        r' +(?P<parent_intf>(\S+))\])?$')
+        p2=r'^admin +state +is'
+           r' +(?P<admin_state>([a-zA-Z0-9\/\.]+))(?:,)?'
+           r'(?: +(?P<dedicated_intf>(Dedicated Interface)))?'
+           r'(?:, +\[parent +interface +is'
+           r' +(?P<parent_intf>(\S+))\])?$',
 
         # Dedicated Interface
-        p2_1 = re.compile(r'^Dedicated Interface$')
+        p2_1=r'^Dedicated Interface$',
 
         # Belongs to Po1
-        p2_2 = re.compile(r'^Belongs *to *(?P<port_channel_int>[a-zA-Z0-9]+)$')
+        p2_2=r'^Belongs *to *(?P<port_channel_int>[a-zA-Z0-9]+)$',
 
         # Hardware: Ethernet, address: 5254.00ff.9c38 (bia 5254.00ff.9c38)
-        p3 = re.compile(r'^Hardware: *(?P<types>[a-zA-Z0-9\/\s]+),'
-                        r' *address: *(?P<mac_address>[a-z0-9\.]+)'
-                        r' *\(bia *(?P<phys_address>[a-z0-9\.]+)\)$')
+        p3=r'^Hardware: *(?P<types>[a-zA-Z0-9\/\s]+),'
+           r' *address: *(?P<mac_address>[a-z0-9\.]+)'
+           r' *\(bia *(?P<phys_address>[a-z0-9\.]+)\)$',
 
         #Description: desc
-        p4 = re.compile(r'^Description: *(?P<description>.*)$')
+        p4=r'^Description: *(?P<description>.*)$',
 
         #Internet Address is 10.4.4.4/24 secondary tag 10
-        p5 = re.compile(r'^Internet *Address *is *(?P<ip>[0-9\.]+)'
-                        r'\/(?P<prefix_length>[0-9]+)'
-                        r'(?: *(?P<secondary>(secondary)))?(?: *tag'
-                        r' *(?P<route_tag>[0-9]+))?$')
+        p5=r'^Internet *Address *is *(?P<ip>[0-9\.]+)'
+           r'\/(?P<prefix_length>[0-9]+)'
+           r'(?: *(?P<secondary>(secondary)))?(?: *tag'
+           r' *(?P<route_tag>[0-9]+))?$',
 
         # MTU 1600 bytes, BW 768 Kbit, DLY 3330 usec
         # MTU 1500 bytes, BW 1000000 Kbit, DLY 10 usec,
         # MTU 1500 bytes, BW 1000000 Kbit
         # MTU 600 bytes, BW 10000000 Kbit , DLY 10 usec
-        p6 = re.compile(r'^MTU *(?P<mtu>[0-9]+) *bytes, *BW'
-                        r' *(?P<bandwidth>[0-9]+) *Kbit( *, *DLY'
-                        r' *(?P<delay>[0-9]+) *usec)?,?$')
+        p6=r'^MTU *(?P<mtu>[0-9]+) *bytes, *BW'
+           r' *(?P<bandwidth>[0-9]+) *Kbit( *, *DLY'
+           r' *(?P<delay>[0-9]+) *usec)?,?$',
 
         # MTU 1500 bytes,  BW 40000000 Kbit,, BW 40000000 Kbit, DLY 10 usec
-        p6_1 = re.compile(r'^MTU *(?P<mtu>[0-9]+) *bytes, *BW'
-                          r' *(?P<bandwidth>[0-9]+) *Kbit, *,? *BW'
-                          r' *([0-9]+) *Kbit, *DLY'
-                          r' *(?P<delay>[0-9]+) *usec$')   
+        p6_1=r'^MTU *(?P<mtu>[0-9]+) *bytes, *BW'
+             r' *(?P<bandwidth>[0-9]+) *Kbit, *,? *BW'
+             r' *([0-9]+) *Kbit, *DLY'
+             r' *(?P<delay>[0-9]+) *usec$',
 
         # reliability 255/255, txload 1/255, rxload 1/255
-        p7 = re.compile(r'^reliability *(?P<reliability>[0-9\/]+),'
-                        r' *txload *(?P<txload>[0-9\/]+),'
-                        r' *rxload *(?P<rxload>[0-9\/]+)$')   
+        p7=r'^reliability *(?P<reliability>[0-9\/]+),'
+           r' *txload *(?P<txload>[0-9\/]+),'
+           r' *rxload *(?P<rxload>[0-9\/]+)$',
 
         #Encapsulation 802.1Q Virtual LAN, Vlan ID 10, medium is broadcast
         #Encapsulation 802.1Q Virtual LAN, Vlan ID 20, medium is p2p
         #Encapsulation ARPA, medium is broadcast
-        p8 = re.compile(r'^Encapsulation *(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
-                        r' *medium *is *(?P<medium>[a-zA-Z]+)$')   
-
-        p8_1 = re.compile(r'^Encapsulation *(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
-                          r' *Vlan *ID *(?P<first_dot1q>[0-9]+),'
-                          r' *medium *is *(?P<medium>[a-z0-9]+)$') 
+        p8=r'^Encapsulation *(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
+           r' *medium *is *(?P<medium>[a-zA-Z]+)$',
+        p8_1=r'^Encapsulation *(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
+             r' *Vlan *ID *(?P<first_dot1q>[0-9]+),'
+             r' *medium *is *(?P<medium>[a-z0-9]+)$',
 
         # Encapsulation ARPA, loopback not set
-        p8_2 = re.compile(r'^Encapsulation *(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
-                          r' *([\w\s]+)$') 
+        p8_2=r'^Encapsulation *(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
+             r' *([\w\s]+)$',
 
         #Port mode is routed
-        p9 = re.compile(r'^Port *mode *is *(?P<port_mode>[a-z]+)$')
+        p9=r'^Port *mode *is *(?P<port_mode>[a-z]+)$',
 
         # auto-duplex, auto-speed
-        p10_1 = re.compile(r'^auto-duplex, +auto-speed$')
+        p10_1=r'^auto-duplex, +auto-speed$',
 
         #full-duplex, 1000 Mb/s
         # auto-duplex, auto-speed
         # full-duplex, 1000 Mb/s, media type is 1G
         # auto-duplex, auto-speed, media type is 10G
-        p10 = re.compile(r'^(?P<duplex_mode>[a-z]+)-duplex, *(?P<port_speed>[a-z0-9\-]+)(?: '
-                         r'*[G|M]b/s)?(?:, +media +type +is (?P<media_type>\w+))?$')
+        p10=r'^(?P<duplex_mode>[a-z]+)-duplex, *(?P<port_speed>[a-z0-9\-]+)(?: '
+            r'*[G|M]b/s)?(?:, +media +type +is (?P<media_type>\w+))?$',
 
         #Beacon is turned off
-        p11 = re.compile(r'^Beacon *is *turned *(?P<beacon>[a-z]+)$')
+        p11=r'^Beacon *is *turned *(?P<beacon>[a-z]+)$',
 
         #Auto-Negotiation is turned off
-        p12 = re.compile(r'^Auto-Negotiation *is *turned'
-                         r' *(?P<auto_negotiate>(off))$')
+        p12=r'^Auto-Negotiation *is *turned'
+            r' *(?P<auto_negotiate>(off))$',
 
         #Auto-Negotiation is turned on
-        p12_1 = re.compile(r'^Auto-Negotiation *is *turned'
-                           r' *(?P<auto_negotiate>(on))$')
+        p12_1=r'^Auto-Negotiation *is *turned'
+              r' *(?P<auto_negotiate>(on))$',
 
         #Input flow-control is off, output flow-control is off
-        p13 = re.compile(r'^Input *flow-control *is *(?P<receive>(off)+),'
-                         r' *output *flow-control *is *(?P<send>(off)+)$')
+        p13=r'^Input *flow-control *is *(?P<receive>(off)+),'
+            r' *output *flow-control *is *(?P<send>(off)+)$',
 
         #Input flow-control is off, output flow-control is on
-        p13_1 = re.compile(r'^Input *flow-control *is *(?P<receive>(on)+),'
-                           r' *output *flow-control *is *(?P<send>(on)+)$')
+        p13_1=r'^Input *flow-control *is *(?P<receive>(on)+),'
+              r' *output *flow-control *is *(?P<send>(on)+)$',
 
         #Auto-mdix is turned off
-        p14 = re.compile(r'^Auto-mdix *is *turned *(?P<auto_mdix>[a-z]+)$')
+        p14=r'^Auto-mdix *is *turned *(?P<auto_mdix>[a-z]+)$',
 
-        #Switchport monitor is off 
-        p15 = re.compile(r'^Switchport *monitor *is *(?P<switchport_monitor>[a-z]+)$')
+        #Switchport monitor is off
+        p15=r'^Switchport *monitor *is *(?P<switchport_monitor>[a-z]+)$',
 
-        #EtherType is 0x8100 
-        p16 = re.compile(r'^EtherType *is *(?P<ethertype>[a-z0-9]+)$')
+        #EtherType is 0x8100
+        p16=r'^EtherType *is *(?P<ethertype>[a-z0-9]+)$',
 
         # Members in this channel: Eth1/15, Eth1/16
         # Members in this channel: Eth1/28
-        p38 = re.compile(r'^Members +in +this +channel *: *'
-                         r'(?P<port_channel_member_intfs>[\w\/\.\-\,\s]+)$')
+        p38=r'^Members +in +this +channel *: *'
+            r'(?P<port_channel_member_intfs>[\w\/\.\-\,\s]+)$',
 
         #EEE (efficient-ethernet) : n/a
-        p17 = re.compile(r'^EEE *\(efficient-ethernet\) *:'
-                         r' *(?P<efficient_ethernet>[A-Za-z\/]+)$')
+        p17=r'^EEE *\(efficient-ethernet\) *:'
+            r' *(?P<efficient_ethernet>[A-Za-z\/]+)$',
 
         #Last link flapped 00:07:28
         #Last link flapped 15week(s) 5day(s)
-        p18 = re.compile(r'^Last *link *flapped'
-                         r' *(?P<last_link_flapped>[\S ]+)$')
+        p18=r'^Last *link *flapped'
+            r' *(?P<last_link_flapped>[\S ]+)$',
 
         # Last clearing of "show interface" counters never
-        p19 = re.compile(r'^Last *clearing *of *\"show *interface\"'
-                         r' *counters *(?P<last_clear>[a-z0-9\:]+)$')
+        p19=r'^Last *clearing *of *\"show *interface\"'
+            r' *counters *(?P<last_clear>[a-z0-9\:]+)$',
 
         # Last clearing of "" counters 00:15:42
-        p19_1 = re.compile(r'^Last *clearing *of *\" *\"'
-                           r' *counters *(?P<last_clear>[a-z0-9\:]+)$')
+        p19_1=r'^Last *clearing *of *\" *\"'
+              r' *counters *(?P<last_clear>[a-z0-9\:]+)$',
 
         #1 interface resets
-        p20 = re.compile(r'^(?P<interface_reset>[0-9]+) *interface'
-                         r' *resets$')
+        p20=r'^(?P<interface_reset>[0-9]+) *interface'
+            r' *resets$',
 
-        # 1 minute input rate 0 bits/sec, 0 packets/sec  
-        p21 = re.compile(r'^(?P<load_interval>[0-9\#]+)'
-                         r' *(minute|second|minutes|seconds) *input *rate'
-                         r' *(?P<in_rate>[0-9]+) *bits/sec,'
-                         r' *(?P<in_rate_pkts>[0-9]+) *packets/sec$')
+        # 1 minute input rate 0 bits/sec, 0 packets/sec
+        p21=r'^(?P<load_interval>[0-9\#]+)'
+            r' *(minute|second|minutes|seconds) *input *rate'
+            r' *(?P<in_rate>[0-9]+) *bits/sec,'
+            r' *(?P<in_rate_pkts>[0-9]+) *packets/sec$',
 
         #1 minute output rate 24 bits/sec, 0 packets/sec
-        p22 = re.compile(r'^(?P<load_interval>[0-9\#]+)'
-                         r' *(minute|second|minutes|seconds) *output'
-                         r' *rate *(?P<out_rate>[0-9]+)'
-                         r' *bits/sec, *(?P<out_rate_pkts>[0-9]+)'
-                         r' *packets/sec$')
+        p22=r'^(?P<load_interval>[0-9\#]+)'
+            r' *(minute|second|minutes|seconds) *output'
+            r' *rate *(?P<out_rate>[0-9]+)'
+            r' *bits/sec, *(?P<out_rate_pkts>[0-9]+)'
+            r' *packets/sec$',
 
         #input rate 0 bps, 0 pps; output rate 0 bps, 0 pps
-        p23 = re.compile(r'^input *rate *(?P<in_rate_bps>[0-9]+) *bps,'
-                         r' *(?P<in_rate_pps>[0-9]+) *pps; *output *rate'
-                         r' *(?P<out_rate_bps>[0-9]+) *bps,'
-                         r' *(?P<out_rate_pps>[0-9]+) *pps$')
+        p23=r'^input *rate *(?P<in_rate_bps>[0-9]+) *bps,'
+            r' *(?P<in_rate_pps>[0-9]+) *pps; *output *rate'
+            r' *(?P<out_rate_bps>[0-9]+) *bps,'
+            r' *(?P<out_rate_pps>[0-9]+) *pps$',
 
         # RX
         # Rx
-        p23_1 = re.compile(r'^(?P<rx>(RX|Rx))$')
+        p23_1=r'^(?P<rx>(RX|Rx))$',
 
         #0 unicast packets  0 multicast packets  0 broadcast packets
-        p24 = re.compile(r'^(?P<in_unicast_pkts>[0-9]+) +unicast +packets'
-                         r' +(?P<in_multicast_pkts>[0-9]+) +multicast +packets'
-                         r' +(?P<in_broadcast_pkts>[0-9]+) +broadcast +packets$')
+        p24=r'^(?P<in_unicast_pkts>[0-9]+) +unicast +packets'
+            r' +(?P<in_multicast_pkts>[0-9]+) +multicast +packets'
+            r' +(?P<in_broadcast_pkts>[0-9]+) +broadcast +packets$',
 
         # 0 input packets  0 bytes
         # 607382344 input packets 445986207 unicast packets 132485585 multicast packets
-        p25 = re.compile(r'^(?P<in_pkts>[0-9]+) +input +packets(?: '
-                         r'+(?P<in_octets>[0-9]+) +bytes)?(?: +(?P<in_unicast_pkts>[0-9]+) '
-                         r'+unicast +packets +(?P<in_multicast_pkts>[0-9]+) +multicast +packets)?$')
+        p25=r'^(?P<in_pkts>[0-9]+) +input +packets(?: '
+            r'+(?P<in_octets>[0-9]+) +bytes)?(?: +(?P<in_unicast_pkts>[0-9]+) '
+            r'+unicast +packets +(?P<in_multicast_pkts>[0-9]+) +multicast +packets)?$',
 
         #0 jumbo packets  0 storm suppression packets
-        p26 = re.compile(r'^(?P<in_jumbo_packets>[0-9]+) +jumbo +packets'
-                         r' *(?P<in_storm_suppression_packets>[0-9]+)'
-                         r' *storm *suppression *packets$')
+        p26=r'^(?P<in_jumbo_packets>[0-9]+) +jumbo +packets'
+            r' *(?P<in_storm_suppression_packets>[0-9]+)'
+            r' *storm *suppression *packets$',
 
         #0 runts  0 giants  0 CRC/FCS  0 no buffer
         #0 runts  0 giants  0 CRC  0 no buffer
-        p27 = re.compile(r'^(?P<in_runts>[0-9]+) *runts'
-                         r' *(?P<in_oversize_frame>[0-9]+) *giants'
-                         r' *(?P<in_crc_errors>[0-9]+) *CRC(/FCS)?'
-                         r' *(?P<in_no_buffer>[0-9]+) *no *buffer$')
+        p27=r'^(?P<in_runts>[0-9]+) *runts'
+            r' *(?P<in_oversize_frame>[0-9]+) *giants'
+            r' *(?P<in_crc_errors>[0-9]+) *CRC(/FCS)?'
+            r' *(?P<in_no_buffer>[0-9]+) *no *buffer$',
 
         #0 input error  0 short frame  0 overrun   0 underrun  0 ignored
-        p28 = re.compile(r'^(?P<in_errors>[0-9]+) *input *error'
-                         r' *(?P<in_short_frame>[0-9]+) *short *frame'
-                         r' *(?P<in_overrun>[0-9]+) *overrun *(?P<in_underrun>[0-9]+)'
-                         r' *underrun *(?P<in_ignored>[0-9]+) *ignored$')
+        p28=r'^(?P<in_errors>[0-9]+) *input *error'
+            r' *(?P<in_short_frame>[0-9]+) *short *frame'
+            r' *(?P<in_overrun>[0-9]+) *overrun *(?P<in_underrun>[0-9]+)'
+            r' *underrun *(?P<in_ignored>[0-9]+) *ignored$',
 
         #0 watchdog  0 bad etype drop  0 bad proto drop  0 if down drop
-        p29 = re.compile(r'^(?P<in_watchdog>[0-9]+) *watchdog'
-                         r' *(?P<in_bad_etype_drop>[0-9]+)'
-                         r' *bad *etype *drop *(?P<in_unknown_protos>[0-9]+)'
-                         r' *bad *proto'
-                         r' *drop *(?P<in_if_down_drop>[0-9]+) *if *down *drop$')
+        p29=r'^(?P<in_watchdog>[0-9]+) *watchdog'
+            r' *(?P<in_bad_etype_drop>[0-9]+)'
+            r' *bad *etype *drop *(?P<in_unknown_protos>[0-9]+)'
+            r' *bad *proto'
+            r' *drop *(?P<in_if_down_drop>[0-9]+) *if *down *drop$',
 
         # 0 input with dribble  0 input discard
-        p30 = re.compile(r'^(?P<in_with_dribble>[0-9]+) *input *with'
-                         r' *dribble *(?P<in_discard>[0-9]+) *input *discard$')
+        p30=r'^(?P<in_with_dribble>[0-9]+) *input *with'
+            r' *dribble *(?P<in_discard>[0-9]+) *input *discard$',
 
         # 0 Rx pause
-        p31 = re.compile(r'^(?P<in_mac_pause_frames>[0-9]+) *Rx *pause$')
+        p31=r'^(?P<in_mac_pause_frames>[0-9]+) *Rx *pause$',
 
         # TX
-        p31_1 = re.compile(r'^(?P<tx>(TX|Tx))$')
+        p31_1=r'^(?P<tx>(TX|Tx))$',
 
         #0 unicast packets  0 multicast packets  0 broadcast packets
-        p32 = re.compile(r'^(?P<out_unicast_pkts>[0-9]+) *unicast *packets'
-                         r' *(?P<out_multicast_pkts>[0-9]+) *multicast *packets'
-                         r' *(?P<out_broadcast_pkts>[0-9]+) *broadcast *packets$')
+        p32=r'^(?P<out_unicast_pkts>[0-9]+) *unicast *packets'
+            r' *(?P<out_multicast_pkts>[0-9]+) *multicast *packets'
+            r' *(?P<out_broadcast_pkts>[0-9]+) *broadcast *packets$',
 
         #0 output packets  0 bytes
-        p33 = re.compile(r'^(?P<out_pkts>[0-9]+) *output *packets'
-                         r' *(?P<out_octets>[0-9]+) *bytes$')
+        p33=r'^(?P<out_pkts>[0-9]+) *output *packets'
+            r' *(?P<out_octets>[0-9]+) *bytes$',
 
         #0 jumbo packets
-        p34 = re.compile(r'^(?P<out_jumbo_packets>[0-9]+) *jumbo *packets$')
+        p34=r'^(?P<out_jumbo_packets>[0-9]+) *jumbo *packets$',
 
         #0 output error  0 collision  0 deferred  0 late collision
-        p35 = re.compile(r'^(?P<out_errors>[0-9]+) *output *error'
-                         r' *(?P<out_collision>[0-9]+) *collision'
-                         r' *(?P<out_deferred>[0-9]+) *deferred'
-                         r' *(?P<out_late_collision>[0-9]+)'
-                         r' *late *collision$')
+        p35=r'^(?P<out_errors>[0-9]+) *output *error'
+            r' *(?P<out_collision>[0-9]+) *collision'
+            r' *(?P<out_deferred>[0-9]+) *deferred'
+            r' *(?P<out_late_collision>[0-9]+)'
+            r' *late *collision$',
 
         #0 lost carrier  0 no carrier  0 babble  0 output discard
-        p36 = re.compile(r'^(?P<out_lost_carrier>[0-9]+) *lost *carrier'
-                         r' *(?P<out_no_carrier>[0-9]+) *no *carrier'
-                         r' *(?P<out_babble>[0-9]+) *babble'
-                         r' *(?P<out_discard>[0-9]+) *output *discard$')
+        p36=r'^(?P<out_lost_carrier>[0-9]+) *lost *carrier'
+            r' *(?P<out_no_carrier>[0-9]+) *no *carrier'
+            r' *(?P<out_babble>[0-9]+) *babble'
+            r' *(?P<out_discard>[0-9]+) *output *discard$',
 
         #0 Tx pause
-        p37 = re.compile(r'^(?P<out_mac_pause_frames>[0-9]+) *Tx *pause$')
-
-        # Members in this channel: Eth1/15, Eth1/16
-        # Members in this channel: Eth1/28
-        p38 = re.compile(r'^Members +in +this +channel *: *'
-                         r'(?P<port_channel_member_intfs>[\w\/\.\-\,\s]+)$')
+        p37=r'^(?P<out_mac_pause_frames>[0-9]+) *Tx *pause$',
 
         # 28910552 broadcast packets 63295517997 bytes
-        p39 = re.compile(r'^(?P<in_broadcast_pkts>[0-9]+) +broadcast +packets +(?P<in_octets>[0-9]+) +bytes$')
+        p39=r'^(?P<in_broadcast_pkts>[0-9]+) +broadcast +packets +(?P<in_octets>[0-9]+) +bytes$',
+    )
+    # p24 and p32 only apply in the RX and TX sections
+    lexer = Lexer(patterns, exclude=['p24', 'p32'])
 
+    def cli(self, interface="", output=None):
+        if output is None:
+            if interface:
+                cmd = self.cli_command[1].format(interface=interface)
+            else:
+                cmd = self.cli_command[0]
+            out = self.device.execute(cmd)
+        else:
+            out = output
+
+        results = parse_blocks(self, out, '_parse_interfaces',
+                               headers=[self.patterns.p1])
+        if results is not None:
+            return merge_results(results)
+        return self._parse_interfaces(out)
+
+    def _parse_interfaces(self, out):
         interface_dict = {}
 
+        p = self.patterns
         rx = False
         tx = False
         for line in out.splitlines():
             line = line.replace('\t', '    ')
             line = line.strip()
+            m = self.lexer.match(line)
+            kind = m.lastgroup if m else None
 
             # Ethernet2/1.10 is down (Administratively down)
             # Vlan1 is down (Administratively down), line protocol is down, autostate enabled
@@ -472,8 +483,7 @@ class ShowInterface(ShowInterfaceSchema):
             # Ethernet1/10 is down (Link not connected)
             # Ethernet1/3 is down (XCVR not inserted)
             # Ethernet1/1 is down (DCX-No ACK in 100 PDUs)
-            m = p1.match(line)
-            if m:
+            if kind == 'p1':
                 group = m.groupdict()
                 interface = group['interface']
 
@@ -507,8 +517,7 @@ class ShowInterface(ShowInterfaceSchema):
             # admin state is up,
             # admin state is up, Dedicated Interface
             # admin state is up, Dedicated Interface, [parent interface is Ethernet2/1]
-            m = p2.match(line)
-            if m:
+            if kind == 'p2':
                 # admin_state
                 admin_state = m.groupdict()['admin_state']
                 interface_dict[interface]['admin_state'] = admin_state
@@ -524,14 +533,12 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             # Dedicated Interface
-            m = p2_1.match(line)
-            if m:
+            if kind == 'p2_1':
                 interface_dict[interface]['dedicated_interface'] = True
                 continue
 
             # Belongs to Po1
-            m = p2_2.match(line)
-            if m:
+            if kind == 'p2_2':
                 port_channel_int = str(m.groupdict()['port_channel_int'])
                 if 'port_channel' not in interface_dict[interface]:
                     interface_dict[interface]['port_channel'] = {}
@@ -542,8 +549,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             # Hardware: Ethernet, address: 5254.00ff.9c38 (bia 5254.00ff.9c38)
-            m = p3.match(line)
-            if m:
+            if kind == 'p3':
                 types = m.groupdict()['types']
                 mac_address = m.groupdict()['mac_address']
                 phys_address = m.groupdict()['phys_address']
@@ -556,16 +562,14 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #Description: desc
-            m = p4.match(line)
-            if m:
+            if kind == 'p4':
                 description = m.groupdict()['description']
 
                 interface_dict[interface]['description'] = description
                 continue
 
             #Internet Address is 10.4.4.4/24 secondary tag 10
-            m = p5.match(line)
-            if m:
+            if kind == 'p5':
                 ip = m.groupdict()['ip']
                 prefix_length = str(m.groupdict()['prefix_length'])
                 secondary = m.groupdict()['secondary']
@@ -593,8 +597,7 @@ class ShowInterface(ShowInterfaceSchema):
             # MTU 1600 bytes, BW 768 Kbit, DLY 3330 usec
             # MTU 1500 bytes, BW 1000000 Kbit, DLY 10 usec,
             # MTU 1500 bytes, BW 1000000 Kbit
-            m = p6.match(line)
-            if m:
+            if kind == 'p6':
                 mtu = int(m.groupdict()['mtu'])
                 bandwidth = int(m.groupdict()['bandwidth'])
                 if m.groupdict()['delay']:
@@ -605,8 +608,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
             
             # MTU 1500 bytes,  BW 40000000 Kbit,, BW 40000000 Kbit, DLY 10 usec
-            m = p6_1.match(line)
-            if m:
+            if kind == 'p6_1':
                 mtu = int(m.groupdict()['mtu'])
                 bandwidth = int(m.groupdict()['bandwidth'])
                 
@@ -616,8 +618,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             # reliability 255/255, txload 1/255, rxload 1/255
-            m = p7.match(line)
-            if m:
+            if kind == 'p7':
                 reliability = m.groupdict()['reliability']
                 txload = m.groupdict()['txload']
                 rxload = m.groupdict()['rxload']
@@ -630,8 +631,7 @@ class ShowInterface(ShowInterfaceSchema):
             #Encapsulation 802.1Q Virtual LAN, Vlan ID 10, medium is broadcast
             #Encapsulation 802.1Q Virtual LAN, Vlan ID 20, medium is p2p
             #Encapsulation ARPA, medium is broadcast
-            m = p8.match(line)
-            if m:
+            if kind == 'p8':
                 encapsulation = m.groupdict()['encapsulation'].lower()
                 encapsulation = encapsulation.replace("802.1q virtual lan","dot1q")
                 medium = m.groupdict()['medium']
@@ -644,8 +644,7 @@ class ShowInterface(ShowInterfaceSchema):
                 interface_dict[interface]['medium'] = medium
                 continue
 
-            m = p8_1.match(line)
-            if m:
+            if kind == 'p8_1':
                 encapsulation = m.groupdict()['encapsulation'].lower()
                 encapsulation = encapsulation.replace("802.1q virtual lan","dot1q")
                 first_dot1q = str(m.groupdict()['first_dot1q'])
@@ -662,8 +661,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             # Encapsulation ARPA, loopback not set
-            m = p8_2.match(line)
-            if m:
+            if kind == 'p8_2':
                 encapsulation = m.groupdict()['encapsulation'].lower()
 
                 if 'encapsulations' not in interface_dict[interface]:
@@ -674,15 +672,13 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #Port mode is routed
-            m = p9.match(line)
-            if m:
+            if kind == 'p9':
                 port_mode = m.groupdict()['port_mode']
                 interface_dict[interface]['port_mode'] = port_mode
                 continue
 
             # auto-duplex, auto-speed
-            m = p10_1.match(line)
-            if m:
+            if kind == 'p10_1':
                 # not caring for this line
                 continue
 
@@ -690,8 +686,7 @@ class ShowInterface(ShowInterfaceSchema):
             # auto-duplex, auto-speed
             # full-duplex, 1000 Mb/s, media type is 1G
             # auto-duplex, auto-speed, media type is 10G
-            m = p10.match(line)
-            if m:
+            if kind == 'p10':
                 duplex_mode = m.groupdict()['duplex_mode'].lower()
                 port_speed = m.groupdict()['port_speed']
                 if m.groupdict()['media_type']:
@@ -704,29 +699,25 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #Beacon is turned off
-            m = p11.match(line)
-            if m:
+            if kind == 'p11':
                 beacon = m.groupdict()['beacon']
                 interface_dict[interface]['beacon'] = beacon
                 continue
 
             #Auto-Negotiation is turned off
-            m = p12.match(line)
-            if m:
+            if kind == 'p12':
                 auto_negotiation = m.groupdict()['auto_negotiate']
                 interface_dict[interface]['auto_negotiate'] = False
                 continue
 
             #Auto-Negotiation is turned on
-            m = p12_1.match(line)
-            if m:
+            if kind == 'p12_1':
                 auto_negotiation = m.groupdict()['auto_negotiate']
                 interface_dict[interface]['auto_negotiate'] = True
                 continue
 
             #Input flow-control is off, output flow-control is off
-            m = p13.match(line)
-            if m:
+            if kind == 'p13':
                 receive = m.groupdict()['receive']
                 send = m.groupdict()['send']
 
@@ -737,8 +728,7 @@ class ShowInterface(ShowInterfaceSchema):
                 interface_dict[interface]['flow_control']['send'] = False
                 continue
             #Input flow-control is off, output flow-control is on
-            m = p13_1.match(line)
-            if m:
+            if kind == 'p13_1':
                 receive = m.groupdict()['receive']
                 send = m.groupdict()['send']
 
@@ -750,30 +740,26 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #Auto-mdix is turned off
-            m = p14.match(line)
-            if m:
+            if kind == 'p14':
                 auto_mdix = m.groupdict()['auto_mdix']
                 interface_dict[interface]['auto_mdix'] = auto_mdix
                 continue
 
             #Switchport monitor is off 
-            m = p15.match(line)
-            if m:
+            if kind == 'p15':
                 switchport_monitor = m.groupdict()['switchport_monitor']
                 interface_dict[interface]['switchport_monitor'] = switchport_monitor
                 continue
 
             #EtherType is 0x8100 
-            m = p16.match(line)
-            if m:
+            if kind == 'p16':
                 ethertype = m.groupdict()['ethertype']
                 interface_dict[interface]['ethertype'] = ethertype
                 continue
 
             # Members in this channel: Eth1/15, Eth1/16
             # Members in this channel: Eth1/28
-            m = p38.match(line)
-            if m:
+            if kind == 'p38':
                 port_channel_member_intfs = m.groupdict()['port_channel_member_intfs']
                 if port_channel_member_intfs:
                     if 'port_channel' not in interface_dict[interface]:
@@ -786,42 +772,36 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
             
             #EEE (efficient-ethernet) : n/a
-            m = p17.match(line)
-            if m:
+            if kind == 'p17':
                 efficient_ethernet = m.groupdict()['efficient_ethernet']
                 interface_dict[interface]['efficient_ethernet'] = efficient_ethernet
                 continue
 
             #Last link flapped 00:07:28
-            m = p18.match(line)
-            if m:
+            if kind == 'p18':
                 last_link_flapped = m.groupdict()['last_link_flapped']
                 interface_dict[interface]['last_link_flapped']\
                  = last_link_flapped
                 continue
 
             # Last clearing of "show interface" counters never
-            m = p19.match(line)
-            if m:
+            if kind == 'p19':
                 last_clear = m.groupdict()['last_clear']
                 continue
 
             # Last clearing of "" counters 00:15:42
-            m = p19_1.match(line)
-            if m:
+            if kind == 'p19_1':
                 last_clear = m.groupdict()['last_clear']
                 continue
 
             #1 interface resets
-            m = p20.match(line)
-            if m:
+            if kind == 'p20':
                 interface_reset = int(m.groupdict()['interface_reset'])
                 interface_dict[interface]['interface_reset'] = interface_reset
                 continue
 
             # 1 minute input rate 0 bits/sec, 0 packets/sec  
-            m = p21.match(line)
-            if m:
+            if kind == 'p21':
 
                 load_interval = int(m.groupdict()['load_interval'])
                 in_rate = int(m.groupdict()['in_rate'])
@@ -841,8 +821,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #1 minute output rate 24 bits/sec, 0 packets/sec
-            m = p22.match(line)
-            if m:
+            if kind == 'p22':
                 load_interval = int(m.groupdict()['load_interval'])
                 out_rate = int(m.groupdict()['out_rate'])
                 out_rate_pkts = int(m.groupdict()['out_rate_pkts'])
@@ -856,8 +835,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #input rate 0 bps, 0 pps; output rate 0 bps, 0 pps
-            m = p23.match(line)
-            if m:
+            if kind == 'p23':
                 in_rate_bps = int(m.groupdict()['in_rate_bps'])
                 in_rate_pps = int(m.groupdict()['in_rate_pps'])
                 out_rate_bps = int(m.groupdict()['out_rate_bps'])
@@ -879,8 +857,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
             # RX
             # Rx
-            m = p23_1.match(line)
-            if m:
+            if kind == 'p23_1':
                 rx = m.groupdict()['rx']
                 if 'counters' not in interface_dict[interface]:
                     interface_dict[interface]['counters'] = {}
@@ -890,11 +867,11 @@ class ShowInterface(ShowInterfaceSchema):
 
             if rx:
                 #0 unicast packets  0 multicast packets  0 broadcast packets
-                m = p24.match(line)
-                if m:
-                    in_unicast_pkts = int(m.groupdict()['in_unicast_pkts'])
-                    in_multicast_pkts = int(m.groupdict()['in_multicast_pkts'])
-                    in_broadcast_pkts = int(m.groupdict()['in_broadcast_pkts'])
+                m1 = p.p24.match(line)
+                if m1:
+                    in_unicast_pkts = int(m1.groupdict()['in_unicast_pkts'])
+                    in_multicast_pkts = int(m1.groupdict()['in_multicast_pkts'])
+                    in_broadcast_pkts = int(m1.groupdict()['in_broadcast_pkts'])
             
                     interface_dict[interface]['counters']['in_unicast_pkts'] = in_unicast_pkts
                     interface_dict[interface]['counters']['in_multicast_pkts'] = in_multicast_pkts
@@ -908,8 +885,7 @@ class ShowInterface(ShowInterfaceSchema):
 
             # 0 input packets  0 bytes
             # 607382344 input packets 445986207 unicast packets 132485585 multicast packets
-            m = p25.match(line)
-            if m:
+            if kind == 'p25':
                 group = m.groupdict()
                 if 'counters' not in interface_dict[interface]:
                     interface_dict[interface]['counters'] = {}
@@ -923,8 +899,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             # 28910552 broadcast packets 63295517997 bytes
-            m = p39.match(line)
-            if m:
+            if kind == 'p39':
                 in_octets = int(m.groupdict()['in_octets'])
                 interface_dict[interface]['counters']['in_octets'] = in_octets
                 
@@ -932,8 +907,7 @@ class ShowInterface(ShowInterfaceSchema):
                 interface_dict[interface]['counters']['in_broadcast_pkts'] = in_broadcast_pkts
 
             #0 jumbo packets  0 storm suppression packets
-            m = p26.match(line)
-            if m:
+            if kind == 'p26':
                 in_jumbo_packets = int(m.groupdict()['in_jumbo_packets'])
                 in_storm_suppression_packets = int(m.groupdict()['in_storm_suppression_packets'])
 
@@ -944,8 +918,7 @@ class ShowInterface(ShowInterfaceSchema):
 
             #0 runts  0 giants  0 CRC/FCS  0 no buffer
             #0 runts  0 giants  0 CRC  0 no buffer
-            m = p27.match(line)
-            if m:
+            if kind == 'p27':
 
                 interface_dict[interface]['counters']['in_runts'] = int(m.groupdict()['in_runts'])
                 interface_dict[interface]['counters']['in_oversize_frame'] = int(m.groupdict()['in_oversize_frame'])
@@ -954,8 +927,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #0 input error  0 short frame  0 overrun   0 underrun  0 ignored
-            m = p28.match(line)
-            if m:
+            if kind == 'p28':
 
                 interface_dict[interface]['counters']['in_errors'] = int(m.groupdict()['in_errors'])
                 interface_dict[interface]['counters']['in_short_frame'] = int(m.groupdict()['in_short_frame'])
@@ -965,8 +937,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #0 watchdog  0 bad etype drop  0 bad proto drop  0 if down drop
-            m = p29.match(line)
-            if m:
+            if kind == 'p29':
 
                 interface_dict[interface]['counters']['in_watchdog'] = int(m.groupdict()['in_watchdog'])
                 interface_dict[interface]['counters']['in_bad_etype_drop'] = int(m.groupdict()['in_bad_etype_drop'])
@@ -975,8 +946,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             # 0 input with dribble  0 input discard
-            m = p30.match(line)
-            if m:
+            if kind == 'p30':
                 in_with_dribble = int(m.groupdict()['in_with_dribble'])
                 in_discard = int(m.groupdict()['in_discard'])
 
@@ -985,16 +955,14 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             # 0 Rx pause
-            m = p31.match(line)
-            if m:
+            if kind == 'p31':
                 in_mac_pause_frames = int(m.groupdict()['in_mac_pause_frames'])
 
                 interface_dict[interface]['counters']['in_mac_pause_frames'] = in_mac_pause_frames
                 continue
             # TX
             # Tx
-            m = p31_1.match(line)
-            if m:
+            if kind == 'p31_1':
                 rx = False
                 tx = m.groupdict()['tx']
                 if 'counters' not in interface_dict[interface]:
@@ -1004,16 +972,15 @@ class ShowInterface(ShowInterfaceSchema):
                 
             if tx:
                 #0 unicast packets  0 multicast packets  0 broadcast packets
-                m = p32.match(line)
-                if m :
-                    interface_dict[interface]['counters']['out_unicast_pkts'] = int(m.groupdict()['out_unicast_pkts'])
-                    interface_dict[interface]['counters']['out_multicast_pkts'] = int(m.groupdict()['out_multicast_pkts'])
-                    interface_dict[interface]['counters']['out_broadcast_pkts'] = int(m.groupdict()['out_broadcast_pkts'])
+                m1 = p.p32.match(line)
+                if m1:
+                    interface_dict[interface]['counters']['out_unicast_pkts'] = int(m1.groupdict()['out_unicast_pkts'])
+                    interface_dict[interface]['counters']['out_multicast_pkts'] = int(m1.groupdict()['out_multicast_pkts'])
+                    interface_dict[interface]['counters']['out_broadcast_pkts'] = int(m1.groupdict()['out_broadcast_pkts'])
                     continue
 
             #0 output packets  0 bytes
-            m = p33.match(line)
-            if m:
+            if kind == 'p33':
                 out_pkts = int(m.groupdict()['out_pkts'])
                 out_octets = int(m.groupdict()['out_octets'])
 
@@ -1022,16 +989,14 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #0 jumbo packets
-            m = p34.match(line)
-            if m:
+            if kind == 'p34':
                 out_jumbo_packets = int(m.groupdict()['out_jumbo_packets'])
 
                 interface_dict[interface]['counters']['out_jumbo_packets'] = out_jumbo_packets
                 continue
 
             #0 output error  0 collision  0 deferred  0 late collision
-            m = p35.match(line)
-            if m:
+            if kind == 'p35':
                 interface_dict[interface]['counters']['out_errors'] = int(m.groupdict()['out_errors'])
                 interface_dict[interface]['counters']['out_collision'] = int(m.groupdict()['out_collision'])
                 interface_dict[interface]['counters']['out_deferred'] = int(m.groupdict()['out_deferred'])
@@ -1039,8 +1004,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #0 lost carrier  0 no carrier  0 babble  0 output discard
-            m = p36.match(line)
-            if m:
+            if kind == 'p36':
 
                 interface_dict[interface]['counters']['out_lost_carrier'] = int(m.groupdict()['out_lost_carrier'])
                 interface_dict[interface]['counters']['out_no_carrier'] = int(m.groupdict()['out_no_carrier'])
@@ -1049,8 +1013,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #0 Tx pause
-            m = p37.match(line)
-            if m:
+            if kind == 'p37':
                 out_mac_pause_frames = int(m.groupdict()['out_mac_pause_frames'])
 
                 interface_dict[interface]['counters']['out_mac_pause_frames'] = out_mac_pause_frames
@@ -1192,6 +1155,192 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
             'wccp_redirect_exclude'
             'multicast_groups_address']
 
+    patterns = Patterns(
+        # IP Interface Status for VRF "VRF1"
+        p1=r'^\s*IP *Interface *Status *for *VRF'
+           ' *(?P<vrf>\S+)$',
+
+        #Ethernet2/1, Interface status: protocol-up/link-up/admin-up, iod: 36,
+        p2=r'^\s*(?P<interface>[a-zA-Z0-9\/\-\.]+), *Interface'
+           ' *status: *(?P<interface_status>[a-z\-\/\s]+),'
+           ' *iod: *(?P<iod>[0-9]+),$',
+
+        # Unnumbered interfaces of loopback0: first iod 46
+        p2_1=r'^\s*Unnumbered +interfaces +of +(?P<unnumbered_intf>[\w\.\/]+): *'
+             'first +iod +(?P<first_iod>\d+)$',
+
+        # Ethernet2/11:
+        # mti18: tunnel-te11: tunnel-te12:
+        p2_2=r'(([E|e]thernet|[L|l]oopback|[T|t]unnel|'
+             r'[V|v]lan|mti|[t|T]unnel-te|[p|P]ort-channel)[\d\/\.]+):',
+
+        # IP address: 10.4.4.4, IP subnet: 10.4.4.0/24 secondary
+        # IP address: 10.64.4.4, IP subnet: 10.64.4.0/24
+        p3=r'^\s*IP *address: *(?P<ip>[0-9\.]+), *IP'
+           ' *subnet: *(?P<ip_subnet>[a-z0-9\.]+)\/'
+           '(?P<prefix_length>[0-9]+)'
+           ' *(?P<secondary>(secondary))?$',
+
+        # IP address: 192.168.106.1, IP subnet: 192.168.106.0/24 route-preference: 0, tag: 0
+        # IP address: 10.115.69.2, IP subnet: 10.115.69.0/24 secondary route-preference: 0, tag: 0
+        p3_1=r'^\s*IP *address: *(?P<ip>[0-9\.]+), *IP *subnet: '
+             r'*(?P<ip_subnet>[a-z0-9\.]+)\/(?P<prefix_length>[0-9\,]+)'
+             r'(\s*(?P<secondary>secondary)\s*)?(?: *route-preference: *'
+             r'(?P<route_preference>[0-9]+),)?'
+             r'(?: *tag: *(?P<route_tag>[0-9]+)?)?$',
+
+        # IP address: none
+        p3_2='^\s*IP +address: +(?P<ip>\S+)$',
+
+        #   0
+        p3_3=r'^\s*(?P<route_tag>\d+)$',
+
+        #IP broadcast address: 255.255.255.255
+        p4=r'^\s*IP *broadcast *address:'
+           ' *(?P<broadcast_address>[0-9\.]+)$',
+
+        #IP multicast groups locally joined: none
+        #224.0.0.6  224.0.0.5  224.0.0.2
+        p5=r'^\s*IP *multicast *groups *locally *joined:'
+           ' *(?P<multicast_groups_address>[a-z]+)$',
+
+        #     show ip interface vrf all
+        p5_0=r'^\s*show',
+
+        #224.0.0.6  224.0.0.5  224.0.0.2
+        p5_1=r'^\s*(?P<multicast_groups_address>[a-z0-9\.\s]+)$',
+
+        #IP MTU: 1600 bytes (using link MTU)
+        p6=r'^\s*IP *MTU: *(?P<ip_mtu>[0-9]+)'
+           ' *bytes *\(using *link *MTU\)$',
+
+        #IP primary address route-preference: 0, tag: 0
+        p7=r'^\s*IP *primary *address *route-preference:'
+           ' *(?P<route_preference>[0-9]+), *tag:'
+           ' *(?P<route_tag>[0-9]+)$',
+
+        #IP proxy ARP : disabled
+        p8=r'^\s*IP *proxy *ARP *: *(?P<proxy_arp>[a-z]+)$',
+
+        #IP Local Proxy ARP : disabled
+        p9=r'^\s*IP *Local *Proxy *ARP *:'
+           ' *(?P<local_proxy_arp>[a-z]+)$',
+
+        #IP multicast routing: disabled
+        p10=r'^\s*IP *multicast *routing:'
+            ' *(?P<multicast_routing>[a-z]+)$',
+
+        #IP icmp redirects: disabled
+        p11=r'^\s*IP *icmp *redirects:'
+            ' *(?P<icmp_redirects>[a-z]+)$',
+
+        #IP directed-broadcast: disabled
+        p12=r'^\s*IP directed-broadcast:'
+            ' *(?P<directed_broadcast>[a-z]+)$',
+
+        #IP Forwarding: disabled
+        p13=r'^\s*IP *Forwarding: *(?P<ip_forwarding>[a-z]+)$',
+
+        #IP icmp unreachables (except port): disabled
+        p14=r'^\s*IP *icmp *unreachables *\(except *port\):'
+            ' *(?P<icmp_unreachable>[a-z]+)$',
+
+        #IP icmp port-unreachable: enabled
+        p15=r'^\s*IP *icmp *port-unreachable:'
+            ' *(?P<icmp_port_unreachable>[a-z]+)$',
+
+        #IP unicast reverse path forwarding: none
+        p16=r'^\s*IP *unicast *reverse *path *forwarding:'
+            ' *(?P<unicast_reverse_path>\w+)$',
+
+        #IP load sharing: none
+        p17=r'^\s*IP *load *sharing: *(?P<load_sharing>\w+)$',
+
+        #IP interface statistics last reset: never
+        # ip interface statistics last reset: never
+        p18=r'^\s*(IP|ip) *interface *statistics *last *reset:'
+            r' *(?P<int_stat_last_reset>[a-zA-Z0-9\:]+)',
+
+        #Unicast packets    : 0/0/0/0/0
+        p20=r'^\s*Unicast *packets *:'
+            ' *(?P<unicast_packets_sent>[0-9]+)\/'
+            '(?P<unicast_packets_received>[0-9]+)\/'
+            '(?P<unicast_packets_forwarded>[0-9]+)\/'
+            '(?P<unicast_packets_originated>[0-9]+)\/'
+            '(?P<unicast_packets_consumed>[0-9]+)$',
+
+        #Unicast bytes      : 0/0/0/0/0
+        p21=r'^\s*Unicast *bytes *:'
+            ' *(?P<unicast_bytes_sent>[0-9]+)\/'
+            '(?P<unicast_bytes_received>[0-9]+)\/'
+            '(?P<unicast_bytes_forwarded>[0-9]+)\/'
+            '(?P<unicast_bytes_originated>[0-9]+)\/'
+            '(?P<unicast_bytes_consumed>[0-9]+)$',
+
+        #Multicast packets  : 0/0/0/0/0
+        p22=r'^\s*Multicast *packets *:'
+            ' *(?P<multicast_packets_sent>[0-9]+)\/'
+            '(?P<multicast_packets_received>[0-9]+)\/'
+            '(?P<multicast_packets_forwarded>[0-9]+)\/'
+            '(?P<multicast_packets_originated>[0-9]+)\/'
+            '(?P<multicast_packets_consumed>[0-9]+)$',
+
+        #Multicast bytes    : 0/0/0/0/0
+        p23=r'^\s*Multicast *bytes *:'
+            ' *(?P<multicast_bytes_sent>[0-9]+)\/'
+            '(?P<multicast_bytes_received>[0-9]+)\/'
+            '(?P<multicast_bytes_forwarded>[0-9]+)\/'
+            '(?P<multicast_bytes_originated>[0-9]+)\/'
+            '(?P<multicast_bytes_consumed>[0-9]+)$',
+
+        #Broadcast packets  : 0/0/0/0/0
+        p24=r'^\s*Broadcast *packets *:'
+            ' *(?P<broadcast_packets_sent>[0-9]+)\/'
+            '(?P<broadcast_packets_received>[0-9]+)\/'
+            '(?P<broadcast_packets_forwarded>[0-9]+)\/'
+            '(?P<broadcast_packets_originated>[0-9]+)\/'
+            '(?P<broadcast_packets_consumed>[0-9]+)$',
+
+        #Broadcast bytes    : 0/0/0/0/0
+        p25=r'^\s*Broadcast *bytes *:'
+            ' *(?P<broadcast_bytes_sent>[0-9]+)\/'
+            '(?P<broadcast_bytes_received>[0-9]+)\/'
+            '(?P<broadcast_bytes_forwarded>[0-9]+)\/'
+            '(?P<broadcast_bytes_originated>[0-9]+)\/'
+            '(?P<broadcast_bytes_consumed>[0-9]+)$',
+
+        #Labeled packets    : 0/0/0/0/0
+        p26=r'^\s*Labeled *packets *:'
+            ' *(?P<labeled_packets_sent>[0-9]+)\/'
+            '(?P<labeled_packets_received>[0-9]+)\/'
+            '(?P<labeled_packets_forwarded>[0-9]+)\/'
+            '(?P<labeled_packets_originated>[0-9]+)\/'
+            '(?P<labeled_packets_consumed>[0-9]+)$',
+
+        #Labeled bytes      : 0/0/0/0/0
+        p27=r'^\s*Labeled *bytes *:'
+            ' *(?P<labeled_bytes_sent>[0-9]+)\/'
+            '(?P<labeled_bytes_received>[0-9]+)\/'
+            '(?P<labeled_bytes_forwarded>[0-9]+)\/'
+            '(?P<labeled_bytes_originated>[0-9]+)\/'
+            '(?P<labeled_bytes_consumed>[0-9]+)$',
+
+        #WCCP Redirect outbound: disabled
+        p28=r'^\s*WCCP *Redirect *outbound:'
+            ' *(?P<wccp_redirect_outbound>[a-z]+)$',
+
+        #WCCP Redirect inbound: disabled
+        p29=r'^\s*WCCP *Redirect *inbound:'
+            ' *(?P<wccp_redirect_inbound>[a-z]+)$',
+
+        #WCCP Redirect exclude: disabled
+        p30=r'^\s*WCCP *Redirect *exclude:'
+            ' *(?P<wccp_redirect_exclude>[a-z]+)$',
+
+        # IP unnumbered interface (loopback0)
+        p31=r'^\s*IP +unnumbered +interface +\((?P<unnum_intf>[\w\/\.]+)\)$',
+    )
+
     def cli(self, interface='', vrf='', output=None):
         if interface and vrf:
             cmd = self.cli_command[0].format(interface=interface, vrf=vrf)
@@ -1212,20 +1361,16 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
 
         for line in out.splitlines():
             line = line.rstrip()
+            p = self.patterns.for_line(line)
             # IP Interface Status for VRF "VRF1"
-            p1 = re.compile(r'^\s*IP *Interface *Status *for *VRF'
-                             ' *(?P<vrf>\S+)$')
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
                 vrf = vrf.replace('"',"")
                 continue
 
             #Ethernet2/1, Interface status: protocol-up/link-up/admin-up, iod: 36,
-            p2 = re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/\-\.]+), *Interface'
-                             ' *status: *(?P<interface_status>[a-z\-\/\s]+),'
-                             ' *iod: *(?P<iod>[0-9]+),$')
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 interface = m.groupdict()['interface']
                 interface_status = m.groupdict()['interface_status']
@@ -1253,18 +1398,14 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             # Unnumbered interfaces of loopback0: first iod 46
-            p2_1 = re.compile(r'^\s*Unnumbered +interfaces +of +(?P<unnumbered_intf>[\w\.\/]+): *'
-                               'first +iod +(?P<first_iod>\d+)$')
-            m = p2_1.match(line)
+            m = p.p2_1.match(line)
             if m:
                 unnumbered_intf = m.groupdict()['unnumbered_intf']
                 continue
 
             # Ethernet2/11:
             # mti18: tunnel-te11: tunnel-te12:
-            p2_2 = re.compile(r'(([E|e]thernet|[L|l]oopback|[T|t]unnel|'
-                              r'[V|v]lan|mti|[t|T]unnel-te|[p|P]ort-channel)[\d\/\.]+):')
-            m = p2_2.findall(line)
+            m = p.p2_2.findall(line)
             if m and unnumbered_intf:
                 temp_intf = []
                 temp_intf = [i[0] for i in m]
@@ -1274,11 +1415,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
             # IP address: 10.4.4.4, IP subnet: 10.4.4.0/24 secondary
             # IP address: 10.64.4.4, IP subnet: 10.64.4.0/24
-            p3 = re.compile(r'^\s*IP *address: *(?P<ip>[0-9\.]+), *IP'
-                             ' *subnet: *(?P<ip_subnet>[a-z0-9\.]+)\/'
-                             '(?P<prefix_length>[0-9]+)'
-                             ' *(?P<secondary>(secondary))?$')
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 ip = m.groupdict()['ip']
                 ip_subnet = m.groupdict()['ip_subnet']
@@ -1317,12 +1454,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
 
             # IP address: 192.168.106.1, IP subnet: 192.168.106.0/24 route-preference: 0, tag: 0
             # IP address: 10.115.69.2, IP subnet: 10.115.69.0/24 secondary route-preference: 0, tag: 0
-            p3_1 = re.compile(r'^\s*IP *address: *(?P<ip>[0-9\.]+), *IP *subnet: '
-                              r'*(?P<ip_subnet>[a-z0-9\.]+)\/(?P<prefix_length>[0-9\,]+)'
-                              r'(\s*(?P<secondary>secondary)\s*)?(?: *route-preference: *'
-                              r'(?P<route_preference>[0-9]+),)?'
-                              r'(?: *tag: *(?P<route_tag>[0-9]+)?)?$')
-            m = p3_1.match(line)
+            m = p.p3_1.match(line)
             
             if m:
                 group = m.groupdict()
@@ -1369,8 +1501,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
             
             # IP address: none
-            p3_2 = re.compile('^\s*IP +address: +(?P<ip>\S+)$')
-            m = p3_2.match(line)
+            m = p.p3_2.match(line)
             if m:
                 group = m.groupdict()
                 address = group.get('ip')
@@ -1383,8 +1514,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             #   0
-            p3_3 = re.compile(r'^\s*(?P<route_tag>\d+)$')
-            m = p3_3.match(line)
+            m = p.p3_3.match(line)
             if m:
                 group = m.groupdict()
                 route_tag = group['route_tag']
@@ -1403,9 +1533,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             #IP broadcast address: 255.255.255.255
-            p4 = re.compile(r'^\s*IP *broadcast *address:'
-                             ' *(?P<broadcast_address>[0-9\.]+)$')
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 broadcast_address = str(m.groupdict()['broadcast_address'])
                 if 'ipv4' in ip_interface_vrf_all_dict[interface]:
@@ -1414,9 +1542,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
             
             #IP multicast groups locally joined: none
             #224.0.0.6  224.0.0.5  224.0.0.2 
-            p5 = re.compile(r'^\s*IP *multicast *groups *locally *joined:'
-                             ' *(?P<multicast_groups_address>[a-z]+)$')
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 multicast_groups_address = m.groupdict()['multicast_groups_address']
 
@@ -1425,14 +1551,12 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
             
             #     show ip interface vrf all
-            p5_0 = re.compile(r'^\s*show')
-            m = p5_0.match(line)
+            m = p.p5_0.match(line)
             if m:
                 continue
 
             #224.0.0.6  224.0.0.5  224.0.0.2 
-            p5_1 = re.compile(r'^\s*(?P<multicast_groups_address>[a-z0-9\.\s]+)$')
-            m = p5_1.match(line)
+            m = p.p5_1.match(line)
             if m:
                 multicast_groups_address = str(m.groupdict()['multicast_groups_address'])
 
@@ -1448,9 +1572,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             #IP MTU: 1600 bytes (using link MTU)
-            p6 = re.compile(r'^\s*IP *MTU: *(?P<ip_mtu>[0-9]+)'
-                             ' *bytes *\(using *link *MTU\)$')
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 ip_mtu = int(m.groupdict()['ip_mtu'])
 
@@ -1458,10 +1580,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             #IP primary address route-preference: 0, tag: 0
-            p7 = re.compile(r'^\s*IP *primary *address *route-preference:'
-                             ' *(?P<route_preference>[0-9]+), *tag:'
-                             ' *(?P<route_tag>[0-9]+)$')
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 route_preference = m.groupdict()['route_preference']
                 route_tag = m.groupdict()['route_tag']
@@ -1476,8 +1595,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             #IP proxy ARP : disabled
-            p8 = re.compile(r'^\s*IP *proxy *ARP *: *(?P<proxy_arp>[a-z]+)$')
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 proxy_arp = m.groupdict()['proxy_arp']
 
@@ -1485,9 +1603,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             #IP Local Proxy ARP : disabled
-            p9 = re.compile(r'^\s*IP *Local *Proxy *ARP *:'
-                             ' *(?P<local_proxy_arp>[a-z]+)$')
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 local_proxy_arp = m.groupdict()['local_proxy_arp']
 
@@ -1496,9 +1612,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             #IP multicast routing: disabled
-            p10 = re.compile(r'^\s*IP *multicast *routing:'
-                              ' *(?P<multicast_routing>[a-z]+)$')
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 multicast_routing = m.groupdict()['multicast_routing']
 
@@ -1507,9 +1621,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             #IP icmp redirects: disabled
-            p11 = re.compile(r'^\s*IP *icmp *redirects:'
-                              ' *(?P<icmp_redirects>[a-z]+)$')
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 icmp_redirects = m.groupdict()['icmp_redirects']
 
@@ -1518,9 +1630,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             #IP directed-broadcast: disabled
-            p12 = re.compile(r'^\s*IP directed-broadcast:'
-                              ' *(?P<directed_broadcast>[a-z]+)$')
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 directed_broadcast = m.groupdict()['directed_broadcast']
 
@@ -1529,8 +1639,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             #IP Forwarding: disabled
-            p13 = re.compile(r'^\s*IP *Forwarding: *(?P<ip_forwarding>[a-z]+)$') 
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 ip_forwarding = m.groupdict()['ip_forwarding']
 
@@ -1539,9 +1648,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             #IP icmp unreachables (except port): disabled
-            p14 = re.compile(r'^\s*IP *icmp *unreachables *\(except *port\):'
-                              ' *(?P<icmp_unreachable>[a-z]+)$')
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 icmp_unreachable = m.groupdict()['icmp_unreachable']
 
@@ -1550,9 +1657,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             #IP icmp port-unreachable: enabled
-            p15 = re.compile(r'^\s*IP *icmp *port-unreachable:'
-                              ' *(?P<icmp_port_unreachable>[a-z]+)$')
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 icmp_port_unreachable = m.groupdict()['icmp_port_unreachable']
 
@@ -1561,9 +1666,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             #IP unicast reverse path forwarding: none
-            p16 = re.compile(r'^\s*IP *unicast *reverse *path *forwarding:'
-                              ' *(?P<unicast_reverse_path>\w+)$')
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 unicast_reverse_path = m.groupdict()['unicast_reverse_path']
 
@@ -1572,8 +1675,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             #IP load sharing: none 
-            p17 = re.compile(r'^\s*IP *load *sharing: *(?P<load_sharing>\w+)$')
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 load_sharing = m.groupdict()['load_sharing']
 
@@ -1583,9 +1685,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
 
             #IP interface statistics last reset: never
             # ip interface statistics last reset: never
-            p18 = re.compile(r'^\s*(IP|ip) *interface *statistics *last *reset:'
-                             r' *(?P<int_stat_last_reset>[a-zA-Z0-9\:]+)')
-            m = p18.match(line)
+            m = p.p18.match(line)
             if m:
                 int_stat_last_reset = m.groupdict()['int_stat_last_reset']
 
@@ -1609,13 +1709,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
             
             if 'ipv4' in ip_interface_vrf_all_dict[interface]:
                 #Unicast packets    : 0/0/0/0/0
-                p20 = re.compile(r'^\s*Unicast *packets *:'
-                                  ' *(?P<unicast_packets_sent>[0-9]+)\/'
-                                  '(?P<unicast_packets_received>[0-9]+)\/'
-                                  '(?P<unicast_packets_forwarded>[0-9]+)\/'
-                                  '(?P<unicast_packets_originated>[0-9]+)\/'
-                                  '(?P<unicast_packets_consumed>[0-9]+)$')
-                m = p20.match(line)
+                m = p.p20.match(line)
                 if m:
                     if 'counters' not in ip_interface_vrf_all_dict[interface]['ipv4'][address]:
                         ip_interface_vrf_all_dict[interface]['ipv4']['counters'] = {}
@@ -1633,13 +1727,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                     continue
 
                 #Unicast bytes      : 0/0/0/0/0
-                p21 = re.compile(r'^\s*Unicast *bytes *:'
-                                  ' *(?P<unicast_bytes_sent>[0-9]+)\/'
-                                  '(?P<unicast_bytes_received>[0-9]+)\/'
-                                  '(?P<unicast_bytes_forwarded>[0-9]+)\/'
-                                  '(?P<unicast_bytes_originated>[0-9]+)\/'
-                                  '(?P<unicast_bytes_consumed>[0-9]+)$')
-                m = p21.match(line)
+                m = p.p21.match(line)
                 if m:
                     ip_interface_vrf_all_dict[interface]['ipv4']['counters']\
                     ['unicast_bytes_sent']= int(m.groupdict()['unicast_bytes_sent'])
@@ -1654,13 +1742,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                     continue
 
                 #Multicast packets  : 0/0/0/0/0
-                p22 = re.compile(r'^\s*Multicast *packets *:'
-                                  ' *(?P<multicast_packets_sent>[0-9]+)\/'
-                                  '(?P<multicast_packets_received>[0-9]+)\/'
-                                  '(?P<multicast_packets_forwarded>[0-9]+)\/'
-                                  '(?P<multicast_packets_originated>[0-9]+)\/'
-                                  '(?P<multicast_packets_consumed>[0-9]+)$')
-                m = p22.match(line)
+                m = p.p22.match(line)
                 if m:
                     ip_interface_vrf_all_dict[interface]['ipv4']['counters']\
                     ['multicast_packets_sent']= int(m.groupdict()['multicast_packets_sent'])
@@ -1675,13 +1757,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                     continue
 
                 #Multicast bytes    : 0/0/0/0/0
-                p23 = re.compile(r'^\s*Multicast *bytes *:'
-                                  ' *(?P<multicast_bytes_sent>[0-9]+)\/'
-                                  '(?P<multicast_bytes_received>[0-9]+)\/'
-                                  '(?P<multicast_bytes_forwarded>[0-9]+)\/'
-                                  '(?P<multicast_bytes_originated>[0-9]+)\/'
-                                  '(?P<multicast_bytes_consumed>[0-9]+)$')
-                m = p23.match(line)
+                m = p.p23.match(line)
                 if m:
                     ip_interface_vrf_all_dict[interface]['ipv4']['counters']\
                     ['multicast_bytes_sent']= int(m.groupdict()['multicast_bytes_sent'])
@@ -1696,13 +1772,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                     continue
 
                 #Broadcast packets  : 0/0/0/0/0
-                p24 = re.compile(r'^\s*Broadcast *packets *:'
-                                  ' *(?P<broadcast_packets_sent>[0-9]+)\/'
-                                  '(?P<broadcast_packets_received>[0-9]+)\/'
-                                  '(?P<broadcast_packets_forwarded>[0-9]+)\/'
-                                  '(?P<broadcast_packets_originated>[0-9]+)\/'
-                                  '(?P<broadcast_packets_consumed>[0-9]+)$')
-                m = p24.match(line)
+                m = p.p24.match(line)
                 if m:
                     ip_interface_vrf_all_dict[interface]['ipv4']['counters']\
                     ['broadcast_packets_sent']= int(m.groupdict()['broadcast_packets_sent'])
@@ -1717,13 +1787,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                     continue
 
                 #Broadcast bytes    : 0/0/0/0/0
-                p25 = re.compile(r'^\s*Broadcast *bytes *:'
-                                  ' *(?P<broadcast_bytes_sent>[0-9]+)\/'
-                                  '(?P<broadcast_bytes_received>[0-9]+)\/'
-                                  '(?P<broadcast_bytes_forwarded>[0-9]+)\/'
-                                  '(?P<broadcast_bytes_originated>[0-9]+)\/'
-                                  '(?P<broadcast_bytes_consumed>[0-9]+)$')
-                m = p25.match(line)
+                m = p.p25.match(line)
                 if m:
                     ip_interface_vrf_all_dict[interface]['ipv4']['counters']\
                     ['broadcast_bytes_sent']= int(m.groupdict()['broadcast_bytes_sent'])
@@ -1738,13 +1802,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                     continue
 
                 #Labeled packets    : 0/0/0/0/0
-                p26 = re.compile(r'^\s*Labeled *packets *:'
-                                  ' *(?P<labeled_packets_sent>[0-9]+)\/'
-                                  '(?P<labeled_packets_received>[0-9]+)\/'
-                                  '(?P<labeled_packets_forwarded>[0-9]+)\/'
-                                  '(?P<labeled_packets_originated>[0-9]+)\/'
-                                  '(?P<labeled_packets_consumed>[0-9]+)$')
-                m = p26.match(line)
+                m = p.p26.match(line)
                 if m:
                     ip_interface_vrf_all_dict[interface]['ipv4']['counters']\
                     ['labeled_packets_sent']= int(m.groupdict()['labeled_packets_sent'])
@@ -1759,13 +1817,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                     continue
 
                 #Labeled bytes      : 0/0/0/0/0
-                p27 = re.compile(r'^\s*Labeled *bytes *:'
-                                  ' *(?P<labeled_bytes_sent>[0-9]+)\/'
-                                  '(?P<labeled_bytes_received>[0-9]+)\/'
-                                  '(?P<labeled_bytes_forwarded>[0-9]+)\/'
-                                  '(?P<labeled_bytes_originated>[0-9]+)\/'
-                                  '(?P<labeled_bytes_consumed>[0-9]+)$')
-                m = p27.match(line)
+                m = p.p27.match(line)
                 if m:
                     ip_interface_vrf_all_dict[interface]['ipv4']['counters']\
                     ['labeled_bytes_sent']= int(m.groupdict()['labeled_bytes_sent'])
@@ -1780,9 +1832,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                     continue
 
             #WCCP Redirect outbound: disabled
-            p28 = re.compile(r'^\s*WCCP *Redirect *outbound:'
-                              ' *(?P<wccp_redirect_outbound>[a-z]+)$')
-            m = p28.match(line)
+            m = p.p28.match(line)
             if m:
                 wccp_redirect_outbound = m.groupdict()['wccp_redirect_outbound']
 
@@ -1791,9 +1841,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             #WCCP Redirect inbound: disabled
-            p29 = re.compile(r'^\s*WCCP *Redirect *inbound:'
-                              ' *(?P<wccp_redirect_inbound>[a-z]+)$')
-            m = p29.match(line)
+            m = p.p29.match(line)
             if m:
                 wccp_redirect_inbound = m.groupdict()['wccp_redirect_inbound']
 
@@ -1802,9 +1850,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             #WCCP Redirect exclude: disabled
-            p30 = re.compile(r'^\s*WCCP *Redirect *exclude:'
-                              ' *(?P<wccp_redirect_exclude>[a-z]+)$')
-            m = p30.match(line)
+            m = p.p30.match(line)
             if m:
                 wccp_redirect_exclude = m.groupdict()['wccp_redirect_exclude']
 
@@ -1813,8 +1859,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             # IP unnumbered interface (loopback0)
-            p31 = re.compile(r'^\s*IP +unnumbered +interface +\((?P<unnum_intf>[\w\/\.]+)\)$')
-            m = p31.match(line)
+            m = p.p31.match(line)
             if m:
                 unnum_intf = m.groupdict()['unnum_intf']
                 if 'ipv4' in ip_interface_vrf_all_dict[interface]:
@@ -2233,6 +2278,113 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
         'unicast_packets_forwarded',
         'ipv6_link_local']
 
+    patterns = Patterns(
+        #IPv6 Interface Status for VRF "VRF1"
+        p1=r'^\s*IPv6 *Interface *Status *for *VRF'
+           ' *(?P<vrf>\S+)$',
+
+        #Ethernet2/1, Interface status: protocol-up/link-up/admin-up, iod: 36
+        #port-channel2.101, Interface status: protocol-down/link-down/admin-up, iod: 71
+        p2=r'^\s*(?:(?P<interface>[a-zA-Z0-9\/\-\.]+)), Interface'
+           ' *status: *(?P<interface_status>[a-z\-\/]+),'
+           ' *iod: *(?P<iod>[0-9]+)$',
+
+        # IPv6 address:
+        p3_1=r'^\s*IPv6 address:$',
+
+        # Anycast configured addresses:
+        p3_2=r'^\s*Anycast configured addresses:$',
+
+        # 2001:db8:1:1::1/64 [VALID]
+        p3_3=r'^\s*(?P<ip>[a-z0-9\:]+)'
+             '\/(?P<prefix_length>[0-9]+)'
+             ' *\[(?P<status>[a-zA-Z]+)\]$',
+
+        #IPv6 subnet:  2001:db8:1:1::/64
+        p4=r'^\s*IPv6 *subnet:'
+           ' *(?P<ipv6_subnet>[a-z0-9\:\/]+)$',
+
+        #IPv6 link-local address: fe80::a8aa:bbff:febb:cccc (default) [VALID]
+        p5=r'^\s*IPv6 *link-local *address:'
+           ' *(?P<ipv6_link_local>[a-z0-9\:\s]+)'
+           ' *\((?P<ipv6_link_local_state>[a-z]+)\)'
+           ' *\[(?P<ipv6_ll_state>[A-Z]+)\]$',
+
+        #IPv6 virtual addresses configured: none
+        p6=r'^\s*IPv6 *virtual *addresses *configured:'
+           ' *(?P<ipv6_virtual_add>\w+)$',
+
+        #IPv6 virtual addresses configured:
+        #        fe80::5:73ff:fea0:2  2001:db8:7746:fa41::1
+        p6_1=r'^\s*(IPv6 virtual *(?P<virtual_add>(addresses|address) configured:))$',
+        p6_2=r'^\s*(?P<ipv6_virtual_addresses>[a-z0-9\:\s]+)$',
+
+        #IPv6 multicast routing: disabled
+        p7=r'^\s*IPv6 *multicast *routing:'
+           ' *(?P<ipv6_multicast_routing>[a-z]+)$',
+
+        #IPv6 report link local: disabled
+        p8=r'^\s*IPv6 *report *link *local:'
+           ' *(?P<ipv6_report_link_local>[a-z]+)$',
+
+        #IPv6 Forwarding feature: disabled
+        p9=r'^\s*IPv6 *Forwarding *feature:'
+           ' *(?P<ipv6_forwarding_feature>[a-z]+)$',
+
+        #IPv6 multicast groups locally joined:
+        p10=r'^\s*(?P<multicast_groups>(IPv6 *multicast *(groups|group) *locally *joined:))$',
+
+        # ff02::1:ffbb:cccc  ff02::1:ff00:3  ff02::1:ff00:2  ff02::2
+        # ff02::1  ff02::1:ff00:1  ff02::1:ffbb:cccc  ff02::1:ff00:0
+        # ff02::1:ffad:beef  ff02::1:ff00:1(2)  ff02::2(2)  ff02::1(2)
+        p11=r'^\s*(?P<ipv6_multicast_group_addresses>[a-z0-9\(\)\:\s]+)$',
+
+        # IPv6 multicast (S,G) entries joined: none
+        # IPv6 multicast (S,G) entries joined:
+        #  (2001:20:1:1::254, ff38::1)
+        p12=r'^\s*IPv6 *multicast *\(S\,G\) *entries *joined:$',
+
+        #  (2001:20:1:1::254, ff38::1)
+        p12_1=r'^\s*\((?P<ip_list>.*)\)',
+
+        #IPv6 MTU: 1600 (using link MTU)
+        p13=r'^\s*IPv6 *MTU: *(?P<ipv6_mtu>[0-9]+)'
+            ' *\(using *link *MTU\)$',
+
+        #IPv6 unicast reverse path forwarding: none
+        p14=r'^\s*IPv6 *unicast *reverse *path *forwarding:'
+            ' *(?P<ipv6_unicast_rev_path_forwarding>\w+)$',
+
+        #IPv6 load sharing: none
+        p15=r'^\s*IPv6 *load *sharing:'
+            ' *(?P<ipv6_load_sharing>\w+)$',
+
+        #IPv6 interface statistics last reset: never
+        p16=r'^\s*IPv6 *interface *statistics *last *reset:'
+            ' *(?P<ipv6_last_reset>[a-z]+)$',
+
+        #Unicast packets:      0/0/0
+        p18=r'^\s*Unicast *packets:'
+            ' *(?P<unicast_packets_forwarded>[0-9]+)\/'
+            '(?P<unicast_packets_originated>[0-9]+)\/'
+            '(?P<unicast_packets_consumed>[0-9]+)$',
+
+        #Unicast bytes:        0/0/0
+        p19=r'^\s*Unicast *bytes: *(?P<unicast_bytes_forwarded>[0-9]+)'
+            '\/(?P<unicast_bytes_originated>[0-9]+)\/'
+            '(?P<unicast_bytes_consumed>[0-9]+)$',
+
+        #Multicast packets:    0/12/9
+        p20=r'^\s*Multicast *packets: *(?P<multicast_packets_forwarded>[0-9]+)'
+            '\/(?P<multicast_packets_originated>[0-9]+)\/'
+            '(?P<multicast_packets_consumed>[0-9]+)$',
+
+        #Multicast bytes:      0/1144/640
+        p21=r'^\s*Multicast *bytes: *(?P<multicast_bytes_forwarded>[0-9]+)\/'
+            '(?P<multicast_bytes_originated>[0-9]+)\/'
+            '(?P<multicast_bytes_consumed>[0-9]+)$',
+    )
+
     def cli(self, interface='', vrf='', output=None):
         if interface and vrf:
             cmd = self.cli_command[0].format(interface=interface, vrf=vrf)
@@ -2256,11 +2408,10 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
 
         for line in out.splitlines():
             line = line.rstrip()
+            p = self.patterns.for_line(line)
 
             #IPv6 Interface Status for VRF "VRF1"
-            p1 = re.compile(r'^\s*IPv6 *Interface *Status *for *VRF'
-                             ' *(?P<vrf>\S+)$')
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
                 vrf = vrf.replace('"',"")
@@ -2268,10 +2419,7 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
 
             #Ethernet2/1, Interface status: protocol-up/link-up/admin-up, iod: 36
             #port-channel2.101, Interface status: protocol-down/link-down/admin-up, iod: 71
-            p2 = re.compile(r'^\s*(?:(?P<interface>[a-zA-Z0-9\/\-\.]+)), Interface'
-                             ' *status: *(?P<interface_status>[a-z\-\/]+),'
-                             ' *iod: *(?P<iod>[0-9]+)$')
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
 
                 interface = str(m.groupdict()['interface'])
@@ -2292,26 +2440,21 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 continue
 
             # IPv6 address:
-            p3_1 = re.compile(r'^\s*IPv6 address:$')
-            m = p3_1.match(line)
+            m = p.p3_1.match(line)
             if m:
                 ipv6_addresses = True
                 anycast_addresses = False
                 continue
 
             # Anycast configured addresses:
-            p3_2 = re.compile(r'^\s*Anycast configured addresses:$')
-            m = p3_2.match(line)
+            m = p.p3_2.match(line)
             if m:
                 anycast_addresses = True
                 ipv6_addresses = False
                 continue
 
             # 2001:db8:1:1::1/64 [VALID]
-            p3_3 = re.compile(r'^\s*(?P<ip>[a-z0-9\:]+)'
-                             '\/(?P<prefix_length>[0-9]+)'
-                             ' *\[(?P<status>[a-zA-Z]+)\]$')
-            m = p3_3.match(line)
+            m = p.p3_3.match(line)
             if m:
                 ip  = m.groupdict()['ip']
                 prefix_length = m.groupdict()['prefix_length']
@@ -2338,9 +2481,7 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 continue
 
             #IPv6 subnet:  2001:db8:1:1::/64
-            p4 = re.compile(r'^\s*IPv6 *subnet:'
-                             ' *(?P<ipv6_subnet>[a-z0-9\:\/]+)$')
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 ipv6_subnet = m.groupdict()['ipv6_subnet']
 
@@ -2348,11 +2489,7 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 continue
 
             #IPv6 link-local address: fe80::a8aa:bbff:febb:cccc (default) [VALID]
-            p5 = re.compile(r'^\s*IPv6 *link-local *address:'
-                             ' *(?P<ipv6_link_local>[a-z0-9\:\s]+)'
-                             ' *\((?P<ipv6_link_local_state>[a-z]+)\)'
-                             ' *\[(?P<ipv6_ll_state>[A-Z]+)\]$')
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 ipv6_link_local = m.groupdict()['ipv6_link_local']
                 ipv6_link_local_state = m.groupdict()['ipv6_link_local_state']
@@ -2367,9 +2504,7 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 continue
 
             #IPv6 virtual addresses configured: none
-            p6 = re.compile(r'^\s*IPv6 *virtual *addresses *configured:'
-                             ' *(?P<ipv6_virtual_add>\w+)$')
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 ipv6_virtual_add = m.groupdict()['ipv6_virtual_add']
 
@@ -2378,8 +2513,7 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
 
             #IPv6 virtual addresses configured:
             #        fe80::5:73ff:fea0:2  2001:db8:7746:fa41::1
-            p6_1 = re.compile(r'^\s*(IPv6 virtual *(?P<virtual_add>(addresses|address) configured:))$')
-            m = p6_1.match(line)
+            m = p.p6_1.match(line)
             if m:
                 virtual_add = m.groupdict()['virtual_add']
 
@@ -2387,8 +2521,7 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 continue
 
             if virtual_add:
-                p6_2 = re.compile(r'^\s*(?P<ipv6_virtual_addresses>[a-z0-9\:\s]+)$')
-                m = p6_2.match(line)
+                m = p.p6_2.match(line)
                 if m:
                     ipv6_virtual_addresses = str(m.groupdict()['ipv6_virtual_addresses'])
 
@@ -2404,9 +2537,7 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                     continue
 
             #IPv6 multicast routing: disabled
-            p7 = re.compile(r'^\s*IPv6 *multicast *routing:'
-                             ' *(?P<ipv6_multicast_routing>[a-z]+)$')
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 ipv6_multicast_routing = m.groupdict()['ipv6_multicast_routing']
 
@@ -2414,9 +2545,7 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 continue
 
             #IPv6 report link local: disabled
-            p8 = re.compile(r'^\s*IPv6 *report *link *local:'
-                              ' *(?P<ipv6_report_link_local>[a-z]+)$')
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 ipv6_report_link_local = m.groupdict()['ipv6_report_link_local']
 
@@ -2425,9 +2554,7 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 continue
 
             #IPv6 Forwarding feature: disabled
-            p9 = re.compile(r'^\s*IPv6 *Forwarding *feature:'
-                              ' *(?P<ipv6_forwarding_feature>[a-z]+)$')
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 ipv6_forwarding_feature = m.groupdict()['ipv6_forwarding_feature']
 
@@ -2436,8 +2563,7 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 continue
 
             #IPv6 multicast groups locally joined:
-            p10 = re.compile(r'^\s*(?P<multicast_groups>(IPv6 *multicast *(groups|group) *locally *joined:))$')
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 virtual_add = False
                 multicast_groups = m.groupdict()['multicast_groups']
@@ -2448,8 +2574,7 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 # ff02::1:ffbb:cccc  ff02::1:ff00:3  ff02::1:ff00:2  ff02::2   
                 # ff02::1  ff02::1:ff00:1  ff02::1:ffbb:cccc  ff02::1:ff00:0
                 # ff02::1:ffad:beef  ff02::1:ff00:1(2)  ff02::2(2)  ff02::1(2)
-                p11 = re.compile(r'^\s*(?P<ipv6_multicast_group_addresses>[a-z0-9\(\)\:\s]+)$')
-                m = p11.match(line)
+                m = p.p11.match(line)
                 if m:
                     ipv6_multicast_group_addresses = str(m.groupdict()['ipv6_multicast_group_addresses'])
 
@@ -2467,15 +2592,13 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
             # IPv6 multicast (S,G) entries joined: none
             # IPv6 multicast (S,G) entries joined: 
             #  (2001:20:1:1::254, ff38::1)
-            p12 = re.compile(r'^\s*IPv6 *multicast *\(S\,G\) *entries *joined:$')
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 ipv6_multicast_entries = True
                 continue
 
             #  (2001:20:1:1::254, ff38::1)
-            p12_1 = re.compile(r'^\s*\((?P<ip_list>.*)\)')
-            m = p12_1.match(line)
+            m = p.p12_1.match(line)
             if m and ipv6_multicast_entries:
                 ipv6_multicast_entries = m.groupdict()['ip_list']
                 ipv6_interface_dict[interface]['ipv6']['ipv6_multicast_entries']\
@@ -2483,9 +2606,7 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 continue
 
             #IPv6 MTU: 1600 (using link MTU)
-            p13 = re.compile(r'^\s*IPv6 *MTU: *(?P<ipv6_mtu>[0-9]+)'
-                              ' *\(using *link *MTU\)$')
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 ipv6_mtu = int(m.groupdict()['ipv6_mtu'])
 
@@ -2493,9 +2614,7 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 continue
 
             #IPv6 unicast reverse path forwarding: none
-            p14 = re.compile(r'^\s*IPv6 *unicast *reverse *path *forwarding:'
-                              ' *(?P<ipv6_unicast_rev_path_forwarding>\w+)$')
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 ipv6_unicast_rev_path_forwarding = m.groupdict()\
                 ['ipv6_unicast_rev_path_forwarding']
@@ -2506,9 +2625,7 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 continue
 
             #IPv6 load sharing: none
-            p15 = re.compile(r'^\s*IPv6 *load *sharing:'
-                             ' *(?P<ipv6_load_sharing>\w+)$')
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 ipv6_load_sharing = m.groupdict()['ipv6_load_sharing']
 
@@ -2517,9 +2634,7 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 continue
 
             #IPv6 interface statistics last reset: never
-            p16 = re.compile(r'^\s*IPv6 *interface *statistics *last *reset:'
-                              ' *(?P<ipv6_last_reset>[a-z]+)$')
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 ipv6_last_reset = m.groupdict()['ipv6_last_reset']
 
@@ -2528,11 +2643,7 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 continue
 
             #Unicast packets:      0/0/0
-            p18 = re.compile(r'^\s*Unicast *packets:'
-                             ' *(?P<unicast_packets_forwarded>[0-9]+)\/'
-                             '(?P<unicast_packets_originated>[0-9]+)\/'
-                             '(?P<unicast_packets_consumed>[0-9]+)$')
-            m = p18.match(line)
+            m = p.p18.match(line)
             if m:
                 if 'counters' not in ipv6_interface_dict[interface]['ipv6']:
                     ipv6_interface_dict[interface]['ipv6']['counters'] = {}
@@ -2547,10 +2658,7 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 continue
 
             #Unicast bytes:        0/0/0
-            p19 = re.compile(r'^\s*Unicast *bytes: *(?P<unicast_bytes_forwarded>[0-9]+)'
-                              '\/(?P<unicast_bytes_originated>[0-9]+)\/'
-                              '(?P<unicast_bytes_consumed>[0-9]+)$')
-            m = p19.match(line)
+            m = p.p19.match(line)
             if m:
                 ipv6_interface_dict[interface]['ipv6']['counters']\
                 ['unicast_bytes_forwarded'] = int(m.groupdict()['unicast_bytes_forwarded'])
@@ -2561,10 +2669,7 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 continue
 
             #Multicast packets:    0/12/9
-            p20 = re.compile(r'^\s*Multicast *packets: *(?P<multicast_packets_forwarded>[0-9]+)'
-                              '\/(?P<multicast_packets_originated>[0-9]+)\/'
-                              '(?P<multicast_packets_consumed>[0-9]+)$')
-            m = p20.match(line)
+            m = p.p20.match(line)
             if m:
                 ipv6_interface_dict[interface]['ipv6']['counters']\
                 ['multicast_packets_forwarded'] = int(m.groupdict()['multicast_packets_forwarded'])
@@ -2575,10 +2680,7 @@ class ShowIpv6InterfaceVrfAll(ShowIpv6InterfaceVrfAllSchema):
                 continue
 
             #Multicast bytes:      0/1144/640
-            p21 = re.compile(r'^\s*Multicast *bytes: *(?P<multicast_bytes_forwarded>[0-9]+)\/'
-                              '(?P<multicast_bytes_originated>[0-9]+)\/'
-                              '(?P<multicast_bytes_consumed>[0-9]+)$')
-            m = p21.match(line)
+            m = p.p21.match(line)
             if m:
                 ipv6_interface_dict[interface]['ipv6']['counters']\
                 ['multicast_bytes_forwarded'] = int(m.groupdict()['multicast_bytes_forwarded'])
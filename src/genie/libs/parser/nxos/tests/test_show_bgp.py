@@ -1,5 +1,6 @@
 
 # Python
+import json
 import unittest
 from unittest.mock import Mock
 import xml.etree.ElementTree as ET
@@ -43,6 +44,30 @@ from genie.libs.parser.nxos.show_bgp import ShowBgpProcessVrfAll,\
                                  ShowBgpL2vpnEvpnNeighborsAdvertisedRoutes, \
                                  ShowBgpVrfIpv4Unicast
 
+
+def json_output(xml_output):
+    """Return the '| json' reply NX-OS gives for the tree under __readonly__
+       of an '| xml' reply"""
+    root = ET.fromstring(xml_output.replace(']]>]]>', '').strip())
+    # the innermost one, as some replies nest __readonly__ twice
+    readonly = [elem for elem in root.iter()
+                if elem.tag.endswith('__readonly__')][-1]
+
+    def element(elem):
+        node = {}
+        for child in elem:
+            tag = child.tag.rpartition('}')[2]
+            value = element(child) if len(child) else (child.text or '')
+            if tag in node:
+                if not isinstance(node[tag], list):
+                    node[tag] = [node[tag]]
+                node[tag].append(value)
+            else:
+                node[tag] = value
+        return node
+
+    return json.dumps(element(readonly), indent=1)
+
 # =========================================
 #  Unit test for 'show bgp process vrf all'
 # =========================================
@@ -2982,6 +3007,28 @@ class test_show_bgp_process_vrf_all_xml(unittest.TestCase):
         parsed_output = obj.parse()
         self.assertEqual(parsed_output,self.golden_parsed_output)
 
+    def test_show_bgp_process_vrf_all_golden_json(self):
+        self.maxDiff = None
+        self.device = Mock(**{'execute.return_value': json_output(
+            self.golden_output['execute.return_value'])})
+        obj = ShowBgpProcessVrfAll(device=self.device)
+        parsed_output = obj.parse_json()
+        self.device.execute.assert_called_once_with(
+            'show bgp process vrf all | json')
+        self.assertEqual(parsed_output,self.golden_parsed_output)
+
+    def test_show_bgp_process_vrf_all_json_output(self):
+        self.maxDiff = None
+        self.device = Mock()
+        obj = ShowBgpProcessVrfAll(device=self.device)
+        parsed_output = obj.parse_json(output=json_output(
+            self.golden_output['execute.return_value']))
+        self.assertEqual(parsed_output,self.golden_parsed_output)
+        # a rejected '| json' given as output is not run on the device
+        with self.assertRaises(ValueError):
+            obj.parse_json(output="% Invalid command at '^' marker.")
+        self.device.execute.assert_not_called()
+
 
 class test_show_bgp_process_vrf_all_yang(unittest.TestCase):
 
@@ -13750,6 +13797,16 @@ class test_show_bgp_vrf_all_all_summary_xml(unittest.TestCase):
         parsed_output = obj.parse(vrf='all')
         self.assertEqual(parsed_output,self.golden_parsed_output)
 
+    def test_golden_json(self):
+        self.maxDiff = None
+        self.device = Mock(**{'execute.return_value': json_output(
+            self.golden_output['execute.return_value'])})
+        obj = ShowBgpVrfAllAllSummary(device=self.device)
+        parsed_output = obj.parse_json(vrf='all')
+        self.device.execute.assert_called_once_with(
+            'show bgp vrf all all summary | json')
+        self.assertEqual(parsed_output,self.golden_parsed_output)
+
 
 # ==================================================================
 #  Unit test for 'show bgp process vrf all all dampening parameters'
@@ -23278,6 +23335,18 @@ class test_show_bgp_all_nexthop_database_xml(unittest.TestCase):
         parsed_output = obj.parse()
         self.assertEqual(parsed_output,self.golden_parsed_output_3)
 
+    def test_golden_json(self):
+        self.maxDiff = None
+        for golden_output, golden_parsed_output in (
+                (self.golden_output_1, self.golden_parsed_output_1),
+                (self.golden_output_2, self.golden_parsed_output_2),
+                (self.golden_output_3, self.golden_parsed_output_3)):
+            self.device = Mock(**{'execute.return_value': json_output(
+                golden_output['execute.return_value'])})
+            obj = ShowBgpAllNexthopDatabase(device=self.device)
+            parsed_output = obj.parse_json()
+            self.assertEqual(parsed_output,golden_parsed_output)
+
 
 # =======================================================
 #  Unit test for 'show bgp peer-template'
@@ -25741,6 +25810,43 @@ class test_show_bgp_sessions_xml(unittest.TestCase):
         parsed_output = obj.parse(vrf='all')
         self.assertEqual(parsed_output,self.golden_parsed_output)
 
+    def test_golden_json(self):
+        self.maxDiff = None
+        self.device = Mock(**{'execute.return_value': json_output(
+            self.golden_output['execute.return_value'])})
+        obj = ShowBgpSessions(device=self.device)
+        parsed_output = obj.parse_json(vrf='all')
+        self.device.execute.assert_called_once_with(
+            'show bgp sessions vrf all | json')
+        self.assertEqual(parsed_output,self.golden_parsed_output)
+
+    def test_json_rejected(self):
+        self.maxDiff = None
+        outputs = {
+            'show bgp sessions vrf all | json':
+                "% Invalid command at '^' marker.",
+            'show bgp sessions vrf all': test_show_bgp_sessions_cli.\
+                golden_output_1['execute.return_value']}
+        self.device = Mock(**{'execute.side_effect': outputs.get})
+        obj = ShowBgpSessions(device=self.device)
+        parsed_output = obj.parse_json(vrf='all')
+        self.assertEqual(parsed_output,
+                         test_show_bgp_sessions_cli.golden_parsed_output_1)
+
+    def test_json_rejected_output(self):
+        self.device = Mock()
+        obj = ShowBgpSessions(device=self.device)
+        with self.assertRaises(ValueError):
+            obj.parse_json(vrf='all',
+                           output="% Invalid command at '^' marker.")
+        self.device.execute.assert_not_called()
+
+    def test_empty_json(self):
+        self.device = Mock(**{'execute.return_value': ''})
+        obj = ShowBgpSessions(device=self.device)
+        with self.assertRaises(SchemaEmptyParserError):
+            parsed_output = obj.parse_json(vrf='all')
+
 
 # =============================================================================
 #  Unit test for 'show bgp <address_family> labels [vrf <WROD>]'
@@ -26879,6 +26985,17 @@ class test_show_bgp_labels_xml(unittest.TestCase):
         parsed_output = obj.parse(address_family='ipv4 unicast', vrf='all')
         self.assertEqual(parsed_output,self.golden_parsed_output)
 
+    def test_golden_json(self):
+        self.maxDiff = None
+        self.device = Mock(**{'execute.return_value': json_output(
+            self.golden_output['execute.return_value'])})
+        obj = ShowBgpLabels(device=self.device)
+        parsed_output = obj.parse_json(address_family='ipv4 unicast',
+                                       vrf='all')
+        self.device.execute.assert_called_once_with(
+            'show bgp ipv4 unicast labels vrf all | json')
+        self.assertEqual(parsed_output,self.golden_parsed_output)
+
 # ==============================================================
 #  Unit test for 'show bgp l2vpn evpn summary'
 # ==============================================================
@@ -1,3 +1,7 @@
 from genie import abstract
 abstract.declare_token(__name__)
 
+from genie.libs.parser.utils.lazy import lazy_getattr
+
+# parser modules are imported when first accessed
+__getattr__ = lazy_getattr(__name__)
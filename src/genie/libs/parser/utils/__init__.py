@@ -1,3 +1,10 @@
-from .common import get_parser, get_parser_exclude, get_parser_commands
-from . import entry_points
+from .lazy import lazy_getattr
 
+# get_parser and the other helpers are imported with common on first access,
+# not by the parser modules only using a helper of utils
+__getattr__ = lazy_getattr(__name__, {
+    'get_parser': '.common',
+    'get_parser_exclude': '.common',
+    'get_parser_commands': '.common',
+    'get_parser_cache': '.common',
+})
@@ -0,0 +1,327 @@
+'''Bulk offline parsing of captured show command outputs
+
+A job is an (os, command, output, is_path) tuple, output being the text of
+the show command output, or the path of a file holding it when is_path is
+True. is_path may be left out for the text of an output. The parser of each
+distinct (os, command) is looked up once with get_parser, the jobs are parsed
+in a process pool, by chunks, through the output argument of the parsers so
+no device is ever connected to, and one result record is returned per job,
+in the order of the jobs:
+
+    from genie.libs.parser.utils.bulk import parse_bulk
+
+    jobs = [('iosxe', 'show version', 'captures/r1/show_version.txt', True),
+            ('nxos', 'show vrf', 'captures/n1/show_vrf.txt', True)]
+    for record in parse_bulk(jobs):
+        print(record['status'], record['seconds'], record['result'])
+
+The same from the command line, the records are written as NDJSON:
+
+    genie-parse-bulk --jobs jobs.ndjson --output results.ndjson
+    genie-parse-bulk --os iosxe --command 'show version' captures/*/show_version.txt
+
+where each line of jobs.ndjson is a json object with the os, command and
+either path or output keys.
+
+Given a ParseCache (--cache, --cache-dir), identical outputs of the same
+command are parsed once per process, or once overall with a cache directory.
+
+With --validation, the results are validated with the compiled validators of
+validator.py instead of the generic schema engine, each one (full), a sample
+of them (sample, see --sample-every) or none.
+'''
+
+# python
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import concurrent.futures
+
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+from .cache import ParseCache
+from .common import get_parser
+from .validator import MODES, parse_with_validator
+
+log = logging.getLogger(__name__)
+
+# jobs sent to a process at once
+CHUNKSIZE = 16
+
+# parse cache and validation of a worker process, see _init_worker
+_worker_cache = None
+_worker_validation = (None, 100)
+
+
+class OfflineDevice(object):
+    '''Device given to the parsers of a bulk parse, only the abstraction
+       attributes are set and nothing can be executed on it'''
+
+    def __init__(self, os, platform=None, name=None):
+        self.name = name or os
+        self.os = os
+        self.platform = platform
+        order = ['os', 'platform'] if platform else ['os']
+        self.custom = {'abstraction': {'order': order}}
+
+    def __repr__(self):
+        return '<OfflineDevice {}>'.format(self.name)
+
+    def execute(self, command, *args, **kwargs):
+        raise Exception("Cannot execute '{}' on offline device '{}', the "
+                        "output must be provided".format(command, self.name))
+
+
+def _job(job):
+    # (os, command, output, is_path), is_path defaults to False
+    os_name, command, output, *is_path = job
+    return os_name, command, output, bool(is_path and is_path[0])
+
+
+def resolve_parsers(jobs):
+    '''Look up the parser of each distinct (os, command) of the jobs
+
+        Returns:
+            dict of (os, command): (parser class, kwargs) or the error message
+            when no parser is found
+    '''
+    parsers = {}
+    for os_name, command, *_ in jobs:
+        key = (os_name, command)
+        if key in parsers:
+            continue
+        try:
+            parsers[key] = get_parser(command, OfflineDevice(os_name))
+        except Exception as e:
+            parsers[key] = str(e)
+    return parsers
+
+
+def parse_job(index, os_name, command, parser, output, is_path=False,
+              cache=None, validation=None, sample_every=100):
+    '''Parse one job
+
+        Args:
+            index (`int`): position of the job
+            os_name (`str`): os of the device
+            command (`str`): show command
+            parser: (parser class, kwargs) or the error message of the lookup
+            output (`str`): output or path of the file holding it
+            is_path (`bool`): output is the path of a file
+            cache (`ParseCache`): results of the outputs already parsed
+            validation (`str`): validation mode of the compiled validators,
+                                see set_validation, None for parse()
+            sample_every (`int`): sampling interval of the sample validation
+
+        Returns:
+            result record
+    '''
+    start = time.perf_counter()
+    record = {'index': index,
+              'os': os_name,
+              'command': command,
+              'path': None,
+              'parser': None,
+              'status': 'error',
+              'result': None,
+              'error': None,
+              'cached': False}
+    try:
+        if isinstance(parser, str):
+            raise Exception(parser)
+        parser_cls, kwargs = parser
+        record['parser'] = '{}.{}'.format(parser_cls.__module__,
+                                          parser_cls.__name__)
+        if is_path:
+            record['path'] = output
+            with open(output) as f:
+                output = f.read()
+        result = ParseCache.MISSING
+        if cache is not None and cache.enabled:
+            key = cache.key(parser_cls, kwargs, output)
+            result = cache.get(key)
+            record['cached'] = result is not ParseCache.MISSING
+        if result is ParseCache.MISSING:
+            device = OfflineDevice(os_name)
+            if validation:
+                result = parse_with_validator(parser_cls, device, output,
+                                              validation, sample_every,
+                                              **kwargs)
+            else:
+                result = parser_cls(device=device).parse(output=output,
+                                                         **kwargs)
+            if cache is not None and cache.enabled:
+                cache.set(key, result)
+        record['result'] = result
+        record['status'] = 'ok'
+    except SchemaEmptyParserError:
+        record['status'] = 'empty'
+        record['result'] = {}
+    except Exception as e:
+        record['error'] = '{}: {}'.format(type(e).__name__, e)
+    record['seconds'] = time.perf_counter() - start
+    return record
+
+
+def _init_worker(cache, validation=None, sample_every=100):
+    global _worker_cache, _worker_validation
+    _worker_cache = cache
+    _worker_validation = (validation, sample_every)
+
+
+def _parse_chunk(chunk, cache=None, validation=None):
+    cache = cache or _worker_cache
+    validation, sample_every = validation or _worker_validation
+    return [parse_job(*job, cache=cache, validation=validation,
+                      sample_every=sample_every)
+            for job in chunk]
+
+
+def parse_bulk(jobs, workers=None, chunksize=CHUNKSIZE, cache=None,
+               validation=None, sample_every=100):
+    '''Parse jobs in a process pool
+
+        Args:
+            jobs (`list`): (os, command, output, is_path) tuples, see the
+                           module
+            workers (`int`): number of processes, defaults to the number of
+                             CPUs, 1 parses in the current process
+            chunksize (`int`): number of jobs sent to a process at once
+            cache (`ParseCache`): cache of the parsed results, each process
+                                  gets its own memory tier and shares the
+                                  on-disk one
+            validation (`str`): full, sample or none to validate with the
+                                compiled validators, None for parse()
+            sample_every (`int`): sampling interval of the sample validation
+
+        Returns:
+            generator of the result records, in the order of the jobs
+    '''
+    jobs = [_job(job) for job in jobs]
+    parsers = resolve_parsers(jobs)
+    work = [(index, os_name, command, parsers[(os_name, command)], output,
+             is_path)
+            for index, (os_name, command, output, is_path)
+            in enumerate(jobs)]
+    chunks = [work[index:index + chunksize]
+              for index in range(0, len(work), chunksize)]
+
+    if validation and validation not in MODES:
+        raise ValueError('validation mode {!r} is not one of {}'.format(
+            validation, ', '.join(MODES)))
+    workers = workers or os.cpu_count() or 1
+    if workers < 2 or len(chunks) < 2:
+        for chunk in chunks:
+            yield from _parse_chunk(chunk, cache,
+                                    (validation, sample_every))
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker,
+            initargs=(cache, validation, sample_every)) as pool:
+        for records in pool.map(_parse_chunk, chunks):
+            yield from records
+
+
+def write_ndjson(records, stream):
+    '''Write the records one json object per line
+
+        Returns:
+            dict of the number of records per status, and of cached records
+    '''
+    summary = {}
+    for record in records:
+        stream.write(json.dumps(record, default=str))
+        stream.write('\n')
+        summary[record['status']] = summary.get(record['status'], 0) + 1
+        if record['cached']:
+            summary['cached'] = summary.get('cached', 0) + 1
+    return summary
+
+
+def read_jobs(stream):
+    '''Read the jobs of an NDJSON stream, one json object per line with the
+       os, command and either path or output keys'''
+    for number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        job = json.loads(line)
+        try:
+            if 'path' in job:
+                yield job['os'], job['command'], job['path'], True
+            else:
+                yield job['os'], job['command'], job['output'], False
+        except KeyError as e:
+            raise ValueError('Job on line {} has no {} key'.format(number, e))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Parse captured show command outputs offline, the '
+                    'results are written as NDJSON')
+    parser.add_argument('files', nargs='*',
+                        help='output files of --command on --os')
+    parser.add_argument('--jobs', help="NDJSON jobs file, '-' for stdin")
+    parser.add_argument('--os', help='os of the files')
+    parser.add_argument('--command', help='show command of the files')
+    parser.add_argument('--output', '-o', help='results file, default stdout')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='number of processes, default number of CPUs')
+    parser.add_argument('--chunksize', type=int, default=CHUNKSIZE,
+                        help='jobs sent to a process at once')
+    parser.add_argument('--cache', action='store_true',
+                        help='parse identical outputs once per process')
+    parser.add_argument('--cache-dir',
+                        help='on-disk parse cache shared by the processes '
+                             'and the runs, implies --cache, its results are '
+                             'unpickled so it must be trusted')
+    parser.add_argument('--validation', choices=MODES,
+                        help='validate with the compiled validators, every '
+                             'result, a sample or none')
+    parser.add_argument('--sample-every', type=int, default=100,
+                        help='validate one result in every, per parser, '
+                             'with --validation sample')
+    args = parser.parse_args(argv)
+
+    jobs = []
+    if args.files:
+        if not args.os or not args.command:
+            parser.error('--os and --command are required with files')
+        jobs.extend((args.os, args.command, path, True)
+                    for path in args.files)
+    if args.jobs == '-':
+        jobs.extend(read_jobs(sys.stdin))
+    elif args.jobs:
+        with open(args.jobs) as f:
+            jobs.extend(read_jobs(f))
+    if not jobs:
+        parser.error('no jobs, give --jobs or files')
+
+    cache = None
+    if args.cache or args.cache_dir:
+        cache = ParseCache(directory=args.cache_dir)
+
+    start = time.perf_counter()
+    records = parse_bulk(jobs, workers=args.workers,
+                         chunksize=args.chunksize, cache=cache,
+                         validation=args.validation,
+                         sample_every=args.sample_every)
+    if args.output:
+        with open(args.output, 'w') as f:
+            summary = write_ndjson(records, f)
+    else:
+        summary = write_ndjson(records, sys.stdout)
+
+    print('{} jobs in {:.2f}s: {}'.format(
+        len(jobs), time.perf_counter() - start,
+        ', '.join('{} {}'.format(count, status)
+                  for status, count in sorted(summary.items()))),
+        file=sys.stderr)
+    return 1 if summary.get('error') else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
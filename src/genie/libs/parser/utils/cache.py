@@ -0,0 +1,316 @@
+'''Caches used by the parser utilities'''
+
+# python
+import os
+import json
+import threading
+from collections import OrderedDict
+
+
+class LRUCache(object):
+    '''Bounded least recently used cache with hit and miss counters
+
+        Args:
+            maxsize (`int`): maximum number of entries, 0 disables the cache
+            maxbytes (`int`): maximum total size of the values, None for no
+                              limit
+            sizeof (`callable`): size of a value, defaults to len
+
+        example:
+
+            >>> cache = LRUCache(maxsize=2)
+            >>> cache.set('show version', 1)
+            >>> cache.get('show version')
+            1
+            >>> cache.info()
+            {'hits': 1, 'misses': 0, 'size': 1, 'maxsize': 2}
+    '''
+
+    # returned by get when the key is not cached, None is a valid value
+    MISSING = object()
+
+    def __init__(self, maxsize=1024, maxbytes=None, sizeof=len):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.sizeof = sizeof
+        self.hits = 0
+        self.misses = 0
+        self.bytes = 0
+        self._data = OrderedDict()
+        self._sizes = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key):
+        '''Return the cached value of key, or LRUCache.MISSING'''
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return self.MISSING
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        '''Cache value under key, evicting the least recently used entries'''
+        if self.maxsize <= 0:
+            return
+        size = self.sizeof(value) if self.maxbytes is not None else 0
+        if self.maxbytes is not None and size > self.maxbytes:
+            # would evict everything else and still not fit
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self.bytes += size - self._sizes.get(key, 0)
+            self._sizes[key] = size
+            while len(self._data) > self.maxsize or \
+                    (self.maxbytes is not None and self.bytes > self.maxbytes):
+                evicted, _ = self._data.popitem(last=False)
+                self.bytes -= self._sizes.pop(evicted)
+
+    def clear(self):
+        '''Remove all the entries, the counters are kept'''
+        with self._lock:
+            self._data.clear()
+            self._sizes.clear()
+            self.bytes = 0
+
+    def reset(self):
+        '''Remove all the entries and reset the counters'''
+        with self._lock:
+            self._data.clear()
+            self._sizes.clear()
+            self.bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        '''Return the hit and miss counters and the current size'''
+        info = {'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._data),
+                'maxsize': self.maxsize}
+        if self.maxbytes is not None:
+            info['bytes'] = self.bytes
+            info['maxbytes'] = self.maxbytes
+        return info
+
+
+class ParseCache(object):
+    '''Parsed results keyed on the content they were parsed from
+
+        The key is a hash of the parser class, its kwargs and the output, so
+        identical outputs, from several devices or from the same device polled
+        again, are parsed once. Results are kept pickled, each hit unpickles a
+        new copy, so a caller modifying its result does not modify the cache.
+
+        Args:
+            maxsize (`int`): maximum number of results in memory, 0 disables
+                             the cache
+            maxbytes (`int`): maximum size of the pickled results in memory
+            directory (`str`): directory of the on-disk tier, shared between
+                               processes, None for memory only
+            maxdiskbytes (`int`): maximum size of the on-disk tier
+
+        The on-disk results are unpickled, and unpickling runs code: anyone
+        able to write to the directory can run code in the processes using
+        the cache. The directory is created readable by its owner only, a
+        directory shared with other users must be trusted as much as the
+        code of the parsers.
+
+        example:
+
+            >>> cache = ParseCache(directory='/tmp/parse_cache')
+            >>> parsed = cache.parse(ShowVersion, device, output)
+            >>> cache.info()['hit_ratio']
+    '''
+
+    MISSING = LRUCache.MISSING
+
+    def __init__(self, maxsize=1024, maxbytes=64 * 1024 * 1024,
+                 directory=None, maxdiskbytes=1024 * 1024 * 1024):
+        self.memory = LRUCache(maxsize=maxsize, maxbytes=maxbytes)
+        self.directory = directory
+        self.maxdiskbytes = maxdiskbytes
+        self.disk_hits = 0
+        self._disk_bytes = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # a copy, ex: for a worker process, has the limits but no entries
+        return {'maxsize': self.memory.maxsize,
+                'maxbytes': self.memory.maxbytes,
+                'directory': self.directory,
+                'maxdiskbytes': self.maxdiskbytes}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    @property
+    def enabled(self):
+        return self.memory.maxsize > 0 or self.directory is not None
+
+    def configure(self, maxsize=None, maxbytes=None, directory=None,
+                  maxdiskbytes=None):
+        '''Change the limits or the directory, the entries are kept'''
+        if maxsize is not None:
+            self.memory.maxsize = maxsize
+        if maxbytes is not None:
+            self.memory.maxbytes = maxbytes
+        if directory is not None:
+            self.directory = directory
+            self._disk_bytes = None
+        if maxdiskbytes is not None:
+            self.maxdiskbytes = maxdiskbytes
+
+    @staticmethod
+    def key(parser_cls, kwargs, output):
+        '''Hash of the parser class, its kwargs and the output'''
+        # pickle, hashlib and tempfile are only imported once the parse
+        # cache is used, not with the parser modules
+        import hashlib
+        from genie.libs.parser import __version__
+        digest = hashlib.sha256()
+        # a new release can parse the same output differently
+        digest.update('{}:{}.{}\0'.format(__version__, parser_cls.__module__,
+                                          parser_cls.__qualname__).encode())
+        digest.update(json.dumps(kwargs or {}, sort_keys=True,
+                                 default=repr).encode())
+        digest.update(b'\0')
+        digest.update(output.encode('utf-8', 'surrogatepass'))
+        return digest.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key + '.pickle')
+
+    def get(self, key):
+        '''Return a copy of the result cached under key, or MISSING'''
+        data = self.memory.get(key)
+        if data is self.MISSING and self.directory is not None:
+            try:
+                with open(self._path(key), 'rb') as f:
+                    data = f.read()
+            except OSError:
+                pass
+            else:
+                with self._lock:
+                    self.disk_hits += 1
+                self.memory.set(key, data)
+        if data is self.MISSING:
+            return data
+        import pickle
+        return pickle.loads(data)
+
+    def set(self, key, result):
+        '''Cache result under key'''
+        import pickle
+        data = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        self.memory.set(key, data)
+        if self.directory is not None:
+            self._write(key, data)
+
+    def _write(self, key, data):
+        path = self._path(key)
+        if os.path.exists(path):
+            return
+        # owner only, see the class docstring
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+        # written under a temporary name, readers never see a partial file
+        import tempfile
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+        with self._lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = self._disk_usage()
+            else:
+                self._disk_bytes += len(data)
+            if self.maxdiskbytes is not None and \
+                    self._disk_bytes > self.maxdiskbytes:
+                self._prune_disk()
+
+    def _files(self):
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                if name.endswith('.pickle'):
+                    path = os.path.join(root, name)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    yield stat.st_mtime, stat.st_size, path
+
+    def _disk_usage(self):
+        return sum(size for _, size, _ in self._files())
+
+    def _prune_disk(self):
+        # oldest first, down to 90% of the limit
+        target = self.maxdiskbytes * 0.9
+        size = self._disk_usage()
+        for _, file_size, path in sorted(self._files()):
+            if size <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            size -= file_size
+        self._disk_bytes = size
+
+    def parse(self, parser_cls, device, output, kwargs=None):
+        '''Parse output with parser_cls, or return the cached result of an
+           identical output'''
+        kwargs = kwargs or {}
+        if not self.enabled or not isinstance(output, str):
+            # a stream cannot be hashed without consuming it
+            return parser_cls(device=device).parse(output=output, **kwargs)
+        key = self.key(parser_cls, kwargs, output)
+        result = self.get(key)
+        if result is self.MISSING:
+            result = parser_cls(device=device).parse(output=output, **kwargs)
+            self.set(key, result)
+        return result
+
+    def clear(self):
+        '''Remove the entries of the memory tier, the counters are kept'''
+        self.memory.clear()
+
+    def reset(self):
+        '''Remove the entries of the memory tier and reset the counters'''
+        self.memory.reset()
+        with self._lock:
+            self.disk_hits = 0
+
+    def info(self):
+        '''Return the hit counters, the hit ratio and the sizes'''
+        memory = self.memory.info()
+        # disk hits are memory misses
+        hits = memory['hits'] + self.disk_hits
+        misses = memory['misses'] - self.disk_hits
+        lookups = hits + misses
+        info = {'hits': hits,
+                'memory_hits': memory['hits'],
+                'disk_hits': self.disk_hits,
+                'misses': misses,
+                'hit_ratio': hits / lookups if lookups else 0.0,
+                'size': memory['size'],
+                'maxsize': memory['maxsize'],
+                'bytes': memory.get('bytes', 0),
+                'maxbytes': memory.get('maxbytes')}
+        if self.directory is not None:
+            with self._lock:
+                if self._disk_bytes is None:
+                    self._disk_bytes = self._disk_usage()
+                info['disk_bytes'] = self._disk_bytes
+            info['maxdiskbytes'] = self.maxdiskbytes
+        return info
@@ -0,0 +1,432 @@
+'''Columnar results of table parsers
+
+A table parser returns one nested dict per row. With columnar=True, the
+parsers using ColumnarParser return the rows as columns instead, one list per
+field, with an index of the row keys:
+
+    >>> res = Ps(device=device).parse(columnar=True)
+    >>> table = res['pid']
+    >>> table['cmd'][table.index['2322']]
+    '/sbin/mingetty /dev/tty2'
+    >>> res.to_dict() == Ps(device=device).parse()
+    True
+
+The rows of a table are located in the schema by a path of literal keys and
+{key} columns, ex: ('vrf', '{vrf}', 'index', '{index}') for
+show ip nat translations. Each row holds its keys, the fields of the dicts
+along the path, nested dicts flattened as 'details.create', and None for the
+fields it does not have. The values of the schema outside the rows are kept
+in Columnar.extra.
+
+Table.arrays() returns the columns as NumPy arrays when NumPy is installed.
+'''
+
+# Python
+import inspect
+
+# NumPy is optional
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+
+def _key_name(segment):
+    # '{vrf}' -> 'vrf', literal keys -> None
+    if segment.startswith('{') and segment.endswith('}'):
+        return segment[1:-1]
+    return None
+
+
+def _flatten_fields(node, prefix, fields, skip=()):
+    # skip is the chain of literal keys leading to the next rows
+    for name, value in node.items():
+        if skip and name == skip[0]:
+            if len(skip) > 1 and isinstance(value, dict):
+                _flatten_fields(value, prefix + name + '.', fields, skip[1:])
+            continue
+        if isinstance(value, dict) and value:
+            _flatten_fields(value, prefix + name + '.', fields)
+        else:
+            fields[prefix + name] = value
+
+
+class Table(object):
+    '''Rows of a table result, stored as one list per field
+
+        Args:
+            path (`tuple`): literal keys and {key} columns leading to the rows
+                            in the schema
+            key_fields (`list`): keys which are also a field of the dict they
+                                 key, ex: 'ip' of the arp neighbors
+
+        Attributes:
+            keys (`list`): names of the key columns
+            columns (`dict`): {field: list of the values of the rows}
+            index (`dict`): {key, or tuple of keys: row number}
+    '''
+
+    def __init__(self, path, key_fields=()):
+        self.path = tuple(path)
+        self.key_fields = set(key_fields)
+        self.keys = [name for name in map(_key_name, self.path) if name]
+        if not self.keys:
+            raise ValueError('path {} has no {{key}} column'.format(path))
+        self.columns = {name: [] for name in self.keys}
+        self.index = {}
+        # field: number of keys of the dict holding it
+        self.levels = {name: 0 for name in self.keys}
+        self._length = 0
+        self._single = self.keys[0] if len(self.keys) == 1 else None
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def __contains__(self, name):
+        return name in self.columns
+
+    def _key(self, row):
+        # key of the row in the index, None when a key is missing
+        if self._single:
+            return row.get(self._single)
+        key = tuple(map(row.get, self.keys))
+        return None if None in key else key
+
+    def append(self, row, levels=None):
+        '''Add a row, or update the row with the same keys, as a dict
+           update would
+
+            Args:
+                row (`dict`): {key or field: value}, flattened, missing fields
+                              are None
+                levels (`dict`): {field: number of keys of the dict holding
+                                 it}, defaults to the rows themselves
+        '''
+        key = self._key(row)
+        columns = self.columns
+        index = self.index
+        number = index.get(key) if key is not None else None
+        if number is None:
+            number = self._length
+            self._length += 1
+            if key is not None:
+                index[key] = number
+            if len(row) == len(columns):
+                # same fields as the rows before, the usual case
+                try:
+                    for name, value in row.items():
+                        columns[name].append(value)
+                    return
+                except KeyError:
+                    # a new field, the rows before are aligned again below
+                    pass
+
+        for name, value in row.items():
+            column = columns.get(name)
+            if column is None:
+                column = columns[name] = [None] * number
+                self.levels[name] = len(self.keys) if levels is None \
+                    else levels[name]
+            if len(column) > number:
+                column[number] = value
+            else:
+                column.append(value)
+        for column in columns.values():
+            while len(column) < self._length:
+                column.append(None)
+
+    def extend(self, columns, levels=None, update=True):
+        '''Add rows given as columns, None for the fields a row does not
+           have
+
+            A cli() filling the table appends the values of each row to
+            lists, one per field, and extends the table with them once: the
+            lists become the columns of an empty table and the index is
+            built at once, instead of row by row. Rows with the keys of a
+            row before update it, as append() does, or are left out when
+            update is False.
+
+            Args:
+                columns (`dict`): {key or field: list of the values of the
+                                  rows}, the lists are taken over
+                levels (`dict`): see append
+                update (`bool`): rows with the keys of a row before update
+                                 it, else the first row is kept
+        '''
+        length = len(next(iter(columns.values()), ()))
+        if not length:
+            return
+        if any(len(column) != length for column in columns.values()):
+            raise ValueError('columns of different lengths')
+        if not self._length and all(name in columns for name in self.keys):
+            if self._single:
+                keys = columns[self._single]
+            else:
+                keys = zip(*(columns[name] for name in self.keys))
+            if any(None in columns[name] for name in self.keys):
+                # the rows without all their keys are not indexed
+                keys = list(keys)
+                complete = [number for number, key in enumerate(keys)
+                            if key is not None and
+                            (self._single or None not in key)]
+                index = dict(zip(map(keys.__getitem__, complete), complete))
+                unique = len(index) == len(complete)
+            else:
+                index = dict(zip(keys, range(length)))
+                unique = len(index) == length
+            if unique:
+                # the usual case
+                for name, column in columns.items():
+                    self.columns[name] = column
+                    if name not in self.levels:
+                        self.levels[name] = len(self.keys) \
+                            if levels is None else levels[name]
+                self.index = index
+                self._length = length
+                return
+
+        names = list(columns)
+        for values in zip(*columns.values()):
+            row = {name: value for name, value in zip(names, values)
+                   if value is not None}
+            if not update and self._key(row) in self.index:
+                continue
+            self.append(row, levels)
+
+    def rows(self):
+        '''Yield each row as a dict of its non None values'''
+        names = list(self.columns)
+        for values in zip(*(self.columns[name] for name in names)):
+            yield {name: value for name, value in zip(names, values)
+                   if value is not None}
+
+    def arrays(self):
+        '''Return the columns as NumPy arrays, numeric columns without
+           missing values get a numeric dtype, or as lists without NumPy'''
+        if numpy is None:
+            return dict(self.columns)
+        arrays = {}
+        for name, column in self.columns.items():
+            if all(isinstance(value, (int, float)) for value in column):
+                arrays[name] = numpy.asarray(column)
+            else:
+                arrays[name] = numpy.array(column, dtype=object)
+        return arrays
+
+    def to_dict(self, into=None):
+        '''Return the rows as the schema shaped dict
+
+            Args:
+                into (`dict`): dict to add the rows to
+        '''
+        result = {} if into is None else into
+        names = list(self.columns)
+        # fields of each dict along the path, by number of keys
+        fields = [[] for _ in range(len(self.keys) + 1)]
+        for name in names:
+            if self.levels[name]:
+                fields[self.levels[name]].append((name, name.split('.')))
+
+        for values in zip(*(self.columns[name] for name in names)):
+            row = dict(zip(names, values))
+            node = result
+            level = 0
+            pending = []
+            for segment in self.path:
+                name = _key_name(segment)
+                if name is None:
+                    pending.append(segment)
+                    continue
+                key = row[name]
+                if key is None:
+                    break
+                # the literal keys are only added above an existing row
+                for literal in pending:
+                    node = node.setdefault(literal, {})
+                pending = []
+                node = node.setdefault(key, {})
+                level += 1
+                if name in self.key_fields:
+                    node[name] = key
+                for field, parts in fields[level]:
+                    value = row[field]
+                    if value is None:
+                        continue
+                    target = node
+                    for part in parts[:-1]:
+                        target = target.setdefault(part, {})
+                    target[parts[-1]] = value
+        return result
+
+
+class Columnar(object):
+    '''Columnar result of a parser: its tables and the values outside them
+
+        Attributes:
+            tables (`dict`): {name: Table}
+            extra (`dict`): schema shaped values which are not in a row
+    '''
+
+    def __init__(self, tables=None, extra=None):
+        self.tables = tables or {}
+        self.extra = extra or {}
+
+    def __getitem__(self, name):
+        return self.tables[name]
+
+    def __iter__(self):
+        return iter(self.tables)
+
+    def __len__(self):
+        return sum(len(table) for table in self.tables.values())
+
+    def __bool__(self):
+        return bool(len(self) or self.extra)
+
+    def to_dict(self):
+        '''Return the schema shaped dict of the parser'''
+        result = {}
+        _merge(result, self.extra)
+        for table in self.tables.values():
+            table.to_dict(into=result)
+        return result
+
+    @classmethod
+    def from_dict(cls, parsed, paths, key_fields=()):
+        '''Split a parsed result into the rows of the tables at paths
+
+            Args:
+                parsed (`dict`): schema shaped result
+                paths (`dict`): {table name: path of its rows}
+                key_fields (`list`): see Table
+        '''
+        columnar = cls({name: Table(path, key_fields)
+                        for name, path in paths.items()})
+        anchors = []
+        for table in columnar.tables.values():
+            literals = []
+            for segment in table.path:
+                if _key_name(segment):
+                    break
+                literals.append(segment)
+            anchors.append(tuple(literals))
+            node = parsed
+            for literal in literals:
+                node = node.get(literal) if isinstance(node, dict) else None
+            if isinstance(node, dict):
+                _flatten(table, node, len(literals), {}, {})
+        columnar.extra = _extra(parsed, anchors, ())
+        return columnar
+
+
+def _flatten(table, node, position, row, levels):
+    # node is the dict keyed by the key column at path[position]
+    name = _key_name(table.path[position])
+    level = table.keys.index(name) + 1
+    end = position + 1
+    while end < len(table.path) and not _key_name(table.path[end]):
+        end += 1
+    # literal keys from the dict of a row to the rows of the next key column
+    chain = table.path[position + 1:end] if end < len(table.path) else ()
+
+    for key, child in node.items():
+        if not isinstance(child, dict):
+            # ex: 'number_of_translations' next to the vrfs, see _extra
+            continue
+        entity = dict(row)
+        entity[name] = key
+        entity_levels = dict(levels)
+        fields = {}
+        _flatten_fields(child, '', fields, chain)
+        for field, value in fields.items():
+            if field == name and value == key:
+                table.key_fields.add(name)
+                continue
+            if field in entity:
+                raise ValueError('field {} of {} is at two levels'.format(
+                    field, table.path))
+            entity[field] = value
+            entity_levels[field] = level
+
+        nested = child
+        for literal in chain:
+            nested = nested.get(literal) if isinstance(nested, dict) \
+                else None
+        if chain and isinstance(nested, dict) and \
+                any(isinstance(value, dict) for value in nested.values()):
+            _flatten(table, nested, end, entity, entity_levels)
+        else:
+            table.append(entity, entity_levels)
+
+
+def _extra(node, anchors, prefix):
+    # copy of node without the dicts holding the rows, the values next to
+    # the keys of the rows are kept
+    if prefix in anchors:
+        return {key: value for key, value in node.items()
+                if not isinstance(value, dict)}
+    extra = {}
+    for key, value in node.items():
+        path = prefix + (key,)
+        if isinstance(value, dict) and \
+                any(anchor[:len(path)] == path for anchor in anchors):
+            kept = _extra(value, anchors, path)
+            if kept:
+                extra[key] = kept
+        else:
+            extra[key] = value
+    return extra
+
+
+def _merge(target, other):
+    for key, value in other.items():
+        if isinstance(value, dict):
+            _merge(target.setdefault(key, {}), value)
+        else:
+            target[key] = value
+
+
+class ColumnarParser(object):
+    '''Adds the columnar mode to the parse() of a table parser
+
+        The parser lists its tables in columnar_tables, {name: path}, and
+        the keys repeated in the dict they key in columnar_key_fields. By
+        default parse(columnar=True) parses as usual then splits the result
+        into the tables. A parser whose cli() fills the tables itself sets
+        columnar_cli, its cli() is then called with columnar=True and
+        returns a Columnar, without building nor validating the dicts. The
+        subclasses overriding cli() without the columnar argument fall back
+        to the split result.
+
+        example:
+
+            class Ps(ColumnarParser, PsSchema):
+                columnar_tables = {'pid': ('pid', '{pid}')}
+    '''
+
+    columnar_tables = {}
+    columnar_key_fields = ()
+    columnar_cli = False
+
+    def parse(self, *args, columnar=False, **kwargs):
+        if not columnar:
+            return super().parse(*args, **kwargs)
+        if not self.columnar_cli or \
+                'columnar' not in inspect.signature(self.cli).parameters:
+            return Columnar.from_dict(super().parse(*args, **kwargs),
+                                      self.columnar_tables,
+                                      self.columnar_key_fields)
+        result = self.cli(*args, columnar=True, **kwargs)
+        if not result:
+            raise SchemaEmptyParserError(result)
+        return result
+
+    def columnar_result(self):
+        '''Return the empty Columnar of the tables of the parser, for cli()'''
+        return Columnar({name: Table(path, self.columnar_key_fields)
+                         for name, path in self.columnar_tables.items()})
@@ -0,0 +1,162 @@
+'''Token trie over the show commands of parsers.json
+
+The trie is used by `_fuzzy_search_command` to narrow down the commands which
+can possibly match a search before running the (expensive) `_matches_fuzzy`
+on them. Each command is split on whitespace; literal tokens are stored as
+edges, `{argument}` tokens as a wildcard edge and tokens with an embedded
+argument (ex: `/dna/intent/api/v1/interface/{interface}`) as pattern edges.
+Each node holds the commands which end on it, grouped per OS.
+'''
+
+# python
+import re
+import bisect
+
+from .common import _is_regular_token
+
+
+class _Node(object):
+    '''Single node of the command trie'''
+
+    __slots__ = ('children', 'keys', 'wildcard', 'patterns', 'leaves')
+
+    def __init__(self):
+        # literal token -> _Node
+        self.children = {}
+        # sorted literal tokens, used for prefix (abbreviation) lookups
+        self.keys = None
+        # node reached by consuming an argument
+        self.wildcard = None
+        # (start, end, _Node) for tokens with an embedded argument
+        self.patterns = []
+        # os -> set of commands ending on this node, None holds all of them
+        self.leaves = {}
+
+    def prefixed(self, token):
+        '''yield the child nodes whose token starts with `token`'''
+        if self.keys is None:
+            self.keys = sorted(self.children)
+        keys = self.keys
+        index = bisect.bisect_left(keys, token)
+        while index < len(keys) and keys[index].startswith(token):
+            yield self.children[keys[index]]
+            index += 1
+
+
+class CommandTrie(object):
+    '''Token trie of show commands
+
+        Args:
+            data (`dict`): parser data, command -> os -> parser information
+
+        example:
+
+            >>> trie = CommandTrie(parser_data)
+            >>> trie.candidates(['sh', 'ver'], os='iosxe')
+            ['show version']
+    '''
+
+    def __init__(self, data=None):
+        self.root = _Node()
+        # command -> insertion order, results must follow parsers.json order
+        self.order = {}
+        for command, source in (data or {}).items():
+            self.add(command, source)
+
+    def __len__(self):
+        return len(self.order)
+
+    def __contains__(self, command):
+        return command in self.order
+
+    def add(self, command, os_names):
+        '''Add a command supported under the given os names'''
+
+        self.order.setdefault(command, len(self.order))
+
+        node = self.root
+        for token in command.split():
+            if '{' not in token:
+                child = node.children.get(token)
+                if child is None:
+                    child = node.children[token] = _Node()
+                    node.keys = None
+            elif token.startswith('{'):
+                if node.wildcard is None:
+                    node.wildcard = _Node()
+                child = node.wildcard
+            else:
+                start, end = re.match('(.*){.*?}(.*)', token).groups()
+                for pattern_start, pattern_end, child in node.patterns:
+                    if (pattern_start, pattern_end) == (start, end):
+                        break
+                else:
+                    child = _Node()
+                    node.patterns.append((start, end, child))
+            node = child
+
+        for os_name in [None] + list(os_names):
+            node.leaves.setdefault(os_name, set()).add(command)
+
+    def candidates(self, tokens, fuzzy=False, os=None):
+        '''Return the commands which could match the search tokens
+
+            The result is a superset of the commands `_matches_fuzzy` accepts,
+            ordered the same way as the parser data.
+
+            Args:
+                tokens (`list`): the search tokens
+                fuzzy (`bool`): whether or not the tokens can be regex
+                os (`str`): only return commands supported by this os
+
+            Returns:
+                list of commands
+        '''
+        found = set()
+        self._walk(self.root, tokens, 0, fuzzy, os, found)
+        return sorted(found, key=self.order.__getitem__)
+
+    def _walk(self, node, tokens, i, fuzzy, os, found):
+        if i == len(tokens):
+            self._collect(node, os, found)
+            return
+
+        token = tokens[i]
+
+        if fuzzy and token != '*':
+            if not _is_regular_token(token):
+                # A regex can span any number of command tokens, every
+                # command below this node is a candidate
+                self._collect_all(node, os, found)
+                return
+            token = token.replace(r'\|', '|').replace(r'\.', '.')
+
+        # Exact token or abbreviation of it
+        for child in node.prefixed(token):
+            self._walk(child, tokens, i + 1, fuzzy, os, found)
+
+        # Argument, which can span up to two tokens
+        if node.wildcard is not None:
+            self._walk(node.wildcard, tokens, i + 1, fuzzy, os, found)
+            if i + 1 < len(tokens):
+                self._walk(node.wildcard, tokens, i + 2, fuzzy, os, found)
+
+        # Argument embedded in the token
+        for start, end, child in node.patterns:
+            if token.startswith(start) and token.endswith(end):
+                self._walk(child, tokens, i + 1, fuzzy, os, found)
+
+    @staticmethod
+    def _collect(node, os, found):
+        found.update(node.leaves.get(os, ()))
+
+    def _collect_all(self, node, os, found):
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            self._collect(node, os, found)
+            stack.extend(node.children.values())
+            if node.wildcard is not None:
+                stack.append(node.wildcard)
+            stack.extend(child for _, _, child in node.patterns)
+
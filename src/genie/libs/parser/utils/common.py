@@ -5,7 +5,6 @@ import re
 import os
 import json
 import sys
-import warnings
 import logging
 import importlib
 import math
@@ -13,8 +12,17 @@ import math
 from genie.libs import parser
 from genie.abstract import Lookup
 
+from .cache import LRUCache, ParseCache
+from .intf_name import convert_intf_name
+from .xml_index import XmlIndex
+
 log = logging.getLogger(__name__)
 
+# xml time of Common.convert_xml_time, P4DT12M38S or PT1H4M41S
+_XML_TIME = re.compile(r'^P((?P<day>\d+)D)?T((?P<hour>\d+)H)?'
+                       r'((?P<minute>\d+)M)?((?P<second>\d+)S)?$')
+
+
 def _load_parser_json():
     '''get all parser data in json file'''
     try:
@@ -33,14 +41,86 @@ def _load_parser_json():
             parser_data = json.load(f)
     return parser_data
 
-# Parser within Genie
-parser_data = _load_parser_json()
-
-def get_parser_commands(device, data=parser_data):
+def _load_parser_data():
+    '''get all parser data, from the compact parser index when it is up to
+       date with parsers.json, else from parsers.json'''
+    from .parser_index import load_parser_index, _package_path, \
+                              INDEX_NAME, JSON_NAME
+
+    data = load_parser_index(_package_path(INDEX_NAME),
+                             _package_path(JSON_NAME))
+    if data is None:
+        data = _load_parser_json()
+    return data
+
+def _load_entry_points():
+    '''add the parsers of the external packages, once the parsers within
+       Genie are loaded'''
+    from . import entry_points
+
+def _get_parser_data():
+    '''Return parser_data, the dictionary of the parsers within Genie. It
+       is loaded on the first call, so importing genie.libs.parser does not
+       pay for it, and loaded again by the next call when the load fails.
+
+       Parsers are added with entry_points.add_parser, which keeps the token
+       trie and get_parser_cache in sync. Changing parser_data directly is
+       not supported, code doing so must call get_parser_cache.clear()'''
+    try:
+        return globals()['parser_data']
+    except KeyError:
+        pass
+    data = _load_parser_data()
+    # a module global from now on, the entry points add to it
+    globals()['parser_data'] = data
+    _load_entry_points()
+    return data
+
+def __getattr__(name):
+    # parser_data, a plain dict loaded on first access
+    if name == 'parser_data':
+        return _get_parser_data()
+    raise AttributeError('module {!r} has no attribute {!r}'.format(
+        __name__, name))
+
+# Token trie of the parser_data commands, built on first search
+_command_trie = None
+
+def _get_command_trie():
+    '''Return the token trie of the parser_data commands. It is rebuilt
+       when commands were added to parser_data behind its back'''
+    global _command_trie
+
+    parser_data = _get_parser_data()
+    if _command_trie is None or len(_command_trie) != len(parser_data):
+        from .command_trie import CommandTrie
+        _command_trie = CommandTrie(parser_data)
+    return _command_trie
+
+# Resolved get_parser results, keyed on the command and the device
+# abstraction. Check get_parser_cache.info() for the hit/miss counters.
+# Cleared by add_parser, not by direct changes to parser_data
+get_parser_cache = LRUCache(maxsize=1024)
+
+def _parser_data_updated(command, os_name):
+    '''Invalidation hook, to be called whenever a parser is added to
+       parser_data. Keeps the token trie and the get_parser cache in sync'''
+    if _command_trie is not None:
+        _command_trie.add(command, [os_name])
+    get_parser_cache.clear()
+
+# Parsed results keyed on the parser, its kwargs and the output, used by
+# parse_output. Disabled until configured, ex: parse_cache.configure(maxsize=1024)
+parse_cache = ParseCache(maxsize=0)
+
+def get_parser_commands(device, data=None):
     '''Remove all commands which contain { as this requires
        extra kwargs which cannot be guessed dynamically
        Remove the ones that arent related to this os'''
 
+    if data is None:
+        data = _get_parser_data()
+
     commands = []
     for command, values in data.items():
         if '{' in command or command == 'tokens' or device.os not in values:
@@ -78,6 +158,13 @@ def get_parser(command, device, fuzzy=False):
         order_list = None
 
     lookup = Lookup.from_device(device, packages={'parser': parser})
+
+    key = _get_parser_cache_key(command, device, lookup, order_list, fuzzy)
+    if key is not None:
+        cached = get_parser_cache.get(key)
+        if cached is not LRUCache.MISSING:
+            return _copy_parser_result(cached, fuzzy)
+
     results = _fuzzy_search_command(command, fuzzy, device.os, order_list)
     valid_results = []
     
@@ -105,9 +192,42 @@ def get_parser(command, device, fuzzy=False):
                         "'{c}' under {l}".format(c=command, l=lookup._tokens))
 
     if not fuzzy:
-        return valid_results[0][1], valid_results[0][2]
+        result = valid_results[0][1], valid_results[0][2]
+    else:
+        result = valid_results
+
+    if key is not None:
+        get_parser_cache.set(key, result)
+
+    return _copy_parser_result(result, fuzzy)
+
+def parse_output(command, device, output):
+    '''Parse the output of command with the parser get_parser finds for
+       device. When parse_cache is enabled, an output identical to one
+       already parsed is not parsed again'''
+    parser_cls, kwargs = get_parser(command, device)
+    return parse_cache.parse(parser_cls, device, output, kwargs)
+
+def _get_parser_cache_key(command, device, lookup, order_list, fuzzy):
+    '''Return the get_parser cache key, None when the device abstraction, its
+       os, tokens and abstraction order, is not made of strings and cannot be
+       cached (ex: the auto-created attributes of a Mock device)'''
+    if not isinstance(lookup._tokens, (list, tuple)) or \
+            not isinstance(order_list, (list, tuple, type(None))):
+        return None
+    tokens, order = tuple(lookup._tokens), tuple(order_list or ())
+    if not all(isinstance(part, str)
+               for part in (command, device.os) + tokens + order):
+        return None
+    return (command, device.os, tokens, order, fuzzy)
 
-    return valid_results
+def _copy_parser_result(result, fuzzy):
+    '''kwargs are returned to the caller, never hand out the cached dict'''
+    if not fuzzy:
+        parser_cls, kwargs = result
+        return parser_cls, dict(kwargs)
+    return [(found_command, parser_cls, dict(kwargs))
+                for found_command, parser_cls, kwargs in result]
 
 def _fuzzy_search_command(search, fuzzy, os=None, order_list=None, 
                                                                 device=None):
@@ -124,6 +244,8 @@ def _fuzzy_search_command(search, fuzzy, os=None, order_list=None,
             list: the result of the search
     """
 
+    parser_data = _get_parser_data()
+
     # Perfect match should return 
     if search in parser_data:
         return [(search, parser_data[search], {})]
@@ -141,7 +263,11 @@ def _fuzzy_search_command(search, fuzzy, os=None, order_list=None,
     best_score = -math.inf
     result = []
 
-    for command, source in parser_data.items():
+    # Only the commands the token trie could not rule out for this os
+    # need to be compared
+    for command in _get_command_trie().candidates(tokens, fuzzy, os or None):
+        source = parser_data[command]
+
         # Tokens and kwargs parameter must be non reference
         match_result = _matches_fuzzy(0, 0, tokens.copy(),
                                                         command, {}, fuzzy)
@@ -153,9 +279,6 @@ def _fuzzy_search_command(search, fuzzy, os=None, order_list=None,
                                 getattr(device, order_list[0]) not in source:
                 continue
 
-            if os and os not in source:
-                continue
-
             entry = (command, source, kwargs)
 
             if score > best_score:
@@ -482,11 +605,13 @@ class Common():
         return match
 
     @classmethod
-    def convert_intf_name(self, intf):
+    def convert_intf_name(self, intf, os=None):
         '''return the full interface name
 
             Args:
                 intf (`str`): Short version of the interface name
+                os (`str`): os of the device, for its overrides of the
+                            abbreviations, see intf_name.OS_ABBREVIATIONS
 
             Returns:
                 Full interface name fit the standard
@@ -498,59 +623,12 @@ class Common():
 
                 >>> convert_intf_name(intf='Eth2/1')
         '''
-
-        # Please add more when face other type of interface
-        convert = {'Eth': 'Ethernet',
-                   'Lo': 'Loopback',
-                   'Fa': 'FastEthernet',
-                   'Fas': 'FastEthernet',
-                   'Po': 'Port-channel',
-                   'PO': 'Port-channel',
-                   'Null': 'Null',
-                   'Gi': 'GigabitEthernet',
-                   'Gig': 'GigabitEthernet',
-                   'GE': 'GigabitEthernet',
-                   'Te': 'TenGigabitEthernet',
-                   'Ten': 'TenGigabitEthernet',
-                   'Tw': 'TwoGigabitEthernet',
-                   'Two': 'TwoGigabitEthernet',
-                   'Twe': 'TwentyFiveGigE',
-                   'mgmt': 'mgmt',
-                   'Vl': 'Vlan',
-                   'Tu': 'Tunnel',
-                   'Fe': '',
-                   'Hs': 'HSSI',
-                   'AT': 'ATM',
-                   'Et': 'Ethernet',
-                   'BD': 'BDI',
-                   'Se': 'Serial',
-                   'Fo': 'FortyGigabitEthernet',
-                   'For': 'FortyGigabitEthernet',
-                   'Hu': 'HundredGigE',
-                   'Hun': 'HundredGigE',
-                   'vl': 'vasileft',
-                   'vr': 'vasiright',
-                   'BE': 'Bundle-Ether'
-                   }
-        m = re.search(r'([a-zA-Z]+)', intf) 
-        m1 = re.search(r'([\d\/\.]+)', intf)
-        if hasattr(m, 'group') and hasattr(m1, 'group'):
-            int_type = m.group(0)
-            int_port = m1.group(0)
-            if int_type in convert.keys():
-                return(convert[int_type] + int_port)
-            else:
-                # Unifying interface names
-                converted_intf = intf[0].capitalize()+intf[1:].replace(
-                    ' ','').replace('ethernet', 'Ethernet')
-                return(converted_intf)
-        else:
-            return(intf)
+        return convert_intf_name(intf, os)
 
 
     @classmethod
     def retrieve_xml_child(self, root, key):
-        '''return the root which contains the key from xml
+        '''return the first element under root whose tag is key
 
             Args:
 
@@ -558,7 +636,7 @@ class Common():
                 key (`str`): Expceted tag name. ( without namespace)
 
             Returns:
-                Element object of the given tag
+                Element object of the given tag, None when not found
 
             Raises:
                 None
@@ -569,12 +647,8 @@ class Common():
                         root=<Element '{urn:ietf:params:xml:ns:netconf:base:1.0}rpc-reply' at 0xf760434c>,
                         key='TABLE_vrf')
         '''
-        for item in root:
-            if key in item.tag:
-                return item
-            else:
-                root = item
-                return self.retrieve_xml_child(root, key)
+        # the tags under root are indexed on the first lookup
+        return XmlIndex.of(root).find(key)
 
 
     @classmethod
@@ -587,6 +661,8 @@ class Common():
 
                 root (`obj`): ElementTree Object, point to top of the tree
                 namespace (`str`): Namesapce. Ex. {http://www.cisco.com/nxos:8.2.0.SK.1.:rip}
+                                   Not used, the namespace is read from the
+                                   tags of the reply.
                 expect_command (`str`): expected command.
 
             Returns:
@@ -594,7 +670,6 @@ class Common():
 
             Raises:
                 AssertionError: xml tag cli and command is not matched
-                Exception: No mandatory tag __readonly__ in output
 
             example:
 
@@ -603,73 +678,8 @@ class Common():
                         namespace='{http://www.cisco.com/nxos:8.2.0.SK.1.:rip}',
                         expect_command='show bgp all dampening flap-statistics')
         '''
-        # get to data node
-        cmd_node = root.getchildren()[0]
-        # compose command from element tree
-        # ex.  <nf:data>
-        #        <show>
-        #         <bgp>
-        #          <all>
-        #           <dampening>
-        #            <flap-statistics>
-        #             <__readonly__>
-        cli = ''
-        while True:
-            # get next node
-            try:
-                cmd_node = cmd_node.getchildren()
-                if len(cmd_node) == 1:
-
-                    # when only have one child
-                    cmd_node = cmd_node[0]
-
-                    # <__XML__PARAM__vrf-name>
-                    #  <__XML__value>VRF1</__XML__value>
-                    # </__XML__PARAM__vrf-name>
-                    if '__XML__value' in cmd_node.tag:
-                        cli += ' ' + cmd_node.text
-
-                elif len(cmd_node) > 1:
-
-                   # <__XML__PARAM__interface>
-                   #   <__XML__value>loopback100</__XML__value>
-                   #   <vrf>
-                   for item in cmd_node:
-                       if '__XML__value' in item.tag:
-                           cli += ' ' + item.text
-                       else:
-                           cmd_node = item
-                           break
-                else:
-                    break
-            except Exception:
-                pass
-
-            # get tag name
-            tag = cmd_node.tag.replace(namespace, '')
-
-            # __readonly__ is the end of the command
-            if '__readonly__' not in tag:
-                if '__XML__PARAM__' not in tag and \
-                   '__XML__value' not in tag and \
-                   'TABLE' not in tag:
-                    cli += ' ' + tag
-            else:
-                break
-
-            # if there is no __readonly__ but the command has outputs
-            # should be warining
-            if 'TABLE' in tag:
-                warnings.warn('Tag "__readonly__" should exsist in output when '
-                              'there are actual values in output')
-                break
-
-        cli = cli.strip()
-        # compare the commands
-        assert cli == expect_command, \
-            'Cli created from XML tags does not match the actual cli:\n'\
-            'XML Tags cli: {c}\nCli command: {e}'.format(c=cli, e=expect_command)
-
+        # the command is composed once per reply
+        XmlIndex.of(root).compare_command(expect_command)
 
 
     @classmethod
@@ -692,26 +702,18 @@ class Common():
         '''
         # P4DT12M38S
         # PT1H4M41S
-        p = re.compile(r'^P((?P<day>\d+)D)?T((?P<hour>\d+)H)?((?P<minute>\d+)M)?((?P<second>\d+)S)?$')
-        m = p.match(xml_time)
+        m = _XML_TIME.match(xml_time)
         if m:
-            day = m.groupdict()['day']
-            hour = m.groupdict()['hour']
+            day, hour, minute, second = m.group('day', 'hour', 'minute',
+                                                'second')
             hour = 0 if not hour else int(hour)
-            minute = m.groupdict()['minute']
             minute = 0 if not  minute else int(minute)
-            second = m.groupdict()['second']
             second = 0 if not  second else int(second)
 
             if day:
                 standard_time = "{d}d{h}h".format(d=day, h="%02d"% (hour))
             else:
-                standard_time = ''
-                standard_time += format("%02d"% (hour))
-                standard_time += ' ' + format("%02d"% (minute))
-                standard_time += ' ' +  format("%02d"% (second))
-
-                standard_time = ':'.join(standard_time.strip().split())
+                standard_time = "%02d:%02d:%02d" % (hour, minute, second)
         else:
             # P4M13DT21H21M19S
             standard_time = xml_time
@@ -37,7 +37,7 @@ import sys
 import pkg_resources
 import logging
 
-from .common import parser_data
+from .common import _get_parser_data, _parser_data_updated
 
 log = logging.getLogger(__name__)
 
@@ -69,6 +69,7 @@ def add_parser(parser, os_name):
     if isinstance(cli_commands, str):
         cli_commands = [cli_commands]
 
+    parser_data = _get_parser_data()
     for cmd in cli_commands:
         if cmd not in parser_data:
             parser_data[cmd] = {}
@@ -78,6 +79,7 @@ def add_parser(parser, os_name):
             'package': package,
             'class': parser.__name__
         }
+        _parser_data_updated(cmd, os_name)
 
 
 def load_entry_points():
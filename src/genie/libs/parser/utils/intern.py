@@ -0,0 +1,174 @@
+'''Shared values for large parsed results
+
+Full table parses repeat the same small values on every entry: next hops,
+interface and vrf names, origin codes, AS paths, and whole attribute dicts
+identical between thousands of prefixes. An Interner keeps one copy of each
+distinct string and of each distinct dict or list of strings and numbers,
+and hands out that copy instead of the equal one it is given.
+
+It is opt-in, either on the result once parsed:
+
+    >>> interner = Interner()
+    >>> parsed = interner.result(ShowIpBgp(device=device).parse())
+
+or from the result-building code of a parser, leaves first then the dict
+they complete:
+
+    path = {'next_hop': interner(m.groupdict()['next_hop']),
+            'path': interner(m.groupdict()['path'])}
+    index_dict[index] = interner.dict(path)
+
+The same Interner can be given the results of several devices, values are
+then shared between them as well. It holds a reference to every value it
+shares, drop it or clear() it with the results.
+
+Shared dicts and lists are the same object in several places of the result,
+they must not be modified once interned.
+'''
+
+# values compared by equality, the other values are shared containers
+_SCALARS = frozenset([str, int, float, bool, type(None)])
+
+
+def _items(container):
+    return container.items() if container.__class__ is dict \
+        else enumerate(container)
+
+
+class _Key(object):
+    '''Key of a shared container, equal to the containers of the same type
+       with the same items, compared with their type'''
+
+    __slots__ = ('container', 'hash')
+
+    def __init__(self, container):
+        self.container = container
+        self.hash = hash((container.__class__,) + tuple(_items(container)))
+
+    def __hash__(self):
+        return self.hash
+
+    def __eq__(self, other):
+        container, other = self.container, other.container
+        if container.__class__ is not other.__class__ or \
+                len(container) != len(other):
+            return False
+        # True == 1 == 1.0, the types have to be compared too
+        for (item, value), (other_item, other_value) in \
+                zip(_items(container), _items(other)):
+            if item != other_item or value != other_value or \
+                    item.__class__ is not other_item.__class__ or \
+                    value.__class__ is not other_value.__class__:
+                return False
+        return True
+
+
+class Interner(object):
+    '''One copy of each distinct string, and of each distinct dict or list
+       of scalars (strings, numbers, booleans and None)
+
+        Containers holding other containers are not shared, their items are.
+
+        Args:
+            max_items (`int`): containers with more items are not shared
+
+        example:
+
+            >>> interner = Interner()
+            >>> a = interner.dict({'next_hop': '10.1.1.1', 'weight': 0})
+            >>> b = interner.dict({'next_hop': '10.1.1.1', 'weight': 0})
+            >>> a is b
+            True
+    '''
+
+    def __init__(self, max_items=16):
+        self.max_items = max_items
+        self.hits = 0
+        self._values = {}
+        self._containers = {}
+
+    def __call__(self, value):
+        '''Return the shared copy of a string, other values are returned as
+           they are'''
+        if value.__class__ is not str:
+            return value
+        shared = self._values.setdefault(value, value)
+        if shared is not value:
+            self.hits += 1
+        return shared
+
+    def _share(self, container, values):
+        if len(container) > self.max_items:
+            return container
+        for value in values:
+            if value.__class__ not in _SCALARS:
+                return container
+        key = _Key(container)
+        shared = self._containers.setdefault(key, key).container
+        if shared is not container:
+            self.hits += 1
+        return shared
+
+    def dict(self, value):
+        '''Return the shared dict equal to value, or value when it holds
+           containers
+
+            The dict must not be modified afterwards.
+        '''
+        return self._share(value, value.values())
+
+    def list(self, value):
+        '''Return the shared list equal to value, see dict'''
+        return self._share(value, value)
+
+    def result(self, result):
+        '''Intern a parsed result, leaves first
+
+            The result is modified in place, its strings, dicts and lists of
+            scalars are replaced by their shared copy.
+
+            Returns:
+                the interned result
+        '''
+        cls = result.__class__
+        if cls is str:
+            return self(result)
+        if cls is dict:
+            for key, value in result.items():
+                if value.__class__ in _SCALARS and value.__class__ is not str:
+                    continue
+                result[key] = self.result(value)
+            return self.dict(result)
+        if cls is list:
+            for index, value in enumerate(result):
+                result[index] = self.result(value)
+            return self.list(result)
+        return result
+
+    def clear(self):
+        '''Forget the shared values, the counters are kept'''
+        self._values.clear()
+        self._containers.clear()
+
+    def info(self):
+        '''Return the number of shared strings, containers and of hits'''
+        return {'strings': len(self._values),
+                'containers': len(self._containers),
+                'hits': self.hits}
+
+
+def intern_result(result, interner=None):
+    '''Share the equal strings, dicts and lists of scalars of a parsed
+       result
+
+        Args:
+            result (`dict`): parsed result, modified in place
+            interner (`Interner`): shared with the results of other parses,
+                                   defaults to a new one
+
+        Returns:
+            the interned result
+    '''
+    if interner is None:
+        interner = Interner()
+    return interner.result(result)
@@ -0,0 +1,181 @@
+'''Interface name normalization
+
+Expands abbreviated interface names, as found in the tables of the show
+commands, to their full name:
+
+    >>> convert_intf_name('Gi1/0/1')
+    'GigabitEthernet1/0/1'
+    >>> convert_intf_name('Te0/0/0/1', os='iosxr')
+    'TenGigE0/0/0/1'
+    >>> convert_intf_names(['Eth1/1', 'Eth1/2', 'Po10'])
+    ['Ethernet1/1', 'Ethernet1/2', 'Port-channel10']
+
+The abbreviations are held in a character trie, built once per OS from
+ABBREVIATIONS and the overrides of OS_ABBREVIATIONS, so the type of a name is
+found in a single walk over its first characters. Names repeat across the
+rows of a table and across commands, the results are memoized.
+
+Common.convert_intf_name is the same conversion.
+'''
+
+# python
+import re
+import functools
+from string import ascii_letters
+
+# abbreviation: full name, please add more when facing other interface types
+ABBREVIATIONS = {
+    'Eth': 'Ethernet',
+    'Lo': 'Loopback',
+    'Fa': 'FastEthernet',
+    'Fas': 'FastEthernet',
+    'Po': 'Port-channel',
+    'PO': 'Port-channel',
+    'Null': 'Null',
+    'Gi': 'GigabitEthernet',
+    'Gig': 'GigabitEthernet',
+    'GE': 'GigabitEthernet',
+    'Te': 'TenGigabitEthernet',
+    'Ten': 'TenGigabitEthernet',
+    'Tw': 'TwoGigabitEthernet',
+    'Two': 'TwoGigabitEthernet',
+    'Twe': 'TwentyFiveGigE',
+    'mgmt': 'mgmt',
+    'Vl': 'Vlan',
+    'Tu': 'Tunnel',
+    'Fe': '',
+    'Hs': 'HSSI',
+    'AT': 'ATM',
+    'Et': 'Ethernet',
+    'BD': 'BDI',
+    'Se': 'Serial',
+    'Fo': 'FortyGigabitEthernet',
+    'For': 'FortyGigabitEthernet',
+    'Hu': 'HundredGigE',
+    'Hun': 'HundredGigE',
+    'vl': 'vasileft',
+    'vr': 'vasiright',
+    'BE': 'Bundle-Ether',
+}
+
+# os: {abbreviation: full name}, replacing or adding to ABBREVIATIONS for the
+# devices of that os
+OS_ABBREVIATIONS = {
+    'iosxr': {
+        'Te': 'TenGigE',
+        'Ten': 'TenGigE',
+        'Fo': 'FortyGigE',
+        'For': 'FortyGigE',
+        'TF': 'TwentyFiveGigE',
+        'Mg': 'MgmtEth',
+        'BV': 'BVI',
+    },
+    'nxos': {
+        'Po': 'port-channel',
+        'Lo': 'loopback',
+    },
+}
+
+# number of memoized names
+MEMO_SIZE = 8192
+
+_TYPE = re.compile(r'([a-zA-Z]+)')
+_PORT = re.compile(r'([\d\/\.]+)')
+
+# key of the full name in a trie node, characters are the other keys
+_FULL = None
+
+# os: (abbreviations, trie)
+_tables = {}
+
+
+def _table(os):
+    try:
+        return _tables[os]
+    except KeyError:
+        pass
+    abbreviations = dict(ABBREVIATIONS)
+    abbreviations.update(OS_ABBREVIATIONS.get(os, {}))
+    trie = {}
+    for abbreviation, full in abbreviations.items():
+        node = trie
+        for char in abbreviation:
+            node = node.setdefault(char, {})
+        node[_FULL] = full
+    _tables[os] = abbreviations, trie
+    return abbreviations, trie
+
+
+@functools.lru_cache(maxsize=MEMO_SIZE)
+def convert_intf_name(intf, os=None):
+    '''return the full interface name
+
+        Args:
+            intf (`str`): Short version of the interface name
+            os (`str`): os of the device, for its overrides of the
+                        abbreviations
+
+        Returns:
+            Full interface name fit the standard
+
+        example:
+
+            >>> convert_intf_name(intf='Eth2/1')
+            'Ethernet2/1'
+    '''
+    abbreviations, node = _table(os)
+
+    # walk the leading letters down the trie
+    position = 0
+    size = len(intf)
+    while position < size:
+        child = node.get(intf[position])
+        if child is None:
+            break
+        node = child
+        position += 1
+    if _FULL in node and (position == size or
+                          intf[position] not in ascii_letters):
+        m = _PORT.search(intf, position)
+        return node[_FULL] + m.group(0) if m else intf
+
+    m = _TYPE.search(intf)
+    m1 = _PORT.search(intf)
+    if not m or not m1:
+        return intf
+    int_type = m.group(0)
+    if int_type in abbreviations:
+        return abbreviations[int_type] + m1.group(0)
+    # Unifying interface names
+    return intf[0].capitalize() + \
+        intf[1:].replace(' ', '').replace('ethernet', 'Ethernet')
+
+
+def convert_intf_names(names, os=None):
+    '''Return the full names of a column of interface names
+
+        Args:
+            names (`iterable`): short versions of the interface names
+            os (`str`): os of the device
+
+        Returns:
+            list of the full names, in the order of names
+    '''
+    names = list(names)
+    converted = {name: convert_intf_name(name, os) for name in set(names)}
+    return [converted[name] for name in names]
+
+
+def add_abbreviations(abbreviations, os=None):
+    '''Add abbreviations, for all the os or for one os only
+
+        Args:
+            abbreviations (`dict`): {abbreviation: full name}
+            os (`str`): os of the abbreviations, None for all
+    '''
+    if os is None:
+        ABBREVIATIONS.update(abbreviations)
+    else:
+        OS_ABBREVIATIONS.setdefault(os, {}).update(abbreviations)
+    _tables.clear()
+    convert_intf_name.cache_clear()
@@ -0,0 +1,172 @@
+'''Rows of NX-OS '| json' replies
+
+NX-OS replies to '<command> | json' with the tree its '| xml' reply holds
+under __readonly__, the tags as keys, the leaves as strings and the
+TABLE_x/ROW_x tables as objects, a ROW_x being an object when the table
+has one row and a list of them otherwise:
+
+    {
+     "totalpeers": "3",
+     "TABLE_vrf": {
+      "ROW_vrf": [
+       {
+        "vrf-name-out": "default",
+        "TABLE_neighbor": {
+         "ROW_neighbor": {
+          "neighbor-id": "10.106.102.3",
+    ...
+
+iter_json_rows() walks the decoded reply with the Row specs of
+xml_stream and yields its rows as iter_rows() does for the '| xml' reply,
+so that a parser reading its rows with xml_rows gets a json() method from
+the same mapping, run by parse_json() of structured.JsonContext:
+
+    >>> tree = loads(out)
+    >>> if tree is None:
+    ...     # '| json' is rejected by the platform
+    ...     return self.cli()
+    >>> for name, values, parents in iter_json_rows(tree, self.xml_rows):
+    ...     ...
+
+The reply is decoded with orjson when it is installed, with json otherwise.
+'''
+
+# python
+import json
+
+# orjson is optional, a faster decoder of the replies
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .xml_stream import Row
+
+
+def loads(output, decoder=None):
+    '''Return the decoded '| json' reply of the device
+
+        Args:
+            output (`str`): reply of the device
+            decoder (`obj`): function decoding the reply, orjson.loads when
+                             orjson is installed, json.loads otherwise
+
+        Returns:
+            dict, {} when the reply is empty as NX-OS returns it for no
+            entries, None when it is not a json reply, as the error of a
+            platform rejecting '| json'
+
+        Raises:
+            ValueError: the reply is truncated or not well-formed
+
+        example:
+
+            >>> loads("% Invalid command at '^' marker.")
+            >>> loads('{"totalpeers": "3"}')
+            {'totalpeers': '3'}
+    '''
+    output = output.strip()
+    if not output:
+        return {}
+    if not output.startswith('{'):
+        # % Invalid command at '^' marker.
+        # Syntax error while parsing '| json'
+        return None
+    if decoder is None:
+        decoder = orjson.loads if orjson is not None else json.loads
+    return decoder(output)
+
+
+def iter_json_rows(tree, rows):
+    '''Yield the rows of a decoded NX-OS '| json' reply
+
+        Args:
+            tree (`dict`): reply decoded by loads()
+            rows (`dict`): {name: Row or path} of the rows to extract, the
+                           xml_rows of the parser
+
+        Returns:
+            generator of (name, values, parents) as iter_rows() yields them,
+            a row after the rows nested in it
+
+        example:
+
+            >>> for name, values, parents in iter_json_rows(
+            ...         loads(out), {'vrf': 'TABLE_vrf/ROW_vrf'}):
+            ...     print(values['vrf-name-out'])
+    '''
+    rows = {name: row if isinstance(row, Row) else Row(row)
+            for name, row in rows.items()}
+    by_path = {row.path: (name, row.fields) for name, row in rows.items()}
+    # tags leading from each path to an extracted row, the others are
+    # skipped
+    children = {}
+    for row in rows.values():
+        for index in range(len(row.path)):
+            children.setdefault(row.path[:index], set()).add(
+                row.path[index])
+    children = {path: {tag: path + (tag,) for tag in tags}
+                for path, tags in children.items()}
+    return _walk(tree, (), by_path, children, [])
+
+
+# a value of the row which is not a leaf
+_NOT_LEAF = object()
+
+
+def _leaf(value):
+    # the text of the leaf in the '| xml' reply, the first one of a leaf
+    # repeated in the row, _NOT_LEAF for a table
+    if type(value) is str or value is _NOT_LEAF:
+        return value
+    if isinstance(value, list):
+        if not value:
+            return _NOT_LEAF
+        value = value[0]
+    if isinstance(value, (dict, list)):
+        return _NOT_LEAF
+    return value if value is None else str(value)
+
+
+def _values(node, fields):
+    # the leaves of a row mapped to its schema keys, as iter_rows() does
+    values = {}
+    if fields is None:
+        for tag, value in node.items():
+            value = _leaf(value)
+            if value is not _NOT_LEAF:
+                values[tag] = value
+        return values
+    for tag, (key, convert) in fields.items():
+        value = node.get(tag, _NOT_LEAF)
+        if type(value) is not str:
+            value = _leaf(value)
+            if value is _NOT_LEAF:
+                continue
+        if convert is None:
+            values[key] = value
+        elif value is not None:
+            try:
+                values[key] = convert(value)
+            except (ValueError, TypeError):
+                pass
+    return values
+
+
+def _walk(node, path, by_path, children, parents):
+    row = by_path.get(path)
+    if row is not None:
+        values = _values(node, row[1])
+        parents.append(values)
+    tags = children.get(path)
+    for tag, child in node.items() if tags else ():
+        key = tags.get(tag)
+        if key is None:
+            continue
+        # ROW_x is an object when the table has one row
+        for item in child if isinstance(child, list) else (child,):
+            if isinstance(item, dict):
+                yield from _walk(item, key, by_path, children, parents)
+    if row is not None:
+        parents.pop()
+        yield row[0], values, tuple(parents)
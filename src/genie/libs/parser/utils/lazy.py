@@ -0,0 +1,56 @@
+'''Lazy attributes of the parser packages
+
+A parser package imports none of its modules, each parser module is only
+imported when its class is resolved, as genie.abstract resolves it with
+getattr() on the token packages. lazy_getattr() returns the module
+__getattr__ of a package, importing a submodule or a name of a submodule
+the first time it is accessed:
+
+    from genie import abstract
+    abstract.declare_token(__name__)
+
+    from genie.libs.parser.utils.lazy import lazy_getattr
+
+    # parser modules are imported when first accessed
+    __getattr__ = lazy_getattr(__name__)
+
+so that getattr(nxos, 'show_bgp') imports show_bgp and nothing else.
+'''
+
+# python
+import importlib
+import importlib.util
+
+
+def lazy_getattr(package, names=None):
+    '''Return the module __getattr__ of package
+
+        Args:
+            package (`str`): name of the package
+            names (`dict`): {name: submodule} of the names imported from a
+                            submodule on first access, the submodule
+                            relative to package
+
+        Returns:
+            function returning the submodule or the name accessed, raising
+            AttributeError for any other name
+
+        example:
+
+            >>> __getattr__ = lazy_getattr(__name__, {
+            ...     'get_parser': '.common'})
+    '''
+    names = names or {}
+
+    def __getattr__(name):
+        if name in names:
+            return getattr(importlib.import_module(names[name], package),
+                           name)
+        fullname = '{}.{}'.format(package, name)
+        if not name.startswith('_') and \
+                importlib.util.find_spec(fullname) is not None:
+            return importlib.import_module(fullname)
+        raise AttributeError('module {!r} has no attribute {!r}'.format(
+            package, name))
+
+    return __getattr__
@@ -0,0 +1,289 @@
+'''Single pass line lexer
+
+A line by line parser calls match() once per pattern until one matches. The
+Lexer merges the patterns into a single alternation, each pattern in its own
+named outer group, in the same order:
+
+    (?P<p1>...)|(?P<p2>...)|(?P<p3>...)
+
+so each line is scanned once by the regex engine, and the pattern which
+matched is m.lastgroup, the first one in the declaration order as with
+sequential matching. The named groups of the patterns are renamed in the
+alternation as several patterns usually use the same names, the match
+returned by the lexer gives them back under their original names.
+
+example:
+
+    class ShowLogging(ShowLoggingSchema):
+
+        patterns = Patterns(
+            # File logging: disabled
+            p8=r'(?P<tag>File +logging): +(?P<status>\\S+)$',
+            ...
+        )
+        lexer = Lexer(patterns)
+
+        def cli(self, output=None):
+            ...
+            for line in out.splitlines():
+                line = line.strip()
+                m = self.lexer.match(line)
+                kind = m.lastgroup if m else None
+
+                # File logging: disabled
+                if kind == 'p8':
+                    group = m.groupdict()
+                    ...
+                    continue
+
+Only patterns whose block is unconditional and ends with `continue` can be
+part of the lexer: a block guarded by a state variable, or which goes on with
+the next patterns, must keep its own match() call at the same place, and be
+excluded from the lexer.
+'''
+
+# python
+import re
+import threading
+
+# Scoped inline flags usable for an alternative
+_FLAGS = ((re.IGNORECASE, 'i'), (re.MULTILINE, 'm'), (re.DOTALL, 's'),
+          (re.VERBOSE, 'x'))
+_INLINE_FLAGS = re.compile(r'^\(\?([aiLmsux]+)\)')
+
+
+def _rename_groups(pattern, prefix):
+    '''Prefix the named groups of a regex source, along with their references
+
+        Returns:
+            (new source, [group names])
+
+        Raises:
+            ValueError: numbered references cannot be renumbered
+    '''
+    out = []
+    names = []
+    index = 0
+    in_class = False
+    size = len(pattern)
+    while index < size:
+        char = pattern[index]
+        if char == '\\':
+            if not in_class and index + 1 < size and \
+                    pattern[index + 1] in '123456789':
+                raise ValueError('numbered backreference in {!r}'
+                                 .format(pattern))
+            out.append(pattern[index:index + 2])
+            index += 2
+            continue
+        if in_class:
+            if char == ']':
+                in_class = False
+            out.append(char)
+            index += 1
+            continue
+        if char == '[':
+            in_class = True
+            out.append(char)
+            index += 1
+            # ']' right after '[' or '[^' is a literal
+            if pattern.startswith('^', index):
+                out.append('^')
+                index += 1
+            if pattern.startswith(']', index):
+                out.append(']')
+                index += 1
+            continue
+        if char == '(' and pattern.startswith('(?', index):
+            m = re.match(r'\(\?P<(\w+)>|\(\?P=(\w+)\)|\(\?\((\w+)\)',
+                         pattern[index:])
+            if m:
+                name = m.group(1) or m.group(2) or m.group(3)
+                if name.isdigit():
+                    raise ValueError('numbered group reference in {!r}'
+                                     .format(pattern))
+                new = prefix + name
+                if m.group(1):
+                    names.append(name)
+                    out.append('(?P<{}>'.format(new))
+                elif m.group(2):
+                    out.append('(?P={})'.format(new))
+                else:
+                    out.append('(?({})'.format(new))
+                index += m.end()
+                continue
+        out.append(char)
+        index += 1
+    return ''.join(out), names
+
+
+class LexerMatch(object):
+    '''Match of a Lexer, with the groups of the pattern which matched
+
+        lastgroup is the name of the pattern which matched, groupdict() and
+        group() use the group names of the pattern.
+    '''
+
+    __slots__ = ('match', 'lastgroup', '_groups', '_numbers')
+
+    def __init__(self, match, lastgroup, groups, numbers):
+        self.match = match
+        self.lastgroup = lastgroup
+        # original name -> name in the alternation
+        self._groups = groups
+        # group numbers of the pattern in the alternation
+        self._numbers = numbers
+
+    def __repr__(self):
+        return '<LexerMatch {}: {!r}>'.format(self.lastgroup,
+                                              self.match.group())
+
+    @property
+    def string(self):
+        return self.match.string
+
+    def groupdict(self, default=None):
+        group = self.match.group
+        return {name: default if group(renamed) is None else group(renamed)
+                for name, renamed in self._groups.items()}
+
+    def groups(self, default=None):
+        group = self.match.group
+        return tuple(default if group(number) is None else group(number)
+                     for number in self._numbers)
+
+    def _group(self, key):
+        if key == 0:
+            return self.match.group(self.lastgroup)
+        if isinstance(key, int):
+            return self.match.group(self._numbers[key - 1])
+        return self.match.group(self._groups[key])
+
+    def group(self, *keys):
+        if not keys:
+            return self._group(0)
+        if len(keys) == 1:
+            return self._group(keys[0])
+        return tuple(self._group(key) for key in keys)
+
+    __getitem__ = _group
+
+    def span(self, key=0):
+        return self.match.span(self.lastgroup if key == 0 else
+                               self._groups.get(key, key))
+
+    def start(self, key=0):
+        return self.span(key)[0]
+
+    def end(self, key=0):
+        return self.span(key)[1]
+
+
+class Lexer(object):
+    '''Ordered line patterns matched in a single pass
+
+        Args:
+            patterns: Patterns registry, or ordered (name, regex) pairs where
+                      regex is a string, a (string, flags) tuple or a compiled
+                      pattern
+            exclude (`list`): names of the patterns left out of the lexer
+
+        example:
+
+            >>> lexer = Lexer([('p1', r'^(?P<tag>\\S+) +logging: +(?P<status>\\S+)$'),
+            ...                ('p2', r'^(?P<status>\\S+)$')])
+            >>> m = lexer.match('Console logging: disabled')
+            >>> m.lastgroup, m.groupdict()
+            ('p1', {'tag': 'Console', 'status': 'disabled'})
+    '''
+
+    def __init__(self, patterns, exclude=()):
+        if hasattr(patterns, 'source'):
+            # Patterns registry
+            patterns = [(name, patterns.source(name)) for name in patterns]
+        self.names = []
+        self._sources = []
+        for name, pattern in patterns:
+            if name in exclude:
+                continue
+            if name.startswith('_') or not name.isidentifier():
+                raise ValueError("'{}' cannot be used as a pattern name"
+                                 .format(name))
+            if isinstance(pattern, tuple):
+                pattern, flags = pattern
+            elif hasattr(pattern, 'pattern'):
+                pattern, flags = pattern.pattern, pattern.flags
+            else:
+                flags = 0
+            self.names.append(name)
+            self._sources.append((pattern, flags))
+        self._regex = None
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self.names
+
+    def _build(self):
+        alternatives = []
+        groups = {}
+        for index, (name, (pattern, flags)) in \
+                enumerate(zip(self.names, self._sources)):
+            # global inline flags are only valid at the start of the regex
+            m = _INLINE_FLAGS.match(pattern)
+            if m:
+                pattern = pattern[m.end():]
+                inline = m.group(1)
+            else:
+                inline = ''
+            for flag, letter in _FLAGS:
+                if flags & flag:
+                    inline += letter
+            if set(inline) & set('aLu'):
+                raise ValueError("Pattern '{}' uses flags which cannot be "
+                                 "scoped".format(name))
+
+            source, inner = _rename_groups(pattern, '_{}_'.format(index))
+            if inline:
+                source = '(?{}:{})'.format(''.join(sorted(set(inline))),
+                                           source)
+            alternatives.append('(?P<{}>{})'.format(name, source))
+            groups[name] = {group: '_{}_{}'.format(index, group)
+                            for group in inner}
+
+        regex = re.compile('|'.join(alternatives))
+
+        # group numbers of each pattern, its own groups follow its outer one
+        numbers = {}
+        outer = [regex.groupindex[name] for name in self.names]
+        for position, name in enumerate(self.names):
+            stop = outer[position + 1] if position + 1 < len(outer) \
+                else regex.groups + 1
+            numbers[name] = tuple(range(outer[position] + 1, stop))
+
+        self._groups = groups
+        self._numbers = numbers
+        return regex
+
+    @property
+    def regex(self):
+        '''The alternation, compiled on first use'''
+        if self._regex is None:
+            with self._lock:
+                if self._regex is None:
+                    self._regex = self._build()
+        return self._regex
+
+    def match(self, line):
+        '''Match line against the patterns, in order, in a single pass
+
+            Returns:
+                LexerMatch of the first pattern which matches, or None
+        '''
+        m = self.regex.match(line)
+        if m is None:
+            return None
+        name = m.lastgroup
+        return LexerMatch(m, name, self._groups[name], self._numbers[name])
@@ -0,0 +1,244 @@
+'''Literal prefix line dispatch
+
+Line by line parsers try each of their patterns on every line until one
+matches, most lines pay for dozens of failed match() calls. Most patterns
+start with a literal word though (Hardware, MTU, Encapsulation...), a line
+can only be matched by the patterns whose literal prefix agrees with the
+first word of the line, and by the patterns without any literal prefix.
+
+LineDispatcher works out the literal prefix of each pattern once, and for
+each distinct first word the ordered list of candidate patterns, so each line
+is only tried against its candidates, in the original order.
+
+example:
+
+    dispatcher = LineDispatcher([
+        (r'^Hardware +is +(?P<type>.+)$', on_hardware),
+        (r'^MTU +(?P<mtu>\\d+) +bytes', on_mtu),
+        (r'^(?P<interface>\\S+) +is +(?P<enabled>.+)$', on_interface),
+    ])
+
+    for line in out.splitlines():
+        # 'MTU 1500 bytes' is only tried against the MTU and the interface
+        # patterns
+        dispatcher.dispatch(line.strip(), parsed_dict)
+'''
+
+# python
+import re
+import threading
+
+try:
+    from re import _parser as sre_parse
+    from re import _constants as sre_constants
+except ImportError:
+    # python < 3.11
+    import sre_parse
+    import sre_constants
+
+
+_ANCHORS = (sre_constants.AT_BEGINNING, sre_constants.AT_BEGINNING_STRING)
+_REPEATS = (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT)
+
+
+def _is_space(items):
+    '''True if the parsed items can only match whitespace characters'''
+    if len(items) != 1:
+        return False
+    op, av = items[0]
+    if op is sre_constants.LITERAL:
+        return chr(av).isspace()
+    if op is sre_constants.IN:
+        return all((op_ is sre_constants.LITERAL and chr(av_).isspace()) or
+                   (op_ is sre_constants.CATEGORY and
+                    av_ is sre_constants.CATEGORY_SPACE)
+                   for op_, av_ in av)
+    if op in _REPEATS:
+        return _is_space(list(av[2]))
+    return False
+
+
+def _flatten(items):
+    '''Inline the content of the groups, the sequence is unchanged'''
+    for op, av in items:
+        # group, add_flags, del_flags, pattern
+        if op is sre_constants.SUBPATTERN and not av[1] and not av[2]:
+            yield from _flatten(av[-1])
+        else:
+            yield op, av
+
+
+def literal_prefix(pattern):
+    '''Return the literal leading word a line must have to match pattern
+
+        Args:
+            pattern (`str` or compiled regex): pattern, used with match()
+
+        Returns:
+            (anchored, word, complete), word is '' when the pattern does not
+            start with a literal. When complete is True the first word of a
+            matching line is word, else the first word starts with word.
+            anchored is True when the pattern starts with ^, the prefix is
+            then also valid for search() and findall()
+
+        example:
+
+            >>> literal_prefix(r'^MTU +(?P<mtu>\\d+) +bytes')
+            (True, 'MTU', True)
+            >>> literal_prefix(r'^Description: *(?P<description>.*)$')
+            (True, 'Description:', False)
+    '''
+    if isinstance(pattern, str):
+        pattern = re.compile(pattern)
+    if not isinstance(pattern.pattern, str) or \
+            pattern.flags & (re.IGNORECASE | re.MULTILINE):
+        return False, '', False
+
+    items = list(_flatten(sre_parse.parse(pattern.pattern, pattern.flags)))
+
+    anchored = False
+    index = 0
+    if items and items[0][0] is sre_constants.AT and items[0][1] in _ANCHORS:
+        anchored = True
+        index = 1
+
+    # leading optional whitespace, the first word of the line is the same
+    while index < len(items) and items[index][0] in _REPEATS and \
+            items[index][1][0] == 0 and _is_space([items[index]]):
+        index += 1
+
+    word = []
+    while index < len(items) and items[index][0] is sre_constants.LITERAL:
+        char = chr(items[index][1])
+        if char.isspace():
+            return anchored, ''.join(word), bool(word)
+        word.append(char)
+        index += 1
+
+    if not word:
+        return anchored, '', False
+
+    # the word is complete when followed by whitespace or the end of line,
+    # match() does not need to reach the end of the pattern
+    complete = False
+    if index < len(items):
+        op, av = items[index]
+        if op is sre_constants.AT and av is sre_constants.AT_END:
+            complete = True
+        elif op in _REPEATS:
+            complete = av[0] > 0 and _is_space([items[index]])
+        else:
+            complete = _is_space([items[index]])
+    return anchored, ''.join(word), complete
+
+
+def first_word(line):
+    '''Return the first whitespace separated word of line'''
+    words = line.split(None, 1)
+    return words[0] if words else ''
+
+
+class LineDispatcher(object):
+    '''Dispatch lines to the patterns which can match their first word
+
+        Args:
+            rules: ordered iterable of (pattern, handler), pattern is a regex
+                   string or a compiled regex, tried with match()
+            maxsize (`int`): number of distinct first words remembered
+
+        example:
+
+            >>> dispatcher = LineDispatcher([(r'^MTU +(?P<mtu>\\d+)', 'mtu'),
+            ...                              (r'^(?P<intf>\\S+) +is', 'intf')])
+            >>> [handler for _, handler in dispatcher.candidates('MTU 1500')]
+            ['mtu', 'intf']
+            >>> [handler for _, handler in dispatcher.candidates('Gi1 is up')]
+            ['intf']
+    '''
+
+    # returned by a handler to try the next candidate patterns as well
+    NEXT = object()
+
+    def __init__(self, rules, maxsize=4096):
+        self.rules = []
+        self.prefixes = []
+        for pattern, handler in rules:
+            if isinstance(pattern, str):
+                pattern = re.compile(pattern)
+            self.rules.append((pattern, handler))
+            self.prefixes.append(literal_prefix(pattern))
+
+        # rules without any prefix are candidates of every line
+        self._any = tuple(index for index, (_, word, _) in
+                          enumerate(self.prefixes) if not word)
+        # complete prefix -> rule indexes
+        self._words = {}
+        # partial prefixes, checked once per distinct first word
+        self._partials = []
+        for index, (_, word, complete) in enumerate(self.prefixes):
+            if not word:
+                continue
+            if complete:
+                self._words.setdefault(word, []).append(index)
+            else:
+                self._partials.append((word, index))
+
+        self.maxsize = maxsize
+        self._candidates = {}
+        self._lock = threading.Lock()
+
+        # match() calls done by dispatch
+        self.lines = 0
+        self.attempts = 0
+
+    def __len__(self):
+        return len(self.rules)
+
+    def _indexes(self, word):
+        '''Ordered indexes of the rules which can match a line
+           starting with word'''
+        indexes = list(self._any)
+        indexes.extend(self._words.get(word, ()))
+        indexes.extend(index for prefix, index in self._partials
+                       if word.startswith(prefix))
+        return tuple(sorted(indexes))
+
+    def candidates_of(self, word):
+        '''Return the ordered (pattern, handler) which can match a line
+           starting with word'''
+        try:
+            return self._candidates[word]
+        except KeyError:
+            pass
+
+        candidates = tuple(self.rules[index] for index in self._indexes(word))
+        with self._lock:
+            if len(self._candidates) >= self.maxsize:
+                # interface names are first words as well, do not grow
+                # without limit on large outputs
+                self._candidates.clear()
+            self._candidates[word] = candidates
+        return candidates
+
+    def candidates(self, line):
+        '''Return the ordered (pattern, handler) which can match line'''
+        return self.candidates_of(first_word(line))
+
+    def dispatch(self, line, *args, **kwargs):
+        '''Call the handler of the first candidate pattern matching line
+
+           handler is called with the match object and args. When it returns
+           LineDispatcher.NEXT, the following candidates are tried as well.
+
+            Returns:
+                what the handler returned, None when no pattern matched
+        '''
+        self.lines += 1
+        for pattern, handler in self.candidates(line):
+            self.attempts += 1
+            m = pattern.match(line)
+            if m:
+                result = handler(m, *args, **kwargs)
+                if result is not self.NEXT:
+                    return result
+        return None
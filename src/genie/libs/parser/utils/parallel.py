@@ -0,0 +1,171 @@
+'''Parallel parsing of outputs made of independent blocks
+
+Outputs such as 'show interfaces' are a sequence of blocks, one per
+interface, each starting with a header line. When asked for, and above a
+size threshold, the output is split at header lines into chunks of whole
+blocks, the chunks are parsed in a process pool, and the results are merged
+in the output order.
+
+A parser supports it by moving its line loop into a method taking the output
+and returning its result, and calling parse_blocks() first:
+
+    class ShowInterface(ShowInterfaceSchema):
+
+        def cli(self, interface="", output=None):
+            ...
+            results = parse_blocks(self, out, '_parse_interfaces',
+                                   headers=[self.patterns.p1])
+            if results is not None:
+                return merge_results(results)
+            return self._parse_interfaces(out)
+
+        def _parse_interfaces(self, out):
+            interface_dict = {}
+            for line in out.splitlines():
+                ...
+            return interface_dict
+
+The headers must be the patterns which start a new block in the line loop,
+so a chunk is parsed the same way as in the whole output. State which spans
+blocks, if any, has to be merged by the parser itself.
+
+The parallel mode is off unless it is asked for, as the caller may already
+be running in a process pool of its own: an output is only parsed in
+parallel when a number of processes is given, by the parallel_workers
+attribute of the parser class or instance, or by the GENIE_PARSER_WORKERS
+environment variable, and it is above the parallel_threshold attribute,
+PARALLEL_THRESHOLD by default. None disables either. The processes are
+capped to MAX_WORKERS and to the number of CPUs.
+
+    parser = ShowInterfaces(device=device)
+    parser.parallel_workers = 4
+    parser.parse()
+'''
+
+# python
+import os
+
+# number of characters of the output above which it is parsed in parallel
+PARALLEL_THRESHOLD = 4 * 1024 * 1024
+
+# environment variable of the number of processes, unset for no parallel mode
+WORKERS_VARIABLE = 'GENIE_PARSER_WORKERS'
+
+# processes started for a parse at most
+MAX_WORKERS = 8
+
+# chunks per process, so a slow chunk does not hold back the whole parse
+CHUNKS_PER_WORKER = 4
+
+
+def split_blocks(output, headers, count):
+    '''Split output into at most count chunks of whole blocks
+
+        Args:
+            output (`str`): show command output
+            headers (`list`): compiled patterns matching the first line of a
+                              block, lines are stripped before matching
+            count (`int`): number of chunks
+
+        Returns:
+            list of chunks, which joined together give back output
+    '''
+    starts = []
+    position = 0
+    for line in output.splitlines(True):
+        stripped = line.strip()
+        if any(header.match(stripped) for header in headers):
+            starts.append(position)
+        position += len(line)
+
+    chunks = []
+    start = 0
+    size = len(output) / max(count, 1)
+    for block in starts:
+        # end the chunk at the first block start past its share
+        if block - start >= size:
+            chunks.append(output[start:block])
+            start = block
+    chunks.append(output[start:])
+    return chunks
+
+
+def merge_results(results, into=None):
+    '''Merge the results of the chunks in the output order
+
+        Nested dictionaries are merged, other values of a later chunk replace
+        the ones of an earlier chunk, as when the blocks are parsed in one go.
+    '''
+    merged = {} if into is None else into
+    for result in results:
+        _merge(merged, result)
+    return merged
+
+
+def _merge(target, other):
+    for key, value in other.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            _merge(target[key], value)
+        else:
+            target[key] = value
+
+
+def _parse_chunk(cls, method, chunk):
+    # worker side, device is not needed to parse an output
+    return getattr(cls(device=None), method)(chunk)
+
+
+def _workers(parser, workers):
+    '''Return the number of processes asked for, None when not asked for'''
+    if workers is None:
+        workers = getattr(parser, 'parallel_workers', None)
+    if workers is None:
+        try:
+            workers = int(os.environ.get(WORKERS_VARIABLE, ''))
+        except ValueError:
+            return None
+    return min(workers, MAX_WORKERS, os.cpu_count() or 1)
+
+
+def parse_blocks(parser, output, method, headers, threshold=None,
+                 workers=None):
+    '''Parse output in parallel, chunk by chunk, with parser.method
+
+        Args:
+            parser: parser instance
+            output (`str`): show command output
+            method (`str`): name of the parser method which parses an output
+            headers (`list`): compiled patterns of the block header lines
+            threshold (`int`): size of output from which it is parsed in
+                               parallel, defaults to parser.parallel_threshold
+            workers (`int`): number of processes, defaults to
+                             parser.parallel_workers then to the
+                             GENIE_PARSER_WORKERS environment variable, and
+                             capped to MAX_WORKERS and the number of CPUs
+
+        Returns:
+            list of the results of the chunks in the output order, or None
+            when output is to be parsed in one go, the default
+    '''
+    if threshold is None:
+        threshold = getattr(parser, 'parallel_threshold', PARALLEL_THRESHOLD)
+    workers = _workers(parser, workers)
+    if threshold is None or workers is None or workers < 2 or \
+            not isinstance(output, str) or len(output) < threshold:
+        return None
+
+    # multiprocessing is only imported by the parsers going parallel
+    import multiprocessing
+    import concurrent.futures
+
+    if multiprocessing.current_process().daemon:
+        # daemonic processes cannot start a pool
+        return None
+
+    chunks = split_blocks(output, headers, workers * CHUNKS_PER_WORKER)
+    if len(chunks) < 2:
+        return None
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_parse_chunk, [type(parser)] * len(chunks),
+                             [method] * len(chunks), chunks))
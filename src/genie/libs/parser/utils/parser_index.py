@@ -0,0 +1,170 @@
+'''Compact parser index
+
+parsers.json holds, for every command and os, the parser location along with
+its documentation and schema; loading it costs every process which imports
+genie.libs.parser. The parser index only keeps what the lookups need:
+
+    command -> os -> [token ->] {'package', 'module_name', 'class'}
+
+plus the `tokens` list, marshalled into a binary file next to parsers.json.
+The header records the size, mtime and crc32 of the parsers.json it was
+built from, so an index left behind by a newer parsers.json is detected as
+stale and parsers.json is used instead. The marshal format is only read by
+the interpreter version writing it, the header records the marshal version
+and the python version too, and an index built by another interpreter is
+not used.
+
+Build it with:
+
+    python -c "from genie.libs.parser.utils.parser_index import make_parser_index; make_parser_index()"
+'''
+
+# python
+import os
+import sys
+import json
+import zlib
+import struct
+import marshal
+import logging
+import importlib
+
+log = logging.getLogger(__name__)
+
+INDEX_NAME = 'parsers.idx'
+JSON_NAME = 'parsers.json'
+
+# magic, format version, marshal version, python major and minor version,
+# parsers.json size, mtime (ns) and crc32
+HEADER = struct.Struct('<4sHHBBQqI')
+MAGIC = b'GPIX'
+VERSION = 2
+
+# Keys of a parser entry which are kept in the index
+PARSER_KEYS = ('package', 'module_name', 'class')
+
+
+def _package_path(name):
+    '''return the path of name within the genie.libs.parser package'''
+    try:
+        mod = importlib.import_module('genie.libs.parser')
+        return os.path.join(mod.__path__[0], name)
+    except Exception:
+        return ''
+
+
+def _digest(path):
+    with open(path, 'rb') as f:
+        return zlib.crc32(f.read())
+
+
+def compact(data):
+    '''Strip everything but the parser location from parser data
+
+        Args:
+            data (`dict`): content of parsers.json
+
+        Returns:
+            dict with the same commands, os and tokens
+    '''
+    def _strip(entry):
+        stripped = {}
+        for key, value in entry.items():
+            if isinstance(value, dict):
+                # token level
+                stripped[key] = _strip(value)
+            elif key in PARSER_KEYS:
+                stripped[key] = value
+        return stripped
+
+    index = {}
+    for command, source in data.items():
+        if isinstance(source, dict):
+            index[command] = _strip(source)
+        else:
+            # 'tokens'
+            index[command] = source
+    return index
+
+
+def make_parser_index(json_path=None, index_path=None):
+    '''Build the parser index from parsers.json
+
+        Args:
+            json_path (`str`): parsers.json path, default is the package one
+            index_path (`str`): index path, default is next to json_path
+
+        Returns:
+            path of the index
+    '''
+    json_path = json_path or _package_path(JSON_NAME)
+    index_path = index_path or os.path.join(os.path.dirname(json_path),
+                                            INDEX_NAME)
+
+    with open(json_path) as f:
+        data = json.load(f)
+
+    stat = os.stat(json_path)
+    header = HEADER.pack(MAGIC, VERSION, marshal.version,
+                         sys.version_info[0], sys.version_info[1],
+                         stat.st_size, stat.st_mtime_ns, _digest(json_path))
+
+    # write then rename, a reader never sees a partial index
+    tmp_path = '{}.{}.tmp'.format(index_path, os.getpid())
+    with open(tmp_path, 'wb') as f:
+        f.write(header)
+        f.write(marshal.dumps(compact(data)))
+    os.replace(tmp_path, index_path)
+
+    return index_path
+
+
+def load_parser_index(index_path, json_path=None):
+    '''Load the parser index
+
+        Args:
+            index_path (`str`): index path
+            json_path (`str`): parsers.json the index must be up to date with
+
+        Returns:
+            parser data, None when the index is missing, invalid or stale
+    '''
+    if not os.path.isfile(index_path):
+        return None
+
+    if os.path.getsize(index_path) < HEADER.size:
+        log.debug('Parser index {} is truncated'.format(index_path))
+        return None
+
+    with open(index_path, 'rb') as f:
+        content = f.read()
+
+    magic, version, marshal_version, major, minor, size, mtime, digest = \
+        HEADER.unpack_from(content)
+    if magic != MAGIC or version != VERSION:
+        log.debug('Parser index {} has an unsupported format'
+                  .format(index_path))
+        return None
+
+    if (marshal_version, major, minor) != (marshal.version,
+                                           sys.version_info[0],
+                                           sys.version_info[1]):
+        log.debug('Parser index {} was built by another python version'
+                  .format(index_path))
+        return None
+
+    if json_path and os.path.isfile(json_path):
+        stat = os.stat(json_path)
+        # mtime is not kept by every installer, compare the content only
+        # when it differs
+        if stat.st_size != size or (stat.st_mtime_ns != mtime and
+                                    _digest(json_path) != digest):
+            log.debug('Parser index {} is older than {}'
+                      .format(index_path, json_path))
+            return None
+
+    try:
+        return marshal.loads(memoryview(content)[HEADER.size:])
+    except (EOFError, ValueError, TypeError):
+        log.debug('Parser index {} is corrupted'.format(index_path))
+        return None
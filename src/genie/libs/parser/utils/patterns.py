@@ -0,0 +1,208 @@
+'''Precompiled regex pattern registry for parsers
+
+Most parsers compile their regexes at the beginning of cli(), some even for
+every line of output. Even with the `re` module cache, for short outputs the
+compile and cache lookup overhead outweighs the actual matching. Declaring
+the patterns once on the parser class with `Patterns` compiles them once
+per process, on first use, and shares them between every call.
+
+example:
+
+    class ShowClock(ShowClockSchema):
+
+        cli_command = 'show clock'
+
+        patterns = Patterns(
+            # *10:59:08.612 UTC Mon Jan 14 2019
+            p1=r'^\\*?(?P<time>[\\d\\:\\.]+) +(?P<timezone>\\w+) +'
+               r'(?P<day_of_week>\\w+) +(?P<month>\\w+) +(?P<day>\\d+) +'
+               r'(?P<year>\\d+)$',
+        )
+
+        def cli(self, output=None):
+            ...
+            p = self.patterns
+            for line in out.splitlines():
+                m = p.p1.match(line.strip())
+
+Parsers which try many patterns on each line can ask for the patterns of a
+line instead, the patterns whose literal prefix cannot match the first word
+of the line are then skipped (see line_dispatch):
+
+            for line in out.splitlines():
+                line = line.strip()
+                p = self.patterns.for_line(line)
+                m = p.p1.match(line)
+'''
+
+# python
+import re
+import inspect
+import threading
+from types import SimpleNamespace
+
+# parser
+from .line_dispatch import LineDispatcher, first_word
+
+
+class Patterns(object):
+    '''Regex patterns of a parser class, compiled on first use
+
+        Args:
+            patterns: name -> regex, or (regex, flags). The declaration order
+                      is kept
+
+        example:
+
+            >>> patterns = Patterns(p1=r'^Hardware +is +(?P<type>.+)$',
+            ...                     p2=(r'^mtu +(?P<mtu>\\d+)$', re.I))
+            >>> patterns.p1.match('Hardware is Loopback').group('type')
+            'Loopback'
+    '''
+
+    def __init__(self, **patterns):
+        sources = {}
+        for name, pattern in patterns.items():
+            if hasattr(Patterns, name) or name.startswith('_'):
+                raise ValueError("'{}' cannot be used as a pattern name"
+                                 .format(name))
+            if isinstance(pattern, tuple):
+                pattern, flags = pattern
+            else:
+                flags = 0
+            sources[name] = (pattern, flags)
+        self._sources = sources
+        self._dispatcher = None
+        self._views = {}
+
+    def __getattr__(self, name):
+        # Only called for patterns which are not compiled yet
+        try:
+            pattern, flags = self.__dict__['_sources'][name]
+        except KeyError:
+            raise AttributeError("No pattern named '{}'".format(name)) \
+                from None
+        compiled = re.compile(pattern, flags)
+        setattr(self, name, compiled)
+        return compiled
+
+    def __iter__(self):
+        return iter(self._sources)
+
+    def __len__(self):
+        return len(self._sources)
+
+    def __contains__(self, name):
+        return name in self._sources
+
+    def __repr__(self):
+        return '{}({})'.format(type(self).__name__, ', '.join(self._sources))
+
+    def items(self):
+        '''yield (name, compiled pattern) in declaration order'''
+        for name in self._sources:
+            yield name, getattr(self, name)
+
+    def source(self, name):
+        '''return the (regex, flags) pattern name was declared with'''
+        return self._sources[name]
+
+    def compile(self):
+        '''Compile every pattern now instead of on first use'''
+        for name in self._sources:
+            getattr(self, name)
+        return self
+
+    def for_line(self, line):
+        '''Return the patterns to use on line
+
+           Same names as the registry. The ^ anchored patterns whose literal
+           prefix does not agree with the first word of line are replaced by
+           a pattern which never matches, without calling the regex engine.
+           The result is only valid for line itself.
+        '''
+        word = first_word(line)
+        try:
+            return self._views[word]
+        except KeyError:
+            pass
+
+        if self._dispatcher is None:
+            with _lock:
+                if self._dispatcher is None:
+                    self._dispatcher = LineDispatcher(
+                        (pattern, name) for name, pattern in self.items())
+
+        dispatcher = self._dispatcher
+        candidates = set(name for _, name in dispatcher.candidates_of(word))
+        view = {}
+        for (pattern, name), (anchored, _, _) in zip(dispatcher.rules,
+                                                    dispatcher.prefixes):
+            if name in candidates or not anchored:
+                view[name] = pattern
+            else:
+                view[name] = NoMatch(pattern)
+
+        with _lock:
+            if len(self._views) >= dispatcher.maxsize:
+                self._views.clear()
+            self._views[word] = view = SimpleNamespace(**view)
+        return view
+
+
+class NoMatch(object):
+    '''Stands for a compiled pattern which cannot match the current line'''
+
+    __slots__ = ('regex',)
+
+    def __init__(self, regex):
+        self.regex = regex
+
+    def __getattr__(self, name):
+        return getattr(self.regex, name)
+
+    def match(self, string, *args):
+        return None
+
+    search = fullmatch = match
+
+    def findall(self, string, *args):
+        return []
+
+    def finditer(self, string, *args):
+        return iter(())
+
+
+_lock = threading.Lock()
+
+
+def compile_patterns(*objects):
+    '''Compile eagerly the patterns of parser classes, for example when
+       warming up a worker process before it starts parsing
+
+        Args:
+            objects: parser classes, or modules of parser classes
+
+        Returns:
+            number of pattern registries compiled
+
+        example:
+
+            >>> from genie.libs.parser.iosxe import show_interface
+            >>> compile_patterns(show_interface)
+    '''
+    registries = []
+    for obj in objects:
+        if inspect.ismodule(obj):
+            classes = [cls for _, cls in inspect.getmembers(obj, inspect.isclass)
+                       if cls.__module__ == obj.__name__]
+        else:
+            classes = [obj]
+
+        for cls in classes:
+            patterns = getattr(cls, 'patterns', None)
+            if isinstance(patterns, Patterns) and \
+                    not any(patterns is r for r in registries):
+                registries.append(patterns.compile())
+
+    return len(registries)
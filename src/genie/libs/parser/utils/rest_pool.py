@@ -0,0 +1,314 @@
+'''Pooled REST collection of the bigip resources
+
+Each bigip parser fetches one resource of the iControl REST API in rest(),
+with a blocking GET over the rest connection of the device:
+
+    class NetWccp(NetWccpSchema):
+        cli_command = "/mgmt/tm/net/wccp"
+
+        def rest(self):
+            response = self.device.get(self.cli_command)
+            return response.json()
+
+Parsing them one after the other costs one round trip per resource, and a
+new connection when the device closes the previous one. collect() fetches
+them over a bounded pool of threads instead, each thread keeping its
+connection to the device alive and reusing it for the resources it fetches,
+and hands each body to its parser as soon as it is received:
+
+    >>> device = RestDevice('https://10.1.1.1', username='admin',
+    ...                     password='admin', verify=False)
+    >>> fetches = collect(device, [NetWccp, '/mgmt/tm/sys/version'],
+    ...                   workers=8)
+    >>> fetches['/mgmt/tm/net/wccp'].output
+    {'kind': 'tm:net:wccp:wccpcollectionstate', ...}
+    >>> fetches['/mgmt/tm/net/wccp'].latency
+    0.0123
+
+It only needs the standard library. RestDevice can also be replaced by the
+device of a testbed, whose get() collect() calls the same way.
+'''
+
+# python
+import ssl
+import json
+import time
+import base64
+import threading
+import http.client
+import urllib.parse
+import concurrent.futures
+
+# orjson is optional, a faster decoder of the bodies
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+# number of resources fetched at the same time
+WORKERS = 8
+
+
+class RestError(Exception):
+    '''The device replied to a GET with an error status'''
+
+    def __init__(self, message, response=None):
+        super().__init__(message)
+        self.response = response
+
+
+class RestResponse(object):
+    '''Reply of RestDevice.get(), with the attributes of a requests response
+       the parsers use'''
+
+    __slots__ = ('url', 'status_code', 'reason', 'headers', 'content')
+
+    def __init__(self, url, status_code, reason, headers, content):
+        self.url = url
+        self.status_code = status_code
+        self.reason = reason
+        self.headers = headers
+        self.content = content
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8', 'replace')
+
+    def json(self):
+        '''Return the decoded body, decoded from its bytes without a text
+           copy of it'''
+        if orjson is not None:
+            return orjson.loads(self.content)
+        return json.loads(self.content)
+
+
+class RestDevice(object):
+    '''Device stand-in fetching the REST resources of a BIG-IP
+
+        Each thread calling get() has its own HTTP/1.1 connection, which is
+        kept alive and reused by its next calls.
+
+        Args:
+            url (`str`): 'https://10.1.1.1' or 'http://127.0.0.1:8080'
+            username (`str`): basic authentication, with password
+            password (`str`): basic authentication, with username
+            headers (`dict`): headers of every request, as
+                              {'X-F5-Auth-Token': token}
+            verify (`bool`): check the certificate of the device
+            timeout (`float`): seconds of the connections
+    '''
+
+    def __init__(self, url, username=None, password=None, headers=None,
+                 verify=True, timeout=30):
+        url = urllib.parse.urlsplit(url)
+        self.scheme = url.scheme or 'https'
+        self.host = url.hostname
+        self.port = url.port
+        self.base = url.path.rstrip('/')
+        self.timeout = timeout
+        self.headers = {'Accept': 'application/json',
+                        'Connection': 'keep-alive'}
+        if username is not None:
+            credentials = '{}:{}'.format(username, password or '')
+            self.headers['Authorization'] = 'Basic ' + base64.b64encode(
+                credentials.encode()).decode()
+        self.headers.update(headers or {})
+        self.context = None
+        if self.scheme == 'https' and not verify:
+            self.context = ssl._create_unverified_context()
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+
+    def _connection(self):
+        # the connection of the calling thread
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            if self.scheme == 'https':
+                connection = http.client.HTTPSConnection(
+                    self.host, self.port, timeout=self.timeout,
+                    context=self.context)
+            else:
+                connection = http.client.HTTPConnection(
+                    self.host, self.port, timeout=self.timeout)
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    def _drop(self, connection):
+        # close the connection of the calling thread and forget it
+        connection.close()
+        self._local.connection = None
+        with self._lock:
+            if connection in self._connections:
+                self._connections.remove(connection)
+
+    def get(self, api_url, headers=None, expected_status_codes=(200,),
+            **kwargs):
+        '''GET api_url from the device
+
+            Raises:
+                RestError: the status is not one of expected_status_codes
+        '''
+        url = self.base + api_url
+        request_headers = dict(self.headers, **(headers or {}))
+        for attempt in (1, 2):
+            connection = self._connection()
+            try:
+                connection.request('GET', url, headers=request_headers)
+                response = connection.getresponse()
+                content = response.read()
+                break
+            except Exception as e:
+                # the connection may be left in the middle of the request,
+                # the next call of the thread opens a new one
+                self._drop(connection)
+                # the device closed the kept alive connection, retried once
+                if attempt == 2 or not isinstance(e, (
+                        http.client.RemoteDisconnected, ConnectionResetError,
+                        BrokenPipeError)):
+                    raise
+        if response.will_close:
+            connection.close()
+        reply = RestResponse(url, response.status, response.reason,
+                             dict(response.getheaders()), content)
+        if reply.status_code not in expected_status_codes:
+            raise RestError('GET {} returned {} {}'.format(
+                url, reply.status_code, reply.reason), reply)
+        return reply
+
+    def close(self):
+        '''Close the connections of every thread'''
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections = []
+        self._local = threading.local()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class Fetch(object):
+    '''Outcome of a resource fetched by collect()
+
+        Attributes:
+            endpoint (`str`): path of the resource
+            parser (`class`): parser of the resource, None for an endpoint
+            output (`dict`): parsed output, None on error
+            error (`Exception`): raised by the GET or the parser, None
+            status_code (`int`): HTTP status of the reply, None when none
+            latency (`float`): seconds of the GET, from the request to the
+                               last byte of the body
+            parse_time (`float`): seconds of decoding and parsing the body
+    '''
+
+    __slots__ = ('endpoint', 'parser', 'output', 'error', 'status_code',
+                 'latency', 'parse_time')
+
+    def __init__(self, endpoint, parser=None):
+        self.endpoint = endpoint
+        self.parser = parser
+        self.output = None
+        self.error = None
+        self.status_code = None
+        self.latency = None
+        self.parse_time = None
+
+    def __repr__(self):
+        return '<Fetch {} {} {}>'.format(
+            self.endpoint, self.status_code,
+            'error' if self.error is not None else
+            '{:.1f}ms'.format((self.latency or 0) * 1000))
+
+
+class _Timed(object):
+    # the device of one fetch, timing its GET
+
+    __slots__ = ('device', 'fetch')
+
+    def __init__(self, device, fetch):
+        self.device = device
+        self.fetch = fetch
+
+    def get(self, api_url, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            response = self.device.get(api_url, *args, **kwargs)
+        except RestError as e:
+            self.fetch.status_code = e.response.status_code
+            raise
+        finally:
+            self.fetch.latency = time.perf_counter() - start
+        self.fetch.status_code = getattr(response, 'status_code', None)
+        return response
+
+    def __getattr__(self, name):
+        return getattr(self.device, name)
+
+
+def _fetch(device, fetch):
+    timed = _Timed(device, fetch)
+    start = time.perf_counter()
+    try:
+        if fetch.parser is None:
+            fetch.output = timed.get(fetch.endpoint).json()
+        else:
+            try:
+                fetch.output = fetch.parser(device=timed,
+                                            context='rest').parse()
+            except SchemaEmptyParserError:
+                # the collection is empty
+                fetch.output = {}
+    except Exception as e:
+        fetch.error = e
+    fetch.parse_time = time.perf_counter() - start - (fetch.latency or 0)
+    return fetch
+
+
+def collect(device, targets, workers=WORKERS):
+    '''Fetch and parse REST resources over a pool of workers threads
+
+        Args:
+            device (`obj`): RestDevice, or a device with a rest connection
+            targets (`list`): parser classes, fetched with their cli_command
+                              and parsed with their rest(), or endpoint paths,
+                              whose decoded body is returned
+            workers (`int`): number of resources fetched at the same time,
+                             and of connections to the device
+
+        Returns:
+            dict of {endpoint: Fetch}, in the order of targets
+
+        example:
+
+            >>> fetches = collect(device, [NetWccp, LtmMonitorFtp])
+            >>> {endpoint: fetch.latency for endpoint, fetch in
+            ...  fetches.items()}
+    '''
+    fetches = {}
+    for target in targets:
+        if isinstance(target, str):
+            fetch = Fetch(target)
+        else:
+            fetch = Fetch(target.cli_command, target)
+        fetches[fetch.endpoint] = fetch
+    if not fetches:
+        return fetches
+
+    with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, min(workers, len(fetches)))) as pool:
+        for future in [pool.submit(_fetch, device, fetch)
+                       for fetch in fetches.values()]:
+            future.result()
+    return fetches
@@ -0,0 +1,44 @@
+'''Streaming input for line oriented parsers
+
+The output given to a parser is usually the whole show command output as a
+string. Large captures can instead be given as a text file handle, or any
+iterable of lines, which the parser consumes one line at a time so the raw
+text and the list of its lines are never held in memory:
+
+    with open('show_logging.txt') as f:
+        parsed = ShowLogging(device=device).parse(output=f)
+
+A line oriented parser supports it by iterating over iter_lines(out) instead
+of out.splitlines():
+
+    for line in iter_lines(out):
+        line = line.strip()
+        ...
+'''
+
+
+def iter_lines(output):
+    '''Lines of a parser output
+
+        Args:
+            output: show command output as a string, a text file handle or
+                    an iterable of lines
+
+        Returns:
+            the lines without their line breaks, as str.splitlines() does;
+            lazily for a file handle or an iterable
+    '''
+    if isinstance(output, str):
+        return output.splitlines()
+    return _iter_lines(output)
+
+
+def _iter_lines(lines):
+    for line in lines:
+        if isinstance(line, bytes):
+            line = line.decode()
+        if not line:
+            yield line
+        else:
+            # a line read from a file keeps its line break
+            yield from line.splitlines()
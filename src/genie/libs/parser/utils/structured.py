@@ -0,0 +1,232 @@
+'''Structured replies of JunOS, '| display xml' and '| display json'
+
+JunOS replies to '<command> | display xml' with the tree its text output is
+rendered from, and the schemas of the junos parsers use its tags:
+
+    <rpc-reply xmlns:junos="http://xml.juniper.net/junos/19.2R1/junos">
+        <route-information xmlns="http://xml.juniper.net/junos/19.2R1/junos-routing">
+            <route-table>
+                <table-name>inet.0</table-name>
+                <rt junos:style="detail">
+                    <rt-destination>0.0.0.0/0</rt-destination>
+                    <rt-entry-count junos:format="1 entry">1</rt-entry-count>
+    ...
+
+'| display json' carries the same tree, each element as a list of objects
+holding its children, its text under "data" and its attributes under
+"attributes". Both are read into the dicts of xmltodict, text under
+'#text' and attributes under '@' keys.
+
+A parser mixing StructuredParser in declares its structured_mapping, the
+part of the tree its schema holds, and gets the xml context and the json
+method. They run the structured variant of the command and keep that part
+of the reply, instead of matching the text output line by line:
+
+    class ShowInterfaces(StructuredParser, ShowInterfacesSchema):
+        structured_mapping = {
+            "interface-information": {
+                "physical-interface": [{
+                    "name": TEXT,
+                    "admin-status": {"@junos:format": TEXT},
+                    "if-device-flags": {"ifdf-present": FLAG},
+    ...
+
+    >>> ShowInterfaces(device=device, context='xml').parse()
+
+MetaParser.parse() only runs the contexts of MetaParser.CONTEXT_LIST, cli,
+xml, yang and rest, and rejects context='json'. JsonContext adds
+parse_json(), which runs json() and checks its output as parse() checks
+the output of the other contexts:
+
+    >>> ShowInterfaces(device=device).parse_json()
+'''
+
+# python
+import json
+import string
+
+# Genie
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+from genie.metaparser.util.schemaengine import Schema
+
+# text of the element
+TEXT = 'text'
+
+# True when the element is there, as <ifdf-present/>
+FLAG = 'flag'
+
+
+class OneOrMany(object):
+    '''Mapping of an element kept as a dict when it is there once, as a list
+       of dicts when it is repeated. [mapping] always keeps a list.'''
+
+    __slots__ = ('mapping',)
+
+    def __init__(self, mapping):
+        self.mapping = mapping
+
+    def __repr__(self):
+        return 'OneOrMany({!r})'.format(self.mapping)
+
+
+def select(mapping, node):
+    '''Return the part of node, a tree read by xmltodict, which mapping
+       declares. Elements which are not declared or hold nothing declared
+       are left out.
+
+        Args:
+            mapping (`dict`): {tag: TEXT, FLAG, mapping, [mapping] or
+                              OneOrMany(mapping)}, '@' keys for attributes
+                              and '#text' for the text of an element with
+                              attributes
+            node (`dict`): tree of the reply
+
+        Returns:
+            dict, None when nothing is declared in node
+
+        example:
+
+            >>> select({'rt': [{'rt-destination': TEXT}]},
+            ...        {'rt': {'rt-destination': '0.0.0.0/0', 'rt-state': 'x'}})
+            {'rt': [{'rt-destination': '0.0.0.0/0'}]}
+    '''
+    if mapping is FLAG:
+        return True
+    if isinstance(mapping, list):
+        values = [select(mapping[0], item)
+                  for item in (node if isinstance(node, list) else [node])]
+        return [value for value in values if value is not None] or None
+    if isinstance(mapping, OneOrMany):
+        if isinstance(node, list):
+            return select([mapping.mapping], node)
+        return select(mapping.mapping, node)
+    if isinstance(node, list):
+        # repeated, but declared once
+        node = node[0]
+    if mapping is TEXT:
+        text = node.get('#text') if isinstance(node, dict) else node
+        # <formatted-tlv-data/> is there, with an empty text
+        return '' if text is None else text
+    if not isinstance(node, dict):
+        if node is None:
+            return None
+        node = {'#text': node}
+    values = {}
+    for key, value in mapping.items():
+        if key in node:
+            value = select(value, node[key])
+            if value is not None:
+                values[key] = value
+    return values or None
+
+
+def read_xml(output):
+    '''Return the tree of a '| display xml' reply, under rpc-reply'''
+    # the prompt or {master} lines around the reply
+    output = output[output.find('<'):output.rfind('>') + 1]
+    # xmltodict imports urllib, only the xml context needs it
+    import xmltodict
+    tree = xmltodict.parse(output)
+    return tree.get('rpc-reply', tree)
+
+
+def read_json(output):
+    '''Return the tree of a '| display json' reply, as read_xml() does'''
+    decoder = json.JSONDecoder()
+    start = output.find('{')
+    while True:
+        try:
+            tree, _ = decoder.raw_decode(output, max(start, 0))
+        except ValueError:
+            # {master} or the prompt around the reply, which holds braces
+            # too
+            start = output.find('{', start + 1)
+            if start == -1:
+                raise
+        else:
+            return _json_element(tree)
+
+
+def _json_element(item):
+    # {"data": "inet.0"}, {"data": [null]} for <flag/>,
+    # {"data": "3w2d", "attributes": {"junos:seconds": "1829035"}}
+    # or {"attributes": {...}, "table-name": [{"data": "inet.0"}], ...}
+    attributes = item.get('attributes') or {}
+    if 'data' in item:
+        text = item['data']
+        if text == [None]:
+            text = None
+        if not attributes:
+            return text
+        node = {'@' + key: value for key, value in attributes.items()}
+        if text is not None:
+            node['#text'] = text
+        return node
+    node = {'@' + key: value for key, value in attributes.items()}
+    for key, value in item.items():
+        if key != 'attributes':
+            values = [_json_element(child) for child in value]
+            node[key] = values[0] if len(values) == 1 else values
+    return node
+
+
+class JsonContext(object):
+    '''Adds parse_json() to a parser with a json() method'''
+
+    def parse_json(self, **kwargs):
+        '''Return json() taking kwargs, checked against the schema as
+           parse() checks cli()
+
+            Raises:
+                SchemaEmptyParserError: json() returned nothing
+        '''
+        parsed_output = self.json(**kwargs)
+        if self.schema:
+            if not parsed_output:
+                raise SchemaEmptyParserError(parsed_output)
+            Schema(self.schema).validate(parsed_output)
+        return parsed_output
+
+
+class StructuredParser(JsonContext):
+    '''Adds the xml context and parse_json() to a JunOS parser
+
+        xml() and json() run the command of cli_command taking the arguments
+        given, followed by '| display xml' or '| display json', and return
+        the part of the reply declared in structured_mapping. Like cli(),
+        they parse the reply given as output instead.
+
+        example:
+
+            class ShowInterfaces(StructuredParser, ShowInterfacesSchema):
+                structured_mapping = {'interface-information': {...}}
+    '''
+
+    structured_mapping = {}
+
+    def xml(self, output=None, **kwargs):
+        if output is None:
+            output = self.device.execute('{} | display xml'.format(
+                self.structured_command(**kwargs)))
+        return select(self.structured_mapping, read_xml(output)) or {}
+
+    def json(self, output=None, **kwargs):
+        if output is None:
+            output = self.device.execute('{} | display json'.format(
+                self.structured_command(**kwargs)))
+        return select(self.structured_mapping, read_json(output)) or {}
+
+    def structured_command(self, **kwargs):
+        '''Return the command of cli_command taking the arguments given'''
+        kwargs = {key: value for key, value in kwargs.items()
+                  if value is not None}
+        commands = self.cli_command
+        if isinstance(commands, str):
+            commands = [commands]
+        for command in commands:
+            names = {name for _, name, _, _ in string.Formatter().parse(
+                command) if name}
+            if names == set(kwargs):
+                return command.format(**kwargs)
+        raise TypeError('{} has no command taking {}'.format(
+            type(self).__name__, ', '.join(sorted(kwargs)) or 'no argument'))
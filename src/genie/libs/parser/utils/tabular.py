@@ -0,0 +1,196 @@
+'''Fixed width table parsing
+
+Parses column outputs such as 'show ip interface brief' from the offsets of
+the column headers: the header line is located once, then each row is cut at
+those offsets by a single regex built from them, rows with a cell wider than
+its column are split by split_row.
+
+    Interface              IP-Address      OK? Method Status                Protocol
+    GigabitEthernet0/0     10.1.10.20      YES NVRAM  up                    up
+
+    >>> res = Tabular(device_output=out,
+    ...               header_fields=['Interface', 'IP-Address', r'OK\\?',
+    ...                              'Method', 'Status', 'Protocol'],
+    ...               label_fields=['interface', 'ip_address',
+    ...                             'interface_is_ok', 'method', 'status',
+    ...                             'protocol'],
+    ...               index=[0])
+    >>> res.entries['GigabitEthernet0/0']['ip_address']
+    '10.1.10.20'
+
+The arguments and the entries are the ones of parsergen.oper_fill_tabular for
+a device output, so a parser can switch from one to the other.
+'''
+
+# python
+import re
+import functools
+
+# characters of the separator line under the headers
+_SEPARATOR = frozenset('-=+ ')
+
+
+@functools.lru_cache(maxsize=256)
+def _compile(pattern):
+    return re.compile(pattern)
+
+
+def find_header(lines, header_fields):
+    '''Find the header line of a table
+
+        Args:
+            lines (`list`): lines of the output
+            header_fields (`list`): regexes of the column headers, in order
+
+        Returns:
+            (line number, [(start, end)] of each header), or None when no line
+            has all the headers in order
+    '''
+    regexes = [_compile(field) for field in header_fields]
+    first = regexes[0]
+    for number, line in enumerate(lines):
+        if not first.search(line):
+            continue
+        offsets = []
+        position = 0
+        for regex in regexes:
+            m = regex.search(line, position)
+            if not m:
+                break
+            offsets.append(m.span())
+            position = m.end()
+        else:
+            return number, offsets
+    return None
+
+
+def split_row(line, offsets, right_justified=False):
+    '''Cut a row at the column offsets of the headers
+
+        A cell wider than its column overflows into the next one: on a left
+        justified table the cell ends at the next space and the following
+        columns move right as much, on a right justified table the next cell
+        starts after the previous space.
+
+        Returns:
+            list of the stripped cells
+    '''
+    cells = []
+    size = len(line)
+    last = len(offsets) - 1
+    if not right_justified:
+        shift = 0
+        for column, (start, _) in enumerate(offsets):
+            start += shift
+            if column == last:
+                cells.append(line[start:].strip())
+                break
+            end = offsets[column + 1][0] + shift
+            if 0 < end < size and line[end - 1] != ' ' and line[end] != ' ':
+                overflow = line.find(' ', end)
+                if overflow == -1:
+                    overflow = size
+                shift += overflow - end
+                end = overflow
+            cells.append(line[start:end].strip())
+        return cells
+
+    start = 0
+    for column, (_, end) in enumerate(offsets):
+        if column == last:
+            cells.append(line[start:].strip())
+            break
+        if 0 < end < size and line[end - 1] != ' ' and line[end] != ' ':
+            end = line.rfind(' ', start, end) + 1 or start
+        cells.append(line[start:end].strip())
+        start = end
+    return cells
+
+
+def row_regex(offsets, right_justified=False):
+    '''Regex cutting a row at the column offsets of the headers
+
+        A row matches when no cell is wider than its column, the groups are
+        then the cells as split_row returns them, before stripping.
+    '''
+    if right_justified:
+        begin = 0
+        cuts = [end for _, end in offsets[:-1]]
+    else:
+        begin = offsets[0][0]
+        cuts = [start for start, _ in offsets[1:]]
+    pattern = ['^.{{{}}}'.format(begin)]
+    for cut in cuts:
+        # a cell ends with a space, or is followed by one
+        pattern.append('(.{{{}}}(?: |[^ ](?= )))'.format(cut - begin - 1))
+        begin = cut
+    pattern.append('(.*)$')
+    return _compile(''.join(pattern))
+
+
+class Tabular(object):
+    '''Entries of a fixed width table, keyed by their index columns
+
+        Args:
+            device_output (`str`): show command output
+            header_fields (`list`): regexes of the column headers, in order
+            label_fields (`list`): keys of the columns in the entries,
+                                   defaults to header_fields
+            index (`list`): columns keying the entries, nested when several,
+                            defaults to the first column
+            table_terminal_pattern (`str`): regex of the line ending the table,
+                                            by default the end of the output
+            right_justified (`bool`): the cells end where their header ends,
+                                      instead of starting where it starts
+            device_os (`str`): unused, kept for parsergen compatibility
+
+        Attributes:
+            entries (`dict`): {index value: {label: cell}}
+            offsets (`list`): (start, end) of each header, None when the
+                              header line is not found
+    '''
+
+    def __init__(self, device_output, header_fields, label_fields=None,
+                 index=None, table_terminal_pattern=None,
+                 right_justified=False, device_os=None):
+        self.label_fields = list(label_fields or header_fields)
+        if len(self.label_fields) != len(header_fields):
+            raise ValueError('header_fields and label_fields must have the '
+                             'same length')
+        self.index = list(index or [0])
+        self.entries = {}
+        self.offsets = None
+
+        lines = device_output.splitlines()
+        found = find_header(lines, header_fields)
+        if found is None:
+            return
+        number, self.offsets = found
+        terminal = _compile(table_terminal_pattern) \
+            if table_terminal_pattern else None
+
+        row = row_regex(self.offsets, right_justified)
+        label_fields = self.label_fields
+        index = self.index
+        for line in lines[number + 1:]:
+            # the patterns of parsergen see the line break, ex: '^\n'
+            if terminal and terminal.search(line + '\n'):
+                break
+            stripped = line.strip()
+            if not stripped or \
+                    stripped[0] in '-=+' and set(stripped) <= _SEPARATOR:
+                continue
+            m = row.match(line)
+            if m:
+                cells = [cell.strip() for cell in m.groups()]
+            else:
+                cells = split_row(line, self.offsets, right_justified)
+
+            keys = [cells[column] for column in index]
+            if not all(keys):
+                # continuation line of a wrapped row
+                continue
+            entries = self.entries
+            for key in keys[:-1]:
+                entries = entries.setdefault(key, {})
+            entries[keys[-1]] = dict(zip(label_fields, cells))
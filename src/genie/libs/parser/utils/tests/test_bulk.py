@@ -0,0 +1,126 @@
+import io
+import os
+import json
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from genie.libs.parser.iosxe.show_system import ShowClock
+from genie.libs.parser.utils import bulk
+from genie.libs.parser.utils.cache import ParseCache
+from genie.libs.parser.utils.bulk import OfflineDevice, parse_bulk, \
+                                        write_ndjson, read_jobs
+
+CLOCK = {'time': '05:26:38.035', 'timezone': 'EST', 'day_of_week': 'Wed',
+         'month': 'JAN', 'day': '4', 'year': '2019'}
+
+
+class TestBulk(unittest.TestCase):
+
+    def setUp(self):
+        self.lookups = []
+
+        def get_parser(command, device):
+            self.lookups.append((device.os, command))
+            if command != 'show clock':
+                raise Exception('Could not find parser')
+            return ShowClock, {}
+
+        patcher = patch.object(bulk, 'get_parser', side_effect=get_parser)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        with tempfile.NamedTemporaryFile('w', suffix='.txt',
+                                         delete=False) as f:
+            f.write('05:26:38.035 EST Wed JAN 4 2019\n')
+        self.path = f.name
+        self.addCleanup(os.remove, self.path)
+
+        self.jobs = [('iosxe', 'show clock', self.path, True),
+                     ('iosxe', 'show clock',
+                      '*18:56:04.554 EST Mon Oct 17 2016\n'),
+                     ('iosxe', 'show clock', 'nothing to parse\n', False),
+                     ('iosxe', 'show foo', '05:26:38.035 EST\n')] * 10
+
+    def check(self, records):
+        self.assertEqual([r['index'] for r in records],
+                         list(range(len(self.jobs))))
+        self.assertEqual([r['status'] for r in records[:4]],
+                         ['ok', 'ok', 'empty', 'error'])
+        self.assertEqual(records[0]['result'], CLOCK)
+        self.assertEqual(records[0]['path'], self.path)
+        self.assertEqual(records[1]['result']['year'], '2016')
+        self.assertIsNone(records[1]['path'])
+        self.assertIn('Could not find parser', records[3]['error'])
+        self.assertTrue(all(r['seconds'] >= 0 for r in records))
+        # the parser is looked up once per distinct command
+        self.assertEqual(self.lookups, [('iosxe', 'show clock'),
+                                        ('iosxe', 'show foo')])
+
+    def test_serial(self):
+        self.check(list(parse_bulk(self.jobs, workers=1)))
+
+    def test_pool(self):
+        self.check(list(parse_bulk(self.jobs, workers=2, chunksize=3)))
+
+    def test_cache(self):
+        records = list(parse_bulk(self.jobs, workers=1, cache=ParseCache()))
+        self.check(records)
+        self.assertEqual([r['cached'] for r in records[:8]],
+                         [False, False, False, False, True, True, False, False])
+        self.assertEqual(records[4]['result'], CLOCK)
+
+    def test_validation(self):
+        self.check(list(parse_bulk(self.jobs, workers=1,
+                                   validation='full')))
+        with patch.object(ShowClock, 'schema', dict(ShowClock.schema,
+                                                    year=int)):
+            records = list(parse_bulk(self.jobs[:4], workers=1,
+                                      validation='full'))
+            self.assertEqual([r['status'] for r in records],
+                             ['error', 'error', 'empty', 'error'])
+            self.assertIn('year: expected int', records[0]['error'])
+            records = list(parse_bulk(self.jobs[:4], workers=1,
+                                      validation='none'))
+            self.assertEqual(records[0]['status'], 'ok')
+        with self.assertRaises(ValueError):
+            list(parse_bulk(self.jobs, validation='some'))
+
+    def test_output_not_path(self):
+        # an output naming a file is parsed as is, the file is not read
+        records = list(parse_bulk([('iosxe', 'show clock', self.path)],
+                                  workers=1))
+        self.assertEqual(records[0]['status'], 'empty')
+        self.assertIsNone(records[0]['path'])
+
+    def test_ndjson(self):
+        stream = io.StringIO()
+        summary = write_ndjson(parse_bulk(self.jobs[:4], workers=1), stream)
+        self.assertEqual(summary, {'ok': 2, 'empty': 1, 'error': 1})
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(json.loads(lines[0])['result'], CLOCK)
+
+    def test_read_jobs(self):
+        stream = io.StringIO(
+            '{"os": "iosxe", "command": "show version", "path": "a.txt"}\n'
+            '\n'
+            '{"os": "nxos", "command": "show vrf", "output": "VRF1"}\n')
+        self.assertEqual(list(read_jobs(stream)),
+                         [('iosxe', 'show version', 'a.txt', True),
+                          ('nxos', 'show vrf', 'VRF1', False)])
+        with self.assertRaises(ValueError):
+            list(read_jobs(io.StringIO('{"os": "iosxe"}')))
+
+
+class TestOfflineDevice(unittest.TestCase):
+
+    def test_device(self):
+        device = OfflineDevice('iosxe', platform='c9300')
+        self.assertEqual(device.custom['abstraction']['order'],
+                         ['os', 'platform'])
+        with self.assertRaises(Exception):
+            device.execute('show version')
+
+
+if __name__ == '__main__':
+    unittest.main()
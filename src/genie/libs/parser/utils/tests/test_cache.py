@@ -0,0 +1,204 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock, Mock, patch
+
+from genie.libs.parser.utils import common
+from genie.libs.parser.utils.cache import LRUCache, ParseCache
+from genie.libs.parser.utils.common import get_parser, get_parser_cache, \
+                                           parse_output
+from genie.libs.parser.utils.entry_points import add_parser
+
+
+class TestLRUCache(unittest.TestCase):
+
+    def test_hit_miss(self):
+        cache = LRUCache(maxsize=2)
+        self.assertIs(cache.get('a'), LRUCache.MISSING)
+        cache.set('a', None)
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.info(),
+                         {'hits': 1, 'misses': 1, 'size': 1, 'maxsize': 2})
+
+    def test_eviction(self):
+        cache = LRUCache(maxsize=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertIn('c', cache)
+
+    def test_disabled(self):
+        cache = LRUCache(maxsize=0)
+        cache.set('a', 1)
+        self.assertEqual(len(cache), 0)
+
+    def test_maxbytes(self):
+        cache = LRUCache(maxsize=10, maxbytes=10)
+        cache.set('a', b'12345')
+        cache.set('b', b'12345')
+        cache.set('c', b'123')
+        self.assertNotIn('a', cache)
+        self.assertEqual(cache.info()['bytes'], 8)
+        # larger than the whole cache
+        cache.set('d', b'12345678901')
+        self.assertNotIn('d', cache)
+        self.assertIn('b', cache)
+
+
+class TestGetParserCache(unittest.TestCase):
+
+    def setUp(self):
+        get_parser_cache.reset()
+        self.device = Mock(os='iosxe', custom={})
+        self.lookup = Mock(_tokens=['iosxe'])
+        self.parser_cls = Mock()
+        patchers = [
+            patch.object(common.Lookup, 'from_device',
+                         return_value=self.lookup),
+            patch.object(common, '_fuzzy_search_command', return_value=[
+                ('show vrf {vrf}', {'iosxe': {}}, {'vrf': 'VRF1'})]),
+            patch.object(common, '_find_parser_cls',
+                         return_value=self.parser_cls),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_cached(self):
+        first = get_parser('show vrf VRF1', self.device)
+        first[1]['vrf'] = 'modified'
+        second = get_parser('show vrf VRF1', self.device)
+
+        self.assertEqual(second, (self.parser_cls, {'vrf': 'VRF1'}))
+        self.assertEqual(common._fuzzy_search_command.call_count, 1)
+        self.assertEqual(get_parser_cache.info()['hits'], 1)
+        self.assertEqual(get_parser_cache.info()['misses'], 1)
+
+    def test_key(self):
+        get_parser('show vrf VRF1', self.device)
+        self.lookup._tokens = ['iosxe', 'c9300']
+        get_parser('show vrf VRF1', self.device)
+        self.assertEqual(common._fuzzy_search_command.call_count, 2)
+
+    def test_mock_attributes_not_cached(self):
+        # an os or an abstraction order auto-created by the Mock
+        for device in (Mock(custom={}), MagicMock(os='iosxe')):
+            with self.subTest(device=device):
+                get_parser_cache.reset()
+                common._fuzzy_search_command.reset_mock()
+                get_parser('show vrf VRF1', device)
+                get_parser('show vrf VRF1', device)
+                self.assertEqual(common._fuzzy_search_command.call_count, 2)
+                self.assertEqual(len(get_parser_cache), 0)
+
+    def test_invalidated_by_add_parser(self):
+        get_parser('show vrf VRF1', self.device)
+        mock_parser = Mock(cli_command='show test_get_parser_cache')
+        mock_parser.__name__ = 'MockParser'
+        # the parser is added to the module parser_data, removed once done
+        with patch.dict(common._get_parser_data()), \
+                patch.object(common, '_command_trie', None):
+            add_parser(parser=mock_parser, os_name='iosxe')
+        self.assertEqual(len(get_parser_cache), 0)
+        self.assertNotIn('show test_get_parser_cache', common.parser_data)
+
+
+class Parser(object):
+
+    calls = 0
+
+    def __init__(self, device):
+        self.device = device
+
+    def parse(self, output, vrf=None):
+        Parser.calls += 1
+        return {'lines': output.splitlines(), 'vrf': vrf}
+
+
+class TestParseCache(unittest.TestCase):
+
+    def setUp(self):
+        Parser.calls = 0
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def test_key(self):
+        key = ParseCache.key(Parser, {'vrf': 'a'}, 'output')
+        self.assertEqual(key, ParseCache.key(Parser, {'vrf': 'a'}, 'output'))
+        self.assertNotEqual(key, ParseCache.key(Parser, {'vrf': 'b'},
+                                                'output'))
+        self.assertNotEqual(key, ParseCache.key(Parser, {'vrf': 'a'},
+                                                'output\n'))
+        self.assertNotEqual(key, ParseCache.key(Mock, {'vrf': 'a'}, 'output'))
+
+    def test_parse(self):
+        cache = ParseCache()
+        first = cache.parse(Parser, None, 'a\nb', {'vrf': 'red'})
+        second = cache.parse(Parser, None, 'a\nb', {'vrf': 'red'})
+        self.assertEqual(first, second)
+        self.assertEqual(Parser.calls, 1)
+        cache.parse(Parser, None, 'a\nb', {'vrf': 'blue'})
+        self.assertEqual(Parser.calls, 2)
+        info = cache.info()
+        self.assertEqual((info['hits'], info['misses']), (1, 2))
+        self.assertAlmostEqual(info['hit_ratio'], 1 / 3)
+
+    def test_copy_on_read(self):
+        cache = ParseCache()
+        cache.parse(Parser, None, 'a')['lines'].append('modified')
+        self.assertEqual(cache.parse(Parser, None, 'a')['lines'], ['a'])
+
+    def test_disabled(self):
+        cache = ParseCache(maxsize=0)
+        cache.parse(Parser, None, 'a')
+        cache.parse(Parser, None, 'a')
+        self.assertEqual(Parser.calls, 2)
+
+    def test_stream(self):
+        # a stream cannot be hashed, it is parsed every time
+        cache = ParseCache()
+        for _ in range(2):
+            cache.parse(Parser, None, Mock(splitlines=lambda: ['a']))
+        self.assertEqual(Parser.calls, 2)
+        self.assertEqual(cache.info()['size'], 0)
+
+    def test_disk(self):
+        ParseCache(directory=self.directory).parse(Parser, None, 'a')
+        cache = ParseCache(directory=self.directory)
+        self.assertEqual(cache.parse(Parser, None, 'a')['lines'], ['a'])
+        self.assertEqual(Parser.calls, 1)
+        self.assertEqual(cache.info()['disk_hits'], 1)
+        self.assertEqual(cache.info()['hit_ratio'], 1.0)
+
+    def test_disk_mode(self):
+        directory = os.path.join(self.directory, 'cache')
+        ParseCache(directory=directory).parse(Parser, None, 'a')
+        for root, names, _ in os.walk(directory):
+            self.assertEqual(os.stat(root).st_mode & 0o777, 0o700)
+
+    def test_disk_eviction(self):
+        cache = ParseCache(directory=self.directory, maxdiskbytes=400)
+        for index in range(20):
+            cache.parse(Parser, None, 'line {}'.format(index))
+        self.assertLessEqual(cache.info()['disk_bytes'], 400)
+        size = sum(os.path.getsize(os.path.join(root, name))
+                   for root, _, names in os.walk(self.directory)
+                   for name in names)
+        self.assertEqual(size, cache.info()['disk_bytes'])
+
+    def test_parse_output(self):
+        with patch.object(common, 'get_parser',
+                          return_value=(Parser, {'vrf': 'red'})), \
+                patch.object(common, 'parse_cache', ParseCache()):
+            parse_output('show vrf red', None, 'a')
+            self.assertEqual(parse_output('show vrf red', None, 'a'),
+                             {'lines': ['a'], 'vrf': 'red'})
+        self.assertEqual(Parser.calls, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
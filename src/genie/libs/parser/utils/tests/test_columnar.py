@@ -0,0 +1,202 @@
+import unittest
+from unittest.mock import Mock
+
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+from genie.libs.parser.utils.columnar import Table, Columnar
+from genie.libs.parser.linux.ps import Ps
+from genie.libs.parser.iosxe.show_arp import ShowArp
+from genie.libs.parser.iosxe.show_fdb import ShowMacAddressTable
+from genie.libs.parser.iosxe.show_ip_nat import ShowIpNatTranslations
+
+
+class TestTable(unittest.TestCase):
+
+    def setUp(self):
+        self.table = Table(('vrf', '{vrf}', 'index', '{index}'))
+
+    def test_append(self):
+        self.table.append({'vrf': 'default', 'index': 1, 'protocol': 'tcp'})
+        self.table.append({'vrf': 'default', 'index': 2,
+                           'time_left': '0:00:05'})
+        self.assertEqual(len(self.table), 2)
+        self.assertEqual(self.table['protocol'], ['tcp', None])
+        self.assertEqual(self.table['time_left'], [None, '0:00:05'])
+        self.assertEqual(self.table.index, {('default', 1): 0,
+                                            ('default', 2): 1})
+        self.assertEqual(list(self.table.rows()),
+                         [{'vrf': 'default', 'index': 1, 'protocol': 'tcp'},
+                          {'vrf': 'default', 'index': 2,
+                           'time_left': '0:00:05'}])
+
+    def test_update(self):
+        # same keys, updated as a dict would be
+        self.table.append({'vrf': 'default', 'index': 1, 'protocol': 'tcp'})
+        self.table.append({'vrf': 'default', 'index': 1, 'protocol': 'udp',
+                           'group_id': 0})
+        self.assertEqual(len(self.table), 1)
+        self.assertEqual(self.table['protocol'], ['udp'])
+        self.assertEqual(self.table['group_id'], [0])
+
+    def test_extend(self):
+        columns = {'vrf': ['default', 'default'], 'index': [1, 2],
+                   'protocol': ['tcp', None]}
+        self.table.extend(columns)
+        self.assertEqual(len(self.table), 2)
+        self.assertIs(self.table['protocol'], columns['protocol'])
+        self.assertEqual(self.table.index, {('default', 1): 0,
+                                            ('default', 2): 1})
+
+    def test_extend_update(self):
+        # same keys, updated as by append, or the first row kept
+        columns = {'vrf': ['default', 'default'], 'index': [1, 1],
+                   'protocol': ['tcp', 'udp'], 'group_id': [None, 0]}
+        self.table.extend(dict(columns))
+        self.assertEqual(len(self.table), 1)
+        self.assertEqual(self.table['protocol'], ['udp'])
+        self.assertEqual(self.table['group_id'], [0])
+        table = Table(self.table.path)
+        table.extend(dict(columns), update=False)
+        self.assertEqual(table['protocol'], ['tcp'])
+
+    def test_extend_missing_key(self):
+        # the rows without all their keys are kept but not indexed
+        self.table.extend({'vrf': ['default', 'default', 'default'],
+                           'index': [1, None, None],
+                           'protocol': ['tcp', 'udp', 'gre']})
+        self.assertEqual(len(self.table), 3)
+        self.assertEqual(self.table.index, {('default', 1): 0})
+
+    def test_extend_lengths(self):
+        with self.assertRaises(ValueError):
+            self.table.extend({'vrf': ['default'], 'index': [1, 2]})
+
+    def test_to_dict(self):
+        self.table.append({'vrf': 'default', 'index': 1, 'protocol': 'tcp',
+                           'details.use': '00:00:01'})
+        self.assertEqual(self.table.to_dict(), {'vrf': {'default': {
+            'index': {1: {'protocol': 'tcp',
+                          'details': {'use': '00:00:01'}}}}}})
+
+    def test_arrays(self):
+        self.table.append({'vrf': 'default', 'index': 1})
+        self.assertEqual(list(self.table.arrays()['index']), [1])
+
+    def test_no_key(self):
+        with self.assertRaises(ValueError):
+            Table(('vrf', 'index'))
+
+
+class TestColumnar(unittest.TestCase):
+
+    parsed = {
+        'vrf': {
+            'default': {
+                'index': {1: {'protocol': 'tcp',
+                              'details': {'use': '00:00:01'}},
+                          2: {'protocol': 'udp'}},
+            },
+            'number_of_translations': 2,
+        },
+    }
+
+    def test_from_dict(self):
+        columnar = Columnar.from_dict(
+            self.parsed, {'index': ('vrf', '{vrf}', 'index', '{index}')})
+        table = columnar['index']
+        self.assertEqual(len(columnar), 2)
+        self.assertEqual(table['protocol'][table.index['default', 2]], 'udp')
+        self.assertEqual(table['details.use'], ['00:00:01', None])
+        self.assertEqual(columnar.extra,
+                         {'vrf': {'number_of_translations': 2}})
+        self.assertEqual(columnar.to_dict(), self.parsed)
+
+    def test_key_fields(self):
+        parsed = {'interfaces': {'Vlan100': {'ipv4': {'neighbors': {
+            '10.1.1.1': {'ip': '10.1.1.1', 'type': 'ARPA'}}}}}}
+        columnar = Columnar.from_dict(parsed, {
+            'neighbors': ('interfaces', '{interface}', 'ipv4', 'neighbors',
+                          '{ip}')})
+        self.assertEqual(set(columnar['neighbors'].columns),
+                         {'interface', 'ip', 'type'})
+        self.assertEqual(columnar.to_dict(), parsed)
+
+    def test_empty(self):
+        columnar = Columnar.from_dict(
+            {}, {'index': ('vrf', '{vrf}', 'index', '{index}')})
+        self.assertFalse(columnar)
+        self.assertEqual(columnar.to_dict(), {})
+
+
+class TestColumnarParser(unittest.TestCase):
+
+    ps_output = '''
+        UID        PID  PPID  C STIME TTY          TIME CMD
+        root         1     0  0  2019 ?        00:00:36 /sbin/init
+        root      2322     1  0  2019 tty2     00:00:00 /sbin/mingetty /dev/tty2
+    '''
+
+    arp_output = '''
+        Protocol  Address          Age (min)  Hardware Addr   Type   Interface
+        Internet  192.168.234.1           -   58bf.eaff.e508  ARPA   Vlan100
+        Internet  10.169.197.93          -   fa16.3eff.b7ad  ARPA
+    '''
+
+    def test_ps(self):
+        parser = Ps(device=Mock())
+        columnar = parser.parse(output=self.ps_output, columnar=True)
+        table = columnar['pid']
+        self.assertEqual(table['cmd'][table.index['2322']],
+                         '/sbin/mingetty /dev/tty2')
+        self.assertEqual(columnar.to_dict(),
+                         parser.parse(output=self.ps_output))
+
+    def test_arp(self):
+        parser = ShowArp(device=Mock())
+        columnar = parser.parse(output=self.arp_output, columnar=True)
+        self.assertEqual(columnar['neighbors']['interface'], ['Vlan100'])
+        self.assertEqual(columnar['global_static_table']['ip_address'],
+                         ['10.169.197.93'])
+        self.assertEqual(columnar.to_dict(),
+                         parser.parse(output=self.arp_output))
+
+    mac_output = '''
+        *  102  aa11.bbff.ee55    static  Yes          -   Gi1/2,Gi1/4
+                                                         Router
+        *  102  aa11.bbff.ee55   dynamic   No         10   Gi1/4
+          20    aaaa.bbff.8888    STATIC      Drop
+        Total Mac Addresses for this criterion: 3
+    '''
+
+    nat_output = '''
+        Pro Inside global      Inside local       Outside local      Outside global
+        udp 172.16.94.209:1220  192.168.1.95:1220  172.16.169.132:53    172.16.169.132:53
+        tcp 172.16.94.209:11012 192.168.1.89:11012 172.16.196.220:23    172.16.196.220:23
+        Total number of translations: 2
+    '''
+
+    def test_mac(self):
+        parser = ShowMacAddressTable(device=Mock())
+        columnar = parser.parse(output=self.mac_output, columnar=True)
+        table = columnar['mac_addresses']
+        self.assertEqual(table['age'][table.index[
+            '102', 'aa11.bbff.ee55', 'GigabitEthernet1/4']], 10)
+        self.assertEqual(columnar.extra, {'total_mac_addresses': 3})
+        self.assertEqual(columnar.to_dict(),
+                         parser.parse(output=self.mac_output))
+
+    def test_nat(self):
+        parser = ShowIpNatTranslations(device=Mock())
+        columnar = parser.parse(output=self.nat_output, columnar=True)
+        table = columnar['index']
+        self.assertEqual(table['protocol'][table.index['default', 1]], 'udp')
+        self.assertEqual(columnar.to_dict(),
+                         parser.parse(output=self.nat_output))
+
+    def test_empty(self):
+        with self.assertRaises(SchemaEmptyParserError):
+            Ps(device=Mock()).parse(output='', columnar=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+
+from genie.libs.parser.utils.command_trie import CommandTrie
+
+
+class TestCommandTrie(unittest.TestCase):
+
+    data = {
+        'show version': {'iosxe': {}, 'nxos': {}},
+        'show vrf': {'iosxe': {}},
+        'show vrf {vrf}': {'iosxe': {}},
+        'show ip route vrf {vrf}': {'nxos': {}},
+        'show interfaces {interface} status': {'iosxe': {}},
+        '/dna/intent/api/v1/interface/{interface}': {'dnac': {}},
+    }
+
+    def setUp(self):
+        self.trie = CommandTrie(self.data)
+
+    def test_exact(self):
+        self.assertEqual(self.trie.candidates(['show', 'version']),
+                         ['show version'])
+
+    def test_abbreviation(self):
+        self.assertEqual(self.trie.candidates(['sh', 'v']),
+                         ['show version', 'show vrf'])
+
+    def test_os(self):
+        self.assertEqual(self.trie.candidates(['sh', 'v'], os='nxos'),
+                         ['show version'])
+        self.assertEqual(self.trie.candidates(['show', 'vrf'], os='nxos'), [])
+
+    def test_argument(self):
+        self.assertEqual(self.trie.candidates(['show', 'vrf', 'VRF1']),
+                         ['show vrf {vrf}'])
+        self.assertEqual(
+            self.trie.candidates('show interfaces Gi 1/0/1 status'.split()),
+            ['show interfaces {interface} status'])
+
+    def test_embedded_argument(self):
+        self.assertEqual(
+            self.trie.candidates(['/dna/intent/api/v1/interface/abc']),
+            ['/dna/intent/api/v1/interface/{interface}'])
+
+    def test_regex(self):
+        self.assertEqual(self.trie.candidates(['show', '.*'], fuzzy=True),
+                         ['show version', 'show vrf', 'show vrf {vrf}',
+                          'show ip route vrf {vrf}',
+                          'show interfaces {interface} status'])
+
+    def test_add(self):
+        self.trie.add('show version', ['junos'])
+        self.assertEqual(self.trie.candidates(['show', 'version'],
+                                              os='junos'), ['show version'])
+        self.assertEqual(len(self.trie), len(self.data))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -449,5 +449,23 @@ class TestFuzzyRegexSearchCommand(unittest.TestCase):
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0][0], 'show ipv6 prefix-list detail')
 
+    def test_other_os_not_matched(self):
+        # a command of a single os, searched with an extra space so that it
+        # is not a perfect match
+        command = next(command for command, source in parser_data.items()
+                       if list(source) == ['nxos'] and '{' not in command)
+        search = command.replace(' ', '  ', 1)
+        for fuzzy in (False, True):
+            with self.subTest(fuzzy=fuzzy):
+                found = [result[0] for result in _fuzzy_search_command(
+                    re.escape(search) if fuzzy else search, fuzzy,
+                    os='nxos')]
+                self.assertIn(command, found)
+                for result in _fuzzy_search_command(
+                        re.escape(search) if fuzzy else search, fuzzy,
+                        os='iosxe'):
+                    self.assertNotEqual(result[0], command)
+                    self.assertIn('iosxe', result[1])
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,108 @@
+import unittest
+
+from genie.libs.parser.utils.intern import Interner, intern_result
+
+
+def fresh(value):
+    # a new string object equal to value
+    return ''.join(list(value))
+
+
+class TestInterner(unittest.TestCase):
+
+    def setUp(self):
+        self.interner = Interner()
+
+    def test_strings(self):
+        a = self.interner(fresh('10.1.1.1'))
+        b = self.interner(fresh('10.1.1.1'))
+        self.assertIs(a, b)
+        self.assertEqual(self.interner(100), 100)
+        self.assertIsNone(self.interner(None))
+        self.assertEqual(self.interner.info(),
+                         {'strings': 1, 'containers': 0, 'hits': 1})
+
+    def test_dicts(self):
+        a = self.interner.dict({'next_hop': '10.1.1.1', 'weight': 0})
+        b = self.interner.dict({'next_hop': '10.1.1.1', 'weight': 0})
+        c = self.interner.dict({'next_hop': '10.1.1.2', 'weight': 0})
+        self.assertIs(a, b)
+        self.assertIsNot(a, c)
+
+    def test_types(self):
+        # equal but of different types
+        a = self.interner.dict({'enabled': True})
+        b = self.interner.dict({'enabled': 1})
+        c = self.interner.dict({'enabled': 1.0})
+        self.assertIs(type(b['enabled']), int)
+        self.assertIs(type(c['enabled']), float)
+        self.assertIsNot(a, b)
+        self.assertIsNot(b, c)
+        self.assertIsNot(self.interner.dict({1: 'a'}),
+                         self.interner.dict({True: 'a'}))
+
+    def test_lists(self):
+        a = self.interner.list(['65001:100', '65001:200'])
+        b = self.interner.list(['65001:100', '65001:200'])
+        self.assertIs(a, b)
+        # a dict and a list with the same items are not the same
+        d = self.interner.dict({0: '65001:100', 1: '65001:200'})
+        self.assertIsInstance(d, dict)
+
+    def test_not_shared(self):
+        nested = {'index': {1: {'next_hop': '10.1.1.1'}}}
+        self.assertIsNot(self.interner.dict(nested),
+                         self.interner.dict(
+                             {'index': {1: {'next_hop': '10.1.1.1'}}}))
+        interner = Interner(max_items=1)
+        big = {'a': 1, 'b': 2}
+        self.assertIs(interner.dict(big), big)
+        self.assertIsNot(interner.dict({'a': 1, 'b': 2}), big)
+
+    def test_result(self):
+        result = {'routes': {
+            '10.0.0.0/24': {'index': {1: {'next_hop': fresh('10.1.1.1'),
+                                          'path': fresh('65001 65002'),
+                                          'weight': 0},
+                                      2: {'next_hop': fresh('10.1.1.2'),
+                                          'path': fresh('65001 65002'),
+                                          'weight': 0}}},
+            '10.0.1.0/24': {'index': {1: {'next_hop': fresh('10.1.1.1'),
+                                          'path': fresh('65001 65002'),
+                                          'weight': 0}},
+                            'communities': [fresh('65001:1')]},
+            '10.0.2.0/24': {'communities': [fresh('65001:1')]}}}
+        expected = {'routes': {
+            '10.0.0.0/24': {'index': {1: {'next_hop': '10.1.1.1',
+                                          'path': '65001 65002',
+                                          'weight': 0},
+                                      2: {'next_hop': '10.1.1.2',
+                                          'path': '65001 65002',
+                                          'weight': 0}}},
+            '10.0.1.0/24': {'index': {1: {'next_hop': '10.1.1.1',
+                                          'path': '65001 65002',
+                                          'weight': 0}},
+                            'communities': ['65001:1']},
+            '10.0.2.0/24': {'communities': ['65001:1']}}}
+
+        interned = intern_result(result)
+        self.assertIs(interned, result)
+        self.assertEqual(interned, expected)
+        routes = interned['routes']
+        self.assertIs(routes['10.0.0.0/24']['index'][1],
+                      routes['10.0.1.0/24']['index'][1])
+        self.assertIs(routes['10.0.0.0/24']['index'][1]['path'],
+                      routes['10.0.0.0/24']['index'][2]['path'])
+        self.assertIs(routes['10.0.1.0/24']['communities'],
+                      routes['10.0.2.0/24']['communities'])
+
+    def test_shared_between_results(self):
+        first = intern_result({'vrf': fresh('default')}, self.interner)
+        second = intern_result({'vrf': fresh('default')}, self.interner)
+        self.assertIs(first, second)
+        self.interner.clear()
+        self.assertEqual(self.interner.info()['strings'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import unittest
+
+from genie.libs.parser.utils import intf_name
+from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.intf_name import convert_intf_name, \
+    convert_intf_names, add_abbreviations
+
+
+class TestConvertIntfName(unittest.TestCase):
+
+    def test_abbreviations(self):
+        self.assertEqual(convert_intf_name('Gi1/0/1'), 'GigabitEthernet1/0/1')
+        self.assertEqual(convert_intf_name('Gig1/0/1.100'),
+                         'GigabitEthernet1/0/1.100')
+        self.assertEqual(convert_intf_name('Eth2/1'), 'Ethernet2/1')
+        self.assertEqual(convert_intf_name('Te0/1/0'),
+                         'TenGigabitEthernet0/1/0')
+        self.assertEqual(convert_intf_name('BE10'), 'Bundle-Ether10')
+        # the port is the first number after the type
+        self.assertEqual(convert_intf_name('Gi 1/0/1'), 'GigabitEthernet1/0/1')
+
+    def test_full_names(self):
+        self.assertEqual(convert_intf_name('GigabitEthernet1/0/1'),
+                         'GigabitEthernet1/0/1')
+        self.assertEqual(convert_intf_name('Port-channel10'),
+                         'Port-channel10')
+        self.assertEqual(convert_intf_name('port-channel10'),
+                         'Port-channel10')
+        # a prefix of a longer type is not an abbreviation
+        self.assertEqual(convert_intf_name('TenGigE0/0/0/1'),
+                         'TenGigE0/0/0/1')
+        self.assertEqual(convert_intf_name('gigabitethernet1'),
+                         'GigabitEthernet1')
+
+    def test_no_port(self):
+        self.assertEqual(convert_intf_name('Gi'), 'Gi')
+        self.assertEqual(convert_intf_name('mgmt'), 'mgmt')
+        self.assertEqual(convert_intf_name('1/0/1'), '1/0/1')
+        self.assertEqual(convert_intf_name(''), '')
+
+    def test_os_overrides(self):
+        self.assertEqual(convert_intf_name('Te0/0/0/1', os='iosxr'),
+                         'TenGigE0/0/0/1')
+        self.assertEqual(convert_intf_name('Gi0/0/0/1', os='iosxr'),
+                         'GigabitEthernet0/0/0/1')
+        self.assertEqual(convert_intf_name('Po10', os='nxos'),
+                         'port-channel10')
+        # an unknown os has the default abbreviations
+        self.assertEqual(convert_intf_name('Te1/1', os='junos'),
+                         'TenGigabitEthernet1/1')
+
+    def test_common(self):
+        self.assertEqual(Common.convert_intf_name(intf='Fa0/1'),
+                         'FastEthernet0/1')
+        self.assertEqual(Common.convert_intf_name('Te0/0/0/1', os='iosxr'),
+                         'TenGigE0/0/0/1')
+
+    def test_memoized(self):
+        convert_intf_name.cache_clear()
+        convert_intf_name('Lo0')
+        convert_intf_name('Lo0')
+        info = convert_intf_name.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+
+    def test_bulk(self):
+        self.assertEqual(convert_intf_names(['Eth1/1', 'Po10', 'Eth1/1']),
+                         ['Ethernet1/1', 'Port-channel10', 'Ethernet1/1'])
+        self.assertEqual(convert_intf_names(iter(['Po10']), os='nxos'),
+                         ['port-channel10'])
+        self.assertEqual(convert_intf_names([]), [])
+
+
+class TestAddAbbreviations(unittest.TestCase):
+
+    def setUp(self):
+        self.abbreviations = dict(intf_name.ABBREVIATIONS)
+        self.os_abbreviations = {os: dict(table) for os, table
+                                 in intf_name.OS_ABBREVIATIONS.items()}
+
+    def tearDown(self):
+        intf_name.ABBREVIATIONS.clear()
+        intf_name.ABBREVIATIONS.update(self.abbreviations)
+        intf_name.OS_ABBREVIATIONS.clear()
+        intf_name.OS_ABBREVIATIONS.update(self.os_abbreviations)
+        intf_name._tables.clear()
+        convert_intf_name.cache_clear()
+
+    def test_add(self):
+        self.assertEqual(convert_intf_name('Nv1'), 'Nv1')
+        add_abbreviations({'Nv': 'nve'})
+        self.assertEqual(convert_intf_name('Nv1'), 'nve1')
+
+    def test_add_os(self):
+        add_abbreviations({'Gi': 'GigE'}, os='iosxr')
+        self.assertEqual(convert_intf_name('Gi0/0/0/1', os='iosxr'),
+                         'GigE0/0/0/1')
+        self.assertEqual(convert_intf_name('Gi0/0/0/1'),
+                         'GigabitEthernet0/0/0/1')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+import json
+import unittest
+
+from genie.libs.parser.utils import json_rows
+from genie.libs.parser.utils.json_rows import iter_json_rows, loads
+from genie.libs.parser.utils.xml_stream import iter_rows, Row
+
+
+XML_OUTPUT = '''<?xml version="1.0" encoding="ISO-8859-1"?>
+<nf:rpc-reply xmlns="http://www.cisco.com/nxos:7.0.3.I7.1.:bgp" xmlns:nf="urn:ietf:params:xml:ns:netconf:base:1.0">
+ <nf:data>
+  <show>
+   <bgp>
+    <sessions>
+     <__readonly__>
+      <totalpeers>3</totalpeers>
+      <TABLE_vrf>
+       <ROW_vrf>
+        <vrf-name-out>VRF1</vrf-name-out>
+        <TABLE_neighbor>
+         <ROW_neighbor>
+          <neighbor-id>10.106.102.3</neighbor-id>
+          <remoteas>100</remoteas>
+         </ROW_neighbor>
+         <ROW_neighbor>
+          <neighbor-id>10.106.102.4</neighbor-id>
+          <remoteas>none</remoteas>
+         </ROW_neighbor>
+        </TABLE_neighbor>
+       </ROW_vrf>
+       <ROW_vrf>
+        <vrf-name-out>default</vrf-name-out>
+        <TABLE_neighbor>
+         <ROW_neighbor>
+          <neighbor-id>10.106.101.1</neighbor-id>
+          <remoteas>333</remoteas>
+         </ROW_neighbor>
+        </TABLE_neighbor>
+       </ROW_vrf>
+      </TABLE_vrf>
+     </__readonly__>
+    </sessions>
+   </bgp>
+  </show>
+ </nf:data>
+</nf:rpc-reply>
+]]>]]>'''
+
+# the same reply with '| json', a table of one row holds an object
+JSON_OUTPUT = '''
+{
+  "totalpeers": "3",
+  "TABLE_vrf": {
+    "ROW_vrf": [
+      {
+        "vrf-name-out": "VRF1",
+        "TABLE_neighbor": {
+          "ROW_neighbor": [
+            {"neighbor-id": "10.106.102.3", "remoteas": "100"},
+            {"neighbor-id": "10.106.102.4", "remoteas": "none"}
+          ]
+        }
+      },
+      {
+        "vrf-name-out": "default",
+        "TABLE_neighbor": {
+          "ROW_neighbor": {"neighbor-id": "10.106.101.1", "remoteas": "333"}
+        }
+      }
+    ]
+  }
+}
+'''
+
+ROWS = {
+    'sessions': Row('', {'totalpeers': ('total_peers', int)}),
+    'vrf': Row('TABLE_vrf/ROW_vrf', {'vrf-name-out': 'vrf'}),
+    'neighbor': Row('TABLE_vrf/ROW_vrf/TABLE_neighbor/ROW_neighbor', {
+        'neighbor-id': 'neighbor',
+        'remoteas': ('remote_as', int)}),
+}
+
+
+class TestLoads(unittest.TestCase):
+
+    def test_loads(self):
+        self.assertEqual(loads('{"totalpeers": "3"}\n'), {'totalpeers': '3'})
+        self.assertEqual(loads('{"totalpeers": "3"}', decoder=json.loads),
+                         {'totalpeers': '3'})
+
+    def test_empty(self):
+        self.assertEqual(loads(''), {})
+        self.assertEqual(loads('\n  \n'), {})
+
+    def test_rejected(self):
+        self.assertIsNone(loads("% Invalid command at '^' marker."))
+        self.assertIsNone(loads("Syntax error while parsing '| json'"))
+
+    def test_truncated(self):
+        with self.assertRaises(ValueError):
+            loads('{"totalpeers": "3", "TABLE_vrf": {')
+
+    @unittest.skipIf(json_rows.orjson is None, 'orjson is not installed')
+    def test_decoders(self):
+        self.assertEqual(loads(JSON_OUTPUT),
+                         loads(JSON_OUTPUT, decoder=json.loads))
+
+
+class TestIterJsonRows(unittest.TestCase):
+
+    def test_rows(self):
+        self.assertEqual(
+            [(name, values) for name, values, _ in iter_json_rows(
+                loads(JSON_OUTPUT), ROWS)],
+            [('neighbor', {'neighbor': '10.106.102.3', 'remote_as': 100}),
+             ('neighbor', {'neighbor': '10.106.102.4'}),
+             ('vrf', {'vrf': 'VRF1'}),
+             ('neighbor', {'neighbor': '10.106.101.1', 'remote_as': 333}),
+             ('vrf', {'vrf': 'default'}),
+             ('sessions', {'total_peers': 3})])
+
+    def test_same_as_xml(self):
+        self.assertEqual(list(iter_json_rows(loads(JSON_OUTPUT), ROWS)),
+                         list(iter_rows(XML_OUTPUT, ROWS)))
+
+    def test_parents(self):
+        for name, values, parents in iter_json_rows(loads(JSON_OUTPUT),
+                                                    ROWS):
+            if name == 'neighbor':
+                self.assertEqual([parent.get('vrf') for parent in parents],
+                                 [None, 'default' if values['neighbor']
+                                  == '10.106.101.1' else 'VRF1'])
+
+    def test_every_leaf(self):
+        self.assertEqual(
+            [values for _, values, _ in iter_json_rows(
+                loads(JSON_OUTPUT), {'vrf': 'TABLE_vrf/ROW_vrf'})],
+            [{'vrf-name-out': 'VRF1'}, {'vrf-name-out': 'default'}])
+
+    def test_leaves(self):
+        # leaves given as numbers, and a leaf repeated in the row
+        tree = {'TABLE_vrf': {'ROW_vrf': {'vrf-name-out': ['VRF1', 'VRF2'],
+                                          'vrf-id': 3}}}
+        self.assertEqual(
+            [values for _, values, _ in iter_json_rows(tree, {
+                'vrf': Row('TABLE_vrf/ROW_vrf', {'vrf-name-out': 'vrf',
+                                                 'vrf-id': 'vrf_id'})})],
+            [{'vrf': 'VRF1', 'vrf_id': '3'}])
+
+    def test_no_rows(self):
+        self.assertEqual(list(iter_json_rows({}, ROWS)),
+                         [('sessions', {}, ())])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import sys
+import types
+import unittest
+import subprocess
+
+from genie.libs.parser import nxos
+from genie.libs.parser.utils.lazy import lazy_getattr
+
+
+def imported(code):
+    '''Return the genie.libs.parser modules imported by code, in a new
+       interpreter'''
+    return set(subprocess.check_output([
+        sys.executable, '-c', code + '\nimport sys\nprint(" ".join(sorted('
+        'm for m in sys.modules if m.startswith("genie.libs.parser"))))'],
+        universal_newlines=True).split())
+
+
+class TestLazyGetattr(unittest.TestCase):
+
+    def test_submodule(self):
+        __getattr__ = lazy_getattr('genie.libs.parser.nxos')
+        module = __getattr__('show_vrf')
+        self.assertIsInstance(module, types.ModuleType)
+        self.assertEqual(module.__name__, 'genie.libs.parser.nxos.show_vrf')
+        self.assertIs(nxos.show_vrf, module)
+
+    def test_names(self):
+        __getattr__ = lazy_getattr('genie.libs.parser.utils', {
+            'get_parser': '.common'})
+        from genie.libs.parser.utils.common import get_parser
+        self.assertIs(__getattr__('get_parser'), get_parser)
+
+    def test_unknown(self):
+        __getattr__ = lazy_getattr('genie.libs.parser.nxos')
+        with self.assertRaises(AttributeError):
+            __getattr__('show_unknown')
+        with self.assertRaises(AttributeError):
+            __getattr__('__path_hooks__')
+        self.assertFalse(hasattr(nxos, 'show_unknown'))
+
+
+class TestLazyPackages(unittest.TestCase):
+
+    def test_one_parser(self):
+        modules = imported('from genie.libs.parser.nxos.show_vrf import '
+                           'ShowVrf')
+        self.assertIn('genie.libs.parser.nxos.show_vrf', modules)
+        self.assertEqual([module for module in modules
+                          if module.startswith('genie.libs.parser.nxos.')],
+                         ['genie.libs.parser.nxos.show_vrf'])
+        self.assertNotIn('genie.libs.parser.base', modules)
+        self.assertNotIn('genie.libs.parser.utils.entry_points', modules)
+
+    def test_package_names(self):
+        modules = imported('from genie.libs.parser import CaasMetaParser\n'
+                           'from genie.libs.parser.utils import get_parser')
+        self.assertIn('genie.libs.parser.base', modules)
+        self.assertIn('genie.libs.parser.utils.common', modules)
+
+    def test_entry_points(self):
+        # the external parsers are added with the parser data
+        modules = imported('from genie.libs.parser.utils.common import '
+                           'parser_data\nlen(parser_data)')
+        self.assertIn('genie.libs.parser.utils.entry_points', modules)
+
+
+if __name__ == '__main__':
+    unittest.main()
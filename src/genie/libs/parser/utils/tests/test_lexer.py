@@ -0,0 +1,73 @@
+import re
+import unittest
+
+from genie.libs.parser.utils.lexer import Lexer
+from genie.libs.parser.utils.patterns import Patterns
+
+
+class TestLexer(unittest.TestCase):
+
+    def setUp(self):
+        self.lexer = Lexer(Patterns(
+            p1=r'^(?P<tag>\S+) +logging: +(?P<status>\S+)$',
+            p2=r'^(?P<tag>\S+) +logging: +level +(?P<level>\S+), '
+               r'+(?P<messages>\d+) +messages',
+            p3=r'^Trap +logging: +level +(\S+), +(\d+) +message lines',
+            p4=(r'^mtu +(?P<mtu>\d+)$', re.I)))
+
+    def test_order(self):
+        m = self.lexer.match('Console logging: disabled')
+        self.assertEqual(m.lastgroup, 'p1')
+        m = self.lexer.match('Trap logging: level debugging, 9 messages')
+        self.assertEqual(m.lastgroup, 'p2')
+        self.assertIsNone(self.lexer.match('Log Buffer (32000 bytes):'))
+
+    def test_groups(self):
+        m = self.lexer.match('Monitor logging: level debugging, 0 messages')
+        self.assertEqual(m.groupdict(), {'tag': 'Monitor',
+                                         'level': 'debugging',
+                                         'messages': '0'})
+        self.assertEqual(m.groups(), ('Monitor', 'debugging', '0'))
+        self.assertEqual(m.group('level'), 'debugging')
+        self.assertEqual(m['messages'], '0')
+        self.assertEqual(m.group(1, 3), ('Monitor', '0'))
+        self.assertEqual(m.group(), m.string[:m.end()])
+        self.assertEqual(m.span('tag'), (0, 7))
+
+    def test_unnamed_groups(self):
+        m = self.lexer.match('Trap logging: level informational, '
+                             '95 message lines logged')
+        self.assertEqual(m.lastgroup, 'p3')
+        self.assertEqual(m.groups(), ('informational', '95'))
+        self.assertEqual(m.groupdict(), {})
+
+    def test_flags(self):
+        self.assertEqual(self.lexer.match('MTU 1500').group('mtu'), '1500')
+        lexer = Lexer([('p1', r'(?i)^mtu +(?P<mtu>\d+)$'),
+                       ('p2', r'^MTU$')])
+        self.assertEqual(lexer.match('Mtu 9000').lastgroup, 'p1')
+        # the flag of p1 does not apply to p2
+        self.assertIsNone(Lexer([('p1', r'(?i)^x$'),
+                                 ('p2', r'^mtu$')]).match('MTU'))
+
+    def test_references(self):
+        lexer = Lexer([('p1', r'^(?P<a>\w+)-(?P=a)$'),
+                       ('p2', r'^(?P<a>\w+) (?(a)x|y)$')])
+        self.assertEqual(lexer.match('ab-ab').lastgroup, 'p1')
+        self.assertEqual(lexer.match('ab x').lastgroup, 'p2')
+        with self.assertRaises(ValueError):
+            Lexer([('p1', r'^(\w+)-\1$')]).regex
+
+    def test_exclude(self):
+        lexer = Lexer(Patterns(p1=r'^a', p2=r'^ab'), exclude=['p1'])
+        self.assertEqual(lexer.names, ['p2'])
+        self.assertEqual(lexer.match('ab').lastgroup, 'p2')
+        self.assertNotIn('p1', lexer)
+
+    def test_invalid_name(self):
+        with self.assertRaises(ValueError):
+            Lexer([('_p1', r'^a')])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+import re
+import unittest
+
+from genie.libs.parser.utils.line_dispatch import LineDispatcher, \
+                                                  literal_prefix, first_word
+
+
+class TestLiteralPrefix(unittest.TestCase):
+
+    def test_complete_word(self):
+        self.assertEqual(literal_prefix(r'^MTU +(?P<mtu>\d+) +bytes'),
+                         (True, 'MTU', True))
+        self.assertEqual(literal_prefix(r'^Base PPPoATM +(?P<base>\S+)$'),
+                         (True, 'Base', True))
+        self.assertEqual(literal_prefix(r'^No\. +of +active'),
+                         (True, 'No.', True))
+        self.assertEqual(literal_prefix(r'^LCP\s+(?P<state>\S+)'),
+                         (True, 'LCP', True))
+        self.assertEqual(literal_prefix(r'^Helper$'), (True, 'Helper', True))
+
+    def test_partial_word(self):
+        self.assertEqual(literal_prefix(r'^Description: *(?P<desc>.*)$'),
+                         (True, 'Description:', False))
+        self.assertEqual(literal_prefix(r'^Encapsulation(\(s\):)? +(?P<e>.*)'),
+                         (True, 'Encapsulation', False))
+        # match() does not need to reach the end of the pattern
+        self.assertEqual(literal_prefix(r'^Foo'), (True, 'Foo', False))
+
+    def test_leading_whitespace(self):
+        self.assertEqual(literal_prefix(r'^\s*For +address +family:'),
+                         (True, 'For', True))
+
+    def test_no_prefix(self):
+        self.assertEqual(literal_prefix(r'^(?P<intf>[\w\/\.\-]+) +is'),
+                         (True, '', False))
+        self.assertEqual(literal_prefix(r'^(?:Foo|Bar) +is'),
+                         (True, '', False))
+        self.assertEqual(literal_prefix(r'^ +Foo'), (True, '', False))
+        self.assertEqual(literal_prefix(re.compile(r'^foo', re.I)),
+                         (False, '', False))
+
+    def test_not_anchored(self):
+        self.assertEqual(literal_prefix(r'Hardware +is +(?P<type>.+)'),
+                         (False, 'Hardware', True))
+
+    def test_first_word(self):
+        self.assertEqual(first_word('  MTU 1500 bytes'), 'MTU')
+        self.assertEqual(first_word('MTU\t1500'), 'MTU')
+        self.assertEqual(first_word(''), '')
+
+
+class TestLineDispatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = []
+        self.dispatcher = LineDispatcher([
+            (r'^Hardware +is +(?P<type>.+)$', self.handler('hardware')),
+            (r'^Description: *(?P<description>.*)$',
+             self.handler('description')),
+            (r'^MTU +(?P<mtu>\d+) +bytes', self.handler('mtu')),
+            (r'^(?P<interface>\S+) +is +(?P<enabled>.+)$',
+             self.handler('interface')),
+        ])
+
+    def handler(self, name, result=None):
+        def _handler(m, *args):
+            self.calls.append((name, m.groups(), args))
+            return name if result is None else result
+        return _handler
+
+    def candidates(self, line):
+        return [p.pattern for p, _ in self.dispatcher.candidates(line)]
+
+    def test_candidates(self):
+        self.assertEqual(self.candidates('MTU 1500 bytes'),
+                         [r'^MTU +(?P<mtu>\d+) +bytes',
+                          r'^(?P<interface>\S+) +is +(?P<enabled>.+)$'])
+        self.assertEqual(self.candidates('Description:uplink'),
+                         [r'^Description: *(?P<description>.*)$',
+                          r'^(?P<interface>\S+) +is +(?P<enabled>.+)$'])
+        self.assertEqual(self.candidates('Gi1 is up'),
+                         [r'^(?P<interface>\S+) +is +(?P<enabled>.+)$'])
+
+    def test_dispatch(self):
+        self.assertEqual(self.dispatcher.dispatch('MTU 1500 bytes', 'x'),
+                         'mtu')
+        self.assertEqual(self.calls, [('mtu', ('1500',), ('x',))])
+        self.assertIsNone(self.dispatcher.dispatch('5 minute input rate'))
+        self.assertEqual(self.dispatcher.lines, 2)
+        self.assertEqual(self.dispatcher.attempts, 2)
+
+    def test_order(self):
+        # 'Hardware is up' is matched by both patterns, the first one wins
+        self.assertEqual(self.dispatcher.dispatch('Hardware is up'),
+                         'hardware')
+
+    def test_next(self):
+        dispatcher = LineDispatcher([
+            (r'^Hardware +is +(?P<type>.+)$',
+             self.handler('hardware', LineDispatcher.NEXT)),
+            (r'^(?P<interface>\S+) +is +(?P<enabled>.+)$',
+             self.handler('interface'))])
+        self.assertEqual(dispatcher.dispatch('Hardware is up'), 'interface')
+        self.assertEqual([name for name, _, _ in self.calls],
+                         ['hardware', 'interface'])
+
+    def test_maxsize(self):
+        dispatcher = LineDispatcher([(r'^MTU +\d+', None)], maxsize=2)
+        for index in range(5):
+            dispatcher.candidates('Gi{} is up'.format(index))
+        self.assertLessEqual(len(dispatcher._candidates), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
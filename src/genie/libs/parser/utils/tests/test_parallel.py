@@ -0,0 +1,139 @@
+import os
+import re
+import unittest
+from unittest.mock import patch
+
+from genie.libs.parser.utils import parallel
+from genie.libs.parser.utils.parallel import split_blocks, merge_results, \
+                                             parse_blocks
+
+HEADER = re.compile(r'^(?P<interface>\S+) +is +(?P<status>\S+)$')
+
+OUTPUT = '''\
+show interfaces
+Gi1 is up
+  MTU 1500 bytes
+Gi2 is down
+  MTU 9000 bytes
+Gi3 is up
+  MTU 1500 bytes
+'''
+
+
+class Parser(object):
+    '''Minimal block parser, module level so it can be pickled'''
+
+    parallel_threshold = 0
+    parallel_workers = 2
+
+    def __init__(self, device=None):
+        self.device = device
+
+    def parse(self, out):
+        results = parse_blocks(self, out, '_parse', headers=[HEADER])
+        if results is not None:
+            return merge_results(results)
+        return self._parse(out)
+
+    def _parse(self, out):
+        ret_dict = {}
+        for line in out.splitlines():
+            line = line.strip()
+            m = HEADER.match(line)
+            if m:
+                intf_dict = ret_dict.setdefault(m.group('interface'), {})
+                intf_dict['status'] = m.group('status')
+                continue
+            m = re.match(r'^MTU +(?P<mtu>\d+)', line)
+            if m:
+                intf_dict['mtu'] = int(m.group('mtu'))
+        return ret_dict
+
+
+class TestSplitBlocks(unittest.TestCase):
+
+    def test_split(self):
+        chunks = split_blocks(OUTPUT, [HEADER], 3)
+        self.assertEqual(''.join(chunks), OUTPUT)
+        self.assertGreater(len(chunks), 1)
+        self.assertLessEqual(len(chunks), 3)
+        # every chunk after the first one starts with a block
+        for chunk in chunks[1:]:
+            self.assertTrue(HEADER.match(chunk.splitlines()[0]))
+
+    def test_single_chunk(self):
+        self.assertEqual(split_blocks(OUTPUT, [HEADER], 1), [OUTPUT])
+        self.assertEqual(split_blocks('', [HEADER], 4), [''])
+
+
+class TestMergeResults(unittest.TestCase):
+
+    def test_merge(self):
+        merged = merge_results([
+            {'Po1': {'members': ['Gi1']}, 'Gi1': {'port_channel': {'int': 'Po1'}}},
+            {'Gi1': {'port_channel': {'member': True}, 'mtu': 1500}}])
+        self.assertEqual(merged, {
+            'Po1': {'members': ['Gi1']},
+            'Gi1': {'port_channel': {'int': 'Po1', 'member': True},
+                    'mtu': 1500}})
+        self.assertEqual(list(merged), ['Po1', 'Gi1'])
+
+    def test_later_wins(self):
+        self.assertEqual(merge_results([{'a': 1}, {'a': 2}]), {'a': 2})
+
+
+class Serial(Parser):
+    '''A parser which does not ask for the parallel mode'''
+
+    parallel_workers = None
+
+
+class TestParseBlocks(unittest.TestCase):
+
+    def setUp(self):
+        patcher = patch.object(parallel.os, 'cpu_count', return_value=4)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        environ = patch.dict(os.environ)
+        environ.start()
+        self.addCleanup(environ.stop)
+        os.environ.pop(parallel.WORKERS_VARIABLE, None)
+
+    def test_serial_by_default(self):
+        self.assertIsNone(parse_blocks(Serial(), OUTPUT, '_parse', [HEADER]))
+
+    def test_environment(self):
+        os.environ[parallel.WORKERS_VARIABLE] = '2'
+        results = parse_blocks(Serial(), OUTPUT, '_parse', [HEADER])
+        self.assertGreater(len(results), 1)
+        os.environ[parallel.WORKERS_VARIABLE] = 'many'
+        self.assertIsNone(parse_blocks(Serial(), OUTPUT, '_parse', [HEADER]))
+
+    def test_workers_capped(self):
+        self.assertEqual(parallel._workers(Serial(), 64), 4)
+        with patch.object(parallel, 'MAX_WORKERS', 3):
+            self.assertEqual(parallel._workers(Serial(), 64), 3)
+        self.assertIsNone(parallel._workers(Serial(), None))
+
+    def test_serial(self):
+        parser = Parser()
+        self.assertIsNone(parse_blocks(parser, OUTPUT, '_parse', [HEADER],
+                                       threshold=len(OUTPUT) + 1))
+        self.assertIsNone(parse_blocks(parser, OUTPUT, '_parse', [HEADER],
+                                       workers=1))
+        parser.parallel_threshold = None
+        self.assertIsNone(parse_blocks(parser, OUTPUT, '_parse', [HEADER]))
+
+    def test_parallel(self):
+        parser = Parser()
+        results = parse_blocks(parser, OUTPUT, '_parse', [HEADER])
+        self.assertGreater(len(results), 1)
+        self.assertEqual(merge_results(results), parser._parse(OUTPUT))
+        self.assertEqual(parser.parse(OUTPUT), {
+            'Gi1': {'status': 'up', 'mtu': 1500},
+            'Gi2': {'status': 'down', 'mtu': 9000},
+            'Gi3': {'status': 'up', 'mtu': 1500}})
+
+
+if __name__ == '__main__':
+    unittest.main()
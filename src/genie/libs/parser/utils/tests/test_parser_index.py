@@ -0,0 +1,141 @@
+import os
+import json
+import shutil
+import marshal
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from genie.libs.parser.utils import common
+from genie.libs.parser.utils.parser_index import compact, make_parser_index, \
+                                                 load_parser_index, HEADER
+
+
+class TestParserIndex(unittest.TestCase):
+
+    data = {
+        'tokens': ['iosxe', 'c9300'],
+        'show version': {
+            'iosxe': {
+                'module_name': 'show_platform',
+                'package': 'genie.libs.parser',
+                'class': 'ShowVersion',
+                'doc': 'Parser for show version',
+                'schema': '{}',
+                'c9300': {
+                    'module_name': 'show_platform',
+                    'package': 'genie.libs.parser',
+                    'class': 'ShowVersion',
+                    'doc': 'Parser for show version',
+                },
+            },
+        },
+    }
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+        self.json_path = os.path.join(self.tmp, 'parsers.json')
+        with open(self.json_path, 'w') as f:
+            json.dump(self.data, f)
+
+    def test_compact(self):
+        self.assertEqual(compact(self.data), {
+            'tokens': ['iosxe', 'c9300'],
+            'show version': {
+                'iosxe': {
+                    'module_name': 'show_platform',
+                    'package': 'genie.libs.parser',
+                    'class': 'ShowVersion',
+                    'c9300': {
+                        'module_name': 'show_platform',
+                        'package': 'genie.libs.parser',
+                        'class': 'ShowVersion',
+                    },
+                },
+            },
+        })
+
+    def test_round_trip(self):
+        index_path = make_parser_index(self.json_path)
+        self.assertEqual(index_path, os.path.join(self.tmp, 'parsers.idx'))
+        self.assertEqual(load_parser_index(index_path, self.json_path),
+                         compact(self.data))
+
+    def test_missing(self):
+        self.assertIsNone(load_parser_index(
+            os.path.join(self.tmp, 'parsers.idx'), self.json_path))
+
+    def test_stale(self):
+        index_path = make_parser_index(self.json_path)
+        with open(self.json_path, 'w') as f:
+            json.dump({'show clock': {}}, f)
+        self.assertIsNone(load_parser_index(index_path, self.json_path))
+
+    def test_other_python(self):
+        index_path = make_parser_index(self.json_path)
+        with open(index_path, 'r+b') as f:
+            header = list(HEADER.unpack_from(f.read(HEADER.size)))
+            # built by another marshal version, then another python
+            for position, value in ((2, marshal.version + 1),
+                                    (4, header[4] + 1)):
+                changed = list(header)
+                changed[position] = value
+                f.seek(0)
+                f.write(HEADER.pack(*changed))
+                f.flush()
+                self.assertIsNone(load_parser_index(index_path,
+                                                    self.json_path))
+
+    def test_invalid(self):
+        index_path = os.path.join(self.tmp, 'parsers.idx')
+        with open(index_path, 'wb') as f:
+            f.write(b'not an index')
+        self.assertIsNone(load_parser_index(index_path, self.json_path))
+
+
+class TestParserData(unittest.TestCase):
+
+    def setUp(self):
+        # parser_data is loaded again by the loader of the test
+        loaded = common.__dict__.pop('parser_data', None)
+
+        def restore():
+            common.__dict__.pop('parser_data', None)
+            if loaded is not None:
+                common.parser_data = loaded
+        self.addCleanup(restore)
+
+        self.calls = []
+        for name in ('_load_parser_data', '_load_entry_points'):
+            patcher = patch.object(common, name)
+            self.addCleanup(patcher.stop)
+            setattr(self, name, patcher.start())
+
+    def test_lazy(self):
+        self._load_parser_data.return_value = {'show version': {'iosxe': {}}}
+        self._load_parser_data.assert_not_called()
+        # a plain dict, read as a dict by the C functions as well
+        self.assertIs(type(common.parser_data), dict)
+        self.assertEqual(json.dumps(common.parser_data),
+                         '{"show version": {"iosxe": {}}}')
+        self.assertEqual(common.get_parser_commands(
+            type('Device', (), {'os': 'iosxe'})), ['show version'])
+        self._load_parser_data.assert_called_once_with()
+        self._load_entry_points.assert_called_once_with()
+
+    def test_failed_load_retried(self):
+        self._load_parser_data.side_effect = [
+            FileNotFoundError('parsers.json'), {'show version': {'iosxe': {}}}]
+        with self.assertRaises(FileNotFoundError):
+            common.parser_data
+        self.assertIn('show version', common.parser_data)
+        self.assertEqual(self._load_parser_data.call_count, 2)
+
+    def test_unknown(self):
+        with self.assertRaises(AttributeError):
+            common.parser_datas
+
+
+if __name__ == '__main__':
+    unittest.main()
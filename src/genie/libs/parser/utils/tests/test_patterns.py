@@ -0,0 +1,89 @@
+import re
+import types
+import unittest
+
+from genie.libs.parser.utils.patterns import Patterns, NoMatch, \
+                                             compile_patterns
+
+
+class TestPatterns(unittest.TestCase):
+
+    def setUp(self):
+        self.patterns = Patterns(
+            p1=r'^Hardware +is +(?P<type>.+)$',
+            p2=(r'^mtu +(?P<mtu>\d+)$', re.I))
+
+    def test_match(self):
+        m = self.patterns.p1.match('Hardware is Loopback')
+        self.assertEqual(m.groupdict(), {'type': 'Loopback'})
+        m = self.patterns.p2.match('MTU 1500')
+        self.assertEqual(m.groupdict(), {'mtu': '1500'})
+
+    def test_compiled_once(self):
+        self.assertNotIn('p1', vars(self.patterns))
+        p1 = self.patterns.p1
+        self.assertIn('p1', vars(self.patterns))
+        self.assertIs(self.patterns.p1, p1)
+
+    def test_unknown(self):
+        with self.assertRaises(AttributeError):
+            self.patterns.p3
+
+    def test_invalid_name(self):
+        with self.assertRaises(ValueError):
+            Patterns(items=r'^items$')
+        with self.assertRaises(ValueError):
+            Patterns(_p1=r'^p1$')
+
+    def test_registry(self):
+        self.assertEqual(list(self.patterns), ['p1', 'p2'])
+        self.assertEqual(len(self.patterns), 2)
+        self.assertIn('p2', self.patterns)
+        self.assertEqual(self.patterns.source('p2'),
+                         (r'^mtu +(?P<mtu>\d+)$', re.I))
+        self.assertEqual([name for name, _ in self.patterns.items()],
+                         ['p1', 'p2'])
+
+    def test_for_line(self):
+        patterns = Patterns(
+            p1=r'^(?P<interface>\S+) +is +(?P<enabled>.+)$',
+            p2=r'^Hardware +is +(?P<type>.+)$',
+            p3=r'^MTU +(?P<mtu>\d+) +bytes',
+            p4=r'(?P<address>\d+\.\d+\.\d+\.\d+)')
+
+        p = patterns.for_line('MTU 1500 bytes')
+        self.assertIs(p.p1, patterns.p1)
+        self.assertIsInstance(p.p2, NoMatch)
+        self.assertIsNone(p.p2.match('MTU 1500 bytes'))
+        self.assertEqual(p.p2.findall('MTU 1500 bytes'), [])
+        self.assertEqual(p.p2.pattern, patterns.p2.pattern)
+        self.assertEqual(p.p3.match('MTU 1500 bytes').group('mtu'), '1500')
+        # not anchored, can be used with search() or findall()
+        self.assertIs(p.p4, patterns.p4)
+
+        # one view per first word
+        self.assertIs(patterns.for_line('MTU 9000 bytes'), p)
+        self.assertIs(patterns.for_line('Hardware is Loopback').p2,
+                      patterns.p2)
+
+    def test_compile_patterns(self):
+        class Parser(object):
+            patterns = self.patterns
+
+        class SubParser(Parser):
+            pass
+
+        module = types.ModuleType('parsers')
+        Parser.__module__ = SubParser.__module__ = module.__name__
+        module.Parser = Parser
+        module.SubParser = SubParser
+
+        # the registry inherited by SubParser is compiled once
+        self.assertEqual(compile_patterns(module), 1)
+        self.assertIn('p1', vars(self.patterns))
+        self.assertIn('p2', vars(self.patterns))
+        self.assertEqual(compile_patterns(object), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,214 @@
+import json
+import time
+import socket
+import threading
+import unittest
+import http.server
+
+from genie.libs.parser.bigip.get_net_wccp import NetWccp
+from genie.libs.parser.bigip.get_sys_version import SysVersion
+from genie.libs.parser.utils.rest_pool import collect, RestDevice, RestError
+
+
+# replies recorded from a BIG-IP, by path
+RESPONSES = {
+    '/mgmt/tm/sys/version': {
+        'kind': 'tm:sys:version:versionstats',
+        'selfLink': 'https://localhost/mgmt/tm/sys/version?ver=14.1.2.3',
+        'entries': {
+            'https://localhost/mgmt/tm/sys/version/0': {
+                'nestedStats': {'entries': {
+                    'Build': {'description': '0.0.5'},
+                    'Edition': {'description': 'Point Release 3'},
+                    'Product': {'description': 'BIG-IP'},
+                    'Title': {'description': 'Main Package'},
+                    'Version': {'description': '14.1.2.3'}}}}}},
+    '/mgmt/tm/net/wccp': {
+        'kind': 'tm:net:wccp:wccpcollectionstate',
+        'selfLink': 'https://localhost/mgmt/tm/net/wccp?ver=14.1.2.3',
+        'items': [{
+            'kind': 'tm:net:wccp:wccpstate',
+            'name': 'wccp1',
+            'fullPath': '/Common/wccp1',
+            'services': [{'name': '90', 'trafficAssign': 'hash'}]}]},
+    '/mgmt/tm/ltm/virtual': {
+        'kind': 'tm:ltm:virtual:virtualcollectionstate',
+        'items': [{'name': 'vs{}'.format(number),
+                   'destination': '/Common/10.1.1.{}:80'.format(number)}
+                  for number in range(20)]},
+}
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+    # the body follows the headers without a Nagle delay, as on a device
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.server.requests.append((self.path, self.client_address[1],
+                                     self.headers.get('Authorization')))
+        time.sleep(self.server.delay)
+        if self.path not in RESPONSES:
+            body = json.dumps({'code': 404, 'message': 'Object not found'})
+            self.send_response(404)
+        else:
+            body = json.dumps(RESPONSES[self.path])
+            self.send_response(200)
+        body = body.encode()
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestCollect(unittest.TestCase):
+
+    def setUp(self):
+        self.server = http.server.ThreadingHTTPServer(('127.0.0.1', 0),
+                                                      Handler)
+        self.server.requests = []
+        self.server.delay = 0
+        threading.Thread(target=self.server.serve_forever,
+                         daemon=True).start()
+        self.device = RestDevice(
+            'http://127.0.0.1:{}'.format(self.server.server_port),
+            username='admin', password='admin')
+
+    def tearDown(self):
+        self.device.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_parsers(self):
+        fetches = collect(self.device, [NetWccp, SysVersion])
+        self.assertEqual(list(fetches),
+                         ['/mgmt/tm/net/wccp', '/mgmt/tm/sys/version'])
+        for endpoint, fetch in fetches.items():
+            self.assertIsNone(fetch.error)
+            self.assertEqual(fetch.status_code, 200)
+            self.assertEqual(fetch.output, RESPONSES[endpoint])
+        self.assertIs(fetches['/mgmt/tm/net/wccp'].parser, NetWccp)
+
+    def test_endpoints(self):
+        fetches = collect(self.device, ['/mgmt/tm/ltm/virtual'])
+        self.assertEqual(fetches['/mgmt/tm/ltm/virtual'].output,
+                         RESPONSES['/mgmt/tm/ltm/virtual'])
+        self.assertIsNone(fetches['/mgmt/tm/ltm/virtual'].parser)
+
+    def test_latency(self):
+        self.server.delay = 0.05
+        fetches = collect(self.device, [NetWccp, '/mgmt/tm/ltm/virtual'])
+        for fetch in fetches.values():
+            self.assertGreaterEqual(fetch.latency, 0.05)
+            self.assertGreaterEqual(fetch.parse_time, 0)
+
+    def test_concurrent(self):
+        self.server.delay = 0.1
+        start = time.perf_counter()
+        collect(self.device, ['/mgmt/tm/ltm/virtual'] + [
+            '/mgmt/tm/ltm/virtual?ver={}'.format(number)
+            for number in range(7)], workers=8)
+        # eight 100ms requests sent one after the other take 800ms
+        self.assertLess(time.perf_counter() - start, 0.5)
+
+    def test_keep_alive(self):
+        RESPONSES.update({'/mgmt/tm/ltm/pool/{}'.format(number): {}
+                          for number in range(30)})
+        try:
+            collect(self.device, ['/mgmt/tm/ltm/pool/{}'.format(number)
+                                  for number in range(30)], workers=4)
+        finally:
+            for number in range(30):
+                del RESPONSES['/mgmt/tm/ltm/pool/{}'.format(number)]
+        self.assertEqual(len(self.server.requests), 30)
+        # one connection per worker, reused by its requests
+        self.assertLessEqual(
+            len({port for _, port, _ in self.server.requests}), 4)
+        self.assertEqual({auth for _, _, auth in self.server.requests},
+                         {'Basic YWRtaW46YWRtaW4='})
+
+    def test_errors(self):
+        fetches = collect(self.device, ['/mgmt/tm/ltm/missing', SysVersion])
+        fetch = fetches['/mgmt/tm/ltm/missing']
+        self.assertIsInstance(fetch.error, RestError)
+        self.assertEqual(fetch.status_code, 404)
+        self.assertIsNone(fetch.output)
+        self.assertIsNotNone(fetch.latency)
+        self.assertEqual(fetches['/mgmt/tm/sys/version'].output,
+                         RESPONSES['/mgmt/tm/sys/version'])
+
+    def test_empty(self):
+        RESPONSES['/mgmt/tm/net/wccp'], wccp = {}, RESPONSES[
+            '/mgmt/tm/net/wccp']
+        try:
+            fetches = collect(self.device, [NetWccp])
+        finally:
+            RESPONSES['/mgmt/tm/net/wccp'] = wccp
+        self.assertEqual(fetches['/mgmt/tm/net/wccp'].output, {})
+        self.assertIsNone(fetches['/mgmt/tm/net/wccp'].error)
+
+    def test_no_targets(self):
+        self.assertEqual(collect(self.device, []), {})
+
+
+class TestRestDevice(unittest.TestCase):
+
+    def setUp(self):
+        self.server = http.server.ThreadingHTTPServer(('127.0.0.1', 0),
+                                                      Handler)
+        self.server.requests = []
+        self.server.delay = 0
+        threading.Thread(target=self.server.serve_forever,
+                         daemon=True).start()
+        self.url = 'http://127.0.0.1:{}'.format(self.server.server_port)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_get(self):
+        with RestDevice(self.url) as device:
+            response = device.get('/mgmt/tm/sys/version')
+        self.assertTrue(response.ok)
+        self.assertEqual(response.json(), RESPONSES['/mgmt/tm/sys/version'])
+        self.assertEqual(json.loads(response.text),
+                         RESPONSES['/mgmt/tm/sys/version'])
+        self.assertIsNone(self.server.requests[0][2])
+
+    def test_error(self):
+        with RestDevice(self.url) as device:
+            with self.assertRaises(RestError) as error:
+                device.get('/mgmt/tm/ltm/missing')
+            self.assertEqual(error.exception.response.status_code, 404)
+            self.assertEqual(device.get(
+                '/mgmt/tm/ltm/missing',
+                expected_status_codes=(200, 404)).status_code, 404)
+
+    def test_reconnect(self):
+        # a kept alive connection closed by the device is opened again
+        with RestDevice(self.url) as device:
+            device.get('/mgmt/tm/sys/version')
+            device._local.connection.sock.shutdown(socket.SHUT_RDWR)
+            device.get('/mgmt/tm/sys/version')
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_timeout(self):
+        # a connection left waiting for a reply is not reused
+        self.server.delay = 0.5
+        with RestDevice(self.url, timeout=0.1) as device:
+            with self.assertRaises(socket.timeout):
+                device.get('/mgmt/tm/sys/version')
+            self.assertIsNone(device._local.connection)
+            self.assertEqual(device._connections, [])
+            self.server.delay = 0
+            response = device.get('/mgmt/tm/sys/version')
+        self.assertEqual(response.json(), RESPONSES['/mgmt/tm/sys/version'])
+        self.assertEqual(len(self.server.requests), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+import io
+import unittest
+
+from genie.libs.parser.utils.stream import iter_lines
+
+
+class TestIterLines(unittest.TestCase):
+
+    output = 'Syslog logging: enabled\r\n\n    Console logging: disabled\n'
+
+    def test_string(self):
+        self.assertEqual(list(iter_lines(self.output)),
+                         self.output.splitlines())
+
+    def test_file(self):
+        lines = iter_lines(io.StringIO(self.output, newline=''))
+        self.assertNotIsInstance(lines, list)
+        self.assertEqual(list(lines), self.output.splitlines())
+
+    def test_iterable(self):
+        self.assertEqual(list(iter_lines(['a', '', 'b\n', b'c\n'])),
+                         ['a', '', 'b', 'c'])
+
+    def test_lazy(self):
+        def lines():
+            yield 'a'
+            raise AssertionError('read past the first line')
+        self.assertEqual(next(iter_lines(lines())), 'a')
+
+
+if __name__ == '__main__':
+    unittest.main()
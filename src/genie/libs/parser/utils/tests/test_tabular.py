@@ -0,0 +1,157 @@
+import unittest
+from textwrap import dedent
+
+from genie.libs.parser.utils.tabular import Tabular, find_header, split_row, \
+    row_regex
+
+
+class TestTabular(unittest.TestCase):
+
+    output = dedent('''\
+        R1#show ip interface brief
+        Interface              IP-Address      OK? Method Status                Protocol
+        GigabitEthernet0/0     10.1.10.20      YES NVRAM  up                    up
+        GigabitEthernet1/0/1   unassigned      YES unset  administratively down down
+        Port-channel10.1000000 192.168.100.100 YES manual up                    up
+
+        R1#
+        ''')
+
+    header_fields = ['Interface', 'IP-Address', r'OK\?', 'Method', 'Status',
+                     'Protocol']
+    label_fields = ['interface', 'ip_address', 'interface_is_ok', 'method',
+                    'status', 'protocol']
+
+    def test_entries(self):
+        res = Tabular(device_output=self.output,
+                      header_fields=self.header_fields,
+                      label_fields=self.label_fields,
+                      index=[0],
+                      table_terminal_pattern=r'^\n')
+        self.assertEqual(list(res.entries), ['GigabitEthernet0/0',
+                                             'GigabitEthernet1/0/1',
+                                             'Port-channel10.1000000'])
+        self.assertEqual(res.entries['GigabitEthernet0/0'],
+                         {'interface': 'GigabitEthernet0/0',
+                          'ip_address': '10.1.10.20',
+                          'interface_is_ok': 'YES',
+                          'method': 'NVRAM',
+                          'status': 'up',
+                          'protocol': 'up'})
+        self.assertEqual(
+            res.entries['GigabitEthernet1/0/1']['status'],
+            'administratively down')
+
+    def test_overflow(self):
+        # the interface name runs into the IP-Address column
+        res = Tabular(device_output=self.output,
+                      header_fields=self.header_fields,
+                      label_fields=self.label_fields)
+        entry = res.entries['Port-channel10.1000000']
+        self.assertEqual(entry['ip_address'], '192.168.100.100')
+        self.assertEqual(entry['method'], 'manual')
+
+    def test_default_labels(self):
+        res = Tabular(device_output=self.output,
+                      header_fields=self.header_fields)
+        self.assertEqual(res.entries['GigabitEthernet0/0'][r'OK\?'], 'YES')
+
+    def test_terminal_pattern(self):
+        output = dedent('''\
+            App id                                   State
+            ---------------------------------------------------------
+            utd                                      RUNNING
+            iox                                      STOPPED
+            Total: 2
+            ''')
+        res = Tabular(device_output=output, header_fields=['App id', 'State'],
+                      table_terminal_pattern=r'^Total')
+        self.assertEqual(res.entries, {
+            'utd': {'App id': 'utd', 'State': 'RUNNING'},
+            'iox': {'App id': 'iox', 'State': 'STOPPED'}})
+
+    def test_nested_index(self):
+        output = dedent('''\
+            Interface    User               Mode         Idle     Peer Address
+            unknown      NETCONF(ONEP)      com.cisco.ne 00:00:49
+            unknown      a(ONEP)            com.cisco.sy 00:00:49
+            ''')
+        res = Tabular(device_output=output,
+                      header_fields=['Interface', 'User', 'Mode', 'Idle',
+                                     'Peer Address'],
+                      index=[0, 1])
+        self.assertEqual(list(res.entries), ['unknown'])
+        self.assertEqual(list(res.entries['unknown']),
+                         ['NETCONF(ONEP)', 'a(ONEP)'])
+        self.assertEqual(res.entries['unknown']['a(ONEP)']['Mode'],
+                         'com.cisco.sy')
+        self.assertEqual(res.entries['unknown']['a(ONEP)']['Peer Address'],
+                         '')
+
+    def test_right_justified(self):
+        output = dedent('''\
+            Switch Ports Model              SW Version        SW Image              Mode
+            ------ ----- -----              ----------        ----------            ----
+                 1 52    WS-C3650-48PD      03.06.07E         cat3k_caa-universalk9 INSTALL
+            *    2 52    WS-C3650-48PD      03.06.07E         cat3k_caa-universalk9 INSTALL
+            ''')
+        res = Tabular(device_output=output,
+                      header_fields=['Switch', 'Ports', 'Model             ',
+                                     'SW Version       ',
+                                     'SW Image              ', 'Mode'],
+                      label_fields=['switch_num', 'ports', 'model', 'sw_ver',
+                                    'sw_image', 'mode'],
+                      right_justified=True)
+        self.assertEqual(list(res.entries), ['1', '*    2'])
+        self.assertEqual(res.entries['*    2'],
+                         {'switch_num': '*    2',
+                          'ports': '52',
+                          'model': 'WS-C3650-48PD',
+                          'sw_ver': '03.06.07E',
+                          'sw_image': 'cat3k_caa-universalk9',
+                          'mode': 'INSTALL'})
+
+    def test_no_header(self):
+        res = Tabular(device_output='% Invalid input detected\n',
+                      header_fields=self.header_fields)
+        self.assertEqual(res.entries, {})
+        self.assertIsNone(res.offsets)
+
+    def test_label_mismatch(self):
+        with self.assertRaises(ValueError):
+            Tabular(device_output=self.output,
+                    header_fields=self.header_fields,
+                    label_fields=['interface'])
+
+
+class TestHelpers(unittest.TestCase):
+
+    def test_find_header(self):
+        lines = ['Interface  Status', 'Gi1        up']
+        self.assertEqual(find_header(lines, ['Interface', 'Status']),
+                         (0, [(0, 9), (11, 17)]))
+        # the headers have to be in order
+        self.assertIsNone(find_header(lines, ['Status', 'Interface']))
+
+    def test_split_row(self):
+        offsets = [(0, 9), (11, 17)]
+        self.assertEqual(split_row('Gi1        up', offsets), ['Gi1', 'up'])
+        self.assertEqual(split_row('Gi1', offsets), ['Gi1', ''])
+        self.assertEqual(split_row('GigabitEthernet1 up', offsets),
+                         ['GigabitEthernet1', 'up'])
+
+    def test_row_regex(self):
+        offsets = [(0, 9), (11, 17)]
+        row = row_regex(offsets)
+        self.assertEqual(row.match('Gi1        up').groups(),
+                         ('Gi1        ', 'up'))
+        # overflowing and short rows are left to split_row
+        self.assertIsNone(row.match('GigabitEthernet1 up'))
+        self.assertIsNone(row.match('Gi1'))
+        row = row_regex(offsets, right_justified=True)
+        self.assertEqual(row.match('      Gi1   up').groups(),
+                         ('      Gi1', '   up'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,181 @@
+import os
+import runpy
+import unittest
+from unittest.mock import Mock
+
+from pyats.utils.exceptions import (SchemaError, SchemaTypeError,
+                                    SchemaMissingKeyError,
+                                    SchemaUnsupportedKeyError)
+from genie.metaparser import MetaParser
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+from genie.metaparser.util.schemaengine import Any, Optional, Or, And, Use
+
+from genie.libs.parser.iosxe import tests as iosxe_tests
+from genie.libs.parser.iosxe.show_ntp import ShowNtpAssociationsSchema
+from genie.libs.parser.utils import validator
+from genie.libs.parser.utils.validator import compile_schema, \
+    compiled_validator, validate_result, set_validation, get_validation, \
+    parse_with_validator, FULL, SAMPLE, NONE
+
+
+def is_list(value):
+    if not isinstance(value, list):
+        raise SchemaError('not a list')
+    return value
+
+
+class ShowRoutesSchema(MetaParser):
+    schema = {
+        'vrf': {
+            Any(): {
+                Optional('table_id'): Or(int, str),
+                'routes': {
+                    Any(): {
+                        'active': bool,
+                        Optional('next_hops'): list,
+                    },
+                },
+            },
+        },
+        Optional('tags'): Use(is_list),
+    }
+
+
+class ShowRoutes(ShowRoutesSchema):
+
+    def cli(self, output=None):
+        result = {}
+        for line in output.splitlines():
+            vrf, prefix = line.split()
+            result.setdefault('vrf', {}).setdefault(vrf, {}).setdefault(
+                'routes', {})[prefix] = {'active': True}
+        return result
+
+
+class TestCompileSchema(unittest.TestCase):
+
+    def setUp(self):
+        self.validate = compile_schema(ShowRoutesSchema.schema)
+
+    def test_valid(self):
+        self.validate({'vrf': {'default': {
+            'table_id': 1,
+            'routes': {'10.0.0.0/8': {'active': True,
+                                      'next_hops': ['10.1.1.1']}}}}})
+        self.validate({'vrf': {'blue': {'table_id': '0x1', 'routes': {}}},
+                       'tags': ['a']})
+
+    def test_missing_key(self):
+        with self.assertRaisesRegex(SchemaMissingKeyError,
+                                    r'vrf\.default: missing'):
+            self.validate({'vrf': {'default': {}}})
+
+    def test_unsupported_key(self):
+        with self.assertRaisesRegex(SchemaUnsupportedKeyError,
+                                    "unsupported key 'vrfs'"):
+            self.validate({'vrf': {}, 'vrfs': {}})
+
+    def test_type(self):
+        with self.assertRaisesRegex(
+                SchemaTypeError,
+                r'vrf\.default\.routes\.10\.0\.0\.0/8\.active'):
+            self.validate({'vrf': {'default': {'routes': {
+                '10.0.0.0/8': {'active': 'yes'}}}}})
+        with self.assertRaises(SchemaTypeError):
+            self.validate({'vrf': {'default': {'table_id': 1.5,
+                                               'routes': {}}}})
+        with self.assertRaises(SchemaTypeError):
+            self.validate({'vrf': []})
+
+    def test_use(self):
+        with self.assertRaisesRegex(SchemaError, 'not a list'):
+            self.validate({'vrf': {}, 'tags': 'a'})
+
+    def test_keys_and_lists(self):
+        validate = compile_schema({int: {'state': Or('up', 'down')},
+                                   Optional('items'): [{'id': int}, str]})
+        validate({1: {'state': 'up'}, 'items': [{'id': 1}, 'x']})
+        with self.assertRaises(SchemaUnsupportedKeyError):
+            validate({'1': {'state': 'up'}})
+        with self.assertRaises(SchemaError):
+            validate({1: {'state': 'admin down'}})
+        with self.assertRaises(SchemaTypeError):
+            validate({'items': 'x'})
+        with self.assertRaises(SchemaError):
+            validate({'items': [{'id': '1'}]})
+
+    def test_in_tree_schema(self):
+        # no in-tree schema uses And, the Or schema of show ntp associations
+        # is nested in one
+        validate = compile_schema(And(dict, ShowNtpAssociationsSchema.schema))
+        expected = runpy.run_path(os.path.join(
+            os.path.dirname(iosxe_tests.__file__), 'ShowNtpAssociations',
+            'cli', 'equal', 'golden_output_1_expected.py'))['expected_output']
+        validate(expected)
+        peer = next(iter(expected['peer'].values()))
+        mode = next(iter(peer['local_mode'].values()))
+        for receive_time in ('-', 16):
+            mode['receive_time'] = receive_time
+            validate(expected)
+        mode['receive_time'] = 1.5
+        with self.assertRaisesRegex(SchemaError, 'receive_time'):
+            validate(expected)
+        with self.assertRaises(SchemaError):
+            validate([])
+
+
+class TestValidateResult(unittest.TestCase):
+
+    result = {'vrf': {'default': {'routes': {}}}}
+    invalid = {'vrf': {'default': {}}}
+
+    def tearDown(self):
+        set_validation(FULL)
+
+    def test_cached_on_class(self):
+        validate = compiled_validator(ShowRoutes)
+        self.assertIs(compiled_validator(ShowRoutes), validate)
+        self.assertIn('_compiled_schema', ShowRoutes.__dict__)
+
+    def test_subclass_schema(self):
+        class ShowMoreRoutes(ShowRoutes):
+            schema = {'routes': list}
+        self.assertIsNot(compiled_validator(ShowMoreRoutes),
+                         compiled_validator(ShowRoutes))
+        validate_result(ShowMoreRoutes, {'routes': []})
+
+    def test_full(self):
+        self.assertTrue(validate_result(ShowRoutes, self.result))
+        with self.assertRaises(SchemaError):
+            validate_result(ShowRoutes, self.invalid)
+
+    def test_sample(self):
+        set_validation(SAMPLE, every=3)
+        self.assertEqual(get_validation(), (SAMPLE, 3))
+        validator._compiled(ShowRoutes).count = 0
+        self.assertEqual([validate_result(ShowRoutes, self.result)
+                          for _ in range(6)],
+                         [True, False, False, True, False, False])
+        with self.assertRaises(SchemaError):
+            validate_result(ShowRoutes, self.invalid)
+        self.assertFalse(validate_result(ShowRoutes, self.invalid))
+
+    def test_none(self):
+        self.assertFalse(validate_result(ShowRoutes, self.invalid,
+                                         validation=NONE))
+
+    def test_mode(self):
+        with self.assertRaises(ValueError):
+            set_validation('some')
+
+    def test_parse_with_validator(self):
+        self.assertEqual(
+            parse_with_validator(ShowRoutes, Mock(), 'default 10.0.0.0/8'),
+            {'vrf': {'default': {'routes': {'10.0.0.0/8': {
+                'active': True}}}}})
+        with self.assertRaises(SchemaEmptyParserError):
+            parse_with_validator(ShowRoutes, Mock(), '')
+
+
+if __name__ == '__main__':
+    unittest.main()
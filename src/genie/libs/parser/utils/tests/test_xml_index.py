@@ -0,0 +1,123 @@
+import gc
+import weakref
+import unittest
+import warnings
+from xml.etree import ElementTree as ET
+
+from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.xml_index import XmlIndex
+
+
+OUTPUT = '''<?xml version="1.0" encoding="ISO-8859-1"?>
+<nf:rpc-reply xmlns="http://www.cisco.com/nxos:7.0.3.I7.1.:bgp" xmlns:nf="urn:ietf:params:xml:ns:netconf:base:1.0">
+ <nf:data>
+  <show>
+   <bgp>
+    <sessions>
+     <vrf>
+      <__XML__PARAM__vrf-name>
+       <__XML__value>VRF1</__XML__value>
+      </__XML__PARAM__vrf-name>
+     </vrf>
+     <__readonly__>
+      <totalpeers>2</totalpeers>
+      <TABLE_vrf>
+       <ROW_vrf>
+        <vrf-name-out>VRF1</vrf-name-out>
+        <TABLE_neighbor>
+         <ROW_neighbor>
+          <neighbor-id>10.106.102.3</neighbor-id>
+         </ROW_neighbor>
+         <ROW_neighbor>
+          <neighbor-id>10.106.102.4</neighbor-id>
+         </ROW_neighbor>
+        </TABLE_neighbor>
+       </ROW_vrf>
+      </TABLE_vrf>
+     </__readonly__>
+    </sessions>
+   </bgp>
+  </show>
+ </nf:data>
+</nf:rpc-reply>
+]]>]]>'''
+
+NAMESPACE = '{http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}'
+
+
+class TestXmlIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = XmlIndex(OUTPUT)
+
+    def test_lookups(self):
+        index = self.index
+        self.assertEqual(index.text('totalpeers'), '2')
+        self.assertEqual([elem.text for elem in index.findall('neighbor-id')],
+                         ['10.106.102.3', '10.106.102.4'])
+        self.assertEqual(index.find('ROW_vrf').tag, NAMESPACE + 'ROW_vrf')
+        self.assertIn('TABLE_neighbor', index)
+        self.assertNotIn('rpc-reply', index)
+        self.assertIn('__XML__value', set(index))
+        self.assertIsNone(index.find('ROW_afi'))
+        self.assertEqual(index.findall('ROW_afi'), ())
+        self.assertEqual(index.text('ROW_afi', 'none'), 'none')
+
+    def test_namespace(self):
+        self.assertEqual(self.index.namespace, NAMESPACE)
+        self.assertEqual(XmlIndex('<data><a/></data>').namespace, '')
+
+    def test_local_name(self):
+        self.assertEqual(self.index.local_name(self.index.find('ROW_vrf')),
+                         'ROW_vrf')
+
+    def test_of(self):
+        root = ET.fromstring(OUTPUT.split(']]>]]>')[0])
+        self.assertIs(XmlIndex.of(root), XmlIndex.of(root))
+        self.assertIsNot(XmlIndex.of(root),
+                         XmlIndex.of(XmlIndex.of(root).find('ROW_vrf')))
+
+    def test_of_released(self):
+        root = ET.fromstring(OUTPUT.split(']]>]]>')[0])
+        index = weakref.ref(XmlIndex.of(root))
+        del root
+        gc.collect()
+        self.assertIsNone(index())
+
+    def test_command(self):
+        self.assertEqual(self.index.command, 'show bgp sessions vrf VRF1')
+        self.index.compare_command('show bgp sessions vrf VRF1')
+        with self.assertRaisesRegex(AssertionError, 'XML Tags cli: '
+                                    'show bgp sessions vrf VRF1'):
+            self.index.compare_command('show bgp sessions')
+
+    def test_no_readonly(self):
+        index = XmlIndex('''<nf:rpc-reply xmlns:nf="urn:ietf:params:xml:ns:netconf:base:1.0">
+         <nf:data><show><bgp><sessions>
+          <TABLE_vrf><ROW_vrf><vrf-name-out>default</vrf-name-out></ROW_vrf></TABLE_vrf>
+         </sessions></bgp></show></nf:data></nf:rpc-reply>''')
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            self.assertEqual(index.command, 'show bgp sessions')
+        self.assertIn('__readonly__', str(caught[0].message))
+
+
+class TestCommonXml(unittest.TestCase):
+
+    def test_retrieve_xml_child(self):
+        root = ET.fromstring(OUTPUT.split(']]>]]>')[0])
+        self.assertEqual(Common.retrieve_xml_child(root, 'vrf-name-out').text,
+                         'VRF1')
+        self.assertIsNone(Common.retrieve_xml_child(root, 'rpc-reply'))
+
+    def test_compose_compare_command(self):
+        root = ET.fromstring(OUTPUT.split(']]>]]>')[0])
+        Common.compose_compare_command(root, NAMESPACE,
+                                       'show bgp sessions vrf VRF1')
+        with self.assertRaises(AssertionError):
+            Common.compose_compare_command(root, NAMESPACE,
+                                           'show bgp sessions')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,169 @@
+import io
+import gc
+import weakref
+import unittest
+import warnings
+
+from genie.libs.parser.utils import xml_stream
+from genie.libs.parser.utils.xml_stream import iter_rows, Row
+
+
+OUTPUT = '''<?xml version="1.0" encoding="ISO-8859-1"?>
+<nf:rpc-reply xmlns="http://www.cisco.com/nxos:7.0.3.I7.1.:bgp" xmlns:nf="urn:ietf:params:xml:ns:netconf:base:1.0">
+ <nf:data>
+  <show>
+   <bgp>
+    <sessions>
+     <vrf>
+      <__XML__PARAM__vrf-name>
+       <__XML__value>all</__XML__value>
+      </__XML__PARAM__vrf-name>
+     </vrf>
+     <__readonly__>
+      <totalpeers>3</totalpeers>
+      <TABLE_vrf>
+       <ROW_vrf>
+        <vrf-name-out>default</vrf-name-out>
+        <local-as>333</local-as>
+        <TABLE_neighbor>
+         <ROW_neighbor>
+          <neighbor-id>10.106.102.3</neighbor-id>
+          <remoteas>333</remoteas>
+          <lastflap>PT1H4M41S</lastflap>
+         </ROW_neighbor>
+         <ROW_neighbor>
+          <neighbor-id>10.106.102.4</neighbor-id>
+          <remoteas>n/a</remoteas>
+         </ROW_neighbor>
+        </TABLE_neighbor>
+        <vrfpeers>2</vrfpeers>
+       </ROW_vrf>
+       <ROW_vrf>
+        <vrf-name-out>VRF1</vrf-name-out>
+        <local-as>100</local-as>
+       </ROW_vrf>
+      </TABLE_vrf>
+     </__readonly__>
+    </sessions>
+   </bgp>
+  </show>
+ </nf:data>
+</nf:rpc-reply>
+]]>]]>'''
+
+ROWS = {
+    'sessions': Row('', {'totalpeers': ('total_peers', int)}),
+    'vrf': Row('TABLE_vrf/ROW_vrf', {
+        'vrf-name-out': 'vrf',
+        'local-as': ('local_as', int),
+        'vrfpeers': ('vrf_peers', int)}),
+    'neighbor': Row('TABLE_vrf/ROW_vrf/TABLE_neighbor/ROW_neighbor', {
+        'neighbor-id': 'neighbor',
+        'remoteas': ('remote_as', int)}),
+}
+
+
+class TestIterRows(unittest.TestCase):
+
+    def test_rows(self):
+        rows = [(name, values, tuple(dict(parent) for parent in parents))
+                for name, values, parents in iter_rows(OUTPUT, ROWS)]
+        self.assertEqual(rows, [
+            ('neighbor', {'neighbor': '10.106.102.3', 'remote_as': 333},
+             ({'total_peers': 3}, {'vrf': 'default', 'local_as': 333})),
+            ('neighbor', {'neighbor': '10.106.102.4'},
+             ({'total_peers': 3}, {'vrf': 'default', 'local_as': 333})),
+            ('vrf', {'vrf': 'default', 'local_as': 333, 'vrf_peers': 2},
+             ({'total_peers': 3},)),
+            ('vrf', {'vrf': 'VRF1', 'local_as': 100}, ({'total_peers': 3},)),
+            ('sessions', {'total_peers': 3}, ()),
+        ])
+
+    def test_parents_are_live(self):
+        for name, values, parents in iter_rows(OUTPUT, ROWS):
+            if name == 'vrf' and values['vrf'] == 'default':
+                vrf = values
+            elif name == 'neighbor':
+                neighbor_parent = parents[-1]
+        self.assertIs(neighbor_parent, vrf)
+
+    def test_path_only(self):
+        rows = list(iter_rows(OUTPUT, {'vrf': 'TABLE_vrf/ROW_vrf'}))
+        self.assertEqual([values for _, values, _ in rows], [
+            {'vrf-name-out': 'default', 'local-as': '333', 'vrfpeers': '2'},
+            {'vrf-name-out': 'VRF1', 'local-as': '100'}])
+
+    def test_command(self):
+        self.assertEqual(
+            len(list(iter_rows(OUTPUT, ROWS,
+                               command='show bgp sessions vrf all'))), 5)
+        with self.assertRaisesRegex(AssertionError, 'XML Tags cli: '
+                                    'show bgp sessions vrf all'):
+            list(iter_rows(OUTPUT, ROWS, command='show bgp sessions'))
+
+    def test_no_readonly(self):
+        output = '''<nf:rpc-reply xmlns:nf="urn:ietf:params:xml:ns:netconf:base:1.0">
+         <nf:data><show><bgp><sessions>
+          <TABLE_vrf><ROW_vrf><vrf-name-out>default</vrf-name-out></ROW_vrf></TABLE_vrf>
+         </sessions></bgp></show></nf:data></nf:rpc-reply>'''
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            rows = list(iter_rows(output, ROWS, command='show bgp sessions'))
+        self.assertIn('__readonly__', str(caught[0].message))
+        self.assertEqual(rows, [('vrf', {'vrf': 'default'}, ({},)),
+                                ('sessions', {}, ())])
+
+    def test_empty(self):
+        output = '''<nf:rpc-reply xmlns:nf="urn:ietf:params:xml:ns:netconf:base:1.0">
+         <nf:data><show><bgp><sessions/></bgp></show></nf:data></nf:rpc-reply>'''
+        self.assertEqual(list(iter_rows(output, ROWS,
+                                        command='show bgp sessions')), [])
+        with self.assertRaises(AssertionError):
+            list(iter_rows(output, ROWS, command='show bgp'))
+
+    def test_file(self):
+        self.assertEqual(list(iter_rows(io.StringIO(OUTPUT.split(
+                                         xml_stream.JUNK)[0]), ROWS)),
+                         list(iter_rows(OUTPUT, ROWS)))
+
+    def test_chunks(self):
+        chunk = xml_stream.CHUNK
+        xml_stream.CHUNK = 7
+        try:
+            rows = list(iter_rows(OUTPUT, ROWS))
+        finally:
+            xml_stream.CHUNK = chunk
+        self.assertEqual(rows, list(iter_rows(OUTPUT, ROWS)))
+
+    def test_elements_freed(self):
+        neighbor = OUTPUT[OUTPUT.index('<ROW_neighbor>'):
+                          OUTPUT.index('<ROW_neighbor>', OUTPUT.index(
+                              '</ROW_neighbor>'))]
+        output = OUTPUT.replace(neighbor, neighbor * 100)
+        refs = []
+        parser = xml_stream.ET.XMLPullParser
+
+        class Tracking(parser):
+            def read_events(self):
+                for event, elem in parser.read_events(self):
+                    if event == 'start' and elem.tag.endswith('ROW_neighbor'):
+                        refs.append(weakref.ref(elem))
+                    yield event, elem
+
+        xml_stream.ET.XMLPullParser = Tracking
+        try:
+            for name, _, _ in iter_rows(output, ROWS):
+                if name == 'vrf':
+                    # still parsing, the neighbor rows read are freed but
+                    # the last one the tree builder may keep
+                    gc.collect()
+                    live = sum(ref() is not None for ref in refs)
+                    break
+        finally:
+            xml_stream.ET.XMLPullParser = parser
+        self.assertEqual(len(refs), 101)
+        self.assertLessEqual(live, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
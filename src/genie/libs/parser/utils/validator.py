@@ -0,0 +1,349 @@
+'''Compiled schema validators
+
+The schema of a parser is a nested dict of literal keys, Optional, Any, Or,
+And and Use markers, types and lists. Walking it generically on every parse
+interprets each marker again for each value of the result. compile_schema()
+turns it once into nested closures specialized for it: the literal keys of
+each dict are looked up in a dict, the required ones are checked with a set
+difference, and only the Any() and type keys are tried in order.
+
+The validator of a parser class is compiled on first use and cached on the
+class:
+
+    >>> validate_result(ShowVersion, parsed)
+
+Trusted production polling can validate a sample of the results only, the
+first result of each parser class then one in every:
+
+    >>> set_validation(SAMPLE, every=100)
+
+parse_with_validator() parses an output through the cli() of a parser and
+validates the result with the compiled validator, as MetaParser.parse() does
+with the generic one. The bulk parser uses it with --validation.
+'''
+
+# python
+import reprlib
+import threading
+
+# Metaparser
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+from genie.metaparser.util.schemaengine import Any, Optional, Or, And, Use
+
+# pyATS
+from pyats.utils.exceptions import (SchemaError, SchemaTypeError,
+                                    SchemaMissingKeyError,
+                                    SchemaUnsupportedKeyError)
+
+# validation modes
+FULL = 'full'
+SAMPLE = 'sample'
+NONE = 'none'
+MODES = (FULL, SAMPLE, NONE)
+
+_settings = {'mode': FULL, 'every': 100}
+_lock = threading.Lock()
+
+
+def _path(path):
+    return '.'.join(str(key) for key in path) or '<top>'
+
+
+class _Message(object):
+    # message of the compiled validator, pyats formats its own from the
+    # arguments the generic engine gives its exceptions
+    def __init__(self, message):
+        Exception.__init__(self, message)
+
+    def __str__(self):
+        return self.args[0]
+
+
+class _Error(_Message, SchemaError):
+    pass
+
+
+class _TypeError(_Message, SchemaTypeError):
+    pass
+
+
+class _MissingKeyError(_Message, SchemaMissingKeyError):
+    pass
+
+
+class _UnsupportedKeyError(_Message, SchemaUnsupportedKeyError):
+    pass
+
+
+def _fail(path, message, data, error=_Error):
+    raise error('{}: {}, got {}'.format(_path(path), message,
+                                        reprlib.repr(data)))
+
+
+def _compile_type(schema):
+    def validate(data, path):
+        if not isinstance(data, schema):
+            _fail(path, 'expected {}'.format(schema.__name__), data,
+                  _TypeError)
+    return validate
+
+
+def _compile_literal(schema):
+    def validate(data, path):
+        if data != schema:
+            _fail(path, 'expected {!r}'.format(schema), data)
+    return validate
+
+
+def _compile_or(schemas):
+    validators = [_compile(schema) for schema in schemas]
+    # all types, a single isinstance
+    if all(isinstance(schema, type) for schema in schemas):
+        types = tuple(schemas)
+
+        def validate(data, path):
+            if not isinstance(data, types):
+                _fail(path, 'expected one of {}'.format(
+                    ', '.join(t.__name__ for t in types)), data, _TypeError)
+        return validate
+
+    def validate(data, path):
+        errors = []
+        for validator in validators:
+            try:
+                validator(data, path)
+                return
+            except SchemaError as e:
+                errors.append(str(e))
+        _fail(path, 'no alternative matches ({})'.format('; '.join(errors)),
+              data)
+    return validate
+
+
+def _compile_and(schemas):
+    validators = [_compile(schema) for schema in schemas]
+
+    def validate(data, path):
+        for validator in validators:
+            validator(data, path)
+    return validate
+
+
+def _compile_callable(function):
+    def validate(data, path):
+        try:
+            valid = function(data)
+        except SchemaError:
+            raise
+        except Exception as e:
+            _fail(path, '{} failed: {}'.format(
+                getattr(function, '__name__', function), e), data)
+        if not valid:
+            _fail(path, '{} is false'.format(
+                getattr(function, '__name__', function)), data)
+    return validate
+
+
+def _compile_list(schema):
+    item = _compile_or(schema) if len(schema) > 1 else \
+        _compile(schema[0]) if schema else None
+    container = type(schema)
+
+    def validate(data, path):
+        if not isinstance(data, container):
+            _fail(path, 'expected a {}'.format(container.__name__), data,
+                  _TypeError)
+        if item is not None:
+            for index, value in enumerate(data):
+                item(value, path + (index,))
+    return validate
+
+
+def _key_matcher(key):
+    # function telling whether a data key matches a non literal schema key
+    if isinstance(key, Any):
+        return lambda data: True
+    if isinstance(key, type):
+        return lambda data: isinstance(data, key)
+    validator = _compile(key)
+
+    def matches(data):
+        try:
+            validator(data, ())
+            return True
+        except SchemaError:
+            return False
+    return matches
+
+
+def _compile_dict(schema):
+    literals = {}
+    required = set()
+    patterns = []
+    for key, value in schema.items():
+        optional = False
+        if isinstance(key, Optional) and not isinstance(key, Any):
+            optional = True
+            key = key.schema
+        if isinstance(key, (Any, type, Or, And, Use)):
+            patterns.append((_key_matcher(key), _compile(value)))
+            continue
+        literals[key] = _compile(value)
+        if not optional:
+            required.add(key)
+    required = frozenset(required)
+
+    def validate(data, path):
+        if not isinstance(data, dict):
+            _fail(path, 'expected a dict', data, _TypeError)
+        if required:
+            missing = required.difference(data)
+            if missing:
+                _fail(path, 'missing keys {}'.format(sorted(missing, key=str)),
+                      sorted(data, key=str), _MissingKeyError)
+        for key, value in data.items():
+            validator = literals.get(key)
+            if validator is None:
+                for matches, validator in patterns:
+                    if matches(key):
+                        break
+                else:
+                    _fail(path, 'unsupported key {!r}'.format(key),
+                          sorted(data, key=str), _UnsupportedKeyError)
+            validator(value, path + (key,))
+    return validate
+
+
+def _compile(schema):
+    if isinstance(schema, dict):
+        return _compile_dict(schema)
+    if isinstance(schema, (list, tuple)):
+        return _compile_list(schema)
+    if isinstance(schema, Any):
+        return lambda data, path: None
+    if isinstance(schema, type):
+        return _compile_type(schema)
+    if isinstance(schema, Or):
+        return _compile_or(schema.schemas)
+    if isinstance(schema, And):
+        return _compile_and(schema.schemas)
+    if hasattr(schema, 'validate'):
+        # Use, a nested Schema and the other markers validate themselves
+        return _compile_callable(lambda data: schema.validate(data) or True)
+    if callable(schema):
+        return _compile_callable(schema)
+    return _compile_literal(schema)
+
+
+def compile_schema(schema):
+    '''Return a validator specialized for schema
+
+        The validator takes the data to validate and raises SchemaError with
+        the path of the first invalid value: SchemaTypeError for a value of
+        the wrong type, SchemaMissingKeyError for a missing key and
+        SchemaUnsupportedKeyError for a key the schema does not declare.
+
+        example:
+
+            >>> validate = compile_schema({'version': {'os': str}})
+            >>> validate({'version': {'os': 'IOS-XE'}})
+    '''
+    validator = _compile(schema)
+
+    def validate(data):
+        validator(data, ())
+    return validate
+
+
+class _Compiled(object):
+    '''Validator of a parser class, with its source schema and the number of
+       results given to it'''
+
+    __slots__ = ('schema', 'validator', 'count')
+
+    def __init__(self, schema):
+        self.schema = schema
+        self.validator = compile_schema(schema)
+        self.count = 0
+
+
+def _compiled(parser_cls):
+    # in the __dict__ of the class itself, a subclass has its own schema
+    schema = parser_cls.schema
+    compiled = parser_cls.__dict__.get('_compiled_schema')
+    if compiled is None or compiled.schema is not schema:
+        with _lock:
+            compiled = parser_cls.__dict__.get('_compiled_schema')
+            if compiled is None or compiled.schema is not schema:
+                compiled = _Compiled(schema)
+                setattr(parser_cls, '_compiled_schema', compiled)
+    return compiled
+
+
+def compiled_validator(parser_cls):
+    '''Return the compiled validator of the schema of a parser class,
+       compiled on first use'''
+    return _compiled(parser_cls).validator
+
+
+def set_validation(mode=FULL, every=100):
+    '''Set how validate_result validates the results
+
+        Args:
+            mode (`str`): FULL validates every result, SAMPLE the first result
+                          of each parser class then one in every, NONE none
+            every (`int`): sampling interval of SAMPLE
+    '''
+    if mode not in MODES:
+        raise ValueError('validation mode {!r} is not one of {}'.format(
+            mode, ', '.join(MODES)))
+    if every < 1:
+        raise ValueError('every must be at least 1')
+    _settings.update(mode=mode, every=every)
+
+
+def get_validation():
+    '''Return the validation mode and sampling interval'''
+    return _settings['mode'], _settings['every']
+
+
+def validate_result(parser_cls, result, validation=None, sample_every=None):
+    '''Validate a result of a parser class with its compiled validator
+
+        Args:
+            parser_cls: parser class of the result
+            result (`dict`): parsed result
+            validation (`str`): validation mode, defaults to set_validation
+            sample_every (`int`): sampling interval, defaults to
+                                  set_validation
+
+        Returns:
+            True when the result was validated, False when it was skipped
+    '''
+    mode = validation or _settings['mode']
+    every = sample_every or _settings['every']
+    if mode == NONE or not getattr(parser_cls, 'schema', None):
+        return False
+    compiled = _compiled(parser_cls)
+    if mode == SAMPLE:
+        count = compiled.count
+        compiled.count = count + 1
+        if count % every:
+            return False
+    compiled.validator(result)
+    return True
+
+
+def parse_with_validator(parser_cls, device, output, validation=None,
+                         sample_every=None, **kwargs):
+    '''Parse an output with the cli() of a parser and validate the result
+       with validate_result
+
+        Raises:
+            SchemaEmptyParserError when the result is empty
+    '''
+    result = parser_cls(device=device).cli(output=output, **kwargs)
+    if not result:
+        raise SchemaEmptyParserError(result)
+    validate_result(parser_cls, result, validation, sample_every)
+    return result
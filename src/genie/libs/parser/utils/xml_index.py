@@ -0,0 +1,187 @@
+'''One pass tag index of xml replies
+
+Looking up a tag with root.iter() or root.find('.//') walks the tree again
+for every key, and the tags of a reply carry its namespace, which has to
+be found before the lookup:
+
+    <nf:rpc-reply xmlns="http://www.cisco.com/nxos:7.0.3.I7.1.:bgp" ...>
+     <nf:data>
+      <show><bgp><sessions>
+       <__readonly__>
+        <totalpeers>3</totalpeers>
+    ...
+
+XmlIndex walks the tree once, indexing its elements by their tag without
+namespace, so that every lookup after it is a dict access:
+
+    >>> index = XmlIndex.of(root)
+    >>> index.text('totalpeers')
+    '3'
+    >>> index.compare_command('show bgp sessions')
+
+XmlIndex.of() keeps the index of a root for as long as the root is alive,
+the index, the namespace and the command of a reply are built once however
+many times a parser looks them up.
+'''
+
+# python
+import warnings
+import weakref
+from xml.etree import ElementTree as ET
+
+from .xml_stream import JUNK, _check_command
+
+
+class XmlIndex(object):
+    '''Index of the elements under an xml root by their tag without
+       namespace
+
+        Args:
+            root (`obj`): ElementTree Element, or the xml reply as a string
+
+        example:
+
+            >>> index = XmlIndex(root)
+            >>> index.findall('ROW_vrf')
+            (<Element '{http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}ROW_vrf'>, ...)
+    '''
+
+    __slots__ = ('namespace', '_data', '_tags', '_local', '_command',
+                 '__weakref__')
+
+    # indexes of the roots still alive
+    _indexes = weakref.WeakKeyDictionary()
+
+    def __init__(self, root):
+        if isinstance(root, str):
+            end = root.find(JUNK)
+            root = ET.fromstring(root if end < 0 else root[:end])
+        # the index holds no reference to root, which XmlIndex.of() would
+        # keep alive otherwise
+        self._data = root[0] if len(root) else None
+        self._command = None
+
+        tags = {}
+        local = {}
+        namespace = None
+        iterator = root.iter()
+        next(iterator)
+        for elem in iterator:
+            try:
+                tag = local[elem.tag]
+            except KeyError:
+                # namespaces are stripped once per distinct tag
+                tag = local[elem.tag] = elem.tag.rpartition('}')[2]
+                if namespace is None and elem.tag[0] == '{' and \
+                        not root.tag.startswith(elem.tag[:-len(tag)]):
+                    namespace = elem.tag[:-len(tag)]
+            try:
+                tags[tag].append(elem)
+            except KeyError:
+                tags[tag] = [elem]
+
+        # <nf:rpc-reply xmlns="http://www.cisco.com/nxos:7.0.3.I7.1.:bgp"
+        # the namespace of the reply, not the one of the netconf elements
+        if namespace is None:
+            namespace = root.tag[:-len(root.tag.rpartition('}')[2])]
+        self.namespace = namespace
+        self._tags = {tag: tuple(elems) for tag, elems in tags.items()}
+        self._local = local
+
+    @classmethod
+    def of(cls, root):
+        '''Return the index of root, built on the first call for a root'''
+        try:
+            return cls._indexes[root]
+        except KeyError:
+            index = cls._indexes[root] = cls(root)
+            return index
+
+    def __contains__(self, key):
+        return key in self._tags
+
+    def __iter__(self):
+        # the tags of the index
+        return iter(self._tags)
+
+    def find(self, key, default=None):
+        '''Return the first element of tag key, in document order'''
+        try:
+            return self._tags[key][0]
+        except KeyError:
+            return default
+
+    def findall(self, key):
+        '''Return the elements of tag key, in document order'''
+        return self._tags.get(key, ())
+
+    def text(self, key, default=None):
+        '''Return the text of the first element of tag key'''
+        try:
+            return self._tags[key][0].text
+        except KeyError:
+            return default
+
+    def local_name(self, elem):
+        '''Return the tag of elem without namespace'''
+        try:
+            return self._local[elem.tag]
+        except KeyError:
+            return elem.tag.rpartition('}')[2]
+
+    @property
+    def command(self):
+        '''command composed from the tags before __readonly__, composed
+           once per reply'''
+        if self._command is None:
+            self._command = ' '.join(self._compose_command())
+        return self._command
+
+    def _compose_command(self):
+        # ex.  <nf:data>
+        #        <show>
+        #         <bgp>
+        #          <vrf>
+        #           <__XML__PARAM__vrf-name>
+        #            <__XML__value>VRF1</__XML__value>
+        #           </__XML__PARAM__vrf-name>
+        #          </vrf>
+        #          <__readonly__>
+        parts = []
+        node = self._data
+        while node is not None:
+            child = None
+            for item in node:
+                if self.local_name(item) == '__XML__value':
+                    if item.text:
+                        parts.append(item.text)
+                else:
+                    child = item
+                    break
+            if child is None:
+                return parts
+            node = child
+            tag = self.local_name(node)
+
+            # __readonly__ is the end of the command
+            if tag == '__readonly__':
+                return parts
+
+            # if there is no __readonly__ but the command has outputs
+            # should be warining
+            if tag.startswith('TABLE'):
+                warnings.warn('Tag "__readonly__" should exsist in output '
+                              'when there are actual values in output')
+                return parts
+
+            if '__XML__' not in tag:
+                parts.append(tag)
+        return parts
+
+    def compare_command(self, expect_command):
+        '''Compare the command of the reply with expect_command
+
+            Raises:
+                AssertionError: xml tag cli and command is not matched
+        '''
+        _check_command([self.command], expect_command)
@@ -0,0 +1,240 @@
+'''Streaming extraction of the rows of NX-OS '| xml' replies
+
+An NX-OS '| xml' reply wraps the tags of the command in netconf elements,
+then holds the values under __readonly__ as nested TABLE_x/ROW_x tables:
+
+    <nf:rpc-reply xmlns="http://www.cisco.com/nxos:7.0.3.I7.1.:bgp" ...>
+     <nf:data>
+      <show><bgp><sessions>
+       <__readonly__>
+        <totalpeers>3</totalpeers>
+        <TABLE_vrf>
+         <ROW_vrf>
+          <vrf-name-out>default</vrf-name-out>
+          <TABLE_neighbor>
+           <ROW_neighbor>
+            <neighbor-id>10.106.102.3</neighbor-id>
+    ...
+
+Building the whole tree with ET.fromstring() holds the entire reply in
+memory before the first row is read. iter_rows() parses the reply with an
+incremental parser instead, matches the rows to extract by their tag path
+under __readonly__, maps their leaf values straight to schema keys, and
+frees each element once it is read, so memory stays bounded by the depth of
+the tables whatever the number of rows:
+
+    >>> rows = {
+    ...     'vrf': Row('TABLE_vrf/ROW_vrf', {
+    ...         'vrf-name-out': 'vrf',
+    ...         'local-as': ('local_as', int)}),
+    ...     'neighbor': Row('TABLE_vrf/ROW_vrf/TABLE_neighbor/ROW_neighbor', {
+    ...         'neighbor-id': 'neighbor',
+    ...         'remoteas': ('remote_as', int)}),
+    ... }
+    >>> for name, values, parents in iter_rows(out, rows,
+    ...                                        command='show bgp sessions'):
+    ...     if name == 'neighbor':
+    ...         vrf = parents[-1]['vrf']
+
+A row is yielded when its closing tag is read, after the rows nested in it.
+The rows nested in a row see the values of its leaves read so far, which
+hold its keys as NX-OS puts them first in a row.
+'''
+
+# python
+import warnings
+from xml.etree import ElementTree as ET
+
+# framing appended by the device after the reply
+JUNK = ']]>]]>'
+
+# size of the pieces of the reply given to the parser
+CHUNK = 64 * 1024
+
+
+class Row(object):
+    '''A row of an NX-OS '| xml' table to extract
+
+        Args:
+            path (`str`): '/' separated tag path of the row under
+                          __readonly__, '' for __readonly__ itself
+            fields (`dict`): {tag: key} or {tag: (key, convert)} mapping the
+                             leaves of the row to schema keys. Unmapped leaves
+                             are skipped, values which do not convert are
+                             left out. None keeps every leaf under its tag.
+    '''
+
+    __slots__ = ('path', 'fields')
+
+    def __init__(self, path, fields=None):
+        self.path = tuple(path.split('/')) if path else ()
+        if fields is not None:
+            fields = {tag: field if isinstance(field, tuple) else (field, None)
+                      for tag, field in fields.items()}
+        self.fields = fields
+
+    def __repr__(self):
+        return 'Row({!r})'.format('/'.join(self.path))
+
+
+def _chunks(output):
+    # pieces of the reply, up to the framing of the device
+    if hasattr(output, 'read'):
+        for chunk in iter(lambda: output.read(CHUNK), ''):
+            yield chunk
+        return
+    end = output.find(JUNK)
+    if end < 0:
+        end = len(output)
+    for start in range(0, end, CHUNK):
+        yield output[start:min(start + CHUNK, end)]
+
+
+def _check_command(cli, command):
+    cli = ' '.join(cli)
+    assert cli == command, \
+        'Cli created from XML tags does not match the actual cli:\n'\
+        'XML Tags cli: {c}\nCli command: {e}'.format(c=cli, e=command)
+
+
+def iter_rows(output, rows, command=None):
+    '''Yield the rows of an NX-OS '| xml' reply as it is parsed
+
+        Args:
+            output (`str`): reply of the device, or a file object of it
+            rows (`dict`): {name: Row or path} of the rows to extract
+            command (`str`): command expected from the tags before
+                             __readonly__, not checked when None
+
+        Returns:
+            generator of (name, values, parents), with values the dict of the
+            row and parents the values of the extracted rows it is nested in,
+            outermost first
+
+        Raises:
+            AssertionError: the tags do not match the command
+            ParseError: the reply is not well-formed xml
+
+        example:
+
+            >>> for name, values, parents in iter_rows(
+            ...         out, {'vrf': 'TABLE_vrf/ROW_vrf'}):
+            ...     print(values['vrf-name-out'])
+    '''
+    rows = {name: row if isinstance(row, Row) else Row(row)
+            for name, row in rows.items()}
+    by_path = {row.path: (name, row.fields) for name, row in rows.items()}
+    # tag paths leading to an extracted row, the others are skipped
+    wanted = {row.path[:index] for row in rows.values()
+              for index in range(len(row.path))}
+
+    parser = ET.XMLPullParser(events=('start', 'end'))
+    local = {}
+    # open elements, whether they have children, and their path under
+    # __readonly__ once it is found
+    stack = []
+    branch = []
+    path = []
+    base = None
+    cli = []
+    # [depth, name, fields, values] of the rows being read
+    open_rows = []
+    # depth of the subtree no row needs which is being skipped
+    skipping = None
+
+    def start_rows(depth):
+        nonlocal base
+        if command is not None:
+            _check_command(cli, command)
+        base = depth
+        if () in by_path:
+            name, fields = by_path[()]
+            open_rows.append([depth - 1, name, fields, {}])
+
+    for chunk in _chunks(output):
+        parser.feed(chunk)
+        for event, elem in parser.read_events():
+            try:
+                tag = local[elem.tag]
+            except KeyError:
+                # namespaces are stripped once per distinct tag
+                tag = local[elem.tag] = elem.tag.rpartition('}')[2]
+
+            if event == 'start':
+                depth = len(stack)
+                if branch:
+                    branch[-1] = True
+                stack.append(elem)
+                branch.append(False)
+                if base is None:
+                    if tag == '__readonly__':
+                        start_rows(depth + 1)
+                        continue
+                    if not tag.startswith('TABLE'):
+                        # <__XML__PARAM__vrf-name> and <__XML__value> are
+                        # not part of the command
+                        if depth > 1 and '__XML__' not in tag:
+                            cli.append(tag)
+                        continue
+                    warnings.warn('Tag "__readonly__" should exsist in output '
+                                  'when there are actual values in output')
+                    start_rows(depth)
+                elif depth < base:
+                    continue
+                path.append(tag)
+                if skipping is not None:
+                    continue
+                key = tuple(path)
+                if key in by_path:
+                    name, fields = by_path[key]
+                    open_rows.append([depth, name, fields, {}])
+                elif key not in wanted and not (
+                        open_rows and open_rows[-1][0] == depth - 1):
+                    skipping = depth
+                continue
+
+            stack.pop()
+            leaf = not branch.pop()
+            depth = len(stack)
+            if base is None:
+                if tag == '__XML__value' and elem.text:
+                    cli.append(elem.text)
+                continue
+            if depth < base:
+                # end of __readonly__
+                if open_rows and open_rows[-1][0] == depth:
+                    row = open_rows.pop()
+                    yield row[1], row[3], ()
+                continue
+            path.pop()
+            if skipping is not None:
+                if depth == skipping:
+                    skipping = None
+            elif open_rows:
+                row = open_rows[-1]
+                if row[0] == depth:
+                    open_rows.pop()
+                    yield row[1], row[3], tuple(
+                        parent[3] for parent in open_rows)
+                elif row[0] == depth - 1 and leaf:
+                    fields = row[2]
+                    values = row[3]
+                    if fields is None:
+                        values.setdefault(tag, elem.text)
+                    elif tag in fields:
+                        key, convert = fields[tag]
+                        value = elem.text
+                        if key in values:
+                            pass
+                        elif convert is None:
+                            values[key] = value
+                        elif value is not None:
+                            try:
+                                values[key] = convert(value)
+                            except (ValueError, TypeError):
+                                pass
+            # read, free it
+            stack[-1].remove(elem)
+
+    if base is None and command is not None:
+        _check_command(cli, command)
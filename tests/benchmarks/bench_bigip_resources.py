@@ -0,0 +1,144 @@
+"""Compare the startup of the bigip parsers as modules and as table rows.
+
+Renders the RESOURCES table of genie.libs.parser.bigip as the package of
+one module per resource it replaced, in a temporary directory, then reports
+the time and the resident memory of fresh interpreters loading every parser
+class from those modules and from the table, and loading only the package
+and one class from the table, as a testbed using a single parser does.
+Every interpreter is run once before being timed, for its byte code to be
+cached, then --repeat times, and the median is reported.
+
+    python bench_bigip_resources.py
+    python bench_bigip_resources.py --repeat 10
+"""
+
+# Python
+import os
+import sys
+import json
+import tempfile
+import argparse
+import statistics
+import subprocess
+
+from genie.libs.parser.bigip.resources import RESOURCES
+
+# a module of the package the table replaced
+MODULE = '''# Global Imports
+import json
+from collections import defaultdict
+
+# Metaparser
+from genie.metaparser import MetaParser
+
+# =============================================
+# Collection for '{path}' resources
+# =============================================
+
+
+class {name}Schema(MetaParser):
+
+    schema = {{}}
+
+
+class {name}({name}Schema):
+    """ To F5 resource for {path}
+    """
+
+    cli_command = "{path}"
+
+    def rest(self):
+
+        response = self.device.get(self.cli_command)
+
+        response_json = response.json()
+
+        if not response_json:
+            return {{}}
+
+        return response_json
+'''
+
+# timed in the interpreter, from after the import of genie.libs.parser
+MEASURE = '''
+import os, time, resource, importlib
+import genie.metaparser, genie.libs.parser
+
+def rss():
+    # resident KiB, the peak one where /proc is not available
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') // 1024
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+before = rss()
+start = time.perf_counter()
+{load}
+seconds = time.perf_counter() - start
+print(seconds, rss() - before)
+'''
+
+LOADS = {
+    'modules, every class': '''
+for module, name in {rows}:
+    getattr(importlib.import_module('legacy_bigip.' + module), name)
+''',
+    'table, every class': '''
+from genie.libs.parser import bigip
+for module, name in {rows}:
+    getattr(bigip, name)
+''',
+    'table, one class': '''
+from genie.libs.parser.bigip import NetWccp
+''',
+}
+
+
+def legacy(directory):
+    """Write the legacy_bigip package of one module per resource"""
+    package = os.path.join(directory, 'legacy_bigip')
+    os.mkdir(package)
+    open(os.path.join(package, '__init__.py'), 'w').close()
+    for module, name, path in RESOURCES:
+        with open(os.path.join(package, module + '.py'), 'w') as f:
+            f.write(MODULE.format(name=name, path=path))
+
+
+def run(load, directory):
+    """Return the seconds and the RSS KiB of load in a new interpreter"""
+    env = dict(os.environ)
+    # byte code cached in directory, as an installed package has it
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    env['PYTHONPYCACHEPREFIX'] = os.path.join(directory, 'pycache')
+    env['PYTHONPATH'] = os.pathsep.join(
+        [directory] + [path for path in sys.path if path])
+    output = subprocess.check_output(
+        [sys.executable, '-c', MEASURE.format(load=load)], env=env,
+        universal_newlines=True)
+    seconds, rss = output.split()
+    return float(seconds), int(rss)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    rows = json.dumps([[module, name] for module, name, _ in RESOURCES])
+    print('{} bigip resources'.format(len(RESOURCES)))
+    print('{:<24} {:>10} {:>10}'.format('', 'ms', 'RSS MiB'))
+    with tempfile.TemporaryDirectory() as directory:
+        legacy(directory)
+        for label, load in LOADS.items():
+            load = load.format(rows=rows)
+            run(load, directory)
+            timings = [run(load, directory) for _ in range(args.repeat)]
+            print('{:<24} {:>10.1f} {:>10.1f}'.format(
+                label,
+                statistics.median(seconds for seconds, _ in timings) * 1000,
+                statistics.median(rss for _, rss in timings) / 1024))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+"""Compare the dict and columnar results of the table parsers on large outputs.
+
+Generates a 'show arp' output of --rows entries spread over 64 interfaces,
+one in 16 without interface, a 'ps -ef' output of --rows processes, or a
+'show mac address-table' or 'show ip nat translations' output of --rows
+records expanded from a golden output by tests/synthetic.py, and parses it
+into the usual nested dicts then with columnar=True. The columnar result is
+checked to convert back to the dict result before reporting the parse time
+and the memory held by each result, measured by walking it.
+
+    python bench_columnar.py
+    python bench_columnar.py --parser ps --rows 100000 --repeat 3
+    python bench_columnar.py --parser mac --rows 100000
+"""
+
+# Python
+import gc
+import os
+import sys
+import time
+import random
+import argparse
+from unittest.mock import Mock
+
+from genie.libs.parser.iosxe.show_arp import ShowArp
+from genie.libs.parser.linux.ps import Ps
+from genie.libs.parser.iosxe.show_fdb import ShowMacAddressTable
+from genie.libs.parser.iosxe.show_ip_nat import ShowIpNatTranslations
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+from synthetic import GENERATORS
+
+
+def arp_output(rows, seed):
+    """Return a show arp output of rows entries"""
+    rng = random.Random(seed)
+    lines = ['Protocol  Address          Age (min)  Hardware Addr   Type   '
+             'Interface']
+    for number in range(rows):
+        address = '10.{}.{}.{}'.format(number // 65536, number // 256 % 256,
+                                       number % 256)
+        mac = '{:04x}.{:04x}.{:04x}'.format(rng.getrandbits(16),
+                                            rng.getrandbits(16), number % 65536)
+        age = rng.choice(['-', str(rng.randint(0, 240))])
+        interface = '' if number % 16 == 0 else \
+            'GigabitEthernet1/0/{}'.format(number % 64)
+        lines.append('Internet  {:<15} {:>10}   {}  ARPA   {}'.format(
+            address, age, mac, interface).rstrip())
+    return '\n'.join(lines)
+
+
+def ps_output(rows, seed):
+    """Return a ps -ef output of rows processes"""
+    rng = random.Random(seed)
+    commands = ['/sbin/mingetty /dev/tty{}'.format(tty) for tty in range(8)]
+    commands += ['[kworker/{}:{}]'.format(cpu, n) for cpu in range(4)
+                 for n in range(4)]
+    lines = ['UID        PID  PPID  C STIME TTY          TIME CMD']
+    for pid in range(1, rows + 1):
+        lines.append('{:<8} {:>6} {:>5}  0 {} {:<8} 00:00:{:02d} {}'.format(
+            rng.choice(['root', 'daemon', 'admin']), pid,
+            rng.randint(1, pid), rng.choice(['2019', '10:12', 'Mar03']),
+            rng.choice(['?', 'tty2', 'pts/0']), rng.randint(0, 59),
+            rng.choice(commands)))
+    return '\n'.join(lines)
+
+
+PARSERS = {'arp': (ShowArp, arp_output), 'ps': (Ps, ps_output),
+           'mac': (ShowMacAddressTable, GENERATORS['mac'].output),
+           'nat': (ShowIpNatTranslations, GENERATORS['nat'].output)}
+
+
+def deep_size(value):
+    """Return the size in bytes of value and of all the objects it holds,
+       each counted once"""
+    seen = set()
+    size = 0
+    stack = [value]
+    while stack:
+        value = stack.pop()
+        if id(value) in seen:
+            continue
+        seen.add(id(value))
+        size += sys.getsizeof(value)
+        if isinstance(value, dict):
+            stack.extend(value.keys())
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+        elif hasattr(value, '__dict__'):
+            stack.append(vars(value))
+    return size
+
+
+def timed(parser, output, columnar, repeat):
+    best = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = parser(device=Mock()).parse(output=output, columnar=columnar)
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--parser', choices=sorted(PARSERS), default='arp')
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    klass, generate = PARSERS[args.parser]
+    output = generate(args.rows, args.seed)
+    dict_seconds, dict_result = timed(klass, output, False, args.repeat)
+    columnar_seconds, columnar_result = timed(klass, output, True,
+                                              args.repeat)
+    if columnar_result.to_dict() != dict_result:
+        sys.exit('columnar result differs from the dict result')
+
+    start = time.perf_counter()
+    columnar_result.to_dict()
+    to_dict_seconds = time.perf_counter() - start
+
+    print('{} {} rows'.format(klass.__name__, args.rows))
+    print('{:<10} {:>10} {:>10}'.format('result', 'seconds', 'MB'))
+    print('{:<10} {:>10.3f} {:>10.1f}'.format(
+        'dict', dict_seconds, deep_size(dict_result) / 2 ** 20))
+    print('{:<10} {:>10.3f} {:>10.1f}'.format(
+        'columnar', columnar_seconds, deep_size(columnar_result) / 2 ** 20))
+    print('to_dict() {:.3f} seconds'.format(to_dict_seconds))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+"""Benchmark command lookups against a growing parsers.json.
+
+Compares the linear scan over every command of parsers.json with the token
+trie used by `_fuzzy_search_command`. The parser data is grown by cloning
+every command under a synthetic keyword, the trie lookup cost should stay
+flat while the linear scan grows with the number of commands.
+
+    python bench_command_trie.py
+    python bench_command_trie.py --parsers parsers.json --factors 1 2 4 8
+"""
+
+# Python
+import re
+import sys
+import json
+import time
+import random
+import argparse
+
+# Genie
+from genie.libs.parser.utils import common
+from genie.libs.parser.utils.common import _matches_fuzzy, _fuzzy_search_command
+
+
+def grow(data, factor):
+    """Return parser data with `factor` times as many commands."""
+    grown = dict(data)
+    for index in range(1, factor):
+        for command, source in data.items():
+            tokens = command.split()
+            tokens.insert(1, 'bench{}'.format(index))
+            grown[' '.join(tokens)] = source
+    return grown
+
+
+def build_searches(data, count, seed=0):
+    """Abbreviated searches for real commands, as users type them."""
+    rnd = random.Random(seed)
+    commands = [c for c in data if c != 'tokens']
+    searches = []
+    for command in rnd.sample(commands, min(count, len(commands))):
+        search = re.sub('{.*?}', 'argument', command)
+        searches.append(' '.join(token[:rnd.randint(1, len(token))]
+                                 for token in search.split()))
+    return searches
+
+
+def linear_lookup(search, data, os):
+    """Lookup as done before the token trie: compare with every command."""
+    tokens = search.split()
+    for command, source in data.items():
+        if _matches_fuzzy(0, 0, tokens.copy(), command, {}, False) and \
+                os in source:
+            pass
+
+
+def trie_lookup(search, data, os):
+    try:
+        _fuzzy_search_command(search, False, os)
+    except Exception:
+        # ambiguous abbreviations are fine for timing purposes
+        pass
+
+
+def timeit(func, searches, data, os):
+    start = time.perf_counter()
+    for search in searches:
+        func(search, data, os)
+    return (time.perf_counter() - start) / len(searches) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--parsers', default=None,
+                        help='parsers.json to use, default is the installed one')
+    parser.add_argument('--factors', type=int, nargs='+',
+                        default=[1, 2, 4, 8, 16])
+    parser.add_argument('--searches', type=int, default=100)
+    parser.add_argument('--os', default='iosxe')
+    args = parser.parse_args()
+
+    if args.parsers:
+        with open(args.parsers) as f:
+            data = json.load(f)
+    else:
+        data = dict(common.parser_data)
+    if not data:
+        sys.exit('No parser data available, use --parsers')
+
+    searches = build_searches(data, args.searches)
+    original = dict(common.parser_data)
+
+    print('{:>10} {:>16} {:>16}'.format('commands', 'linear us/call',
+                                        'trie us/call'))
+    try:
+        for factor in args.factors:
+            grown = grow(data, factor)
+            common.parser_data.clear()
+            common.parser_data.update(grown)
+            # parser_data is changed directly, not through add_parser
+            common.get_parser_cache.clear()
+            # build the trie outside of the timed section
+            common._get_command_trie()
+
+            linear = timeit(linear_lookup, searches, grown, args.os)
+            trie = timeit(trie_lookup, searches, grown, args.os)
+            print('{:>10} {:>16.1f} {:>16.1f}'.format(len(grown), linear, trie))
+    finally:
+        common.parser_data.clear()
+        common.parser_data.update(original)
+        common.get_parser_cache.clear()
+
+
+if __name__ == '__main__':
+    main()
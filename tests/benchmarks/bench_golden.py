@@ -0,0 +1,190 @@
+"""Time the parsers on their golden outputs and check them against a baseline.
+
+Walks the golden outputs tests/ci_folder_parsing.py tests, with the same
+-o/-c/-t/-n filters, and times parse(output=...) of every parser on each of
+its <name>_output.txt with its <name>_arguments.json, the parsers failing
+with an output argument being given a device replying the output instead. Each
+output is parsed for at least --min-time seconds, --repeat times, and the
+best time is kept. The memory allocated by one parse is traced apart.
+
+Reported per parser: the golden outputs, their lines, the microseconds of
+parsing all of them once, the passes per second, the microseconds per
+line, the peak KiB allocated by a parse, and the change from the baseline.
+
+The baseline is --baseline, golden_baseline.json next to this script by
+default, written or updated with --update. The check fails, with a
+non-zero exit status, when a parser is slower than its baseline by more
+than --threshold percent.
+
+    python bench_golden.py -o iosxe
+    python bench_golden.py -o nxos -c ShowBgpSessions --repeat 5
+    python bench_golden.py --update
+    python bench_golden.py --threshold 10
+"""
+
+# Python
+import gc
+import os
+import sys
+import json
+import time
+import argparse
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+from golden import parsers, cases
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        'golden_baseline.json')
+
+
+def parse_function(case, output):
+    """Return a function parsing output, the output of case, once"""
+    arguments = case.arguments
+    cls, device = case.parser.cls, case.device()
+    try:
+        cls(device=device).parse(output=output, **arguments)
+    except Exception:
+        # cli() takes no output argument, or ignores it, the device
+        # replies it as in the golden tests
+        cls(device=device).parse(**arguments)
+        return lambda: cls(device=device).parse(**arguments)
+    return lambda: cls(device=device).parse(output=output, **arguments)
+
+
+def best(function, repeat, min_time):
+    """Return the best seconds of one call of function"""
+    loops, elapsed = 1, 0
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        loops *= 10 if elapsed * 10 < min_time else 2
+    seconds = elapsed / loops
+    for _ in range(repeat - 1):
+        gc.collect()
+        start = time.perf_counter()
+        for _ in range(loops):
+            function()
+        seconds = min(seconds, (time.perf_counter() - start) / loops)
+    return seconds
+
+
+def allocated(function):
+    """Return the peak bytes allocated by a call of function"""
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def measure(parser, args):
+    """Return the result of parser on its golden outputs, None when it has
+    none, the failed outputs as errors"""
+    result = {'cases': 0, 'lines': 0, 'microseconds': 0.0, 'kib': 0.0,
+              'errors': []}
+    for case in cases(parser, number=args.number):
+        output = case.output
+        try:
+            function = parse_function(case, output)
+        except Exception as e:
+            result['errors'].append('{}: {!r}'.format(case.name, e))
+            continue
+        result['cases'] += 1
+        result['lines'] += output.count('\n') + 1
+        result['microseconds'] += best(function, args.repeat,
+                                       args.min_time) * 1e6
+        result['kib'] = max(result['kib'], allocated(function) / 1024)
+    if not result['cases'] and not result['errors']:
+        return None
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-o', '--operating_system', default=None,
+                        help='The OS you wish to filter on')
+    parser.add_argument('-c', '--class_name', default=None,
+                        help='The Class you wish to filter on')
+    parser.add_argument('-t', '--token', default=None,
+                        help="The Token associated with the class, such as "
+                             "'asr1k'")
+    parser.add_argument('-n', '--number', type=int, default=None,
+                        help="The specific golden output, such as '25'")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--min-time', type=float, default=0.01,
+                        help='seconds each output is parsed for')
+    parser.add_argument('--threshold', type=float, default=25,
+                        help='percent slower than the baseline failing')
+    parser.add_argument('--baseline', default=BASELINE)
+    parser.add_argument('--update', action='store_true',
+                        help='record the results in the baseline')
+    args = parser.parse_args()
+
+    baseline = {}
+    if os.path.isfile(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    operating_systems = [args.operating_system] if args.operating_system \
+        else None
+    regressions, errors, measured = [], [], {}
+    print('{:<56} {:>5} {:>6} {:>10} {:>9} {:>7} {:>9} {:>7}'.format(
+        'parser', 'cases', 'lines', 'us/pass', 'pass/s', 'us/line',
+        'alloc KiB', 'change'))
+    for found in parsers(operating_systems, args.class_name, args.token):
+        if found.cls is None:
+            errors.append('{}: {!r}'.format(found.id, found.error))
+            continue
+        result = measure(found, args)
+        if result is None:
+            continue
+        errors.extend('{}/{}'.format(found.id, error)
+                      for error in result.pop('errors'))
+        if not result['cases']:
+            continue
+        measured[found.id] = result
+        expected = baseline.get(found.id)
+        change = ''
+        if expected:
+            change = 100 * (result['microseconds'] /
+                            expected['microseconds'] - 1)
+            if change > args.threshold:
+                regressions.append('{} {:+.0f}%, {:.0f}us from {:.0f}us'
+                                   .format(found.id, change,
+                                           result['microseconds'],
+                                           expected['microseconds']))
+            change = '{:+.0f}%'.format(change)
+        print('{:<56} {:>5} {:>6} {:>10.1f} {:>9.1f} {:>7.2f} {:>9.1f} '
+              '{:>7}'.format(found.id, result['cases'], result['lines'],
+                             result['microseconds'],
+                             1e6 / result['microseconds'],
+                             result['microseconds'] / result['lines'],
+                             result['kib'], change))
+
+    if args.update:
+        baseline.update({name: {key: round(value, 1) if
+                                isinstance(value, float) else value
+                                for key, value in result.items()}
+                         for name, result in measured.items()})
+        with open(args.baseline, 'w') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print('{} parsers written to {}'.format(len(measured),
+                                                args.baseline))
+    for error in errors:
+        print('ERROR: {}'.format(error))
+    for regression in regressions:
+        print('REGRESSION: {}'.format(regression))
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
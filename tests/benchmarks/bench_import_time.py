@@ -0,0 +1,152 @@
+"""Check the cold-start import of single parsers against a baseline.
+
+Imports each --parser, as module:Class, in fresh interpreters run with
+python -X importtime, and reports the genie.libs.parser modules it
+imported, the time spent importing them and the modules they import, and
+the time of the whole import, genie.metaparser and genie.abstract
+included.
+Every interpreter is run once before being timed, for its byte code to be
+cached, then --repeat times, and the median is reported.
+
+The result is compared with import_time.json next to this script: the
+check fails, with a non-zero exit status, when a parser imports a
+genie.libs.parser module its baseline does not list, or when importing the
+genie.libs.parser modules is slower than the baseline by more than
+--tolerance. --update records the result as the new baseline.
+
+    python bench_import_time.py
+    python bench_import_time.py --repeat 9 --tolerance 0.25
+    python bench_import_time.py --update
+"""
+
+# Python
+import os
+import sys
+import json
+import tempfile
+import argparse
+import statistics
+import subprocess
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        'import_time.json')
+
+PARSERS = [
+    'genie.libs.parser.nxos.show_bgp:ShowBgpSessions',
+    'genie.libs.parser.iosxe.show_interface:ShowInterfaces',
+    'genie.libs.parser.ios.show_interface:ShowInterfaces',
+    'genie.libs.parser.junos.show_route:ShowRouteProtocolExtensive',
+    'genie.libs.parser.bigip.get_net_wccp:NetWccp',
+]
+
+PACKAGE = 'genie.libs.parser'
+
+
+def importtime(parser, cache):
+    """Return {module: self microseconds} of importing parser, counting
+       only the modules imported by genie.libs.parser, and the
+       microseconds of the whole import"""
+    module, name = parser.split(':')
+    env = dict(os.environ)
+    # byte code cached in cache, as an installed package has it
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    env['PYTHONPYCACHEPREFIX'] = cache
+    env['PYTHONPATH'] = os.pathsep.join(path for path in sys.path if path)
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c',
+         'from {} import {}'.format(module, name)],
+        env=env, stderr=subprocess.PIPE, universal_newlines=True, check=True)
+    lines = []
+    for line in process.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        spent, _, imported = line[len('import time:'):].split('|')
+        name = imported.lstrip()
+        lines.append((len(imported) - len(name), name, int(spent)))
+
+    # a module is imported after the modules it imports, with a smaller
+    # indent, and is attributed to the closest genie module importing it
+    modules, total, stack = {}, 0, []
+    for depth, name, spent in reversed(lines):
+        total += spent
+        while stack and stack[-1][0] >= depth:
+            stack.pop()
+        if name == PACKAGE or name.startswith(PACKAGE + '.'):
+            owner = PACKAGE
+        elif name.split('.')[0] == 'genie':
+            owner = None
+        else:
+            owner = stack[-1][1] if stack else None
+        stack.append((depth, owner))
+        if owner is not None:
+            modules[name] = spent
+    return modules, total
+
+
+def measure(parser, repeat, cache):
+    """Return the genie.libs.parser modules, the median microseconds of
+       importing them and the modules they import, and the median
+       microseconds of the whole import"""
+    importtime(parser, cache)
+    runs = [importtime(parser, cache) for _ in range(repeat)]
+    modules = sorted(module for module in runs[0][0]
+                     if module == PACKAGE or module.startswith(PACKAGE + '.'))
+    return (modules,
+            int(statistics.median(sum(run.values()) for run, _ in runs)),
+            int(statistics.median(total for _, total in runs)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--parser', action='append', dest='parsers',
+                        help='module:Class, the default parsers when unset')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--tolerance', type=float, default=0.5,
+                        help='allowed slowdown, 0.5 for 50%%')
+    parser.add_argument('--update', action='store_true',
+                        help='record the result as the baseline')
+    args = parser.parse_args()
+
+    baseline = {}
+    if os.path.isfile(BASELINE):
+        with open(BASELINE) as f:
+            baseline = json.load(f)
+
+    failures = []
+    result = dict(baseline)
+    print('{:<64} {:>8} {:>10} {:>10} {:>10}'.format(
+        '', 'modules', 'parser ms', 'base ms', 'total ms'))
+    with tempfile.TemporaryDirectory() as cache:
+        for name in args.parsers or PARSERS:
+            modules, own, total = measure(name, args.repeat, cache)
+            result[name] = {'modules': modules, 'microseconds': own}
+            expected = baseline.get(name)
+            print('{:<64} {:>8} {:>10.1f} {:>10} {:>10.1f}'.format(
+                name, len(modules), own / 1000,
+                '{:.1f}'.format(expected['microseconds'] / 1000)
+                if expected else '-', total / 1000))
+            if expected is None or args.update:
+                continue
+            extra = sorted(set(modules) - set(expected['modules']))
+            if extra:
+                failures.append('{} imports {}'.format(name,
+                                                       ', '.join(extra)))
+            if own > expected['microseconds'] * (1 + args.tolerance):
+                failures.append('{} imports in {:.1f}ms, {:.1f}ms in the '
+                                'baseline'.format(
+                                    name, own / 1000,
+                                    expected['microseconds'] / 1000))
+
+    if args.update:
+        with open(BASELINE, 'w') as f:
+            json.dump(result, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print('baseline written to {}'.format(BASELINE))
+    for failure in failures:
+        print('REGRESSION: {}'.format(failure))
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,160 @@
+"""Report the memory saved by interning a synthetic full BGP table.
+
+Generates the lines of a 'show ip bgp' output of --prefixes prefixes, each
+learned from one to three of 16 peers, with an AS path drawn with a fixed seed
+from a pool of 2000 paths, each with its origin code and metric, and builds
+the result in the shape of the iosxe ShowIpBgp schema from the regex groups of
+each line, as a parser does. Each mode runs
+in its own process:
+
+    plain     no interning
+    build     leaves and attribute dicts interned while building the result
+    result    the plain result interned once built, with `intern_result`
+
+and reports the memory held by the result, measured by walking it, the RSS
+of the process and the build time.
+
+    python bench_intern.py
+    python bench_intern.py --prefixes 100000
+"""
+
+# Python
+import re
+import gc
+import sys
+import json
+import time
+import random
+import argparse
+import resource
+import subprocess
+
+from genie.libs.parser.utils.intern import Interner
+
+MODES = ['plain', 'build', 'result']
+
+LINE = re.compile(r'^(?P<status_codes>[*>sdhr ]{2}) +(?P<prefix>\S+)? +'
+                  r'(?P<next_hop>\S+) +(?P<metric>\d+) +(?P<localpref>\d+) +'
+                  r'(?P<weight>\d+) +(?P<path>[\d ]+?) ?'
+                  r'(?P<origin_codes>[ie?])$')
+
+
+def lines(prefixes, seed):
+    """Yield the route lines of a 'show ip bgp' output"""
+    rng = random.Random(seed)
+    next_hops = ['10.0.{}.1'.format(peer) for peer in range(16)]
+    paths = [(' '.join(str(rng.randint(1, 65000))
+                       for _ in range(rng.randint(1, 6))),
+              rng.choice('ii?e'), rng.choice((0, 0, 0, 10)))
+             for _ in range(2000)]
+    for number in range(prefixes):
+        prefix = '{}.{}.{}.0/24'.format(number // 65536 + 1,
+                                        number // 256 % 256, number % 256)
+        path, origin, metric = rng.choice(paths)
+        peers = rng.sample(next_hops, rng.choice((1, 1, 2, 3)))
+        for index, next_hop in enumerate(peers):
+            yield '{} {:<18} {:<15} {:>6} {:>6} {:>6} {} {}'.format(
+                '*>' if index == 0 else '* ', prefix if index == 0 else '',
+                next_hop, metric, 100, 0, path, origin)
+
+
+def build(prefixes, seed, interner=None):
+    """Build the ShowIpBgp shaped result of the generated lines"""
+    intern = interner if interner is not None else (lambda value: value)
+    routes = {}
+    result = {'vrf': {'default': {'address_family': {
+        'ipv4 unicast': {'routes': routes}}}}}
+    index_dict = None
+    for line in lines(prefixes, seed):
+        group = LINE.match(line).groupdict()
+        if group['prefix']:
+            index_dict = routes.setdefault(group['prefix'], {}).setdefault(
+                'index', {})
+        path = {'status_codes': intern(group['status_codes']),
+                'next_hop': intern(group['next_hop']),
+                'metric': int(group['metric']),
+                'localpref': int(group['localpref']),
+                'weight': int(group['weight']),
+                'path': intern(group['path']),
+                'origin_codes': intern(group['origin_codes'])}
+        index_dict[len(index_dict) + 1] = \
+            interner.dict(path) if interner is not None else path
+    return result
+
+
+def deep_size(value):
+    """Return the size in bytes of value and of all the objects it holds,
+       each counted once"""
+    seen = set()
+    size = 0
+    stack = [value]
+    while stack:
+        value = stack.pop()
+        if id(value) in seen:
+            continue
+        seen.add(id(value))
+        size += sys.getsizeof(value)
+        if isinstance(value, dict):
+            stack.extend(value.keys())
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return size
+
+
+def rss():
+    """Return the current RSS of the process in bytes"""
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * resource.getpagesize()
+
+
+def child(mode, prefixes, seed):
+    gc.collect()
+    before = rss()
+    start = time.perf_counter()
+    interner = Interner() if mode == 'build' else None
+    result = build(prefixes, seed, interner)
+    if mode == 'result':
+        interner = Interner()
+        result = interner.result(result)
+    seconds = time.perf_counter() - start
+    gc.collect()
+    print(json.dumps({'seconds': seconds,
+                      'result': deep_size(result),
+                      'rss': rss() - before,
+                      'peak': resource.getrusage(
+                          resource.RUSAGE_SELF).ru_maxrss * 1024,
+                      'info': interner.info() if interner is not None
+                      else None}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--prefixes', type=int, default=1000000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--child', choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child, args.prefixes, args.seed)
+        return
+
+    print('{} prefixes'.format(args.prefixes))
+    print('{:<8} {:>10} {:>10} {:>10} {:>9} {:>8}'.format(
+        'mode', 'result MB', 'RSS MB', 'peak MB', 'saved', 'seconds'))
+    plain = None
+    for mode in MODES:
+        out = subprocess.run(
+            [sys.executable, __file__, '--child', mode,
+             '--prefixes', str(args.prefixes), '--seed', str(args.seed)],
+            check=True, stdout=subprocess.PIPE, universal_newlines=True)
+        report = json.loads(out.stdout)
+        plain = plain or report['result']
+        print('{:<8} {:>10.1f} {:>10.1f} {:>10.1f} {:>8.0%} {:>8.2f}'.format(
+            mode, report['result'] / 2 ** 20, report['rss'] / 2 ** 20,
+            report['peak'] / 2 ** 20, 1 - report['result'] / plain,
+            report['seconds']))
+
+
+if __name__ == '__main__':
+    main()
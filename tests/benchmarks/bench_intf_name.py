@@ -0,0 +1,143 @@
+"""Benchmark interface name normalization on the golden outputs.
+
+Collects the words of the golden outputs of all the parsers which look like
+interface names, as the parsers pass them to convert_intf_name, and converts
+all of them in the output order with the former implementation (a dict
+literal and two re.search per call), with the trie without memoization, with
+the memoized `convert_intf_name` and with `convert_intf_names`. The names
+converted by each method are checked to be the same.
+
+Golden outputs are read from the <os>/tests/<parser>/cli/equal folders.
+
+    python bench_intf_name.py
+    python bench_intf_name.py --os iosxe --repeat 10
+"""
+
+# Python
+import os
+import re
+import glob
+import time
+import argparse
+
+# Genie
+import genie.libs.parser
+from genie.libs.parser.utils.intf_name import convert_intf_name, \
+    convert_intf_names
+
+# words starting with letters and ending with a slot/port number
+INTF = re.compile(r'(?<![\w\-/.:])([A-Za-z][A-Za-z\-]*\s?\d+(?:[/.:]\d+)*)'
+                  r'(?![\w\-/.:])')
+
+
+def interface_names(os_names):
+    """Return the interface names of the golden outputs, with repetitions"""
+    root = os.path.dirname(genie.libs.parser.__file__)
+    names = []
+    for os_name in os_names:
+        pattern = os.path.join(root, os_name, 'tests', '*', 'cli', 'equal',
+                               '*_output.txt')
+        for path in sorted(glob.glob(pattern)):
+            with open(path, errors='replace') as f:
+                names.extend(INTF.findall(f.read()))
+    return names
+
+
+def former(intf):
+    """convert_intf_name before the trie and the memoization"""
+    convert = {'Eth': 'Ethernet', 'Lo': 'Loopback', 'Fa': 'FastEthernet',
+               'Fas': 'FastEthernet', 'Po': 'Port-channel',
+               'PO': 'Port-channel', 'Null': 'Null', 'Gi': 'GigabitEthernet',
+               'Gig': 'GigabitEthernet', 'GE': 'GigabitEthernet',
+               'Te': 'TenGigabitEthernet', 'Ten': 'TenGigabitEthernet',
+               'Tw': 'TwoGigabitEthernet', 'Two': 'TwoGigabitEthernet',
+               'Twe': 'TwentyFiveGigE', 'mgmt': 'mgmt', 'Vl': 'Vlan',
+               'Tu': 'Tunnel', 'Fe': '', 'Hs': 'HSSI', 'AT': 'ATM',
+               'Et': 'Ethernet', 'BD': 'BDI', 'Se': 'Serial',
+               'Fo': 'FortyGigabitEthernet', 'For': 'FortyGigabitEthernet',
+               'Hu': 'HundredGigE', 'Hun': 'HundredGigE', 'vl': 'vasileft',
+               'vr': 'vasiright', 'BE': 'Bundle-Ether'}
+    m = re.search(r'([a-zA-Z]+)', intf)
+    m1 = re.search(r'([\d\/\.]+)', intf)
+    if hasattr(m, 'group') and hasattr(m1, 'group'):
+        int_type = m.group(0)
+        int_port = m1.group(0)
+        if int_type in convert.keys():
+            return(convert[int_type] + int_port)
+        else:
+            converted_intf = intf[0].capitalize()+intf[1:].replace(
+                ' ', '').replace('ethernet', 'Ethernet')
+            return(converted_intf)
+    else:
+        return(intf)
+
+
+def one_by_one(func, names):
+    return [func(name) for name in names]
+
+
+def trie(names):
+    # memoization off, the trie only
+    return [convert_intf_name.__wrapped__(name) for name in names]
+
+
+def memoized(names):
+    convert_intf_name.cache_clear()
+    return [convert_intf_name(name) for name in names]
+
+
+def bulk(names):
+    convert_intf_name.cache_clear()
+    return convert_intf_names(names)
+
+
+def timeit(func, names, repeat):
+    """Return the best time per name of repeat runs in us"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(names)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / len(names) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--os', nargs='*', default=None,
+                        help='os folders to read, default all')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    root = os.path.dirname(genie.libs.parser.__file__)
+    os_names = args.os or sorted(
+        name for name in os.listdir(root)
+        if os.path.isdir(os.path.join(root, name, 'tests')))
+    names = interface_names(os_names)
+    if not names:
+        raise SystemExit('no interface names found')
+
+    methods = [('former', lambda names: one_by_one(former, names)),
+               ('trie', trie),
+               ('memoized', memoized),
+               ('bulk', bulk)]
+    expected = one_by_one(former, names)
+    for name, func in methods[1:]:
+        converted = func(names)
+        for intf, before, after in zip(names, expected, converted):
+            if before != after:
+                raise SystemExit('{}: {!r} converted to {!r} instead of {!r}'
+                                 .format(name, intf, after, before))
+
+    print('{} names, {} distinct'.format(len(names), len(set(names))))
+    print('{:<10} {:>8} {:>8}'.format('method', 'us/name', 'speedup'))
+    reference = None
+    for name, func in methods:
+        elapsed = timeit(func, names, args.repeat)
+        reference = reference or elapsed
+        print('{:<10} {:>8.3f} {:>7.1f}x'.format(name, elapsed,
+                                                 reference / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,208 @@
+"""Compare the cli, xml and json paths of ShowBgpSessions on a large reply.
+
+Generates --vrfs vrfs of --rows BGP neighbors each and renders them as the
+'show bgp sessions vrf all' text output, its '| xml' reply and its '| json'
+reply, then reports the best time of parsing each of them with
+ShowBgpSessions: the regex cli() path, the xml() path streaming the reply
+with iter_rows(), and the json() path decoding the reply and reading it
+with iter_json_rows(), once with the stdlib json decoder and once with
+orjson when it is installed. The decode time alone is reported as well.
+Every path is checked to parse every generated neighbor.
+
+    python bench_json_rows.py
+    python bench_json_rows.py --vrfs 4 --rows 50000 --repeat 5
+"""
+
+# Python
+import gc
+import sys
+import json
+import time
+import random
+import argparse
+from unittest.mock import Mock
+
+from genie.libs.parser.utils import json_rows
+from genie.libs.parser.nxos.show_bgp import ShowBgpSessions
+
+STATES = {'Established': 'E', 'Idle': 'I', 'Active': 'A'}
+
+
+def address(number):
+    return '10.{}.{}.{}'.format(number // 65536 % 256, number // 256 % 256,
+                                number % 256)
+
+
+def sessions(vrfs, rows, seed):
+    """Return the generated vrfs, a list of (name, neighbors)"""
+    rng = random.Random(seed)
+    generated = []
+    for vrf in range(vrfs):
+        neighbors = []
+        for number in range(rows):
+            state = rng.choice(sorted(STATES))
+            neighbors.append({
+                'neighbor-id': address(number),
+                'connectionsdropped': str(rng.randint(0, 9)),
+                'remoteas': str(rng.randint(1, 65535)),
+                'hours': rng.randint(0, 23),
+                'read': rng.randint(0, 59),
+                'write': rng.randint(0, 59),
+                'state': state,
+                'localport': str(rng.randint(1024, 65535)
+                                 if state == 'Established' else 0),
+                'remoteport': '179' if state == 'Established' else '0'})
+        generated.append(('VRF{}'.format(vrf), neighbors))
+    return generated
+
+
+def cli_output(generated):
+    """Return the show bgp sessions vrf all text output"""
+    total = sum(len(neighbors) for _, neighbors in generated)
+    lines = ['Total peers {0}, established peers {0}'.format(total),
+             'ASN 100']
+    for vrf, neighbors in generated:
+        lines += [
+            'VRF {}, local ASN 100'.format(vrf),
+            'peers {0}, established peers {0}, local router-id '
+            '10.1.1.1'.format(len(neighbors)),
+            'State: I-Idle, A-Active, O-Open, E-Established, C-Closing, '
+            'S-Shutdown', '',
+            'Neighbor        ASN    Flaps LastUpDn|LastRead|LastWrit St '
+            'Port(L/R)  Notif(S/R)']
+        for row in neighbors:
+            lines.append(
+                '{:<19} {:<5} {:<5} {:02d}:52:46|00:00:{:02d}|00:00:{:02d} '
+                '{}   {}/{}      0/0'.format(
+                    row['neighbor-id'], row['remoteas'],
+                    row['connectionsdropped'], row['hours'], row['read'],
+                    row['write'], STATES[row['state']], row['localport'],
+                    row['remoteport']))
+        lines.append('')
+    return '\n'.join(lines)
+
+
+def readonly(generated):
+    """Return the tree under __readonly__ of the reply"""
+    total = str(sum(len(neighbors) for _, neighbors in generated))
+    return {
+        'totalpeers': total, 'totalestablishedpeers': total,
+        'localas': '100',
+        'TABLE_vrf': {'ROW_vrf': [{
+            'vrf-name-out': vrf, 'local-as': '100',
+            'vrfpeers': str(len(neighbors)),
+            'vrfestablishedpeers': str(len(neighbors)),
+            'router-id': '10.1.1.1',
+            'TABLE_neighbor': {'ROW_neighbor': [{
+                'neighbor-id': row['neighbor-id'],
+                'connectionsdropped': row['connectionsdropped'],
+                'remoteas': row['remoteas'],
+                'lastflap': 'P1DT{}H52M46S'.format(row['hours']),
+                'lastread': 'PT{}S'.format(row['read']),
+                'lastwrite': 'PT{}S'.format(row['write']),
+                'state': row['state'],
+                'localport': row['localport'],
+                'remoteport': row['remoteport'],
+                'notificationssent': '0',
+                'notificationsreceived': '0'} for row in neighbors]},
+        } for vrf, neighbors in generated]}}
+
+
+def xml_element(tag, value):
+    if isinstance(value, str):
+        return '<{0}>{1}</{0}>'.format(tag, value)
+    if isinstance(value, list):
+        return ''.join(xml_element(tag, item) for item in value)
+    return '<{0}>{1}</{0}>'.format(tag, ''.join(
+        xml_element(key, item) for key, item in value.items()))
+
+
+def xml_output(generated):
+    """Return the show bgp sessions vrf all | xml reply"""
+    return (
+        '<?xml version="1.0" encoding="ISO-8859-1"?>\n'
+        '<nf:rpc-reply xmlns="http://www.cisco.com/nxos:7.0.3.I7.3.:bgp" '
+        'xmlns:nf="urn:ietf:params:xml:ns:netconf:base:1.0">'
+        '<nf:data><show><bgp><sessions><vrf><all>{}</all></vrf></sessions>'
+        '</bgp></show></nf:data></nf:rpc-reply>\n]]>]]>'.format(
+            xml_element('__readonly__', readonly(generated))))
+
+
+def json_output(generated):
+    """Return the show bgp sessions vrf all | json reply"""
+    return json.dumps(readonly(generated), indent=2)
+
+
+def best(function, repeat):
+    """Return the best time and the result of function()"""
+    seconds = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - start
+        seconds = elapsed if seconds is None else min(seconds, elapsed)
+    return seconds, result
+
+
+def parsed(output, context, orjson=None):
+    """Return the best time of ShowBgpSessions parsing output"""
+    device = Mock(**{'execute.return_value': output})
+    # the decoder of loads(), None for the stdlib json
+    json_rows.orjson = orjson
+    if context == 'json':
+        # MetaParser has no json context
+        return lambda: ShowBgpSessions(device=device).parse_json(vrf='all')
+    return lambda: ShowBgpSessions(device=device, context=context).parse(
+        vrf='all')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--vrfs', type=int, default=8)
+    parser.add_argument('--rows', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    orjson = json_rows.orjson
+    generated = sessions(args.vrfs, args.rows, args.seed)
+    outputs = {'cli': cli_output(generated), 'xml': xml_output(generated),
+               'json': json_output(generated)}
+
+    timings = [('cli() regex', 'cli', None), ('xml()', 'xml', None),
+               ('json() json', 'json', None)]
+    if orjson is not None:
+        timings.append(('json() orjson', 'json', orjson))
+
+    print('ShowBgpSessions {} vrfs x {} neighbors'.format(args.vrfs,
+                                                          args.rows))
+    print('{:<16} {:>10} {:>10} {:>10}'.format('', 'reply MB', 'seconds',
+                                               'speedup'))
+    reference = None
+    for label, context, decoder in timings:
+        seconds, result = best(parsed(outputs[context], context, decoder),
+                               args.repeat)
+        count = sum(len(vrf.get('neighbor', {}))
+                    for vrf in result['vrf'].values())
+        if count != args.vrfs * args.rows:
+            sys.exit('{} parsed {} neighbors out of {}'.format(
+                label, count, args.vrfs * args.rows))
+        reference = reference or seconds
+        print('{:<16} {:>10.1f} {:>10.3f} {:>9.1f}x'.format(
+            label, len(outputs[context]) / 2 ** 20, seconds,
+            reference / seconds))
+    json_rows.orjson = orjson
+
+    output = outputs['json']
+    decoders = [('json.loads', json.loads)]
+    if orjson is not None:
+        decoders.append(('orjson.loads', orjson.loads))
+    print('{:<16} {:>10} {:>10}'.format('decode only', '', 'seconds'))
+    for label, decoder in decoders:
+        seconds, _ = best(lambda: decoder(output), args.repeat)
+        print('{:<16} {:>10} {:>10.3f}'.format(label, '', seconds))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""Benchmark single pass lexing against matching patterns one by one.
+
+For each line of the golden outputs of the parsers, finds the first pattern
+which matches by calling match() on every pattern in order, as parsers did
+before, then with one `Lexer.match` call, checks both find the same pattern
+and reports the time per line.
+
+Golden outputs are read from the <os>/tests/<parser>/cli/equal folders and
+from the golden_output attributes of the unittest classes.
+
+    python bench_lexer.py
+    python bench_lexer.py --repeat 200
+"""
+
+# Python
+import time
+import argparse
+import importlib
+
+from bench_line_dispatch import golden_outputs
+
+# os, module, parser class, unittest class
+PARSERS = [
+    ('iosxe', 'show_logging', 'ShowLogging', 'TestShowLogging'),
+    ('nxos', 'show_interface', 'ShowInterface', 'TestShowInterface'),
+]
+
+
+def sequential(regexes, line):
+    """Return the name of the first pattern which matches line"""
+    for name, regex in regexes:
+        if regex.match(line):
+            return name
+
+
+def lexer_match(lexer, line):
+    m = lexer.match(line)
+    return m.lastgroup if m else None
+
+
+def timeit(func, arg, lines, repeat):
+    """Return the time per line in us"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for line in lines:
+            func(arg, line)
+    return (time.perf_counter() - start) / (repeat * len(lines)) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    print('{:<6} {:<16} {:>8} {:>6} {:>10} {:>10} {:>8}'.format(
+        'os', 'parser', 'patterns', 'lines', 'us/line', 'us/line',
+        'speedup'))
+    print('{:<6} {:<16} {:>8} {:>6} {:>10} {:>10} {:>8}'.format(
+        '', '', '', '', 'sequential', 'lexer', ''))
+
+    for os_name, module_name, class_name, test_name in PARSERS:
+        module = importlib.import_module('genie.libs.parser.{}.{}'.format(
+            os_name, module_name))
+        cls = getattr(module, class_name)
+        lines = [line.replace('\t', '    ').strip()
+                 for output in golden_outputs(os_name, module_name,
+                                              class_name, test_name)
+                 for line in output.splitlines()]
+        if not lines:
+            continue
+
+        lexer = cls.lexer
+        regexes = [(name, getattr(cls.patterns, name))
+                   for name in lexer.names]
+        for line in lines:
+            expected = sequential(regexes, line)
+            found = lexer_match(lexer, line)
+            if expected != found:
+                raise SystemExit('{}: {!r} matched by {} instead of {}'
+                                 .format(class_name, line, found, expected))
+
+        before = timeit(sequential, regexes, lines, args.repeat)
+        after = timeit(lexer_match, lexer, lines, args.repeat)
+        print('{:<6} {:<16} {:>8} {:>6} {:>10.2f} {:>10.2f} {:>7.1f}x'
+              .format(os_name, class_name, len(lexer), len(lines), before,
+                      after, before / after))
+
+
+if __name__ == '__main__':
+    main()
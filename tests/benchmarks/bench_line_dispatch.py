@@ -0,0 +1,174 @@
+"""Benchmark literal prefix line dispatch on interface parsers.
+
+Parses the golden outputs of the show interface parsers trying every pattern
+on every line, as before, then with `Patterns.for_line`, and reports the
+number of match() calls per line and the time of one cli() call.
+
+Golden outputs are read from the <os>/tests/<parser>/cli/equal folders and
+from the golden_output attributes of the unittest classes.
+
+    python bench_line_dispatch.py
+    python bench_line_dispatch.py --os nxos --repeat 100
+"""
+
+# Python
+import os
+import glob
+import time
+import argparse
+import importlib
+from unittest.mock import Mock
+
+# Genie
+import genie.libs.parser
+
+# os, module, parser class, unittest class
+PARSERS = [
+    ('iosxe', 'show_interface', 'ShowInterfaces', 'TestShowInterfaces'),
+    ('iosxe', 'show_interface', 'ShowIpInterface', 'TestShowIpInterface'),
+    ('iosxe', 'show_interface', 'ShowIpv6Interface', 'TestShowIpv6Interface'),
+    ('nxos', 'show_interface', 'ShowInterface', 'TestShowInterface'),
+    ('nxos', 'show_interface', 'ShowIpInterfaceVrfAll',
+     'TestShowIpInterfaceVrfAll'),
+    ('nxos', 'show_interface', 'ShowIpv6InterfaceVrfAll',
+     'TestShowIpv6InterfaceVrfAll'),
+    ('iosxr', 'show_interface', 'ShowInterfaces', 'test_show_interfaces'),
+    ('iosxr', 'show_interface', 'ShowInterfacesDetail',
+     'test_show_interface_detail'),
+    ('iosxr', 'show_interface', 'ShowIpv4VrfAllInterface',
+     'test_show_ipv4_vrf_all_interface'),
+    ('iosxr', 'show_interface', 'ShowIpv6VrfAllInterface',
+     'test_show_ipv6_vrf_all_interface'),
+]
+
+
+class CountingPattern(object):
+    """Compiled pattern counting the match() calls"""
+
+    calls = 0
+
+    def __init__(self, regex):
+        self.regex = regex
+
+    def __getattr__(self, name):
+        return getattr(self.regex, name)
+
+    def match(self, *args):
+        CountingPattern.calls += 1
+        return self.regex.match(*args)
+
+    def search(self, *args):
+        CountingPattern.calls += 1
+        return self.regex.search(*args)
+
+    def findall(self, *args):
+        CountingPattern.calls += 1
+        return self.regex.findall(*args)
+
+
+def golden_outputs(os_name, module_name, class_name, test_name):
+    """Return the golden outputs of a parser"""
+    root = os.path.join(os.path.dirname(genie.libs.parser.__file__), os_name,
+                        'tests')
+    outputs = []
+    for path in sorted(glob.glob(os.path.join(root, class_name, 'cli', 'equal',
+                                              '*_output.txt'))):
+        with open(path) as f:
+            outputs.append(f.read())
+
+    try:
+        tests = importlib.import_module('genie.libs.parser.{}.tests.test_{}'
+                                        .format(os_name, module_name))
+    except ImportError:
+        return outputs
+    test_class = getattr(tests, test_name, None)
+    for name, value in sorted(vars(test_class or object).items()):
+        if name.startswith('golden_output') and isinstance(value, dict) and \
+                isinstance(value.get('execute.return_value'), str):
+            outputs.append(value['execute.return_value'])
+    return outputs
+
+
+def count(cls, outputs):
+    """Return the match() calls per line"""
+    parser = cls(device=Mock())
+    CountingPattern.calls = 0
+    for output in outputs:
+        parser.cli(output=output)
+    lines = sum(len(output.splitlines()) for output in outputs)
+    return CountingPattern.calls / lines
+
+
+def timeit(cls, outputs, repeat):
+    """Return the time of one cli() call in us"""
+    parser = cls(device=Mock())
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for output in outputs:
+            parser.cli(output=output)
+    return (time.perf_counter() - start) / (repeat * len(outputs)) * 1e6
+
+
+def without_dispatch(patterns):
+    """Make for_line return every pattern, as parsers did before"""
+    patterns.for_line = lambda line: patterns
+
+
+def reset(patterns):
+    patterns.__dict__.pop('for_line', None)
+    patterns._dispatcher = None
+    patterns._views.clear()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--os', default=None,
+                        choices=sorted(set(p[0] for p in PARSERS)))
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    print('{:<6} {:<24} {:>6} {:>10} {:>10} {:>11} {:>11}'.format(
+        'os', 'parser', 'lines', 'calls/line', 'calls/line', 'us/call',
+        'us/call'))
+    print('{:<6} {:<24} {:>6} {:>10} {:>10} {:>11} {:>11}'.format(
+        '', '', '', 'before', 'after', 'before', 'after'))
+
+    for os_name, module_name, class_name, test_name in PARSERS:
+        if args.os and os_name != args.os:
+            continue
+        module = importlib.import_module('genie.libs.parser.{}.{}'.format(
+            os_name, module_name))
+        cls = getattr(module, class_name)
+        outputs = golden_outputs(os_name, module_name, class_name, test_name)
+        if not outputs:
+            continue
+
+        patterns = cls.patterns
+        compiled = dict(patterns.items())
+        try:
+            for name, regex in compiled.items():
+                setattr(patterns, name, CountingPattern(regex))
+            without_dispatch(patterns)
+            calls_before = count(cls, outputs)
+            reset(patterns)
+            calls_after = count(cls, outputs)
+        finally:
+            for name, regex in compiled.items():
+                setattr(patterns, name, regex)
+            reset(patterns)
+
+        try:
+            without_dispatch(patterns)
+            time_before = timeit(cls, outputs, args.repeat)
+        finally:
+            reset(patterns)
+        time_after = timeit(cls, outputs, args.repeat)
+
+        lines = sum(len(output.splitlines()) for output in outputs)
+        print('{:<6} {:<24} {:>6} {:>10.1f} {:>10.1f} {:>11.1f} {:>11.1f}'
+              .format(os_name, class_name, lines, calls_before, calls_after,
+                      time_before, time_after))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""Benchmark block-split parallel parsing of show interface outputs.
+
+Builds a synthetic output of --interfaces interfaces per parser, repeating
+the first block of a golden output under new interface names (golden outputs
+are read as in bench_line_dispatch.py), parses it in one go then with 2, 4,
+... processes, checks the results are identical and reports the speedup
+against the number of processes.
+
+    python bench_parallel.py
+    python bench_parallel.py --interfaces 20000 --workers 1 2 4 8
+"""
+
+# Python
+import os
+import time
+import argparse
+import importlib
+from unittest.mock import Mock
+
+from bench_line_dispatch import golden_outputs
+
+# os, parser class, unittest class
+PARSERS = [
+    ('iosxe', 'ShowInterfaces', 'TestShowInterfaces'),
+    ('nxos', 'ShowInterface', 'TestShowInterface'),
+    ('iosxr', 'ShowInterfacesDetail', 'test_show_interface_detail'),
+]
+
+
+def synthetic_output(os_name, cls, test_name, count):
+    """Repeat the first interface block of a golden output count times"""
+    header = cls.patterns.p1
+    for output in golden_outputs(os_name, 'show_interface', cls.__name__,
+                                 test_name):
+        lines = output.splitlines()
+        starts = [i for i, line in enumerate(lines)
+                  if header.match(line.strip())]
+        if len(starts) < 2:
+            continue
+        block = lines[starts[0]:starts[1]]
+        name = header.match(block[0].strip()).group('interface')
+        text = '\n'.join(block) + '\n'
+        return ''.join(text.replace(name, '{}.{}'.format(name, index), 1)
+                       for index in range(1, count + 1))
+
+
+def timeit(cls, output, workers):
+    parser = cls(device=Mock())
+    cls.parallel_threshold = 0 if workers > 1 else None
+    cls.parallel_workers = workers
+    start = time.perf_counter()
+    result = parser.cli(output=output)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--interfaces', type=int, default=10000)
+    parser.add_argument('--workers', type=int, nargs='+', default=None)
+    args = parser.parse_args()
+
+    workers = args.workers
+    if not workers:
+        workers = [1]
+        while workers[-1] < max(os.cpu_count() or 1, 2):
+            workers.append(workers[-1] * 2)
+
+    print('cpus: {}'.format(os.cpu_count()))
+    print('{:<6} {:<22} {:>8} {:>8} {:>8} {:>8}'.format(
+        'os', 'parser', 'MB', 'workers', 's', 'speedup'))
+    for os_name, class_name, test_name in PARSERS:
+        module = importlib.import_module(
+            'genie.libs.parser.{}.show_interface'.format(os_name))
+        cls = getattr(module, class_name)
+        output = synthetic_output(os_name, cls, test_name,
+                                  args.interfaces)
+        if not output:
+            continue
+        size = len(output) / 1024 / 1024
+
+        serial = None
+        for count in workers:
+            seconds, result = timeit(cls, output, count)
+            if serial is None:
+                serial, expected = seconds, result
+            elif result != expected:
+                raise SystemExit('{}: parallel result differs with {} '
+                                 'workers'.format(class_name, count))
+            print('{:<6} {:<22} {:>8.1f} {:>8} {:>8.2f} {:>7.2f}x'.format(
+                os_name, class_name, size, count, seconds, serial / seconds))
+        del cls.parallel_threshold, cls.parallel_workers
+
+
+if __name__ == '__main__':
+    main()
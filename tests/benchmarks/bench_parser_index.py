@@ -0,0 +1,110 @@
+"""Benchmark process start up cost of the parser data.
+
+Measures the load time of the compact parser index against parsers.json and,
+in fresh interpreters:
+    * importing genie.libs.parser (parser data is now loaded lazily)
+    * import and first lookup through the compact parser index
+    * import and first lookup through parsers.json, as done at import before
+
+    python bench_parser_index.py
+    python bench_parser_index.py --parsers parsers.json --repeat 10
+"""
+
+# Python
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import subprocess
+
+# Genie
+from genie.libs.parser.utils.parser_index import make_parser_index, \
+                                                 load_parser_index, \
+                                                 _package_path, JSON_NAME
+
+SNIPPETS = {
+    'import only': '''
+import genie.libs.parser
+''',
+    'import + parser index': '''
+import genie.libs.parser
+from genie.libs.parser.utils.parser_index import load_parser_index
+data = load_parser_index({index!r}, {json!r})
+assert data is not None
+''',
+    'import + parsers.json': '''
+import json
+import genie.libs.parser
+with open({json!r}) as f:
+    data = json.load(f)
+''',
+}
+
+TIMER = '''
+import time
+start = time.perf_counter()
+{snippet}
+print(time.perf_counter() - start)
+'''
+
+
+def measure(snippet, repeat):
+    """Best wall time of the snippet over `repeat` fresh interpreters."""
+    timings = []
+    for _ in range(repeat):
+        output = subprocess.check_output(
+            [sys.executable, '-c', TIMER.format(snippet=snippet)],
+            stderr=subprocess.DEVNULL)
+        timings.append(float(output.decode().split()[-1]))
+    return min(timings)
+
+
+def measure_load(func, repeat):
+    """Best wall time of func over `repeat` calls."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def load_json(json_path):
+    with open(json_path) as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--parsers', default=None,
+                        help='parsers.json to use, default is the installed one')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    json_path = args.parsers or _package_path(JSON_NAME)
+    if not os.path.isfile(json_path):
+        sys.exit('{} does not exist, use --parsers'.format(json_path))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index_path = make_parser_index(json_path,
+                                       os.path.join(tmp, 'parsers.idx'))
+
+        print('parsers.json: {:>10} bytes'.format(os.path.getsize(json_path)))
+        print('parser index: {:>10} bytes'.format(os.path.getsize(index_path)))
+        print()
+        print('{:<24} {:>10}'.format('', 'ms'))
+        print('{:<24} {:>10.1f}'.format('load parser index', measure_load(
+            lambda: load_parser_index(index_path, json_path),
+            args.repeat) * 1e3))
+        print('{:<24} {:>10.1f}'.format('load parsers.json', measure_load(
+            lambda: load_json(json_path), args.repeat) * 1e3))
+        for name, snippet in SNIPPETS.items():
+            snippet = snippet.format(index=index_path, json=json_path)
+            print('{:<24} {:>10.1f}'.format(
+                name, measure(snippet, args.repeat) * 1e3))
+
+
+if __name__ == '__main__':
+    main()
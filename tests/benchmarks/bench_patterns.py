@@ -0,0 +1,149 @@
+"""Benchmark the per call overhead of regex compilation on golden outputs.
+
+Every golden output of the parsers below is parsed with their precompiled
+`Patterns` registry, then with a registry which compiles the pattern again on
+every access, as `re.compile` inside cli() did:
+    * warm: the compiled pattern is found in the `re` module cache
+    * cold: the `re` cache is purged before every call, as happens when more
+      distinct patterns are used than the cache holds (512)
+
+The "every access" registry is an upper bound for parsers which compiled
+their patterns once at the top of cli(); with --rev the parsers are also
+timed as they were at a git revision, before their move to `Patterns`.
+
+    python bench_patterns.py
+    python bench_patterns.py --os iosxe --classes ShowInterfaces --repeat 200
+    python bench_patterns.py --rev <revision before the migration>
+"""
+
+# Python
+import os
+import re
+import glob
+import json
+import time
+import argparse
+import importlib
+import subprocess
+from unittest.mock import Mock
+
+# Genie
+import genie.libs.parser
+from genie.libs.parser.utils.patterns import Patterns
+
+PARSERS = {
+    'iosxe': {
+        'show_interface': ['ShowInterfaces', 'ShowIpInterface'],
+        'show_bgp': ['ShowBgpAllNeighbors', 'ShowIpBgpAllDetail',
+                     'ShowBgpAllSummary'],
+        'show_ospf': ['ShowIpOspf', 'ShowIpOspfDatabaseRouter'],
+    },
+}
+
+
+class InlinePatterns(Patterns):
+    """Patterns compiled on every access, like re.compile inside cli()"""
+
+    def __init__(self, registry):
+        self._sources = registry._sources
+
+    def __getattribute__(self, name):
+        sources = object.__getattribute__(self, '_sources')
+        if name in sources:
+            return re.compile(*sources[name])
+        return object.__getattribute__(self, name)
+
+
+def golden_outputs(os_name, class_name):
+    """yield (arguments, output) of the golden tests of a parser"""
+    folder = os.path.join(os.path.dirname(genie.libs.parser.__file__),
+                          os_name, 'tests', class_name, 'cli', 'equal')
+    for path in sorted(glob.glob(os.path.join(folder, '*_output.txt'))):
+        arguments = path.replace('_output.txt', '_arguments.json')
+        kwargs = {}
+        if os.path.isfile(arguments):
+            with open(arguments) as f:
+                kwargs = json.load(f)
+        with open(path) as f:
+            yield kwargs, f.read()
+
+
+def load_revision(module, rev):
+    """Load the source of module as it was at git revision rev"""
+    # './' makes the path relative to cwd instead of the repository root
+    source = subprocess.check_output(
+        ['git', 'show', '{}:./{}'.format(rev,
+                                         os.path.basename(module.__file__))],
+        cwd=os.path.dirname(module.__file__))
+    old = type(module)('{}_{}'.format(module.__name__, rev))
+    old.__file__ = module.__file__
+    exec(compile(source, module.__file__, 'exec'), old.__dict__)
+    return old
+
+
+def timeit(cls, goldens, repeat, purge=False):
+    """Return the time of one cli() call in us, best of repeat rounds"""
+    parser = cls(device=Mock())
+    best = None
+    for _ in range(repeat):
+        elapsed = 0
+        for kwargs, output in goldens:
+            if purge:
+                re.purge()
+            start = time.perf_counter()
+            parser.cli(output=output, **kwargs)
+            elapsed += time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / len(goldens) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--os', default='iosxe', choices=sorted(PARSERS))
+    parser.add_argument('--classes', nargs='+', default=None,
+                        help='parser classes, default is all of them')
+    parser.add_argument('--repeat', type=int, default=50)
+    parser.add_argument('--rev', default=None,
+                        help='also time the parsers as of this git revision')
+    args = parser.parse_args()
+
+    print('{:<28} {:>8} {:>12} {:>12} {:>12} {:>12}'.format(
+        'parser', 'patterns', 'registry us', 'warm us', 'cold us',
+        '{} us'.format(args.rev[:8]) if args.rev else ''))
+
+    for module_name, class_names in PARSERS[args.os].items():
+        module = importlib.import_module('genie.libs.parser.{}.{}'.format(
+            args.os, module_name))
+        old_module = load_revision(module, args.rev) if args.rev else None
+        for class_name in class_names:
+            if args.classes and class_name not in args.classes:
+                continue
+            cls = getattr(module, class_name)
+            goldens = list(golden_outputs(args.os, class_name))
+            if not goldens:
+                continue
+
+            # the registry is shared with the classes it is inherited from
+            owner = next(klass for klass in cls.__mro__
+                         if 'patterns' in vars(klass))
+            registry = owner.patterns.compile()
+            registry_us = timeit(cls, goldens, args.repeat)
+            try:
+                owner.patterns = InlinePatterns(registry)
+                warm_us = timeit(cls, goldens, args.repeat)
+                cold_us = timeit(cls, goldens, args.repeat, purge=True)
+            finally:
+                owner.patterns = registry
+
+            rev_us = ''
+            if old_module:
+                rev_us = '{:.1f}'.format(timeit(getattr(old_module, class_name),
+                                                goldens, args.repeat))
+
+            print('{:<28} {:>8} {:>12.1f} {:>12.1f} {:>12.1f} {:>12}'.format(
+                class_name, len(registry), registry_us, warm_us, cold_us,
+                rev_us))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+"""Compare sequential and pooled collection of bigip REST resources.
+
+Serves --endpoints recorded-like collections of --items items each from a
+local HTTP/1.1 server answering every GET after --delay milliseconds, as a
+BIG-IP across a network would, then reports the wall time of parsing them
+all with their parsers one after the other, over a new connection per
+request as the device of a testbed without keep-alive does, and with
+collect() over pools of 1, 4, 8 and 16 workers keeping their connections
+alive. The median and worst latency of a GET are reported as well.
+
+    python bench_rest_pool.py
+    python bench_rest_pool.py --endpoints 200 --delay 20 --items 500
+"""
+
+# Python
+import json
+import time
+import argparse
+import statistics
+import threading
+import http.server
+import urllib.request
+
+from genie.metaparser import MetaParser
+from genie.libs.parser.utils.rest_pool import collect, RestDevice
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+    # the body follows the headers without a Nagle delay, as on a device
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        time.sleep(self.server.delay)
+        body = self.server.body
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def parsers(endpoints):
+    """Return parser classes of endpoints resources, as the bigip ones"""
+    classes = []
+    for number in range(endpoints):
+        def rest(self):
+            return self.device.get(self.cli_command).json()
+        classes.append(type('Resource{}'.format(number), (MetaParser,), {
+            'schema': {}, 'rest': rest,
+            'cli_command': '/mgmt/tm/ltm/resource{}'.format(number)}))
+    return classes
+
+
+class Connection(object):
+    """Device opening a connection per GET, as urllib does"""
+
+    class Response(object):
+        def __init__(self, content):
+            self.content = content
+
+        def json(self):
+            return json.loads(self.content)
+
+    def __init__(self, url):
+        self.url = url
+
+    def get(self, api_url):
+        with urllib.request.urlopen(self.url + api_url) as response:
+            return self.Response(response.read())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--endpoints', type=int, default=100)
+    parser.add_argument('--items', type=int, default=100)
+    parser.add_argument('--delay', type=float, default=10,
+                        help='milliseconds of each reply')
+    args = parser.parse_args()
+
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.delay = args.delay / 1000
+    server.body = json.dumps({
+        'kind': 'tm:ltm:virtual:virtualcollectionstate',
+        'items': [{'name': 'vs{}'.format(number), 'enabled': True,
+                   'destination': '/Common/10.1.1.{}:80'.format(number % 256)}
+                  for number in range(args.items)]}).encode()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = 'http://127.0.0.1:{}'.format(server.server_port)
+    classes = parsers(args.endpoints)
+
+    print('{} endpoints of {} items, {:.0f}ms per reply'.format(
+        args.endpoints, args.items, args.delay))
+    print('{:<20} {:>10} {:>10} {:>12} {:>12}'.format(
+        '', 'seconds', 'speedup', 'median ms', 'worst ms'))
+
+    start = time.perf_counter()
+    connection = Connection(url)
+    for cls in classes:
+        cls(device=connection, context='rest').parse()
+    reference = time.perf_counter() - start
+    print('{:<20} {:>10.3f} {:>9.1f}x'.format('sequential', reference, 1))
+
+    for workers in (1, 4, 8, 16):
+        with RestDevice(url) as device:
+            start = time.perf_counter()
+            fetches = collect(device, classes, workers=workers)
+            seconds = time.perf_counter() - start
+        errors = [fetch for fetch in fetches.values() if fetch.error]
+        if errors:
+            raise SystemExit('{} failed: {!r}'.format(errors[0].endpoint,
+                                                      errors[0].error))
+        latencies = [fetch.latency * 1000 for fetch in fetches.values()]
+        print('{:<20} {:>10.3f} {:>9.1f}x {:>12.1f} {:>12.1f}'.format(
+            'collect {} workers'.format(workers), seconds,
+            reference / seconds, statistics.median(latencies),
+            max(latencies)))
+
+    server.shutdown()
+    server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,176 @@
+"""Time the parsers on golden outputs expanded to growing sizes.
+
+Parses the outputs of the generators of tests/synthetic.py, the golden
+outputs of the iosxe BGP table, route table, MAC address table, NAT
+translations and interfaces expanded to more and more records, and reports
+per size the best seconds of --repeat parses, the microseconds per record
+and the peak MiB allocated by a parse, traced apart.
+
+The growth of the parse time with the size is fitted as size ** exponent:
+a linear parser has an exponent near 1. The check fails, with a non-zero
+exit status, when a parser has an exponent above --exponent.
+
+The sizes are --sizes, or from 1000 records by --factor up to --max-size,
+the production size of the generator with --full: 1M BGP prefixes and
+routes, 200k MAC addresses, 50k NAT translations and 10k interfaces.
+--plot draws the parse time and the peak memory against the size, with
+matplotlib, and --json writes the results.
+
+    python bench_scaling.py
+    python bench_scaling.py -g bgp -g mac --full
+    python bench_scaling.py -g nat --sizes 1000,10000,50000 --seed 7
+    python bench_scaling.py --plot scaling.png --json scaling.json
+"""
+
+# Python
+import gc
+import os
+import sys
+import json
+import math
+import time
+import argparse
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+from synthetic import GENERATORS
+
+
+def sizes(generator, args):
+    """Return the sizes generator is measured at"""
+    if args.sizes:
+        return [int(size) for size in args.sizes.split(',')]
+    maximum = generator.size if args.full else min(args.max_size,
+                                                   generator.size)
+    result, size = [], 1000
+    while size < maximum:
+        result.append(size)
+        size *= args.factor
+    return result + [maximum]
+
+
+def measure(generator, size, args):
+    """Return the lines, the best seconds and the peak bytes allocated of
+    parsing the output of generator of size records"""
+    output = generator.output(size, seed=args.seed)
+    cls, arguments = generator.parser(), generator.arguments
+    seconds = None
+    for _ in range(args.repeat):
+        gc.collect()
+        start = time.perf_counter()
+        cls(device=None).parse(output=output, **arguments)
+        elapsed = time.perf_counter() - start
+        seconds = elapsed if seconds is None else min(seconds, elapsed)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        cls(device=None).parse(output=output, **arguments)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return output.count('\n'), seconds, peak
+
+
+def exponent(points):
+    """Return the slope of log(seconds) against log(size), least squares"""
+    xs = [math.log(size) for size, _, _ in points]
+    ys = [math.log(seconds) for _, seconds, _ in points]
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    if not variance:
+        return None
+    return sum((x - mean_x) * (y - mean_y)
+               for x, y in zip(xs, ys)) / variance
+
+
+def plot(results, path):
+    """Draw the seconds and the peak MiB against the size to path"""
+    try:
+        import matplotlib
+        matplotlib.use('Agg')
+        from matplotlib import pyplot
+    except ImportError:
+        sys.exit('--plot needs matplotlib, pip install matplotlib')
+    figure, (timing, memory) = pyplot.subplots(1, 2, figsize=(12, 5))
+    for name, result in results.items():
+        points = result['points']
+        size = [point['size'] for point in points]
+        timing.plot(size, [point['seconds'] for point in points], 'o-',
+                    label=name)
+        memory.plot(size, [point['peak_mib'] for point in points], 'o-',
+                    label=name)
+    for axes, label in ((timing, 'parse seconds'),
+                        (memory, 'peak MiB allocated')):
+        axes.set_xscale('log')
+        axes.set_yscale('log')
+        axes.set_xlabel('records')
+        axes.set_ylabel(label)
+        axes.grid(True, which='both', alpha=0.3)
+        axes.legend()
+    figure.tight_layout()
+    figure.savefig(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-g', '--generator', action='append',
+                        dest='generators', choices=sorted(GENERATORS),
+                        help='the generators measured, all when unset')
+    parser.add_argument('--sizes', default=None,
+                        help='comma separated sizes, in records')
+    parser.add_argument('--factor', type=int, default=4)
+    parser.add_argument('--max-size', type=int, default=16000)
+    parser.add_argument('--full', action='store_true',
+                        help='up to the production size of the generator')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--exponent', type=float, default=1.25,
+                        help='exponent of the parse time failing')
+    parser.add_argument('--plot', default=None,
+                        help='image the results are drawn to')
+    parser.add_argument('--json', default=None,
+                        help='file the results are written to')
+    args = parser.parse_args()
+
+    results, failures = {}, []
+    print('{:<12} {:>9} {:>10} {:>10} {:>9} {:>9}'.format(
+        'generator', 'records', 'lines', 'seconds', 'us/record',
+        'peak MiB'))
+    for name in args.generators or sorted(GENERATORS):
+        generator = GENERATORS[name]
+        points = []
+        for size in sizes(generator, args):
+            lines, seconds, peak = measure(generator, size, args)
+            points.append((size, seconds, peak))
+            print('{:<12} {:>9} {:>10} {:>10.3f} {:>9.2f} {:>9.1f}'.format(
+                name, size, lines, seconds, seconds / size * 1e6,
+                peak / 2 ** 20))
+        growth = exponent(points)
+        if growth is not None:
+            print('{:<12} parse time ~ size ** {:.2f}'.format(name, growth))
+            if growth > args.exponent:
+                failures.append('{} parses in size ** {:.2f}'.format(
+                    name, growth))
+        results[name] = {
+            'parser': generator.parser_name,
+            'golden': generator.golden,
+            'exponent': growth,
+            'points': [{'size': size, 'seconds': seconds,
+                        'peak_mib': round(peak / 2 ** 20, 3)}
+                       for size, seconds, peak in points]}
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write('\n')
+    if args.plot:
+        plot(results, args.plot)
+    for failure in failures:
+        print('SUPER-LINEAR: {}'.format(failure))
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
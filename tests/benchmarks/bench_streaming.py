@@ -0,0 +1,114 @@
+"""Benchmark the peak memory of parsing large outputs as a string or a stream.
+
+The largest golden output of each parser is repeated --scale times into a
+temporary file, which is parsed in a fresh process for each mode:
+
+    string  the file is read and given to cli() as a string, as before
+    stream  the file handle is given to cli(), lines are read lazily
+
+and the peak RSS of the process above the one after the imports is reported.
+Linux only (resource.getrusage).
+
+    python bench_streaming.py
+    python bench_streaming.py --scale 200
+"""
+
+# Python
+import os
+import sys
+import glob
+import time
+import argparse
+import tempfile
+import importlib
+import resource
+import subprocess
+from unittest.mock import Mock
+
+# Genie
+import genie.libs.parser
+
+# os, module, parser class
+PARSERS = [
+    ('iosxe', 'show_snmp', 'ShowSnmpMib'),
+    ('iosxe', 'show_logging', 'ShowLogging'),
+    ('junos', 'show_route', 'ShowRouteProtocolExtensive'),
+]
+
+
+def largest_output(os_name, class_name):
+    root = os.path.join(os.path.dirname(genie.libs.parser.__file__), os_name,
+                        'tests', class_name, 'cli', 'equal')
+    paths = glob.glob(os.path.join(root, '*_output.txt'))
+    return max(paths, key=os.path.getsize) if paths else None
+
+
+def peak_rss():
+    """Peak RSS of the process in MB"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def child(mode, os_name, module_name, class_name, path):
+    """Parse path in this process, print the peak RSS and the time"""
+    module = importlib.import_module('genie.libs.parser.{}.{}'.format(
+        os_name, module_name))
+    parser = getattr(module, class_name)(device=Mock())
+    base = peak_rss()
+    start = time.perf_counter()
+    with open(path) as f:
+        if mode == 'string':
+            parser.cli(output=f.read())
+        else:
+            parser.cli(output=f)
+    print(peak_rss() - base, time.perf_counter() - start)
+
+
+def run(mode, parser, path):
+    out = subprocess.check_output(
+        [sys.executable, __file__, '--child', mode] + list(parser) + [path],
+        universal_newlines=True)
+    rss, seconds = out.split()
+    return float(rss), float(seconds)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scale', type=int, default=100)
+    parser.add_argument('--child', nargs=5, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(*args.child)
+        return
+
+    print('{:<6} {:<28} {:>8} {:>10} {:>10} {:>8} {:>8}'.format(
+        'os', 'parser', 'MB', 'peak MB', 'peak MB', 's', 's'))
+    print('{:<6} {:<28} {:>8} {:>10} {:>10} {:>8} {:>8}'.format(
+        '', '', 'input', 'string', 'stream', 'string', 'stream'))
+
+    for os_name, module_name, class_name in PARSERS:
+        source = largest_output(os_name, class_name)
+        if not source:
+            continue
+        with open(source) as f:
+            text = f.read()
+        if not text.endswith('\n'):
+            text += '\n'
+        with tempfile.NamedTemporaryFile('w', suffix='.txt',
+                                         delete=False) as f:
+            for _ in range(args.scale):
+                f.write(text)
+        try:
+            size = os.path.getsize(f.name) / 1024 / 1024
+            parser_args = (os_name, module_name, class_name)
+            string_rss, string_time = run('string', parser_args, f.name)
+            stream_rss, stream_time = run('stream', parser_args, f.name)
+        finally:
+            os.remove(f.name)
+        print('{:<6} {:<28} {:>8.1f} {:>10.1f} {:>10.1f} {:>8.2f} {:>8.2f}'
+              .format(os_name, class_name, size, string_rss, stream_rss,
+                      string_time, stream_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+"""Benchmark the fixed width table engine on a large show ip interface brief.
+
+Generates a 'show ip interface brief' output of --rows rows and parses it
+with `Tabular`, with a regex per row as a reference, and with
+parsergen.oper_fill_tabular when genie.parsergen is installed. The entries
+of each method are checked to be the same before reporting the time per
+method.
+
+    python bench_tabular.py
+    python bench_tabular.py --rows 50000 --repeat 5
+"""
+
+# Python
+import re
+import time
+import argparse
+
+from genie.libs.parser.utils.tabular import Tabular
+
+try:
+    from genie import parsergen
+except ImportError:
+    parsergen = None
+
+HEADER = ('Interface              IP-Address      OK? Method Status'
+          '                Protocol')
+
+HEADER_FIELDS = ['Interface', 'IP-Address', r'OK\?', 'Method', 'Status',
+                 'Protocol']
+LABEL_FIELDS = ['Interface', 'ip_address', 'interface_is_ok', 'method',
+                'status', 'protocol']
+
+ROW = re.compile(r'^(?P<Interface>\S+) +(?P<ip_address>\S+) +'
+                 r'(?P<interface_is_ok>\S+) +(?P<method>\S+) +'
+                 r'(?P<status>up|down|administratively down|deleted) +'
+                 r'(?P<protocol>\S+)$')
+
+
+def generate(rows):
+    """Return a show ip interface brief output of rows interfaces"""
+    lines = ['R1#show ip interface brief', HEADER]
+    states = [('up', 'up'), ('down', 'down'),
+              ('administratively down', 'down')]
+    for number in range(rows):
+        name = 'GigabitEthernet{}/0/{}'.format(number // 48 + 1,
+                                               number % 48 + 1)
+        if number % 3:
+            address = '10.{}.{}.1'.format(number // 256 % 256, number % 256)
+            method = 'manual'
+        else:
+            address, method = 'unassigned', 'unset'
+        status, protocol = states[number % len(states)]
+        lines.append('{:<22} {:<15} YES {:<6} {:<21} {}'.format(
+            name, address, method, status, protocol))
+    lines.append('')
+    return '\n'.join(lines)
+
+
+def tabular(output):
+    return Tabular(device_output=output,
+                   device_os='iosxe',
+                   table_terminal_pattern=r'^\n',
+                   header_fields=HEADER_FIELDS,
+                   label_fields=LABEL_FIELDS,
+                   index=[0]).entries
+
+
+def regex(output):
+    entries = {}
+    for line in output.splitlines():
+        m = ROW.match(line.strip())
+        if m and m.group('Interface') != 'Interface':
+            entries[m.group('Interface')] = m.groupdict()
+    return entries
+
+
+def oper_fill_tabular(output):
+    return parsergen.oper_fill_tabular(device_output=output,
+                                       device_os='iosxe',
+                                       table_terminal_pattern=r'^\n',
+                                       header_fields=HEADER_FIELDS,
+                                       label_fields=LABEL_FIELDS,
+                                       index=[0]).entries
+
+
+def timeit(func, output, repeat):
+    """Return the best time of repeat runs in seconds"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(output)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=50000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    output = generate(args.rows)
+    methods = [('tabular', tabular), ('regex per row', regex)]
+    if parsergen is not None:
+        methods.append(('parsergen', oper_fill_tabular))
+
+    expected = tabular(output)
+    if len(expected) != args.rows:
+        raise SystemExit('tabular found {} rows instead of {}'.format(
+            len(expected), args.rows))
+    for name, func in methods[1:]:
+        if func(output) != expected:
+            raise SystemExit('{} entries differ from tabular'.format(name))
+
+    print('{} rows, {} characters'.format(args.rows, len(output)))
+    print('{:<14} {:>10} {:>10}'.format('method', 'seconds', 'us/row'))
+    for name, func in methods:
+        seconds = timeit(func, output, args.repeat)
+        print('{:<14} {:>10.3f} {:>10.2f}'.format(
+            name, seconds, seconds / args.rows * 1e6))
+
+
+if __name__ == '__main__':
+    main()
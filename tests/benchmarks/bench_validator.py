@@ -0,0 +1,123 @@
+"""Compare schema validation to regex parsing on the largest golden outputs.
+
+Takes the --count largest golden outputs, parses each one with the cli() of
+its parser, then validates the result with the generic schema engine
+(Schema(schema).validate) and with the validator compiled by
+`compile_schema`. Reports the time of each per output, in ms, and the one
+time cost of compiling the schema. Both validators are checked to accept the
+result.
+
+Golden outputs are read from the <os>/tests/<parser>/cli/equal folders.
+
+    python bench_validator.py
+    python bench_validator.py --count 20 --repeat 10
+"""
+
+# Python
+import os
+import re
+import glob
+import json
+import time
+import argparse
+import importlib
+from unittest.mock import Mock
+
+# Genie
+import genie.libs.parser
+from genie.metaparser.util.schemaengine import Schema
+from genie.libs.parser.utils.validator import compile_schema
+
+ROOT = os.path.dirname(genie.libs.parser.__file__)
+
+
+def parser_classes(os_name, _modules={}):
+    """Return {class name: module name} of the parsers of an os"""
+    if os_name not in _modules:
+        classes = {}
+        for path in sorted(glob.glob(os.path.join(ROOT, os_name, '**', '*.py'),
+                                     recursive=True)):
+            if os.sep + 'tests' + os.sep in path:
+                continue
+            with open(path, errors='ignore') as f:
+                names = re.findall(r'^class (\w+)', f.read(), re.M)
+            module = os.path.relpath(path[:-3], os.path.dirname(ROOT))
+            for name in names:
+                classes.setdefault(name, 'genie.libs.' + module.replace(
+                    os.sep, '.'))
+        _modules[os_name] = classes
+    return _modules[os_name]
+
+
+def largest_outputs(count):
+    """Yield (parser class, kwargs, output, name) of the largest golden
+       outputs which parse"""
+    paths = glob.glob(os.path.join(ROOT, '*', 'tests', '*', 'cli', 'equal',
+                                   '*_output.txt'))
+    found = 0
+    for path in sorted(paths, key=os.path.getsize, reverse=True):
+        parts = os.path.relpath(path, ROOT).split(os.sep)
+        os_name, class_name = parts[0], parts[2]
+        module = parser_classes(os_name).get(class_name)
+        if not module:
+            continue
+        arguments = path[:-len('_output.txt')] + '_arguments.json'
+        kwargs = {}
+        if os.path.exists(arguments):
+            with open(arguments) as f:
+                kwargs = json.load(f)
+        try:
+            cls = getattr(importlib.import_module(module), class_name)
+            with open(path) as f:
+                output = f.read()
+            if not cls(device=Mock()).cli(output=output, **kwargs) or \
+                    not getattr(cls, 'schema', None):
+                continue
+        except Exception:
+            continue
+        yield cls, kwargs, output, '{} {} {}'.format(
+            os_name, class_name, parts[-1][:-len('_output.txt')])
+        found += 1
+        if found == count:
+            return
+
+
+def timeit(function, repeat):
+    """Return the time of one call in ms"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=20)
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    print('{:<58} {:>7} {:>8} {:>9} {:>8}'.format(
+        'output', 'parse', 'generic', 'compiled', 'compile'))
+    totals = [0, 0, 0, 0]
+    for cls, kwargs, output, name in largest_outputs(args.count):
+        parsed = cls(device=Mock()).cli(output=output, **kwargs)
+        start = time.perf_counter()
+        validate = compile_schema(cls.schema)
+        compile_ms = (time.perf_counter() - start) * 1e3
+        Schema(cls.schema).validate(parsed)
+        validate(parsed)
+        times = [
+            timeit(lambda: cls(device=Mock()).cli(output=output, **kwargs),
+                   args.repeat),
+            timeit(lambda: Schema(cls.schema).validate(parsed), args.repeat),
+            timeit(lambda: validate(parsed), args.repeat),
+            compile_ms]
+        totals = [total + value for total, value in zip(totals, times)]
+        print('{:<58} {:>7.2f} {:>8.2f} {:>9.2f} {:>8.2f}'.format(
+            name[:58], *times))
+    print('{:<58} {:>7.2f} {:>8.2f} {:>9.2f} {:>8.2f}'.format('total',
+                                                              *totals))
+
+
+if __name__ == '__main__':
+    main()
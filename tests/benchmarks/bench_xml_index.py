@@ -0,0 +1,156 @@
+"""Compare the previous Common xml helpers with XmlIndex on the NX-OS golden xml replies.
+
+Reads the xml golden outputs of the NX-OS unit tests and, for each reply,
+finds the namespace, composes the command and looks up every tag of the
+reply --lookups times, first as the parsers did with the previous
+Common.retrieve_xml_child, Common.compose_compare_command and
+root.find('.//'), then with XmlIndex. The previous helpers are reproduced
+below, with list() in place of Element.getchildren(), and are checked to
+compose the same commands, but for the replies where they kept
+__XML__OPT tags in.
+
+    python bench_xml_index.py
+    python bench_xml_index.py --lookups 10 --repeat 20
+"""
+
+# Python
+import re
+import os
+import ast
+import sys
+import time
+import argparse
+import warnings
+from xml.etree import ElementTree as ET
+
+from genie.libs.parser.utils.xml_index import XmlIndex
+
+TESTS = os.path.join(os.path.dirname(__file__), '..', '..', 'src', 'genie',
+                     'libs', 'parser', 'nxos', 'tests')
+
+
+def golden_replies(folder):
+    """Return the xml replies held by the unit tests of folder"""
+    replies = []
+    for name in sorted(os.listdir(folder)):
+        if not name.startswith('test_') or not name.endswith('.py'):
+            continue
+        with open(os.path.join(folder, name)) as f:
+            tree = ast.parse(f.read())
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Constant) and \
+                    isinstance(node.value, str) and \
+                    '<nf:rpc-reply' in node.value:
+                replies.append(node.value.replace(']]>]]>', ''))
+    return replies
+
+
+def retrieve_xml_child(root, key):
+    """Common.retrieve_xml_child before XmlIndex"""
+    for item in root:
+        if key in item.tag:
+            return item
+        else:
+            root = item
+            return retrieve_xml_child(root, key)
+
+
+def compose_command(root, namespace):
+    """the command composed by Common.compose_compare_command before
+       XmlIndex"""
+    cmd_node = list(root)[0]
+    cli = ''
+    while True:
+        try:
+            cmd_node = list(cmd_node)
+            if len(cmd_node) == 1:
+                cmd_node = cmd_node[0]
+                if '__XML__value' in cmd_node.tag:
+                    cli += ' ' + cmd_node.text
+            elif len(cmd_node) > 1:
+                for item in cmd_node:
+                    if '__XML__value' in item.tag:
+                        cli += ' ' + item.text
+                    else:
+                        cmd_node = item
+                        break
+            else:
+                break
+        except Exception:
+            pass
+        tag = cmd_node.tag.replace(namespace, '')
+        if '__readonly__' not in tag:
+            if '__XML__PARAM__' not in tag and \
+               '__XML__value' not in tag and \
+               'TABLE' not in tag:
+                cli += ' ' + tag
+        else:
+            break
+        if 'TABLE' in tag:
+            break
+    return cli.strip()
+
+
+def previous(reply, tags, lookups):
+    root = ET.fromstring(reply)
+    show_root = retrieve_xml_child(root=root, key='show')
+    namespace = re.compile(r'(?P<name>\{[\S]+\})').match(
+        show_root.tag).groupdict()['name']
+    command = compose_command(root, namespace)
+    for _ in range(lookups):
+        for tag in tags:
+            root.find('.//{}{}'.format(namespace, tag))
+    return command
+
+
+def indexed(reply, tags, lookups):
+    index = XmlIndex.of(ET.fromstring(reply))
+    for _ in range(lookups):
+        for tag in tags:
+            index.find(tag)
+    return index.command
+
+
+def timed(function, reply, tags, lookups, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(reply, tags, lookups)
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--tests', default=TESTS)
+    parser.add_argument('--lookups', type=int, default=3)
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    warnings.simplefilter('ignore')
+    replies = golden_replies(args.tests)
+    if not replies:
+        sys.exit('no xml golden output under {}'.format(args.tests))
+
+    print('{:>6} {:>6}  {:>14} {:>14} {:>8}'.format(
+        'reply', 'tags', 'previous us', 'XmlIndex us', 'speedup'))
+    totals = [0, 0]
+    for number, reply in enumerate(replies):
+        tags = sorted(XmlIndex(reply))
+        command = previous(reply, tags, 1)
+        # the previous helper kept the <__XML__OPT_Cmd_...> tags in
+        if command != indexed(reply, tags, 1) and '__XML__' not in command:
+            sys.exit('reply {} composes another command'.format(number))
+        seconds = [timed(function, reply, tags, args.lookups, args.repeat)
+                   for function in (previous, indexed)]
+        totals = [total + part for total, part in zip(totals, seconds)]
+        print('{:>6} {:>6}  {:>14.1f} {:>14.1f} {:>7.1f}x'.format(
+            number, len(tags), seconds[0] * 1e6, seconds[1] * 1e6,
+            seconds[0] / seconds[1]))
+    print('{:>6} {:>6}  {:>14.1f} {:>14.1f} {:>7.1f}x'.format(
+        'total', '', totals[0] * 1e6, totals[1] * 1e6, totals[0] / totals[1]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,199 @@
+"""Compare the time and peak memory of building and streaming NX-OS xml replies.
+
+Generates a 'show bgp sessions vrf all | xml' reply of --vrfs vrfs of
+--rows neighbors each, or a 'show bgp ipv4 unicast labels vrf all | xml'
+reply of --vrfs vrfs of --rows prefixes each, then reports the time and the
+peak memory traced while building the whole tree with ET.fromstring(), as
+the parsers did before, while reading its rows with iter_rows(), and while
+parsing it with the ShowBgpSessions or ShowBgpLabels xml parser, which
+streams it with iter_rows(). The parsed result is checked to hold every
+generated row.
+
+    python bench_xml_stream.py
+    python bench_xml_stream.py --parser labels --vrfs 4 --rows 50000
+"""
+
+# Python
+import gc
+import sys
+import time
+import random
+import argparse
+import tracemalloc
+from unittest.mock import Mock
+from xml.etree import ElementTree as ET
+
+from genie.libs.parser.utils.xml_stream import iter_rows
+from genie.libs.parser.nxos.show_bgp import ShowBgpSessions, ShowBgpLabels
+
+HEADER = '''<?xml version="1.0" encoding="ISO-8859-1"?>
+<nf:rpc-reply xmlns="http://www.cisco.com/nxos:7.0.3.I7.3.:bgp" xmlns:nf="urn:ietf:params:xml:ns:netconf:base:1.0">
+ <nf:data>
+  <show>
+   <bgp>
+{command}
+     <__readonly__>
+'''
+
+FOOTER = '''     </__readonly__>
+{close}
+   </bgp>
+  </show>
+ </nf:data>
+</nf:rpc-reply>
+]]>]]>'''
+
+
+def address(number):
+    return '10.{}.{}.{}'.format(number // 65536 % 256, number // 256 % 256,
+                                number % 256)
+
+
+def sessions_output(vrfs, rows, seed):
+    """Return a show bgp sessions vrf all | xml reply"""
+    rng = random.Random(seed)
+    lines = [HEADER.format(command='    <sessions><vrf><all>'),
+             '<totalpeers>{}</totalpeers>'.format(vrfs * rows),
+             '<totalestablishedpeers>{}</totalestablishedpeers>'.format(
+                 vrfs * rows),
+             '<localas>100</localas>', '<TABLE_vrf>']
+    for vrf in range(vrfs):
+        lines += ['<ROW_vrf>',
+                  '<vrf-name-out>VRF{}</vrf-name-out>'.format(vrf),
+                  '<local-as>100</local-as>',
+                  '<vrfpeers>{}</vrfpeers>'.format(rows),
+                  '<vrfestablishedpeers>{}</vrfestablishedpeers>'.format(rows),
+                  '<router-id>10.1.1.1</router-id>', '<TABLE_neighbor>']
+        for number in range(rows):
+            lines += [
+                '<ROW_neighbor>',
+                '<neighbor-id>{}</neighbor-id>'.format(address(number)),
+                '<connectionsdropped>{}</connectionsdropped>'.format(
+                    rng.randint(0, 9)),
+                '<remoteas>{}</remoteas>'.format(rng.randint(1, 65535)),
+                '<lastflap>P1DT{}H52M46S</lastflap>'.format(rng.randint(0, 23)),
+                '<lastread>PT{}S</lastread>'.format(rng.randint(0, 59)),
+                '<lastwrite>PT{}S</lastwrite>'.format(rng.randint(0, 59)),
+                '<state>{}</state>'.format(rng.choice(['Established',
+                                                       'Idle', 'Active'])),
+                '<localport>{}</localport>'.format(rng.randint(1024, 65535)),
+                '<remoteport>179</remoteport>',
+                '<notificationssent>0</notificationssent>',
+                '<notificationsreceived>0</notificationsreceived>',
+                '</ROW_neighbor>']
+        lines += ['</TABLE_neighbor>', '</ROW_vrf>']
+    lines += ['</TABLE_vrf>', FOOTER.format(close='    </all></vrf></sessions>')]
+    return '\n'.join(lines)
+
+
+def labels_output(vrfs, rows, seed):
+    """Return a show bgp ipv4 unicast labels vrf all | xml reply"""
+    rng = random.Random(seed)
+    lines = [HEADER.format(command='    <ipv4><unicast><labels><vrf><all>')]
+    lines.append('<TABLE_vrf>')
+    for vrf in range(vrfs):
+        lines += ['<ROW_vrf>',
+                  '<vrf-name-out>VRF{}</vrf-name-out>'.format(vrf),
+                  '<TABLE_afi><ROW_afi><afi>1</afi><TABLE_safi><ROW_safi>',
+                  '<safi>1</safi>', '<af-name>IPv4 Unicast</af-name>',
+                  '<table-version>{}</table-version>'.format(rows),
+                  '<router-id>10.1.1.1</router-id>',
+                  '<TABLE_rd><ROW_rd><TABLE_prefix>']
+        for number in range(rows):
+            lines += ['<ROW_prefix>',
+                      '<ipprefix>{}/32</ipprefix>'.format(address(number)),
+                      '<TABLE_path>',
+                      '<ROW_path>', '<pathnr>0</pathnr>',
+                      '<status>valid</status>', '<best>bestpath</best>',
+                      '<type>internal</type>', '<statuscode>*</statuscode>',
+                      '<bestcode>&gt;</bestcode>', '<typecode>i</typecode>',
+                      '<ipnexthop>{}</ipnexthop>'.format(
+                          address(rng.getrandbits(16))),
+                      '<inlabel>nolabel</inlabel>',
+                      '<outlabel>{}</outlabel>'.format(rng.choice(
+                          ['nolabel', str(rng.randint(16, 1048575))])),
+                      '<vpn></vpn>', '<hold_down></hold_down>',
+                      '</ROW_path>', '</TABLE_path>', '</ROW_prefix>']
+        lines += ['</TABLE_prefix></ROW_rd></TABLE_rd>',
+                  '</ROW_safi></TABLE_safi></ROW_afi></TABLE_afi>',
+                  '</ROW_vrf>']
+    lines += ['</TABLE_vrf>',
+              FOOTER.format(close='    </all></vrf></labels></unicast>'
+                                  '</ipv4>')]
+    return '\n'.join(lines)
+
+
+def sessions_rows(result):
+    return sum(len(vrf['neighbor']) for vrf in result['vrf'].values())
+
+
+def labels_rows(result):
+    return sum(len(vrf['address_family']['ipv4 unicast']['prefix'])
+               for vrf in result['vrf'].values())
+
+
+PARSERS = {
+    'sessions': (ShowBgpSessions, sessions_output, sessions_rows,
+                 {'vrf': 'all'}),
+    'labels': (ShowBgpLabels, labels_output, labels_rows,
+               {'address_family': 'ipv4 unicast', 'vrf': 'all'}),
+}
+
+
+def measured(function, repeat):
+    """Return the best time, the peak traced memory and the result of
+       function()"""
+    best = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = function()
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    del result
+    gc.collect()
+    tracemalloc.start()
+    result = function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--parser', choices=sorted(PARSERS),
+                        default='sessions')
+    parser.add_argument('--vrfs', type=int, default=8)
+    parser.add_argument('--rows', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    klass, generate, count, kwargs = PARSERS[args.parser]
+    output = generate(args.vrfs, args.rows, args.seed)
+    reply = output[:output.index(']]>]]>')]
+
+    tree_seconds, tree_peak, _ = measured(
+        lambda: ET.fromstring(reply), args.repeat)
+    rows_seconds, rows_peak, _ = measured(
+        lambda: sum(1 for _ in iter_rows(reply, klass.xml_rows)), args.repeat)
+    device = Mock(**{'execute.return_value': output})
+    stream_seconds, stream_peak, result = measured(
+        lambda: klass(device=device).xml(**kwargs), args.repeat)
+    if count(result) != args.vrfs * args.rows:
+        sys.exit('parsed {} rows out of {}'.format(count(result),
+                                                   args.vrfs * args.rows))
+
+    print('{} {} vrfs x {} rows, {:.1f} MB reply'.format(
+        klass.__name__, args.vrfs, args.rows, len(output) / 2 ** 20))
+    print('{:<14} {:>10} {:>12}'.format('', 'seconds', 'peak MB'))
+    print('{:<14} {:>10.3f} {:>12.1f}'.format(
+        'ET.fromstring', tree_seconds, tree_peak / 2 ** 20))
+    print('{:<14} {:>10.3f} {:>12.1f}'.format(
+        'iter_rows()', rows_seconds, rows_peak / 2 ** 20))
+    print('{:<14} {:>10.3f} {:>12.1f}'.format(
+        'xml()', stream_seconds, stream_peak / 2 ** 20))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,205 @@
+"""Golden outputs of the parsers, as tests/ci_folder_parsing.py walks them.
+
+Each parser class of an OS, or of a token of an OS, has its golden outputs
+in the tests folder next to its module:
+
+    src/genie/libs/parser/<os>/tests/<Class>/cli/equal/<name>_output.txt
+                                                       <name>_expected.py
+                                                       <name>_arguments.json
+    src/genie/libs/parser/<os>/<token>/tests/<Class>/cli/empty/...
+
+parsers() yields the classes ci_folder_parsing.py tests, with its filters
+and its CLASS_SKIP table, and cases() the golden outputs of a class,
+without pyATS:
+
+    >>> for parser in parsers(['iosxe'], class_name='ShowVersion'):
+    ...     for case in cases(parser):
+    ...         parsed = parser.cls(device=case.device()).parse(
+    ...             **case.arguments)
+"""
+
+# Python
+import os
+import re
+import ast
+import glob
+import json
+import inspect
+import importlib
+from unittest.mock import Mock
+
+TESTS = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.join(os.path.dirname(TESTS), 'src', 'genie', 'libs', 'parser')
+
+# the OSs of ci_folder_parsing.py when none is given
+OPERATING_SYSTEMS = ['asa', 'ios', 'iosxe', 'junos']
+
+
+def _skip_tables():
+    """Return the CLASS_SKIP and EMPTY_SKIP tables of ci_folder_parsing.py,
+    read from its source as it imports pyATS"""
+    with open(os.path.join(TESTS, 'ci_folder_parsing.py')) as f:
+        tree = ast.parse(f.read())
+    tables = {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1 and \
+                getattr(node.targets[0], 'id', None) in ('CLASS_SKIP',
+                                                         'EMPTY_SKIP'):
+            tables[node.targets[0].id] = ast.literal_eval(node.value)
+    return tables.get('CLASS_SKIP', {}), tables.get('EMPTY_SKIP', {})
+
+
+CLASS_SKIP, EMPTY_SKIP = _skip_tables()
+
+
+def _natural(key):
+    # golden_output_10 after golden_output_9
+    return [int(text) if text.isdigit() else text
+            for text in re.split('([0-9]+)', key)]
+
+
+class Parser(object):
+    """A parser class with golden outputs"""
+
+    __slots__ = ('os', 'token', 'name', 'module', 'cls', 'error')
+
+    def __init__(self, os_name, token, name, module, cls, error=None):
+        self.os = os_name
+        self.token = token
+        self.name = name
+        self.module = module
+        self.cls = cls
+        self.error = error
+
+    @property
+    def id(self):
+        return '/'.join(part for part in (self.os, self.token, self.name)
+                        if part)
+
+    def folder(self, kind='equal'):
+        """Return the folder of the golden outputs of kind, equal or empty"""
+        return os.path.join(ROOT, self.os, *([self.token] if self.token
+                                             else []),
+                            'tests', self.name, 'cli', kind)
+
+    def __repr__(self):
+        return '<Parser {}>'.format(self.id)
+
+
+class Case(object):
+    """A golden output of a parser"""
+
+    __slots__ = ('parser', 'name', 'kind', 'output_file', 'expected_file',
+                 'arguments_file')
+
+    def __init__(self, parser, name, kind, folder):
+        self.parser = parser
+        self.name = name
+        self.kind = kind
+        self.output_file = os.path.join(folder, name + '_output.txt')
+        self.expected_file = os.path.join(folder, name + '_expected.py')
+        self.arguments_file = os.path.join(folder, name + '_arguments.json')
+
+    @property
+    def id(self):
+        return '{}/{}/{}'.format(self.parser.id, self.kind, self.name)
+
+    @property
+    def output(self):
+        with open(self.output_file) as f:
+            return f.read()
+
+    @property
+    def arguments(self):
+        if not os.path.exists(self.arguments_file):
+            return {}
+        with open(self.arguments_file) as f:
+            return json.load(f)
+
+    def device(self):
+        """Return a device replying output to every command"""
+        return Mock(**{'execute.return_value': self.output})
+
+    def __repr__(self):
+        return '<Case {}>'.format(self.id)
+
+
+def tokens(os_name):
+    """Return the tokens of os_name, the folders holding a tests folder"""
+    return sorted(os.path.basename(os.path.dirname(path)) for path in
+                  glob.glob(os.path.join(ROOT, os_name, '*', 'tests')))
+
+
+def modules(os_name, token=None):
+    """Return the names of the parser modules of os_name or of its token"""
+    folder = os.path.join(ROOT, os_name, *([token] if token else []))
+    return sorted(os.path.basename(path)[:-len('.py')]
+                  for path in glob.glob(os.path.join(folder, '*.py'))
+                  if not path.endswith('__init__.py'))
+
+
+def parsers(operating_systems=None, class_name=None, token=None):
+    """Yield the Parser of the classes tested by ci_folder_parsing.py
+
+        Args:
+            operating_systems (`list`): OSs, OPERATING_SYSTEMS when None
+            class_name (`str`): only this class, as -c
+            token (`str`): only the classes of this token, as -t
+
+        Returns:
+            generator of Parser, a module failing to import as a Parser
+            named after the module, of cls None and of the import error
+    """
+    for os_name in operating_systems or OPERATING_SYSTEMS:
+        skip = CLASS_SKIP.get(os_name, {})
+        for os_token in [None] + tokens(os_name):
+            if token and token != os_token:
+                continue
+            package = '.'.join(['genie.libs.parser', os_name] +
+                               ([os_token] if os_token else []))
+            seen = set()
+            for module_name in modules(os_name, os_token):
+                try:
+                    module = importlib.import_module(
+                        '{}.{}'.format(package, module_name))
+                except Exception as e:
+                    if not class_name:
+                        yield Parser(os_name, os_token, module_name,
+                                     '{}.{}'.format(package, module_name),
+                                     None, e)
+                    continue
+                for name, cls in inspect.getmembers(module, inspect.isclass):
+                    if os_token and skip.get(os_token, {}).get(name) or \
+                            not os_token and skip.get(name):
+                        continue
+                    if class_name and class_name != name:
+                        continue
+                    # the ios modules import the iosxe parsers as *_iosxe
+                    if not hasattr(cls, 'cli') or name.endswith('_iosxe') \
+                            or name in seen:
+                        continue
+                    seen.add(name)
+                    yield Parser(os_name, os_token, name, module.__name__,
+                                 cls)
+
+
+def cases(parser, kind='equal', number=None):
+    """Return the Case of the golden outputs of parser
+
+        Args:
+            parser (`Parser`): parser of the golden outputs
+            kind (`str`): equal, or empty for the outputs parsing to nothing
+            number (`int`): only golden_output<number>, as -n
+    """
+    folder = parser.folder(kind)
+    if number is None:
+        patterns = ['*_output.txt']
+    else:
+        patterns = ['golden_output{}_output.txt'.format(number),
+                    'golden_output_{}_output.txt'.format(number)]
+    paths = set()
+    for pattern in patterns:
+        paths.update(glob.glob(os.path.join(folder, pattern)))
+    return [Case(parser, os.path.basename(path)[:-len('_output.txt')], kind,
+                 folder)
+            for path in sorted(paths, key=_natural)]
@@ -0,0 +1,262 @@
+"""Run the golden tests of tests/ci_folder_parsing.py over a process pool.
+
+Tests the same parser classes on the same golden outputs as
+ci_folder_parsing.py, with the same -o/-c/-t/-n/-f options, without pyATS:
+each <name>_output.txt of cli/equal is parsed with its
+<name>_arguments.json and compared with the expected_output of its
+<name>_expected.py, and each output of cli/empty is expected to raise
+SchemaEmptyParserError. The parser classes are spread over --workers
+processes.
+
+The expected outputs are cached in --cache, pickled, and loaded from there
+as long as the mtime and the size of their _expected.py are unchanged, so
+a run only executes the expected files changed since the previous one.
+
+--summary writes the results as JSON, one record per golden output:
+
+    {"summary": {"passed": 1650, "failed": 2, "error": 0, "missing": 3,
+                 "workers": 16, "seconds": 4.2},
+     "results": [{"parser": "iosxe/ShowVersion", "kind": "equal",
+                  "case": "golden_output_1", "status": "passed",
+                  "seconds": 0.0012, "message": ""}, ...]}
+
+The exit status is non-zero when a test did not pass.
+
+    python parallel_folder_parsing.py
+    python parallel_folder_parsing.py -o iosxe -f
+    python parallel_folder_parsing.py -o iosxe -c ShowVersion -n 2
+    python parallel_folder_parsing.py --workers 32 --summary results.json
+"""
+
+# Python
+import os
+import sys
+import json
+import time
+import pickle
+import hashlib
+import argparse
+import importlib
+import tempfile
+import concurrent.futures
+
+from golden import EMPTY_SKIP, Parser, parsers, cases
+
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+CACHE = os.path.join(tempfile.gettempdir(), 'genie_parser_expected')
+
+# differences of a failed golden output shown
+DIFFERENCES = 10
+
+
+def load_expected(path, cache=None):
+    """Return the expected_output of the _expected.py file path
+
+        Args:
+            path (`str`): the _expected.py file
+            cache (`str`): folder of the pickled expected outputs, None not
+                           to cache them
+    """
+    stat = os.stat(path)
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = None
+    if cache is not None:
+        cached = os.path.join(cache, hashlib.sha1(
+            os.path.abspath(path).encode()).hexdigest() + '.pickle')
+        try:
+            with open(cached, 'rb') as f:
+                cached_key, expected = pickle.load(f)
+            if cached_key == key:
+                return expected
+        except (OSError, EOFError, pickle.UnpicklingError, ValueError):
+            pass
+
+    with open(path) as f:
+        code = compile(f.read(), path, 'exec')
+    namespace = {'__name__': 'expected', '__file__': path}
+    exec(code, namespace)
+    expected = namespace['expected_output']
+
+    if cached is not None:
+        try:
+            data = pickle.dumps((key, expected),
+                                protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            # not picklable, loaded from its file every time
+            return expected
+        os.makedirs(cache, exist_ok=True)
+        # written under a temporary name, the other workers never read a
+        # partial file
+        fd, tmp = tempfile.mkstemp(dir=cache)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, cached)
+    return expected
+
+
+def differences(parsed, expected, path=''):
+    """Yield the keys where parsed and expected differ, as strings"""
+    if isinstance(parsed, dict) and isinstance(expected, dict):
+        for key in sorted(set(parsed) | set(expected), key=repr):
+            key_path = '{}[{!r}]'.format(path, key)
+            if key not in expected:
+                yield '+ {}: {!r}'.format(key_path, parsed[key])
+            elif key not in parsed:
+                yield '- {}: {!r}'.format(key_path, expected[key])
+            else:
+                yield from differences(parsed[key], expected[key], key_path)
+    elif parsed != expected:
+        yield '~ {}: {!r} != {!r}'.format(path or 'output', parsed,
+                                          expected)
+
+
+def run_case(case, cache):
+    """Return the status and the message of the golden output case"""
+    cls = case.parser.cls
+    try:
+        parsed = cls(device=case.device()).parse(**case.arguments)
+    except SchemaEmptyParserError:
+        if case.kind == 'empty':
+            return 'passed', ''
+        return 'failed', 'parsed to an empty output'
+    except AttributeError:
+        # as ci_folder_parsing.py, an empty output may fail in the parser
+        if case.kind == 'empty':
+            return 'passed', ''
+        raise
+    if case.kind == 'empty':
+        return 'failed', 'parsed, when expected not to'
+    expected = load_expected(case.expected_file, cache)
+    if parsed == expected:
+        return 'passed', ''
+    lines = list(differences(parsed, expected))
+    if len(lines) > DIFFERENCES:
+        lines[DIFFERENCES:] = ['... {} more'.format(len(lines) -
+                                                    DIFFERENCES)]
+    return 'failed', '\n'.join(lines)
+
+
+def run_parser(parser, number=None, cache=None):
+    """Return the results of the golden outputs of a parser
+
+        Args:
+            parser (`tuple`): os, token, class name and module of the parser
+            number (`int`): only the equal golden_output<number>, as -n
+            cache (`str`): folder of the cached expected outputs
+    """
+    os_name, token, name, module = parser
+    parser = Parser(os_name, token, name, module,
+                    getattr(importlib.import_module(module), name))
+    results = []
+    for kind in ('equal', 'empty'):
+        # as ci_folder_parsing.py, -n only filters the equal outputs
+        found = cases(parser, kind, number if kind == 'equal' else None)
+        if not found and (kind == 'equal' or
+                          not EMPTY_SKIP.get(os_name, {}).get(name)):
+            results.append(result(parser.id, kind, '', 'missing', 0,
+                                  'no golden output in {}'.format(
+                                      parser.folder(kind))))
+        for case in found:
+            start = time.perf_counter()
+            try:
+                status, message = run_case(case, cache)
+            except Exception as e:
+                status, message = 'error', '{}: {}'.format(
+                    type(e).__name__, e)
+            results.append(result(parser.id, kind, case.name, status,
+                                  time.perf_counter() - start, message))
+    return results
+
+
+def result(parser, kind, case, status, seconds, message):
+    return {'parser': parser, 'kind': kind, 'case': case, 'status': status,
+            'seconds': round(seconds, 6), 'message': message}
+
+
+def main():
+    my_parser = argparse.ArgumentParser(
+        description=__doc__.splitlines()[0])
+    my_parser.add_argument('-o', "--operating_system",
+                           type=str,
+                           help='The OS you wish to filter on',
+                           default=None)
+    my_parser.add_argument('-c', "--class_name",
+                           type=str,
+                           help="The Class you wish to filter on, (not the "
+                                "Test File)",
+                           default=None)
+    my_parser.add_argument('-t', "--token",
+                           type=str,
+                           help="The Token associated with the class, such "
+                                "as 'asr1k'",
+                           default=None)
+    my_parser.add_argument('-f', "--display_only_failed",
+                           help="Displaying only failed classes",
+                           action='store_true')
+    my_parser.add_argument('-n', "--number",
+                           type=int,
+                           help="The specific unittest we want to run, such "
+                                "as '25'",
+                           default=None)
+    my_parser.add_argument('-w', '--workers', type=int,
+                           default=os.cpu_count(),
+                           help='Processes running the tests')
+    my_parser.add_argument('--cache', default=CACHE,
+                           help='Folder of the cached expected outputs')
+    my_parser.add_argument('--no-cache', action='store_true',
+                           help='Load every expected output from its file')
+    my_parser.add_argument('--summary', default=None,
+                           help='JSON file the results are written to')
+    args = my_parser.parse_args()
+
+    if args.number and not args.class_name:
+        sys.exit("Unittest number provided but missing supporting arguments:"
+                 "\n* '-c' or '--class_name' for the parser class"
+                 "\n* '-o' or '--operating_system' for operating system")
+
+    start = time.perf_counter()
+    cache = None if args.no_cache else args.cache
+    operating_systems = [args.operating_system] if args.operating_system \
+        else None
+    found, results = [], []
+    for parser in parsers(operating_systems, args.class_name, args.token):
+        if parser.cls is None:
+            results.append(result(parser.id, 'import', '', 'error', 0,
+                                  repr(parser.error)))
+        else:
+            found.append((parser.os, parser.token, parser.name,
+                          parser.module))
+
+    workers = max(1, min(args.workers, len(found)))
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        for parser_results in pool.map(
+                run_parser, found, [args.number] * len(found),
+                [cache] * len(found), chunksize=4):
+            results.extend(parser_results)
+
+    counts = {'passed': 0, 'failed': 0, 'error': 0, 'missing': 0}
+    for record in results:
+        counts[record['status']] += 1
+        if record['status'] == 'passed' and args.display_only_failed:
+            continue
+        print('{:<8} {}'.format(record['status'].upper(), '/'.join(
+            part for part in (record['parser'], record['kind'],
+                              record['case']) if part)))
+        if record['message']:
+            print('    ' + record['message'].replace('\n', '\n    '))
+
+    seconds = time.perf_counter() - start
+    summary = dict(counts, workers=workers, seconds=round(seconds, 3))
+    print('{passed} passed, {failed} failed, {error} errors, {missing} '
+          'missing in {seconds:.1f}s over {workers} workers'.format(
+              **summary))
+    if args.summary:
+        with open(args.summary, 'w') as f:
+            json.dump({'summary': summary, 'results': results}, f, indent=1)
+            f.write('\n')
+    sys.exit(1 if len(results) != counts['passed'] else 0)
+
+
+if __name__ == '__main__':
+    main()
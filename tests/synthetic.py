@@ -0,0 +1,228 @@
+"""Golden outputs expanded to the size of production devices.
+
+A Generator splits a golden output in its head, its records and its tail,
+and writes an output of any number of records, each a copy of a record of
+the golden output, picked by a seeded random generator, with its key, the
+prefix, the MAC address or the interface the parser indexes it by, made
+unique. The columns of a record are kept aligned, the lines of a record
+naming other records, as the members of a port-channel, are left out since
+the keys they name are renamed, and the totals of the tail count the
+records written, so that the output is parsed as the golden output is,
+only larger.
+
+    >>> generator = GENERATORS['bgp']
+    >>> output = generator.output(100000, seed=1)
+    >>> parsed = generator.parser()(device=None).parse(
+    ...     output=output, **generator.arguments)
+
+The same size and seed always give the same output.
+"""
+
+# Python
+import re
+import json
+import math
+import random
+import importlib
+
+from golden import ROOT
+
+
+def _permutation(space, seed):
+    """Return a function mapping 0..space-1 to themselves, shuffled by
+    seed, without building the shuffled list"""
+    rng = random.Random(seed)
+    step = rng.randrange(1, space)
+    while math.gcd(step, space) != 1:
+        step += 1
+    offset = rng.randrange(space)
+    return lambda index: (index * step + offset) % space
+
+
+def networks(size, seed):
+    """Return size unique /24 network addresses, 1.0.0.0 to 222.255.255.0"""
+    permutation = _permutation(222 << 16, seed)
+    addresses = []
+    for index in range(size):
+        address = (1 << 16) + permutation(index)
+        addresses.append('{}.{}.{}.0'.format(
+            address >> 16, address >> 8 & 0xff, address & 0xff))
+    return addresses
+
+
+def hosts(size, seed):
+    """Return size unique host addresses, the first of unique /24s"""
+    return [network[:-1] + '1' for network in networks(size, seed)]
+
+
+def macs(size, seed):
+    """Return size unique MAC addresses, dotted as IOS shows them"""
+    permutation = _permutation(1 << 48, seed)
+    addresses = []
+    for index in range(size):
+        address = permutation(index)
+        addresses.append('{:04x}.{:04x}.{:04x}'.format(
+            address >> 32, address >> 16 & 0xffff, address & 0xffff))
+    return addresses
+
+
+def ports(size, seed):
+    """Return size unique slot/module/port numbers, in order"""
+    return ['{}/{}/{}'.format(index // 2304 + 1, index // 48 % 48,
+                              index % 48 + 1) for index in range(size)]
+
+
+class Generator(object):
+    """Expands a golden output to any number of records
+
+        Args:
+            parser (`str`): module:Class of the parser
+            golden (`str`): the golden output, relative to ROOT and without
+                            its _output.txt suffix
+            record (`str`): regex of the first line of a record, its first
+                            group the key made unique
+            values (`function`): returning size unique keys from a size and
+                                 a seed
+            size (`int`): records of a production device
+            tail (`str`): regex of the first line of the tail, the blank
+                          lines after the last record when None
+            total (`str`): regex of a line of the tail counting the
+                           records, its first group the count
+            drop (`str`): regex of the lines of a record naming other
+                          records, left out
+    """
+
+    def __init__(self, parser, golden, record, values, size, tail=None,
+                 total=None, drop=None):
+        self.parser_name = parser
+        self.golden = golden
+        self.record = re.compile(record)
+        self.values = values
+        self.size = size
+        self.tail = re.compile(tail) if tail else None
+        self.total = re.compile(total) if total else None
+        self.drop = re.compile(drop) if drop else None
+        self._template = None
+
+    @property
+    def arguments(self):
+        """The arguments of the golden output"""
+        try:
+            with open('{}/{}_arguments.json'.format(ROOT, self.golden)) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def parser(self):
+        """Return the parser class"""
+        module, name = self.parser_name.split(':')
+        return getattr(importlib.import_module(module), name)
+
+    def template(self):
+        """Return the head lines, the records and the tail lines of the
+        golden output, a record as the line before its key, the rest of
+        its key column, the width of its key column, None when the key is
+        not followed by a column, the line after its key column, and its
+        other lines"""
+        if self._template is not None:
+            return self._template
+        with open('{}/{}_output.txt'.format(ROOT, self.golden)) as f:
+            lines = f.read().splitlines()
+        starts = [index for index, line in enumerate(lines)
+                  if self.record.match(line)]
+        if not starts:
+            raise ValueError('no record in {}'.format(self.golden))
+        end = len(lines)
+        if self.tail:
+            end = next((index for index in range(starts[-1] + 1, len(lines))
+                        if self.tail.match(lines[index])), end)
+
+        records = []
+        for start, stop in zip(starts, starts[1:] + [end]):
+            line = lines[start]
+            begin, finish = self.record.match(line).span(1)
+            after = line[finish:]
+            # the rest of the key column, as the mask of a prefix
+            suffix = after[:len(after) - len(after.lstrip('/:.0123456789'))]
+            spaces = len(after) - len(suffix) - \
+                len(after[len(suffix):].lstrip(' '))
+            width = None
+            if spaces and after.strip(' ') != suffix:
+                # the key is a column, kept aligned
+                width = finish - begin + len(suffix) + spaces
+                after = after[len(suffix) + spaces:]
+            rest = lines[start + 1:stop]
+            if self.drop:
+                rest = [line for line in rest if not self.drop.match(line)]
+            records.append([line[:begin], suffix, width, after, rest])
+
+        # the blank lines after the last record are the tail's, unless
+        # every record ends with them
+        rest = records[-1][-1]
+        if not all(record[-1] and not record[-1][-1].strip()
+                   for record in records[:-1]):
+            while rest and not rest[-1].strip():
+                end -= 1
+                rest.pop()
+        self._template = (lines[:starts[0]], records, lines[end:])
+        return self._template
+
+    def output(self, size, seed=0):
+        """Return the golden output expanded to size records"""
+        head, records, tail = self.template()
+        rng = random.Random(seed)
+        lines = list(head)
+        for value in self.values(size, seed):
+            before, suffix, width, after, rest = rng.choice(records)
+            value += suffix
+            if width is None:
+                lines.append(before + value + after)
+            elif len(value) < width:
+                lines.append(before + value.ljust(width) + after)
+            else:
+                lines.append(before + value + ' ' + after)
+            lines.extend(rest)
+        for line in tail:
+            match = self.total.search(line) if self.total else None
+            if match:
+                line = line[:match.start(1)] + str(size) + \
+                    line[match.end(1):]
+            lines.append(line)
+        return '\n'.join(lines) + '\n'
+
+
+IPV4 = r'\d+\.\d+\.\d+\.\d+'
+
+GENERATORS = {
+    'bgp': Generator(
+        'genie.libs.parser.iosxe.show_bgp:ShowIpBgpAll',
+        'iosxe/tests/ShowIpBgpAll/cli/equal/golden_output2',
+        r'^\s+[*>=a-zA-Z ]+?({})/\d+'.format(IPV4),
+        networks, 1000000),
+    'route': Generator(
+        'genie.libs.parser.iosxe.show_routing:ShowIpRoute',
+        'iosxe/tests/ShowIpRoute/cli/equal/golden_output_1',
+        r'^[A-Za-z*+%]{{1,2}}(?: [A-Za-z0-9*+%]{{1,2}})*\s+({})'.format(
+            IPV4),
+        networks, 1000000),
+    'mac': Generator(
+        'genie.libs.parser.iosxe.show_fdb:ShowMacAddressTable',
+        'iosxe/tests/ShowMacAddressTable/cli/equal/golden_output_2',
+        r'^\*?\s*(?:\d+|---)\s+([0-9a-f]{4}\.[0-9a-f]{4}\.[0-9a-f]{4})\s',
+        macs, 200000,
+        tail=r'^\s*Total Mac Addresses',
+        total=r'Total Mac Addresses for this criterion: (\d+)'),
+    'nat': Generator(
+        'genie.libs.parser.iosxe.show_ip_nat:ShowIpNatTranslations',
+        'iosxe/tests/ShowIpNatTranslations/cli/equal/golden_output_3',
+        r'^(?:udp|tcp|icmp|gre|esp|any|---)\s+\S+\s+({})'.format(IPV4),
+        hosts, 50000,
+        tail=r'^Total number of translations',
+        total=r'Total number of translations: (\d+)'),
+    'interfaces': Generator(
+        'genie.libs.parser.iosxe.show_interface:ShowInterfaces',
+        'iosxe/tests/ShowInterfaces/cli/equal/golden_output',
+        r'^[A-Za-z][A-Za-z\-]*([\d/.:]+) is ',
+        ports, 10000,
+        drop=r'^\s+Members in this channel:'),
+}
@@ -0,0 +1,43 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic import GENERATORS
+
+
+class TestGenerators(unittest.TestCase):
+
+    def test_parsed(self):
+        # every record is parsed and the output holds to the schema, from
+        # two records, ShowIpNatTranslations keeps its first translation
+        # until the second
+        for name, generator in sorted(GENERATORS.items()):
+            parser = generator.parser()
+            for size in (2, 48, 1000):
+                for seed in (0, 1, 7):
+                    with self.subTest(name, size=size, seed=seed):
+                        output = generator.output(size, seed=seed)
+                        parsed = parser(device=None).parse(
+                            output=output, **generator.arguments)
+                        self.assertTrue(parsed)
+
+    def test_deterministic(self):
+        for name, generator in sorted(GENERATORS.items()):
+            with self.subTest(name):
+                self.assertEqual(generator.output(100, seed=3),
+                                 generator.output(100, seed=3))
+                self.assertNotEqual(generator.output(100, seed=3),
+                                    generator.output(100, seed=4))
+
+    def test_interfaces(self):
+        generator = GENERATORS['interfaces']
+        output = generator.output(1000, seed=0)
+        self.assertNotIn('Members in this channel', output)
+        parsed = generator.parser()(device=None).parse(output=output)
+        self.assertEqual(len(parsed), 1000)
+
+
+if __name__ == '__main__':
+    unittest.main()